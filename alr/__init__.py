@@ -3,20 +3,53 @@ Main alr module
 """
 
 import copy
+import functools
+import importlib
 import math
+import warnings
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable, Sequence, List, Tuple
 
 import torch
 from torch import nn
 
 from alr.acquisition import AcquisitionFunction
 from alr.modules.dropout import replace_dropout, replace_consistent_dropout
+from alr.modules.folding import (
+    fold_weight_norm,
+    fold_batch_norm,
+    _detached_weight_norm,
+    _set_submodule,
+)
+from alr.modules.ensemble import StackedModules
+from alr.modules.quantisation import (
+    prepare_static_quantisation,
+    convert_static_quantisation,
+    _conv_modules,
+)
+from alr.modules.graph import (
+    split_at_first_dropout,
+    split_at_last_dropout,
+    stochastic_layers,
+)
 from alr.utils import range_progress_bar, progress_bar
+from alr.utils.snapshot import SnapshotStore
+from alr.utils.feature_cache import FeatureCache
 from alr.utils._type_aliases import _DeviceType
 
 __version__ = "0.0.0b8"
 
+# submodules that are imported on first access (e.g. `alr.training.Trainer`) rather than
+# by `import alr`: they pull in torchvision, ignite, etc. which are slow to import.
+# `acquisition`, `modules`, and `utils` are needed by the models below, hence imported eagerly.
+_LAZY_SUBMODULES = {"data", "training"}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class ALRModel(nn.Module, ABC):
     def __init__(self):
@@ -26,6 +59,7 @@ class ALRModel(nn.Module, ABC):
         """
         super(ALRModel, self).__init__()
         self._snapshot = None
+        self._snapshot_store = None
 
     @abstractmethod
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -51,26 +85,175 @@ class ALRModel(nn.Module, ABC):
         self.eval()
         return self(x)
 
-    def reset_weights(self) -> None:
+    def reset_weights(self, name: Optional[str] = None) -> None:
         """
         Resets the model's weights to the last saved snapshot.
 
+        :param name: if provided, resets the weights to the named snapshot
+            in :attr:`snapshots` instead.
+        :type name: str, optional
         :return: None
         :rtype: NoneType
         """
+        if name is not None:
+            self.load_state_dict(self.snapshots.load(name), strict=True)
+            return
         assert self._snapshot is not None, "Snapshot was never taken"
         self.load_state_dict(self._snapshot, strict=True)
 
-    def snap(self) -> None:
+    def snap(self, name: Optional[str] = None) -> None:
         r"""
         Take and store a snapshot of the current state.
 
+        Args:
+            name (str, optional): if provided, the snapshot is kept in :attr:`snapshots` under `name`
+                (compressed and de-duplicated) instead of replacing the last snapshot.
+
         Returns:
             NoneType: None
         """
+        if name is not None:
+            self.snapshots.save(name, self.state_dict())
+            return
         # update snapshot
         self._snapshot = copy.deepcopy(self.state_dict())
 
+    @property
+    def snapshots(self) -> SnapshotStore:
+        r"""
+        The :class:`alr.utils.snapshot.SnapshotStore` that keeps named snapshots. An in-memory
+        store is created on first use; assign an on-disk store to persist snapshots, e.g.
+        `model.snapshots = SnapshotStore("snapshots/")`.
+        """
+        if self._snapshot_store is None:
+            self._snapshot_store = SnapshotStore()
+        return self._snapshot_store
+
+    @snapshots.setter
+    def snapshots(self, store: SnapshotStore) -> None:
+        self._snapshot_store = store
+
+    def export(
+        self, example_input: torch.Tensor, atol: Optional[float] = 1e-5
+    ) -> "ALRModel":
+        r"""
+        Returns a frozen copy of this model for acquisition and evaluation *only*.
+        Weight normalisation is folded into the weights and eval-mode batch norm layers
+        are folded into the preceding convolution, so neither is recomputed on every forward pass.
+        Persistent and consistent dropout layers are kept as they are. This model is not modified.
+
+        Args:
+            example_input (`torch.Tensor`): an input that's representative of the model's inputs.
+                This is used to pair convolutions with batch norm layers and to verify the copy.
+            atol (float, optional): absolute tolerance when verifying that the copy's
+                predictions on `example_input` match this model's predictions.
+
+        Returns:
+            :class:`ALRModel`: frozen copy of this model in eval mode. The copy has no snapshot and
+            should not be trained.
+
+        Raises:
+            RuntimeError: Occurs when the copy's predictions do not match this model's predictions.
+        """
+        with _detached_weight_norm(self):
+            # don't copy the snapshots
+            model = copy.deepcopy(
+                self, {id(self._snapshot): None, id(self._snapshot_store): None}
+            )
+        model.eval()
+        reference = _seeded_forward(model, example_input)
+        fold_weight_norm(model)
+        fold_batch_norm(model, example_input)
+        model._modules_replaced()
+        for p in model.parameters():
+            p.requires_grad_(False)
+        model._verify_export(reference, example_input, atol)
+        return model
+
+    def quantise(
+        self,
+        example_input: torch.Tensor,
+        dtype: Optional[torch.dtype] = torch.qint8,
+        calibration_data: Optional[Iterable] = None,
+    ) -> "ALRModel":
+        r"""
+        Returns a frozen copy of this model for CPU-only acquisition and evaluation with int8 layers.
+        The copy is folded with :meth:`export` first. If the model has convolutions, it's statically
+        quantised (see :func:`alr.modules.quantisation.prepare_static_quantisation`): convolutions are
+        fused with the following ReLU layers, the ranges of the activations are calibrated by predicting
+        `calibration_data` (e.g. the labelled set), and the layers are then converted to int8 kernels.
+        Otherwise, the `nn.Linear` layers are dynamically quantised (weights are stored as `dtype` and
+        activations are quantised on the fly). Dropout layers run in fp32 either way, hence persistent
+        and consistent dropout semantics are kept.
+
+        Args:
+            example_input (`torch.Tensor`): an input that's representative of the model's inputs.
+                This model and `example_input` must be on CPU.
+            dtype (`torch.dtype`, optional): quantised weight type. Either `torch.qint8` or `torch.float16`.
+                With `torch.float16`, the model is always dynamically quantised.
+            calibration_data (Iterable, optional): batches of inputs or of `(input, target)` pairs
+                (e.g. a `DataLoader` of the labelled set) to calibrate the statically quantised layers with.
+                Defaults to `example_input`.
+
+        Returns:
+            :class:`ALRModel`: frozen and quantised copy of this model in eval mode.
+
+        Note:
+            Static quantisation requires the submodules with convolutions (e.g. `base_model`)
+            to be traceable by :mod:`torch.fx`. Use :func:`alr.acquisition.selection_agreement`
+            to check how often the quantised model selects the same points as the fp32 model.
+        """
+        assert not example_input.is_cuda, "Quantised models can only run on CPU."
+        model = self.export(example_input)
+        targets = dict(_conv_modules(model)) if dtype == torch.qint8 else {}
+        if not targets:
+            model = torch.quantization.quantize_dynamic(
+                model, {nn.Linear}, dtype=dtype, inplace=True
+            )
+            model._modules_replaced()
+            return model
+        # the targets are prepared with their own inputs
+        inputs = {}
+        hooks = [
+            m.register_forward_pre_hook(
+                lambda m, args, name=name: inputs.setdefault(name, args[0])
+            )
+            for name, m in targets.items()
+        ]
+        _seeded_forward(model, example_input)
+        for h in hooks:
+            h.remove()
+        for name, m in targets.items():
+            # vectorised ensemble members are called through a copy: their input is the model's input
+            x = inputs.get(name, example_input)
+            _set_submodule(model, name, prepare_static_quantisation(m, x))
+        model._modules_replaced()
+        if calibration_data is None:
+            calibration_data = [example_input]
+        # neither calibration (dropout) nor conversion (initialisation of the int8 layers)
+        # consume the global random state
+        with torch.random.fork_rng(devices=[]):
+            with torch.no_grad():
+                for x in calibration_data:
+                    model(x[0] if isinstance(x, (tuple, list)) else x)
+            for name in targets:
+                _set_submodule(
+                    model, name, convert_static_quantisation(model.get_submodule(name))
+                )
+        model._modules_replaced()
+        return model
+
+    def _modules_replaced(self) -> None:
+        # called after export or quantisation replaced some of the submodules
+        pass
+
+    def _verify_export(self, reference, example_input, atol):
+        output = _seeded_forward(self, example_input)
+        if not torch.allclose(reference, output, atol=atol):
+            raise RuntimeError(
+                "Exported model's predictions do not match the original model's predictions."
+            )
+
 
 class MCDropout(ALRModel):
     def __init__(
@@ -82,6 +265,9 @@ class MCDropout(ALRModel):
         output_transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
         fast: Optional[bool] = False,
         consistent: Optional[bool] = False,
+        jit: Optional[bool] = False,
+        functional: Optional[bool] = False,
+        deterministic_prefix: Optional[bool] = False,
     ):
         r"""
         A wrapper that turns a regular PyTorch module into one that implements
@@ -106,15 +292,29 @@ class MCDropout(ALRModel):
                           MC dropout passes. If false, then forward passes are called in a for-loop. Note,
                           the former will consume `forward` times more memory.
             consistent (bool, optional): if true, the dropout layers will be replaced with consistent variants.
+            jit (bool, optional): if true, `base_model` and `output_transform` (and the repeat of `fast`) are traced
+                          with TorchScript once per input shape and mode (train or eval) to remove the python overhead
+                          of each pass. The traced graphs share this model's parameters, hence, they can be trained.
+                          `base_model`'s forward pass must not depend on python control flow over the input's values.
+            functional (bool, optional): if true, functional dropout calls (e.g. `F.dropout`) in `model`'s forward pass
+                          are replaced too (see :func:`alr.modules.dropout.replace_dropout`). `base_model` is then a
+                          :class:`torch.fx.GraphModule` that shares `model`'s submodules.
+            deterministic_prefix (bool, optional): if true, the layers before the first dropout layer
+                          (see :attr:`stochastic_layers`) are evaluated once per batch in :meth:`stochastic_forward`
+                          instead of once per stochastic pass. `base_model` has to be traceable by :mod:`torch.fx`.
         Attributes:
               base_model (`nn.Module`): provided base model (a clone if `inplace=True`)
               n_forward (int): number of forward passes (`forward`)
         """
         super(MCDropout, self).__init__()
         if consistent:
-            self.base_model = replace_consistent_dropout(model, inplace=inplace)
+            self.base_model = replace_consistent_dropout(
+                model, inplace=inplace, functional=functional
+            )
         else:
-            self.base_model = replace_dropout(model, inplace=inplace)
+            self.base_model = replace_dropout(
+                model, inplace=inplace, functional=functional
+            )
         self.n_forward = forward
         self._output_transform = (
             output_transform if output_transform is not None else lambda x: x
@@ -122,6 +322,11 @@ class MCDropout(ALRModel):
         self._reduce = reduce.lower()
         assert self._reduce in {"logsumexp", "mean"}
         self._fast = fast
+        self._consistent = consistent
+        self._jit = jit
+        self._traced = _TraceCache()
+        self._deterministic_prefix = deterministic_prefix
+        self._modules_replaced()
         self.snap()
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -152,7 +357,12 @@ class MCDropout(ALRModel):
               instead: `base_model(x)`
         """
         if self.training:
+            if self._jit:
+                return self._traced_forward(x, repeat=1)
             return self._output_transform(self.base_model(x))
+        if self._jit:
+            reduce = _scripted_reduce(self._reduce)
+            return reduce(self.stochastic_forward(x), self.n_forward)
         if self._reduce == "mean":
             return torch.mean(self.stochastic_forward(x), dim=0)
         # if self._reduce == "logsumexp"
@@ -177,12 +387,29 @@ class MCDropout(ALRModel):
         Raises:
             RuntimeError: Occurs when the machine runs out of memory and `fast` was set to true.
         """
-        if self._fast:
+        model = self.base_model
+        if self._jit and self._fast:
+            part = "model" if self._split is None else "split"
+            preds = self._traced_forward(x, repeat=self.n_forward, part=part)
+        elif self._jit:
+            part = "model"
+            if self._split is not None:
+                x, part = self._split[0](x), "suffix"
+            preds = torch.stack(
+                [
+                    self._traced_forward(x, repeat=1, part=part)
+                    for _ in range(self.n_forward)
+                ]
+            )
+        elif self._fast:
+            if self._split is not None:
+                # the deterministic prefix is evaluated once
+                x, model = self._split[0](x), self._split[1]
             size = x.size()
             x = self._repeat_n(x, self.n_forward)
             assert x.size() == (size[0] * self.n_forward, *size[1:])
             try:
-                preds = self._output_transform(self.base_model(x))
+                preds = self._output_transform(model(x))
                 preds = preds.view(self.n_forward, -1, *preds.size()[1:])
             except RuntimeError as e:
                 raise RuntimeError(
@@ -191,15 +418,163 @@ class MCDropout(ALRModel):
                     "fast MC dropout."
                 ) from e
         else:
+            if self._split is not None:
+                x, model = self._split[0](x), self._split[1]
             preds = torch.stack(
-                [
-                    self._output_transform(self.base_model(x))
-                    for _ in range(self.n_forward)
-                ]
+                [self._output_transform(model(x)) for _ in range(self.n_forward)]
             )
         assert preds.size(0) == self.n_forward
         return preds
 
+    def export(
+        self,
+        example_input: torch.Tensor,
+        atol: Optional[float] = 1e-5,
+        trace: Optional[bool] = False,
+    ) -> "MCDropout":
+        r"""
+        See :meth:`ALRModel.export`. Additionally, `base_model` can be traced with
+        TorchScript to remove the python overhead of each stochastic forward pass. This overhead
+        is usually small compared to the convolutions (on CPU, tracing MNISTNet or CIFAR10Net isn't
+        measurably faster, see `test_export_throughput`), hence, only trace if it's faster for your model.
+
+        Args:
+            example_input (`torch.Tensor`): an input that's representative of the model's inputs.
+            atol (float, optional): absolute tolerance used to verify the copy's predictions.
+            trace (bool, optional): if true, `base_model` of the copy is traced with
+                :func:`torch.jit.trace`. Not available with consistent dropout since its
+                masks would be frozen into the trace.
+
+        Returns:
+            :class:`MCDropout`: frozen copy of this model in eval mode.
+        """
+        if trace and self._consistent:
+            raise ValueError("Cannot trace a model with consistent dropout layers.")
+        model = super(MCDropout, self).export(example_input, atol=atol)
+        if trace:
+            reference = _seeded_forward(model, example_input)
+            model.base_model = _trace(model.base_model, example_input)
+            # the traced base model can't be split
+            model._split = None
+            model._verify_export(reference, example_input, atol)
+        return model
+
+    def feature_cache(
+        self,
+        batch_size: Optional[int] = 1024,
+        device: _DeviceType = None,
+        num_workers: Optional[int] = 0,
+        drop_backbone_dropout: Optional[bool] = False,
+    ) -> FeatureCache:
+        r"""
+        Splits `base_model` at its last dropout layer (see :func:`alr.modules.graph.split_at_last_dropout`)
+        and returns a :class:`alr.utils.feature_cache.FeatureCache` of the first part's output.
+        The cache's `head` is an :class:`MCDropout` model (with the same settings as this model) of the
+        second part. Repeated stochastic forward passes in the same round (e.g. acquisition, calibration,
+        and pseudo-labelling) then only run the head on the cached features.
+        Both parts share this model's parameters and the cache is cleared when they change.
+
+        Args:
+            batch_size (int, optional): batch size used to compute missing features
+            device (None, str, `torch.device`): device used to compute missing features
+            num_workers (int, optional): number of workers used to load missing points
+            drop_backbone_dropout (bool, optional): if `base_model` has dropout layers
+                before the last one, its first part isn't deterministic and can't be cached. If true, these
+                layers are skipped when computing features (i.e. only the last dropout layer is stochastic;
+                "last-layer" MC dropout). Otherwise, a `ValueError` is raised.
+
+        Returns:
+            :class:`alr.utils.feature_cache.FeatureCache`: an empty cache
+        """
+        backbone, head = split_at_last_dropout(self.base_model, drop_backbone_dropout)
+        head = MCDropout(
+            head,
+            forward=self.n_forward,
+            reduce=self._reduce,
+            output_transform=self._output_transform,
+            fast=self._fast,
+            consistent=self._consistent,
+            jit=self._jit,
+        )
+        return FeatureCache(
+            backbone,
+            head,
+            batch_size=batch_size,
+            device=device,
+            num_workers=num_workers,
+        )
+
+    @property
+    def stochastic_layers(self) -> List[Tuple[int, str]]:
+        r"""
+        Position of every dropout layer in `base_model`'s computation graph
+        (see :func:`alr.modules.graph.stochastic_layers`).
+        """
+        return stochastic_layers(self.base_model)
+
+    def _modules_replaced(self) -> None:
+        self._traced.clear()
+        # the prefix and suffix hold on to the replaced modules
+        self._split = (
+            split_at_first_dropout(self.base_model)
+            if self._deterministic_prefix
+            else None
+        )
+
+    def train(self, mode: bool = True) -> "MCDropout":
+        if self._consistent:
+            # consistent dropout masks are refreshed and the traced graphs hold on to the old masks
+            self._traced.clear()
+        return super(MCDropout, self).train(mode)
+
+    def _apply(self, fn, *args, **kwargs):
+        # parameters may be replaced (e.g. when moved to another device)
+        self._traced.clear()
+        return super(MCDropout, self)._apply(fn, *args, **kwargs)
+
+    def _traced_forward(
+        self, x: torch.Tensor, repeat: int, part: Optional[str] = "model"
+    ) -> torch.Tensor:
+        # part: the whole model ("model"), the stochastic suffix ("suffix"),
+        # or the prefix followed by the (repeated) suffix ("split")
+        key = (part, repeat, self.training, tuple(x.size()), x.dtype, x.device)
+        traced = self._traced.get(key)
+        if traced is None:
+            if part == "model":
+                module = _Composed(self.base_model, self._output_transform, repeat)
+            else:
+                module = _Composed(
+                    self._split[1],
+                    self._output_transform,
+                    repeat,
+                    prefix=self._split[0] if part == "split" else None,
+                )
+            # tracing runs a forward pass: don't let it update batch norm's running statistics
+            buffers = [(b, b.clone()) for b in self.base_model.buffers()]
+            try:
+                if self._consistent and not self.training:
+                    # create the masks first so they're traced as constants
+                    # rather than being re-drawn by the traced graph
+                    with torch.no_grad():
+                        module(x)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", torch.jit.TracerWarning)
+                    traced = _trace(module, x)
+            except RuntimeError as e:
+                warnings.warn(
+                    f"Couldn't trace model ({e}) for inputs of size {tuple(x.size())}. "
+                    "Falling back to python execution for these inputs.",
+                    UserWarning,
+                )
+                # only inputs with this key run in python; the others are still traced
+                traced = module
+            finally:
+                with torch.no_grad():
+                    for b, value in buffers:
+                        b.copy_(value)
+            self._traced[key] = traced
+        return traced(x)
+
     @staticmethod
     def _repeat_n(x: torch.Tensor, n: int) -> torch.Tensor:
         r"""
@@ -224,3 +599,152 @@ class MCDropout(ALRModel):
                 "fast MC dropout."
             ) from e
         return out
+
+
+class DeepEnsemble(ALRModel):
+    def __init__(
+        self,
+        models: Sequence[nn.Module],
+        reduce: Optional[str] = "logsumexp",
+        output_transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+        vectorise: Optional[bool] = None,
+    ):
+        r"""
+        A wrapper that turns a collection of identically-structured models into a
+        `deep ensemble <https://arxiv.org/abs/1612.01474>`_ (Lakshminarayanan et al., 2017)
+        with the same interface as :class:`MCDropout`: each member plays the role of a stochastic forward pass.
+        Hence, it can be used in place of :class:`MCDropout` in acquisition functions
+        (e.g. `BALD(eval_fwd_exp(ensemble))`). The members are evaluated in one batched call
+        (see :class:`alr.modules.ensemble.StackedModules`) rather than one after another.
+
+        Args:
+            models (Sequence[`nn.Module`]): ensemble members with identical architecture. Each member's forward pass
+                should return (log) probabilities, otherwise, use `output_transform`. The members are not copied;
+                they should be trained individually.
+            reduce (str, optional): either `"logsumexp"` or `"mean"`. See :class:`MCDropout`.
+            output_transform (callable, optional): model's output is given as input and the output of this
+                callable is expected to return (log) probabilities.
+            vectorise (bool, optional): if false, members are evaluated in a for-loop. See
+                :class:`alr.modules.ensemble.StackedModules`.
+
+        Attributes:
+              members (`nn.ModuleList`): ensemble members
+              n_forward (int): number of members
+        """
+        super(DeepEnsemble, self).__init__()
+        self.members = nn.ModuleList(models)
+        self.n_forward = len(self.members)
+        self._output_transform = (
+            output_transform if output_transform is not None else lambda x: x
+        )
+        self._reduce = reduce.lower()
+        assert self._reduce in {"logsumexp", "mean"}
+        self._stacked = StackedModules(self.members, vectorise=vectorise)
+        self.snap()
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        r"""
+        Returns the (log) mean score of the members' predictions. See :meth:`MCDropout.forward`.
+
+        Args:
+            x (`torch.Tensor`): input tensor, any size
+
+        Returns:
+            `torch.Tensor`:
+                output tensor of size :math:`N \times C` where
+                :math:`N` is the batch size and :math:`C` is the number of target classes.
+        """
+        if self._reduce == "mean":
+            return torch.mean(self.stochastic_forward(x), dim=0)
+        # if self._reduce == "logsumexp"
+        return torch.logsumexp(self.stochastic_forward(x), dim=0) - math.log(
+            self.n_forward
+        )
+
+    def stochastic_forward(self, x: torch.Tensor) -> torch.Tensor:
+        r"""
+        Returns a :math:`M \times N \times C` `torch.Tensor` where:
+
+            1. :math:`M` is equal to the number of members, `self.n_forward`
+            2. :math:`N` is the batch size, equal to `x.size(0)`
+            3. :math:`C` is the number of units in the final layer (e.g. number of classes in a classification model)
+
+        Args:
+            x (`torch.Tensor`): input tensor
+
+        Returns:
+            `torch.Tensor`: output tensor of shape :math:`M \times N \times C`
+        """
+        preds = self._stacked(x)
+        preds = self._output_transform(preds.flatten(0, 1))
+        return preds.view(self.n_forward, -1, *preds.size()[1:])
+
+    def _modules_replaced(self) -> None:
+        # quantisation replaces the members themselves
+        self._stacked = StackedModules(self.members, vectorise=self._stacked._vectorise)
+
+
+class _Composed(nn.Module):
+    # base model, output transform and (for fast MC dropout) the batch repeat
+    # as a single module so they're traced as one graph
+    def __init__(
+        self,
+        model: nn.Module,
+        output_transform: Callable,
+        repeat: int,
+        prefix: Optional[nn.Module] = None,
+    ):
+        super(_Composed, self).__init__()
+        self.model = model
+        self.prefix = prefix
+        self._output_transform = output_transform
+        self._repeat = repeat
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if self.prefix is not None:
+            x = self.prefix(x)
+        if self._repeat == 1:
+            return self._output_transform(self.model(x))
+        x = x.repeat(self._repeat, *([1] * (x.ndim - 1)))
+        preds = self._output_transform(self.model(x))
+        return preds.view(self._repeat, -1, *preds.size()[1:])
+
+
+class _TraceCache(dict):
+    # traced graphs are tied to the model they were traced from: copies start with an empty cache
+    def __deepcopy__(self, memo):
+        return _TraceCache()
+
+    def __reduce__(self):
+        return _TraceCache, ()
+
+
+def _logsumexp_reduce(preds: torch.Tensor, n: int) -> torch.Tensor:
+    return torch.logsumexp(preds, dim=0) - math.log(n)
+
+
+def _mean_reduce(preds: torch.Tensor, n: int) -> torch.Tensor:
+    return torch.mean(preds, dim=0)
+
+
+@functools.lru_cache(maxsize=None)
+def _scripted_reduce(reduce: str) -> Callable[[torch.Tensor, int], torch.Tensor]:
+    # scripted on first use rather than at import time
+    if reduce == "mean":
+        return torch.jit.script(_mean_reduce)
+    return torch.jit.script(_logsumexp_reduce)
+
+
+def _trace(module: nn.Module, x: torch.Tensor) -> torch.jit.ScriptModule:
+    # tracing runs a forward pass: its dropout masks mustn't consume the global RNG state
+    devices = [x.device.index or 0] if x.is_cuda else []
+    with torch.random.fork_rng(devices=devices):
+        return torch.jit.trace(module, x, check_trace=False)
+
+
+def _seeded_forward(model: nn.Module, x: torch.Tensor) -> torch.Tensor:
+    # same dropout masks on every call without disturbing the global RNG state
+    devices = [x.device.index or 0] if x.is_cuda else []
+    with torch.random.fork_rng(devices=devices), torch.no_grad():
+        torch.manual_seed(0)
+        return model(x)
@@ -13,6 +13,13 @@ from alr.utils._type_aliases import _DeviceType
 _BayesianCallable = Callable[[torch.Tensor], torch.Tensor]
 
 
+def _pool_loader(X_pool: torchdata.Dataset, params: dict) -> torchdata.DataLoader:
+    # fetches each batch of the pool with one call (see alr.data.batch_loader)
+    from alr.data import batch_loader
+
+    return batch_loader(X_pool, **params)
+
+
 def _xlogy(x, y):
     res = x * torch.log(y)
     res[y == 0] = 0.0
@@ -122,7 +129,7 @@ class BALD(AcquisitionFunction):
                 return idxs
             idxs = np.random.choice(pool_size, r, replace=False)
             X_pool = torchdata.Subset(X_pool, idxs)
-        dl = torchdata.DataLoader(X_pool, **self._dl_params)
+        dl = _pool_loader(X_pool, self._dl_params)
         with torch.no_grad():
             mc_preds: torch.Tensor = torch.cat(
                 [self._pred_fn(x.to(self._device) if self._device else x) for x in dl],
@@ -231,7 +238,7 @@ class ICAL(AcquisitionFunction):
         l = self._l
         pool_size = len(X_pool)
         r = self._r if self._r != -1 else pool_size
-        dl = torchdata.DataLoader(X_pool, **self._dl_params)
+        dl = _pool_loader(X_pool, self._dl_params)
         with torch.no_grad():
             mc_preds = torch.cat(
                 [self._pred_fn(x.to(self._device) if self._device else x) for x in dl],
@@ -379,6 +386,53 @@ class ICAL(AcquisitionFunction):
         return res
 
 
+def selection_agreement(
+    reference: AcquisitionFunction,
+    candidate: AcquisitionFunction,
+    X_pool: torchdata.Dataset,
+    b: int,
+    seed: Optional[int] = 42,
+) -> float:
+    r"""
+    Returns the proportion of the top-`b` points selected by `reference` that are also
+    selected by `candidate`. Both acquisition functions are run on `X_pool` with the same
+    (forked) random state, so if `candidate` differs from `reference` only in how the predictions are
+    computed (e.g. :func:`~alr.utils.eval_fwd_exp` with `quantise=True`),
+    the dropout masks and pool subsets are identical and the disagreement is attributable to the
+    difference in predictions alone.
+
+    .. code:: python
+
+        fp32 = BALD(eval_fwd_exp(model), batch_size=512)
+        int8 = BALD(eval_fwd_exp(model, quantise=True), batch_size=512)
+        selection_agreement(fp32, int8, X_pool, b=10)
+
+    :param reference: acquisition function used as the ground truth
+    :type reference: :class:`AcquisitionFunction`
+    :param candidate: acquisition function to compare against `reference`
+    :type candidate: :class:`AcquisitionFunction`
+    :param X_pool: Unlabelled dataset
+    :type X_pool: `torch.utils.data.Dataset`
+    :param b: number of points to acquire
+    :type b: int
+    :param seed: seed used by both acquisition functions
+    :type seed: int, optional
+    :return: proportion of agreement in :math:`[0, 1]`
+    :rtype: float
+    """
+    picks = []
+    np_state = np.random.get_state()
+    try:
+        for acq_fn in (reference, candidate):
+            with torch.random.fork_rng():
+                torch.manual_seed(seed)
+                np.random.seed(seed)
+                picks.append(set(np.asarray(acq_fn(X_pool, b)).tolist()))
+    finally:
+        np.random.set_state(np_state)
+    return len(picks[0] & picks[1]) / b
+
+
 def _bald_score(pred_fn, dataloader, device):
     # for research debugging only
     with torch.no_grad():
@@ -413,7 +467,7 @@ class BatchBALD(AcquisitionFunction):
     def __call__(self, X_pool: torchdata.Dataset, b: int) -> np.array:
         from batchbald_redux.batchbald import get_batchbald_batch
 
-        dl = torchdata.DataLoader(X_pool, **self._dl_params)
+        dl = _pool_loader(X_pool, self._dl_params)
         with torch.no_grad():
             mc_preds_K_N_C: torch.Tensor = torch.cat(
                 [self._pred_fn(x.to(self._device) if self._device else x) for x in dl],
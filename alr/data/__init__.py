@@ -1,13 +1,15 @@
-from typing import Callable, Sequence, Optional, Tuple
+from typing import Callable, List, Sequence, Optional, Tuple, Union
 
 import torch
 import torch.utils.data as torchdata
+from torch.utils.data.dataloader import default_collate
 import copy
+import math
+import warnings
 
 from alr.acquisition import AcquisitionFunction
 from contextlib import contextmanager
 import numpy as np
-import torchvision as tv
 
 
 class UnlabelledDataset(torchdata.Dataset):
@@ -41,6 +43,7 @@ class UnlabelledDataset(torchdata.Dataset):
         self._mask = torch.ones(len(dataset), dtype=torch.bool)
         self._len = len(dataset)
         self._idx_mask = torch.arange(len(dataset))
+        self._shared = False
         self.debug = debug
         if self.debug:
             assert self._label_fn is None
@@ -78,6 +81,8 @@ class UnlabelledDataset(torchdata.Dataset):
         # update masks and length
         self._mask[local_mask[idxs]] = 0
         self._idx_mask = torch.nonzero(self._mask).flatten()
+        if self._shared:
+            self._idx_mask.share_memory_()
         self._len -= len(idxs)
         return labelled
 
@@ -89,6 +94,21 @@ class UnlabelledDataset(torchdata.Dataset):
         # user provided (x, y) => return x only
         return self._dataset[self._idx_mask[idx].item()][0]
 
+    def get_batch(self, idxs: Sequence[int]):
+        r"""
+        Returns the collated points at `idxs` (see :func:`get_batch`).
+
+        Args:
+            idxs (Sequence[int]): indices relative to the current state of this dataset
+
+        Returns:
+            the same batch as collating `self[i]` for each `i` in `idxs`
+        """
+        batch = get_batch(self._dataset, self.convert_idx(idxs))
+        if self._label_fn or self.debug:
+            return batch
+        return batch[0]
+
     def __len__(self) -> int:
         return self._len
 
@@ -118,9 +138,12 @@ class UnlabelledDataset(torchdata.Dataset):
     def labelled_classes(self) -> list:
         r"""
         Return a list of classes that were labelled by the user (`label_fn`).
+        The classes are read with :func:`get_targets`, i.e. from the dataset's metadata
+        where possible, and are always `int` class indices: tensor targets are converted and
+        one-hot (or soft) targets are reduced to their argmax, unlike `self[i][1]`.
 
         Returns:
-            list: list of classes
+            list: list of classes (`int`)
         """
         if self._label_fn is not None:
             import warnings
@@ -129,10 +152,7 @@ class UnlabelledDataset(torchdata.Dataset):
             warnings.warn(
                 "UnlabelledDataset was initialised with label_fn but labelled_classes was invoked."
             )
-        classes = []
-        for i in self.labelled_indices:
-            classes.append(self._dataset[i][1])
-        return classes
+        return get_targets(self._dataset, self.labelled_indices).tolist()
 
     def reset(self) -> None:
         r"""
@@ -145,6 +165,60 @@ class UnlabelledDataset(torchdata.Dataset):
         self._mask = torch.ones(len(self._dataset), dtype=torch.bool)
         self._idx_mask = torch.arange(len(self._dataset))
         self._len = len(self._dataset)
+        if self._shared:
+            self._mask.share_memory_()
+            self._idx_mask.share_memory_()
+
+    def state_dict(self) -> dict:
+        r"""
+        Returns the state of this dataset, i.e. which points have been labelled, as a bitmap
+        (one bit per point of the underlying dataset).
+
+        Returns:
+            dict: state that can be restored with :meth:`load_state_dict`
+        """
+        return {
+            "size": len(self._dataset),
+            "labelled": np.packbits(~self._mask.numpy()),
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        r"""
+        Restores a state returned by :meth:`state_dict`.
+
+        Args:
+            state (dict): state
+
+        Returns:
+            NoneType: None
+        """
+        if state["size"] != len(self._dataset):
+            raise ValueError(
+                f"The state is of a dataset of {state['size']} points, "
+                f"but this dataset has {len(self._dataset)} points."
+            )
+        labelled = np.unpackbits(state["labelled"], count=state["size"]).astype(bool)
+        self._mask = torch.from_numpy(~labelled)
+        self._idx_mask = torch.nonzero(self._mask).flatten()
+        self._len = len(self._idx_mask)
+        if self._shared:
+            self._mask.share_memory_()
+            self._idx_mask.share_memory_()
+
+    def share_memory(self) -> "UnlabelledDataset":
+        r"""
+        Moves the masks of this dataset (and the numeric state of the underlying dataset,
+        see :func:`share_memory`) to shared memory. They stay in shared memory after
+        :meth:`label` and :meth:`reset`.
+
+        Returns:
+            :class:`UnlabelledDataset`: `self`
+        """
+        self._shared = True
+        self._mask.share_memory_()
+        self._idx_mask.share_memory_()
+        share_memory(self._dataset)
+        return self
 
     @contextmanager
     def true_labels(self):
@@ -192,6 +266,8 @@ class DataManager:
         self._labelled = labelled
         self._unlabelled = unlabelled
         self._a_fn = acquisition_fn
+        # absolute indices of every acquisition (see state_dict)
+        self._acquired = []
 
     def acquire(self, b: int, transform=None) -> Tuple[np.array, torchdata.Dataset]:
         r"""
@@ -224,6 +300,7 @@ class DataManager:
         # it's important to get true_idxs before calling label(),
         labelled = self._unlabelled.label(idxs)
         self.append_to_labelled(labelled)
+        self._acquired.append(np.asarray(true_idxs, dtype=np.int64))
         return true_idxs, labelled
 
     @property
@@ -276,6 +353,57 @@ class DataManager:
         """
         self._unlabelled.reset()
         self._labelled = self._old_labelled
+        self._acquired = []
+
+    def state_dict(self) -> dict:
+        r"""
+        Returns the state of this data manager: the (absolute) indices of every acquisition
+        in order and the state of the :attr:`unlabelled` dataset. Only points acquired by
+        :meth:`acquire` since the last :meth:`reset` are part of the state.
+
+        Returns:
+            dict: state that can be restored with :meth:`load_state_dict`
+
+        Raises:
+            RuntimeError: if points were appended to :attr:`labelled` with :meth:`append_to_labelled`
+        """
+        if self.n_labelled != len(self._old_labelled) + sum(map(len, self._acquired)):
+            raise RuntimeError(
+                "Can't save the state of a data manager whose labelled dataset "
+                "was modified outside of acquire()."
+            )
+        sizes = np.array([len(a) for a in self._acquired], dtype=np.int64)
+        return {
+            "acquired": np.concatenate(self._acquired or [np.empty(0, np.int64)]),
+            "sizes": sizes,
+            "unlabelled": self._unlabelled.state_dict(),
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        r"""
+        Restores a state returned by :meth:`state_dict`: this data manager is reset and every
+        acquisition is replayed in order, so :attr:`labelled` and :attr:`unlabelled` are
+        the same as when the state was saved (without calling the acquisition function).
+
+        Args:
+            state (dict): state
+
+        Returns:
+            NoneType: None
+        """
+        self.reset()
+        for idxs in np.split(state["acquired"], np.cumsum(state["sizes"])[:-1]):
+            if not len(idxs):
+                continue
+            # absolute to relative indices: the remaining points are in ascending order
+            remaining = self._unlabelled.convert_idx(np.arange(self.n_unlabelled))
+            labelled = self._unlabelled.label(np.searchsorted(remaining, idxs))
+            self.append_to_labelled(labelled)
+            self._acquired.append(idxs)
+        if not _equal_states(self._unlabelled.state_dict(), state["unlabelled"]):
+            raise ValueError(
+                "The acquisitions don't match the unlabelled dataset's state."
+            )
 
     def append_to_labelled(self, dataset: torchdata.Dataset):
         r"""
@@ -313,6 +441,30 @@ class PseudoLabelDataset(torchdata.Dataset):
     def __getitem__(self, idx):
         return self._dataset[idx], self._labels[idx]
 
+    def get_batch(self, idxs: Sequence[int]):
+        r"""
+        Returns the collated points at `idxs` (see :func:`get_batch`).
+
+        Args:
+            idxs (Sequence[int]): indices
+
+        Returns:
+            the same batch as collating `self[i]` for each `i` in `idxs`
+        """
+        return get_batch(self._dataset, idxs), _take(self._labels, idxs)
+
+    def share_memory(self) -> "PseudoLabelDataset":
+        r"""
+        Moves the labels and the underlying dataset's numeric state to
+        shared memory (see :func:`share_memory`).
+
+        Returns:
+            :class:`PseudoLabelDataset`: `self`
+        """
+        self._labels = _shared(self._labels)
+        share_memory(self._dataset)
+        return self
+
 
 class RelabelDataset(torchdata.Dataset):
     def __init__(self, dataset: torchdata.Dataset, labels: Sequence):
@@ -335,6 +487,30 @@ class RelabelDataset(torchdata.Dataset):
     def __getitem__(self, idx):
         return self._dataset[idx][0], self._labels[idx]
 
+    def get_batch(self, idxs: Sequence[int]):
+        r"""
+        Returns the collated points at `idxs` (see :func:`get_batch`).
+
+        Args:
+            idxs (Sequence[int]): indices
+
+        Returns:
+            the same batch as collating `self[i]` for each `i` in `idxs`
+        """
+        return get_batch(self._dataset, idxs)[0], _take(self._labels, idxs)
+
+    def share_memory(self) -> "RelabelDataset":
+        r"""
+        Moves the labels and the underlying dataset's numeric state to
+        shared memory (see :func:`share_memory`).
+
+        Returns:
+            :class:`RelabelDataset`: `self`
+        """
+        self._labels = _shared(self._labels)
+        share_memory(self._dataset)
+        return self
+
 
 class TransformedDataset(torchdata.Dataset):
     """
@@ -347,6 +523,9 @@ class TransformedDataset(torchdata.Dataset):
         transform: Optional[list] = None,
         augmentation: Optional[list] = None,
     ):
+        # torchvision is slow to import: only import it when it's needed
+        import torchvision as tv
+
         self.raw_dataset = raw_dataset
         self._transforms = transform
         self._augmentations = augmentation
@@ -358,6 +537,46 @@ class TransformedDataset(torchdata.Dataset):
     def __len__(self):
         return len(self.raw_dataset)
 
+    def batched(self, seed: Optional[int] = None):
+        r"""
+        Moves the augmentation and transforms of this dataset to the batch level.
+        The returned dataset only converts raw (PIL) images into uint8 tensors
+        (i.e. data loader workers only decode) and the returned
+        :class:`alr.data.batch_transforms.Compose` applies the equivalent of `augmentation` and `transform`
+        to collated batches, see :class:`alr.data.batch_transforms.BatchTransformLoader`.
+
+        Args:
+            seed (int, optional): seed of the batch augmentation
+
+        Returns:
+            tuple: a 2-tuple of (:class:`TransformedDataset`, :class:`alr.data.batch_transforms.Compose`)
+        """
+        import torchvision as tv
+        from alr.data.batch_transforms import Compose
+
+        transforms = (self._augmentations or []) + (self._transforms or [])
+        batch_transform = Compose.from_torchvision(transforms, seed=seed)
+        dataset = TransformedDataset(
+            self.raw_dataset, transform=[tv.transforms.PILToTensor()]
+        )
+        return dataset, batch_transform
+
+    def get_batch(self, idxs: Sequence[int]):
+        r"""
+        Returns the collated points at `idxs` (see :func:`get_batch`). Transforms and augmentations
+        are applied to one point at a time, hence the points are only fetched from the raw dataset
+        at once if there are none (see :meth:`batched` for batch augmentation instead).
+
+        Args:
+            idxs (Sequence[int]): indices
+
+        Returns:
+            the same batch as collating `self[i]` for each `i` in `idxs`
+        """
+        if self._transforms or self._augmentations:
+            return default_collate([self[int(i)] for i in idxs])
+        return get_batch(self.raw_dataset, idxs)
+
     def __getitem__(self, idx):
         item = self.raw_dataset[idx]
         if isinstance(item, (list, tuple)):
@@ -367,6 +586,85 @@ class TransformedDataset(torchdata.Dataset):
             return self.transform(self.augmentation(item))
 
 
+class IndexView(torchdata.Subset):
+    def __init__(self, dataset: torchdata.Dataset, indices: Sequence[int]):
+        r"""
+        A :class:`torch.utils.data.Subset` that stores its indices as a flat int64 array. Views of views (and
+        of subsets) are composed by indexing the index arrays instead of nesting, so a point is always
+        one lookup away from the underlying dataset (e.g. for :func:`get_batch`).
+
+        Args:
+            dataset (`torch.utils.data.Dataset`): dataset
+            indices (Sequence[int]): indices of `dataset` in this view
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        while isinstance(dataset, torchdata.Subset):
+            indices = np.asarray(dataset.indices, dtype=np.int64)[indices]
+            dataset = dataset.dataset
+        super(IndexView, self).__init__(dataset, indices)
+
+
+def partition(
+    dataset: torchdata.Dataset, idxs: Sequence[int]
+) -> Tuple[IndexView, IndexView]:
+    r"""
+    Partitions `dataset` into the points at `idxs` and the remaining points (in ascending order).
+    The remaining points are found with a boolean mask rather than a set difference.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): dataset
+        idxs (Sequence[int]): indices of the first part
+
+    Returns:
+        Tuple[:class:`IndexView`, :class:`IndexView`]: the points at `idxs` and the remaining points
+    """
+    idxs = np.asarray(idxs, dtype=np.int64).reshape(-1)
+    mask = np.ones(len(dataset), dtype=bool)
+    mask[idxs] = False
+    return IndexView(dataset, idxs), IndexView(dataset, np.flatnonzero(mask))
+
+
+def random_split(
+    dataset: torchdata.Dataset,
+    lengths: Sequence[Union[int, float]],
+    generator: Optional[torch.Generator] = None,
+) -> List[IndexView]:
+    r"""
+    Same as :func:`torch.utils.data.random_split` (the same generator state gives the same split),
+    but returns :class:`IndexView` s.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): dataset
+        lengths (Sequence[Union[int, float]]): lengths of the splits; they must sum to `len(dataset)`.
+            Alternatively, fractions that sum to 1: the length of each split is the floor of its
+            fraction of `len(dataset)`, and the remaining points are added one at a time
+            to the splits in turn (as in torch).
+        generator (`torch.Generator`, optional): random number generator
+
+    Returns:
+        List[:class:`IndexView`]: the splits
+    """
+    if math.isclose(sum(lengths), 1) and sum(lengths) <= 1:
+        n = len(dataset)
+        fractions = lengths
+        lengths = [int(math.floor(n * f)) for f in fractions]
+        for i in range(n - sum(lengths)):
+            lengths[i % len(lengths)] += 1
+        for i, length in enumerate(lengths):
+            if length == 0:
+                warnings.warn(
+                    f"Length of split at index {i} is 0. "
+                    f"This might result in an empty dataset."
+                )
+    if sum(lengths) != len(dataset):
+        raise ValueError(
+            "Sum of input lengths does not equal the length of the input dataset!"
+        )
+    perm = torch.randperm(sum(lengths), generator=generator).numpy()
+    offsets = np.cumsum(lengths)
+    return [IndexView(dataset, perm[end - n : end]) for n, end in zip(lengths, offsets)]
+
+
 def disable_augmentation(dataset: UnlabelledDataset):
     r"""
     When using :class:`UnlabelledDataset` and :class:`TransformedDataset`, this function
@@ -390,3 +688,308 @@ def disable_augmentation(dataset: UnlabelledDataset):
     )
     assert len(new_dataset) == expected_len
     return new_dataset
+
+
+def get_batch(dataset: torchdata.Dataset, idxs: Sequence[int]):
+    r"""
+    Returns the points of `dataset` at `idxs` as a batch, i.e. the same as collating `dataset[i]`
+    for each `i` in `idxs` with :func:`torch.utils.data.dataloader.default_collate`, but with a single call
+    per dataset layer: datasets with a `get_batch` method (the wrappers in :mod:`alr.data`,
+    :class:`alr.data.cache.CachedDataset`) slice the layer below, :class:`torch.utils.data.Subset` and
+    :class:`torch.utils.data.ConcatDataset` map the indices, and :class:`torch.utils.data.TensorDataset`
+    gathers all points with one indexing operation. Other datasets are indexed point by point.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): dataset
+        idxs (Sequence[int]): indices
+
+    Returns:
+        the collated batch
+    """
+    if hasattr(dataset, "get_batch"):
+        return dataset.get_batch(idxs)
+    if isinstance(dataset, torchdata.TensorDataset):
+        idxs = torch.as_tensor(np.asarray(idxs, dtype=np.int64))
+        return tuple(t[idxs] for t in dataset.tensors)
+    if isinstance(dataset, torchdata.Subset):
+        return get_batch(dataset.dataset, np.asarray(dataset.indices)[np.asarray(idxs)])
+    if isinstance(dataset, torchdata.ConcatDataset):
+        idxs = np.asarray(idxs, dtype=np.int64)
+        which = np.searchsorted(dataset.cumulative_sizes, idxs, side="right")
+        starts = np.concatenate([[0], dataset.cumulative_sizes])
+        positions, batches = [], []
+        for i in np.unique(which):
+            (pos,) = np.nonzero(which == i)
+            positions.append(pos)
+            batches.append(get_batch(dataset.datasets[i], idxs[pos] - starts[i]))
+        # put the points back in the order of idxs
+        order = np.argsort(np.concatenate(positions), kind="stable")
+        return _merge(batches, torch.from_numpy(order))
+    return default_collate([dataset[int(i)] for i in idxs])
+
+
+def batch_loader(
+    dataset: torchdata.Dataset,
+    batch_size: Optional[int] = 1,
+    shuffle: Optional[bool] = False,
+    drop_last: Optional[bool] = False,
+    **kwargs,
+) -> torchdata.DataLoader:
+    r"""
+    A :class:`torch.utils.data.DataLoader` that fetches each batch with a single :func:`get_batch` call
+    (a batch sampler and an identity collate) rather than one `__getitem__` call per point followed
+    by a collate. It yields the same batches as a regular data loader with the same arguments.
+    Iterable datasets and custom samplers or collate functions get a regular data loader.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): dataset
+        batch_size (int, optional): batch size
+        shuffle (bool, optional): shuffle the points every epoch
+        drop_last (bool, optional): drop the last incomplete batch
+        **kwargs (Any, optional): other arguments of :class:`torch.utils.data.DataLoader` (e.g. `num_workers`)
+
+    Returns:
+        `torch.utils.data.DataLoader`: data loader
+    """
+    if isinstance(dataset, torchdata.IterableDataset) or kwargs.keys() & {
+        "collate_fn",
+        "sampler",
+        "batch_sampler",
+    }:
+        return torchdata.DataLoader(
+            dataset,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            drop_last=drop_last,
+            **kwargs,
+        )
+    sampler = (
+        torchdata.RandomSampler(dataset)
+        if shuffle
+        else torchdata.SequentialSampler(dataset)
+    )
+    return torchdata.DataLoader(
+        _BatchFetcher(dataset),
+        sampler=torchdata.BatchSampler(sampler, batch_size, drop_last),
+        batch_size=None,
+        collate_fn=_identity,
+        **kwargs,
+    )
+
+
+class _BatchFetcher(torchdata.Dataset):
+    # indexed with a list of indices by batch_loader's batch sampler
+    def __init__(self, dataset: torchdata.Dataset):
+        self.dataset = dataset
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def __getitem__(self, idxs):
+        return get_batch(self.dataset, idxs)
+
+
+def _identity(batch):
+    return batch
+
+
+def _equal_states(a, b) -> bool:
+    # compares (nested) state dicts of arrays
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and a.keys() == b.keys()
+            and all(_equal_states(a[k], b[k]) for k in a)
+        )
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_equal_states(x, y) for x, y in zip(a, b))
+    return np.array_equal(a, b)
+
+
+def _take(values, idxs: Sequence[int]):
+    if isinstance(values, torch.Tensor):
+        return values[torch.as_tensor(np.asarray(idxs, dtype=np.int64))]
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        return torch.from_numpy(values[np.asarray(idxs, dtype=np.int64)])
+    return default_collate([values[int(i)] for i in idxs])
+
+
+def _merge(batches: list, order: torch.Tensor):
+    # concatenates batches (tensors or nested sequences of them) and reorders the points
+    first = batches[0]
+    if isinstance(first, torch.Tensor):
+        return torch.cat(batches)[order]
+    merged = [_merge(list(fields), order) for fields in zip(*batches)]
+    return merged if isinstance(first, list) else tuple(merged)
+
+
+def share_memory(dataset: torchdata.Dataset) -> torchdata.Dataset:
+    r"""
+    Moves the numeric state of `dataset` and the datasets it wraps into shared memory, in place.
+    Data loader workers then read the same pages instead of copying the lists of Python objects that
+    reference counting touches (e.g. :class:`torch.utils.data.Subset`'s indices, torchvision's targets),
+    so their memory stays flat as the number of workers grows. Processes started with
+    `spawn` (e.g. data loader workers, :func:`alr.utils.run_seeds`) receive handles to the shared
+    memory instead of copies, provided the dataset is sent with :mod:`torch.multiprocessing`.
+
+    Datasets with a `share_memory` method (e.g. :class:`UnlabelledDataset`) are asked to share
+    their own state; :class:`torch.utils.data.Subset`'s indices, :class:`torch.utils.data.ConcatDataset`'s
+    datasets, :class:`torch.utils.data.TensorDataset`'s tensors, and `data` and `targets` attributes (e.g. torchvision's MNIST and CIFAR) are handled here.
+    Tensors are moved to shared memory in place; lists and arrays are replaced by numpy views of shared
+    tensors (e.g. a list of targets becomes an int64 array) that are pickled as the tensors they view.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): dataset
+
+    Returns:
+        `torch.utils.data.Dataset`: `dataset`
+    """
+    if hasattr(dataset, "share_memory"):
+        dataset.share_memory()
+    elif isinstance(dataset, torchdata.Subset):
+        dataset.indices = _shared(dataset.indices)
+        share_memory(dataset.dataset)
+    elif isinstance(dataset, torchdata.ConcatDataset):
+        for ds in dataset.datasets:
+            share_memory(ds)
+    elif isinstance(dataset, TransformedDataset):
+        share_memory(dataset.raw_dataset)
+    elif isinstance(dataset, torchdata.TensorDataset):
+        for tensor in dataset.tensors:
+            tensor.share_memory_()
+    else:
+        for attr in ("data", "targets"):
+            value = getattr(dataset, attr, None)
+            if isinstance(value, (torch.Tensor, np.ndarray)) or (
+                isinstance(value, list) and value and isinstance(value[0], int)
+            ):
+                setattr(dataset, attr, _shared(value))
+    return dataset
+
+
+def _shared(values):
+    # tensors stay tensors, everything else becomes a numpy view of a shared tensor
+    if isinstance(values, torch.Tensor):
+        return values.share_memory_()
+    if len(values) and isinstance(values[0], torch.Tensor):
+        return torch.stack(list(values)).share_memory_()
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values)
+    return _shared_array(torch.from_numpy(values).clone().share_memory_())
+
+
+class _SharedArray(np.ndarray):
+    # a numpy view of a shared tensor that's pickled as the tensor, hence torch.multiprocessing
+    # sends a handle to its shared memory instead of the array's bytes. Slices and other
+    # arrays derived from it don't keep the tensor and are pickled as regular arrays.
+    def __reduce__(self):
+        tensor = getattr(self, "_tensor", None)
+        if tensor is None:
+            return np.asarray(self).__reduce__()
+        return _shared_array, (tensor,)
+
+
+def _shared_array(tensor: torch.Tensor) -> np.ndarray:
+    array = tensor.numpy().view(_SharedArray)
+    array._tensor = tensor
+    return array
+
+
+def get_targets(
+    dataset: torchdata.Dataset, indices: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    r"""
+    Returns the class of every point in `dataset` without loading the inputs wherever possible.
+    The targets are read from a `targets` attribute (e.g. torchvision's datasets,
+    :class:`alr.data.cache.CachedDataset`) or the second tensor of a
+    :class:`torch.utils.data.TensorDataset`, and propagated through
+    :class:`torch.utils.data.Subset`, :class:`torch.utils.data.ConcatDataset`,
+    :class:`TransformedDataset`, :class:`UnlabelledDataset` (the remaining points),
+    :class:`RelabelDataset`, and :class:`PseudoLabelDataset`. Other datasets are
+    indexed point by point (only at `indices`, if given). One-hot (or soft) targets are
+    converted to class indices.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): labelled dataset
+        indices (Sequence[int], optional): if given, only the classes of these points are returned
+
+    Returns:
+        `np.ndarray`: int64 array of classes of shape :math:`N` (or the number of `indices`)
+
+    Raises:
+        ValueError: Occurs when `dataset` is an :class:`UnlabelledDataset` with a `label_fn`
+            (its targets aren't known until they're labelled).
+    """
+    if indices is not None:
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    if isinstance(dataset, UnlabelledDataset):
+        if dataset._label_fn is not None:
+            raise ValueError(
+                "The targets of an UnlabelledDataset with a label_fn are unknown."
+            )
+        return get_targets(dataset._dataset, _at(dataset._idx_mask.numpy(), indices))
+    if isinstance(dataset, (RelabelDataset, PseudoLabelDataset)):
+        return _at(_as_classes(dataset._labels), indices)
+    if isinstance(dataset, TransformedDataset):
+        return get_targets(dataset.raw_dataset, indices)
+    if isinstance(dataset, torchdata.Subset):
+        return get_targets(
+            dataset.dataset,
+            _at(np.asarray(dataset.indices, dtype=np.int64), indices),
+        )
+    if isinstance(dataset, torchdata.ConcatDataset):
+        if indices is None:
+            return np.concatenate([get_targets(ds) for ds in dataset.datasets])
+        # the dataset that each index falls in, and the index within it
+        which = np.searchsorted(dataset.cumulative_sizes, indices, side="right")
+        offsets = np.concatenate([[0], dataset.cumulative_sizes])
+        targets = np.empty(len(indices), dtype=np.int64)
+        for d in np.unique(which):
+            at = which == d
+            targets[at] = get_targets(dataset.datasets[d], indices[at] - offsets[d])
+        return targets
+    if isinstance(dataset, torchdata.TensorDataset) and len(dataset.tensors) > 1:
+        targets = dataset.tensors[1]
+        if indices is not None:
+            targets = targets[torch.from_numpy(indices)]
+        return _as_classes(targets)
+    targets = getattr(dataset, "targets", None)
+    # a target transform may change the targets
+    if targets is not None and getattr(dataset, "target_transform", None) is None:
+        return _at(_as_classes(targets), indices)
+    if indices is None:
+        indices = range(len(dataset))
+    return _as_classes([dataset[i][1] for i in indices])
+
+
+def class_counts(
+    dataset: torchdata.Dataset, num_classes: Optional[int] = None
+) -> np.ndarray:
+    r"""
+    Counts the number of points of each class in `dataset` (see :func:`get_targets`).
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): labelled dataset
+        num_classes (int, optional): length of the returned array. Defaults to the largest class + 1.
+
+    Returns:
+        `np.ndarray`: the number of points of each class
+    """
+    return np.bincount(get_targets(dataset), minlength=num_classes or 0)
+
+
+def _at(values: np.ndarray, indices: Optional[np.ndarray]) -> np.ndarray:
+    # all of `values` if `indices` is None
+    return values if indices is None else values[indices]
+
+
+def _as_classes(targets) -> np.ndarray:
+    if isinstance(targets, torch.Tensor):
+        targets = targets.cpu().numpy()
+    elif len(targets) and isinstance(targets[0], torch.Tensor):
+        targets = torch.stack(list(targets)).cpu().numpy()
+    targets = np.asarray(targets)
+    if targets.ndim > 1:
+        # one-hot or soft targets
+        targets = targets.argmax(axis=-1)
+    return targets.astype(np.int64, copy=False)
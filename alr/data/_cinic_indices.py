@@ -1,60005 +1,18 @@
-_cinic_train_indices = [
-    123137,
-    130504,
-    31166,
-    26262,
-    64868,
-    169616,
-    166225,
-    81650,
-    12169,
-    86247,
-    86592,
-    126842,
-    83282,
-    106343,
-    58281,
-    11599,
-    110819,
-    134993,
-    137811,
-    178337,
-    86975,
-    38642,
-    161593,
-    158580,
-    158393,
-    167975,
-    129224,
-    82405,
-    66350,
-    126629,
-    176132,
-    35,
-    104424,
-    13656,
-    114262,
-    138632,
-    2862,
-    157644,
-    55010,
-    128181,
-    112397,
-    69234,
-    12584,
-    69889,
-    58816,
-    114222,
-    60763,
-    53842,
-    84549,
-    16307,
-    50731,
-    81811,
-    13678,
-    120521,
-    140149,
-    33181,
-    92577,
-    68142,
-    5554,
-    58742,
-    115751,
-    28452,
-    121090,
-    46041,
-    109517,
-    133966,
-    174928,
-    52065,
-    40292,
-    3442,
-    127695,
-    10763,
-    73880,
-    99606,
-    56658,
-    56423,
-    15256,
-    28050,
-    123635,
-    13059,
-    179720,
-    140731,
-    172923,
-    11147,
-    94813,
-    15680,
-    94004,
-    109148,
-    36963,
-    4196,
-    177534,
-    138664,
-    90081,
-    152415,
-    54323,
-    29931,
-    21120,
-    162825,
-    29370,
-    17823,
-    75363,
-    19561,
-    22749,
-    154908,
-    64491,
-    96053,
-    143044,
-    21110,
-    35746,
-    133362,
-    106582,
-    171580,
-    155593,
-    91505,
-    40408,
-    31624,
-    157958,
-    36333,
-    102570,
-    70193,
-    118318,
-    42676,
-    118965,
-    150047,
-    179616,
-    135562,
-    117534,
-    47316,
-    141718,
-    83811,
-    94093,
-    143402,
-    159294,
-    130851,
-    53581,
-    101867,
-    27189,
-    132293,
-    117036,
-    52250,
-    63509,
-    156508,
-    75218,
-    156622,
-    135060,
-    49694,
-    111907,
-    14556,
-    57650,
-    110473,
-    149451,
-    42432,
-    29751,
-    30321,
-    123321,
-    34203,
-    25048,
-    36641,
-    100973,
-    138773,
-    142393,
-    123219,
-    81341,
-    41011,
-    19482,
-    57767,
-    92269,
-    41044,
-    143806,
-    173344,
-    86882,
-    91059,
-    155310,
-    119538,
-    131473,
-    83976,
-    46864,
-    71489,
-    177372,
-    162447,
-    1416,
-    158960,
-    79240,
-    70395,
-    49128,
-    33328,
-    68839,
-    51043,
-    162902,
-    40437,
-    111762,
-    75107,
-    4362,
-    119915,
-    66329,
-    76355,
-    92840,
-    27538,
-    121634,
-    166574,
-    75079,
-    134323,
-    33925,
-    147236,
-    145217,
-    64253,
-    83137,
-    123755,
-    98149,
-    78899,
-    79323,
-    46877,
-    41558,
-    168282,
-    18617,
-    122275,
-    166617,
-    30116,
-    163132,
-    167161,
-    17911,
-    174522,
-    67167,
-    84485,
-    77502,
-    24111,
-    25299,
-    106374,
-    120770,
-    93412,
-    75562,
-    121096,
-    152102,
-    162621,
-    49590,
-    123997,
-    165738,
-    41897,
-    66977,
-    82457,
-    154831,
-    84825,
-    2888,
-    154707,
-    160226,
-    72543,
-    57731,
-    58365,
-    80663,
-    164741,
-    173226,
-    130813,
-    8262,
-    125550,
-    171217,
-    94398,
-    132423,
-    123567,
-    118084,
-    16254,
-    98798,
-    99469,
-    50208,
-    76745,
-    172748,
-    53876,
-    95473,
-    42854,
-    156333,
-    83964,
-    90239,
-    2996,
-    2992,
-    130139,
-    133573,
-    154637,
-    96848,
-    351,
-    144307,
-    117320,
-    95036,
-    40788,
-    102957,
-    74221,
-    164002,
-    58351,
-    156098,
-    171815,
-    17141,
-    133553,
-    148602,
-    14733,
-    124861,
-    66298,
-    130421,
-    89749,
-    86815,
-    167411,
-    126828,
-    29848,
-    130763,
-    155942,
-    132938,
-    124921,
-    103907,
-    20854,
-    75484,
-    113580,
-    84893,
-    57800,
-    38965,
-    171953,
-    133718,
-    9732,
-    20952,
-    167908,
-    67721,
-    22682,
-    26290,
-    99938,
-    37050,
-    57460,
-    40427,
-    32236,
-    110608,
-    10082,
-    16759,
-    79107,
-    39942,
-    90999,
-    116406,
-    172113,
-    114228,
-    43592,
-    8256,
-    171306,
-    149516,
-    137273,
-    12162,
-    176209,
-    34790,
-    99325,
-    125286,
-    41358,
-    11167,
-    4093,
-    63202,
-    23369,
-    174409,
-    168311,
-    175719,
-    114247,
-    146283,
-    114822,
-    175361,
-    64227,
-    134375,
-    86181,
-    24692,
-    39240,
-    68192,
-    37579,
-    154095,
-    147297,
-    91292,
-    55898,
-    131442,
-    80304,
-    62622,
-    40557,
-    5991,
-    134758,
-    81116,
-    177971,
-    73546,
-    94469,
-    147145,
-    134340,
-    13387,
-    48797,
-    43613,
-    32524,
-    44685,
-    136482,
-    69998,
-    107081,
-    44709,
-    131729,
-    114616,
-    29198,
-    167240,
-    38999,
-    151762,
-    172072,
-    71611,
-    78917,
-    99298,
-    161716,
-    151824,
-    41535,
-    39174,
-    127100,
-    63357,
-    63377,
-    155607,
-    78470,
-    79575,
-    91682,
-    34205,
-    53757,
-    111643,
-    64917,
-    171980,
-    77405,
-    42433,
-    96795,
-    117169,
-    164522,
-    149244,
-    51701,
-    145775,
-    83216,
-    23195,
-    176003,
-    104521,
-    107957,
-    2785,
-    125638,
-    170211,
-    95851,
-    103004,
-    30790,
-    39969,
-    105402,
-    100217,
-    30191,
-    5567,
-    102436,
-    135861,
-    84408,
-    163894,
-    93777,
-    18060,
-    97530,
-    161506,
-    1635,
-    37759,
-    14311,
-    104815,
-    139615,
-    170052,
-    20846,
-    96859,
-    78745,
-    173588,
-    147643,
-    95073,
-    175750,
-    18475,
-    11051,
-    119794,
-    47220,
-    169515,
-    3241,
-    92883,
-    55125,
-    139071,
-    70101,
-    32277,
-    93839,
-    43965,
-    172519,
-    3335,
-    81191,
-    105226,
-    162047,
-    23044,
-    5820,
-    41517,
-    101579,
-    126347,
-    45593,
-    157069,
-    116314,
-    96817,
-    5458,
-    82685,
-    35383,
-    58938,
-    94459,
-    76530,
-    64221,
-    116975,
-    114828,
-    37032,
-    127366,
-    38518,
-    6501,
-    37576,
-    22349,
-    25183,
-    124652,
-    45459,
-    50780,
-    71477,
-    134850,
-    81742,
-    80204,
-    73408,
-    50724,
-    115417,
-    175642,
-    6058,
-    28315,
-    66014,
-    102710,
-    163895,
-    50781,
-    138626,
-    151220,
-    66360,
-    8588,
-    24658,
-    113460,
-    136676,
-    56253,
-    88542,
-    74588,
-    73625,
-    90589,
-    105123,
-    109755,
-    171322,
-    23192,
-    106828,
-    82568,
-    129538,
-    97959,
-    44010,
-    122657,
-    69244,
-    110526,
-    113882,
-    51808,
-    178640,
-    19520,
-    110085,
-    84422,
-    119299,
-    67941,
-    104941,
-    90346,
-    133752,
-    18347,
-    174386,
-    173365,
-    93172,
-    157375,
-    168974,
-    42185,
-    121913,
-    175220,
-    118492,
-    12670,
-    34143,
-    123877,
-    56979,
-    58110,
-    143599,
-    103852,
-    157742,
-    90922,
-    128818,
-    41824,
-    136170,
-    175900,
-    161687,
-    75568,
-    44073,
-    59479,
-    136320,
-    177265,
-    16593,
-    148788,
-    65798,
-    55080,
-    43936,
-    32342,
-    75613,
-    54632,
-    90171,
-    20658,
-    117816,
-    42454,
-    306,
-    116887,
-    165839,
-    159121,
-    167959,
-    89077,
-    115621,
-    15267,
-    143110,
-    114080,
-    110752,
-    94236,
-    77372,
-    34317,
-    117168,
-    7117,
-    122509,
-    41502,
-    142737,
-    38376,
-    91576,
-    87198,
-    117950,
-    29880,
-    155623,
-    28518,
-    106737,
-    153913,
-    79129,
-    40552,
-    58159,
-    108571,
-    91899,
-    174749,
-    122937,
-    72355,
-    105180,
-    27336,
-    12347,
-    37824,
-    15140,
-    54421,
-    88245,
-    124081,
-    65981,
-    95101,
-    129502,
-    76818,
-    101315,
-    29760,
-    26822,
-    163330,
-    116673,
-    156694,
-    132302,
-    133123,
-    15777,
-    111834,
-    115931,
-    3946,
-    92797,
-    25489,
-    21903,
-    109117,
-    7058,
-    5254,
-    23069,
-    34098,
-    136716,
-    10641,
-    124215,
-    97587,
-    170312,
-    123944,
-    21501,
-    168002,
-    24040,
-    152246,
-    39113,
-    97759,
-    28237,
-    170640,
-    26570,
-    170656,
-    98152,
-    174969,
-    81615,
-    82320,
-    66211,
-    50347,
-    57968,
-    131302,
-    154483,
-    165204,
-    163303,
-    102360,
-    171706,
-    34353,
-    69641,
-    102085,
-    134830,
-    147844,
-    25367,
-    125195,
-    140277,
-    44795,
-    134360,
-    32807,
-    49626,
-    117803,
-    109141,
-    63939,
-    121454,
-    143512,
-    19767,
-    160612,
-    120313,
-    101566,
-    152190,
-    176341,
-    1108,
-    23716,
-    96886,
-    46324,
-    28793,
-    171371,
-    120948,
-    105765,
-    115793,
-    144035,
-    58972,
-    143027,
-    130345,
-    98411,
-    6921,
-    63234,
-    146415,
-    9588,
-    76885,
-    157022,
-    150968,
-    124495,
-    3063,
-    36720,
-    44682,
-    56153,
-    103271,
-    35370,
-    37883,
-    163532,
-    54671,
-    51850,
-    72589,
-    33067,
-    162612,
-    53310,
-    118074,
-    124275,
-    104306,
-    72716,
-    34458,
-    131462,
-    9794,
-    117425,
-    136939,
-    20006,
-    54,
-    93404,
-    133583,
-    37599,
-    82980,
-    170751,
-    127833,
-    46245,
-    167797,
-    149344,
-    10137,
-    126377,
-    110411,
-    19286,
-    50566,
-    85276,
-    6274,
-    99706,
-    110745,
-    10201,
-    167660,
-    131035,
-    52997,
-    26522,
-    37724,
-    63483,
-    108952,
-    41119,
-    12180,
-    60909,
-    93147,
-    50326,
-    62101,
-    128282,
-    49975,
-    64733,
-    29040,
-    23077,
-    68950,
-    119396,
-    51629,
-    11723,
-    143159,
-    102961,
-    77052,
-    44437,
-    94746,
-    21905,
-    55593,
-    99335,
-    173145,
-    127389,
-    83180,
-    142682,
-    47749,
-    132932,
-    125047,
-    86249,
-    113786,
-    143698,
-    7319,
-    47088,
-    33171,
-    14186,
-    53259,
-    65868,
-    135093,
-    56201,
-    141303,
-    122311,
-    115587,
-    167159,
-    83809,
-    155537,
-    30229,
-    117852,
-    143832,
-    72521,
-    121605,
-    92984,
-    137379,
-    29043,
-    129388,
-    121055,
-    36867,
-    151774,
-    130491,
-    32181,
-    170590,
-    57084,
-    47495,
-    157388,
-    131709,
-    113414,
-    32269,
-    3971,
-    95655,
-    21059,
-    45746,
-    66338,
-    10472,
-    165871,
-    72154,
-    121615,
-    117671,
-    100030,
-    48079,
-    131420,
-    33431,
-    25073,
-    50376,
-    90137,
-    110413,
-    121262,
-    28209,
-    171113,
-    42456,
-    37401,
-    113571,
-    53110,
-    9342,
-    47887,
-    146186,
-    47559,
-    42610,
-    22237,
-    173620,
-    162575,
-    132653,
-    87668,
-    169762,
-    86376,
-    150749,
-    21543,
-    116069,
-    52070,
-    110345,
-    5133,
-    34310,
-    129352,
-    33929,
-    87760,
-    39860,
-    33110,
-    36511,
-    57844,
-    21646,
-    115297,
-    128602,
-    143462,
-    55599,
-    23464,
-    79511,
-    104054,
-    19670,
-    156213,
-    29618,
-    69481,
-    22663,
-    50124,
-    138315,
-    1498,
-    48012,
-    11842,
-    115490,
-    13424,
-    178722,
-    160714,
-    130524,
-    7698,
-    126779,
-    16590,
-    164505,
-    136386,
-    58924,
-    2375,
-    102378,
-    51103,
-    115143,
-    20987,
-    174127,
-    34338,
-    145254,
-    176906,
-    106710,
-    87392,
-    117736,
-    126852,
-    108997,
-    17774,
-    176569,
-    152403,
-    108302,
-    136556,
-    92737,
-    68703,
-    93527,
-    33047,
-    21363,
-    140837,
-    161170,
-    117396,
-    87094,
-    94667,
-    100656,
-    171483,
-    86364,
-    164043,
-    116807,
-    97482,
-    37422,
-    64539,
-    15635,
-    139378,
-    48487,
-    107614,
-    115627,
-    76956,
-    173212,
-    16814,
-    114519,
-    104035,
-    26229,
-    163753,
-    152520,
-    83968,
-    69723,
-    161211,
-    128213,
-    65680,
-    28111,
-    137180,
-    129225,
-    175229,
-    99130,
-    153450,
-    65137,
-    107818,
-    84960,
-    116291,
-    178294,
-    148011,
-    49332,
-    132928,
-    96178,
-    143501,
-    128134,
-    159015,
-    86329,
-    88732,
-    54982,
-    98479,
-    127336,
-    148993,
-    96243,
-    117596,
-    35926,
-    8105,
-    29744,
-    148595,
-    143183,
-    115841,
-    40974,
-    140412,
-    64710,
-    94707,
-    70931,
-    61798,
-    74327,
-    167435,
-    80003,
-    154241,
-    79306,
-    94264,
-    140874,
-    116349,
-    134219,
-    147886,
-    39743,
-    36568,
-    45316,
-    28967,
-    169403,
-    103875,
-    79524,
-    98781,
-    113873,
-    178670,
-    39551,
-    29359,
-    62837,
-    36168,
-    38837,
-    177012,
-    58974,
-    133219,
-    153384,
-    149492,
-    136928,
-    104834,
-    165215,
-    84587,
-    80723,
-    79016,
-    168253,
-    141288,
-    138437,
-    70693,
-    100134,
-    134182,
-    169055,
-    69359,
-    77543,
-    151085,
-    66628,
-    936,
-    145726,
-    3959,
-    117003,
-    85118,
-    160900,
-    39988,
-    100644,
-    161224,
-    168952,
-    80386,
-    59476,
-    123006,
-    10507,
-    92702,
-    163354,
-    170338,
-    69541,
-    52187,
-    103470,
-    174266,
-    39243,
-    124482,
-    13622,
-    33334,
-    140697,
-    16018,
-    120252,
-    56593,
-    33013,
-    9358,
-    33392,
-    46711,
-    53080,
-    83170,
-    12783,
-    137945,
-    102159,
-    101553,
-    126933,
-    65677,
-    143389,
-    37119,
-    31138,
-    176606,
-    118626,
-    33019,
-    50176,
-    94824,
-    7323,
-    107726,
-    126604,
-    110779,
-    96898,
-    48319,
-    70479,
-    103724,
-    132155,
-    82351,
-    77867,
-    88173,
-    127949,
-    43225,
-    110506,
-    108860,
-    142883,
-    132954,
-    84958,
-    173867,
-    9293,
-    67126,
-    108658,
-    92382,
-    167015,
-    127741,
-    91515,
-    125727,
-    19384,
-    84096,
-    66742,
-    74872,
-    122307,
-    34760,
-    163276,
-    58199,
-    1538,
-    165879,
-    10303,
-    156095,
-    31462,
-    144365,
-    62523,
-    59315,
-    164556,
-    93102,
-    27165,
-    162016,
-    4657,
-    22707,
-    5348,
-    112456,
-    36717,
-    73054,
-    22086,
-    125653,
-    174613,
-    74156,
-    155616,
-    159453,
-    140913,
-    66522,
-    151161,
-    175168,
-    30870,
-    106376,
-    87664,
-    161051,
-    143371,
-    85812,
-    56587,
-    175911,
-    75227,
-    39539,
-    88052,
-    152172,
-    145890,
-    61882,
-    106870,
-    75517,
-    144918,
-    100920,
-    100872,
-    63995,
-    26837,
-    140535,
-    10930,
-    139063,
-    153571,
-    171448,
-    126808,
-    40373,
-    121198,
-    14819,
-    91974,
-    165589,
-    141811,
-    69338,
-    80376,
-    96026,
-    65519,
-    48449,
-    117107,
-    108935,
-    137367,
-    178758,
-    9286,
-    94016,
-    22110,
-    24368,
-    10617,
-    77985,
-    119213,
-    115550,
-    92208,
-    98056,
-    160385,
-    35808,
-    48830,
-    10116,
-    68937,
-    93408,
-    131556,
-    74901,
-    41438,
-    65571,
-    82693,
-    63487,
-    22364,
-    42179,
-    60778,
-    19653,
-    38077,
-    23976,
-    48724,
-    148143,
-    85325,
-    42506,
-    6098,
-    167225,
-    86691,
-    124289,
-    140764,
-    149323,
-    5617,
-    61560,
-    166591,
-    52696,
-    139470,
-    61092,
-    104025,
-    56403,
-    83069,
-    123339,
-    135936,
-    176221,
-    164158,
-    91722,
-    21040,
-    78095,
-    91206,
-    113230,
-    142292,
-    164261,
-    67487,
-    166162,
-    177894,
-    176112,
-    48936,
-    106541,
-    150412,
-    139037,
-    56751,
-    107430,
-    133476,
-    34496,
-    139400,
-    142032,
-    173071,
-    60479,
-    109766,
-    59514,
-    41937,
-    166236,
-    24125,
-    122121,
-    9025,
-    114081,
-    64371,
-    150849,
-    54343,
-    81543,
-    88603,
-    60898,
-    15705,
-    86877,
-    51437,
-    149964,
-    80001,
-    57721,
-    50086,
-    162886,
-    13871,
-    154340,
-    33559,
-    50548,
-    49451,
-    165689,
-    39535,
-    112274,
-    123583,
-    50002,
-    150150,
-    49805,
-    154631,
-    28496,
-    153603,
-    137425,
-    167930,
-    70957,
-    2086,
-    163660,
-    11475,
-    24689,
-    101141,
-    158319,
-    169966,
-    3896,
-    10341,
-    149139,
-    56786,
-    122432,
-    164318,
-    91915,
-    54208,
-    83472,
-    56929,
-    21350,
-    4537,
-    102051,
-    49552,
-    56517,
-    78104,
-    147098,
-    5330,
-    143224,
-    65499,
-    161651,
-    7608,
-    66999,
-    155859,
-    11096,
-    136764,
-    81924,
-    1943,
-    171500,
-    81198,
-    115906,
-    11750,
-    153856,
-    129166,
-    170913,
-    126451,
-    119159,
-    140864,
-    159407,
-    164095,
-    138977,
-    109625,
-    30759,
-    78494,
-    98459,
-    65944,
-    144297,
-    15422,
-    56704,
-    26367,
-    153203,
-    9434,
-    47620,
-    10733,
-    160071,
-    33092,
-    148948,
-    170991,
-    126335,
-    123801,
-    100595,
-    78160,
-    77955,
-    6696,
-    107788,
-    125058,
-    82364,
-    4189,
-    621,
-    1772,
-    161180,
-    167597,
-    177144,
-    77534,
-    60575,
-    80724,
-    97075,
-    124552,
-    105207,
-    22026,
-    178570,
-    138546,
-    80384,
-    33158,
-    173255,
-    29122,
-    36700,
-    140366,
-    42835,
-    112416,
-    76100,
-    18497,
-    51984,
-    12245,
-    59428,
-    40979,
-    168771,
-    16521,
-    67720,
-    152244,
-    164527,
-    68029,
-    40836,
-    101789,
-    3918,
-    145113,
-    146023,
-    36000,
-    98630,
-    161481,
-    36732,
-    57192,
-    64506,
-    123952,
-    57757,
-    35637,
-    34767,
-    68392,
-    115860,
-    140873,
-    61735,
-    19437,
-    134826,
-    164041,
-    169464,
-    163592,
-    2018,
-    91817,
-    18483,
-    44370,
-    130520,
-    123910,
-    139351,
-    2960,
-    22481,
-    30317,
-    9582,
-    45346,
-    92317,
-    83734,
-    109076,
-    138338,
-    85878,
-    26130,
-    5393,
-    51054,
-    72947,
-    88766,
-    176057,
-    165469,
-    68746,
-    21098,
-    16797,
-    104392,
-    51430,
-    167116,
-    124437,
-    138779,
-    58691,
-    35694,
-    129268,
-    50845,
-    72327,
-    25554,
-    106883,
-    116411,
-    174309,
-    121252,
-    148462,
-    16212,
-    72469,
-    42004,
-    170568,
-    78927,
-    104796,
-    132440,
-    72458,
-    46030,
-    71639,
-    82382,
-    121020,
-    159256,
-    162487,
-    95321,
-    111978,
-    21477,
-    36778,
-    124383,
-    163901,
-    134805,
-    16540,
-    50025,
-    90004,
-    99416,
-    129712,
-    117631,
-    148547,
-    166177,
-    93902,
-    107149,
-    91372,
-    88354,
-    54643,
-    144557,
-    121892,
-    140704,
-    102926,
-    82031,
-    40516,
-    117178,
-    140928,
-    54375,
-    51445,
-    60460,
-    10986,
-    80397,
-    104058,
-    70692,
-    155940,
-    172032,
-    39603,
-    38482,
-    51426,
-    150206,
-    177437,
-    159718,
-    24546,
-    125753,
-    7714,
-    33504,
-    1197,
-    158804,
-    133116,
-    145317,
-    18902,
-    29321,
-    15043,
-    161947,
-    156450,
-    60408,
-    175847,
-    170321,
-    127392,
-    116156,
-    120466,
-    147376,
-    129113,
-    136708,
-    165115,
-    88360,
-    153142,
-    27421,
-    169041,
-    33495,
-    169885,
-    155167,
-    113626,
-    58678,
-    66361,
-    158983,
-    16626,
-    136811,
-    48810,
-    8838,
-    159891,
-    97709,
-    66671,
-    8077,
-    100209,
-    132539,
-    11987,
-    48862,
-    6019,
-    138688,
-    165488,
-    72063,
-    45560,
-    49937,
-    112555,
-    39976,
-    127524,
-    33189,
-    47933,
-    57411,
-    93698,
-    33078,
-    105278,
-    123984,
-    24013,
-    110071,
-    179198,
-    4167,
-    61183,
-    167158,
-    5591,
-    97949,
-    179688,
-    8295,
-    141968,
-    27362,
-    12947,
-    72924,
-    86890,
-    29091,
-    126873,
-    22898,
-    9220,
-    147815,
-    124853,
-    126127,
-    97497,
-    178301,
-    170516,
-    13566,
-    80583,
-    106278,
-    131555,
-    50474,
-    102039,
-    72696,
-    52511,
-    178124,
-    30904,
-    91298,
-    88583,
-    32311,
-    146223,
-    1472,
-    43907,
-    133675,
-    120641,
-    42953,
-    59210,
-    24147,
-    121966,
-    2393,
-    138912,
-    129200,
-    37959,
-    161349,
-    109055,
-    130829,
-    64688,
-    153537,
-    20475,
-    39679,
-    169915,
-    27071,
-    38246,
-    81427,
-    1790,
-    26288,
-    797,
-    8449,
-    99556,
-    179274,
-    116240,
-    57901,
-    38406,
-    167977,
-    62479,
-    146318,
-    124624,
-    78114,
-    45034,
-    119331,
-    179941,
-    84413,
-    140365,
-    82984,
-    35945,
-    25075,
-    74292,
-    39262,
-    87503,
-    105066,
-    71073,
-    177650,
-    99533,
-    99168,
-    7947,
-    125667,
-    12684,
-    176291,
-    91955,
-    121735,
-    52988,
-    81106,
-    79784,
-    146773,
-    73793,
-    137142,
-    72193,
-    174338,
-    103097,
-    88424,
-    1430,
-    30481,
-    167382,
-    93940,
-    90832,
-    72735,
-    115581,
-    37416,
-    103087,
-    173707,
-    136545,
-    5358,
-    41282,
-    173343,
-    101027,
-    52698,
-    90863,
-    175987,
-    93866,
-    21410,
-    124193,
-    87732,
-    50905,
-    31361,
-    70184,
-    118441,
-    172012,
-    118494,
-    76027,
-    137389,
-    74921,
-    4568,
-    54033,
-    98638,
-    48150,
-    4444,
-    53068,
-    28385,
-    177545,
-    152997,
-    21237,
-    114622,
-    70885,
-    56186,
-    73600,
-    4168,
-    123630,
-    169146,
-    7865,
-    155060,
-    76352,
-    157393,
-    73544,
-    19094,
-    164829,
-    117516,
-    65203,
-    21224,
-    80438,
-    129431,
-    49716,
-    161457,
-    67808,
-    75217,
-    90970,
-    58500,
-    174316,
-    147423,
-    95710,
-    140338,
-    176954,
-    49674,
-    15580,
-    91801,
-    99841,
-    43260,
-    66066,
-    120663,
-    153395,
-    55548,
-    104329,
-    49705,
-    150307,
-    116842,
-    43206,
-    37908,
-    66971,
-    87084,
-    80776,
-    63956,
-    151303,
-    113574,
-    15192,
-    176470,
-    143621,
-    127062,
-    14826,
-    39872,
-    88489,
-    90342,
-    101669,
-    95927,
-    136739,
-    62392,
-    145833,
-    120780,
-    107838,
-    79802,
-    2532,
-    147609,
-    92016,
-    63633,
-    96893,
-    41987,
-    120422,
-    101273,
-    141789,
-    163222,
-    45296,
-    95555,
-    68845,
-    18822,
-    6459,
-    155681,
-    59897,
-    83735,
-    125718,
-    172325,
-    80769,
-    97723,
-    30951,
-    46491,
-    123111,
-    160166,
-    144213,
-    88497,
-    18567,
-    166967,
-    111846,
-    165238,
-    90720,
-    164629,
-    56328,
-    113242,
-    42188,
-    47224,
-    73986,
-    76923,
-    6989,
-    115534,
-    12196,
-    9520,
-    8160,
-    72802,
-    103815,
-    160165,
-    75150,
-    152400,
-    68922,
-    30629,
-    155594,
-    84352,
-    42872,
-    172869,
-    174345,
-    125209,
-    65831,
-    14575,
-    174098,
-    20802,
-    27696,
-    26909,
-    145630,
-    40713,
-    35800,
-    143355,
-    1682,
-    147756,
-    4298,
-    17832,
-    21587,
-    106707,
-    161706,
-    46630,
-    150448,
-    173770,
-    106562,
-    144389,
-    350,
-    132507,
-    124838,
-    110799,
-    115585,
-    23480,
-    114583,
-    175413,
-    173871,
-    39858,
-    91309,
-    55949,
-    173468,
-    31665,
-    72552,
-    20251,
-    75707,
-    146157,
-    89915,
-    16718,
-    164696,
-    69188,
-    99578,
-    105809,
-    177412,
-    52316,
-    167209,
-    573,
-    87202,
-    122443,
-    96086,
-    139179,
-    12960,
-    172466,
-    168489,
-    51822,
-    6711,
-    116068,
-    96618,
-    109190,
-    70004,
-    85719,
-    92990,
-    14237,
-    80967,
-    58597,
-    123536,
-    87281,
-    126476,
-    85585,
-    89382,
-    143135,
-    139309,
-    2379,
-    95087,
-    21239,
-    120887,
-    150875,
-    135415,
-    106540,
-    161604,
-    98439,
-    55002,
-    146428,
-    100632,
-    43112,
-    92570,
-    137121,
-    28739,
-    89675,
-    27874,
-    114526,
-    90080,
-    42014,
-    90243,
-    175864,
-    110068,
-    5595,
-    102073,
-    40195,
-    126902,
-    45961,
-    139041,
-    97693,
-    19716,
-    153397,
-    147656,
-    151695,
-    164751,
-    179163,
-    109774,
-    100890,
-    161442,
-    49642,
-    71427,
-    84760,
-    13043,
-    2172,
-    133877,
-    17307,
-    140571,
-    81412,
-    80848,
-    84120,
-    118980,
-    152874,
-    16502,
-    129877,
-    16655,
-    29239,
-    125680,
-    16386,
-    139888,
-    110175,
-    61981,
-    131606,
-    113469,
-    87251,
-    48163,
-    86931,
-    92502,
-    31468,
-    178420,
-    146420,
-    158646,
-    158809,
-    75690,
-    162091,
-    2152,
-    108526,
-    115258,
-    143490,
-    154500,
-    116484,
-    39992,
-    26397,
-    35870,
-    99907,
-    77073,
-    43134,
-    36919,
-    59459,
-    154732,
-    123547,
-    151507,
-    166643,
-    859,
-    124312,
-    138730,
-    23588,
-    34538,
-    100749,
-    54454,
-    131397,
-    91866,
-    118076,
-    48472,
-    118652,
-    44686,
-    107342,
-    79658,
-    158246,
-    79200,
-    45220,
-    110058,
-    47415,
-    20787,
-    92637,
-    109773,
-    33858,
-    153994,
-    101453,
-    155760,
-    140604,
-    47912,
-    89920,
-    8790,
-    91935,
-    143830,
-    174641,
-    23870,
-    29629,
-    139444,
-    718,
-    64969,
-    57236,
-    35211,
-    95255,
-    71562,
-    73235,
-    95171,
-    153703,
-    131105,
-    25111,
-    178840,
-    18118,
-    148782,
-    59292,
-    115912,
-    55128,
-    179418,
-    167162,
-    149184,
-    168416,
-    31835,
-    177037,
-    33098,
-    80785,
-    36406,
-    167769,
-    87428,
-    23142,
-    53981,
-    11720,
-    144380,
-    78335,
-    167818,
-    135409,
-    160492,
-    176531,
-    104769,
-    10029,
-    45403,
-    126091,
-    171432,
-    70742,
-    177426,
-    81356,
-    27589,
-    155724,
-    48452,
-    82294,
-    54532,
-    45715,
-    83095,
-    53188,
-    112614,
-    90700,
-    77812,
-    68457,
-    56210,
-    140172,
-    51404,
-    2235,
-    53911,
-    70461,
-    48821,
-    152160,
-    131191,
-    91142,
-    3583,
-    124166,
-    52516,
-    121308,
-    42289,
-    106886,
-    63964,
-    18136,
-    27858,
-    110833,
-    10436,
-    153579,
-    162192,
-    155077,
-    101318,
-    106663,
-    145618,
-    91252,
-    166275,
-    171679,
-    75313,
-    55190,
-    105527,
-    68347,
-    31037,
-    161104,
-    158181,
-    166203,
-    28247,
-    145214,
-    174718,
-    151574,
-    30613,
-    89852,
-    90957,
-    14043,
-    95668,
-    113814,
-    140371,
-    25686,
-    173077,
-    92432,
-    120870,
-    3683,
-    78739,
-    114772,
-    179007,
-    74301,
-    156293,
-    27292,
-    175187,
-    162610,
-    62620,
-    62791,
-    173036,
-    145773,
-    108146,
-    120165,
-    41195,
-    28030,
-    85845,
-    29864,
-    165790,
-    25204,
-    158266,
-    111501,
-    169461,
-    111944,
-    7628,
-    160224,
-    179971,
-    32575,
-    99223,
-    103702,
-    154664,
-    92009,
-    155281,
-    127844,
-    169609,
-    15858,
-    104979,
-    171998,
-    91420,
-    118040,
-    163627,
-    157330,
-    67783,
-    165473,
-    63848,
-    113069,
-    115410,
-    105693,
-    149922,
-    112295,
-    73413,
-    40319,
-    51300,
-    149896,
-    61746,
-    174444,
-    136372,
-    30878,
-    117875,
-    45518,
-    36930,
-    161175,
-    45664,
-    85601,
-    11638,
-    120765,
-    132238,
-    157010,
-    58619,
-    32709,
-    149020,
-    96175,
-    78993,
-    177473,
-    80858,
-    173579,
-    44897,
-    100984,
-    2122,
-    132184,
-    125192,
-    142,
-    34991,
-    55449,
-    101841,
-    34071,
-    124736,
-    59408,
-    175488,
-    18352,
-    10791,
-    172706,
-    78250,
-    129286,
-    130215,
-    24699,
-    126443,
-    178800,
-    93741,
-    118683,
-    13938,
-    144743,
-    149690,
-    11713,
-    160696,
-    134907,
-    25730,
-    18115,
-    127490,
-    140871,
-    3848,
-    137528,
-    173045,
-    121842,
-    11840,
-    34181,
-    124625,
-    147873,
-    87435,
-    140387,
-    164174,
-    143762,
-    53647,
-    19217,
-    153923,
-    36993,
-    146071,
-    133879,
-    132551,
-    84229,
-    147914,
-    100084,
-    81045,
-    75718,
-    14745,
-    2262,
-    23661,
-    100916,
-    170252,
-    127975,
-    40864,
-    80369,
-    102503,
-    28311,
-    96235,
-    18831,
-    69567,
-    105448,
-    90795,
-    148770,
-    64049,
-    78903,
-    147959,
-    169058,
-    106168,
-    82813,
-    146885,
-    18498,
-    84188,
-    50441,
-    159688,
-    28713,
-    177738,
-    47082,
-    174456,
-    136966,
-    153130,
-    43414,
-    99125,
-    164625,
-    10075,
-    103471,
-    59898,
-    147344,
-    155578,
-    42404,
-    119727,
-    178478,
-    8050,
-    163414,
-    169745,
-    163833,
-    154330,
-    87571,
-    123695,
-    109936,
-    124254,
-    127877,
-    152099,
-    168977,
-    56051,
-    124837,
-    25397,
-    149331,
-    109683,
-    111548,
-    15527,
-    31047,
-    7095,
-    85116,
-    129115,
-    18314,
-    157121,
-    144261,
-    142625,
-    48089,
-    166054,
-    174844,
-    60218,
-    38834,
-    31408,
-    14194,
-    136228,
-    15055,
-    108436,
-    76072,
-    157445,
-    22387,
-    159806,
-    120886,
-    99674,
-    42620,
-    71940,
-    169151,
-    152529,
-    65479,
-    172107,
-    94972,
-    123767,
-    138349,
-    756,
-    42841,
-    145747,
-    133457,
-    151712,
-    45141,
-    174912,
-    172708,
-    171546,
-    57096,
-    172432,
-    101187,
-    1032,
-    69340,
-    78974,
-    82592,
-    48018,
-    143205,
-    35630,
-    120444,
-    117091,
-    137128,
-    65487,
-    128976,
-    91274,
-    153705,
-    75676,
-    2613,
-    150074,
-    133716,
-    171591,
-    49667,
-    129074,
-    130717,
-    77036,
-    105981,
-    150431,
-    75804,
-    34878,
-    57710,
-    50049,
-    85492,
-    157652,
-    34619,
-    91345,
-    19713,
-    177909,
-    90068,
-    167203,
-    8467,
-    89159,
-    174484,
-    41038,
-    148921,
-    117730,
-    90492,
-    43720,
-    95583,
-    29049,
-    70413,
-    88736,
-    169992,
-    176780,
-    144243,
-    101249,
-    108044,
-    110923,
-    43896,
-    167451,
-    76163,
-    64837,
-    15184,
-    175562,
-    132253,
-    13215,
-    83346,
-    46401,
-    106876,
-    98166,
-    175571,
-    16633,
-    5067,
-    74791,
-    60975,
-    81809,
-    48317,
-    64069,
-    13765,
-    80395,
-    78677,
-    33297,
-    25214,
-    130331,
-    128196,
-    60963,
-    60368,
-    46308,
-    130077,
-    170587,
-    25859,
-    64834,
-    19980,
-    112852,
-    26778,
-    52080,
-    75994,
-    156717,
-    31978,
-    26898,
-    15476,
-    135452,
-    147167,
-    177180,
-    886,
-    101396,
-    6738,
-    50340,
-    25385,
-    89566,
-    50947,
-    25706,
-    155756,
-    2319,
-    31294,
-    150051,
-    179139,
-    38538,
-    53148,
-    15470,
-    130607,
-    9030,
-    137254,
-    5032,
-    122885,
-    71844,
-    26721,
-    75446,
-    4678,
-    100382,
-    177182,
-    149077,
-    42375,
-    161186,
-    112058,
-    62640,
-    22,
-    95585,
-    15177,
-    108376,
-    153673,
-    139232,
-    115484,
-    146761,
-    131,
-    42250,
-    120743,
-    169642,
-    147321,
-    60008,
-    92996,
-    98768,
-    17148,
-    36399,
-    22858,
-    73281,
-    153848,
-    85258,
-    87038,
-    159068,
-    150552,
-    172784,
-    157654,
-    90362,
-    142588,
-    146196,
-    98556,
-    45255,
-    88822,
-    13218,
-    141143,
-    95154,
-    45532,
-    89182,
-    171779,
-    17703,
-    130866,
-    30804,
-    45633,
-    45566,
-    136563,
-    45172,
-    43326,
-    90984,
-    141241,
-    47799,
-    101283,
-    101312,
-    36278,
-    15087,
-    54463,
-    60466,
-    1888,
-    71900,
-    122864,
-    125594,
-    69337,
-    128981,
-    131476,
-    156636,
-    171386,
-    12889,
-    150551,
-    140108,
-    176742,
-    76235,
-    65217,
-    43370,
-    103395,
-    43626,
-    179904,
-    135877,
-    39094,
-    31308,
-    47216,
-    16993,
-    88254,
-    170607,
-    62356,
-    142437,
-    103993,
-    65684,
-    160741,
-    139967,
-    88194,
-    148735,
-    151402,
-    165254,
-    68478,
-    101499,
-    149467,
-    67332,
-    3266,
-    20468,
-    137019,
-    159804,
-    155069,
-    99217,
-    145451,
-    138530,
-    171631,
-    143161,
-    94721,
-    157938,
-    53134,
-    159716,
-    10626,
-    90017,
-    126993,
-    60052,
-    176719,
-    122107,
-    159368,
-    27735,
-    110653,
-    15001,
-    120075,
-    2173,
-    17917,
-    60045,
-    117929,
-    118421,
-    37915,
-    178950,
-    49092,
-    105303,
-    152493,
-    107840,
-    113022,
-    41095,
-    131334,
-    73047,
-    122260,
-    16051,
-    115943,
-    31504,
-    176157,
-    46613,
-    158790,
-    121647,
-    85117,
-    75502,
-    1069,
-    75519,
-    122576,
-    75829,
-    148709,
-    147122,
-    38204,
-    92422,
-    42007,
-    101716,
-    53511,
-    79087,
-    1572,
-    29158,
-    108062,
-    157456,
-    156696,
-    107699,
-    75618,
-    164867,
-    82903,
-    56854,
-    99817,
-    58004,
-    81601,
-    138002,
-    107206,
-    50856,
-    171983,
-    85910,
-    53308,
-    119427,
-    28723,
-    95283,
-    95164,
-    134218,
-    63009,
-    167505,
-    134422,
-    160542,
-    171678,
-    8948,
-    153299,
-    137600,
-    47183,
-    152467,
-    50788,
-    34269,
-    42652,
-    72332,
-    154002,
-    69339,
-    70946,
-    166737,
-    16435,
-    37583,
-    52126,
-    88787,
-    143955,
-    108245,
-    157603,
-    131716,
-    97281,
-    122709,
-    12917,
-    136119,
-    130756,
-    41137,
-    112600,
-    156103,
-    97876,
-    3725,
-    165651,
-    79563,
-    18503,
-    143035,
-    56768,
-    172426,
-    38470,
-    94706,
-    127564,
-    98460,
-    2852,
-    75779,
-    122117,
-    138289,
-    165478,
-    161703,
-    43017,
-    166463,
-    142743,
-    20669,
-    16421,
-    16606,
-    178681,
-    53119,
-    90190,
-    13020,
-    150459,
-    23223,
-    69229,
-    5827,
-    18552,
-    145635,
-    150131,
-    139285,
-    49741,
-    174812,
-    159287,
-    100349,
-    154317,
-    155514,
-    37222,
-    70743,
-    76686,
-    35966,
-    106306,
-    34978,
-    114477,
-    76226,
-    27474,
-    126862,
-    63966,
-    50158,
-    20225,
-    119313,
-    136577,
-    75492,
-    11006,
-    135048,
-    162500,
-    64298,
-    128456,
-    21884,
-    105832,
-    104379,
-    9731,
-    154729,
-    106628,
-    118795,
-    61717,
-    89259,
-    121422,
-    11661,
-    105008,
-    49978,
-    150784,
-    133324,
-    58506,
-    44990,
-    127327,
-    55974,
-    44177,
-    97823,
-    12173,
-    37147,
-    875,
-    95496,
-    87648,
-    16564,
-    54807,
-    128737,
-    31906,
-    24504,
-    107993,
-    14064,
-    137182,
-    30866,
-    54458,
-    23820,
-    116140,
-    32170,
-    108132,
-    159459,
-    150924,
-    68609,
-    75721,
-    157273,
-    4217,
-    39134,
-    48274,
-    125825,
-    91912,
-    77215,
-    133312,
-    7469,
-    174101,
-    41595,
-    51918,
-    38902,
-    30730,
-    28971,
-    174168,
-    164735,
-    49676,
-    82098,
-    115023,
-    26912,
-    122157,
-    92912,
-    24708,
-    75125,
-    178844,
-    175690,
-    101994,
-    105609,
-    161754,
-    69707,
-    84075,
-    20332,
-    45655,
-    146234,
-    151710,
-    179147,
-    133203,
-    69422,
-    33517,
-    55150,
-    86561,
-    93315,
-    44955,
-    58753,
-    68589,
-    161597,
-    169313,
-    103151,
-    82520,
-    8839,
-    99204,
-    114119,
-    115595,
-    87222,
-    157170,
-    121662,
-    81822,
-    154932,
-    114805,
-    109289,
-    160307,
-    4728,
-    86585,
-    171558,
-    10334,
-    95575,
-    174876,
-    137742,
-    17056,
-    121965,
-    160770,
-    89776,
-    123720,
-    65437,
-    23962,
-    125497,
-    69667,
-    143168,
-    108468,
-    89737,
-    107409,
-    122145,
-    15496,
-    104798,
-    136223,
-    48025,
-    92980,
-    62173,
-    65698,
-    149279,
-    78653,
-    127499,
-    143910,
-    1972,
-    151971,
-    113092,
-    52686,
-    114657,
-    29279,
-    93201,
-    75565,
-    35937,
-    114046,
-    79542,
-    139480,
-    166710,
-    137830,
-    150510,
-    117987,
-    44768,
-    169107,
-    71754,
-    110906,
-    177812,
-    76062,
-    127289,
-    120265,
-    107924,
-    12632,
-    169469,
-    87338,
-    174218,
-    138339,
-    41687,
-    9497,
-    142941,
-    82431,
-    95782,
-    172247,
-    132045,
-    57854,
-    159176,
-    157415,
-    64789,
-    108164,
-    70224,
-    47959,
-    173801,
-    107122,
-    24681,
-    99466,
-    24614,
-    32738,
-    24542,
-    102512,
-    3170,
-    58196,
-    144111,
-    76841,
-    141810,
-    46888,
-    30242,
-    23523,
-    108234,
-    156042,
-    146308,
-    14814,
-    16096,
-    59957,
-    134100,
-    64587,
-    156344,
-    132710,
-    40111,
-    90522,
-    141149,
-    178696,
-    65675,
-    12172,
-    8422,
-    52007,
-    177039,
-    34126,
-    24186,
-    30683,
-    12545,
-    2259,
-    896,
-    129396,
-    106824,
-    164367,
-    62514,
-    96273,
-    67774,
-    171744,
-    122219,
-    29901,
-    117701,
-    155922,
-    33,
-    17632,
-    72408,
-    55172,
-    120751,
-    270,
-    165633,
-    33920,
-    101391,
-    156469,
-    131984,
-    40899,
-    63559,
-    91661,
-    76430,
-    170318,
-    153313,
-    170753,
-    861,
-    167709,
-    170456,
-    28143,
-    89946,
-    56992,
-    46987,
-    119250,
-    68294,
-    77933,
-    51619,
-    105720,
-    101275,
-    72632,
-    178926,
-    78914,
-    148650,
-    13035,
-    174532,
-    160163,
-    68476,
-    51443,
-    76049,
-    163172,
-    3713,
-    15156,
-    168969,
-    143437,
-    14366,
-    27643,
-    141098,
-    51671,
-    1009,
-    71683,
-    120126,
-    59424,
-    126364,
-    27480,
-    53375,
-    92982,
-    143448,
-    118829,
-    59285,
-    105815,
-    78214,
-    76265,
-    102275,
-    147547,
-    64058,
-    64310,
-    137242,
-    112871,
-    151026,
-    80616,
-    99667,
-    4919,
-    171812,
-    131292,
-    24332,
-    16986,
-    61501,
-    175459,
-    73200,
-    2518,
-    95972,
-    25580,
-    55202,
-    26453,
-    49818,
-    94657,
-    133729,
-    67729,
-    152644,
-    10668,
-    30336,
-    13858,
-    16815,
-    93977,
-    157171,
-    156741,
-    168650,
-    74969,
-    141643,
-    55135,
-    82934,
-    25389,
-    118224,
-    39625,
-    130142,
-    48497,
-    83214,
-    85696,
-    158152,
-    154647,
-    176303,
-    169355,
-    168999,
-    2504,
-    164604,
-    70335,
-    98921,
-    149924,
-    125661,
-    154106,
-    145970,
-    36950,
-    114338,
-    83316,
-    39024,
-    114405,
-    119039,
-    59177,
-    180,
-    51402,
-    55682,
-    144439,
-    171945,
-    15514,
-    160651,
-    50963,
-    135252,
-    18812,
-    171008,
-    151347,
-    80271,
-    79406,
-    27166,
-    10256,
-    162916,
-    43152,
-    133353,
-    94181,
-    136903,
-    105821,
-    136148,
-    79224,
-    142148,
-    29981,
-    58018,
-    80230,
-    151020,
-    142521,
-    101,
-    151381,
-    73122,
-    57640,
-    167616,
-    16232,
-    124755,
-    162726,
-    168005,
-    164287,
-    166554,
-    168049,
-    6700,
-    75371,
-    32073,
-    21784,
-    56455,
-    152471,
-    56610,
-    79703,
-    123337,
-    24436,
-    178401,
-    10474,
-    173778,
-    174781,
-    93886,
-    24286,
-    154293,
-    114575,
-    15653,
-    110636,
-    5003,
-    32385,
-    110587,
-    53132,
-    163370,
-    96976,
-    26680,
-    125242,
-    62322,
-    82112,
-    76864,
-    147135,
-    110232,
-    104241,
-    51423,
-    179653,
-    91773,
-    10003,
-    70421,
-    101498,
-    77943,
-    155500,
-    4019,
-    59985,
-    121707,
-    72059,
-    625,
-    133967,
-    45939,
-    106977,
-    68819,
-    101191,
-    11286,
-    158310,
-    26456,
-    86783,
-    102546,
-    4688,
-    13619,
-    140226,
-    19319,
-    128341,
-    105452,
-    52160,
-    83239,
-    84873,
-    75526,
-    36970,
-    92225,
-    153572,
-    7746,
-    20610,
-    87545,
-    167444,
-    91538,
-    59187,
-    170535,
-    20423,
-    164140,
-    73464,
-    48453,
-    175324,
-    136625,
-    64633,
-    51749,
-    35973,
-    165305,
-    143334,
-    156156,
-    89654,
-    165130,
-    84616,
-    173605,
-    50196,
-    89575,
-    80568,
-    164941,
-    165214,
-    81945,
-    63459,
-    168146,
-    170118,
-    86932,
-    39546,
-    144081,
-    124856,
-    119013,
-    140513,
-    21908,
-    163973,
-    143178,
-    13291,
-    178264,
-    7214,
-    54420,
-    94017,
-    125237,
-    164462,
-    83336,
-    75196,
-    54275,
-    176767,
-    81627,
-    109905,
-    42860,
-    154964,
-    148653,
-    28720,
-    133828,
-    132572,
-    139266,
-    107704,
-    91120,
-    5119,
-    171840,
-    60478,
-    44025,
-    23465,
-    92123,
-    19068,
-    15124,
-    13212,
-    137193,
-    22450,
-    128883,
-    176856,
-    43886,
-    133153,
-    122867,
-    18880,
-    117837,
-    134723,
-    24428,
-    37773,
-    51490,
-    40352,
-    101468,
-    42633,
-    23850,
-    78569,
-    39476,
-    177289,
-    155803,
-    53514,
-    40650,
-    140646,
-    93417,
-    110416,
-    61112,
-    49627,
-    154594,
-    131270,
-    25748,
-    144206,
-    107415,
-    30098,
-    78029,
-    70595,
-    159064,
-    31681,
-    104963,
-    96036,
-    149665,
-    165708,
-    39077,
-    1492,
-    57882,
-    110887,
-    175963,
-    135529,
-    152526,
-    32479,
-    54609,
-    21872,
-    69941,
-    74008,
-    174737,
-    82961,
-    35408,
-    174634,
-    97214,
-    101624,
-    71277,
-    152577,
-    66749,
-    79060,
-    40734,
-    27346,
-    77992,
-    54542,
-    135741,
-    146569,
-    6382,
-    161912,
-    91250,
-    149496,
-    79340,
-    8986,
-    113048,
-    162828,
-    147579,
-    83430,
-    175287,
-    54696,
-    38954,
-    52392,
-    88758,
-    83927,
-    35962,
-    98270,
-    58342,
-    14887,
-    95885,
-    168203,
-    53624,
-    31221,
-    114618,
-    87356,
-    170974,
-    103103,
-    136142,
-    135271,
-    174303,
-    122456,
-    102561,
-    15888,
-    50458,
-    62588,
-    128212,
-    92421,
-    150052,
-    26353,
-    133900,
-    112410,
-    135173,
-    30133,
-    55051,
-    50393,
-    40872,
-    144624,
-    84176,
-    66515,
-    37882,
-    122658,
-    34938,
-    30304,
-    127384,
-    179998,
-    52871,
-    82900,
-    61511,
-    78816,
-    161573,
-    166896,
-    1122,
-    24033,
-    143109,
-    46080,
-    70848,
-    169544,
-    19310,
-    106178,
-    61875,
-    163397,
-    70506,
-    27383,
-    172248,
-    19993,
-    53998,
-    158765,
-    163102,
-    100109,
-    45685,
-    161803,
-    158441,
-    140026,
-    143856,
-    120298,
-    23235,
-    72544,
-    59465,
-    44919,
-    148140,
-    21195,
-    120740,
-    131481,
-    58743,
-    170686,
-    77056,
-    102923,
-    81203,
-    69198,
-    24662,
-    32775,
-    93821,
-    17486,
-    43063,
-    130764,
-    120460,
-    15482,
-    163682,
-    21397,
-    163320,
-    76665,
-    128908,
-    58369,
-    96126,
-    32896,
-    85345,
-    10262,
-    42784,
-    130668,
-    136363,
-    6248,
-    140685,
-    114404,
-    70163,
-    78641,
-    96876,
-    108195,
-    58153,
-    88878,
-    146774,
-    150956,
-    167108,
-    84323,
-    176587,
-    6483,
-    177672,
-    84133,
-    158949,
-    117422,
-    62806,
-    46740,
-    40967,
-    58149,
-    172034,
-    179988,
-    24407,
-    132506,
-    4830,
-    41513,
-    76528,
-    61082,
-    155028,
-    91843,
-    70384,
-    49292,
-    138211,
-    38309,
-    121255,
-    163312,
-    28852,
-    42328,
-    166268,
-    71618,
-    145367,
-    140961,
-    172896,
-    110066,
-    159539,
-    157629,
-    141279,
-    97779,
-    7801,
-    174315,
-    153745,
-    75523,
-    112760,
-    112758,
-    31333,
-    163355,
-    75546,
-    92824,
-    104210,
-    92753,
-    92188,
-    20073,
-    179353,
-    158501,
-    114409,
-    27904,
-    96732,
-    23732,
-    41544,
-    53807,
-    137783,
-    116808,
-    51974,
-    88033,
-    58368,
-    115678,
-    146607,
-    88710,
-    33816,
-    97913,
-    51473,
-    129106,
-    163928,
-    58201,
-    60373,
-    94554,
-    147868,
-    60236,
-    29945,
-    83672,
-    91057,
-    44622,
-    155208,
-    10975,
-    75410,
-    87642,
-    16183,
-    58404,
-    80571,
-    76012,
-    127544,
-    137754,
-    175979,
-    68171,
-    136214,
-    107231,
-    6208,
-    67154,
-    138772,
-    113442,
-    126413,
-    140606,
-    63349,
-    179280,
-    77222,
-    42672,
-    24205,
-    19030,
-    18730,
-    56367,
-    68390,
-    109012,
-    136420,
-    81619,
-    121894,
-    176220,
-    131710,
-    118594,
-    116574,
-    164543,
-    14044,
-    23240,
-    170151,
-    10557,
-    4124,
-    112332,
-    68690,
-    160735,
-    24304,
-    137397,
-    141010,
-    142023,
-    102661,
-    115339,
-    174286,
-    13835,
-    74766,
-    136999,
-    81618,
-    127689,
-    27520,
-    151081,
-    140869,
-    154838,
-    143272,
-    150083,
-    138845,
-    169298,
-    1260,
-    4739,
-    113404,
-    12847,
-    70073,
-    31426,
-    272,
-    117780,
-    38500,
-    116141,
-    879,
-    83358,
-    176206,
-    116589,
-    130465,
-    44480,
-    176287,
-    30925,
-    161691,
-    3448,
-    169606,
-    112483,
-    155188,
-    167251,
-    68351,
-    139031,
-    132786,
-    34183,
-    118826,
-    46256,
-    80087,
-    176511,
-    113,
-    128615,
-    77675,
-    96684,
-    26259,
-    132056,
-    67758,
-    128985,
-    64209,
-    175516,
-    14816,
-    167488,
-    88468,
-    9758,
-    46971,
-    164641,
-    160348,
-    52106,
-    38749,
-    18460,
-    11322,
-    1389,
-    93815,
-    117142,
-    33168,
-    11109,
-    101771,
-    29687,
-    24719,
-    69525,
-    173379,
-    163125,
-    156284,
-    61414,
-    101466,
-    77778,
-    31062,
-    52713,
-    174067,
-    86917,
-    97321,
-    2040,
-    29222,
-    18526,
-    149235,
-    81417,
-    123647,
-    37398,
-    134207,
-    14708,
-    85018,
-    60102,
-    141057,
-    77387,
-    11858,
-    33954,
-    75375,
-    141825,
-    23131,
-    132775,
-    71603,
-    35941,
-    27815,
-    105512,
-    11267,
-    58712,
-    72094,
-    118812,
-    139476,
-    86098,
-    144429,
-    156947,
-    39088,
-    13711,
-    75653,
-    21613,
-    152929,
-    690,
-    42385,
-    95674,
-    32366,
-    145064,
-    45086,
-    167431,
-    99245,
-    171756,
-    60001,
-    49295,
-    42750,
-    84257,
-    68622,
-    102108,
-    100643,
-    66288,
-    62629,
-    17815,
-    160739,
-    67802,
-    178810,
-    103135,
-    87217,
-    94005,
-    95755,
-    69701,
-    142906,
-    101097,
-    110902,
-    46549,
-    51463,
-    69873,
-    27218,
-    165461,
-    66880,
-    167309,
-    21192,
-    13966,
-    73434,
-    36234,
-    153243,
-    84148,
-    3997,
-    4848,
-    132648,
-    138710,
-    161067,
-    161774,
-    55860,
-    56835,
-    118432,
-    120261,
-    17070,
-    42778,
-    24473,
-    109907,
-    138158,
-    59861,
-    145497,
-    69827,
-    53840,
-    50006,
-    11914,
-    75168,
-    88731,
-    159053,
-    124598,
-    55711,
-    124058,
-    104760,
-    18291,
-    82046,
-    12125,
-    83825,
-    29277,
-    120053,
-    75797,
-    86093,
-    47882,
-    90041,
-    12046,
-    142306,
-    134079,
-    116686,
-    159627,
-    13505,
-    170176,
-    118267,
-    151509,
-    134252,
-    57819,
-    96903,
-    55712,
-    59598,
-    91847,
-    138990,
-    154479,
-    161613,
-    14053,
-    120626,
-    85700,
-    158033,
-    47063,
-    43956,
-    107670,
-    17253,
-    83704,
-    35883,
-    17549,
-    55266,
-    56537,
-    122071,
-    34687,
-    19073,
-    65649,
-    105372,
-    156276,
-    142117,
-    106819,
-    92171,
-    93128,
-    163007,
-    163611,
-    126666,
-    69520,
-    69403,
-    149225,
-    99343,
-    164920,
-    6345,
-    4979,
-    177469,
-    100811,
-    50190,
-    178755,
-    84965,
-    136724,
-    39382,
-    117420,
-    136985,
-    174940,
-    88956,
-    86779,
-    85405,
-    73384,
-    92434,
-    149070,
-    145129,
-    156960,
-    6985,
-    105582,
-    11846,
-    157902,
-    112101,
-    166029,
-    141478,
-    59169,
-    16610,
-    1109,
-    15318,
-    8613,
-    47123,
-    98747,
-    2300,
-    120455,
-    18158,
-    174881,
-    164266,
-    70368,
-    63392,
-    130818,
-    18911,
-    92642,
-    43708,
-    173358,
-    25286,
-    59794,
-    128122,
-    143429,
-    26443,
-    11606,
-    67823,
-    90087,
-    23571,
-    20346,
-    141361,
-    1979,
-    108796,
-    85362,
-    5087,
-    46405,
-    40570,
-    66357,
-    162143,
-    67469,
-    129041,
-    86929,
-    28447,
-    92311,
-    99225,
-    75734,
-    73846,
-    94336,
-    96301,
-    105215,
-    106317,
-    22324,
-    35323,
-    77414,
-    126250,
-    94725,
-    160349,
-    124571,
-    133220,
-    131638,
-    64401,
-    125433,
-    81175,
-    70314,
-    42562,
-    95891,
-    65176,
-    79167,
-    64623,
-    27726,
-    172197,
-    32673,
-    2485,
-    167446,
-    100298,
-    44170,
-    57837,
-    133166,
-    154913,
-    26369,
-    33840,
-    14273,
-    9832,
-    136292,
-    27021,
-    125434,
-    73668,
-    90164,
-    177202,
-    32019,
-    139742,
-    20445,
-    57256,
-    1275,
-    89035,
-    78314,
-    37906,
-    139049,
-    6367,
-    13668,
-    22351,
-    5866,
-    171297,
-    107278,
-    144248,
-    104201,
-    47977,
-    139404,
-    140268,
-    75188,
-    61107,
-    118405,
-    31867,
-    127429,
-    147810,
-    32018,
-    165538,
-    176668,
-    87708,
-    64559,
-    159221,
-    170270,
-    117860,
-    49688,
-    174562,
-    61867,
-    90392,
-    174327,
-    44292,
-    123347,
-    16574,
-    157546,
-    160114,
-    118445,
-    144488,
-    22690,
-    28999,
-    151147,
-    160244,
-    86308,
-    125768,
-    108179,
-    138906,
-    68128,
-    28565,
-    174423,
-    44554,
-    89952,
-    97124,
-    128893,
-    115726,
-    51100,
-    175234,
-    41169,
-    16189,
-    149813,
-    84328,
-    5428,
-    2494,
-    25914,
-    110524,
-    159661,
-    38388,
-    73116,
-    78690,
-    52430,
-    56899,
-    36037,
-    101547,
-    57762,
-    16299,
-    114905,
-    74350,
-    26933,
-    2218,
-    138592,
-    30142,
-    136582,
-    141570,
-    117113,
-    138540,
-    29231,
-    76492,
-    18928,
-    24593,
-    76825,
-    15774,
-    21271,
-    6172,
-    124431,
-    73202,
-    156483,
-    130853,
-    179776,
-    29937,
-    109146,
-    158777,
-    132845,
-    59334,
-    174092,
-    164823,
-    131643,
-    16289,
-    45253,
-    97533,
-    107638,
-    65250,
-    179173,
-    149413,
-    90279,
-    47945,
-    40543,
-    70491,
-    102890,
-    148426,
-    172419,
-    151257,
-    169059,
-    23297,
-    151102,
-    145760,
-    4404,
-    127404,
-    24159,
-    71806,
-    110259,
-    59398,
-    93524,
-    116433,
-    24733,
-    106897,
-    25305,
-    137349,
-    163640,
-    1970,
-    95859,
-    169036,
-    150900,
-    35964,
-    123034,
-    9276,
-    152563,
-    83062,
-    63364,
-    168522,
-    82350,
-    165240,
-    48039,
-    65909,
-    92414,
-    142670,
-    42657,
-    132942,
-    18339,
-    10324,
-    86469,
-    55418,
-    60852,
-    23708,
-    103926,
-    5811,
-    59611,
-    15359,
-    62715,
-    16536,
-    40618,
-    20670,
-    121699,
-    75521,
-    46735,
-    124561,
-    22688,
-    58362,
-    167157,
-    10817,
-    70888,
-    135456,
-    81727,
-    179281,
-    106158,
-    170758,
-    45404,
-    162149,
-    142276,
-    96295,
-    84964,
-    54432,
-    89990,
-    69280,
-    84310,
-    164692,
-    74270,
-    177384,
-    25172,
-    58702,
-    86413,
-    131974,
-    94465,
-    164278,
-    20381,
-    8420,
-    67947,
-    15630,
-    143129,
-    102590,
-    84063,
-    150385,
-    56569,
-    179017,
-    75873,
-    179905,
-    95455,
-    49080,
-    85728,
-    60804,
-    82683,
-    176537,
-    152142,
-    50042,
-    45233,
-    132873,
-    176416,
-    99121,
-    88476,
-    128400,
-    90584,
-    163318,
-    61328,
-    14074,
-    66449,
-    160042,
-    134561,
-    122436,
-    105842,
-    99088,
-    107797,
-    73893,
-    95854,
-    63522,
-    98962,
-    30885,
-    122199,
-    94275,
-    115956,
-    156102,
-    81907,
-    156071,
-    165304,
-    37983,
-    42009,
-    81639,
-    140787,
-    81804,
-    63458,
-    175694,
-    111775,
-    165701,
-    70430,
-    121457,
-    174042,
-    79897,
-    47808,
-    128952,
-    108279,
-    50339,
-    154176,
-    82705,
-    146980,
-    132943,
-    111700,
-    127575,
-    157681,
-    17819,
-    157787,
-    102912,
-    69071,
-    83066,
-    79892,
-    116624,
-    75180,
-    32330,
-    115557,
-    141676,
-    84574,
-    127792,
-    16929,
-    47970,
-    12964,
-    70823,
-    168909,
-    2721,
-    13537,
-    88752,
-    81717,
-    17245,
-    68828,
-    50829,
-    59811,
-    113179,
-    50996,
-    28278,
-    102276,
-    69691,
-    101719,
-    108706,
-    86484,
-    92362,
-    93355,
-    101981,
-    59362,
-    104441,
-    67956,
-    50864,
-    119422,
-    162516,
-    111398,
-    109158,
-    72631,
-    137983,
-    174325,
-    14685,
-    33023,
-    12791,
-    96727,
-    28529,
-    71722,
-    112198,
-    51723,
-    37684,
-    14894,
-    67377,
-    94320,
-    39797,
-    65835,
-    170586,
-    45460,
-    174644,
-    172741,
-    82771,
-    10592,
-    149076,
-    19300,
-    101021,
-    162444,
-    104114,
-    179304,
-    16243,
-    148121,
-    120387,
-    128158,
-    129361,
-    44701,
-    171820,
-    167634,
-    169797,
-    57553,
-    77367,
-    25831,
-    29318,
-    176024,
-    145057,
-    35912,
-    137891,
-    173434,
-    138107,
-    42684,
-    151273,
-    42037,
-    164567,
-    99151,
-    28935,
-    125053,
-    140964,
-    155920,
-    15240,
-    70674,
-    145073,
-    66821,
-    79729,
-    148762,
-    89444,
-    68000,
-    5298,
-    102212,
-    110194,
-    128983,
-    173451,
-    122777,
-    81281,
-    90382,
-    121996,
-    69955,
-    115501,
-    25601,
-    7383,
-    167841,
-    49825,
-    72695,
-    108845,
-    120299,
-    87501,
-    110707,
-    106089,
-    23568,
-    93578,
-    77287,
-    43932,
-    104157,
-    79268,
-    20518,
-    31549,
-    86667,
-    93647,
-    101618,
-    80731,
-    24383,
-    52583,
-    108764,
-    113830,
-    166202,
-    13753,
-    176523,
-    32816,
-    60358,
-    71965,
-    3222,
-    4560,
-    132525,
-    130185,
-    153904,
-    126563,
-    131844,
-    149632,
-    120060,
-    159020,
-    114664,
-    47663,
-    159026,
-    74844,
-    171406,
-    163313,
-    82261,
-    79982,
-    76288,
-    3699,
-    84810,
-    94896,
-    174312,
-    120447,
-    7492,
-    102243,
-    128195,
-    162547,
-    153061,
-    18881,
-    114977,
-    65172,
-    77639,
-    4325,
-    116935,
-    66222,
-    89,
-    6705,
-    106673,
-    171823,
-    128731,
-    167359,
-    41251,
-    27880,
-    85946,
-    36082,
-    7299,
-    126816,
-    132494,
-    127297,
-    126512,
-    3899,
-    117343,
-    137291,
-    25000,
-    54976,
-    22379,
-    38091,
-    112545,
-    141574,
-    40181,
-    152571,
-    15547,
-    50824,
-    64032,
-    5216,
-    58386,
-    31170,
-    94280,
-    176014,
-    8919,
-    130355,
-    58555,
-    166615,
-    132172,
-    128392,
-    5071,
-    127311,
-    133503,
-    93691,
-    141585,
-    77620,
-    54893,
-    125357,
-    149040,
-    23281,
-    121591,
-    86739,
-    48209,
-    138618,
-    113198,
-    40525,
-    57421,
-    91249,
-    179271,
-    179115,
-    33636,
-    112324,
-    80594,
-    115934,
-    58094,
-    59969,
-    173543,
-    175137,
-    3695,
-    60271,
-    118937,
-    151826,
-    38417,
-    137756,
-    23677,
-    92062,
-    58069,
-    62028,
-    117801,
-    165356,
-    27923,
-    55779,
-    95549,
-    3251,
-    57435,
-    61386,
-    62313,
-    59095,
-    71187,
-    174968,
-    33824,
-    113083,
-    85665,
-    106778,
-    27457,
-    89273,
-    82744,
-    164724,
-    98930,
-    3999,
-    42969,
-    39223,
-    45724,
-    25995,
-    6450,
-    66542,
-    177143,
-    132160,
-    70337,
-    150954,
-    97979,
-    10645,
-    59463,
-    143798,
-    115065,
-    98079,
-    44706,
-    103935,
-    133088,
-    8219,
-    129002,
-    156931,
-    57985,
-    132100,
-    102847,
-    165137,
-    80463,
-    113412,
-    135957,
-    173044,
-    55895,
-    172695,
-    8158,
-    158055,
-    78333,
-    84140,
-    20135,
-    22428,
-    297,
-    72615,
-    115882,
-    117187,
-    157552,
-    67013,
-    18533,
-    105667,
-    135001,
-    81439,
-    30962,
-    69026,
-    18492,
-    50155,
-    6138,
-    34438,
-    113448,
-    100317,
-    46341,
-    18329,
-    135100,
-    143081,
-    9155,
-    122629,
-    140866,
-    19893,
-    116754,
-    51531,
-    67615,
-    9690,
-    151849,
-    145905,
-    56696,
-    173771,
-    91508,
-    8940,
-    69411,
-    144132,
-    36695,
-    149552,
-    111329,
-    111050,
-    26174,
-    12068,
-    25749,
-    24792,
-    60175,
-    61781,
-    63066,
-    102827,
-    85249,
-    15125,
-    176340,
-    65098,
-    108082,
-    34853,
-    28204,
-    109269,
-    7060,
-    82258,
-    102938,
-    154150,
-    94609,
-    154327,
-    114962,
-    138379,
-    125134,
-    85988,
-    156553,
-    33212,
-    101871,
-    161197,
-    75824,
-    145394,
-    99844,
-    129524,
-    88814,
-    143120,
-    73833,
-    90953,
-    164756,
-    169561,
-    81612,
-    28510,
-    167695,
-    153779,
-    179393,
-    151735,
-    26139,
-    47861,
-    50944,
-    97867,
-    54957,
-    99719,
-    119534,
-    76875,
-    172533,
-    166535,
-    13838,
-    29170,
-    39171,
-    18478,
-    160112,
-    168577,
-    176558,
-    27425,
-    43043,
-    10480,
-    14004,
-    97991,
-    689,
-    16227,
-    84461,
-    105680,
-    54294,
-    142879,
-    61004,
-    112267,
-    84632,
-    99676,
-    92705,
-    157389,
-    75291,
-    120001,
-    71212,
-    165554,
-    56187,
-    123453,
-    173916,
-    121293,
-    96264,
-    9467,
-    57680,
-    13445,
-    78050,
-    31378,
-    58818,
-    101055,
-    35004,
-    105028,
-    6537,
-    19579,
-    60400,
-    131096,
-    128242,
-    142836,
-    145208,
-    125743,
-    4770,
-    95802,
-    55630,
-    176570,
-    160383,
-    17571,
-    177756,
-    126111,
-    63781,
-    32615,
-    83161,
-    87131,
-    165802,
-    162722,
-    64039,
-    108208,
-    99661,
-    65448,
-    33414,
-    166269,
-    170092,
-    111903,
-    98955,
-    9776,
-    52993,
-    145935,
-    144219,
-    176838,
-    146855,
-    70604,
-    129557,
-    36505,
-    174359,
-    177067,
-    45669,
-    24511,
-    124948,
-    77181,
-    94866,
-    14424,
-    67063,
-    83284,
-    71048,
-    164878,
-    170359,
-    65518,
-    70984,
-    73562,
-    111935,
-    56074,
-    46570,
-    142478,
-    68663,
-    77364,
-    41898,
-    92392,
-    164042,
-    86565,
-    78401,
-    109807,
-    33659,
-    71293,
-    151648,
-    163989,
-    30360,
-    108716,
-    150699,
-    11512,
-    57188,
-    126249,
-    54726,
-    73857,
-    69045,
-    165952,
-    48044,
-    5908,
-    75245,
-    160561,
-    146754,
-    73587,
-    175775,
-    81013,
-    129845,
-    67535,
-    14907,
-    125066,
-    61637,
-    47985,
-    126935,
-    141515,
-    74799,
-    38998,
-    89614,
-    3550,
-    135873,
-    92503,
-    160641,
-    80182,
-    5137,
-    80478,
-    378,
-    78026,
-    164972,
-    70695,
-    12656,
-    25383,
-    38047,
-    22862,
-    161301,
-    92359,
-    165072,
-    101866,
-    58012,
-    164,
-    152964,
-    111337,
-    45917,
-    170291,
-    42645,
-    5737,
-    26645,
-    35873,
-    139846,
-    43863,
-    151324,
-    140714,
-    33270,
-    126284,
-    106943,
-    81847,
-    125121,
-    156603,
-    176359,
-    128287,
-    92097,
-    79672,
-    92678,
-    67212,
-    47817,
-    168264,
-    100805,
-    33363,
-    149193,
-    90908,
-    97792,
-    5040,
-    162684,
-    164836,
-    35054,
-    22160,
-    1934,
-    42221,
-    126989,
-    51752,
-    86644,
-    112219,
-    8699,
-    40346,
-    54899,
-    97296,
-    16168,
-    66701,
-    44842,
-    126506,
-    52626,
-    173030,
-    52939,
-    84166,
-    61878,
-    99107,
-    84857,
-    30234,
-    177946,
-    88540,
-    62892,
-    82696,
-    178550,
-    28173,
-    164779,
-    42862,
-    6525,
-    6393,
-    64000,
-    50335,
-    123253,
-    32636,
-    159899,
-    91652,
-    25985,
-    128478,
-    77436,
-    36403,
-    72798,
-    9581,
-    79195,
-    170187,
-    60860,
-    162468,
-    96323,
-    36348,
-    84832,
-    14107,
-    169120,
-    60588,
-    48992,
-    85964,
-    172771,
-    920,
-    79394,
-    168158,
-    176202,
-    14067,
-    137883,
-    168856,
-    80582,
-    163553,
-    16925,
-    136472,
-    22359,
-    119887,
-    147678,
-    33735,
-    121021,
-    46641,
-    17971,
-    53782,
-    82025,
-    118577,
-    84668,
-    105625,
-    100693,
-    100012,
-    49269,
-    101705,
-    54157,
-    14368,
-    82073,
-    148509,
-    173116,
-    19774,
-    103910,
-    19906,
-    9954,
-    48734,
-    21154,
-    43946,
-    13202,
-    163851,
-    173547,
-    164948,
-    72569,
-    35968,
-    12474,
-    13468,
-    53819,
-    14641,
-    2713,
-    41270,
-    15931,
-    134925,
-    174671,
-    152846,
-    45400,
-    135381,
-    152441,
-    53087,
-    176969,
-    56473,
-    61809,
-    165211,
-    90023,
-    103803,
-    99460,
-    120604,
-    103404,
-    163932,
-    159533,
-    168664,
-    36231,
-    99540,
-    82671,
-    97087,
-    24612,
-    74022,
-    800,
-    94833,
-    99641,
-    77362,
-    35859,
-    66687,
-    33979,
-    163360,
-    118852,
-    156397,
-    26246,
-    104969,
-    41443,
-    152910,
-    44812,
-    46844,
-    3912,
-    72549,
-    28952,
-    126062,
-    95906,
-    128067,
-    26305,
-    82988,
-    101920,
-    90294,
-    135835,
-    74755,
-    100507,
-    82825,
-    139534,
-    42402,
-    87544,
-    141182,
-    159240,
-    149746,
-    121902,
-    139567,
-    125425,
-    91201,
-    15346,
-    141678,
-    7210,
-    138174,
-    63428,
-    172941,
-    121945,
-    145739,
-    137249,
-    165573,
-    171275,
-    53422,
-    158889,
-    7054,
-    44886,
-    37892,
-    153445,
-    112161,
-    60398,
-    72840,
-    1398,
-    92880,
-    45448,
-    50510,
-    107860,
-    32923,
-    146722,
-    138908,
-    139977,
-    143480,
-    135572,
-    128800,
-    174525,
-    42162,
-    47713,
-    130787,
-    32418,
-    133799,
-    168803,
-    103360,
-    34589,
-    178655,
-    7686,
-    99149,
-    23749,
-    79018,
-    26670,
-    17691,
-    42763,
-    100340,
-    98628,
-    18382,
-    15463,
-    26454,
-    111327,
-    128617,
-    86791,
-    49370,
-    171778,
-    152536,
-    98476,
-    99954,
-    87318,
-    36971,
-    162786,
-    166999,
-    135280,
-    158235,
-    43208,
-    24203,
-    41440,
-    38855,
-    174167,
-    95219,
-    133164,
-    143337,
-    135980,
-    34199,
-    16203,
-    152132,
-    81123,
-    11597,
-    104348,
-    53199,
-    15977,
-    148589,
-    72826,
-    42274,
-    116424,
-    62542,
-    15407,
-    152186,
-    878,
-    168367,
-    53795,
-    39343,
-    100540,
-    35697,
-    36083,
-    143790,
-    87631,
-    46952,
-    175256,
-    81087,
-    59186,
-    150629,
-    157079,
-    73145,
-    37803,
-    36300,
-    145359,
-    51281,
-    86046,
-    157988,
-    84484,
-    36976,
-    56667,
-    55710,
-    35040,
-    156026,
-    173777,
-    33727,
-    61567,
-    112253,
-    74895,
-    7431,
-    51462,
-    151282,
-    135603,
-    55510,
-    168663,
-    46985,
-    141930,
-    98151,
-    154065,
-    157395,
-    125116,
-    86323,
-    173458,
-    98431,
-    166777,
-    47280,
-    118836,
-    14080,
-    38051,
-    56787,
-    91719,
-    12528,
-    61974,
-    64803,
-    99617,
-    33975,
-    52026,
-    76940,
-    81304,
-    136371,
-    140672,
-    142913,
-    8291,
-    101937,
-    114077,
-    104240,
-    171472,
-    172050,
-    174681,
-    179128,
-    139886,
-    43599,
-    82264,
-    179220,
-    128361,
-    38172,
-    80378,
-    72698,
-    3289,
-    165881,
-    47724,
-    157609,
-    17394,
-    138085,
-    166381,
-    148380,
-    179938,
-    56445,
-    52714,
-    144029,
-    127261,
-    42997,
-    51788,
-    64682,
-    46409,
-    114927,
-    57628,
-    2362,
-    92721,
-    112868,
-    139655,
-    92615,
-    124840,
-    25776,
-    111017,
-    59692,
-    179735,
-    69763,
-    124005,
-    91202,
-    31833,
-    174161,
-    59796,
-    119827,
-    22598,
-    158303,
-    5879,
-    106269,
-    162433,
-    73223,
-    79105,
-    64154,
-    53153,
-    65710,
-    56016,
-    17166,
-    151218,
-    154687,
-    101860,
-    8917,
-    145655,
-    126710,
-    111952,
-    34046,
-    60185,
-    159584,
-    63082,
-    1328,
-    7033,
-    8599,
-    156533,
-    39271,
-    125005,
-    63723,
-    82275,
-    121046,
-    49569,
-    36689,
-    24570,
-    39474,
-    169740,
-    179028,
-    33154,
-    146181,
-    106613,
-    134975,
-    139813,
-    154362,
-    15069,
-    92679,
-    173156,
-    157352,
-    59662,
-    102128,
-    162570,
-    10591,
-    103785,
-    140428,
-    120662,
-    163130,
-    89740,
-    129235,
-    3559,
-    126050,
-    81603,
-    95513,
-    93502,
-    107168,
-    89065,
-    143,
-    173721,
-    48583,
-    97517,
-    173027,
-    133756,
-    35924,
-    111588,
-    161280,
-    129434,
-    3123,
-    68050,
-    63600,
-    7592,
-    61130,
-    132477,
-    106418,
-    20811,
-    84365,
-    93437,
-    33881,
-    65947,
-    115147,
-    70515,
-    108332,
-    124987,
-    105473,
-    16563,
-    36251,
-    107810,
-    68419,
-    6315,
-    57855,
-    51171,
-    149826,
-    140984,
-    56177,
-    81659,
-    74864,
-    70710,
-    119118,
-    174591,
-    53767,
-    148018,
-    160282,
-    72510,
-    113898,
-    166329,
-    19877,
-    119094,
-    54884,
-    111400,
-    124371,
-    55065,
-    172635,
-    56730,
-    18301,
-    100636,
-    175126,
-    156161,
-    92782,
-    97538,
-    13242,
-    116555,
-    8218,
-    149211,
-    163771,
-    167210,
-    75072,
-    138929,
-    59152,
-    124941,
-    161438,
-    169910,
-    163473,
-    99759,
-    165653,
-    69142,
-    24184,
-    177454,
-    52197,
-    58096,
-    145478,
-    44614,
-    116818,
-    178032,
-    117249,
-    52639,
-    85475,
-    82507,
-    34648,
-    134124,
-    113706,
-    116230,
-    55874,
-    14210,
-    14333,
-    7292,
-    50035,
-    118275,
-    27243,
-    87074,
-    157815,
-    39249,
-    179086,
-    25292,
-    111428,
-    66585,
-    19881,
-    146129,
-    110829,
-    10783,
-    165911,
-    102183,
-    66817,
-    173157,
-    63360,
-    33709,
-    177009,
-    164602,
-    129379,
-    173894,
-    111849,
-    66237,
-    42277,
-    64656,
-    12916,
-    39773,
-    16314,
-    87693,
-    76191,
-    1343,
-    24523,
-    174295,
-    157515,
-    124942,
-    166994,
-    21921,
-    30577,
-    164668,
-    160521,
-    102149,
-    82837,
-    37794,
-    145961,
-    155271,
-    116169,
-    173308,
-    75896,
-    71147,
-    97784,
-    92717,
-    166343,
-    140878,
-    129172,
-    127746,
-    107872,
-    95067,
-    138547,
-    148945,
-    178930,
-    35550,
-    97732,
-    65247,
-    24167,
-    117048,
-    131218,
-    95359,
-    86945,
-    38367,
-    21731,
-    47334,
-    82337,
-    88659,
-    79701,
-    68257,
-    116085,
-    101935,
-    83921,
-    152671,
-    87225,
-    155730,
-    148357,
-    81068,
-    167084,
-    175832,
-    7387,
-    21278,
-    146536,
-    121814,
-    687,
-    7024,
-    167219,
-    37989,
-    162601,
-    167996,
-    116432,
-    100208,
-    135108,
-    12819,
-    161204,
-    40336,
-    56679,
-    111542,
-    27084,
-    92777,
-    130767,
-    20111,
-    112799,
-    109820,
-    26976,
-    87540,
-    31273,
-    81705,
-    60407,
-    7442,
-    24370,
-    7953,
-    82262,
-    29385,
-    154052,
-    149713,
-    147713,
-    81194,
-    36889,
-    120892,
-    101831,
-    45497,
-    128076,
-    91564,
-    72387,
-    32528,
-    13183,
-    32798,
-    177369,
-    31388,
-    121463,
-    36226,
-    48804,
-    145518,
-    47442,
-    81263,
-    20109,
-    3231,
-    25281,
-    109363,
-    155856,
-    122906,
-    119230,
-    123490,
-    120607,
-    26753,
-    60550,
-    104467,
-    157569,
-    175172,
-    134504,
-    162406,
-    4380,
-    73623,
-    151472,
-    66645,
-    149609,
-    44586,
-    153693,
-    16152,
-    34248,
-    83861,
-    84255,
-    103745,
-    119011,
-    179301,
-    137184,
-    87224,
-    6491,
-    130714,
-    127455,
-    109106,
-    155106,
-    145104,
-    126136,
-    135845,
-    104264,
-    164415,
-    136416,
-    24528,
-    130592,
-    121541,
-    144817,
-    36702,
-    31396,
-    131968,
-    62201,
-    46124,
-    144016,
-    85546,
-    513,
-    170324,
-    109561,
-    78896,
-    12321,
-    99707,
-    148499,
-    73765,
-    139878,
-    129574,
-    159370,
-    41413,
-    141684,
-    123764,
-    73119,
-    113896,
-    43994,
-    87462,
-    105166,
-    176802,
-    83854,
-    22868,
-    141468,
-    22734,
-    80256,
-    43676,
-    12258,
-    153246,
-    126326,
-    101366,
-    73403,
-    72886,
-    7851,
-    143505,
-    775,
-    145954,
-    96230,
-    4210,
-    119251,
-    122861,
-    144259,
-    93543,
-    132436,
-    45305,
-    88404,
-    134436,
-    125035,
-    154895,
-    2296,
-    72400,
-    148703,
-    144806,
-    171021,
-    143805,
-    7221,
-    134392,
-    32770,
-    38113,
-    1137,
-    51153,
-    31508,
-    172922,
-    118813,
-    82649,
-    139323,
-    74488,
-    159122,
-    103176,
-    140402,
-    178166,
-    21540,
-    73746,
-    114697,
-    119110,
-    123248,
-    162237,
-    121664,
-    109682,
-    162473,
-    27519,
-    48891,
-    120928,
-    171713,
-    124271,
-    71409,
-    7260,
-    116100,
-    65219,
-    2563,
-    66047,
-    1530,
-    28119,
-    160036,
-    159668,
-    60050,
-    98681,
-    139691,
-    131146,
-    49209,
-    39039,
-    161743,
-    132728,
-    39514,
-    165489,
-    21703,
-    83910,
-    154119,
-    69664,
-    10605,
-    179325,
-    113994,
-    122936,
-    69853,
-    9655,
-    45439,
-    57432,
-    44063,
-    24724,
-    113691,
-    125838,
-    89728,
-    154257,
-    132778,
-    19396,
-    57830,
-    71869,
-    100427,
-    80457,
-    6569,
-    72824,
-    116232,
-    175733,
-    34478,
-    51649,
-    22302,
-    157448,
-    49526,
-    2718,
-    122195,
-    123875,
-    65505,
-    91324,
-    99942,
-    53741,
-    19138,
-    116239,
-    63352,
-    30124,
-    31383,
-    103987,
-    74702,
-    139105,
-    97146,
-    138610,
-    165691,
-    50598,
-    58148,
-    63336,
-    45773,
-    12498,
-    117015,
-    117706,
-    140013,
-    12851,
-    18675,
-    26409,
-    154914,
-    112160,
-    23102,
-    151258,
-    159312,
-    173655,
-    117372,
-    35318,
-    169333,
-    65365,
-    3614,
-    163733,
-    34320,
-    162185,
-    83204,
-    60292,
-    63231,
-    94958,
-    52970,
-    162913,
-    72783,
-    157950,
-    124031,
-    64142,
-    150415,
-    115810,
-    62870,
-    97529,
-    137280,
-    76776,
-    148539,
-    11361,
-    162256,
-    17683,
-    128430,
-    176680,
-    14854,
-    94711,
-    151339,
-    85036,
-    28472,
-    117976,
-    94225,
-    73164,
-    60711,
-    160090,
-    57190,
-    41408,
-    169890,
-    47654,
-    126033,
-    30391,
-    103045,
-    175534,
-    148009,
-    21504,
-    69529,
-    104362,
-    41977,
-    16975,
-    90324,
-    33252,
-    55035,
-    32749,
-    175845,
-    102910,
-    124316,
-    30863,
-    23673,
-    25788,
-    82311,
-    1189,
-    79304,
-    13370,
-    72262,
-    138801,
-    139782,
-    64880,
-    73124,
-    34113,
-    4526,
-    19027,
-    151076,
-    10585,
-    173830,
-    10010,
-    7329,
-    68441,
-    174137,
-    19125,
-    163619,
-    164449,
-    160754,
-    124532,
-    15393,
-    132482,
-    150920,
-    171043,
-    22895,
-    162014,
-    41791,
-    135155,
-    99793,
-    147022,
-    120964,
-    62452,
-    66799,
-    34774,
-    88785,
-    108655,
-    25278,
-    170369,
-    98821,
-    19341,
-    164980,
-    6120,
-    16302,
-    169932,
-    26888,
-    104109,
-    101571,
-    133314,
-    179372,
-    176397,
-    99105,
-    2552,
-    15066,
-    106431,
-    67781,
-    868,
-    144719,
-    161140,
-    9869,
-    131510,
-    147448,
-    117678,
-    169052,
-    122061,
-    2538,
-    51688,
-    112699,
-    10922,
-    38957,
-    46118,
-    26518,
-    176281,
-    140910,
-    39905,
-    56127,
-    64365,
-    59719,
-    78562,
-    174905,
-    41518,
-    166090,
-    62197,
-    172858,
-    151573,
-    110606,
-    178787,
-    48806,
-    153821,
-    99117,
-    126103,
-    59684,
-    80597,
-    154896,
-    139808,
-    70181,
-    139230,
-    23484,
-    146286,
-    77672,
-    138417,
-    2609,
-    68360,
-    89533,
-    109857,
-    156482,
-    132901,
-    172411,
-    93359,
-    88458,
-    76220,
-    53376,
-    82498,
-    169566,
-    97523,
-    134988,
-    9208,
-    41156,
-    8739,
-    133365,
-    69978,
-    43975,
-    104566,
-    110542,
-    176456,
-    71080,
-    145380,
-    176149,
-    66549,
-    127482,
-    62327,
-    85913,
-    97325,
-    116596,
-    153707,
-    98082,
-    103525,
-    72912,
-    33942,
-    158252,
-    170360,
-    171496,
-    30120,
-    149133,
-    56688,
-    136753,
-    85583,
-    78621,
-    161138,
-    106129,
-    63563,
-    68758,
-    177188,
-    809,
-    16916,
-    90934,
-    126927,
-    107592,
-    11372,
-    42660,
-    176099,
-    4900,
-    154930,
-    150101,
-    65359,
-    110808,
-    118806,
-    43730,
-    149262,
-    133754,
-    70401,
-    147006,
-    97478,
-    81528,
-    173417,
-    16801,
-    85561,
-    118029,
-    31471,
-    177709,
-    25506,
-    127858,
-    107186,
-    73941,
-    45293,
-    53261,
-    136839,
-    5015,
-    44644,
-    31267,
-    50740,
-    177157,
-    70211,
-    34035,
-    12991,
-    17953,
-    85433,
-    48474,
-    69185,
-    89371,
-    133357,
-    54011,
-    66431,
-    44839,
-    62799,
-    88127,
-    21176,
-    54393,
-    91910,
-    92279,
-    151753,
-    103436,
-    83602,
-    179839,
-    113386,
-    158939,
-    44271,
-    69271,
-    164633,
-    50008,
-    12606,
-    56988,
-    170750,
-    142042,
-    102558,
-    177420,
-    8270,
-    38180,
-    152227,
-    84367,
-    119907,
-    121650,
-    70896,
-    97051,
-    81752,
-    53858,
-    146100,
-    1201,
-    41524,
-    142846,
-    147409,
-    107463,
-    122317,
-    149347,
-    145076,
-    147682,
-    108650,
-    165876,
-    81436,
-    20728,
-    70578,
-    49669,
-    91781,
-    130022,
-    159528,
-    136685,
-    150117,
-    150558,
-    162529,
-    41211,
-    151387,
-    142701,
-    38843,
-    38479,
-    89097,
-    174790,
-    61944,
-    37797,
-    166929,
-    131424,
-    145659,
-    54426,
-    47690,
-    98117,
-    117055,
-    173562,
-    78585,
-    102593,
-    141837,
-    99064,
-    169626,
-    31539,
-    175356,
-    162267,
-    52042,
-    122167,
-    53127,
-    101130,
-    65447,
-    79523,
-    113465,
-    123065,
-    112605,
-    14597,
-    115086,
-    162302,
-    138670,
-    150744,
-    145023,
-    21963,
-    158640,
-    12272,
-    73767,
-    54773,
-    31583,
-    92057,
-    91859,
-    51640,
-    59511,
-    23333,
-    177660,
-    64020,
-    165643,
-    103827,
-    168441,
-    45273,
-    96331,
-    86835,
-    146190,
-    3901,
-    153350,
-    68145,
-    109354,
-    51680,
-    173438,
-    131931,
-    159072,
-    175610,
-    101202,
-    111629,
-    34355,
-    118595,
-    15570,
-    142537,
-    14881,
-    109901,
-    134071,
-    179423,
-    115293,
-    154424,
-    36577,
-    70572,
-    93463,
-    42526,
-    30319,
-    3099,
-    15621,
-    128350,
-    68540,
-    154094,
-    19179,
-    35664,
-    92733,
-    24233,
-    51492,
-    87247,
-    119549,
-    63159,
-    106367,
-    56419,
-    86525,
-    79205,
-    33041,
-    131951,
-    102551,
-    147296,
-    44702,
-    141732,
-    166016,
-    52074,
-    44727,
-    52376,
-    176603,
-    36309,
-    51390,
-    141278,
-    169237,
-    165574,
-    131770,
-    103773,
-    75680,
-    26528,
-    102949,
-    147144,
-    43571,
-    124699,
-    98748,
-    12184,
-    95820,
-    107209,
-    51536,
-    52029,
-    54916,
-    150909,
-    71784,
-    58696,
-    162938,
-    81592,
-    160777,
-    149847,
-    126974,
-    68638,
-    97063,
-    113147,
-    162554,
-    147653,
-    106351,
-    155070,
-    141824,
-    109921,
-    107945,
-    30479,
-    15728,
-    963,
-    164799,
-    55819,
-    132150,
-    144595,
-    144144,
-    159748,
-    52676,
-    145685,
-    121210,
-    24773,
-    28186,
-    18049,
-    33634,
-    92908,
-    127731,
-    167303,
-    41916,
-    100768,
-    45881,
-    163490,
-    40133,
-    173731,
-    102596,
-    17454,
-    159960,
-    64260,
-    157502,
-    28042,
-    151983,
-    122362,
-    147856,
-    155172,
-    93987,
-    27066,
-    37385,
-    87827,
-    175877,
-    46509,
-    140505,
-    22587,
-    70429,
-    66499,
-    20244,
-    74387,
-    140336,
-    47081,
-    158049,
-    119455,
-    52145,
-    143325,
-    23947,
-    159778,
-    23501,
-    27449,
-    130998,
-    82345,
-    3215,
-    20551,
-    148771,
-    112499,
-    113785,
-    17468,
-    82548,
-    926,
-    166732,
-    8473,
-    27226,
-    94089,
-    26450,
-    143676,
-    67184,
-    11047,
-    72791,
-    21546,
-    118851,
-    96627,
-    16816,
-    107368,
-    52429,
-    57978,
-    4417,
-    50330,
-    134876,
-    78687,
-    151096,
-    162408,
-    74443,
-    19078,
-    141802,
-    105708,
-    164951,
-    49438,
-    97373,
-    34565,
-    23114,
-    91481,
-    854,
-    143421,
-    135808,
-    93433,
-    45214,
-    85857,
-    162556,
-    126395,
-    39938,
-    117122,
-    134485,
-    104116,
-    126246,
-    1020,
-    83423,
-    1689,
-    13069,
-    160286,
-    166384,
-    72389,
-    39046,
-    29299,
-    39175,
-    7820,
-    98687,
-    10020,
-    162119,
-    5309,
-    39803,
-    68143,
-    26697,
-    175315,
-    99988,
-    131675,
-    50868,
-    32399,
-    7830,
-    132182,
-    105359,
-    161124,
-    15054,
-    108357,
-    19707,
-    57696,
-    5215,
-    47662,
-    126907,
-    126430,
-    89746,
-    87981,
-    94652,
-    104667,
-    22443,
-    14179,
-    53501,
-    116137,
-    111271,
-    91065,
-    5684,
-    2223,
-    164355,
-    98526,
-    87350,
-    177688,
-    168659,
-    51302,
-    151984,
-    138296,
-    2891,
-    23231,
-    92802,
-    83441,
-    150520,
-    1313,
-    19058,
-    101300,
-    1566,
-    85507,
-    41488,
-    32537,
-    143000,
-    107239,
-    31726,
-    179136,
-    130823,
-    102564,
-    85082,
-    25241,
-    120499,
-    107722,
-    114937,
-    99002,
-    59783,
-    95189,
-    178573,
-    154852,
-    97395,
-    142791,
-    114474,
-    19066,
-    136605,
-    6916,
-    126541,
-    84036,
-    7892,
-    58775,
-    54363,
-    148008,
-    72429,
-    164952,
-    17872,
-    157695,
-    1864,
-    20629,
-    140709,
-    33586,
-    67328,
-    148949,
-    119817,
-    163304,
-    51174,
-    96751,
-    165497,
-    56935,
-    21620,
-    69369,
-    124599,
-    177609,
-    144734,
-    5047,
-    28246,
-    100703,
-    8284,
-    48911,
-    48918,
-    136682,
-    159174,
-    171100,
-    57798,
-    120933,
-    75199,
-    161242,
-    55062,
-    65005,
-    165207,
-    104540,
-    14479,
-    119536,
-    149249,
-    8115,
-    157799,
-    126977,
-    131052,
-    63740,
-    135515,
-    136697,
-    132133,
-    170210,
-    54451,
-    100238,
-    49714,
-    79836,
-    179230,
-    36895,
-    166770,
-    27991,
-    56463,
-    116179,
-    177319,
-    91024,
-    14764,
-    122551,
-    128311,
-    59975,
-    162307,
-    1090,
-    14460,
-    123291,
-    62813,
-    58751,
-    108827,
-    81230,
-    5979,
-    50679,
-    111959,
-    63584,
-    37353,
-    68276,
-    163533,
-    172642,
-    173890,
-    131423,
-    169450,
-    77683,
-    108218,
-    111966,
-    43802,
-    146688,
-    96933,
-    19968,
-    46997,
-    78419,
-    72047,
-    164424,
-    31805,
-    88438,
-    164666,
-    179113,
-    141800,
-    26827,
-    102516,
-    54950,
-    155600,
-    60437,
-    97712,
-    107238,
-    96255,
-    37735,
-    79605,
-    133961,
-    37922,
-    67515,
-    140686,
-    142816,
-    132400,
-    37634,
-    85606,
-    20068,
-    49204,
-    90580,
-    145329,
-    160699,
-    77094,
-    8199,
-    177035,
-    24450,
-    87626,
-    39511,
-    63934,
-    130960,
-    132820,
-    102762,
-    69545,
-    155229,
-    65054,
-    71434,
-    116110,
-    44148,
-    101319,
-    6270,
-    169975,
-    74687,
-    120916,
-    57605,
-    146327,
-    76356,
-    42658,
-    80335,
-    106344,
-    98201,
-    151451,
-    25432,
-    35707,
-    64010,
-    102425,
-    40534,
-    90163,
-    143713,
-    102766,
-    49447,
-    35854,
-    54435,
-    10189,
-    83603,
-    116666,
-    25817,
-    109549,
-    163426,
-    155425,
-    115230,
-    61070,
-    60242,
-    172751,
-    97921,
-    59532,
-    65660,
-    53845,
-    173982,
-    61504,
-    173616,
-    92105,
-    40215,
-    27080,
-    150110,
-    91238,
-    151430,
-    100248,
-    94750,
-    33577,
-    134558,
-    30843,
-    86278,
-    125112,
-    105007,
-    93631,
-    48688,
-    56029,
-    73845,
-    66949,
-    38784,
-    21289,
-    148086,
-    49845,
-    138724,
-    73442,
-    177187,
-    156480,
-    20849,
-    33731,
-    17932,
-    76681,
-    119527,
-    72601,
-    141815,
-    4709,
-    167298,
-    140912,
-    137299,
-    50260,
-    126596,
-    149346,
-    127358,
-    145106,
-    172633,
-    71286,
-    68016,
-    86051,
-    106740,
-    152729,
-    28697,
-    98786,
-    113945,
-    41344,
-    75220,
-    35660,
-    61627,
-    175386,
-    96703,
-    102597,
-    76817,
-    26509,
-    163126,
-    141454,
-    62174,
-    4851,
-    69822,
-    157763,
-    150610,
-    53631,
-    13941,
-    61139,
-    126438,
-    106635,
-    71046,
-    92159,
-    131989,
-    84566,
-    3951,
-    72181,
-    141909,
-    145529,
-    102717,
-    39890,
-    50392,
-    157305,
-    52886,
-    112741,
-    54177,
-    176330,
-    7600,
-    65390,
-    141921,
-    25883,
-    98708,
-    43308,
-    157513,
-    133331,
-    87634,
-    48111,
-    129421,
-    55980,
-    163181,
-    69661,
-    30724,
-    28733,
-    162756,
-    16250,
-    160452,
-    161273,
-    139983,
-    21273,
-    105399,
-    41436,
-    171063,
-    88345,
-    150531,
-    152629,
-    139092,
-    137862,
-    103370,
-    4597,
-    132397,
-    72673,
-    82115,
-    72609,
-    16701,
-    5627,
-    63851,
-    11272,
-    156511,
-    150752,
-    36010,
-    47896,
-    89225,
-    125311,
-    103228,
-    173998,
-    160908,
-    57444,
-    186,
-    85194,
-    384,
-    134494,
-    100163,
-    176646,
-    45989,
-    109531,
-    121672,
-    145524,
-    44203,
-    117300,
-    103973,
-    75206,
-    78442,
-    24499,
-    61164,
-    159049,
-    79678,
-    52922,
-    28490,
-    149679,
-    6244,
-    69076,
-    45366,
-    128703,
-    47180,
-    44343,
-    2436,
-    144236,
-    5670,
-    81000,
-    148681,
-    27665,
-    162797,
-    135680,
-    4961,
-    78557,
-    129673,
-    178162,
-    57747,
-    146512,
-    59144,
-    49288,
-    65260,
-    150679,
-    15229,
-    18693,
-    107462,
-    175511,
-    148758,
-    113519,
-    162931,
-    136815,
-    14304,
-    75518,
-    112906,
-    111746,
-    85718,
-    88361,
-    91530,
-    22984,
-    92641,
-    59881,
-    18114,
-    112334,
-    46143,
-    178781,
-    23082,
-    77752,
-    7446,
-    178782,
-    124132,
-    42002,
-    103378,
-    59528,
-    84417,
-    104293,
-    137141,
-    170692,
-    5952,
-    33131,
-    14280,
-    128903,
-    147797,
-    81977,
-    69398,
-    175536,
-    88761,
-    44164,
-    161538,
-    28346,
-    98868,
-    40744,
-    89377,
-    41552,
-    85432,
-    38676,
-    43658,
-    50887,
-    151065,
-    104999,
-    7643,
-    79798,
-    42614,
-    94742,
-    96836,
-    73296,
-    18634,
-    102609,
-    161184,
-    162882,
-    26118,
-    152816,
-    20619,
-    104312,
-    121044,
-    141455,
-    168163,
-    83882,
-    72580,
-    145647,
-    96991,
-    156459,
-    25635,
-    123028,
-    47804,
-    171764,
-    159642,
-    85893,
-    148864,
-    5388,
-    5700,
-    146808,
-    147672,
-    140270,
-    89055,
-    90961,
-    59583,
-    16103,
-    63621,
-    27717,
-    93477,
-    58845,
-    36851,
-    10936,
-    28216,
-    119921,
-    95115,
-    157859,
-    38040,
-    19147,
-    150519,
-    79288,
-    26072,
-    79413,
-    80572,
-    140255,
-    161274,
-    172187,
-    174554,
-    168620,
-    165851,
-    114443,
-    63181,
-    710,
-    126064,
-    76792,
-    114829,
-    177195,
-    21313,
-    168695,
-    106859,
-    65398,
-    135293,
-    136961,
-    154794,
-    108555,
-    74105,
-    12253,
-    118729,
-    17476,
-    83437,
-    47772,
-    52875,
-    138361,
-    171122,
-    12908,
-    152371,
-    80039,
-    82389,
-    27855,
-    168793,
-    100942,
-    126540,
-    21362,
-    74120,
-    6682,
-    146426,
-    122310,
-    63744,
-    155615,
-    82764,
-    57703,
-    92109,
-    157733,
-    72604,
-    62384,
-    165248,
-    62569,
-    76556,
-    160801,
-    177735,
-    20370,
-    65935,
-    118385,
-    179908,
-    120857,
-    101327,
-    174656,
-    91650,
-    20213,
-    131056,
-    29634,
-    55241,
-    106515,
-    21634,
-    66946,
-    119838,
-    142217,
-    117348,
-    16499,
-    177822,
-    7665,
-    99086,
-    69257,
-    178586,
-    65811,
-    154857,
-    105239,
-    39540,
-    146513,
-    30326,
-    122646,
-    51939,
-    30079,
-    85494,
-    155288,
-    112723,
-    160941,
-    146630,
-    168482,
-    47375,
-    176138,
-    77291,
-    90649,
-    76697,
-    123194,
-    36810,
-    102713,
-    79713,
-    144645,
-    130130,
-    67101,
-    37151,
-    154035,
-    102094,
-    75390,
-    60169,
-    114565,
-    12836,
-    37816,
-    73394,
-    120153,
-    74004,
-    69047,
-    29826,
-    105760,
-    152091,
-    11108,
-    38357,
-    25798,
-    14993,
-    164072,
-    59237,
-    146556,
-    43409,
-    18410,
-    158217,
-    144983,
-    145165,
-    162205,
-    52808,
-    35072,
-    45454,
-    82395,
-    40351,
-    91429,
-    158636,
-    150029,
-    148173,
-    40392,
-    139529,
-    35508,
-    175155,
-    169872,
-    115453,
-    15978,
-    160501,
-    62347,
-    61427,
-    158362,
-    145703,
-    90142,
-    45121,
-    81878,
-    164579,
-    32741,
-    52646,
-    63806,
-    151793,
-    125440,
-    23125,
-    44422,
-    43496,
-    13422,
-    118508,
-    29759,
-    35361,
-    65903,
-    114274,
-    121102,
-    146984,
-    122490,
-    99549,
-    59889,
-    6355,
-    19964,
-    169415,
-    117965,
-    112086,
-    79282,
-    160028,
-    149561,
-    13826,
-    36306,
-    47166,
-    19313,
-    38751,
-    129391,
-    173454,
-    122835,
-    75061,
-    32237,
-    160101,
-    106185,
-    116763,
-    41653,
-    13249,
-    18604,
-    81176,
-    64267,
-    56836,
-    27775,
-    80688,
-    130468,
-    145653,
-    173484,
-    24547,
-    28716,
-    155275,
-    9961,
-    146824,
-    92537,
-    161626,
-    18296,
-    113016,
-    74535,
-    121481,
-    127657,
-    124743,
-    41170,
-    50614,
-    97891,
-    168107,
-    136034,
-    95267,
-    179069,
-    77079,
-    52438,
-    35789,
-    149629,
-    6754,
-    105877,
-    157141,
-    2105,
-    95581,
-    42343,
-    69709,
-    16824,
-    96082,
-    127914,
-    146163,
-    52966,
-    178497,
-    163596,
-    56530,
-    148687,
-    169110,
-    16765,
-    33118,
-    77691,
-    4230,
-    108367,
-    139328,
-    126609,
-    48082,
-    80313,
-    145825,
-    167590,
-    130152,
-    15509,
-    70263,
-    171895,
-    155166,
-    6914,
-    84439,
-    20542,
-    146433,
-    83296,
-    179544,
-    96761,
-    72343,
-    26463,
-    65432,
-    144077,
-    129067,
-    31889,
-    133489,
-    128427,
-    25260,
-    82156,
-    25724,
-    127318,
-    114062,
-    131198,
-    165934,
-    63100,
-    92900,
-    20807,
-    51099,
-    137082,
-    25802,
-    109610,
-    48682,
-    106190,
-    105785,
-    39845,
-    139889,
-    3355,
-    46380,
-    178936,
-    103143,
-    13452,
-    177210,
-    98759,
-    16628,
-    83675,
-    70354,
-    84584,
-    97716,
-    166909,
-    108063,
-    99080,
-    82242,
-    163156,
-    19949,
-    138108,
-    45912,
-    107291,
-    149050,
-    161390,
-    8864,
-    22341,
-    119068,
-    89454,
-    155749,
-    69345,
-    35263,
-    90924,
-    21429,
-    176684,
-    54661,
-    97562,
-    129470,
-    74887,
-    76435,
-    7041,
-    80089,
-    43350,
-    107737,
-    145708,
-    90384,
-    51898,
-    160687,
-    13494,
-    127703,
-    52291,
-    67088,
-    122394,
-    100583,
-    56984,
-    89414,
-    78268,
-    172844,
-    84501,
-    178065,
-    76480,
-    9447,
-    176903,
-    173493,
-    166446,
-    179106,
-    171038,
-    176584,
-    63052,
-    174232,
-    51261,
-    72020,
-    75585,
-    25878,
-    31330,
-    41043,
-    11893,
-    132839,
-    34892,
-    84128,
-    109209,
-    4046,
-    155462,
-    12663,
-    158873,
-    126627,
-    95141,
-    65914,
-    17493,
-    164064,
-    64522,
-    148973,
-    30462,
-    38115,
-    178004,
-    56579,
-    2385,
-    38387,
-    77162,
-    134746,
-    41418,
-    98060,
-    76155,
-    43696,
-    25641,
-    57876,
-    138411,
-    47091,
-    150905,
-    175064,
-    29964,
-    91677,
-    144781,
-    40170,
-    146287,
-    40869,
-    123334,
-    129720,
-    12886,
-    124491,
-    128706,
-    20269,
-    10214,
-    75486,
-    94127,
-    123954,
-    115789,
-    10356,
-    56002,
-    140502,
-    134943,
-    155345,
-    40272,
-    95332,
-    37716,
-    46123,
-    107265,
-    60905,
-    137147,
-    42695,
-    159878,
-    6873,
-    101229,
-    40778,
-    15354,
-    71450,
-    90595,
-    40337,
-    160793,
-    60485,
-    52199,
-    130029,
-    174564,
-    171950,
-    133784,
-    89810,
-    100660,
-    72784,
-    82781,
-    34602,
-    159178,
-    101891,
-    323,
-    42743,
-    77146,
-    76506,
-    162731,
-    145687,
-    33985,
-    83158,
-    19845,
-    72336,
-    59373,
-    22669,
-    159953,
-    71069,
-    63453,
-    147082,
-    69160,
-    71056,
-    27310,
-    35250,
-    64123,
-    140740,
-    171715,
-    72340,
-    73257,
-    62580,
-    134524,
-    99593,
-    163652,
-    167781,
-    55328,
-    122280,
-    104075,
-    8189,
-    42130,
-    12290,
-    40598,
-    19463,
-    170310,
-    158241,
-    165102,
-    151987,
-    179203,
-    179870,
-    96973,
-    33670,
-    5437,
-    23491,
-    156643,
-    64821,
-    53625,
-    60936,
-    83164,
-    41785,
-    48981,
-    125289,
-    102571,
-    135079,
-    167999,
-    171137,
-    165151,
-    152707,
-    52641,
-    64661,
-    20775,
-    132650,
-    177315,
-    54411,
-    171651,
-    12325,
-    72431,
-    99179,
-    6095,
-    120953,
-    157366,
-    82729,
-    146758,
-    134714,
-    65626,
-    52732,
-    120205,
-    179894,
-    94857,
-    86304,
-    24007,
-    82322,
-    25845,
-    156715,
-    159575,
-    42151,
-    161609,
-    32415,
-    94664,
-    100936,
-    132002,
-    29747,
-    177438,
-    66328,
-    167834,
-    57136,
-    162833,
-    81686,
-    95170,
-    177131,
-    37895,
-    145302,
-    39098,
-    131612,
-    5219,
-    159432,
-    26516,
-    100697,
-    37585,
-    148237,
-    8383,
-    85838,
-    99921,
-    3393,
-    155334,
-    152915,
-    49177,
-    93725,
-    23455,
-    87595,
-    61561,
-    119969,
-    49072,
-    77879,
-    32122,
-    166331,
-    155928,
-    105876,
-    35990,
-    95580,
-    121072,
-    122628,
-    92750,
-    43852,
-    39205,
-    83885,
-    93785,
-    92155,
-    119458,
-    149031,
-    137404,
-    168707,
-    177443,
-    3109,
-    105851,
-    1749,
-    64301,
-    117557,
-    33331,
-    67597,
-    107105,
-    162996,
-    159895,
-    69880,
-    77406,
-    30404,
-    7284,
-    135077,
-    172261,
-    32048,
-    97767,
-    28828,
-    7390,
-    66695,
-    73028,
-    20524,
-    94730,
-    52881,
-    127671,
-    91675,
-    12469,
-    129136,
-    27681,
-    153598,
-    110093,
-    117171,
-    90542,
-    38386,
-    96736,
-    35559,
-    70293,
-    80406,
-    106402,
-    3661,
-    102541,
-    137265,
-    121805,
-    117589,
-    58321,
-    103607,
-    7916,
-    8277,
-    140572,
-    145916,
-    138031,
-    86732,
-    2908,
-    131318,
-    92474,
-    120100,
-    97378,
-    76461,
-    87729,
-    116882,
-    22069,
-    85604,
-    80250,
-    89423,
-    158373,
-    77931,
-    122324,
-    127559,
-    107769,
-    179404,
-    116286,
-    80319,
-    71522,
-    79399,
-    165620,
-    127632,
-    114303,
-    7816,
-    80817,
-    167974,
-    86459,
-    13864,
-    179869,
-    57521,
-    55102,
-    69151,
-    7524,
-    174625,
-    65806,
-    71002,
-    32506,
-    117406,
-    139616,
-    12,
-    76295,
-    92247,
-    159185,
-    103479,
-    133429,
-    168870,
-    76978,
-    58169,
-    128989,
-    157281,
-    108536,
-    162064,
-    88088,
-    118344,
-    69961,
-    114052,
-    25066,
-    146811,
-    121143,
-    61661,
-    93522,
-    35692,
-    43071,
-    27273,
-    4413,
-    116395,
-    14258,
-    67856,
-    176432,
-    46148,
-    69150,
-    158333,
-    149204,
-    63112,
-    157694,
-    163612,
-    67472,
-    146449,
-    24870,
-    110787,
-    12814,
-    105540,
-    84617,
-    125587,
-    162564,
-    136280,
-    173102,
-    149795,
-    114185,
-    844,
-    29202,
-    167341,
-    89443,
-    142402,
-    134969,
-    2760,
-    5677,
-    121152,
-    112477,
-    46569,
-    107762,
-    46036,
-    91356,
-    163666,
-    149844,
-    66649,
-    18431,
-    164583,
-    108789,
-    90014,
-    105931,
-    151114,
-    178158,
-    40892,
-    81325,
-    82573,
-    59093,
-    47697,
-    34430,
-    7398,
-    54258,
-    132713,
-    27872,
-    74994,
-    120830,
-    149945,
-    79344,
-    178849,
-    6540,
-    6660,
-    3414,
-    157911,
-    17278,
-    110746,
-    31540,
-    35345,
-    11334,
-    129032,
-    106416,
-    10379,
-    12194,
-    7959,
-    46732,
-    145357,
-    54481,
-    55880,
-    160241,
-    73426,
-    94053,
-    36563,
-    99722,
-    91406,
-    39165,
-    84264,
-    162364,
-    109874,
-    127465,
-    161997,
-    40257,
-    144864,
-    163975,
-    165196,
-    64987,
-    77721,
-    108402,
-    105502,
-    122581,
-    119469,
-    133958,
-    40551,
-    76569,
-    170290,
-    136246,
-    29788,
-    7077,
-    77417,
-    84898,
-    108016,
-    130198,
-    173114,
-    1126,
-    79541,
-    22198,
-    41651,
-    155217,
-    175510,
-    48130,
-    3426,
-    4622,
-    172224,
-    158789,
-    54419,
-    108441,
-    61214,
-    25983,
-    154419,
-    152699,
-    3027,
-    158725,
-    32190,
-    522,
-    19248,
-    160225,
-    125152,
-    128225,
-    131942,
-    124267,
-    14956,
-    131058,
-    51967,
-    124823,
-    97190,
-    141963,
-    75467,
-    28303,
-    48269,
-    21771,
-    57448,
-    102197,
-    33555,
-    179160,
-    101247,
-    120999,
-    102534,
-    178102,
-    115919,
-    45847,
-    161866,
-    82235,
-    4535,
-    33564,
-    147969,
-    71747,
-    38149,
-    109781,
-    31844,
-    50681,
-    33705,
-    64862,
-    179135,
-    53950,
-    101478,
-    147237,
-    120549,
-    106793,
-    135021,
-    110981,
-    30689,
-    81130,
-    136418,
-    164353,
-    1933,
-    106983,
-    98389,
-    13289,
-    17858,
-    86016,
-    144416,
-    33400,
-    116267,
-    89664,
-    46498,
-    34006,
-    128000,
-    169046,
-    2909,
-    54516,
-    137371,
-    175754,
-    179967,
-    7351,
-    25195,
-    52952,
-    78286,
-    72484,
-    110333,
-    52432,
-    95994,
-    151080,
-    120940,
-    93734,
-    119354,
-    78287,
-    56844,
-    68658,
-    18793,
-    139800,
-    71346,
-    137413,
-    37300,
-    178698,
-    3493,
-    164738,
-    136006,
-    129320,
-    98098,
-    94064,
-    145902,
-    130494,
-    142499,
-    90364,
-    148296,
-    55640,
-    164129,
-    90788,
-    94544,
-    55559,
-    76753,
-    66702,
-    155030,
-    167922,
-    164745,
-    27561,
-    42823,
-    75078,
-    17054,
-    62434,
-    160997,
-    73248,
-    84537,
-    16404,
-    156142,
-    172400,
-    119468,
-    90130,
-    171727,
-    141742,
-    136597,
-    120512,
-    53787,
-    118269,
-    3780,
-    12305,
-    153221,
-    153404,
-    140140,
-    170225,
-    162065,
-    46278,
-    85922,
-    512,
-    77905,
-    92049,
-    20974,
-    56711,
-    161922,
-    49499,
-    7689,
-    148999,
-    166207,
-    48476,
-    179355,
-    47536,
-    171336,
-    63547,
-    172317,
-    59795,
-    165047,
-    41383,
-    98900,
-    95281,
-    46179,
-    15080,
-    140947,
-    59527,
-    86025,
-    120377,
-    15821,
-    77255,
-    8401,
-    41449,
-    22648,
-    143717,
-    159313,
-    9081,
-    125765,
-    167861,
-    72919,
-    97775,
-    113419,
-    5810,
-    162161,
-    40432,
-    113826,
-    116447,
-    61578,
-    31043,
-    47737,
-    21705,
-    137429,
-    72281,
-    174630,
-    1799,
-    111760,
-    132906,
-    89028,
-    137189,
-    24764,
-    41703,
-    113480,
-    170108,
-    43893,
-    79034,
-    138500,
-    155259,
-    85829,
-    157090,
-    80445,
-    107182,
-    121301,
-    125716,
-    106433,
-    152176,
-    124551,
-    22233,
-    102500,
-    140392,
-    116730,
-    120258,
-    93641,
-    111792,
-    82173,
-    4751,
-    113452,
-    4752,
-    106346,
-    150841,
-    85756,
-    62970,
-    154492,
-    170111,
-    146782,
-    42389,
-    177293,
-    102875,
-    144115,
-    39010,
-    60006,
-    118096,
-    4587,
-    3016,
-    137009,
-    173802,
-    145620,
-    130372,
-    120966,
-    170432,
-    150605,
-    59836,
-    71454,
-    175284,
-    37418,
-    90740,
-    150151,
-    115430,
-    98444,
-    42838,
-    39406,
-    62057,
-    72923,
-    145505,
-    173203,
-    161210,
-    64553,
-    6676,
-    148565,
-    92441,
-    42613,
-    121802,
-    103758,
-    145201,
-    35970,
-    61857,
-    51082,
-    7331,
-    1764,
-    105867,
-    126753,
-    160327,
-    104774,
-    34724,
-    8098,
-    76606,
-    25047,
-    98333,
-    129519,
-    47103,
-    12761,
-    38979,
-    131078,
-    3963,
-    1756,
-    2893,
-    42802,
-    172417,
-    38668,
-    148072,
-    128,
-    146068,
-    116095,
-    62307,
-    87001,
-    150624,
-    65893,
-    36679,
-    95542,
-    88735,
-    76809,
-    9502,
-    124608,
-    179979,
-    4896,
-    133403,
-    121131,
-    30476,
-    175980,
-    171142,
-    97995,
-    134018,
-    105316,
-    156651,
-    96290,
-    36608,
-    69863,
-    82698,
-    23208,
-    59953,
-    57802,
-    177017,
-    168790,
-    78989,
-    77872,
-    52416,
-    83506,
-    37868,
-    146214,
-    58320,
-    9656,
-    41118,
-    115199,
-    77504,
-    57744,
-    162557,
-    108520,
-    15051,
-    62531,
-    11133,
-    104080,
-    112120,
-    63417,
-    134721,
-    15199,
-    37593,
-    71924,
-    16150,
-    54368,
-    47823,
-    25026,
-    114234,
-    143984,
-    118631,
-    143963,
-    61203,
-    62305,
-    27783,
-    83047,
-    27571,
-    83340,
-    173699,
-    71972,
-    42685,
-    41608,
-    164419,
-    152960,
-    29143,
-    71879,
-    39677,
-    46704,
-    32579,
-    30719,
-    42128,
-    138224,
-    127588,
-    391,
-    18850,
-    152153,
-    132635,
-    141307,
-    54038,
-    100871,
-    28387,
-    29213,
-    64492,
-    67923,
-    83111,
-    40044,
-    95175,
-    178684,
-    137422,
-    66608,
-    122005,
-    60745,
-    63243,
-    115372,
-    146656,
-    34715,
-    10542,
-    94546,
-    67243,
-    111298,
-    89597,
-    97365,
-    19741,
-    112381,
-    47936,
-    50145,
-    164748,
-    172229,
-    14078,
-    172361,
-    42916,
-    147747,
-    105375,
-    23379,
-    54537,
-    159212,
-    78044,
-    67062,
-    152984,
-    154178,
-    91930,
-    53877,
-    122998,
-    44381,
-    121532,
-    60607,
-    56642,
-    41497,
-    52795,
-    50116,
-    136043,
-    78671,
-    31099,
-    35129,
-    39568,
-    168769,
-    947,
-    166316,
-    170086,
-    111637,
-    63494,
-    172398,
-    99415,
-    88769,
-    106066,
-    121976,
-    4228,
-    25245,
-    124609,
-    160560,
-    87237,
-    64561,
-    28542,
-    42457,
-    21656,
-    81138,
-    117652,
-    129627,
-    26144,
-    36929,
-    83153,
-    91370,
-    130626,
-    155125,
-    122799,
-    56508,
-    14310,
-    74498,
-    103953,
-    53067,
-    29769,
-    78351,
-    179214,
-    55686,
-    31469,
-    47500,
-    160229,
-    60507,
-    72946,
-    168892,
-    20667,
-    48460,
-    104818,
-    53443,
-    170188,
-    51560,
-    95612,
-    90143,
-    102389,
-    4385,
-    55228,
-    38606,
-    147510,
-    86236,
-    171828,
-    109730,
-    124004,
-    119839,
-    157325,
-    173964,
-    176095,
-    51513,
-    44165,
-    130106,
-    55888,
-    104724,
-    71162,
-    5354,
-    95966,
-    127501,
-    160055,
-    51503,
-    177970,
-    86389,
-    60512,
-    149125,
-    175338,
-    17314,
-    1325,
-    166488,
-    38854,
-    132550,
-    95640,
-    44229,
-    11964,
-    114837,
-    7443,
-    124360,
-    78153,
-    107583,
-    175460,
-    148385,
-    151835,
-    59695,
-    63088,
-    93968,
-    138873,
-    43008,
-    125698,
-    1848,
-    153569,
-    1487,
-    677,
-    79844,
-    68005,
-    50914,
-    139004,
-    120020,
-    161926,
-    6469,
-    165449,
-    74934,
-    164576,
-    3579,
-    137698,
-    69775,
-    13482,
-    83688,
-    175208,
-    123158,
-    115479,
-    105621,
-    4559,
-    144192,
-    119626,
-    6046,
-    91537,
-    136389,
-    154897,
-    151879,
-    129031,
-    4372,
-    72842,
-    23137,
-    54371,
-    159169,
-    108102,
-    116269,
-    98703,
-    29147,
-    8286,
-    28909,
-    68035,
-    99429,
-    64047,
-    12053,
-    71604,
-    156808,
-    70059,
-    164450,
-    36858,
-    7923,
-    127388,
-    104954,
-    31675,
-    168094,
-    64605,
-    125714,
-    7067,
-    65778,
-    66427,
-    162294,
-    123235,
-    71698,
-    114086,
-    35067,
-    95842,
-    29225,
-    74284,
-    49660,
-    133361,
-    20944,
-    50488,
-    4543,
-    65218,
-    115918,
-    31140,
-    59208,
-    58558,
-    28846,
-    92153,
-    160757,
-    97591,
-    64061,
-    18536,
-    31447,
-    72992,
-    150143,
-    61135,
-    145815,
-    137453,
-    170362,
-    115762,
-    84764,
-    49368,
-    89879,
-    172452,
-    106906,
-    151678,
-    161341,
-    127232,
-    89004,
-    40766,
-    35194,
-    34947,
-    146437,
-    80552,
-    57376,
-    134192,
-    100816,
-    76525,
-    28347,
-    159654,
-    7519,
-    11657,
-    138885,
-    29588,
-    50523,
-    52559,
-    162987,
-    133070,
-    20554,
-    107548,
-    119154,
-    36808,
-    170366,
-    86827,
-    67725,
-    171285,
-    89469,
-    16039,
-    118618,
-    85599,
-    94644,
-    104737,
-    166754,
-    96180,
-    122774,
-    112560,
-    17613,
-    25913,
-    105533,
-    178470,
-    42117,
-    14796,
-    38511,
-    110505,
-    47871,
-    147394,
-    118605,
-    140899,
-    51878,
-    76263,
-    4360,
-    142168,
-    60817,
-    33869,
-    100062,
-    34493,
-    165101,
-    18751,
-    58629,
-    96792,
-    132017,
-    14238,
-    97584,
-    60121,
-    159749,
-    117657,
-    46227,
-    49246,
-    6828,
-    103673,
-    106767,
-    41727,
-    113275,
-    53358,
-    89681,
-    56018,
-    134621,
-    63783,
-    11976,
-    40333,
-    9724,
-    133933,
-    18107,
-    49638,
-    123644,
-    3962,
-    141251,
-    157001,
-    7960,
-    92176,
-    104197,
-    18420,
-    94212,
-    118184,
-    145458,
-    20821,
-    106060,
-    136781,
-    88443,
-    158941,
-    52294,
-    70281,
-    39586,
-    53672,
-    82283,
-    124472,
-    129827,
-    17902,
-    64073,
-    106978,
-    29885,
-    23209,
-    49763,
-    72202,
-    44403,
-    36871,
-    57159,
-    68927,
-    85685,
-    86937,
-    81355,
-    67930,
-    138318,
-    130977,
-    137066,
-    4110,
-    146442,
-    92423,
-    24012,
-    156784,
-    118475,
-    15516,
-    66928,
-    147587,
-    144785,
-    109397,
-    63482,
-    52090,
-    179370,
-    132945,
-    111933,
-    32849,
-    13812,
-    112278,
-    169584,
-    163567,
-    173602,
-    154585,
-    179449,
-    21225,
-    92277,
-    85319,
-    3621,
-    102481,
-    3564,
-    98241,
-    63951,
-    142991,
-    122521,
-    24803,
-    69146,
-    161434,
-    80598,
-    58011,
-    64436,
-    62728,
-    99311,
-    142067,
-    164105,
-    50688,
-    75881,
-    176065,
-    64924,
-    57677,
-    179526,
-    18335,
-    88420,
-    79116,
-    94891,
-    27718,
-    72452,
-    64498,
-    138423,
-    59077,
-    39509,
-    13374,
-    104607,
-    34165,
-    13961,
-    168259,
-    148094,
-    113151,
-    58484,
-    136823,
-    70862,
-    125151,
-    142383,
-    121938,
-    22589,
-    163270,
-    121234,
-    18778,
-    21196,
-    115823,
-    76765,
-    44396,
-    85377,
-    179887,
-    31390,
-    54806,
-    106092,
-    161920,
-    115108,
-    175867,
-    47307,
-    72888,
-    178086,
-    15585,
-    85883,
-    72430,
-    158559,
-    26241,
-    128183,
-    21465,
-    10670,
-    171434,
-    177418,
-    19336,
-    4317,
-    54062,
-    91453,
-    172719,
-    42583,
-    38121,
-    158077,
-    6201,
-    65989,
-    152851,
-    53961,
-    117571,
-    49095,
-    22990,
-    17590,
-    49982,
-    170049,
-    10000,
-    5743,
-    97882,
-    71043,
-    75011,
-    107446,
-    36664,
-    130630,
-    21885,
-    119210,
-    119955,
-    29005,
-    111490,
-    97808,
-    107882,
-    34040,
-    35758,
-    103794,
-    129490,
-    11779,
-    134509,
-    72487,
-    148332,
-    47145,
-    64676,
-    50449,
-    7152,
-    79604,
-    93238,
-    125903,
-    80091,
-    174575,
-    4335,
-    152469,
-    2956,
-    65859,
-    115356,
-    179974,
-    117564,
-    160845,
-    76311,
-    57563,
-    6299,
-    20433,
-    109689,
-    136267,
-    16808,
-    113738,
-    145689,
-    156267,
-    169983,
-    170152,
-    12332,
-    175461,
-    165426,
-    102170,
-    53353,
-    173733,
-    53177,
-    74203,
-    130966,
-    149088,
-    114762,
-    163392,
-    6411,
-    49315,
-    83354,
-    123926,
-    29835,
-    141318,
-    33255,
-    53620,
-    144497,
-    86536,
-    10288,
-    15121,
-    28089,
-    19827,
-    26589,
-    88511,
-    162843,
-    132531,
-    27845,
-    143942,
-    148759,
-    152992,
-    44994,
-    111334,
-    37813,
-    2113,
-    70267,
-    116855,
-    179297,
-    100015,
-    171863,
-    133916,
-    134576,
-    18828,
-    137885,
-    74798,
-    979,
-    68728,
-    110796,
-    32986,
-    116124,
-    140126,
-    74808,
-    101442,
-    111574,
-    86660,
-    161575,
-    41854,
-    53398,
-    20686,
-    93588,
-    44100,
-    83689,
-    32139,
-    78024,
-    19686,
-    25855,
-    106672,
-    171019,
-    152833,
-    27960,
-    35598,
-    129489,
-    150458,
-    61502,
-    157368,
-    144042,
-    49134,
-    30293,
-    20084,
-    101644,
-    69576,
-    88061,
-    153152,
-    111331,
-    84426,
-    175195,
-    101406,
-    97598,
-    146250,
-    87741,
-    166174,
-    134193,
-    58773,
-    66597,
-    19424,
-    157605,
-    47637,
-    2975,
-    19048,
-    87375,
-    94023,
-    126408,
-    7703,
-    46616,
-    134642,
-    140965,
-    55363,
-    61697,
-    65943,
-    40749,
-    169189,
-    139739,
-    6035,
-    17417,
-    84311,
-    60298,
-    150791,
-    36118,
-    127217,
-    103950,
-    139961,
-    32942,
-    154478,
-    23145,
-    111478,
-    130781,
-    21553,
-    106449,
-    105628,
-    75838,
-    112663,
-    171907,
-    8180,
-    142872,
-    172387,
-    51491,
-    92610,
-    120133,
-    110701,
-    80673,
-    77197,
-    104412,
-    64865,
-    82076,
-    32652,
-    84909,
-    67620,
-    17405,
-    76957,
-    83235,
-    105677,
-    83862,
-    21859,
-    87526,
-    41909,
-    110943,
-    87584,
-    103466,
-    27061,
-    169344,
-    133773,
-    14856,
-    38495,
-    160963,
-    55406,
-    106607,
-    109597,
-    124265,
-    68615,
-    132445,
-    165116,
-    134156,
-    140249,
-    128642,
-    140434,
-    126352,
-    136601,
-    72385,
-    29549,
-    176020,
-    86119,
-    8858,
-    77435,
-    46848,
-    157520,
-    41201,
-    146986,
-    165401,
-    159858,
-    92719,
-    44302,
-    53589,
-    72770,
-    139422,
-    160245,
-    65442,
-    86012,
-    115500,
-    31555,
-    108483,
-    140373,
-    76835,
-    133947,
-    27733,
-    27263,
-    46886,
-    68403,
-    49299,
-    54217,
-    58987,
-    99362,
-    108586,
-    156027,
-    110757,
-    51547,
-    176128,
-    111938,
-    31643,
-    28596,
-    127141,
-    166056,
-    170480,
-    28917,
-    163251,
-    37390,
-    7191,
-    145845,
-    87694,
-    43173,
-    110639,
-    119881,
-    15645,
-    71674,
-    61025,
-    113420,
-    175474,
-    159886,
-    171190,
-    87013,
-    53860,
-    98656,
-    174202,
-    45791,
-    57629,
-    126857,
-    63657,
-    66509,
-    53500,
-    175696,
-    176804,
-    14125,
-    167716,
-    166058,
-    151167,
-    151955,
-    158487,
-    51317,
-    63169,
-    39888,
-    112,
-    122931,
-    154261,
-    38631,
-    24487,
-    49005,
-    42062,
-    75207,
-    47753,
-    126096,
-    15319,
-    46510,
-    76257,
-    6702,
-    43018,
-    13618,
-    43433,
-    116009,
-    22148,
-    87874,
-    16363,
-    76469,
-    169145,
-    145013,
-    122977,
-    82225,
-    42733,
-    140951,
-    19639,
-    12890,
-    151536,
-    107190,
-    117261,
-    168710,
-    141978,
-    127174,
-    120635,
-    56548,
-    162125,
-    109243,
-    108846,
-    136157,
-    74851,
-    144482,
-    156501,
-    12479,
-    6177,
-    100004,
-    19489,
-    160649,
-    15657,
-    148733,
-    35856,
-    8346,
-    157824,
-    147245,
-    36508,
-    16343,
-    10298,
-    12978,
-    85846,
-    128728,
-    8437,
-    91458,
-    73431,
-    3906,
-    104183,
-    149024,
-    35490,
-    130991,
-    84180,
-    4598,
-    123628,
-    108771,
-    161448,
-    25488,
-    51448,
-    179520,
-    15627,
-    41539,
-    152987,
-    137025,
-    40662,
-    87417,
-    10766,
-    47790,
-    157228,
-    26424,
-    91135,
-    46445,
-    19492,
-    74792,
-    67993,
-    160325,
-    95308,
-    143188,
-    161719,
-    165960,
-    38017,
-    127073,
-    120057,
-    10049,
-    11688,
-    159348,
-    28637,
-    7423,
-    113727,
-    85798,
-    142347,
-    89093,
-    174748,
-    167765,
-    147571,
-    56165,
-    12329,
-    82785,
-    107171,
-    113485,
-    171302,
-    145814,
-    129628,
-    39153,
-    96438,
-    140494,
-    124863,
-    67786,
-    48094,
-    114852,
-    91794,
-    2694,
-    22570,
-    77487,
-    96084,
-    70633,
-    152805,
-    53962,
-    81125,
-    172378,
-    20013,
-    163948,
-    117882,
-    99253,
-    166691,
-    137920,
-    84626,
-    160760,
-    177926,
-    14519,
-    99166,
-    91346,
-    164463,
-    141197,
-    8082,
-    48999,
-    173497,
-    142672,
-    83631,
-    47016,
-    14724,
-    162145,
-    155053,
-    171759,
-    134930,
-    125795,
-    110800,
-    128330,
-    54667,
-    119974,
-    80051,
-    8395,
-    25442,
-    71222,
-    95469,
-    102477,
-    55289,
-    142143,
-    116806,
-    167189,
-    156971,
-    128505,
-    129069,
-    96704,
-    122180,
-    151949,
-    164885,
-    126099,
-    114203,
-    124292,
-    65092,
-    13933,
-    48102,
-    140404,
-    21700,
-    62346,
-    14339,
-    125912,
-    48298,
-    62558,
-    34461,
-    163145,
-    86689,
-    9570,
-    12592,
-    16419,
-    58166,
-    121027,
-    163195,
-    111620,
-    54836,
-    84107,
-    177686,
-    27940,
-    110089,
-    103462,
-    119519,
-    156088,
-    156649,
-    80904,
-    57618,
-    145999,
-    54244,
-    20061,
-    137731,
-    42770,
-    69182,
-    18965,
-    40730,
-    96735,
-    134777,
-    112354,
-    25731,
-    89005,
-    89519,
-    40233,
-    10649,
-    40861,
-    93589,
-    111751,
-    177342,
-    26970,
-    172667,
-    7583,
-    16111,
-    36728,
-    63062,
-    138116,
-    19100,
-    127236,
-    47533,
-    90371,
-    33998,
-    107360,
-    109144,
-    40287,
-    101635,
-    103808,
-    2678,
-    159696,
-    72736,
-    67826,
-    151063,
-    19107,
-    99422,
-    35781,
-    70755,
-    60371,
-    49221,
-    42141,
-    52144,
-    28907,
-    5317,
-    3506,
-    38455,
-    27996,
-    7824,
-    99884,
-    156306,
-    107230,
-    122966,
-    72970,
-    87325,
-    136792,
-    34799,
-    130806,
-    57259,
-    1725,
-    156373,
-    69564,
-    50039,
-    1068,
-    36446,
-    45730,
-    162660,
-    62595,
-    51985,
-    118752,
-    37022,
-    81408,
-    169121,
-    173244,
-    14340,
-    95657,
-    166856,
-    121138,
-    87434,
-    37240,
-    49082,
-    4635,
-    50242,
-    4451,
-    55947,
-    130500,
-    139129,
-    92121,
-    125533,
-    72261,
-    113663,
-    110293,
-    80138,
-    1923,
-    106900,
-    121619,
-    81368,
-    138025,
-    96354,
-    53547,
-    147184,
-    40371,
-    128621,
-    30570,
-    59625,
-    70782,
-    159037,
-    92323,
-    48185,
-    121088,
-    57440,
-    113539,
-    161385,
-    128374,
-    143694,
-    146856,
-    111848,
-    63090,
-    179502,
-    144093,
-    70541,
-    131540,
-    139688,
-    116650,
-    150806,
-    38356,
-    160289,
-    36075,
-    33524,
-    160153,
-    103075,
-    80599,
-    99650,
-    83212,
-    47505,
-    70312,
-    165086,
-    15905,
-    15825,
-    102556,
-    49785,
-    23770,
-    97291,
-    156062,
-    179471,
-    49816,
-    31784,
-    18054,
-    102527,
-    171691,
-    25390,
-    29194,
-    117345,
-    92114,
-    88412,
-    127988,
-    21308,
-    138802,
-    73009,
-    173254,
-    123736,
-    19031,
-    159382,
-    49540,
-    111090,
-    629,
-    121564,
-    54965,
-    52834,
-    7277,
-    113233,
-    77741,
-    78998,
-    73899,
-    66161,
-    129378,
-    80432,
-    34957,
-    113337,
-    47748,
-    30983,
-    136636,
-    138017,
-    121109,
-    36632,
-    107028,
-    175658,
-    122925,
-    113474,
-    123577,
-    43268,
-    144263,
-    43924,
-    54274,
-    14782,
-    146555,
-    55117,
-    140875,
-    56486,
-    24470,
-    49657,
-    101846,
-    151399,
-    121331,
-    84691,
-    154305,
-    80716,
-    76849,
-    80045,
-    143139,
-    89458,
-    96488,
-    29006,
-    33166,
-    133379,
-    46693,
-    146543,
-    22170,
-    69112,
-    36216,
-    37139,
-    13585,
-    70895,
-    47621,
-    22461,
-    91060,
-    161648,
-    3299,
-    114935,
-    17125,
-    162077,
-    135324,
-    57097,
-    34631,
-    76496,
-    139833,
-    90472,
-    170331,
-    133894,
-    177806,
-    73228,
-    177089,
-    76232,
-    39327,
-    63273,
-    89349,
-    56535,
-    75255,
-    145216,
-    172454,
-    169199,
-    1136,
-    130105,
-    165539,
-    89255,
-    131267,
-    171701,
-    80678,
-    49932,
-    51208,
-    39953,
-    113115,
-    112922,
-    80210,
-    106144,
-    18633,
-    84702,
-    59204,
-    108849,
-    120826,
-    37298,
-    164071,
-    41255,
-    141501,
-    16331,
-    42859,
-    157854,
-    163043,
-    168007,
-    61673,
-    38427,
-    57046,
-    70328,
-    102807,
-    104836,
-    165399,
-    114567,
-    28903,
-    35441,
-    125073,
-    63763,
-    174855,
-    63262,
-    124195,
-    71398,
-    5198,
-    144685,
-    166014,
-    164381,
-    65204,
-    169184,
-    149412,
-    124616,
-    18842,
-    33771,
-    54095,
-    101404,
-    130969,
-    104343,
-    78838,
-    17033,
-    35827,
-    164601,
-    41224,
-    126567,
-    159773,
-    161453,
-    127464,
-    145383,
-    60492,
-    138022,
-    135146,
-    107085,
-    129043,
-    128553,
-    177602,
-    105640,
-    63424,
-    45581,
-    95110,
-    89137,
-    124643,
-    174009,
-    35835,
-    119483,
-    114148,
-    34652,
-    74379,
-    115523,
-    77610,
-    146793,
-    49754,
-    118550,
-    61230,
-    133475,
-    132643,
-    139055,
-    66859,
-    87430,
-    27053,
-    147880,
-    119377,
-    45859,
-    164817,
-    135144,
-    172967,
-    64019,
-    68365,
-    146942,
-    114920,
-    43500,
-    8091,
-    23355,
-    151172,
-    98462,
-    13926,
-    96543,
-    104247,
-    150299,
-    119393,
-    21516,
-    41258,
-    159074,
-    124140,
-    64536,
-    59996,
-    151682,
-    22493,
-    170087,
-    79759,
-    93855,
-    175038,
-    12615,
-    80622,
-    63941,
-    84356,
-    79257,
-    174259,
-    169242,
-    73996,
-    136160,
-    86378,
-    95130,
-    126240,
-    117394,
-    172953,
-    125621,
-    63602,
-    50312,
-    93403,
-    147274,
-    136183,
-    108448,
-    8719,
-    94847,
-    20851,
-    67633,
-    74735,
-    137246,
-    99544,
-    77150,
-    12492,
-    59952,
-    99135,
-    95095,
-    75075,
-    57015,
-    32407,
-    54498,
-    168975,
-    28222,
-    92468,
-    86695,
-    138827,
-    44234,
-    92389,
-    10238,
-    149556,
-    47179,
-    50696,
-    154809,
-    125460,
-    134307,
-    178776,
-    100049,
-    17715,
-    80793,
-    129596,
-    173666,
-    89032,
-    41285,
-    115549,
-    87363,
-    82058,
-    66136,
-    157497,
-    120402,
-    6279,
-    153896,
-    124057,
-    41316,
-    151092,
-    66407,
-    104022,
-    72873,
-    116736,
-    94541,
-    82171,
-    31154,
-    48578,
-    104449,
-    42032,
-    123898,
-    74388,
-    63850,
-    76190,
-    120418,
-    151039,
-    163425,
-    144161,
-    40810,
-    23090,
-    8275,
-    7881,
-    138650,
-    117371,
-    167067,
-    67210,
-    78613,
-    165104,
-    10383,
-    178806,
-    123512,
-    29926,
-    100914,
-    16529,
-    85139,
-    166365,
-    35989,
-    89992,
-    29019,
-    129503,
-    53995,
-    60429,
-    11918,
-    98889,
-    108010,
-    88588,
-    135725,
-    126042,
-    150660,
-    45062,
-    166172,
-    82467,
-    170240,
-    47206,
-    100555,
-    138979,
-    58913,
-    171582,
-    171394,
-    179045,
-    178450,
-    17120,
-    169045,
-    56669,
-    83363,
-    72011,
-    82023,
-    114335,
-    33604,
-    127225,
-    72997,
-    97502,
-    115775,
-    70064,
-    109424,
-    83892,
-    22583,
-    166441,
-    68790,
-    25861,
-    54578,
-    73942,
-    144376,
-    1714,
-    159649,
-    134062,
-    164414,
-    145781,
-    124075,
-    19859,
-    61656,
-    62364,
-    120077,
-    106006,
-    35713,
-    91389,
-    49139,
-    154904,
-    71523,
-    139170,
-    10508,
-    58379,
-    31366,
-    172115,
-    75424,
-    117670,
-    4468,
-    127907,
-    78837,
-    86471,
-    36340,
-    17113,
-    34818,
-    126821,
-    32111,
-    113324,
-    110136,
-    118675,
-    57471,
-    71951,
-    115927,
-    50714,
-    34735,
-    90926,
-    17242,
-    73236,
-    78631,
-    179961,
-    26792,
-    148273,
-    82097,
-    68472,
-    73083,
-    130261,
-    170065,
-    129855,
-    117128,
-    113347,
-    172254,
-    24786,
-    60823,
-    18411,
-    151134,
-    64819,
-    4221,
-    96530,
-    23706,
-    146458,
-    84236,
-    22058,
-    173042,
-    135098,
-    8566,
-    162779,
-    60789,
-    124556,
-    47321,
-    121979,
-    81524,
-    108301,
-    35855,
-    95035,
-    85339,
-    6488,
-    143681,
-    59063,
-    73886,
-    41241,
-    13345,
-    167263,
-    159391,
-    118621,
-    95182,
-    149223,
-    148119,
-    175354,
-    97567,
-    168305,
-    40011,
-    27549,
-    141141,
-    110254,
-    86674,
-    3560,
-    64608,
-    164580,
-    137782,
-    106107,
-    149146,
-    94273,
-    46460,
-    79412,
-    171613,
-    160194,
-    61796,
-    166437,
-    44096,
-    39494,
-    73161,
-    88934,
-    86521,
-    139772,
-    131520,
-    3561,
-    117851,
-    144240,
-    131055,
-    94484,
-    170263,
-    151045,
-    61030,
-    68298,
-    122083,
-    100456,
-    151815,
-    162385,
-    80860,
-    105972,
-    148479,
-    34720,
-    112083,
-    132856,
-    70522,
-    2741,
-    62779,
-    173261,
-    93030,
-    115834,
-    30720,
-    163483,
-    86500,
-    144055,
-    59712,
-    128550,
-    29167,
-    166257,
-    150229,
-    16280,
-    178647,
-    26007,
-    16572,
-    89214,
-    103129,
-    204,
-    120879,
-    3233,
-    81038,
-    80534,
-    32690,
-    65678,
-    57123,
-    56432,
-    40826,
-    39019,
-    16068,
-    96511,
-    138478,
-    121847,
-    52386,
-    41088,
-    162383,
-    40062,
-    107526,
-    156897,
-    148639,
-    175663,
-    135345,
-    178693,
-    125009,
-    39786,
-    177059,
-    62317,
-    100189,
-    122675,
-    86620,
-    151653,
-    62477,
-    152198,
-    139917,
-    143987,
-    64168,
-    130957,
-    79433,
-    92989,
-    53587,
-    33820,
-    100737,
-    73182,
-    155672,
-    24840,
-    119290,
-    71644,
-    117694,
-    56269,
-    91115,
-    154267,
-    1922,
-    130679,
-    15661,
-    177272,
-    58674,
-    55981,
-    107525,
-    12604,
-    52690,
-    149840,
-    153379,
-    120502,
-    156238,
-    39518,
-    125617,
-    166254,
-    42906,
-    155924,
-    152543,
-    40359,
-    2688,
-    127991,
-    53609,
-    50708,
-    103804,
-    78136,
-    26080,
-    154772,
-    122763,
-    6610,
-    24443,
-    133306,
-    74790,
-    64494,
-    68291,
-    86112,
-    36013,
-    119996,
-    132707,
-    122889,
-    153108,
-    13915,
-    174861,
-    73621,
-    127282,
-    147025,
-    60608,
-    169339,
-    6827,
-    85815,
-    176222,
-    71336,
-    170313,
-    9659,
-    18692,
-    89985,
-    104804,
-    157333,
-    58422,
-    126674,
-    147229,
-    151354,
-    84906,
-    14928,
-    85328,
-    118430,
-    133952,
-    12270,
-    125052,
-    138614,
-    66079,
-    83856,
-    144421,
-    173177,
-    123677,
-    64527,
-    17537,
-    60450,
-    40388,
-    70452,
-    34117,
-    116250,
-    145269,
-    77748,
-    121005,
-    15792,
-    145436,
-    70241,
-    148325,
-    6080,
-    74856,
-    104059,
-    54791,
-    64836,
-    58446,
-    166665,
-    164017,
-    103086,
-    151715,
-    40260,
-    78365,
-    91079,
-    101822,
-    60311,
-    91830,
-    64328,
-    95261,
-    47002,
-    32677,
-    71798,
-    149856,
-    127863,
-    94401,
-    19732,
-    97508,
-    101557,
-    56041,
-    145240,
-    663,
-    102935,
-    119129,
-    152745,
-    78704,
-    90602,
-    156747,
-    52702,
-    154683,
-    803,
-    148568,
-    88518,
-    153323,
-    62865,
-    26500,
-    69841,
-    74925,
-    15226,
-    179505,
-    151672,
-    115146,
-    140810,
-    57925,
-    19620,
-    179339,
-    37678,
-    134964,
-    10616,
-    117633,
-    36009,
-    35359,
-    106746,
-    304,
-    61806,
-    173792,
-    14902,
-    106394,
-    26180,
-    175591,
-    127278,
-    164179,
-    158930,
-    161840,
-    167918,
-    53903,
-    22212,
-    100133,
-    56585,
-    142122,
-    32266,
-    37801,
-    124151,
-    78326,
-    12436,
-    141622,
-    3314,
-    109606,
-    161915,
-    47344,
-    153204,
-    72904,
-    95275,
-    47886,
-    163076,
-    132603,
-    156794,
-    65685,
-    74996,
-    156639,
-    68825,
-    179431,
-    30739,
-    73777,
-    147151,
-    95548,
-    115779,
-    161072,
-    65646,
-    21679,
-    118037,
-    62286,
-    60511,
-    53026,
-    119658,
-    25285,
-    104714,
-    104728,
-    47162,
-    104568,
-    85460,
-    10039,
-    76065,
-    170768,
-    124715,
-    91492,
-    36007,
-    143271,
-    115440,
-    12753,
-    36934,
-    56421,
-    39990,
-    29119,
-    143595,
-    138112,
-    38863,
-    62379,
-    152508,
-    85072,
-    80423,
-    5777,
-    46646,
-    158526,
-    124804,
-    67858,
-    120699,
-    163440,
-    3319,
-    66810,
-    38571,
-    144552,
-    58520,
-    46236,
-    50706,
-    37653,
-    60959,
-    33308,
-    129072,
-    71707,
-    55938,
-    159181,
-    175766,
-    105250,
-    156367,
-    20763,
-    20090,
-    39180,
-    103670,
-    152120,
-    112407,
-    102694,
-    93334,
-    67608,
-    24362,
-    112166,
-    72918,
-    85386,
-    76804,
-    175863,
-    28097,
-    115378,
-    22711,
-    48251,
-    4250,
-    131453,
-    55023,
-    162567,
-    41883,
-    64616,
-    120166,
-    73689,
-    8114,
-    133351,
-    31040,
-    39306,
-    44128,
-    44750,
-    108543,
-    172461,
-    41359,
-    20972,
-    114530,
-    73612,
-    161071,
-    96139,
-    21349,
-    94504,
-    58800,
-    41016,
-    98755,
-    63809,
-    140914,
-    56341,
-    151105,
-    70619,
-    80022,
-    136220,
-    133546,
-    151747,
-    122051,
-    105255,
-    7605,
-    16155,
-    163210,
-    59062,
-    99430,
-    17709,
-    90622,
-    74919,
-    52108,
-    165290,
-    70962,
-    37507,
-    65838,
-    166734,
-    62288,
-    159898,
-    125087,
-    56487,
-    120678,
-    11063,
-    109208,
-    4081,
-    168120,
-    166017,
-    16899,
-    90020,
-    64346,
-    164350,
-    128321,
-    120159,
-    117489,
-    156680,
-    105731,
-    124294,
-    71382,
-    91112,
-    114408,
-    139958,
-    169980,
-    140923,
-    3643,
-    112184,
-    173140,
-    40112,
-    56007,
-    177284,
-    7132,
-    37267,
-    54919,
-    83901,
-    40973,
-    114021,
-    84000,
-    98096,
-    3521,
-    26647,
-    147757,
-    52574,
-    42745,
-    164191,
-    71213,
-    21079,
-    124596,
-    68355,
-    104522,
-    94708,
-    12145,
-    166371,
-    153057,
-    92896,
-    14147,
-    29156,
-    134000,
-    89356,
-    50909,
-    93707,
-    24784,
-    157353,
-    65393,
-    40032,
-    66989,
-    168284,
-    49851,
-    141942,
-    18120,
-    9789,
-    144043,
-    95836,
-    55936,
-    31261,
-    26252,
-    125216,
-    51346,
-    49819,
-    123123,
-    15832,
-    45502,
-    8860,
-    64906,
-    159128,
-    69958,
-    66059,
-    133333,
-    78364,
-    12786,
-    147391,
-    91082,
-    130570,
-    108514,
-    30345,
-    156356,
-    8815,
-    50827,
-    146059,
-    11410,
-    129087,
-    8638,
-    2724,
-    107326,
-    118003,
-    141223,
-    68522,
-    120353,
-    104409,
-    79961,
-    146976,
-    151991,
-    46139,
-    149015,
-    51157,
-    81069,
-    162363,
-    149943,
-    58044,
-    132236,
-    114134,
-    58695,
-    105978,
-    177850,
-    33852,
-    41899,
-    142126,
-    106362,
-    14851,
-    113085,
-    139991,
-    8661,
-    53412,
-    80784,
-    90001,
-    41454,
-    44085,
-    133077,
-    12844,
-    30986,
-    48772,
-    28368,
-    166053,
-    52371,
-    121140,
-    51920,
-    58657,
-    135277,
-    132521,
-    419,
-    91140,
-    156566,
-    122730,
-    171814,
-    54264,
-    86443,
-    93986,
-    14178,
-    178347,
-    128548,
-    139391,
-    133354,
-    111748,
-    79316,
-    135428,
-    179399,
-    116431,
-    157690,
-    46565,
-    38711,
-    21202,
-    60122,
-    135718,
-    82019,
-    36270,
-    50177,
-    122270,
-    17369,
-    113309,
-    87903,
-    20451,
-    142091,
-    65998,
-    146785,
-    79042,
-    73133,
-    26476,
-    174606,
-    30088,
-    9035,
-    174792,
-    168344,
-    44847,
-    22032,
-    44861,
-    18718,
-    134326,
-    11572,
-    166539,
-    166414,
-    3761,
-    163049,
-    136403,
-    173931,
-    20019,
-    146883,
-    153176,
-    152926,
-    123204,
-    5813,
-    33474,
-    163552,
-    149732,
-    88381,
-    111604,
-    125957,
-    3491,
-    153834,
-    100476,
-    119241,
-    171153,
-    61226,
-    114142,
-    148626,
-    44110,
-    121264,
-    24625,
-    43498,
-    38372,
-    42492,
-    154248,
-    47397,
-    157128,
-    17024,
-    166547,
-    110593,
-    154526,
-    81260,
-    133150,
-    71824,
-    109085,
-    147493,
-    84982,
-    172856,
-    171300,
-    153215,
-    3049,
-    139580,
-    81044,
-    94669,
-    138330,
-    53674,
-    64141,
-    174611,
-    139625,
-    103044,
-    171685,
-    129433,
-    176698,
-    38030,
-    135388,
-    90855,
-    151751,
-    62615,
-    174849,
-    12047,
-    67846,
-    130721,
-    48286,
-    179119,
-    3553,
-    177336,
-    178546,
-    86748,
-    173055,
-    123443,
-    31729,
-    155973,
-    127986,
-    111826,
-    135763,
-    138075,
-    78332,
-    58762,
-    68846,
-    75456,
-    21324,
-    153755,
-    32358,
-    89714,
-    62159,
-    13535,
-    5957,
-    158868,
-    10376,
-    64845,
-    35551,
-    71585,
-    51129,
-    149513,
-    13108,
-    67452,
-    20624,
-    45155,
-    15837,
-    131470,
-    60808,
-    139887,
-    113343,
-    123023,
-    79246,
-    92665,
-    165631,
-    39549,
-    90268,
-    109960,
-    89691,
-    95060,
-    80084,
-    133410,
-    141147,
-    85315,
-    53195,
-    66232,
-    176146,
-    62198,
-    117103,
-    5061,
-    88101,
-    110356,
-    16393,
-    15110,
-    174891,
-    31079,
-    73214,
-    135560,
-    56778,
-    27185,
-    154447,
-    109271,
-    60758,
-    93216,
-    121813,
-    29258,
-    105,
-    15822,
-    92627,
-    162694,
-    76806,
-    112748,
-    110854,
-    169030,
-    10576,
-    83844,
-    93802,
-    144305,
-    47631,
-    142333,
-    12932,
-    72016,
-    52277,
-    31141,
-    139996,
-    169071,
-    138962,
-    175798,
-    153542,
-    105084,
-    146675,
-    62321,
-    81055,
-    159704,
-    32692,
-    69132,
-    166510,
-    127149,
-    63179,
-    3773,
-    27995,
-    56099,
-    97871,
-    78726,
-    47272,
-    114015,
-    112465,
-    36771,
-    178760,
-    103962,
-    71250,
-    101307,
-    169465,
-    116827,
-    153442,
-    57875,
-    63601,
-    163471,
-    50490,
-    130552,
-    19221,
-    93155,
-    178480,
-    36046,
-    124356,
-    64175,
-    25725,
-    141049,
-    32980,
-    156899,
-    105796,
-    24968,
-    123558,
-    88224,
-    156265,
-    144602,
-    99141,
-    59909,
-    173166,
-    82096,
-    128187,
-    175981,
-    48609,
-    32886,
-    9019,
-    43143,
-    87364,
-    115662,
-    179893,
-    105381,
-    71177,
-    9310,
-    55239,
-    147480,
-    142875,
-    108883,
-    151058,
-    151858,
-    137211,
-    37640,
-    40383,
-    83959,
-    11587,
-    26816,
-    56721,
-    481,
-    82072,
-    162792,
-    150118,
-    95223,
-    31631,
-    77286,
-    134260,
-    120037,
-    154200,
-    75543,
-    145307,
-    66217,
-    112938,
-    66966,
-    150134,
-    83044,
-    174003,
-    176191,
-    117777,
-    95235,
-    57891,
-    123521,
-    5799,
-    178447,
-    72156,
-    15619,
-    164098,
-    109078,
-    123939,
-    155689,
-    147352,
-    48892,
-    167668,
-    167047,
-    172458,
-    66824,
-    68202,
-    129291,
-    159545,
-    7355,
-    169939,
-    125966,
-    129484,
-    112762,
-    140705,
-    44083,
-    161403,
-    168465,
-    103469,
-    61297,
-    102098,
-    134672,
-    178562,
-    28017,
-    27533,
-    77732,
-    97328,
-    77483,
-    138150,
-    166440,
-    74544,
-    152765,
-    1994,
-    176829,
-    62304,
-    27539,
-    134583,
-    59770,
-    29566,
-    166872,
-    58349,
-    112001,
-    48550,
-    100745,
-    72559,
-    116418,
-    136863,
-    13383,
-    100797,
-    33343,
-    124828,
-    85422,
-    62967,
-    156033,
-    89315,
-    132761,
-    146220,
-    164577,
-    23952,
-    101353,
-    44775,
-    13009,
-    73399,
-    142259,
-    134160,
-    66111,
-    109763,
-    54880,
-    111874,
-    47454,
-    127760,
-    67237,
-    172279,
-    99510,
-    17029,
-    29606,
-    73975,
-    22964,
-    110102,
-    28078,
-    20847,
-    112633,
-    55057,
-    134474,
-    36522,
-    160853,
-    74117,
-    152114,
-    119706,
-    153873,
-    78402,
-    88005,
-    116067,
-    27542,
-    150326,
-    90543,
-    72761,
-    84065,
-    99055,
-    104589,
-    89802,
-    167232,
-    29496,
-    75971,
-    45271,
-    112872,
-    178269,
-    3006,
-    45779,
-    89967,
-    169379,
-    88799,
-    76562,
-    105560,
-    144250,
-    119615,
-    167988,
-    49225,
-    162359,
-    108209,
-    47330,
-    165457,
-    24647,
-    55496,
-    74468,
-    27422,
-    5995,
-    110386,
-    96133,
-    23324,
-    154507,
-    94571,
-    157183,
-    24643,
-    73760,
-    147384,
-    89758,
-    46111,
-    172218,
-    75586,
-    38743,
-    19051,
-    167369,
-    171556,
-    2508,
-    6092,
-    150397,
-    157554,
-    79917,
-    53230,
-    48837,
-    88058,
-    23179,
-    49608,
-    17247,
-    87549,
-    130367,
-    132674,
-    15761,
-    177357,
-    96049,
-    160074,
-    71411,
-    75034,
-    163504,
-    168332,
-    125717,
-    19375,
-    117010,
-    88382,
-    31565,
-    132333,
-    148241,
-    26459,
-    8580,
-    111218,
-    34988,
-    66264,
-    19739,
-    28829,
-    105556,
-    41151,
-    63401,
-    155143,
-    155314,
-    168461,
-    129059,
-    118924,
-    106299,
-    14605,
-    116488,
-    11321,
-    56158,
-    131862,
-    12283,
-    120702,
-    78748,
-    99577,
-    74961,
-    73696,
-    111005,
-    78706,
-    71557,
-    38536,
-    168840,
-    97849,
-    104314,
-    616,
-    172051,
-    88172,
-    125348,
-    128056,
-    11746,
-    127886,
-    21217,
-    78215,
-    143392,
-    94267,
-    35787,
-    118765,
-    9638,
-    136378,
-    110795,
-    171215,
-    149612,
-    147216,
-    161659,
-    158853,
-    34323,
-    41489,
-    98803,
-    114873,
-    41944,
-    115373,
-    105472,
-    172788,
-    18771,
-    130855,
-    61231,
-    30092,
-    57877,
-    125106,
-    59827,
-    9760,
-    44641,
-    50181,
-    104015,
-    171002,
-    178244,
-    99559,
-    97640,
-    148963,
-    126120,
-    172650,
-    28765,
-    144529,
-    82406,
-    32306,
-    7677,
-    143125,
-    50945,
-    1697,
-    161572,
-    147910,
-    27448,
-    176127,
-    160110,
-    130402,
-    32726,
-    47396,
-    113182,
-    161167,
-    45624,
-    23292,
-    111079,
-    62963,
-    151374,
-    59326,
-    64667,
-    18407,
-    16429,
-    13870,
-    49465,
-    78141,
-    157818,
-    447,
-    126522,
-    170539,
-    170329,
-    91886,
-    143173,
-    651,
-    152941,
-    177325,
-    14831,
-    137834,
-    160052,
-    145586,
-    76379,
-    68511,
-    26205,
-    4288,
-    33654,
-    162426,
-    76592,
-    47714,
-    57856,
-    61339,
-    130173,
-    92556,
-    145918,
-    153682,
-    56075,
-    21047,
-    152986,
-    81915,
-    43462,
-    144946,
-    6330,
-    65194,
-    137049,
-    85885,
-    99944,
-    114348,
-    78941,
-    123413,
-    121387,
-    109163,
-    138264,
-    49207,
-    164372,
-    145572,
-    160678,
-    21648,
-    149902,
-    1397,
-    5241,
-    99212,
-    61289,
-    70837,
-    7486,
-    89052,
-    23317,
-    154508,
-    123468,
-    6733,
-    3565,
-    170238,
-    92986,
-    42605,
-    177689,
-    162991,
-    91783,
-    72931,
-    81360,
-    110336,
-    91095,
-    136368,
-    39011,
-    143729,
-    107734,
-    125270,
-    120421,
-    138101,
-    156129,
-    158534,
-    73737,
-    80493,
-    39910,
-    87509,
-    122855,
-    116870,
-    137191,
-    173460,
-    59501,
-    79125,
-    153233,
-    91264,
-    171966,
-    83874,
-    473,
-    129124,
-    107138,
-    82708,
-    167496,
-    175523,
-    152784,
-    44011,
-    142004,
-    131802,
-    72375,
-    34065,
-    19397,
-    1807,
-    163510,
-    143536,
-    143116,
-    26391,
-    75141,
-    140330,
-    67536,
-    2231,
-    124521,
-    120998,
-    40538,
-    138712,
-    60906,
-    128160,
-    132286,
-    135644,
-    114534,
-    76009,
-    99600,
-    114989,
-    123191,
-    159481,
-    107599,
-    150771,
-    92507,
-    31702,
-    74641,
-    144357,
-    34043,
-    42090,
-    36379,
-    45587,
-    88303,
-    76919,
-    37694,
-    166278,
-    100559,
-    76914,
-    179580,
-    136323,
-    42168,
-    138244,
-    77589,
-    139046,
-    115597,
-    51668,
-    82737,
-    9253,
-    61707,
-    105756,
-    47439,
-    113756,
-    107040,
-    135842,
-    117218,
-    156682,
-    125356,
-    35843,
-    131178,
-    73561,
-    51201,
-    19861,
-    89285,
-    95690,
-    40801,
-    131881,
-    132591,
-    45723,
-    127264,
-    119310,
-    32220,
-    83315,
-    123478,
-    88317,
-    164125,
-    69534,
-    13640,
-    52704,
-    114800,
-    110323,
-    12035,
-    13235,
-    103123,
-    10407,
-    90208,
-    72722,
-    60904,
-    122442,
-    124095,
-    137673,
-    50256,
-    109011,
-    176637,
-    49,
-    141419,
-    160472,
-    41480,
-    74509,
-    25518,
-    162789,
-    48753,
-    56138,
-    142310,
-    138376,
-    172663,
-    147541,
-    154097,
-    38338,
-    160556,
-    57290,
-    134147,
-    138053,
-    8547,
-    1763,
-    79645,
-    134740,
-    52188,
-    137873,
-    21813,
-    148116,
-    106326,
-    111699,
-    153091,
-    88555,
-    92383,
-    122437,
-    106059,
-    104551,
-    49466,
-    143003,
-    63154,
-    53571,
-    9915,
-    97125,
-    147387,
-    156429,
-    46856,
-    147895,
-    177556,
-    84883,
-    48085,
-    101032,
-    9163,
-    105604,
-    18438,
-    66439,
-    150516,
-    16095,
-    40750,
-    124898,
-    50052,
-    18040,
-    94143,
-    560,
-    124333,
-    149734,
-    3128,
-    130195,
-    93792,
-    76276,
-    86656,
-    147912,
-    104605,
-    65142,
-    71049,
-    73476,
-    155471,
-    139948,
-    146809,
-    170097,
-    103819,
-    132607,
-    148185,
-    132422,
-    9645,
-    29451,
-    51773,
-    115215,
-    155380,
-    82603,
-    52272,
-    178834,
-    58206,
-    166114,
-    102227,
-    73878,
-    42172,
-    130089,
-    25356,
-    52700,
-    72045,
-    87712,
-    61532,
-    74929,
-    72565,
-    177928,
-    12357,
-    159203,
-    161425,
-    16367,
-    15000,
-    20031,
-    47705,
-    165232,
-    144460,
-    72660,
-    3724,
-    107066,
-    158623,
-    89986,
-    23748,
-    68279,
-    25165,
-    42825,
-    144290,
-    57341,
-    149566,
-    113871,
-    156251,
-    169843,
-    50646,
-    103690,
-    82499,
-    75134,
-    35711,
-    88211,
-    172216,
-    151739,
-    11803,
-    152082,
-    169035,
-    19591,
-    55396,
-    141573,
-    86299,
-    141710,
-    159378,
-    102055,
-    1966,
-    36768,
-    165973,
-    11864,
-    99098,
-    163933,
-    11032,
-    111285,
-    11236,
-    142382,
-    57619,
-    38569,
-    285,
-    104031,
-    34756,
-    6972,
-    110897,
-    79696,
-    41470,
-    152809,
-    110569,
-    123410,
-    20066,
-    44654,
-    90840,
-    73564,
-    112617,
-    57116,
-    72253,
-    158299,
-    51941,
-    101966,
-    158783,
-    80477,
-    64697,
-    71081,
-    174334,
-    12696,
-    10883,
-    8845,
-    179771,
-    178694,
-    109183,
-    37280,
-    135208,
-    6750,
-    7623,
-    24196,
-    75833,
-    75979,
-    56668,
-    139851,
-    108911,
-    70420,
-    125016,
-    30463,
-    114457,
-    106755,
-    103763,
-    78164,
-    53985,
-    51886,
-    106199,
-    31747,
-    170158,
-    123330,
-    93452,
-    92443,
-    127554,
-    177274,
-    109374,
-    47581,
-    31381,
-    35958,
-    143614,
-    137375,
-    29929,
-    46309,
-    94803,
-    25546,
-    105952,
-    3992,
-    82923,
-    161232,
-    75967,
-    56954,
-    107569,
-    23973,
-    14285,
-    13508,
-    91567,
-    69325,
-    153423,
-    106630,
-    134620,
-    117086,
-    125493,
-    105970,
-    99511,
-    127484,
-    164695,
-    58454,
-    60994,
-    175245,
-    140501,
-    133865,
-    34180,
-    5756,
-    5096,
-    101361,
-    75089,
-    176073,
-    179820,
-    86637,
-    111747,
-    48427,
-    169833,
-    67140,
-    3945,
-    100684,
-    116500,
-    166955,
-    7367,
-    26191,
-    89634,
-    179817,
-    176723,
-    160575,
-    151680,
-    37376,
-    125523,
-    136532,
-    146938,
-    148744,
-    76315,
-    85542,
-    172804,
-    32127,
-    7631,
-    154849,
-    120757,
-    149641,
-    95816,
-    139197,
-    92931,
-    90307,
-    92127,
-    44266,
-    92481,
-    174977,
-    66198,
-    122753,
-    167346,
-    121155,
-    107007,
-    34382,
-    121799,
-    79520,
-    146957,
-    121525,
-    81252,
-    46916,
-    89322,
-    127480,
-    166774,
-    567,
-    122481,
-    45361,
-    98649,
-    57647,
-    100600,
-    153294,
-    165694,
-    84942,
-    39160,
-    131791,
-    162813,
-    157930,
-    177174,
-    162504,
-    54295,
-    13666,
-    139219,
-    54761,
-    123422,
-    53725,
-    158250,
-    50645,
-    106768,
-    23544,
-    24738,
-    4795,
-    150296,
-    66183,
-    93336,
-    88099,
-    34243,
-    114270,
-    109347,
-    85303,
-    4480,
-    132010,
-    177576,
-    125986,
-    107453,
-    46861,
-    9937,
-    48457,
-    165827,
-    3073,
-    163491,
-    175010,
-    43687,
-    58223,
-    16085,
-    172391,
-    54132,
-    109964,
-    123848,
-    173180,
-    46348,
-    9866,
-    20235,
-    130857,
-    52261,
-    43389,
-    4998,
-    120048,
-    165824,
-    12896,
-    111802,
-    16341,
-    162569,
-    175791,
-    154454,
-    159471,
-    175065,
-    2608,
-    148047,
-    1002,
-    155282,
-    143600,
-    125516,
-    65425,
-    47199,
-    112494,
-    149189,
-    95353,
-    145671,
-    154734,
-    136856,
-    57457,
-    1491,
-    46699,
-    61040,
-    115932,
-    36932,
-    67074,
-    118787,
-    177700,
-    176196,
-    40157,
-    87042,
-    20412,
-    68820,
-    78120,
-    103114,
-    17397,
-    102867,
-    113775,
-    69657,
-    112137,
-    47539,
-    114733,
-    97985,
-    35425,
-    28561,
-    59296,
-    14279,
-    153496,
-    173949,
-    85819,
-    147602,
-    66347,
-    145069,
-    81034,
-    116824,
-    138199,
-    47072,
-    149778,
-    9193,
-    97049,
-    165318,
-    81404,
-    2513,
-    6939,
-    54085,
-    58944,
-    125448,
-    64113,
-    140757,
-    155710,
-    138909,
-    20556,
-    104860,
-    101176,
-    177345,
-    35152,
-    39746,
-    65002,
-    56466,
-    112884,
-    154133,
-    2484,
-    29823,
-    111608,
-    81521,
-    31730,
-    122009,
-    4547,
-    69461,
-    73700,
-    69777,
-    140599,
-    34130,
-    172160,
-    18650,
-    137722,
-    103982,
-    3797,
-    12581,
-    116662,
-    3656,
-    48315,
-    49003,
-    69606,
-    59561,
-    51457,
-    107069,
-    58129,
-    152925,
-    76961,
-    101362,
-    2403,
-    171971,
-    15742,
-    112054,
-    30556,
-    149558,
-    1575,
-    160078,
-    16045,
-    26355,
-    59942,
-    83756,
-    161990,
-    54425,
-    67267,
-    103369,
-    69904,
-    176657,
-    70933,
-    167271,
-    3822,
-    92484,
-    107161,
-    130649,
-    75378,
-    60028,
-    178075,
-    144291,
-    112662,
-    158980,
-    125868,
-    37758,
-    174755,
-    75415,
-    56205,
-    30548,
-    68250,
-    86504,
-    147180,
-    41125,
-    129889,
-    142679,
-    25115,
-    174574,
-    13130,
-    127650,
-    24480,
-    16028,
-    130786,
-    81190,
-    135519,
-    11134,
-    77577,
-    12041,
-    151728,
-    95458,
-    132814,
-    130459,
-    103692,
-    43176,
-    63445,
-    136047,
-    37490,
-    44969,
-    77326,
-    174889,
-    155383,
-    46161,
-    41180,
-    170262,
-    20759,
-    103076,
-    29766,
-    146713,
-    55359,
-    17765,
-    31814,
-    30315,
-    76327,
-    54178,
-    55752,
-    153929,
-    41650,
-    66750,
-    161195,
-    164896,
-    74093,
-    76302,
-    76850,
-    18366,
-    165402,
-    170481,
-    130264,
-    97102,
-    42200,
-    54462,
-    24915,
-    74171,
-    141282,
-    23914,
-    136202,
-    19821,
-    64760,
-    131463,
-    160468,
-    124734,
-    119179,
-    50507,
-    134478,
-    41079,
-    124181,
-    15760,
-    123751,
-    108041,
-    55683,
-    151639,
-    4903,
-    108847,
-    104506,
-    96436,
-    80885,
-    168895,
-    81367,
-    37715,
-    67321,
-    76886,
-    77608,
-    122719,
-    116587,
-    139289,
-    128950,
-    69868,
-    125599,
-    137652,
-    158508,
-    9131,
-    138245,
-    113217,
-    34953,
-    79566,
-    23146,
-    45770,
-    51147,
-    66105,
-    108236,
-    76915,
-    105354,
-    130149,
-    47138,
-    155577,
-    80906,
-    33362,
-    143647,
-    68884,
-    16200,
-    37234,
-    56082,
-    18820,
-    43113,
-    128601,
-    44743,
-    85179,
-    48226,
-    169531,
-    5266,
-    67777,
-    164678,
-    171370,
-    94367,
-    77708,
-    40047,
-    136437,
-    46601,
-    175274,
-    102411,
-    35965,
-    92822,
-    157324,
-    92483,
-    134727,
-    142149,
-    2758,
-    93208,
-    179095,
-    28132,
-    107811,
-    119845,
-    81071,
-    104684,
-    108116,
-    137217,
-    141243,
-    76306,
-    79378,
-    6054,
-    96157,
-    115971,
-    62350,
-    121318,
-    61433,
-    106807,
-    179785,
-    105324,
-    173459,
-    110110,
-    144643,
-    167621,
-    70315,
-    129527,
-    27286,
-    7298,
-    75778,
-    147984,
-    43926,
-    176973,
-    131155,
-    118952,
-    179569,
-    137524,
-    85354,
-    176292,
-    127614,
-    175874,
-    137310,
-    155771,
-    26869,
-    110327,
-    1375,
-    64715,
-    54894,
-    85822,
-    31723,
-    165948,
-    115244,
-    110953,
-    40208,
-    65337,
-    15669,
-    143610,
-    6455,
-    129387,
-    158394,
-    110682,
-    153714,
-    27264,
-    25840,
-    89545,
-    53516,
-    118464,
-    131674,
-    119562,
-    28928,
-    52961,
-    138234,
-    154858,
-    36572,
-    53016,
-    499,
-    88792,
-    13098,
-    17049,
-    45700,
-    29286,
-    170813,
-    14882,
-    166785,
-    1510,
-    95544,
-    5049,
-    61123,
-    120417,
-    130280,
-    152200,
-    71335,
-    8442,
-    76601,
-    143584,
-    51607,
-    166179,
-    91604,
-    21674,
-    33535,
-    71917,
-    20697,
-    79660,
-    160541,
-    16210,
-    91439,
-    80516,
-    135005,
-    2679,
-    48905,
-    491,
-    153369,
-    101399,
-    82493,
-    83706,
-    6979,
-    32180,
-    43920,
-    124399,
-    59714,
-    58885,
-    103406,
-    40939,
-    20395,
-    65543,
-    67795,
-    33723,
-    168950,
-    39575,
-    144890,
-    85304,
-    96756,
-    112520,
-    178536,
-    14631,
-    139538,
-    44680,
-    156981,
-    137716,
-    29857,
-    116428,
-    16917,
-    75574,
-    82356,
-    156638,
-    79350,
-    93951,
-    173898,
-    13600,
-    99653,
-    130984,
-    62604,
-    116920,
-    129517,
-    3304,
-    44696,
-    92756,
-    3365,
-    110011,
-    36621,
-    11954,
-    179861,
-    167574,
-    99408,
-    48060,
-    147652,
-    2591,
-    154990,
-    52417,
-    74115,
-    72268,
-    93456,
-    177849,
-    172954,
-    110347,
-    66055,
-    22610,
-    19026,
-    146921,
-    87529,
-    75083,
-    59058,
-    4714,
-    2268,
-    50043,
-    66719,
-    178527,
-    68013,
-    172340,
-    152298,
-    141412,
-    57138,
-    171733,
-    65117,
-    9969,
-    94976,
-    151851,
-    130335,
-    99300,
-    118575,
-    86721,
-    67376,
-    178711,
-    139960,
-    86587,
-    21286,
-    70922,
-    154505,
-    106717,
-    148474,
-    169638,
-    13542,
-    134720,
-    96198,
-    48655,
-    84370,
-    30950,
-    166272,
-    178370,
-    95553,
-    23351,
-    49933,
-    49685,
-    142154,
-    48540,
-    154031,
-    22731,
-    2141,
-    86915,
-    109593,
-    157414,
-    48592,
-    21697,
-    24889,
-    150857,
-    132882,
-    134420,
-    29890,
-    39004,
-    97134,
-    158148,
-    66787,
-    91632,
-    164831,
-    93913,
-    101874,
-    143335,
-    22848,
-    25591,
-    97485,
-    157049,
-    104772,
-    130100,
-    31550,
-    144324,
-    112896,
-    16930,
-    153362,
-    147782,
-    128895,
-    74985,
-    146249,
-    35157,
-    29900,
-    163194,
-    22057,
-    50162,
-    74037,
-    152389,
-    117980,
-    23817,
-    153220,
-    81591,
-    87252,
-    155329,
-    62463,
-    145095,
-    165393,
-    120271,
-    81134,
-    83154,
-    19393,
-    35175,
-    68560,
-    93124,
-    102429,
-    87076,
-    68999,
-    111575,
-    57806,
-    146414,
-    172827,
-    143322,
-    29057,
-    39556,
-    11673,
-    8093,
-    81243,
-    121032,
-    55660,
-    36962,
-    14336,
-    40245,
-    55987,
-    124665,
-    100676,
-    136637,
-    168397,
-    159209,
-    172329,
-    133096,
-    74282,
-    145393,
-    126737,
-    80455,
-    25715,
-    130298,
-    11401,
-    93037,
-    150282,
-    73563,
-    84554,
-    2448,
-    2392,
-    113088,
-    108184,
-    95777,
-    86628,
-    10306,
-    67788,
-    68875,
-    97456,
-    104187,
-    102286,
-    2130,
-    122786,
-    76542,
-    136642,
-    165759,
-    58667,
-    124419,
-    165034,
-    152607,
-    1027,
-    108542,
-    46452,
-    12074,
-    144691,
-    12294,
-    106259,
-    41569,
-    83057,
-    164349,
-    88451,
-    173314,
-    146909,
-    71932,
-    174246,
-    83379,
-    92992,
-    12723,
-    98717,
-    126034,
-    96506,
-    74278,
-    158711,
-    55638,
-    84725,
-    14406,
-    140974,
-    148835,
-    43136,
-    157114,
-    178096,
-    15526,
-    15866,
-    146492,
-    138952,
-    61108,
-    98244,
-    40393,
-    25582,
-    133765,
-    167195,
-    36305,
-    138767,
-    146529,
-    144998,
-    3472,
-    169207,
-    5803,
-    17009,
-    22395,
-    30677,
-    165423,
-    2841,
-    136895,
-    32587,
-    90112,
-    106858,
-    54558,
-    116103,
-    146218,
-    39400,
-    47814,
-    170845,
-    91358,
-    68238,
-    172473,
-    144782,
-    174788,
-    88213,
-    120981,
-    139017,
-    72105,
-    159130,
-    79408,
-    39814,
-    106544,
-    133022,
-    106982,
-    163467,
-    157332,
-    104037,
-    115207,
-    66220,
-    45745,
-    77324,
-    151246,
-    20206,
-    23734,
-    116318,
-    34,
-    139448,
-    11630,
-    73488,
-    169805,
-    35303,
-    30780,
-    78260,
-    150572,
-    60861,
-    110394,
-    91191,
-    79540,
-    114966,
-    133839,
-    137373,
-    6821,
-    96535,
-    154098,
-    129982,
-    2449,
-    52630,
-    112639,
-    8008,
-    130020,
-    168820,
-    172321,
-    150642,
-    121041,
-    171186,
-    170140,
-    68913,
-    160802,
-    162676,
-    170812,
-    16047,
-    117669,
-    25220,
-    159868,
-    152840,
-    39921,
-    138961,
-    176169,
-    24516,
-    37885,
-    148064,
-    68652,
-    126749,
-    75259,
-    11052,
-    1423,
-    89072,
-    41836,
-    89212,
-    109641,
-    125767,
-    39822,
-    142040,
-    89420,
-    176035,
-    25799,
-    60923,
-    98909,
-    12577,
-    41802,
-    51133,
-    14391,
-    94059,
-    80629,
-    74253,
-    76267,
-    31133,
-    117039,
-    55969,
-    110354,
-    156423,
-    34866,
-    135418,
-    96222,
-    41360,
-    349,
-    174986,
-    92395,
-    75788,
-    99467,
-    111521,
-    35557,
-    156859,
-    149319,
-    143441,
-    162465,
-    9325,
-    17222,
-    80160,
-    65120,
-    83628,
-    43694,
-    158243,
-    58363,
-    75441,
-    119573,
-    141206,
-    150769,
-    369,
-    114784,
-    82251,
-    69818,
-    134008,
-    99506,
-    160252,
-    122948,
-    159524,
-    140519,
-    12339,
-    107981,
-    114861,
-    31393,
-    172676,
-    17649,
-    98129,
-    98666,
-    62247,
-    157243,
-    70088,
-    172893,
-    134238,
-    73605,
-    78611,
-    105232,
-    152409,
-    155755,
-    14055,
-    173514,
-    58306,
-    124992,
-    95136,
-    71418,
-    32447,
-    151000,
-    39576,
-    44030,
-    56895,
-    74739,
-    82125,
-    25380,
-    92310,
-    152603,
-    138583,
-    82237,
-    59146,
-    122485,
-    50481,
-    64188,
-    125976,
-    153610,
-    62084,
-    103014,
-    136941,
-    64138,
-    24595,
-    125979,
-    142494,
-    71363,
-    125248,
-    13821,
-    75654,
-    147866,
-    45966,
-    166019,
-    151350,
-    123773,
-    45397,
-    132478,
-    8031,
-    16030,
-    94085,
-    105088,
-    88282,
-    148176,
-    125909,
-    6176,
-    157692,
-    20801,
-    79425,
-    117402,
-    56452,
-    176411,
-    79073,
-    90734,
-    23579,
-    140043,
-    120734,
-    112085,
-    135439,
-    38277,
-    34246,
-    6760,
-    176809,
-    28153,
-    115583,
-    361,
-    79796,
-    122525,
-    44322,
-    26383,
-    109061,
-    97200,
-    30828,
-    46205,
-    147081,
-    176686,
-    170506,
-    93701,
-    60083,
-    152140,
-    128837,
-    71084,
-    99094,
-    163978,
-    59872,
-    157304,
-    113895,
-    136061,
-    130109,
-    88239,
-    112078,
-    111696,
-    173138,
-    74680,
-    147415,
-    14960,
-    144314,
-    24271,
-    42781,
-    97535,
-    179901,
-    134069,
-    47974,
-    17519,
-    16006,
-    78178,
-    162268,
-    99356,
-    77593,
-    168834,
-    32513,
-    21356,
-    130079,
-    138920,
-    152329,
-    26304,
-    158106,
-    41342,
-    162682,
-    147275,
-    84208,
-    132187,
-    165381,
-    151816,
-    127493,
-    121174,
-    70026,
-    143911,
-    52228,
-    113708,
-    115530,
-    56322,
-    167506,
-    116419,
-    174438,
-    47449,
-    173161,
-    65559,
-    54521,
-    131194,
-    75039,
-    45837,
-    42542,
-    134571,
-    101640,
-    41551,
-    146422,
-    140754,
-    151259,
-    18549,
-    92957,
-    54951,
-    26331,
-    8931,
-    152913,
-    74802,
-    79881,
-    135039,
-    74932,
-    145651,
-    133912,
-    53395,
-    50649,
-    43718,
-    9801,
-    88691,
-    31022,
-    88007,
-    174123,
-    5153,
-    94374,
-    145888,
-    156793,
-    162809,
-    55452,
-    120695,
-    88323,
-    68133,
-    160931,
-    78981,
-    26006,
-    83347,
-    99553,
-    159583,
-    36485,
-    133238,
-    152086,
-    98852,
-    128144,
-    52039,
-    46331,
-    46215,
-    105056,
-    118538,
-    29474,
-    158609,
-    51554,
-    59213,
-    9197,
-    57261,
-    48097,
-    33752,
-    46130,
-    18428,
-    130703,
-    35134,
-    7297,
-    45317,
-    86528,
-    126433,
-    40678,
-    133749,
-    110437,
-    154193,
-    32257,
-    5860,
-    53414,
-    5180,
-    79115,
-    13677,
-    102393,
-    42003,
-    48611,
-    149150,
-    155816,
-    93849,
-    43705,
-    18084,
-    31287,
-    88110,
-    163630,
-    139687,
-    17240,
-    109990,
-    42789,
-    45956,
-    119856,
-    94433,
-    157704,
-    150257,
-    131464,
-    59626,
-    25768,
-    175666,
-    1480,
-    70769,
-    139844,
-    114464,
-    37270,
-    127284,
-    74979,
-    73594,
-    4107,
-    92660,
-    43597,
-    53934,
-    153414,
-    130940,
-    71577,
-    153121,
-    94128,
-    55392,
-    39438,
-    6059,
-    115536,
-    93682,
-    125283,
-    51193,
-    129341,
-    150763,
-    62282,
-    106771,
-    110484,
-    42121,
-    89556,
-    139605,
-    61655,
-    1721,
-    113261,
-    171347,
-    74570,
-    2617,
-    79998,
-    148764,
-    85400,
-    151778,
-    86291,
-    12995,
-    92433,
-    23346,
-    148061,
-    168037,
-    31838,
-    40792,
-    27994,
-    146594,
-    159139,
-    96531,
-    160217,
-    136275,
-    100383,
-    25737,
-    146783,
-    133635,
-    69761,
-    178688,
-    23733,
-    103782,
-    112368,
-    96545,
-    143782,
-    120226,
-    35731,
-    150831,
-    10305,
-    64601,
-    647,
-    146016,
-    39114,
-    58879,
-    45734,
-    130896,
-    54019,
-    37183,
-    98846,
-    87223,
-    121515,
-    134764,
-    59069,
-    20072,
-    149136,
-    177707,
-    151431,
-    126282,
-    47120,
-    17301,
-    44872,
-    106725,
-    48685,
-    67556,
-    43554,
-    100790,
-    126340,
-    110288,
-    41114,
-    154459,
-    59088,
-    76160,
-    71481,
-    99669,
-    59931,
-    155936,
-    176713,
-    116542,
-    54300,
-    72819,
-    1879,
-    111326,
-    116714,
-    150681,
-    20546,
-    122391,
-    171564,
-    35154,
-    134580,
-    27857,
-    120072,
-    88152,
-    98492,
-    150586,
-    152888,
-    28550,
-    108582,
-    74247,
-    121495,
-    1768,
-    55095,
-    27244,
-    43827,
-    69946,
-    59747,
-    50504,
-    114486,
-    170349,
-    147063,
-    108137,
-    117460,
-    77144,
-    105374,
-    140832,
-    31708,
-    95480,
-    108795,
-    172142,
-    26623,
-    85592,
-    14370,
-    98678,
-    147332,
-    170224,
-    89088,
-    155534,
-    160930,
-    169421,
-    28350,
-    177070,
-    154188,
-    85562,
-    128605,
-    161424,
-    72748,
-    164876,
-    104563,
-    22001,
-    104681,
-    179592,
-    164117,
-    161882,
-    111226,
-    75262,
-    170999,
-    73569,
-    34241,
-    75796,
-    150340,
-    127551,
-    88113,
-    9288,
-    32386,
-    11489,
-    49840,
-    6091,
-    47702,
-    115000,
-    137902,
-    56095,
-    110321,
-    18364,
-    158959,
-    152894,
-    172315,
-    49049,
-    169508,
-    117313,
-    80862,
-    149455,
-    162365,
-    81359,
-    33503,
-    45115,
-    32910,
-    15663,
-    149739,
-    3198,
-    94121,
-    169995,
-    129337,
-    5714,
-    153826,
-    108334,
-    37345,
-    153265,
-    178051,
-    94318,
-    6197,
-    167405,
-    48574,
-    7255,
-    9187,
-    154792,
-    166002,
-    98363,
-    20386,
-    37635,
-    107585,
-    133097,
-    24550,
-    31620,
-    128120,
-    10120,
-    166641,
-    62090,
-    128475,
-    152449,
-    548,
-    161332,
-    9987,
-    132097,
-    46005,
-    77915,
-    28079,
-    28196,
-    65046,
-    155150,
-    3142,
-    147588,
-    98024,
-    28802,
-    157323,
-    160240,
-    53167,
-    101079,
-    63546,
-    56952,
-    118536,
-    72980,
-    66751,
-    46253,
-    134773,
-    100273,
-    154587,
-    27236,
-    147601,
-    30495,
-    179177,
-    73983,
-    2755,
-    7832,
-    98397,
-    158877,
-    103206,
-    29619,
-    17548,
-    44017,
-    21295,
-    99824,
-    142746,
-    133724,
-    164969,
-    147132,
-    159591,
-    36458,
-    44581,
-    62911,
-    144729,
-    78821,
-    25001,
-    32785,
-    197,
-    109251,
-    34406,
-    132875,
-    154650,
-    65209,
-    149094,
-    71546,
-    18381,
-    63919,
-    117377,
-    80444,
-    22252,
-    38497,
-    176541,
-    59194,
-    29745,
-    33207,
-    41117,
-    17109,
-    22961,
-    98394,
-    148151,
-    106913,
-    35375,
-    65320,
-    153751,
-    124002,
-    17308,
-    125164,
-    116769,
-    170647,
-    8528,
-    99598,
-    121095,
-    115681,
-    54440,
-    81800,
-    31684,
-    31183,
-    81030,
-    137205,
-    153483,
-    26941,
-    144592,
-    99670,
-    132421,
-    17803,
-    126589,
-    149887,
-    34625,
-    24101,
-    70932,
-    13564,
-    169669,
-    80617,
-    173372,
-    24506,
-    90764,
-    157018,
-    139575,
-    12619,
-    4523,
-    98055,
-    77448,
-    131359,
-    115262,
-    150066,
-    179176,
-    122680,
-    126387,
-    14035,
-    73094,
-    43540,
-    176905,
-    38679,
-    24481,
-    1045,
-    178676,
-    141935,
-    145629,
-    30356,
-    13028,
-    157411,
-    2964,
-    168684,
-    130625,
-    97082,
-    121511,
-    33953,
-    107759,
-    9755,
-    164047,
-    56340,
-    23121,
-    167657,
-    55992,
-    148135,
-    100955,
-    78526,
-    92237,
-    127076,
-    172430,
-    15113,
-    43091,
-    122168,
-    74832,
-    136339,
-    44954,
-    77561,
-    27804,
-    159078,
-    164304,
-    58278,
-    153270,
-    134664,
-    30139,
-    126412,
-    10365,
-    156130,
-    108999,
-    28502,
-    83823,
-    3676,
-    32957,
-    94349,
-    52395,
-    139862,
-    34757,
-    99980,
-    158133,
-    8563,
-    31372,
-    40349,
-    137810,
-    177836,
-    43895,
-    16345,
-    49687,
-    149796,
-    178380,
-    112601,
-    81510,
-    89275,
-    131134,
-    174599,
-    109432,
-    132116,
-    177081,
-    14776,
-    167877,
-    27458,
-    68981,
-    78744,
-    104510,
-    171074,
-    80050,
-    122731,
-    64602,
-    171298,
-    116133,
-    83068,
-    24251,
-    101672,
-    158894,
-    44410,
-    80654,
-    90032,
-    164308,
-    105949,
-    72182,
-    136820,
-    51487,
-    102533,
-    18791,
-    17088,
-    67318,
-    11935,
-    123127,
-    89923,
-    27536,
-    74005,
-    163424,
-    129952,
-    964,
-    113237,
-    90486,
-    158083,
-    81564,
-    115607,
-    128915,
-    17856,
-    11668,
-    76836,
-    45443,
-    141577,
-    137514,
-    17712,
-    36550,
-    156819,
-    3254,
-    40114,
-    160764,
-    62220,
-    161257,
-    134603,
-    176810,
-    15119,
-    62269,
-    95476,
-    69317,
-    115383,
-    53190,
-    10475,
-    72648,
-    9108,
-    73044,
-    23132,
-    56827,
-    119862,
-    156437,
-    25116,
-    92039,
-    3354,
-    58189,
-    172418,
-    96619,
-    87522,
-    125013,
-    15558,
-    1958,
-    84385,
-    118503,
-    153228,
-    85552,
-    151767,
-    53773,
-    143292,
-    143073,
-    19351,
-    122069,
-    14369,
-    65833,
-    1648,
-    153906,
-    103290,
-    38522,
-    25366,
-    67859,
-    61209,
-    91905,
-    134163,
-    143903,
-    175607,
-    148657,
-    72491,
-    164622,
-    100696,
-    91463,
-    120043,
-    33987,
-    80850,
-    71244,
-    153381,
-    39608,
-    96509,
-    136484,
-    26480,
-    144625,
-    104295,
-    176639,
-    44559,
-    86963,
-    16441,
-    1842,
-    146570,
-    127681,
-    177676,
-    94254,
-    42596,
-    107129,
-    151011,
-    153097,
-    46173,
-    102575,
-    149694,
-    48191,
-    117149,
-    51456,
-    46321,
-    73954,
-    139612,
-    171462,
-    130927,
-    121241,
-    6409,
-    128433,
-    9680,
-    102084,
-    165085,
-    97683,
-    100077,
-    179695,
-    85234,
-    36909,
-    29238,
-    71465,
-    46801,
-    52851,
-    130044,
-    62447,
-    165308,
-    114489,
-    163496,
-    47710,
-    161978,
-    160769,
-    114603,
-    172350,
-    72476,
-    9555,
-    118221,
-    174154,
-    36556,
-    53690,
-    175712,
-    113969,
-    54141,
-    2540,
-    29807,
-    33137,
-    49770,
-    48350,
-    90885,
-    4151,
-    154787,
-    43960,
-    8751,
-    145297,
-    103540,
-    108927,
-    40576,
-    19727,
-    79065,
-    147069,
-    24901,
-    32626,
-    65347,
-    152163,
-    22134,
-    26394,
-    130158,
-    106030,
-    75436,
-    135058,
-    97171,
-    140142,
-    44753,
-    153766,
-    70186,
-    28366,
-    174134,
-    126752,
-    132469,
-    112455,
-    134339,
-    130521,
-    92316,
-    923,
-    57321,
-    95401,
-    104172,
-    175438,
-    13592,
-    87124,
-    18542,
-    130871,
-    46786,
-    152090,
-    64707,
-    151206,
-    64313,
-    4082,
-    28275,
-    112730,
-    109356,
-    144796,
-    98224,
-    153468,
-    165559,
-    10898,
-    84460,
-    127643,
-    88559,
-    90834,
-    113587,
-    9161,
-    18057,
-    151037,
-    99823,
-    38358,
-    61461,
-    148126,
-    85274,
-    116535,
-    56256,
-    141380,
-    59788,
-    72206,
-    41217,
-    142992,
-    1837,
-    15597,
-    74703,
-    64988,
-    162388,
-    97438,
-    27630,
-    118978,
-    14964,
-    113003,
-    111275,
-    133747,
-    125408,
-    173974,
-    33766,
-    113162,
-    123044,
-    118522,
-    11828,
-    103159,
-    95041,
-    109798,
-    16897,
-    172023,
-    90695,
-    87988,
-    97607,
-    3807,
-    179992,
-    179236,
-    16298,
-    54594,
-    176784,
-    43312,
-    15304,
-    37910,
-    28003,
-    153596,
-    46117,
-    129740,
-    117637,
-    64212,
-    68873,
-    140190,
-    111483,
-    68865,
-    85661,
-    106407,
-    13456,
-    21418,
-    136041,
-    134619,
-    19034,
-    84620,
-    154264,
-    18106,
-    109629,
-    23787,
-    159376,
-    70299,
-    37378,
-    64155,
-    155690,
-    127252,
-    70752,
-    146227,
-    147559,
-    173677,
-    74556,
-    82523,
-    66654,
-    92368,
-    11067,
-    73487,
-    113046,
-    75488,
-    174559,
-    123658,
-    69379,
-    73470,
-    22480,
-    79799,
-    56483,
-    2717,
-    111740,
-    43581,
-    111456,
-    176722,
-    35793,
-    79481,
-    107929,
-    171730,
-    201,
-    9298,
-    3341,
-    156619,
-    11806,
-    132547,
-    127757,
-    59517,
-    71548,
-    143259,
-    92440,
-    34386,
-    53417,
-    7198,
-    157837,
-    29413,
-    78480,
-    47784,
-    125867,
-    54473,
-    66153,
-    116159,
-    33838,
-    88871,
-    119716,
-    107193,
-    105930,
-    22130,
-    178398,
-    179678,
-    1040,
-    143924,
-    79822,
-    151938,
-    26644,
-    75915,
-    13844,
-    59444,
-    167953,
-    60617,
-    55995,
-    166640,
-    17960,
-    24712,
-    95214,
-    58226,
-    139845,
-    73534,
-    32092,
-    35403,
-    114201,
-    129964,
-    85196,
-    108511,
-    16180,
-    89926,
-    31134,
-    175384,
-    173822,
-    75845,
-    5324,
-    172806,
-    120778,
-    48884,
-    3237,
-    89901,
-    12787,
-    112329,
-    121800,
-    97933,
-    119991,
-    8236,
-    158748,
-    161028,
-    112048,
-    162342,
-    139856,
-    173385,
-    86906,
-    149131,
-    138657,
-    66187,
-    6096,
-    4088,
-    24210,
-    73126,
-    37152,
-    175958,
-    59913,
-    56069,
-    14682,
-    64468,
-    10700,
-    157062,
-    89323,
-    52694,
-    18104,
-    137953,
-    90157,
-    162310,
-    103478,
-    164190,
-    8474,
-    129407,
-    116372,
-    126612,
-    35354,
-    93757,
-    98640,
-    7584,
-    84019,
-    107538,
-    134959,
-    106113,
-    54201,
-    20326,
-    70635,
-    63555,
-    38421,
-    72292,
-    5396,
-    125118,
-    21572,
-    53720,
-    134201,
-    60377,
-    81879,
-    128968,
-    13083,
-    145345,
-    1134,
-    7321,
-    107266,
-    62696,
-    150174,
-    40811,
-    23485,
-    66744,
-    30818,
-    68695,
-    79022,
-    133586,
-    128887,
-    5832,
-    67327,
-    166646,
-    109788,
-    115761,
-    132896,
-    71169,
-    154762,
-    122212,
-    174199,
-    110493,
-    2987,
-    146581,
-    81538,
-    18742,
-    136273,
-    148950,
-    166886,
-    2184,
-    179244,
-    81904,
-    26495,
-    20496,
-    44831,
-    10413,
-    104321,
-    167653,
-    68490,
-    46354,
-    111507,
-    151810,
-    96769,
-    109957,
-    150341,
-    4613,
-    119508,
-    53667,
-    119864,
-    54687,
-    145268,
-    103372,
-    104168,
-    35093,
-    174604,
-    114271,
-    51008,
-    84808,
-    169967,
-    76336,
-    56554,
-    114724,
-    32324,
-    77388,
-    174347,
-    145413,
-    118610,
-    150100,
-    146006,
-    106857,
-    135466,
-    127110,
-    172732,
-    160727,
-    177824,
-    39359,
-    127726,
-    32523,
-    79851,
-    107076,
-    121830,
-    167508,
-    8479,
-    111980,
-    120559,
-    176263,
-    153734,
-    130449,
-    6996,
-    127243,
-    83523,
-    148487,
-    109301,
-    149705,
-    54387,
-    98833,
-    59621,
-    82360,
-    171365,
-    17599,
-    165677,
-    71759,
-    36856,
-    167734,
-    7969,
-    9490,
-    58211,
-    87442,
-    104502,
-    136926,
-    26728,
-    154863,
-    103085,
-    26846,
-    83549,
-    176270,
-    178891,
-    164412,
-    78089,
-    144152,
-    110495,
-    123497,
-    56274,
-    2002,
-    131187,
-    172759,
-    7438,
-    70683,
-    165220,
-    89487,
-    142365,
-    175267,
-    70177,
-    132023,
-    104655,
-    141770,
-    53999,
-    162635,
-    63714,
-    127022,
-    9848,
-    88551,
-    6799,
-    7327,
-    17443,
-    155543,
-    19290,
-    4865,
-    42173,
-    64966,
-    93187,
-    29636,
-    31506,
-    71278,
-    78398,
-    150513,
-    47032,
-    77283,
-    106681,
-    28203,
-    86789,
-    30919,
-    81702,
-    119276,
-    12156,
-    116328,
-    111020,
-    145229,
-    145847,
-    10245,
-    69655,
-    81908,
-    113667,
-    64235,
-    139265,
-    88751,
-    89748,
-    12075,
-    41213,
-    5851,
-    138770,
-    10808,
-    134696,
-    112737,
-    164649,
-    93535,
-    26748,
-    80873,
-    69336,
-    170828,
-    135104,
-    147070,
-    141250,
-    150996,
-    147335,
-    149183,
-    126483,
-    159166,
-    4345,
-    56893,
-    99799,
-    60828,
-    160364,
-    172083,
-    127349,
-    63166,
-    64149,
-    115343,
-    148623,
-    108431,
-    90614,
-    172480,
-    108198,
-    16190,
-    44546,
-    166809,
-    125273,
-    42602,
-    120012,
-    57510,
-    89269,
-    154271,
-    63398,
-    53908,
-    171822,
-    89773,
-    119928,
-    46731,
-    23583,
-    89658,
-    112772,
-    43133,
-    175341,
-    80133,
-    62243,
-    168505,
-    122006,
-    80320,
-    131375,
-    157673,
-    69439,
-    153635,
-    22988,
-    158952,
-    81574,
-    117,
-    98101,
-    160983,
-    174253,
-    3786,
-    168702,
-    136684,
-    70987,
-    139619,
-    10958,
-    160429,
-    123084,
-    68302,
-    37464,
-    123201,
-    153365,
-    80430,
-    94196,
-    8693,
-    80975,
-    88026,
-    28749,
-    112392,
-    52538,
-    86127,
-    169356,
-    55354,
-    51881,
-    89313,
-    91399,
-    171045,
-    33332,
-    63085,
-    101675,
-    168064,
-    77161,
-    8606,
-    52183,
-    75799,
-    53815,
-    26879,
-    143586,
-    47247,
-    49412,
-    53599,
-    122916,
-    73592,
-    145493,
-    121899,
-    177125,
-    28267,
-    13884,
-    113878,
-    39444,
-    179614,
-    166540,
-    165477,
-    97851,
-    9600,
-    37686,
-    150254,
-    89815,
-    84222,
-    56290,
-    150898,
-    112634,
-    13861,
-    122158,
-    111047,
-    15345,
-    48255,
-    170918,
-    144961,
-    131995,
-    84157,
-    174894,
-    98016,
-    165481,
-    46137,
-    41294,
-    71493,
-    125292,
-    31038,
-    15426,
-    58824,
-    85791,
-    98583,
-    68555,
-    159791,
-    143350,
-    21368,
-    123810,
-    4715,
-    57559,
-    65864,
-    166514,
-    135314,
-    153489,
-    143749,
-    91745,
-    23211,
-    106322,
-    88341,
-    162134,
-    71781,
-    107868,
-    98788,
-    57310,
-    128896,
-    119592,
-    105810,
-    143232,
-    84071,
-    129583,
-    74186,
-    132265,
-    21853,
-    155178,
-    116950,
-    101326,
-    136897,
-    62390,
-    105872,
-    59601,
-    78878,
-    60232,
-    158136,
-    141602,
-    82982,
-    78139,
-    46524,
-    1941,
-    52878,
-    97621,
-    144822,
-    86056,
-    58665,
-    179573,
-    140898,
-    40999,
-    98828,
-    101001,
-    77191,
-    120363,
-    30256,
-    96830,
-    124386,
-    168708,
-    81723,
-    56930,
-    100903,
-    168829,
-    118939,
-    28527,
-    9023,
-    32838,
-    47073,
-    4594,
-    162222,
-    105168,
-    81653,
-    104285,
-    18668,
-    72376,
-    72395,
-    84200,
-    47731,
-    93582,
-    52542,
-    162354,
-    169627,
-    144319,
-    179822,
-    73286,
-    152548,
-    97901,
-    45725,
-    127500,
-    28501,
-    118412,
-    66564,
-    59940,
-    75336,
-    63882,
-    117453,
-    2937,
-    32660,
-    120137,
-    83900,
-    176410,
-    53336,
-    149662,
-    85226,
-    28597,
-    11098,
-    28169,
-    15780,
-    104828,
-    113146,
-    125595,
-    148053,
-    88046,
-    142792,
-    4255,
-    72472,
-    149415,
-    142976,
-    93771,
-    76345,
-    176484,
-    32362,
-    132722,
-    94820,
-    128479,
-    161618,
-    69823,
-    126663,
-    111790,
-    22272,
-    74425,
-    70634,
-    5289,
-    86256,
-    90050,
-    167175,
-    111664,
-    176831,
-    119802,
-    163284,
-    123131,
-    144181,
-    94570,
-    88471,
-    116162,
-    39390,
-    153154,
-    166038,
-    128482,
-    60754,
-    28850,
-    106187,
-    107048,
-    14159,
-    163807,
-    59113,
-    177064,
-    153860,
-    98648,
-    16361,
-    146102,
-    96431,
-    122707,
-    126132,
-    11616,
-    82692,
-    93617,
-    31049,
-    355,
-    131230,
-    146987,
-    150308,
-    32003,
-    23041,
-    15236,
-    162673,
-    82908,
-    169183,
-    99100,
-    148604,
-    48954,
-    123605,
-    43065,
-    165507,
-    82875,
-    59679,
-    98028,
-    81027,
-    129098,
-    134134,
-    80147,
-    123399,
-    36714,
-    20764,
-    48704,
-    160580,
-    159824,
-    20613,
-    70673,
-    72311,
-    60090,
-    81447,
-    29071,
-    66248,
-    81005,
-    113861,
-    128072,
-    146697,
-    33115,
-    111209,
-    147572,
-    52209,
-    147305,
-    46564,
-    19808,
-    5731,
-    61304,
-    91055,
-    67486,
-    86981,
-    7538,
-    95931,
-    102042,
-    14371,
-    98762,
-    163917,
-    52640,
-    4175,
-    64891,
-    103514,
-    115204,
-    15239,
-    26802,
-    81090,
-    165087,
-    173826,
-    124380,
-    41963,
-    170901,
-    95509,
-    30713,
-    106932,
-    171421,
-    110762,
-    58447,
-    27811,
-    113185,
-    21454,
-    132802,
-    37639,
-    146931,
-    19581,
-    29360,
-    161318,
-    145993,
-    142160,
-    168593,
-    42569,
-    41799,
-    160113,
-    52932,
-    47127,
-    66938,
-    100669,
-    98920,
-    14701,
-    172573,
-    166031,
-    4845,
-    143843,
-    14209,
-    137677,
-    97474,
-    119260,
-    149565,
-    164987,
-    97861,
-    95482,
-    25915,
-    52849,
-    116221,
-    137060,
-    100891,
-    57678,
-    136295,
-    170397,
-    91672,
-    168699,
-    147888,
-    154568,
-    161383,
-    95991,
-    101094,
-    71290,
-    74346,
-    165452,
-    25967,
-    165255,
-    103624,
-    134790,
-    80797,
-    5955,
-    60166,
-    48973,
-    124940,
-    68504,
-    75334,
-    26426,
-    141748,
-    151232,
-    121942,
-    84748,
-    132288,
-    38696,
-    135792,
-    123375,
-    101405,
-    107714,
-    48103,
-    41974,
-    97287,
-    11194,
-    519,
-    173513,
-    11562,
-    51276,
-    70380,
-    71881,
-    95767,
-    102494,
-    44822,
-    178290,
-    132365,
-    153540,
-    13816,
-    22432,
-    101446,
-    17471,
-    26803,
-    27352,
-    92487,
-    179110,
-    21081,
-    115354,
-    1449,
-    33584,
-    141948,
-    178713,
-    32466,
-    171109,
-    151994,
-    3451,
-    129273,
-    9252,
-    177394,
-    14355,
-    48898,
-    144384,
-    92160,
-    125521,
-    91613,
-    119380,
-    108780,
-    6342,
-    81323,
-    133285,
-    129946,
-    106101,
-    163139,
-    134785,
-    91348,
-    41826,
-    36747,
-    89763,
-    43214,
-    143384,
-    169399,
-    121135,
-    179786,
-    74320,
-    109126,
-    153984,
-    177591,
-    106266,
-    52295,
-    113946,
-    34854,
-    11738,
-    17406,
-    94762,
-    143332,
-    113970,
-    3658,
-    498,
-    94281,
-    114536,
-    118845,
-    42244,
-    176820,
-    118748,
-    23392,
-    118828,
-    160248,
-    113699,
-    155427,
-    11328,
-    144971,
-    151787,
-    7932,
-    104838,
-    58752,
-    28105,
-    104978,
-    111418,
-    149431,
-    52778,
-    67588,
-    46463,
-    73674,
-    6906,
-    99892,
-    114446,
-    28319,
-    158732,
-    79635,
-    93529,
-    169261,
-    69081,
-    171376,
-    12700,
-    49882,
-    110640,
-    111502,
-    2498,
-    126973,
-    74562,
-    143341,
-    159454,
-    124636,
-    118987,
-    124874,
-    112929,
-    35614,
-    78035,
-    39936,
-    160971,
-    93488,
-    138484,
-    42635,
-    116809,
-    126485,
-    54878,
-    31956,
-    52589,
-    85369,
-    55628,
-    148624,
-    95963,
-    150746,
-    13259,
-    179656,
-    47518,
-    44821,
-    139035,
-    110891,
-    169989,
-    76140,
-    5106,
-    14404,
-    152824,
-    164871,
-    84686,
-    26724,
-    66305,
-    109794,
-    117470,
-    20623,
-    64266,
-    128556,
-    37793,
-    147720,
-    165020,
-    93432,
-    1059,
-    48738,
-    127777,
-    55741,
-    162674,
-    64158,
-    175659,
-    138992,
-    129414,
-    127908,
-    152933,
-    81799,
-    95307,
-    52178,
-    15127,
-    17281,
-    104469,
-    91018,
-    66077,
-    129314,
-    159499,
-    43683,
-    38982,
-    49121,
-    21790,
-    19897,
-    45455,
-    149668,
-    20126,
-    119929,
-    140383,
-    137274,
-    133127,
-    172729,
-    176151,
-    52917,
-    158202,
-    147374,
-    173511,
-    96052,
-    109362,
-    33720,
-    85326,
-    165306,
-    122354,
-    129780,
-    54695,
-    6232,
-    126719,
-    17938,
-    58925,
-    179872,
-    61159,
-    52210,
-    26332,
-    77459,
-    79194,
-    18471,
-    148909,
-    52134,
-    125000,
-    93579,
-    73660,
-    1057,
-    53771,
-    2207,
-    45524,
-    56323,
-    71989,
-    127244,
-    176239,
-    40783,
-    69938,
-    34665,
-    84001,
-    82519,
-    132402,
-    101972,
-    97205,
-    52469,
-    73831,
-    128828,
-    91438,
-    65688,
-    59852,
-    76304,
-    93672,
-    104595,
-    103367,
-    50477,
-    91431,
-    22586,
-    12855,
-    1684,
-    11558,
-    49939,
-    130666,
-    131941,
-    12732,
-    171234,
-    42353,
-    53588,
-    38980,
-    49911,
-    81074,
-    39463,
-    48346,
-    159488,
-    35396,
-    141915,
-    144472,
-    29991,
-    134523,
-    19257,
-    135578,
-    67619,
-    129218,
-    133869,
-    147675,
-    87588,
-    1248,
-    20467,
-    144627,
-    25625,
-    114332,
-    22186,
-    103769,
-    162179,
-    2264,
-    160155,
-    63912,
-    83475,
-    43263,
-    59936,
-    53465,
-    28844,
-    11092,
-    69242,
-    115646,
-    135012,
-    8333,
-    35846,
-    27911,
-    134864,
-    34910,
-    97267,
-    148553,
-    109303,
-    89207,
-    25253,
-    51856,
-    104318,
-    44473,
-    24037,
-    15045,
-    116487,
-    153307,
-    81624,
-    30251,
-    144078,
-    122242,
-    73446,
-    140032,
-    32500,
-    57270,
-    30502,
-    119545,
-    139517,
-    11883,
-    125430,
-    12328,
-    109284,
-    147037,
-    142590,
-    132486,
-    169601,
-    38335,
-    116022,
-    161272,
-    158260,
-    5223,
-    50746,
-    35477,
-    178091,
-    129806,
-    62868,
-    13557,
-    160157,
-    48768,
-    109631,
-    124,
-    45457,
-    36443,
-    123953,
-    27688,
-    141227,
-    43656,
-    109095,
-    66724,
-    21772,
-    101689,
-    156916,
-    50418,
-    172536,
-    143474,
-    33612,
-    73121,
-    177472,
-    172293,
-    140534,
-    27090,
-    129296,
-    89200,
-    74193,
-    58307,
-    138806,
-    19721,
-    121661,
-    113674,
-    138350,
-    153106,
-    10964,
-    929,
-    71444,
-    27530,
-    85810,
-    173471,
-    122940,
-    52805,
-    43038,
-    89625,
-    127112,
-    17538,
-    6000,
-    94294,
-    64647,
-    169434,
-    50318,
-    169689,
-    89557,
-    84740,
-    28066,
-    38420,
-    121963,
-    150292,
-    90905,
-    17499,
-    32301,
-    131588,
-    97998,
-    162499,
-    143288,
-    51735,
-    1800,
-    77220,
-    106542,
-    29972,
-    38715,
-    111621,
-    71665,
-    60085,
-    105224,
-    134061,
-    55853,
-    115916,
-    158315,
-    86954,
-    65828,
-    121606,
-    92571,
-    97241,
-    14793,
-    77719,
-    80355,
-    126938,
-    92870,
-    39168,
-    28639,
-    51040,
-    48745,
-    704,
-    113504,
-    23822,
-    1543,
-    153172,
-    17007,
-    55269,
-    134060,
-    134040,
-    12482,
-    101908,
-    29486,
-    12139,
-    103908,
-    37313,
-    156574,
-    11589,
-    35103,
-    159435,
-    59023,
-    95451,
-    143834,
-    98595,
-    37746,
-    76020,
-    118287,
-    585,
-    8627,
-    167766,
-    104575,
-    138617,
-    150994,
-    135127,
-    89687,
-    107201,
-    167642,
-    142556,
-    54770,
-    150268,
-    131739,
-    60876,
-    91590,
-    61828,
-    58178,
-    10378,
-    108921,
-    13951,
-    115656,
-    158347,
-    118261,
-    144325,
-    133176,
-    133509,
-    101148,
-    38139,
-    102235,
-    156004,
-    178929,
-    56278,
-    167380,
-    107616,
-    65797,
-    94693,
-    175043,
-    41756,
-    57870,
-    97988,
-    96294,
-    167812,
-    80284,
-    178303,
-    152016,
-    124951,
-    75126,
-    84782,
-    79845,
-    102588,
-    128223,
-    41389,
-    73452,
-    12554,
-    20894,
-    77182,
-    44716,
-    74614,
-    169686,
-    50348,
-    144432,
-    33261,
-    62920,
-    59224,
-    66725,
-    45958,
-    107825,
-    64788,
-    93673,
-    32932,
-    8978,
-    105243,
-    136102,
-    99758,
-    139540,
-    31380,
-    157600,
-    62826,
-    50638,
-    90952,
-    1277,
-    16062,
-    100032,
-    134960,
-    164422,
-    36860,
-    65951,
-    154681,
-    62498,
-    113392,
-    106237,
-    15829,
-    53604,
-    139136,
-    16707,
-    154076,
-    146516,
-    115085,
-    158424,
-    109803,
-    100482,
-    10799,
-    40243,
-    67429,
-    154679,
-    48307,
-    87405,
-    65235,
-    77424,
-    87661,
-    8569,
-    138685,
-    160414,
-    40741,
-    57189,
-    21808,
-    105033,
-    147642,
-    174717,
-    178226,
-    135760,
-    62009,
-    159309,
-    131525,
-    100224,
-    18175,
-    61996,
-    125299,
-    59786,
-    1199,
-    121781,
-    129561,
-    674,
-    150607,
-    25013,
-    9733,
-    79598,
-    80377,
-    122957,
-    139582,
-    118789,
-    155265,
-    41955,
-    32164,
-    70351,
-    43767,
-    11062,
-    123542,
-    37614,
-    118358,
-    50160,
-    70513,
-    28657,
-    131348,
-    31918,
-    47403,
-    116951,
-    137956,
-    127779,
-    117468,
-    91015,
-    6662,
-    44411,
-    101698,
-    158672,
-    88931,
-    83194,
-    61718,
-    84126,
-    79342,
-    167547,
-    172131,
-    26390,
-    130098,
-    166335,
-    77422,
-    77103,
-    23587,
-    90490,
-    114823,
-    169117,
-    15753,
-    21837,
-    31196,
-    36776,
-    133924,
-    116300,
-    82361,
-    8966,
-    53200,
-    177829,
-    90620,
-    8318,
-    13538,
-    119219,
-    87458,
-    104819,
-    170550,
-    64296,
-    40911,
-    164768,
-    178333,
-    129543,
-    89550,
-    88514,
-    152057,
-    130267,
-    129584,
-    178494,
-    6188,
-    116788,
-    175483,
-    158827,
-    146841,
-    59064,
-    164460,
-    29358,
-    106797,
-    82269,
-    137219,
-    25982,
-    67581,
-    109222,
-    7962,
-    127683,
-    168451,
-    153375,
-    30520,
-    116840,
-    172824,
-    28272,
-    131849,
-    113007,
-    142221,
-    74151,
-    178965,
-    162404,
-    129771,
-    39436,
-    51743,
-    19839,
-    31669,
-    92872,
-    23689,
-    86203,
-    37636,
-    3490,
-    10274,
-    34132,
-    128200,
-    70066,
-    24385,
-    42074,
-    82492,
-    18258,
-    42575,
-    62388,
-    96229,
-    58660,
-    163107,
-    14379,
-    73518,
-    42538,
-    65600,
-    26310,
-    144024,
-    172924,
-    24241,
-    124727,
-    77989,
-    44881,
-    8875,
-    44862,
-    128749,
-    109116,
-    101100,
-    77809,
-    71026,
-    104581,
-    41202,
-    167204,
-    8258,
-    38519,
-    128754,
-    53427,
-    76292,
-    44922,
-    98217,
-    22257,
-    113183,
-    89981,
-    43523,
-    98107,
-    28061,
-    161238,
-    158788,
-    53540,
-    57869,
-    104088,
-    6448,
-    634,
-    47587,
-    37247,
-    147067,
-    68996,
-    122651,
-    49828,
-    9709,
-    102453,
-    80923,
-    54750,
-    67036,
-    79358,
-    125166,
-    80929,
-    90295,
-    2271,
-    160269,
-    82229,
-    103301,
-    90950,
-    62877,
-    96321,
-    10795,
-    162861,
-    41783,
-    155648,
-    127960,
-    142648,
-    94987,
-    95863,
-    96069,
-    141284,
-    9284,
-    135289,
-    60927,
-    143311,
-    104096,
-    3578,
-    80086,
-    174313,
-    82736,
-    108309,
-    112957,
-    31903,
-    166740,
-    123061,
-    32939,
-    172822,
-    49023,
-    83246,
-    46852,
-    112759,
-    74911,
-    5625,
-    76075,
-    141989,
-    122704,
-    161165,
-    68817,
-    154632,
-    72357,
-    89863,
-    29656,
-    151377,
-    149325,
-    156179,
-    11791,
-    99419,
-    83435,
-    159355,
-    129545,
-    158766,
-    134686,
-    87058,
-    164591,
-    121571,
-    26524,
-    41660,
-    67404,
-    5556,
-    148280,
-    131388,
-    161451,
-    179880,
-    68592,
-    12817,
-    15610,
-    49743,
-    24258,
-    173626,
-    118773,
-    60537,
-    35858,
-    92768,
-    107075,
-    65290,
-    149914,
-    81339,
-    83411,
-    123394,
-    95147,
-    58183,
-    55345,
-    9410,
-    161942,
-    31108,
-    177922,
-    133450,
-    30275,
-    72895,
-    11375,
-    92879,
-    108740,
-    16306,
-    60440,
-    126558,
-    89126,
-    140708,
-    58346,
-    144717,
-    19915,
-    68822,
-    18486,
-    79585,
-    48195,
-    6528,
-    112609,
-    87006,
-    156612,
-    15212,
-    122741,
-    168292,
-    47509,
-    159278,
-    158016,
-    137963,
-    26554,
-    156173,
-    60208,
-    149053,
-    66422,
-    118873,
-    178128,
-    124354,
-    93957,
-    55275,
-    115214,
-    62334,
-    78717,
-    156935,
-    48180,
-    102670,
-    73372,
-    104170,
-    27913,
-    59755,
-    114542,
-    91332,
-    141073,
-    77135,
-    136888,
-    85527,
-    41134,
-    16282,
-    81366,
-    162290,
-    107442,
-    84601,
-    136384,
-    63637,
-    75617,
-    47345,
-    134402,
-    120698,
-    130183,
-    140945,
-    35451,
-    174263,
-    83584,
-    166497,
-    142925,
-    69887,
-    161794,
-    107353,
-    158247,
-    87918,
-    102853,
-    130186,
-    160520,
-    89741,
-    113563,
-    80417,
-    175068,
-    22311,
-    154645,
-    147634,
-    66911,
-    76431,
-    110171,
-    39741,
-    156315,
-    126504,
-    63219,
-    118988,
-    133844,
-    12531,
-    34749,
-    84471,
-    175982,
-    35418,
-    47151,
-    160747,
-    2167,
-    99302,
-    113737,
-    21782,
-    71506,
-    36645,
-    101330,
-    76247,
-    152920,
-    12621,
-    134575,
-    57743,
-    117530,
-    152804,
-    169144,
-    21915,
-    130862,
-    99778,
-    78280,
-    159438,
-    38806,
-    66910,
-    118875,
-    19526,
-    96793,
-    117599,
-    113821,
-    171719,
-    145564,
-    43004,
-    178007,
-    76710,
-    54298,
-    2767,
-    89584,
-    126849,
-    174048,
-    96634,
-    99255,
-    74770,
-    34455,
-    178204,
-    68961,
-    102711,
-    22929,
-    178472,
-    122758,
-    102686,
-    143925,
-    74330,
-    162492,
-    74642,
-    24476,
-    112306,
-    125436,
-    60764,
-    67793,
-    96337,
-    95037,
-    139607,
-    165354,
-    116233,
-    50146,
-    169018,
-    113375,
-    163006,
-    68899,
-    145998,
-    82199,
-    40465,
-    178753,
-    127565,
-    99678,
-    35273,
-    56135,
-    105059,
-    23621,
-    98922,
-    79265,
-    156347,
-    102234,
-    178402,
-    175722,
-    31686,
-    106820,
-    73100,
-    113478,
-    78736,
-    14151,
-    12562,
-    125923,
-    49931,
-    65060,
-    172148,
-    85272,
-    133992,
-    45756,
-    159324,
-    60605,
-    93322,
-    119474,
-    85978,
-    27444,
-    75548,
-    131412,
-    130527,
-    69485,
-    172514,
-    20048,
-    96655,
-    62666,
-    138010,
-    171251,
-    26856,
-    139321,
-    17411,
-    119672,
-    114563,
-    133683,
-    89453,
-    18511,
-    71729,
-    162997,
-    14117,
-    159394,
-    13247,
-    133128,
-    38393,
-    126458,
-    79545,
-    61522,
-    46034,
-    116086,
-    18562,
-    33700,
-    127857,
-    118161,
-    97458,
-    162863,
-    63819,
-    76988,
-    64722,
-    71684,
-    12533,
-    35021,
-    8279,
-    118935,
-    116489,
-    135557,
-    131678,
-    126237,
-    33910,
-    116402,
-    13210,
-    53388,
-    160495,
-    122151,
-    54114,
-    176665,
-    137820,
-    37509,
-    112093,
-    68593,
-    7195,
-    163410,
-    50031,
-    49618,
-    93259,
-    125805,
-    49781,
-    4946,
-    1645,
-    9882,
-    63114,
-    37484,
-    4654,
-    81051,
-    39836,
-    24382,
-    46712,
-    128636,
-    159720,
-    133978,
-    57977,
-    416,
-    105638,
-    73864,
-    174864,
-    94354,
-    35735,
-    81278,
-    164689,
-    93661,
-    110163,
-    20017,
-    98054,
-    106638,
-    57641,
-    158191,
-    35982,
-    88336,
-    125927,
-    78015,
-    14868,
-    18967,
-    88425,
-    139441,
-    127519,
-    178529,
-    60590,
-    54193,
-    3057,
-    147242,
-    144040,
-    78202,
-    28327,
-    47487,
-    65486,
-    68726,
-    47424,
-    140260,
-    3430,
-    179775,
-    145132,
-    73656,
-    151292,
-    173509,
-    29524,
-    26236,
-    112475,
-    121330,
-    78644,
-    92651,
-    56157,
-    50332,
-    95405,
-    121498,
-    148739,
-    15131,
-    76374,
-    18430,
-    144049,
-    45781,
-    107173,
-    25889,
-    43688,
-    70397,
-    58023,
-    77600,
-    103586,
-    101857,
-    163604,
-    72880,
-    11177,
-    142369,
-    17074,
-    42085,
-    24224,
-    84539,
-    77033,
-    113239,
-    22741,
-    104945,
-    83037,
-    82572,
-    105237,
-    44529,
-    70307,
-    66075,
-    57395,
-    124835,
-    44913,
-    119926,
-    8443,
-    101626,
-    115331,
-    123386,
-    58699,
-    43196,
-    78083,
-    54742,
-    27016,
-    14991,
-    81276,
-    179545,
-    137004,
-    73581,
-    136661,
-    74125,
-    102782,
-    42257,
-    32308,
-    49069,
-    78835,
-    147930,
-    60657,
-    164985,
-    130005,
-    174270,
-    81495,
-    147549,
-    172731,
-    31799,
-    79927,
-    167524,
-    76233,
-    39878,
-    166849,
-    31719,
-    74401,
-    138280,
-    6347,
-    173006,
-    128528,
-    71467,
-    45925,
-    26939,
-    16440,
-    169919,
-    90207,
-    10884,
-    128982,
-    77090,
-    58737,
-    61220,
-    2440,
-    108765,
-    171209,
-    167053,
-    115364,
-    124452,
-    118791,
-    170783,
-    78103,
-    2343,
-    116880,
-    53419,
-    8509,
-    67299,
-    155495,
-    118677,
-    40107,
-    174698,
-    48109,
-    50142,
-    115022,
-    93168,
-    25621,
-    25643,
-    139186,
-    102356,
-    115619,
-    107874,
-    80443,
-    117945,
-    129738,
-    133301,
-    113382,
-    75159,
-    176898,
-    73037,
-    60305,
-    34679,
-    62163,
-    176526,
-    140662,
-    86626,
-    137032,
-    165361,
-    2660,
-    74000,
-    170669,
-    105843,
-    2783,
-    166552,
-    123586,
-    85485,
-    73103,
-    25384,
-    126381,
-    21486,
-    30712,
-    166165,
-    167993,
-    8428,
-    165576,
-    112077,
-    95217,
-    12382,
-    108627,
-    19415,
-    138178,
-    14039,
-    34586,
-    6219,
-    96288,
-    160876,
-    85218,
-    121470,
-    157590,
-    133445,
-    16881,
-    31409,
-    114001,
-    126431,
-    116594,
-    53297,
-    2316,
-    141907,
-    73824,
-    39864,
-    13283,
-    140482,
-    3870,
-    175049,
-    5090,
-    106087,
-    128739,
-    157892,
-    5980,
-    27111,
-    104476,
-    88945,
-    155809,
-    14305,
-    152106,
-    32134,
-    62206,
-    23253,
-    161222,
-    83010,
-    29169,
-    146960,
-    67308,
-    109900,
-    105294,
-    169891,
-    166043,
-    78836,
-    97332,
-    42081,
-    132087,
-    128201,
-    138759,
-    154906,
-    88646,
-    35145,
-    128656,
-    8581,
-    64700,
-    120074,
-    146632,
-    103093,
-    63198,
-    94761,
-    89826,
-    25083,
-    103350,
-    108294,
-    136761,
-    92806,
-    31512,
-    108600,
-    140314,
-    143167,
-    63339,
-    94602,
-    171046,
-    4113,
-    68635,
-    54540,
-    106309,
-    75627,
-    175657,
-    166875,
-    109837,
-    22599,
-    151901,
-    146180,
-    144945,
-    101580,
-    24609,
-    20036,
-    21393,
-    13093,
-    21049,
-    22543,
-    45481,
-    65153,
-    156240,
-    1792,
-    30210,
-    55133,
-    100033,
-    4788,
-    118963,
-    115995,
-    143367,
-    59254,
-    166787,
-    86727,
-    114899,
-    78207,
-    46519,
-    64743,
-    9521,
-    117304,
-    45622,
-    60620,
-    140651,
-    153789,
-    66943,
-    157377,
-    44523,
-    97307,
-    175827,
-    47087,
-    113955,
-    82726,
-    103224,
-    104041,
-    104903,
-    141926,
-    10056,
-    107431,
-    74899,
-    113439,
-    31395,
-    94370,
-    69725,
-    62412,
-    137650,
-    63375,
-    120816,
-    45861,
-    127253,
-    127594,
-    38592,
-    147449,
-    113203,
-    79349,
-    144381,
-    32847,
-    78844,
-    70140,
-    42979,
-    123922,
-    66602,
-    86715,
-    64159,
-    169649,
-    30181,
-    173747,
-    80470,
-    170314,
-    27049,
-    109375,
-    91172,
-    90465,
-    23764,
-    80157,
-    52274,
-    66672,
-    133214,
-    62828,
-    168697,
-    135371,
-    10118,
-    178410,
-    168194,
-    41297,
-    70387,
-    1576,
-    77941,
-    130040,
-    22326,
-    55985,
-    120147,
-    24588,
-    72297,
-    13610,
-    35857,
-    147570,
-    12871,
-    52426,
-    44715,
-    12572,
-    27360,
-    154034,
-    13924,
-    148551,
-    70912,
-    163419,
-    169401,
-    47239,
-    113524,
-    128649,
-    60671,
-    26448,
-    114893,
-    55064,
-    157862,
-    174580,
-    65040,
-    128624,
-    118098,
-    66311,
-    6579,
-    156068,
-    28990,
-    35032,
-    12456,
-    90937,
-    163601,
-    148400,
-    160818,
-    37245,
-    146861,
-    155529,
-    29127,
-    949,
-    151492,
-    130688,
-    19428,
-    171124,
-    86701,
-    114574,
-    119826,
-    135194,
-    70596,
-    1346,
-    157427,
-    156154,
-    108719,
-    177563,
-    95100,
-    48074,
-    17195,
-    70319,
-    89304,
-    7718,
-    83505,
-    136411,
-    13359,
-    159316,
-    170771,
-    171089,
-    82709,
-    94928,
-    160415,
-    3207,
-    125201,
-    36269,
-    72071,
-    67919,
-    60353,
-    164239,
-    67522,
-    32434,
-    63603,
-    158843,
-    45127,
-    144930,
-    139241,
-    19145,
-    175144,
-    56703,
-    77216,
-    113158,
-    174553,
-    24629,
-    92939,
-    3406,
-    119332,
-    151097,
-    54265,
-    78866,
-    95517,
-    166009,
-    85138,
-    48684,
-    53898,
-    77157,
-    125329,
-    75228,
-    3173,
-    132367,
-    40661,
-    43814,
-    86712,
-    14607,
-    37108,
-    81517,
-    21769,
-    37362,
-    48364,
-    33179,
-    140053,
-    45093,
-    130276,
-    20899,
-    124653,
-    70416,
-    103461,
-    101031,
-    75827,
-    164702,
-    25287,
-    171949,
-    144187,
-    64217,
-    174795,
-    68409,
-    54385,
-    45829,
-    176827,
-    64270,
-    77896,
-    102394,
-    99686,
-    88681,
-    137151,
-    15544,
-    4313,
-    100310,
-    76812,
-    73774,
-    23164,
-    120260,
-    130605,
-    11554,
-    135251,
-    125704,
-    20682,
-    145153,
-    153039,
-    82201,
-    70103,
-    132769,
-    148179,
-    75350,
-    86621,
-    16218,
-    60541,
-    38434,
-    8368,
-    16353,
-    139965,
-    55089,
-    107367,
-    18015,
-    136769,
-    85106,
-    168045,
-    54602,
-    134500,
-    80080,
-    89002,
-    119187,
-    176392,
-    92645,
-    3050,
-    56924,
-    175619,
-    129105,
-    149977,
-    164165,
-    48816,
-    47160,
-    58644,
-    37538,
-    43830,
-    133735,
-    121396,
-    32950,
-    33570,
-    119249,
-    114711,
-    11687,
-    144085,
-    37920,
-    88243,
-    42205,
-    68647,
-    71619,
-    53727,
-    110247,
-    36891,
-    73570,
-    43611,
-    102450,
-    113339,
-    72645,
-    516,
-    119509,
-    118006,
-    155100,
-    174490,
-    122703,
-    113464,
-    35043,
-    172002,
-    3227,
-    148916,
-    138409,
-    89033,
-    60027,
-    130537,
-    159232,
-    167665,
-    171545,
-    59950,
-    95569,
-    46909,
-    24183,
-    120316,
-    158488,
-    30528,
-    98822,
-    34649,
-    41578,
-    52610,
-    91208,
-    57664,
-    142519,
-    183,
-    138666,
-    20979,
-    158511,
-    110565,
-    48169,
-    111313,
-    142400,
-    119787,
-    82608,
-    101848,
-    49289,
-    67351,
-    7384,
-    69207,
-    91393,
-    39479,
-    178224,
-    59067,
-    97899,
-    63967,
-    86286,
-    70865,
-    148156,
-    24374,
-    110689,
-    104662,
-    169507,
-    57197,
-    178140,
-    164069,
-    5538,
-    144851,
-    124549,
-    41301,
-    66085,
-    26406,
-    103997,
-    8134,
-    27917,
-    120985,
-    46572,
-    24400,
-    164431,
-    157576,
-    82342,
-    6113,
-    31091,
-    10901,
-    142297,
-    138185,
-    23467,
-    91375,
-    159783,
-    25459,
-    50576,
-    171293,
-    76428,
-    178428,
-    167606,
-    61178,
-    124133,
-    24788,
-    150755,
-    135396,
-    142825,
-    1414,
-    112813,
-    35522,
-    167867,
-    19293,
-    136414,
-    77927,
-    18755,
-    169702,
-    135828,
-    64558,
-    96994,
-    92078,
-    171810,
-    169588,
-    98512,
-    18717,
-    162160,
-    75408,
-    96459,
-    23274,
-    67042,
-    35621,
-    160484,
-    88722,
-    160059,
-    9833,
-    148578,
-    48356,
-    27896,
-    84125,
-    76938,
-    45623,
-    53491,
-    127283,
-    139094,
-    15723,
-    131799,
-    111987,
-    35997,
-    173658,
-    3357,
-    48710,
-    38774,
-    86081,
-    84831,
-    55469,
-    30097,
-    72471,
-    113811,
-    165346,
-    9159,
-    15380,
-    99491,
-    162115,
-    20689,
-    67375,
-    154569,
-    92542,
-    17810,
-    146907,
-    149678,
-    119228,
-    77956,
-    56580,
-    124741,
-    67103,
-    70985,
-    57034,
-    178959,
-    120821,
-    89089,
-    41404,
-    103925,
-    95233,
-    31064,
-    175761,
-    93861,
-    156914,
-    167772,
-    81354,
-    45905,
-    149699,
-    63489,
-    70636,
-    159792,
-    4147,
-    31,
-    48708,
-    13897,
-    10613,
-    3175,
-    169522,
-    21675,
-    131093,
-    6763,
-    107836,
-    79681,
-    45208,
-    158222,
-    105517,
-    58287,
-    34628,
-    123903,
-    95870,
-    119866,
-    40342,
-    49979,
-    170658,
-    175275,
-    71802,
-    14912,
-    172622,
-    89683,
-    26224,
-    33091,
-    86737,
-    156272,
-    36449,
-    102123,
-    51530,
-    20482,
-    36805,
-    127454,
-    48361,
-    18538,
-    8052,
-    23698,
-    147561,
-    55059,
-    60281,
-    171439,
-    85790,
-    95532,
-    105543,
-    158121,
-    44594,
-    18670,
-    46552,
-    174789,
-    160846,
-    11471,
-    124084,
-    30679,
-    142492,
-    150729,
-    127805,
-    150358,
-    175154,
-    140652,
-    151804,
-    169520,
-    132561,
-    43304,
-    32971,
-    8681,
-    98211,
-    72605,
-    71511,
-    121741,
-    22843,
-    34514,
-    4624,
-    151214,
-    68777,
-    45478,
-    52821,
-    165123,
-    178732,
-    112471,
-    124107,
-    105766,
-    7416,
-    84851,
-    70285,
-    145259,
-    67717,
-    8676,
-    148312,
-    17840,
-    95229,
-    177432,
-    171023,
-    7707,
-    105733,
-    49248,
-    158619,
-    115046,
-    91317,
-    77101,
-    124273,
-    100582,
-    49457,
-    141614,
-    51877,
-    14569,
-    104689,
-    206,
-    130075,
-    127608,
-    48744,
-    85309,
-    132467,
-    29244,
-    101931,
-    132756,
-    146614,
-    125892,
-    38558,
-    153123,
-    113573,
-    50791,
-    1054,
-    56883,
-    82461,
-    26896,
-    84077,
-    10302,
-    177271,
-    48141,
-    156917,
-    11514,
-    26018,
-    92780,
-    5457,
-    154948,
-    104376,
-    20231,
-    92800,
-    113592,
-    841,
-    113820,
-    121348,
-    165608,
-    179558,
-    31761,
-    55623,
-    50484,
-    84705,
-    69296,
-    4541,
-    73171,
-    60087,
-    129332,
-    141170,
-    129358,
-    174429,
-    174208,
-    134359,
-    134639,
-    101529,
-    53435,
-    142565,
-    109382,
-    48567,
-    134915,
-    35087,
-    145975,
-    31295,
-    174014,
-    2723,
-    171875,
-    131013,
-    126576,
-    133266,
-    140554,
-    1929,
-    77921,
-    104699,
-    85830,
-    102442,
-    147648,
-    11199,
-    12734,
-    103252,
-    85156,
-    155821,
-    100533,
-    124162,
-    3742,
-    43109,
-    36524,
-    33877,
-    136767,
-    63704,
-    122132,
-    45895,
-    19838,
-    26492,
-    1876,
-    10192,
-    55543,
-    97667,
-    464,
-    125428,
-    123119,
-    177016,
-    128693,
-    150683,
-    93114,
-    136778,
-    5069,
-    171279,
-    102401,
-    1406,
-    126639,
-    163940,
-    137498,
-    55707,
-    63691,
-    134593,
-    150389,
-    41193,
-    134424,
-    17436,
-    148477,
-    139398,
-    132863,
-    66785,
-    86629,
-    31355,
-    131243,
-    53438,
-    123722,
-    71174,
-    19516,
-    39902,
-    159526,
-    69786,
-    95997,
-    161168,
-    11145,
-    153845,
-    36211,
-    142115,
-    37522,
-    111240,
-    168331,
-    35871,
-    116512,
-    91989,
-    97396,
-    157335,
-    40737,
-    12765,
-    10140,
-    100716,
-    72214,
-    92365,
-    84496,
-    79383,
-    17170,
-    94683,
-    62360,
-    49007,
-    94343,
-    57415,
-    104942,
-    145858,
-    27469,
-    30386,
-    32327,
-    73573,
-    97279,
-    88837,
-    42559,
-    145826,
-    174716,
-    160872,
-    32623,
-    24581,
-    124519,
-    7508,
-    59832,
-    132843,
-    18849,
-    75268,
-    119725,
-    62738,
-    105458,
-    133443,
-    168276,
-    14211,
-    7251,
-    51296,
-    131212,
-    72625,
-    12000,
-    142498,
-    173143,
-    476,
-    73678,
-    121676,
-    88216,
-    35123,
-    61423,
-    65438,
-    60691,
-    48349,
-    89302,
-    33454,
-    109808,
-    86251,
-    136737,
-    69330,
-    16337,
-    4328,
-    120194,
-    104006,
-    91227,
-    71515,
-    147355,
-    159849,
-    63520,
-    169423,
-    52867,
-    3116,
-    47420,
-    97010,
-    21113,
-    30395,
-    88516,
-    49148,
-    47996,
-    33639,
-    11176,
-    36515,
-    88226,
-    164335,
-    52565,
-    81840,
-    66246,
-    130641,
-    54453,
-    114825,
-    25043,
-    10222,
-    179562,
-    4207,
-    134792,
-    74738,
-    159610,
-    152368,
-    80458,
-    49480,
-    54046,
-    148926,
-    177961,
-    54167,
-    90613,
-    17848,
-    111228,
-    154294,
-    147381,
-    20578,
-    45416,
-    10196,
-    150680,
-    80980,
-    154461,
-    169451,
-    46251,
-    165388,
-    29307,
-    21729,
-    52570,
-    37291,
-    162992,
-    113438,
-    172812,
-    67753,
-    152043,
-    8756,
-    96757,
-    114036,
-    135716,
-    96397,
-    80933,
-    9237,
-    115984,
-    171243,
-    52185,
-    12789,
-    124687,
-    156720,
-    104527,
-    35729,
-    30608,
-    74279,
-    147201,
-    72161,
-    2361,
-    101537,
-    163909,
-    157993,
-    105382,
-    22723,
-    47411,
-    104340,
-    98296,
-    152073,
-    161777,
-    110355,
-    156496,
-    117831,
-    105300,
-    37028,
-    49969,
-    125804,
-    103645,
-    147086,
-    74873,
-    43741,
-    169795,
-    93982,
-    161447,
-    60499,
-    141524,
-    6697,
-    151783,
-    144564,
-    30510,
-    123322,
-    128220,
-    33497,
-    138395,
-    126234,
-    29099,
-    31165,
-    88996,
-    156163,
-    169029,
-    80843,
-    11477,
-    78795,
-    53401,
-    158599,
-    177977,
-    175259,
-    59492,
-    40617,
-    26232,
-    121961,
-    112193,
-    36394,
-    90149,
-    71720,
-    143395,
-    172422,
-    98742,
-    88159,
-    99717,
-    24684,
-    164324,
-    122712,
-    15295,
-    102722,
-    136871,
-    109178,
-    42449,
-    77723,
-    87299,
-    95570,
-    142419,
-    145562,
-    167039,
-    38683,
-    165109,
-    99478,
-    65882,
-    32030,
-    38088,
-    112734,
-    138785,
-    132406,
-    130132,
-    79855,
-    158105,
-    56541,
-    151689,
-    174250,
-    67539,
-    73439,
-    112037,
-    70051,
-    134945,
-    62466,
-    71400,
-    90657,
-    176854,
-    58545,
-    76010,
-    179779,
-    58863,
-    17023,
-    60442,
-    147491,
-    16311,
-    161788,
-    179467,
-    67373,
-    116604,
-    53208,
-    112785,
-    104801,
-    74479,
-    167533,
-    33943,
-    124761,
-    37756,
-    103674,
-    163084,
-    166618,
-    98722,
-    59134,
-    31110,
-    139951,
-    58525,
-    171028,
-    53512,
-    9594,
-    107506,
-    105108,
-    28049,
-    130316,
-    31463,
-    87153,
-    15340,
-    77862,
-    166256,
-    179052,
-    119434,
-    21115,
-    138631,
-    98534,
-    99803,
-    88331,
-    136417,
-    113505,
-    53332,
-    151464,
-    30910,
-    71291,
-    10815,
-    73713,
-    162027,
-    98181,
-    17749,
-    105710,
-    109587,
-    128371,
-    161814,
-    55166,
-    151200,
-    2876,
-    178183,
-    28904,
-    89672,
-    35227,
-    11751,
-    148105,
-    64935,
-    127047,
-    116466,
-    61543,
-    116389,
-    12415,
-    72289,
-    27801,
-    70926,
-    145809,
-    167318,
-    7137,
-    154333,
-    144583,
-    42710,
-    173753,
-    55093,
-    300,
-    4155,
-    155230,
-    78991,
-    26511,
-    81980,
-    18389,
-    179227,
-    117510,
-    116420,
-    37266,
-    14503,
-    24280,
-    149897,
-    170825,
-    66891,
-    153671,
-    65459,
-    65957,
-    27484,
-    136549,
-    50320,
-    98508,
-    68997,
-    34339,
-    54871,
-    172250,
-    53295,
-    48504,
-    58603,
-    136401,
-    128049,
-    117340,
-    49154,
-    100978,
-    106479,
-    115992,
-    16520,
-    71521,
-    59160,
-    2060,
-    122869,
-    51383,
-    175226,
-    120845,
-    88374,
-    12633,
-    21168,
-    11895,
-    59277,
-    51264,
-    158445,
-    171331,
-    108318,
-    64675,
-    121355,
-    53697,
-    33810,
-    35422,
-    130594,
-    125026,
-    99399,
-    50853,
-    175035,
-    90476,
-    84101,
-    2085,
-    46450,
-    102470,
-    21592,
-    40370,
-    81381,
-    118930,
-    106867,
-    34436,
-    42031,
-    49164,
-    22605,
-    155297,
-    15215,
-    18846,
-    35753,
-    83520,
-    140479,
-    159443,
-    105131,
-    93192,
-    131726,
-    139590,
-    135807,
-    57472,
-    50442,
-    64912,
-    115866,
-    151732,
-    151907,
-    31235,
-    116798,
-    86401,
-    38896,
-    153864,
-    128507,
-    114524,
-    158589,
-    66402,
-    72318,
-    134880,
-    153846,
-    91766,
-    147362,
-    99792,
-    84143,
-    171854,
-    9194,
-    101593,
-    158953,
-    168718,
-    38543,
-    81713,
-    58769,
-    127428,
-    68064,
-    74850,
-    19681,
-    170795,
-    6075,
-    64242,
-    45780,
-    41439,
-    69652,
-    36114,
-    172712,
-    31259,
-    154017,
-    33476,
-    124054,
-    46399,
-    36821,
-    136410,
-    146566,
-    160895,
-    142668,
-    64554,
-    168054,
-    30162,
-    58971,
-    93927,
-    124630,
-    114129,
-    142486,
-    119323,
-    62299,
-    170943,
-    125618,
-    147328,
-    21413,
-    139439,
-    68730,
-    153878,
-    77858,
-    30605,
-    178977,
-    70279,
-    160674,
-    117951,
-    76823,
-    8362,
-    5727,
-    158213,
-    36624,
-    62091,
-    24705,
-    54173,
-    14150,
-    79346,
-    130332,
-    170542,
-    28710,
-    18661,
-    63869,
-    106757,
-    28330,
-    56359,
-    34746,
-    43644,
-    28435,
-    149830,
-    15107,
-    129899,
-    88895,
-    10823,
-    131136,
-    128173,
-    57720,
-    2372,
-    656,
-    23001,
-    25084,
-    169125,
-    65238,
-    71808,
-    45098,
-    109799,
-    33833,
-    73959,
-    43806,
-    179581,
-    136185,
-    119091,
-    29523,
-    50427,
-    81345,
-    139451,
-    39462,
-    55771,
-    138596,
-    171193,
-    25033,
-    105304,
-    61669,
-    62010,
-    28921,
-    103983,
-    115058,
-    44313,
-    79677,
-    177985,
-    57671,
-    168800,
-    41861,
-    96297,
-    64890,
-    138797,
-    170629,
-    22987,
-    105342,
-    7128,
-    137505,
-    40354,
-    171782,
-    145705,
-    111534,
-    50935,
-    124607,
-    159016,
-    111143,
-    102338,
-    52893,
-    137832,
-    124529,
-    141435,
-    53369,
-    169792,
-    32462,
-    48589,
-    15315,
-    50363,
-    27331,
-    137654,
-    96874,
-    62470,
-    17094,
-    2226,
-    153459,
-    83638,
-    13832,
-    52030,
-    166520,
-    32832,
-    171973,
-    5205,
-    138964,
-    43121,
-    75644,
-    115771,
-    171603,
-    139008,
-    62129,
-    67284,
-    2483,
-    179555,
-    35726,
-    96455,
-    82118,
-    78189,
-    109879,
-    177843,
-    34705,
-    101171,
-    142017,
-    149237,
-    66866,
-    127603,
-    85523,
-    157025,
-    7382,
-    77447,
-    107694,
-    7849,
-    109477,
-    173189,
-    141938,
-    84623,
-    95083,
-    134146,
-    141120,
-    72368,
-    29787,
-    17912,
-    152284,
-    3837,
-    40561,
-    122129,
-    129532,
-    11081,
-    133201,
-    149518,
-    24001,
-    128069,
-    129325,
-    109712,
-    151036,
-    152357,
-    167832,
-    142146,
-    91451,
-    79571,
-    138088,
-    34318,
-    173646,
-    118759,
-    125453,
-    150076,
-    94206,
-    44646,
-    108884,
-    142041,
-    133139,
-    47483,
-    127359,
-    174566,
-    103239,
-    2815,
-    93390,
-    73772,
-    27649,
-    155005,
-    121853,
-    119111,
-    142724,
-    30668,
-    119762,
-    125372,
-    87970,
-    128127,
-    25962,
-    125413,
-    170509,
-    72724,
-    128416,
-    113322,
-    79243,
-    28413,
-    179443,
-    165548,
-    132960,
-    131071,
-    172119,
-    167891,
-    137358,
-    17954,
-    148556,
-    89202,
-    74077,
-    33127,
-    140831,
-    17105,
-    577,
-    24627,
-    151066,
-    114071,
-    123004,
-    97785,
-    36663,
-    32008,
-    83527,
-    129345,
-    111121,
-    40600,
-    30255,
-    130583,
-    131144,
-    2401,
-    166947,
-    45616,
-    17501,
-    76212,
-    130277,
-    55960,
-    104865,
-    131750,
-    162213,
-    18246,
-    28405,
-    173442,
-    98457,
-    16075,
-    101992,
-    111320,
-    37546,
-    121371,
-    46829,
-    32075,
-    142748,
-    98783,
-    17756,
-    173085,
-    169951,
-    262,
-    44218,
-    123888,
-    20441,
-    149620,
-    122884,
-    78312,
-    175968,
-    127577,
-    20284,
-    9956,
-    32427,
-    144605,
-    157196,
-    96983,
-    165916,
-    158094,
-    14461,
-    70567,
-    93545,
-    130973,
-    126539,
-    16513,
-    28114,
-    161129,
-    127680,
-    80744,
-    172146,
-    90445,
-    88288,
-    137258,
-    113406,
-    119579,
-    50898,
-    121434,
-    66016,
-    123367,
-    175515,
-    147685,
-    126858,
-    117723,
-    177624,
-    115808,
-    97303,
-    126028,
-    165145,
-    170443,
-    10811,
-    21189,
-    127762,
-    72794,
-    92010,
-    91981,
-    171041,
-    150242,
-    43842,
-    131119,
-    93383,
-    13222,
-    172991,
-    118746,
-    17996,
-    147990,
-    22361,
-    102947,
-    51389,
-    19368,
-    45941,
-    10462,
-    86152,
-    25167,
-    120726,
-    7591,
-    120339,
-    106323,
-    57712,
-    68032,
-    10005,
-    91799,
-    11959,
-    116057,
-    7768,
-    56873,
-    1078,
-    127291,
-    130821,
-    156855,
-    126068,
-    71767,
-    109074,
-    64692,
-    30494,
-    134005,
-    123701,
-    113644,
-    77145,
-    34445,
-    83853,
-    175944,
-    175151,
-    94435,
-    20362,
-    10178,
-    31318,
-    141293,
-    174089,
-    136768,
-    104118,
-    101809,
-    132564,
-    54413,
-    30014,
-    90484,
-    93484,
-    51251,
-    1601,
-    29786,
-    132796,
-    97797,
-    582,
-    83245,
-    37041,
-    114406,
-    139412,
-    164645,
-    114112,
-    160720,
-    156388,
-    38063,
-    141999,
-    167986,
-    52355,
-    69673,
-    153799,
-    91893,
-    108129,
-    39776,
-    56756,
-    160120,
-    550,
-    76983,
-    32404,
-    86741,
-    77457,
-    16201,
-    90872,
-    65996,
-    94454,
-    173441,
-    98250,
-    14137,
-    148780,
-    42741,
-    4675,
-    170050,
-    1025,
-    113391,
-    145521,
-    165925,
-    141272,
-    134985,
-    104283,
-    84297,
-    32145,
-    63573,
-    127491,
-    123251,
-    119775,
-    69572,
-    41135,
-    161709,
-    128444,
-    24339,
-    102882,
-    123625,
-    123278,
-    145246,
-    85352,
-    1170,
-    36759,
-    38058,
-    90204,
-    37587,
-    466,
-    111114,
-    24145,
-    132123,
-    93887,
-    30205,
-    109087,
-    123783,
-    85568,
-    88917,
-    107783,
-    177654,
-    29706,
-    177151,
-    155409,
-    84493,
-    65894,
-    129665,
-    36864,
-    68078,
-    164478,
-    165382,
-    79001,
-    19194,
-    81057,
-    171340,
-    51068,
-    6009,
-    5718,
-    9669,
-    65070,
-    137725,
-    37407,
-    163497,
-    29502,
-    137261,
-    132140,
-    177852,
-    60223,
-    164864,
-    77964,
-    120479,
-    172840,
-    139029,
-    154936,
-    113614,
-    143430,
-    165347,
-    67521,
-    114520,
-    104112,
-    30576,
-    49634,
-    122932,
-    93350,
-    147264,
-    146446,
-    17438,
-    109967,
-    69415,
-    89144,
-    81668,
-    82437,
-    43602,
-    74358,
-    96685,
-    78603,
-    39597,
-    26581,
-    140838,
-    134716,
-    168296,
-    105258,
-    111791,
-    69119,
-    32024,
-    29290,
-    102956,
-    86960,
-    160706,
-    171094,
-    177260,
-    84933,
-    150885,
-    154598,
-    82885,
-    69038,
-    138951,
-    170165,
-    86446,
-    66752,
-    114539,
-    65041,
-    109291,
-    125696,
-    119990,
-    135799,
-    51505,
-    130935,
-    80216,
-    123799,
-    42063,
-    116355,
-    128102,
-    101784,
-    166570,
-    115745,
-    35963,
-    74394,
-    175104,
-    127411,
-    95061,
-    80608,
-    50466,
-    51233,
-    108628,
-    117799,
-    114207,
-    97903,
-    77519,
-    22764,
-    147620,
-    169784,
-    56576,
-    2408,
-    45674,
-    107667,
-    1120,
-    167940,
-    94801,
-    20733,
-    80465,
-    124502,
-    8122,
-    144424,
-    57363,
-    171921,
-    18543,
-    70608,
-    102959,
-    62731,
-    67457,
-    151957,
-    47891,
-    24806,
-    102836,
-    163717,
-    127883,
-    98165,
-    8191,
-    110393,
-    94496,
-    59308,
-    82380,
-    34613,
-    149089,
-    103592,
-    157532,
-    104731,
-    100392,
-    149255,
-    96087,
-    148622,
-    137908,
-    146716,
-    126318,
-    112347,
-    62954,
-    84927,
-    35078,
-    62862,
-    71958,
-    155908,
-    106123,
-    37747,
-    59066,
-    78143,
-    45333,
-    79156,
-    170525,
-    176155,
-    115836,
-    1847,
-    142562,
-    13002,
-    102720,
-    124039,
-    46942,
-    142745,
-    82869,
-    88883,
-    30077,
-    160530,
-    106980,
-    138936,
-    47980,
-    97657,
-    49183,
-    167697,
-    73274,
-    98301,
-    170612,
-    90891,
-    143313,
-    10389,
-    89662,
-    48769,
-    81504,
-    3381,
-    154286,
-    42016,
-    10977,
-    101517,
-    164438,
-    100182,
-    166893,
-    147470,
-    141212,
-    170737,
-    162078,
-    76097,
-    32247,
-    25676,
-    27332,
-    129366,
-    42027,
-    163220,
-    158937,
-    141146,
-    19916,
-    31538,
-    131422,
-    124346,
-    29665,
-    140022,
-    91008,
-    8809,
-    71204,
-    17144,
-    6418,
-    22494,
-    79277,
-    65303,
-    49524,
-    25504,
-    160363,
-    48213,
-    141631,
-    52180,
-    63267,
-    10333,
-    120292,
-    18031,
-    12490,
-    166911,
-    104431,
-    145001,
-    31402,
-    141137,
-    72806,
-    120548,
-    38183,
-    55539,
-    75837,
-    42566,
-    132815,
-    121480,
-    138737,
-    120244,
-    104095,
-    63051,
-    158737,
-    112865,
-    73371,
-    87531,
-    99393,
-    36205,
-    45222,
-    163331,
-    108365,
-    166884,
-    83517,
-    73146,
-    123231,
-    7872,
-    161955,
-    128671,
-    82249,
-    89392,
-    56538,
-    68912,
-    57137,
-    153271,
-    135950,
-    24126,
-    61191,
-    174617,
-    21370,
-    156684,
-    19007,
-    115713,
-    166525,
-    131875,
-    9728,
-    114259,
-    27962,
-    178701,
-    40288,
-    117655,
-    130187,
-    1687,
-    145373,
-    149740,
-    35670,
-    118801,
-    109559,
-    77705,
-    127597,
-    13443,
-    100862,
-    34242,
-    67178,
-    139458,
-    170846,
-    126655,
-    108419,
-    141817,
-    116275,
-    155135,
-    112934,
-    92168,
-    95016,
-    111787,
-    175469,
-    15228,
-    4822,
-    14423,
-    152406,
-    129784,
-    36614,
-    65193,
-    100380,
-    33389,
-    85243,
-    63540,
-    157275,
-    145543,
-    91000,
-    104651,
-    37703,
-    174245,
-    91932,
-    176170,
-    154148,
-    117203,
-    66807,
-    165021,
-    161946,
-    113164,
-    65521,
-    136859,
-    41371,
-    167065,
-    14231,
-    135696,
-    131816,
-    44196,
-    66743,
-    141259,
-    113395,
-    43254,
-    136479,
-    21367,
-    46789,
-    129241,
-    127050,
-    11832,
-    12728,
-    62199,
-    113893,
-    171570,
-    67029,
-    144730,
-    121617,
-    4859,
-    86075,
-    73418,
-    148448,
-    127279,
-    125552,
-    96410,
-    157522,
-    22932,
-    99218,
-    116413,
-    105291,
-    154744,
-    117392,
-    159386,
-    46832,
-    117794,
-    29275,
-    79305,
-    125003,
-    137927,
-    143160,
-    125819,
-    164338,
-    86902,
-    168562,
-    151998,
-    135152,
-    1441,
-    162636,
-    157032,
-    120222,
-    58932,
-    4248,
-    71318,
-    162606,
-    20617,
-    13747,
-    153972,
-    27167,
-    151982,
-    102191,
-    129053,
-    61585,
-    173215,
-    137942,
-    115017,
-    105393,
-    111989,
-    129737,
-    29650,
-    126959,
-    1267,
-    10338,
-    37954,
-    9887,
-    97749,
-    54908,
-    103226,
-    98785,
-    48931,
-    44443,
-    49963,
-    161728,
-    136726,
-    36595,
-    6065,
-    105791,
-    105515,
-    169667,
-    145864,
-    176850,
-    49971,
-    34848,
-    44026,
-    174874,
-    141343,
-    116962,
-    41820,
-    136989,
-    59035,
-    67681,
-    96572,
-    56461,
-    156387,
-    64768,
-    179179,
-    168550,
-    174779,
-    126037,
-    87810,
-    83421,
-    95904,
-    66230,
-    170942,
-    140821,
-    47849,
-    82138,
-    31542,
-    85864,
-    87203,
-    49471,
-    94026,
-    110605,
-    108983,
-    22100,
-    86601,
-    32490,
-    47066,
-    64358,
-    2974,
-    154049,
-    46290,
-    55868,
-    65607,
-    49053,
-    31958,
-    27894,
-    133621,
-    152722,
-    40232,
-    58684,
-    146794,
-    176559,
-    125742,
-    87166,
-    51335,
-    12118,
-    89516,
-    140135,
-    101526,
-    10672,
-    81333,
-    144264,
-    16113,
-    153151,
-    34336,
-    100411,
-    8750,
-    157734,
-    95070,
-    132962,
-    167564,
-    100239,
-    158388,
-    178793,
-    164664,
-    153427,
-    3318,
-    21692,
-    55312,
-    153554,
-    97271,
-    168218,
-    81759,
-    17859,
-    157089,
-    71010,
-    12711,
-    12327,
-    109256,
-    166074,
-    143007,
-    9138,
-    52806,
-    89127,
-    158668,
-    56353,
-    172505,
-    178496,
-    55327,
-    140237,
-    123943,
-    88298,
-    67646,
-    95759,
-    148669,
-    125218,
-    54944,
-    52599,
-    91231,
-    110761,
-    53339,
-    110669,
-    106443,
-    11505,
-    106696,
-    54303,
-    22117,
-    94033,
-    179809,
-    112322,
-    34102,
-    111263,
-    65782,
-    119065,
-    118524,
-    6204,
-    11287,
-    4792,
-    177594,
-    174935,
-    157897,
-    124785,
-    34666,
-    116080,
-    30854,
-    150779,
-    156203,
-    124305,
-    10340,
-    86109,
-    172972,
-    27382,
-    113336,
-    21614,
-    97714,
-    46634,
-    144102,
-    175048,
-    61959,
-    54271,
-    84089,
-    61620,
-    7534,
-    161137,
-    115806,
-    116992,
-    143835,
-    32742,
-    119812,
-    101569,
-    38487,
-    130357,
-    120495,
-    102096,
-    74878,
-    129759,
-    54837,
-    152752,
-    157227,
-    103590,
-    14740,
-    75017,
-    112366,
-    98413,
-    80842,
-    31659,
-    7648,
-    160434,
-    42296,
-    135676,
-    22281,
-    58767,
-    68436,
-    78560,
-    167965,
-    55430,
-    25211,
-    168842,
-    159621,
-    96644,
-    80142,
-    79338,
-    16503,
-    59401,
-    116329,
-    104064,
-    91369,
-    101708,
-    60783,
-    90072,
-    14937,
-    94298,
-    39372,
-    175549,
-    63726,
-    157680,
-    2887,
-    118505,
-    83678,
-    66619,
-    62921,
-    145154,
-    22296,
-    58209,
-    142796,
-    117197,
-    110928,
-    119850,
-    65712,
-    3759,
-    158439,
-    73472,
-    140634,
-    39782,
-    70232,
-    168692,
-    74050,
-    9462,
-    161713,
-    167363,
-    149614,
-    48976,
-    96512,
-    65058,
-    88729,
-    100544,
-    163800,
-    135342,
-    158300,
-    82149,
-    123500,
-    137853,
-    80504,
-    68283,
-    25087,
-    41887,
-    110359,
-    123914,
-    6298,
-    57695,
-    99561,
-    9807,
-    12859,
-    62736,
-    80895,
-    85510,
-    41754,
-    48482,
-    106914,
-    37754,
-    60474,
-    114181,
-    69349,
-    104341,
-    115478,
-    31692,
-    15845,
-    40907,
-    149292,
-    174138,
-    100663,
-    175340,
-    127057,
-    76466,
-    127965,
-    33234,
-    149686,
-    108674,
-    152795,
-    81430,
-    39646,
-    52410,
-    71143,
-    45491,
-    40996,
-    37769,
-    34750,
-    56236,
-    122487,
-    146496,
-    171469,
-    156112,
-    95418,
-    144694,
-    17478,
-    109852,
-    90000,
-    143601,
-    126939,
-    177740,
-    10665,
-    165280,
-    89822,
-    17933,
-    154861,
-    166538,
-    21991,
-    125898,
-    121712,
-    102786,
-    128413,
-    18622,
-    15018,
-    48600,
-    143211,
-    36319,
-    173999,
-    90831,
-    103256,
-    55466,
-    38719,
-    172898,
-    14755,
-    137418,
-    144354,
-    94481,
-    85887,
-    88866,
-    141537,
-    68306,
-    148756,
-    88851,
-    58578,
-    154711,
-    52780,
-    172860,
-    138130,
-    15102,
-    168062,
-    1261,
-    132070,
-    24930,
-    103991,
-    123484,
-    164598,
-    171718,
-    79451,
-    166522,
-    8596,
-    153711,
-    18490,
-    23394,
-    137966,
-    30937,
-    71568,
-    298,
-    57295,
-    55532,
-    104956,
-    23325,
-    149002,
-    116745,
-    166788,
-    49992,
-    141244,
-    75326,
-    177018,
-    15902,
-    96612,
-    22636,
-    88825,
-    49129,
-    96785,
-    151790,
-    84051,
-    170799,
-    62378,
-    162146,
-    47079,
-    131355,
-    116593,
-    149692,
-    53000,
-    160577,
-    141322,
-    85493,
-    135299,
-    78219,
-    71067,
-    138373,
-    153495,
-    17796,
-    14692,
-    85841,
-    8447,
-    4619,
-    74483,
-    64038,
-    6118,
-    3727,
-    32436,
-    155151,
-    149994,
-    82936,
-    152830,
-    32884,
-    153643,
-    18723,
-    15737,
-    49880,
-    111691,
-    16078,
-    3199,
-    153679,
-    92306,
-    92977,
-    23273,
-    62416,
-    161924,
-    28083,
-    33268,
-    41794,
-    175394,
-    124593,
-    26947,
-    175072,
-    53060,
-    114956,
-    123891,
-    89585,
-    52846,
-    60433,
-    73347,
-    70927,
-    160816,
-    55902,
-    119517,
-    53812,
-    178656,
-    35888,
-    8027,
-    144311,
-    6701,
-    133826,
-    63501,
-    5779,
-    163815,
-    63943,
-    110754,
-    90541,
-    154254,
-    178456,
-    75527,
-    6362,
-    119370,
-    111537,
-    11128,
-    97970,
-    41483,
-    106974,
-    67462,
-    78801,
-    99876,
-    45082,
-    110775,
-    127131,
-    112504,
-    142441,
-    86956,
-    16042,
-    161212,
-    115868,
-    174330,
-    79955,
-    47884,
-    160623,
-    36816,
-    137334,
-    78582,
-    110256,
-    74459,
-    155101,
-    126586,
-    145900,
-    55470,
-    130588,
-    114572,
-    93872,
-    32336,
-    64920,
-    147458,
-    171586,
-    146465,
-    75958,
-    8688,
-    10776,
-    156057,
-    157002,
-    142984,
-    59300,
-    13645,
-    135848,
-    93662,
-    31324,
-    10790,
-    113130,
-    137523,
-    158820,
-    154217,
-    177986,
-    109980,
-    23783,
-    118917,
-    109394,
-    7381,
-    143458,
-    1860,
-    107483,
-    95718,
-    168287,
-    30371,
-    62381,
-    30635,
-    6339,
-    154040,
-    18956,
-    43810,
-    152822,
-    170664,
-    44780,
-    28077,
-    21503,
-    22811,
-    162139,
-    23688,
-    23573,
-    109482,
-    16086,
-    151194,
-    30022,
-    46060,
-    157972,
-    114386,
-    113013,
-    38093,
-    167713,
-    71852,
-    150055,
-    24706,
-    11749,
-    71288,
-    36484,
-    115508,
-    108340,
-    11293,
-    89370,
-    58838,
-    127596,
-    99791,
-    159835,
-    96312,
-    54753,
-    38391,
-    178752,
-    94139,
-    101294,
-    122127,
-    176264,
-    65264,
-    69495,
-    68158,
-    110715,
-    34794,
-    138046,
-    51410,
-    121881,
-    119141,
-    156058,
-    146660,
-    87467,
-    77133,
-    6708,
-    148675,
-    30725,
-    10132,
-    119307,
-    121746,
-    17785,
-    130148,
-    11043,
-    77571,
-    137616,
-    62782,
-    87670,
-    116828,
-    67806,
-    102953,
-    47200,
-    4717,
-    76871,
-    28499,
-    159104,
-    13143,
-    67064,
-    80517,
-    126725,
-    59651,
-    48633,
-    167237,
-    169560,
-    790,
-    106949,
-    161023,
-    6872,
-    35536,
-    77819,
-    31853,
-    27576,
-    156582,
-    34661,
-    144480,
-    64922,
-    15838,
-    45020,
-    7682,
-    1711,
-    127299,
-    118659,
-    55323,
-    77389,
-    75261,
-    90039,
-    112685,
-    40952,
-    139717,
-    98410,
-    65740,
-    170992,
-    21092,
-    135292,
-    45471,
-    55724,
-    131216,
-    47796,
-    56265,
-    29675,
-    157571,
-    43195,
-    61132,
-    71221,
-    123889,
-    21958,
-    75008,
-    15466,
-    33222,
-    120547,
-    128657,
-    113578,
-    141937,
-    32936,
-    76458,
-    111630,
-    29815,
-    8198,
-    39583,
-    49062,
-    172062,
-    54735,
-    7475,
-    53079,
-    53992,
-    52477,
-    68565,
-    49122,
-    163376,
-    75155,
-    19453,
-    160609,
-    145936,
-    97477,
-    128697,
-    131485,
-    146370,
-    116943,
-    155717,
-    108216,
-    9461,
-    66226,
-    47768,
-    29478,
-    31710,
-    174685,
-    36150,
-    114964,
-    107054,
-    59849,
-    6756,
-    174038,
-    158465,
-    127399,
-    163261,
-    172068,
-    70584,
-    145,
-    118979,
-    42246,
-    105998,
-    28323,
-    52571,
-    2162,
-    25030,
-    38472,
-    121141,
-    86618,
-    105838,
-    138804,
-    10574,
-    4195,
-    129928,
-    170713,
-    134026,
-    169170,
-    60003,
-    144882,
-    41904,
-    84212,
-    177329,
-    6093,
-    3200,
-    57787,
-    120349,
-    172517,
-    88227,
-    159572,
-    98358,
-    123486,
-    63933,
-    27983,
-    24263,
-    65386,
-    5562,
-    123814,
-    149160,
-    68080,
-    101379,
-    78520,
-    99818,
-    67044,
-    116238,
-    167285,
-    135470,
-    19813,
-    174021,
-    101667,
-    115007,
-    61752,
-    9820,
-    150981,
-    8169,
-    119177,
-    32246,
-    17055,
-    58257,
-    126761,
-    78217,
-    56032,
-    156607,
-    108633,
-    77677,
-    99038,
-    47074,
-    129971,
-    130534,
-    173598,
-    32321,
-    3688,
-    85063,
-    103517,
-    130615,
-    122545,
-    68356,
-    87882,
-    73033,
-    24851,
-    85761,
-    39594,
-    170485,
-    110568,
-    150505,
-    55507,
-    65147,
-    155210,
-    128375,
-    39691,
-    42648,
-    97418,
-    16703,
-    160092,
-    32763,
-    156663,
-    89973,
-    65515,
-    34502,
-    3064,
-    22718,
-    11496,
-    59440,
-    117667,
-    105955,
-    127502,
-    50820,
-    138812,
-    117645,
-    112900,
-    16892,
-    35819,
-    117654,
-    4277,
-    123157,
-    58490,
-    105905,
-    118044,
-    25719,
-    29065,
-    4578,
-    125793,
-    19850,
-    98324,
-    53637,
-    91533,
-    31240,
-    127405,
-    164248,
-    139024,
-    40506,
-    162879,
-    78973,
-    84869,
-    151109,
-    147038,
-    171264,
-    33582,
-    94155,
-    145124,
-    11256,
-    46384,
-    134901,
-    158545,
-    167688,
-    16604,
-    156464,
-    50480,
-    105087,
-    170088,
-    57449,
-    30905,
-    158713,
-    42641,
-    985,
-    112186,
-    125115,
-    111104,
-    47466,
-    61611,
-    3876,
-    83730,
-    172393,
-    100590,
-    113545,
-    30914,
-    168601,
-    109815,
-    165988,
-    89774,
-    18042,
-    82314,
-    28104,
-    127884,
-    70697,
-    119000,
-    61591,
-    26137,
-    31243,
-    126350,
-    68551,
-    79972,
-    145487,
-    20299,
-    61783,
-    90735,
-    151302,
-    9067,
-    55148,
-    77339,
-    110512,
-    168549,
-    111357,
-    21211,
-    115573,
-    66385,
-    171954,
-    42855,
-    90076,
-    119956,
-    162848,
-    4157,
-    176878,
-    172887,
-    100186,
-    69217,
-    118954,
-    30942,
-    79012,
-    65352,
-    99053,
-    42572,
-    134483,
-    31278,
-    164638,
-    175704,
-    107831,
-    14144,
-    96315,
-    148786,
-    12609,
-    111012,
-    72661,
-    138567,
-    172364,
-    67816,
-    93189,
-    162130,
-    144092,
-    132623,
-    83774,
-    112061,
-    95435,
-    154700,
-    97518,
-    72464,
-    136334,
-    5706,
-    40941,
-    14007,
-    22049,
-    35373,
-    115561,
-    130873,
-    32339,
-    77023,
-    143420,
-    178624,
-    47757,
-    35312,
-    115121,
-    813,
-    9419,
-    71151,
-    120489,
-    108474,
-    60880,
-    18786,
-    171179,
-    11844,
-    132074,
-    21726,
-    3509,
-    62203,
-    165564,
-    146269,
-    109705,
-    115772,
-    11250,
-    170398,
-    32909,
-    16253,
-    126065,
-    123079,
-    951,
-    6633,
-    67641,
-    62922,
-    117280,
-    26027,
-    145761,
-    145170,
-    154965,
-    3929,
-    83648,
-    28422,
-    159810,
-    67289,
-    35528,
-    119507,
-    133859,
-    54416,
-    15557,
-    127130,
-    128709,
-    119315,
-    89340,
-    50958,
-    174676,
-    27850,
-    42210,
-    172469,
-    152828,
-    115634,
-    44359,
-    53381,
-    52950,
-    162973,
-    12121,
-    51303,
-    95697,
-    79106,
-    159000,
-    84993,
-    127866,
-    130474,
-    155158,
-    48518,
-    82992,
-    14321,
-    58806,
-    104921,
-    84640,
-    176180,
-    138533,
-    8181,
-    49961,
-    47585,
-    179952,
-    78293,
-    65802,
-    179594,
-    6273,
-    50869,
-    14657,
-    30327,
-    3557,
-    91475,
-    162454,
-    115752,
-    160610,
-    110072,
-    58255,
-    55143,
-    134784,
-    129721,
-    89404,
-    48516,
-    168358,
-    149905,
-    159596,
-    123734,
-    68106,
-    58352,
-    21003,
-    63430,
-    88721,
-    93571,
-    134087,
-    113988,
-    121342,
-    116172,
-    96013,
-    119745,
-    19277,
-    93015,
-    119417,
-    51578,
-    18838,
-    32650,
-    163167,
-    19057,
-    164537,
-    140083,
-    118059,
-    120163,
-    73602,
-    1843,
-    69169,
-    105727,
-    124569,
-    122401,
-    129148,
-    152705,
-    152570,
-    49341,
-    149247,
-    140955,
-    137148,
-    18387,
-    25553,
-    40862,
-    64657,
-    62981,
-    85252,
-    21038,
-    148573,
-    41110,
-    137766,
-    130755,
-    167090,
-    72025,
-    175411,
-    15850,
-    8266,
-    13875,
-    167539,
-    170599,
-    166815,
-    59779,
-    129425,
-    9989,
-    54076,
-    29491,
-    73763,
-    61693,
-    113205,
-    100240,
-    69247,
-    103730,
-    159635,
-    134491,
-    121816,
-    77346,
-    53823,
-    162632,
-    87523,
-    116288,
-    97968,
-    92015,
-    668,
-    73911,
-    52170,
-    84354,
-    1798,
-    123081,
-    50609,
-    85378,
-    113134,
-    123508,
-    16523,
-    57455,
-    22136,
-    82978,
-    139586,
-    115198,
-    30471,
-    142327,
-    159231,
-    87591,
-    173837,
-    25327,
-    18234,
-    154409,
-    101989,
-    31053,
-    93044,
-    40489,
-    89579,
-    120760,
-    129012,
-    24933,
-    18349,
-    38590,
-    85081,
-    57271,
-    36283,
-    172235,
-    167792,
-    107531,
-    41386,
-    82426,
-    165805,
-    122613,
-    18731,
-    122135,
-    69864,
-    81910,
-    45645,
-    162805,
-    39501,
-    54211,
-    95895,
-    172094,
-    99480,
-    42194,
-    133763,
-    37898,
-    151641,
-    160827,
-    103049,
-    64282,
-    66502,
-    147444,
-    124915,
-    27291,
-    5877,
-    119551,
-    26146,
-    177571,
-    105729,
-    47744,
-    82955,
-    141111,
-    6136,
-    14438,
-    130902,
-    157026,
-    106623,
-    24679,
-    16949,
-    64011,
-    78531,
-    36065,
-    31603,
-    106518,
-    114640,
-    121423,
-    137694,
-    139356,
-    159192,
-    7094,
-    21290,
-    120088,
-    73266,
-    152588,
-    48223,
-    35553,
-    101007,
-    37149,
-    12950,
-    162697,
-    46855,
-    57048,
-    172245,
-    83832,
-    125067,
-    149349,
-    86201,
-    84347,
-    113167,
-    59033,
-    179975,
-    151122,
-    82974,
-    131072,
-    76383,
-    116857,
-    162190,
-    93108,
-    44875,
-    29599,
-    74472,
-    69143,
-    51185,
-    125472,
-    7745,
-    143575,
-    70868,
-    86684,
-    1582,
-    167422,
-    79579,
-    64913,
-    138433,
-    55106,
-    70974,
-    13577,
-    4685,
-    72654,
-    59771,
-    104198,
-    139825,
-    141663,
-    109187,
-    168504,
-    60938,
-    17612,
-    37000,
-    169225,
-    59543,
-    13680,
-    137622,
-    54269,
-    99576,
-    154006,
-    25326,
-    66869,
-    2736,
-    139213,
-    17389,
-    93633,
-    47720,
-    20831,
-    80756,
-    121706,
-    168853,
-    12648,
-    151120,
-    63385,
-    86725,
-    137111,
-    157006,
-    51895,
-    58586,
-    6454,
-    111284,
-    160984,
-    3620,
-    24075,
-    129691,
-    67204,
-    163234,
-    178372,
-    83924,
-    18443,
-    140078,
-    32582,
-    16981,
-    152291,
-    76507,
-    51037,
-    122848,
-    11968,
-    136813,
-    47903,
-    64423,
-    134064,
-    164794,
-    68220,
-    46383,
-    84658,
-    10997,
-    131291,
-    99387,
-    37255,
-    128796,
-    37565,
-    72421,
-    179331,
-    73885,
-    110435,
-    60812,
-    34188,
-    178299,
-    114324,
-    155490,
-    75820,
-    129034,
-    8546,
-    90002,
-    1008,
-    8696,
-    92456,
-    147316,
-    46301,
-    121276,
-    46203,
-    114860,
-    175140,
-    146802,
-    141873,
-    81244,
-    103781,
-    153605,
-    170829,
-    88944,
-    43157,
-    64391,
-    15818,
-    55839,
-    72067,
-    78534,
-    16491,
-    41903,
-    8775,
-    142666,
-    140667,
-    41362,
-    77336,
-    152165,
-    166264,
-    55317,
-    126856,
-    35309,
-    115840,
-    142975,
-    95186,
-    82456,
-    143772,
-    62949,
-    171608,
-    36635,
-    27345,
-    163357,
-    12330,
-    40746,
-    177158,
-    7819,
-    53460,
-    23895,
-    140698,
-    71594,
-    137233,
-    73557,
-    78987,
-    118199,
-    115291,
-    173928,
-    140564,
-    98361,
-    128534,
-    178330,
-    21822,
-    106131,
-    112583,
-    13738,
-    125870,
-    28589,
-    21445,
-    30626,
-    138971,
-    108783,
-    161436,
-    151812,
-    83070,
-    94882,
-    69009,
-    156065,
-    141982,
-    31968,
-    75037,
-    174909,
-    139284,
-    130441,
-    125010,
-    52471,
-    130881,
-    95226,
-    157877,
-    104891,
-    118971,
-    47619,
-    156247,
-    5726,
-    160172,
-    114240,
-    82704,
-    116696,
-    45304,
-    169860,
-    172189,
-    78392,
-    27316,
-    50037,
-    44843,
-    36723,
-    131604,
-    169668,
-    106000,
-    82997,
-    124334,
-    110500,
-    5173,
-    12993,
-    164960,
-    68394,
-    22253,
-    55901,
-    60137,
-    135850,
-    11035,
-    167196,
-    4049,
-    98406,
-    56526,
-    98049,
-    147173,
-    76856,
-    166592,
-    35259,
-    44585,
-    44288,
-    126660,
-    40164,
-    11566,
-    118714,
-    155461,
-    39482,
-    8862,
-    49011,
-    61837,
-    123593,
-    16275,
-    170994,
-    87027,
-    89781,
-    146247,
-    73898,
-    133464,
-    162626,
-    110479,
-    66472,
-    161485,
-    136734,
-    88081,
-    13216,
-    65739,
-    178325,
-    62145,
-    157265,
-    23646,
-    150859,
-    52150,
-    135379,
-    4689,
-    15643,
-    124255,
-    140881,
-    57233,
-    99683,
-    107793,
-    164949,
-    6349,
-    28178,
-    17316,
-    52279,
-    48358,
-    131426,
-    158385,
-    4546,
-    68606,
-    9826,
-    67803,
-    24277,
-    60043,
-    179023,
-    149512,
-    128401,
-    18292,
-    76154,
-    7061,
-    33429,
-    157450,
-    98990,
-    127440,
-    63821,
-    62200,
-    158479,
-    40201,
-    39559,
-    112904,
-    171416,
-    27882,
-    160323,
-    26886,
-    32632,
-    148208,
-    49637,
-    78354,
-    135750,
-    37563,
-    87769,
-    105052,
-    34463,
-    81933,
-    146279,
-    35818,
-    138552,
-    98590,
-    100222,
-    116883,
-    48035,
-    25803,
-    159106,
-    58772,
-    168566,
-    108515,
-    13874,
-    154009,
-    154926,
-    23552,
-    147134,
-    31019,
-    20541,
-    84167,
-    6806,
-    159936,
-    144635,
-    152743,
-    135728,
-    139263,
-    83819,
-    135874,
-    115351,
-    167343,
-    72186,
-    134172,
-    64808,
-    67699,
-    7339,
-    154788,
-    41319,
-    173222,
-    50743,
-    106931,
-    156658,
-    120433,
-    18147,
-    87770,
-    36586,
-    5222,
-    23280,
-    161279,
-    65748,
-    94043,
-    156529,
-    58469,
-    67410,
-    1081,
-    135785,
-    91560,
-    28056,
-    47810,
-    41148,
-    179276,
-    98592,
-    100860,
-    17355,
-    129559,
-    101641,
-    18814,
-    167006,
-    173911,
-    170842,
-    37712,
-    4599,
-    36521,
-    146393,
-    26893,
-    5519,
-    25827,
-    84287,
-    167672,
-    137464,
-    116186,
-    49344,
-    45586,
-    172488,
-    119375,
-    100679,
-    36415,
-    105804,
-    168777,
-    167774,
-    12038,
-    108976,
-    58471,
-    145968,
-    64659,
-    6552,
-    133317,
-    134859,
-    54403,
-    88679,
-    140470,
-    136027,
-    76751,
-    104036,
-    120939,
-    144397,
-    49120,
-    28441,
-    21046,
-    115707,
-    33789,
-    113822,
-    18169,
-    156327,
-    69808,
-    140360,
-    124020,
-    115021,
-    38141,
-    69343,
-    109510,
-    108815,
-    128300,
-    55915,
-    118125,
-    61142,
-    78622,
-    73327,
-    11707,
-    162981,
-    93992,
-    107630,
-    97253,
-    4004,
-    24954,
-    169406,
-    69746,
-    179821,
-    49624,
-    34897,
-    41028,
-    39521,
-    153150,
-    90846,
-    70205,
-    55899,
-    63121,
-    91436,
-    2556,
-    175353,
-    78862,
-    38403,
-    20500,
-    152174,
-    66256,
-    94684,
-    170167,
-    42474,
-    59239,
-    88417,
-    134775,
-    6281,
-    75818,
-    116848,
-    63300,
-    99808,
-    61408,
-    175404,
-    43342,
-    3787,
-    44358,
-    101450,
-    6933,
-    113906,
-    27854,
-    156818,
-    99383,
-    90973,
-    55577,
-    28678,
-    36745,
-    134270,
-    66871,
-    133193,
-    40858,
-    172045,
-    152866,
-    172157,
-    52148,
-    17209,
-    64983,
-    138600,
-    151059,
-    64813,
-    93768,
-    72301,
-    161026,
-    79281,
-    82053,
-    174360,
-    44463,
-    98428,
-    7935,
-    1478,
-    99368,
-    179711,
-    140132,
-    56122,
-    157133,
-    14967,
-    40012,
-    39628,
-    119360,
-    115104,
-    31837,
-    126863,
-    5857,
-    121168,
-    4510,
-    84098,
-    2108,
-    40700,
-    3686,
-    49475,
-    103622,
-    137703,
-    56070,
-    105415,
-    81256,
-    160737,
-    134761,
-    93721,
-    142010,
-    178500,
-    106729,
-    118650,
-    56310,
-    93429,
-    98729,
-    128586,
-    85427,
-    60830,
-    171648,
-    137893,
-    168324,
-    109995,
-    78904,
-    28292,
-    157068,
-    29309,
-    70550,
-    70911,
-    4807,
-    84111,
-    123688,
-    128055,
-    89462,
-    80507,
-    155078,
-    6090,
-    171481,
-    122385,
-    123653,
-    94463,
-    121818,
-    149773,
-    102465,
-    82359,
-    123772,
-    167440,
-    144050,
-    131330,
-    130758,
-    26189,
-    21467,
-    90136,
-    130502,
-    163040,
-    121440,
-    26930,
-    62411,
-    26328,
-    2481,
-    43799,
-    78212,
-    111816,
-    128277,
-    17346,
-    44684,
-    156781,
-    98293,
-    61288,
-    116236,
-    93241,
-    42444,
-    139089,
-    104687,
-    30575,
-    698,
-    77640,
-    34350,
-    79492,
-    10816,
-    109257,
-    53402,
-    29472,
-    68563,
-    154623,
-    117321,
-    71858,
-    60419,
-    76052,
-    59742,
-    143596,
-    22661,
-    152372,
-    8280,
-    108929,
-    115496,
-    135364,
-    32025,
-    140481,
-    149216,
-    6854,
-    61364,
-    1036,
-    68092,
-    175547,
-    4878,
-    152075,
-    87812,
-    111714,
-    87315,
-    53558,
-    52450,
-    111647,
-    169496,
-    137179,
-    2381,
-    88300,
-    82588,
-    92786,
-    821,
-    43069,
-    111419,
-    52530,
-    160064,
-    9036,
-    120558,
-    26257,
-    47332,
-    4790,
-    40386,
-    126448,
-    72096,
-    105117,
-    51800,
-    6344,
-    156289,
-    81066,
-    141106,
-    33903,
-    29641,
-    15768,
-    76404,
-    155305,
-    14399,
-    85714,
-    63363,
-    125546,
-    114877,
-    63839,
-    61077,
-    65787,
-    50846,
-    62152,
-    165111,
-    99981,
-    125977,
-    19753,
-    88847,
-    158297,
-    43119,
-    122515,
-    163343,
-    162919,
-    140188,
-    71055,
-    83285,
-    97451,
-    30283,
-    89223,
-    124949,
-    162286,
-    162199,
-    2088,
-    146625,
-    159512,
-    34789,
-    67962,
-    62721,
-    102137,
-    64825,
-    177395,
-    22958,
-    116994,
-    130172,
-    173848,
-    105715,
-    3952,
-    44983,
-    55882,
-    6425,
-    168314,
-    168263,
-    71089,
-    133630,
-    120798,
-    116768,
-    34109,
-    93249,
-    50101,
-    163465,
-    141813,
-    1315,
-    14133,
-    58836,
-    85729,
-    65174,
-    106586,
-    144647,
-    42338,
-    158311,
-    172763,
-    149043,
-    135851,
-    102383,
-    139924,
-    78961,
-    125399,
-    152189,
-    176154,
-    144757,
-    37221,
-    60156,
-    48687,
-    130233,
-    178660,
-    161663,
-    44098,
-    115893,
-    175617,
-    30178,
-    90432,
-    67222,
-    21385,
-    85589,
-    145792,
-    64799,
-    34907,
-    60251,
-    46544,
-    130723,
-    9762,
-    45171,
-    101226,
-    41293,
-    163544,
-    69347,
-    11362,
-    286,
-    6313,
-    99861,
-    71809,
-    2588,
-    172753,
-    149382,
-    78005,
-    142103,
-    144268,
-    110414,
-    71148,
-    86139,
-    32290,
-    125187,
-    158060,
-    7690,
-    65289,
-    173342,
-    144508,
-    122031,
-    148562,
-    174302,
-    82014,
-    42119,
-    10197,
-    173387,
-    101880,
-    96868,
-    52177,
-    174624,
-    72679,
-    86432,
-    118945,
-    25756,
-    123042,
-    151970,
-    18596,
-    108231,
-    3329,
-    76926,
-    150598,
-    40110,
-    137236,
-    150691,
-    155480,
-    68599,
-    137970,
-    58941,
-    74485,
-    152148,
-    163417,
-    90055,
-    170694,
-    61630,
-    68697,
-    11462,
-    151580,
-    57652,
-    88256,
-    48479,
-    176724,
-    86325,
-    37226,
-    122905,
-    12794,
-    128288,
-    66000,
-    91869,
-    17964,
-    137153,
-    78030,
-    83439,
-    170295,
-    153068,
-    165987,
-    14183,
-    158583,
-    75416,
-    108739,
-    42378,
-    174328,
-    53021,
-    71992,
-    23873,
-    65128,
-    80927,
-    28290,
-    151009,
-    19886,
-    147833,
-    168408,
-    67079,
-    141383,
-    156977,
-    50311,
-    48395,
-    37192,
-    52111,
-    135887,
-    97028,
-    161153,
-    152168,
-    95183,
-    12212,
-    33873,
-    163512,
-    151127,
-    164468,
-    72217,
-    63938,
-    23751,
-    138159,
-    505,
-    175492,
-    51863,
-    7090,
-    77070,
-    54736,
-    173623,
-    87143,
-    126397,
-    149358,
-    87728,
-    110349,
-    4083,
-    159018,
-    26963,
-    50673,
-    177990,
-    39751,
-    15567,
-    59584,
-    141498,
-    124064,
-    7513,
-    35226,
-    151763,
-    121191,
-    138777,
-    38814,
-    64635,
-    98765,
-    134533,
-    55622,
-    100487,
-    165906,
-    62704,
-    41639,
-    96810,
-    126532,
-    35313,
-    17805,
-    116786,
-    129949,
-    66377,
-    173706,
-    135355,
-    69935,
-    8906,
-    69147,
-    137738,
-    19820,
-    63596,
-    39116,
-    25146,
-    38114,
-    55962,
-    155319,
-    989,
-    173432,
-    170512,
-    112543,
-    90246,
-    91125,
-    148491,
-    198,
-    48409,
-    179422,
-    118779,
-    75942,
-    33505,
-    18922,
-    151052,
-    89344,
-    3548,
-    117134,
-    158634,
-    98424,
-    16379,
-    63822,
-    48386,
-    28916,
-    128650,
-    67205,
-    7027,
-    15827,
-    32973,
-    8123,
-    71890,
-    111494,
-    49441,
-    33995,
-    31749,
-    99398,
-    77060,
-    15608,
-    105272,
-    141671,
-    100250,
-    141350,
-    10891,
-    64594,
-    45466,
-    46182,
-    136892,
-    159175,
-    114478,
-    104499,
-    62880,
-    57699,
-    35880,
-    44668,
-    138008,
-    173127,
-    28352,
-    169754,
-    48099,
-    46230,
-    129454,
-    109939,
-    93229,
-    62019,
-    76109,
-    35238,
-    170080,
-    97820,
-    139858,
-    132782,
-    11139,
-    53278,
-    129500,
-    37899,
-    1644,
-    74245,
-    88925,
-    53527,
-    109793,
-    73084,
-    140055,
-    21260,
-    151951,
-    86776,
-    113877,
-    100677,
-    172648,
-    44538,
-    156806,
-    102858,
-    119212,
-    127891,
-    67538,
-    19390,
-    26322,
-    141410,
-    1952,
-    166095,
-    170693,
-    80200,
-    59406,
-    135391,
-    149064,
-    160425,
-    11283,
-    47898,
-    1450,
-    67436,
-    169021,
-    51161,
-    62517,
-    1741,
-    113163,
-    60571,
-    133537,
-    95498,
-    40652,
-    128332,
-    109336,
-    16144,
-    48454,
-    135871,
-    79443,
-    31484,
-    122156,
-    127639,
-    41709,
-    78344,
-    102896,
-    88212,
-    146008,
-    151033,
-    60395,
-    111303,
-    133320,
-    110919,
-    72874,
-    60934,
-    7975,
-    172835,
-    128795,
-    87306,
-    108356,
-    150934,
-    25808,
-    39033,
-    59297,
-    170109,
-    150437,
-    173703,
-    16678,
-    34950,
-    31612,
-    15571,
-    98345,
-    42127,
-    39329,
-    57486,
-    28131,
-    121022,
-    91138,
-    100464,
-    104163,
-    159580,
-    81097,
-    97452,
-    84894,
-    36657,
-    43746,
-    123503,
-    85668,
-    30423,
-    23456,
-    110537,
-    174552,
-    98445,
-    1077,
-    40206,
-    124266,
-    92602,
-    140159,
-    122076,
-    159190,
-    110048,
-    51685,
-    38125,
-    45815,
-    50229,
-    171924,
-    40166,
-    88610,
-    108268,
-    56901,
-    107513,
-    36975,
-    99959,
-    37294,
-    69116,
-    44062,
-    96851,
-    160487,
-    117876,
-    111918,
-    29755,
-    8959,
-    115902,
-    154530,
-    13676,
-    141733,
-    61967,
-    83607,
-    123429,
-    43966,
-    74312,
-    151784,
-    68221,
-    84395,
-    23710,
-    137720,
-    104719,
-    131979,
-    107074,
-    144506,
-    13541,
-    159420,
-    133390,
-    98709,
-    158618,
-    71105,
-    84645,
-    122713,
-    68568,
-    128052,
-    122390,
-    73766,
-    152972,
-    3140,
-    58130,
-    66838,
-    1886,
-    162463,
-    14792,
-    74048,
-    162208,
-    25522,
-    68654,
-    120705,
-    67911,
-    33671,
-    122381,
-    27233,
-    65692,
-    145446,
-    23213,
-    110405,
-    82749,
-    43901,
-    127356,
-    74870,
-    157869,
-    5929,
-    91738,
-    123808,
-    172716,
-    111238,
-    117158,
-    103858,
-    31272,
-    69324,
-    173283,
-    149901,
-    132809,
-    152877,
-    12902,
-    78201,
-    883,
-    84828,
-    136216,
-    176363,
-    112787,
-    59856,
-    142366,
-    149046,
-    46910,
-    100220,
-    172408,
-    7037,
-    41778,
-    20210,
-    16339,
-    53272,
-    122496,
-    138332,
-    117894,
-    72139,
-    35683,
-    154998,
-    35636,
-    127414,
-    42035,
-    105043,
-    139377,
-    88138,
-    140361,
-    136345,
-    167798,
-    151144,
-    20091,
-    111436,
-    125360,
-    90949,
-    115511,
-    44632,
-    118230,
-    99109,
-    66302,
-    157823,
-    125029,
-    148831,
-    119368,
-    96220,
-    125226,
-    7083,
-    160854,
-    117676,
-    179440,
-    21894,
-    138083,
-    88348,
-    165010,
-    61299,
-    121045,
-    6104,
-    174320,
-    84443,
-    54204,
-    122479,
-    5171,
-    111879,
-    131693,
-    154860,
-    79895,
-    20079,
-    56046,
-    86615,
-    82145,
-    65632,
-    172938,
-    38622,
-    28847,
-    35300,
-    98932,
-    163508,
-    96871,
-    39461,
-    23078,
-    168273,
-    61943,
-    153712,
-    126659,
-    91976,
-    6584,
-    55782,
-    112714,
-    150530,
-    173989,
-    28959,
-    109878,
-    14535,
-    96798,
-    5353,
-    154535,
-    99529,
-    121944,
-    110816,
-    103714,
-    79847,
-    15044,
-    80757,
-    11425,
-    90910,
-    130820,
-    106238,
-    90559,
-    79839,
-    119366,
-    150961,
-    8559,
-    148932,
-    78911,
-    82486,
-    4252,
-    164988,
-    39947,
-    100771,
-    22918,
-    101855,
-    36161,
-    98570,
-    3804,
-    100252,
-    97207,
-    111616,
-    149811,
-    71393,
-    133093,
-    109564,
-    59220,
-    27407,
-    133999,
-    153793,
-    62946,
-    110809,
-    88692,
-    80905,
-    156382,
-    62753,
-    35792,
-    120317,
-    146725,
-    70948,
-    40917,
-    73382,
-    104070,
-    5775,
-    26964,
-    135114,
-    143203,
-    106208,
-    88086,
-    118354,
-    74238,
-    113726,
-    517,
-    116163,
-    170004,
-    159530,
-    162648,
-    101712,
-    167552,
-    58272,
-    49492,
-    177280,
-    110399,
-    14965,
-    116152,
-    153790,
-    80896,
-    154430,
-    95530,
-    168674,
-    101033,
-    58426,
-    167257,
-    4244,
-    34419,
-    103959,
-    139602,
-    157037,
-    92353,
-    52315,
-    157003,
-    87554,
-    90375,
-    124413,
-    46090,
-    85986,
-    45533,
-    166298,
-    59125,
-    94345,
-    103839,
-    178009,
-    177870,
-    79614,
-    64741,
-    31392,
-    145082,
-    79457,
-    19406,
-    9209,
-    29308,
-    154089,
-    50446,
-    81864,
-    113192,
-    113987,
-    54852,
-    36287,
-    562,
-    94239,
-    45212,
-    4363,
-    84874,
-    112116,
-    77612,
-    170730,
-    49144,
-    30130,
-    111080,
-    78765,
-    147046,
-    8736,
-    163739,
-    133529,
-    148300,
-    68315,
-    40501,
-    148236,
-    15128,
-    54364,
-    106272,
-    112304,
-    159845,
-    82339,
-    11743,
-    139110,
-    165854,
-    103084,
-    138295,
-    129315,
-    27104,
-    165807,
-    65826,
-    154806,
-    91339,
-    108577,
-    99439,
-    31813,
-    146518,
-    71993,
-    141094,
-    101410,
-    32594,
-    119983,
-    153514,
-    46183,
-    20129,
-    153614,
-    176866,
-    92107,
-    159275,
-    115620,
-    4154,
-    128421,
-    104230,
-    148090,
-    150128,
-    110305,
-    154869,
-    41197,
-    28018,
-    145499,
-    129783,
-    175634,
-    154918,
-    170916,
-    163390,
-    113231,
-    132377,
-    78276,
-    60260,
-    27267,
-    22457,
-    24494,
-    64727,
-    3189,
-    48369,
-    86360,
-    152310,
-    110878,
-    61406,
-    34290,
-    145232,
-    103928,
-    137620,
-    30753,
-    100976,
-    103201,
-    6351,
-    163371,
-    72278,
-    61866,
-    170660,
-    70357,
-    178150,
-    143776,
-    113295,
-    164578,
-    122263,
-    85446,
-    86659,
-    100110,
-    86529,
-    29896,
-    173635,
-    130483,
-    129264,
-    42138,
-    20644,
-    82411,
-    108630,
-    121323,
-    156277,
-    32141,
-    108240,
-    167336,
-    104511,
-    21812,
-    24515,
-    152525,
-    85499,
-    46655,
-    174329,
-    161875,
-    154427,
-    84861,
-    138816,
-    167500,
-    63768,
-    145480,
-    127406,
-    173978,
-    169826,
-    92134,
-    36292,
-    11113,
-    130318,
-    4609,
-    5944,
-    83643,
-    96244,
-    96607,
-    16165,
-    49022,
-    27607,
-    172358,
-    169623,
-    138277,
-    25890,
-    90742,
-    164954,
-    113110,
-    92558,
-    153388,
-    63153,
-    32715,
-    135767,
-    24852,
-    18624,
-    94360,
-    108728,
-    169780,
-    142385,
-    29305,
-    66952,
-    139056,
-    109404,
-    40714,
-    38012,
-    173910,
-    110477,
-    124546,
-    84184,
-    87845,
-    42638,
-    1632,
-    172353,
-    57700,
-    115952,
-    148290,
-    175290,
-    58811,
-    17273,
-    28310,
-    141201,
-    24767,
-    162374,
-    103667,
-    125126,
-    109954,
-    150256,
-    169043,
-    141616,
-    103958,
-    89701,
-    80937,
-    88206,
-    163536,
-    63577,
-    22273,
-    167833,
-    20714,
-    124815,
-    61509,
-    124788,
-    67994,
-    59630,
-    166823,
-    123174,
-    167897,
-    168106,
-    40177,
-    53280,
-    164690,
-    66831,
-    76476,
-    67043,
-    82371,
-    101274,
-    90318,
-    54774,
-    150473,
-    44097,
-    156358,
-    47926,
-    99194,
-    66792,
-    147103,
-    160358,
-    34291,
-    155000,
-    23626,
-    60158,
-    132262,
-    127724,
-    21890,
-    58058,
-    40773,
-    128502,
-    89723,
-    92882,
-    139015,
-    105120,
-    135978,
-    23242,
-    35448,
-    174985,
-    93010,
-    124270,
-    9606,
-    168788,
-    51386,
-    42487,
-    172106,
-    119464,
-    9061,
-    52915,
-    99440,
-    75731,
-    69269,
-    115251,
-    129365,
-    82153,
-    170280,
-    113447,
-    39301,
-    43765,
-    115494,
-    73549,
-    153758,
-    155669,
-    50941,
-    170209,
-    179734,
-    127190,
-    150801,
-    106423,
-    57463,
-    16835,
-    151185,
-    112034,
-    49587,
-    153250,
-    119124,
-    88287,
-    2776,
-    113402,
-    141778,
-    86614,
-    53043,
-    38269,
-    89473,
-    71464,
-    137195,
-    120868,
-    107144,
-    138302,
-    28423,
-    156320,
-    45307,
-    113397,
-    124870,
-    119796,
-    166637,
-    109143,
-    64443,
-    91077,
-    18275,
-    137981,
-    136924,
-    317,
-    126496,
-    170275,
-    50493,
-    172632,
-    26423,
-    11567,
-    143664,
-    132069,
-    65372,
-    6650,
-    103072,
-    121583,
-    161916,
-    147431,
-    91969,
-    171064,
-    71928,
-    6002,
-    3930,
-    60213,
-    166916,
-    29932,
-    51828,
-    97589,
-    31423,
-    27977,
-    43682,
-    4699,
-    80708,
-    149281,
-    92451,
-    66566,
-    6237,
-    60728,
-    131490,
-    39115,
-    80687,
-    141390,
-    131550,
-    165954,
-    5471,
-    87782,
-    56200,
-    120568,
-    128009,
-    103506,
-    138821,
-    161465,
-    45611,
-    74521,
-    168966,
-    50766,
-    510,
-    39473,
-    155559,
-    164590,
-    25142,
-    22410,
-    141185,
-    94424,
-    135640,
-    45207,
-    42757,
-    115101,
-    100055,
-    56346,
-    170615,
-    76107,
-    95252,
-    79308,
-    34192,
-    33201,
-    170420,
-    170855,
-    33641,
-    30777,
-    155789,
-    83024,
-    20376,
-    83476,
-    43569,
-    179172,
-    39144,
-    118649,
-    9312,
-    165310,
-    125249,
-    19745,
-    101725,
-    149918,
-    7794,
-    175526,
-    155006,
-    175081,
-    100662,
-    136805,
-    137937,
-    45607,
-    124959,
-    35625,
-    132865,
-    3383,
-    117642,
-    5245,
-    166468,
-    99196,
-    56234,
-    74154,
-    64360,
-    30095,
-    46603,
-    15109,
-    138214,
-    43573,
-    56560,
-    83612,
-    148545,
-    55457,
-    129705,
-    173329,
-    86196,
-    862,
-    111183,
-    130894,
-    31858,
-    34797,
-    107244,
-    36666,
-    152011,
-    145195,
-    84450,
-    80833,
-    13694,
-    136679,
-    151544,
-    150628,
-    70243,
-    131475,
-    40977,
-    72704,
-    20909,
-    56267,
-    58542,
-    15512,
-    152584,
-    42804,
-    84672,
-    60136,
-    8921,
-    168795,
-    71689,
-    111217,
-    82633,
-    46974,
-    162724,
-    95510,
-    117370,
-    48218,
-    176230,
-    103644,
-    11157,
-    172273,
-    24179,
-    114038,
-    138889,
-    131619,
-    9904,
-    113662,
-    160085,
-    170197,
-    72965,
-    17991,
-    155770,
-    144180,
-    30102,
-    162193,
-    113222,
-    4033,
-    146657,
-    109579,
-    132378,
-    118719,
-    5792,
-    17556,
-    54779,
-    70937,
-    149522,
-    103680,
-    141427,
-    100381,
-    161269,
-    58088,
-    80790,
-    76722,
-    175802,
-    90040,
-    127752,
-    98465,
-    96096,
-    139256,
-    172405,
-    54772,
-    179947,
-    131845,
-    57890,
-    38124,
-    156340,
-    164254,
-    76495,
-    8260,
-    56737,
-    143426,
-    100654,
-    117948,
-    118100,
-    130347,
-    16885,
-    123420,
-    75739,
-    47609,
-    147137,
-    143581,
-    60508,
-    161288,
-    27863,
-    134557,
-    158312,
-    61190,
-    69970,
-    76659,
-    130285,
-    71436,
-    149286,
-    60856,
-    139941,
-    104547,
-    110663,
-    87870,
-    126527,
-    30420,
-    39002,
-    95010,
-    144441,
-    7141,
-    104119,
-    163138,
-    71066,
-    103923,
-    121580,
-    121201,
-    81186,
-    18218,
-    47677,
-    161973,
-    136621,
-    103749,
-    123454,
-    23683,
-    93507,
-    101944,
-    142676,
-    21594,
-    25858,
-    154581,
-    125290,
-    32730,
-    33140,
-    16391,
-    21187,
-    30903,
-    119153,
-    110456,
-    178145,
-    114683,
-    162459,
-    14342,
-    69790,
-    57841,
-    21699,
-    89114,
-    162889,
-    35317,
-    161537,
-    11849,
-    72950,
-    21417,
-    128904,
-    35170,
-    150836,
-    101342,
-    156376,
-    55747,
-    49479,
-    92564,
-    133518,
-    63145,
-    18886,
-    83589,
-    118679,
-    123698,
-    34770,
-    135606,
-    101840,
-    25417,
-    111701,
-    142328,
-    168302,
-    57112,
-    168731,
-    154287,
-    129305,
-    162937,
-    71956,
-    146683,
-    23188,
-    74677,
-    53742,
-    173399,
-    145676,
-    24672,
-    141135,
-    144226,
-    44043,
-    119577,
-    121295,
-    92731,
-    124425,
-    5526,
-    140958,
-    134204,
-    47765,
-    109810,
-    123826,
-    121120,
-    47828,
-    127237,
-    128661,
-    98877,
-    90563,
-    136296,
-    87710,
-    13679,
-    51050,
-    66868,
-    23541,
-    77351,
-    107000,
-    66227,
-    80134,
-    59585,
-    77037,
-    79496,
-    3056,
-    52968,
-    4628,
-    6048,
-    91440,
-    57694,
-    165953,
-    93385,
-    18912,
-    44856,
-    22282,
-    123998,
-    108851,
-    10373,
-    22019,
-    162435,
-    158954,
-    63142,
-    157626,
-    151936,
-    120245,
-    72026,
-    121698,
-    27401,
-    112318,
-    178369,
-    124446,
-    24378,
-    90494,
-    110690,
-    3368,
-    179253,
-    54988,
-    22619,
-    14232,
-    91803,
-    29668,
-    114314,
-    52738,
-    110000,
-    5487,
-    11607,
-    53442,
-    49586,
-    71480,
-    20765,
-    57662,
-    39484,
-    138795,
-    144777,
-    43962,
-    33740,
-    161906,
-    7059,
-    65014,
-    84260,
-    72093,
-    9682,
-    17182,
-    146368,
-    159551,
-    103003,
-    157007,
-    154029,
-    9566,
-    109401,
-    119262,
-    177226,
-    127702,
-    21965,
-    78692,
-    167718,
-    15820,
-    165210,
-    115338,
-    167152,
-    115529,
-    93512,
-    85248,
-    13158,
-    11792,
-    103438,
-    113779,
-    154312,
-    141174,
-    156941,
-    139034,
-    165143,
-    37204,
-    92037,
-    136303,
-    119164,
-    28384,
-    54718,
-    56512,
-    55760,
-    6804,
-    159306,
-    115382,
-    36597,
-    19911,
-    11265,
-    113915,
-    81677,
-    118305,
-    103554,
-    106506,
-    66050,
-    30673,
-    24928,
-    66890,
-    172026,
-    48092,
-    107384,
-    61814,
-    59255,
-    14085,
-    61412,
-    44147,
-    112778,
-    13419,
-    72175,
-    145009,
-    15560,
-    155128,
-    30372,
-    26427,
-    79196,
-    90590,
-    36463,
-    58464,
-    114264,
-    69971,
-    87730,
-    13814,
-    31615,
-    105343,
-    105172,
-    65281,
-    9181,
-    38772,
-    67700,
-    57946,
-    109137,
-    144723,
-    147568,
-    38265,
-    81310,
-    49468,
-    144156,
-    145445,
-    142364,
-    110334,
-    139843,
-    83145,
-    104785,
-    53914,
-    103233,
-    32451,
-    36038,
-    159099,
-    147023,
-    120744,
-    48858,
-    133674,
-    87037,
-    16657,
-    155419,
-    107591,
-    156624,
-    33423,
-    104492,
-    12331,
-    29569,
-    117215,
-    28509,
-    149251,
-    72578,
-    116341,
-    19872,
-    148819,
-    137680,
-    142661,
-    55045,
-    84928,
-    163884,
-    79487,
-    142763,
-    88734,
-    52388,
-    8062,
-    178125,
-    37287,
-    137833,
-    176841,
-    152651,
-    103164,
-    131826,
-    138398,
-    140127,
-    94781,
-    132958,
-    18845,
-    55979,
-    39200,
-    42522,
-    4855,
-    53506,
-    70715,
-    160412,
-    51499,
-    38792,
-    171792,
-    64877,
-    5954,
-    169222,
-    47833,
-    155926,
-    119604,
-    124527,
-    46070,
-    6561,
-    118969,
-    20352,
-    52555,
-    43466,
-    95338,
-    15685,
-    128683,
-    31963,
-    108717,
-    119765,
-    149443,
-    139518,
-    179667,
-    151480,
-    162880,
-    105030,
-    86753,
-    32057,
-    156312,
-    42700,
-    65315,
-    99579,
-    106880,
-    36353,
-    60383,
-    116234,
-    35811,
-    5669,
-    168919,
-    75938,
-    73007,
-    14041,
-    45537,
-    85747,
-    152557,
-    121091,
-    110824,
-    176329,
-    23511,
-    106302,
-    166546,
-    128715,
-    20959,
-    12160,
-    77671,
-    173053,
-    132114,
-    74028,
-    80362,
-    57576,
-    62504,
-    29280,
-    22519,
-    178090,
-    14463,
-    119145,
-    149574,
-    107140,
-    83225,
-    132020,
-    175401,
-    96377,
-    7654,
-    37415,
-    158469,
-    65253,
-    68223,
-    144620,
-    50640,
-    134025,
-    21243,
-    28494,
-    10666,
-    56166,
-    176277,
-    75429,
-    150213,
-    129357,
-    14900,
-    7487,
-    30650,
-    100820,
-    18824,
-    70052,
-    164185,
-    106377,
-    2189,
-    158958,
-    61137,
-    89917,
-    157159,
-    13324,
-    122329,
-    144359,
-    165035,
-    170989,
-    20466,
-    142341,
-    38901,
-    9750,
-    54248,
-    15831,
-    112582,
-    143319,
-    143057,
-    69270,
-    108522,
-    146052,
-    161600,
-    132224,
-    175406,
-    54092,
-    308,
-    76775,
-    171992,
-    119493,
-    62343,
-    121302,
-    95239,
-    130797,
-    107515,
-    123312,
-    58258,
-    99346,
-    96978,
-    141369,
-    43460,
-    16952,
-    164500,
-    163795,
-    49859,
-    89481,
-    53894,
-    57550,
-    107847,
-    11381,
-    162123,
-    84317,
-    17936,
-    161910,
-    123363,
-    48467,
-    82041,
-    16340,
-    106965,
-    69020,
-    30004,
-    92836,
-    171379,
-    49083,
-    145003,
-    67978,
-    132090,
-    119721,
-    103155,
-    150753,
-    59209,
-    61459,
-    115832,
-    30459,
-    142464,
-    52206,
-    82198,
-    82591,
-    147759,
-    75512,
-    8079,
-    90713,
-    19869,
-    170475,
-    50991,
-    61223,
-    97505,
-    9010,
-    168863,
-    31162,
-    21748,
-    153311,
-    174893,
-    18619,
-    9673,
-    88686,
-    143821,
-    45892,
-    38466,
-    17147,
-    34567,
-    138531,
-    57658,
-    129155,
-    122517,
-    93141,
-    8032,
-    15085,
-    10767,
-    90762,
-    5758,
-    164739,
-    103062,
-    135296,
-    29961,
-    149931,
-    107268,
-    165122,
-    16902,
-    171933,
-    2986,
-    159928,
-    55632,
-    82535,
-    154743,
-    62161,
-    105006,
-    89548,
-    48678,
-    18920,
-    107611,
-    60162,
-    108557,
-    129440,
-    36748,
-    128948,
-    105860,
-    123318,
-    27839,
-    79586,
-    87900,
-    122224,
-    103633,
-    92439,
-    38325,
-    91786,
-    101500,
-    36374,
-    131298,
-    28924,
-    63189,
-    169081,
-    142506,
-    12956,
-    109298,
-    10706,
-    28892,
-    175883,
-    11318,
-    99929,
-    138181,
-    158495,
-    140300,
-    100046,
-    169838,
-    152914,
-    93285,
-    112154,
-    43670,
-    168216,
-    176857,
-    46362,
-    34050,
-    82430,
-    127033,
-    113227,
-    115576,
-    40207,
-    62869,
-    114254,
-    64612,
-    6545,
-    118973,
-    41526,
-    177032,
-    22786,
-    100596,
-    74868,
-    148965,
-    70239,
-    52547,
-    107906,
-    105412,
-    124238,
-    151526,
-    68952,
-    55791,
-    133297,
-    40590,
-    107619,
-    51064,
-    123080,
-    38564,
-    16646,
-    1452,
-    86696,
-    153254,
-    115705,
-    58917,
-    133581,
-    22544,
-    72881,
-    174339,
-    92555,
-    126434,
-    62036,
-    170708,
-    162248,
-    30101,
-    52847,
-    116823,
-    123024,
-    52422,
-    79345,
-    39294,
-    33348,
-    171311,
-    140630,
-    25175,
-    39693,
-    147894,
-    55738,
-    85085,
-    24667,
-    162060,
-    160529,
-    104266,
-    35803,
-    117573,
-    89718,
-    121592,
-    74793,
-    161927,
-    174738,
-    141965,
-    164842,
-    141314,
-    8055,
-    43869,
-    107640,
-    95519,
-    75533,
-    69636,
-    106492,
-    77007,
-    17331,
-    140222,
-    28398,
-    14386,
-    97025,
-    138394,
-    172570,
-    38476,
-    65928,
-    164917,
-    110700,
-    56149,
-    164534,
-    66901,
-    164761,
-    57625,
-    110550,
-    31373,
-    37963,
-    70037,
-    123788,
-    179019,
-    12238,
-    89400,
-    111527,
-    149520,
-    3431,
-    76597,
-    19634,
-    178682,
-    6773,
-    71486,
-    108959,
-    156345,
-    33145,
-    143831,
-    165665,
-    87391,
-    149742,
-    78182,
-    128007,
-    126437,
-    175109,
-    46738,
-    43632,
-    162231,
-    56128,
-    147846,
-    45236,
-    67765,
-    64163,
-    38489,
-    69299,
-    42333,
-    60034,
-    39684,
-    142732,
-    56295,
-    29485,
-    10337,
-    116470,
-    17849,
-    10326,
-    177121,
-    103,
-    155508,
-    91591,
-    104577,
-    64524,
-    119624,
-    106303,
-    171899,
-    153242,
-    13868,
-    157429,
-    26313,
-    69829,
-    76259,
-    642,
-    44951,
-    156586,
-    6427,
-    98213,
-    57507,
-    23136,
-    22473,
-    50754,
-    83410,
-    117528,
-    154116,
-    106033,
-    31931,
-    90556,
-    86990,
-    9663,
-    97513,
-    103032,
-    94615,
-    115011,
-    57401,
-    114932,
-    47809,
-    85513,
-    137354,
-    15291,
-    94622,
-    92094,
-    135759,
-    57857,
-    54365,
-    117337,
-    75154,
-    41320,
-    6516,
-    92852,
-    84220,
-    97920,
-    122198,
-    137341,
-    85162,
-    81781,
-    35659,
-    53327,
-    112018,
-    19951,
-    174482,
-    9459,
-    157011,
-    79817,
-    87040,
-    34095,
-    7722,
-    119337,
-    87831,
-    59893,
-    92212,
-    169472,
-    20174,
-    16450,
-    161758,
-    145976,
-    34258,
-    114790,
-    131269,
-    79692,
-    146952,
-    45390,
-    117076,
-    85399,
-    15721,
-    31258,
-    57809,
-    164313,
-    98939,
-    155032,
-    156908,
-    50569,
-    98924,
-    92293,
-    173132,
-    107401,
-    111936,
-    62042,
-    69948,
-    12466,
-    94899,
-    97280,
-    85071,
-    50467,
-    60643,
-    79181,
-    106902,
-    38212,
-    163348,
-    93380,
-    166739,
-    44726,
-    131899,
-    77072,
-    176473,
-    29828,
-    167663,
-    149327,
-    62874,
-    60752,
-    77309,
-    43738,
-    64196,
-    23678,
-    134446,
-    147944,
-    65878,
-    108908,
-    78075,
-    48348,
-    162276,
-    136791,
-    80726,
-    67739,
-    26330,
-    166855,
-    57951,
-    127798,
-    67988,
-    159998,
-    148714,
-    102392,
-    32859,
-    145091,
-    138641,
-    94880,
-    107035,
-    168024,
-    69303,
-    128484,
-    53561,
-    22018,
-    20170,
-    9492,
-    68155,
-    18662,
-    78523,
-    114681,
-    81599,
-    30233,
-    56382,
-    127537,
-    133424,
-    178351,
-    8954,
-    29410,
-    75983,
-    72507,
-    46133,
-    58580,
-    161567,
-    23745,
-    120202,
-    87192,
-    136110,
-    165277,
-    98513,
-    74127,
-    57294,
-    155696,
-    2307,
-    43781,
-    159631,
-    98885,
-    119063,
-    105095,
-    16920,
-    78681,
-    52246,
-    140152,
-    46968,
-    5950,
-    65175,
-    124739,
-    14291,
-    8396,
-    53567,
-    30803,
-    167388,
-    74656,
-    177251,
-    49124,
-    130953,
-    141051,
-    169252,
-    45595,
-    179755,
-    225,
-    51564,
-    8943,
-    142873,
-    92669,
-    43666,
-    115750,
-    118147,
-    7164,
-    165900,
-    159544,
-    163416,
-    4813,
-    118223,
-    126726,
-    169498,
-    52078,
-    73538,
-    4174,
-    11925,
-    126265,
-    149869,
-    66689,
-    171527,
-    106503,
-    114950,
-    176888,
-    161285,
-    167602,
-    45464,
-    101118,
-    162671,
-    40957,
-    107984,
-    137068,
-    108366,
-    85444,
-    116752,
-    167374,
-    153513,
-    178409,
-    114399,
-    42592,
-    78378,
-    92086,
-    178151,
-    6485,
-    46480,
-    54955,
-    153206,
-    52212,
-    382,
-    11129,
-    130023,
-    81072,
-    162425,
-    52283,
-    135977,
-    39402,
-    172733,
-    84779,
-    176417,
-    16788,
-    122944,
-    38240,
-    66507,
-    103092,
-    5874,
-    47490,
-    171776,
-    146188,
-    31685,
-    173943,
-    98565,
-    170843,
-    2789,
-    50153,
-    51870,
-    144787,
-    130124,
-    142684,
-    178218,
-    153480,
-    26847,
-    159764,
-    120175,
-    15356,
-    94095,
-    51894,
-    168155,
-    92458,
-    78384,
-    179763,
-    143498,
-    167972,
-    34335,
-    147589,
-    137468,
-    113686,
-    43566,
-    14227,
-    70731,
-    69779,
-    81289,
-    23628,
-    37835,
-    144260,
-    74602,
-    135576,
-    47644,
-    103965,
-    46146,
-    78084,
-    135103,
-    117844,
-    105681,
-    172639,
-    49517,
-    161796,
-    138536,
-    164376,
-    166537,
-    114034,
-    15917,
-    107719,
-    167178,
-    12800,
-    169640,
-    36952,
-    8803,
-    118807,
-    39429,
-    127335,
-    75175,
-    18959,
-    75659,
-    59743,
-    97484,
-    140915,
-    142560,
-    176673,
-    103265,
-    30784,
-    113734,
-    56802,
-    160263,
-    96842,
-    91213,
-    80047,
-    23177,
-    142427,
-    166950,
-    75671,
-    74380,
-    55607,
-    8710,
-    106078,
-    93313,
-    56254,
-    62193,
-    170057,
-    175582,
-    148284,
-    130203,
-    135290,
-    64125,
-    169343,
-    140192,
-    154251,
-    90689,
-    3161,
-    56391,
-    14252,
-    4399,
-    37273,
-    155698,
-    65254,
-    119080,
-    166828,
-    19297,
-    29021,
-    137507,
-    32557,
-    5651,
-    20070,
-    106508,
-    42498,
-    170613,
-    22268,
-    103741,
-    152111,
-    108980,
-    8968,
-    5548,
-    138129,
-    76829,
-    34961,
-    175779,
-    49486,
-    98435,
-    46048,
-    26043,
-    94637,
-    49277,
-    116017,
-    7733,
-    166894,
-    88985,
-    113941,
-    112098,
-    138903,
-    143543,
-    64250,
-    108172,
-    148091,
-    111807,
-    171204,
-    60573,
-    117872,
-    51581,
-    11513,
-    24953,
-    169085,
-    114775,
-    71832,
-    12518,
-    118929,
-    108938,
-    158762,
-    102130,
-    78099,
-    113342,
-    54977,
-    145947,
-    29112,
-    6954,
-    42304,
-    171110,
-    28556,
-    78638,
-    51889,
-    50207,
-    36121,
-    11863,
-    107839,
-    72835,
-    104523,
-    82017,
-    124282,
-    95579,
-    51314,
-    46816,
-    59713,
-    90818,
-    71083,
-    81350,
-    117714,
-    11986,
-    161603,
-    148806,
-    132541,
-    45866,
-    96937,
-    173357,
-    132080,
-    171359,
-    59128,
-    167304,
-    153628,
-    118902,
-    116029,
-    5066,
-    161970,
-    87140,
-    98626,
-    20671,
-    91557,
-    108931,
-    22223,
-    61279,
-    88296,
-    2047,
-    79009,
-    150884,
-    77204,
-    60259,
-    48161,
-    118687,
-    100911,
-    17475,
-    167027,
-    57920,
-    127802,
-    38600,
-    9561,
-    52611,
-    128606,
-    112972,
-    137613,
-    37153,
-    85260,
-    14985,
-    104068,
-    136594,
-    30572,
-    131372,
-    103460,
-    41363,
-    103840,
-    11610,
-    179784,
-    179724,
-    54572,
-    179066,
-    15692,
-    137887,
-    168929,
-    38952,
-    46518,
-    141690,
-    18649,
-    49347,
-    55400,
-    174132,
-    170006,
-    155960,
-    59082,
-    166988,
-    129220,
-    62096,
-    44426,
-    64851,
-    54637,
-    157809,
-    151696,
-    98103,
-    56204,
-    111393,
-    25113,
-    172683,
-    4679,
-    119627,
-    78683,
-    115387,
-    36532,
-    35041,
-    69250,
-    35365,
-    20774,
-    59456,
-    137667,
-    35681,
-    139744,
-    78067,
-    77743,
-    169129,
-    64130,
-    74480,
-    160587,
-    79270,
-    97576,
-    90376,
-    174453,
-    15286,
-    141673,
-    155587,
-    56511,
-    84062,
-    149630,
-    174437,
-    15041,
-    7412,
-    38369,
-    72166,
-    5038,
-    75397,
-    179597,
-    94723,
-    34209,
-    35480,
-    116636,
-    163729,
-    41912,
-    111406,
-    177550,
-    68349,
-    137623,
-    111685,
-    156709,
-    6527,
-    125687,
-    117084,
-    17706,
-    28146,
-    11820,
-    86812,
-    168826,
-    127821,
-    132830,
-    133100,
-    38103,
-    140687,
-    80774,
-    106018,
-    114974,
-    146915,
-    30385,
-    179944,
-    48834,
-    14343,
-    96840,
-    116043,
-    14514,
-    142158,
-    12710,
-    171787,
-    143881,
-    158531,
-    51509,
-    86554,
-    40823,
-    54467,
-    25414,
-    36031,
-    95846,
-    62867,
-    77118,
-    117231,
-    76799,
-    14520,
-    128409,
-    111586,
-    7136,
-    153914,
-    92774,
-    127921,
-    169637,
-    119049,
-    157065,
-    51307,
-    45821,
-    114508,
-    237,
-    3795,
-    157588,
-    15815,
-    94216,
-    41643,
-    50662,
-    93331,
-    67331,
-    32318,
-    36997,
-    128564,
-    102603,
-    44916,
-    28649,
-    131962,
-    57556,
-    111901,
-    119613,
-    124076,
-    107070,
-    47597,
-    120107,
-    168727,
-    179885,
-    92455,
-    135514,
-    91397,
-    139437,
-    127471,
-    95518,
-    148493,
-    75421,
-    56319,
-    53885,
-    33821,
-    33104,
-    160490,
-    95277,
-    99314,
-    129710,
-    168319,
-    152653,
-    148327,
-    118120,
-    80083,
-    8960,
-    30093,
-    62710,
-    150561,
-    136456,
-    153005,
-    115010,
-    102724,
-    85929,
-    94286,
-    147004,
-    27341,
-    30792,
-    107653,
-    101790,
-    130342,
-    12072,
-    2495,
-    67502,
-    23286,
-    81067,
-    125351,
-    4691,
-    166376,
-    84916,
-    142222,
-    85926,
-    2154,
-    162279,
-    135094,
-    149264,
-    178565,
-    69666,
-    155620,
-    68180,
-    87577,
-    28392,
-    27760,
-    36649,
-    52751,
-    64975,
-    149205,
-    157178,
-    15392,
-    155052,
-    99512,
-    122454,
-    9339,
-    84611,
-    125824,
-    162245,
-    18626,
-    12824,
-    170300,
-    174173,
-    40707,
-    47769,
-    171699,
-    147018,
-    60316,
-    85387,
-    74465,
-    11117,
-    173678,
-    25616,
-    43191,
-    30764,
-    88547,
-    29182,
-    114712,
-    150223,
-    35628,
-    156413,
-    100763,
-    177745,
-    106136,
-    102545,
-    179898,
-    89621,
-    23329,
-    157000,
-    153760,
-    123963,
-    63096,
-    74196,
-    36737,
-    19401,
-    155015,
-    99564,
-    66416,
-    28627,
-    145237,
-    101842,
-    126611,
-    20512,
-    24894,
-    62481,
-    16790,
-    5297,
-    173875,
-    137146,
-    82271,
-    175995,
-    164260,
-    129619,
-    104652,
-    21655,
-    2683,
-    7633,
-    167097,
-    33491,
-    39940,
-    13361,
-    2136,
-    54549,
-    60986,
-    113966,
-    117772,
-    39057,
-    40303,
-    102021,
-    84962,
-    129835,
-    101375,
-    104642,
-    162481,
-    166723,
-    99472,
-    76385,
-    71984,
-    26525,
-    129754,
-    44298,
-    137419,
-    133237,
-    163115,
-    37450,
-    54234,
-    162780,
-    176381,
-    95898,
-    57438,
-    103433,
-    160669,
-    168312,
-    137825,
-    108589,
-    46636,
-    153101,
-    78123,
-    63778,
-    165187,
-    5761,
-    3020,
-    106640,
-    164872,
-    68175,
-    17720,
-    153076,
-    80462,
-    91433,
-    144316,
-    2240,
-    45852,
-    2158,
-    18336,
-    64204,
-    80512,
-    19040,
-    87151,
-    12284,
-    59873,
-    161857,
-    35474,
-    111450,
-    23979,
-    6256,
-    163935,
-    25671,
-    33100,
-    107025,
-    2109,
-    61654,
-    80953,
-    134762,
-    79215,
-    135917,
-    25110,
-    77843,
-    153586,
-    143689,
-    11456,
-    161720,
-    7419,
-    178567,
-    166208,
-    143952,
-    91516,
-    10765,
-    141781,
-    132392,
-    6637,
-    83102,
-    177150,
-    155939,
-    150017,
-    70928,
-    46563,
-    3479,
-    143680,
-    85636,
-    6152,
-    581,
-    8222,
-    132535,
-    156355,
-    78081,
-    67031,
-    58713,
-    78299,
-    131842,
-    118340,
-    25215,
-    16584,
-    73113,
-    146179,
-    159253,
-    140162,
-    77429,
-    100619,
-    172530,
-    32410,
-    151587,
-    78561,
-    59384,
-    71874,
-    92175,
-    47094,
-    146954,
-    13551,
-    35678,
-    161672,
-    87792,
-    149754,
-    35533,
-    135677,
-    144974,
-    170601,
-    5394,
-    163691,
-    153954,
-    132964,
-    27700,
-    115818,
-    70161,
-    144255,
-    34049,
-    148163,
-    134044,
-    89069,
-    96348,
-    158702,
-    64441,
-    124366,
-    120597,
-    83449,
-    146780,
-    94999,
-    60193,
-    105211,
-    175742,
-    137552,
-    13532,
-    161559,
-    102644,
-    168473,
-    123964,
-    96234,
-    28960,
-    81133,
-    134321,
-    32239,
-    68880,
-    47015,
-    176259,
-    144256,
-    131985,
-    149564,
-    9649,
-    86108,
-    145758,
-    114757,
-    46862,
-    112996,
-    60404,
-    84648,
-    149169,
-    44957,
-    115348,
-    36482,
-    95416,
-    52262,
-    147860,
-    7695,
-    66854,
-    7154,
-    149736,
-    51612,
-    172761,
-    70824,
-    65993,
-    95511,
-    53555,
-    28780,
-    80234,
-    44958,
-    97244,
-    72979,
-    87136,
-    153090,
-    87784,
-    84189,
-    49210,
-    178384,
-    66848,
-    43267,
-    102925,
-    132683,
-    68467,
-    162189,
-    119692,
-    72413,
-    30290,
-    31200,
-    125222,
-    87092,
-    111729,
-    100561,
-    130578,
-    70372,
-    54349,
-    45470,
-    92748,
-    81963,
-    93882,
-    138574,
-    104462,
-    6595,
-    47771,
-    74473,
-    131131,
-    25248,
-    86087,
-    131610,
-    47503,
-    170897,
-    86452,
-    168288,
-    105174,
-    90923,
-    97430,
-    130201,
-    47848,
-    170037,
-    17494,
-    97789,
-    59364,
-    178742,
-    127199,
-    133834,
-    44409,
-    23605,
-    145783,
-    4144,
-    74876,
-    64998,
-    179342,
-    124041,
-    137561,
-    14749,
-    99120,
-    84494,
-    10874,
-    79512,
-    171879,
-    148708,
-    51381,
-    93573,
-    175935,
-    9164,
-    31255,
-    22066,
-    68177,
-    81509,
-    140699,
-    73708,
-    89907,
-    133645,
-    26988,
-    145146,
-    151737,
-    6245,
-    116491,
-    12638,
-    132837,
-    122539,
-    28455,
-    100090,
-    121749,
-    28306,
-    38846,
-    75211,
-    175020,
-    110281,
-    10240,
-    33327,
-    65161,
-    9948,
-    168514,
-    132374,
-    14839,
-    140544,
-    25701,
-    118415,
-    161350,
-    6729,
-    103598,
-    21314,
-    5175,
-    160301,
-    31268,
-    4068,
-    33572,
-    84988,
-    89682,
-    62689,
-    156984,
-    144293,
-    148967,
-    30303,
-    139,
-    126831,
-    169010,
-    96228,
-    116248,
-    176759,
-    89980,
-    63270,
-    21351,
-    158356,
-    114876,
-    88029,
-    123479,
-    8106,
-    152506,
-    9774,
-    164888,
-    1819,
-    161563,
-    94670,
-    116834,
-    134591,
-    141637,
-    96715,
-    169135,
-    23343,
-    42036,
-    6006,
-    20886,
-    86841,
-    19708,
-    149176,
-    178265,
-    24760,
-    51677,
-    163362,
-    155670,
-    136115,
-    73782,
-    122508,
-    119945,
-    39676,
-    97703,
-    109048,
-    125403,
-    101166,
-    170487,
-    34573,
-    140341,
-    164369,
-    173789,
-    47104,
-    127379,
-    74013,
-    151226,
-    167948,
-    102963,
-    62048,
-    109279,
-    137303,
-    169562,
-    62125,
-    84362,
-    31016,
-    110517,
-    170759,
-    118823,
-    72515,
-    118349,
-    29356,
-    112430,
-    13980,
-    77149,
-    11731,
-    78742,
-    69059,
-    61982,
-    14345,
-    102059,
-    142569,
-    71159,
-    93552,
-    139510,
-    122901,
-    51729,
-    20921,
-    159558,
-    10504,
-    8891,
-    9761,
-    172607,
-    78884,
-    117885,
-    138989,
-    45355,
-    169304,
-    92231,
-    24950,
-    157718,
-    8497,
-    90202,
-    15596,
-    94470,
-    174990,
-    132180,
-    106126,
-    170229,
-    33045,
-    164126,
-    96979,
-    94246,
-    64869,
-    59995,
-    125352,
-    50225,
-    145431,
-    87628,
-    5604,
-    119824,
-    135697,
-    120961,
-    31003,
-    48006,
-    135903,
-    120248,
-    59467,
-    104228,
-    157898,
-    168085,
-    62135,
-    31230,
-    44045,
-    179824,
-    92191,
-    53522,
-    109052,
-    132264,
-    89931,
-    74593,
-    171539,
-    131910,
-    146469,
-    38484,
-    78169,
-    138690,
-    64984,
-    70524,
-    5588,
-    175132,
-    25330,
-    62579,
-    15626,
-    33774,
-    88084,
-    158986,
-    76622,
-    150711,
-    39874,
-    35732,
-    172251,
-    109534,
-    97865,
-    158586,
-    99905,
-    29054,
-    162427,
-    30228,
-    103416,
-    124547,
-    10841,
-    35943,
-    88565,
-    47222,
-    21927,
-    139796,
-    35203,
-    20963,
-    107741,
-    131286,
-    87104,
-    30696,
-    29609,
-    147516,
-    173487,
-    61266,
-    61247,
-    110695,
-    155059,
-    168199,
-    127108,
-    103316,
-    8033,
-    128179,
-    42161,
-    29999,
-    79007,
-    164205,
-    86757,
-    68310,
-    109499,
-    149203,
-    119995,
-    113011,
-    20818,
-    38955,
-    155667,
-    72528,
-    93223,
-    28084,
-    104094,
-    53424,
-    75331,
-    14827,
-    91737,
-    50505,
-    103054,
-    31599,
-    54623,
-    71531,
-    81358,
-    54508,
-    159135,
-    70893,
-    41913,
-    102497,
-    12551,
-    165933,
-    61890,
-    176981,
-    98741,
-    138898,
-    137772,
-    175248,
-    86383,
-    140028,
-    30511,
-    94641,
-    9481,
-    43652,
-    141966,
-    28573,
-    38404,
-    147156,
-    114653,
-    105181,
-    166246,
-    31796,
-    86433,
-    92911,
-    101475,
-    2584,
-    179048,
-    139910,
-    16301,
-    58441,
-    41636,
-    65312,
-    159273,
-    144710,
-    76738,
-    100085,
-    73417,
-    124499,
-    152666,
-    26650,
-    128764,
-    149764,
-    175349,
-    22670,
-    95014,
-    60829,
-    134656,
-    37629,
-    34921,
-    139879,
-    22051,
-    112108,
-    150182,
-    64530,
-    110614,
-    49984,
-    58544,
-    17526,
-    141623,
-    44531,
-    40886,
-    42655,
-    41024,
-    82120,
-    128461,
-    127038,
-    70598,
-    114299,
-    137803,
-    156847,
-    176021,
-    62401,
-    2771,
-    69944,
-    42943,
-    79231,
-    104209,
-    91113,
-    63650,
-    62044,
-    128045,
-    22899,
-    10723,
-    163597,
-    177361,
-    80303,
-    8051,
-    23882,
-    60299,
-    60502,
-    56556,
-    178633,
-    4474,
-    41934,
-    55567,
-    91490,
-    55171,
-    19805,
-    16635,
-    7266,
-    35763,
-    175593,
-    100621,
-    129316,
-    136449,
-    59339,
-    45431,
-    22120,
-    45068,
-    88429,
-    177510,
-    81984,
-    153225,
-    123341,
-    102428,
-    101036,
-    83447,
-    127620,
-    34081,
-    174446,
-    129578,
-    150608,
-    114072,
-    84858,
-    149892,
-    70179,
-    147172,
-    83427,
-    93060,
-    131293,
-    93169,
-    25254,
-    128075,
-    32213,
-    62385,
-    91943,
-    90242,
-    95192,
-    21358,
-    11200,
-    68685,
-    167835,
-    70054,
-    108002,
-    6322,
-    138221,
-    99431,
-    5055,
-    9957,
-    25705,
-    99779,
-    155233,
-    66182,
-    30023,
-    20825,
-    62460,
-    10066,
-    149397,
-    60374,
-    168202,
-    124894,
-    115059,
-    52688,
-    160859,
-    112914,
-    138397,
-    14875,
-    137494,
-    61729,
-    125708,
-    11459,
-    7728,
-    168864,
-    164387,
-    96437,
-    47409,
-    126488,
-    40447,
-    94926,
-    95999,
-    37281,
-    127950,
-    73672,
-    122821,
-    129689,
-    27447,
-    25857,
-    36139,
-    173832,
-    477,
-    80491,
-    117059,
-    122469,
-    140762,
-    174533,
-    178902,
-    41194,
-    139052,
-    57216,
-    57285,
-    27895,
-    46697,
-    147555,
-    37101,
-    83865,
-    123156,
-    84318,
-    70381,
-    64785,
-    130638,
-    70798,
-    94789,
-    139976,
-    5582,
-    147679,
-    27703,
-    148860,
-    19697,
-    39183,
-    45282,
-    48571,
-    3087,
-    167333,
-    156665,
-    54813,
-    81413,
-    64392,
-    29141,
-    81885,
-    134499,
-    48370,
-    150702,
-    64479,
-    71921,
-    95837,
-    64972,
-    93284,
-    135951,
-    68575,
-    126319,
-    130188,
-    18237,
-    56061,
-    22260,
-    41804,
-    80088,
-    172568,
-    109360,
-    107817,
-    55667,
-    42166,
-    34346,
-    5766,
-    127089,
-    55224,
-    173528,
-    92470,
-    27570,
-    19466,
-    171352,
-    96166,
-    78461,
-    53774,
-    93112,
-    119795,
-    84214,
-    60413,
-    145441,
-    18125,
-    80893,
-    165358,
-    10583,
-    43605,
-    164691,
-    64665,
-    16839,
-    36886,
-    65100,
-    117869,
-    131964,
-    67578,
-    22518,
-    31949,
-    109519,
-    42714,
-    141396,
-    66476,
-    127009,
-    176538,
-    153026,
-    149103,
-    175243,
-    115045,
-    68849,
-    104274,
-    133185,
-    54408,
-    16889,
-    46930,
-    52475,
-    48860,
-    39538,
-    110307,
-    72407,
-    38827,
-    111864,
-    51355,
-    111003,
-    117205,
-    6257,
-    37346,
-    24740,
-    129623,
-    70370,
-    159980,
-    50444,
-    91002,
-    141765,
-    6904,
-    44061,
-    83159,
-    13075,
-    128262,
-    26882,
-    134383,
-    176915,
-    84504,
-    11,
-    131948,
-    130360,
-    177620,
-    1047,
-    1707,
-    129123,
-    19950,
-    97306,
-    138895,
-    141114,
-    109147,
-    161759,
-    130958,
-    75929,
-    82820,
-    131922,
-    67093,
-    164914,
-    89695,
-    43595,
-    20766,
-    8748,
-    147655,
-    97935,
-    20233,
-    109196,
-    43440,
-    26238,
-    98816,
-    153437,
-    125821,
-    151278,
-    77882,
-    95812,
-    11100,
-    33294,
-    142165,
-    147889,
-    5512,
-    69913,
-    1812,
-    74972,
-    139185,
-    88786,
-    57864,
-    73620,
-    140770,
-    115304,
-    71130,
-    142065,
-    129144,
-    141734,
-    96743,
-    179389,
-    172052,
-    38595,
-    159781,
-    47169,
-    583,
-    151703,
-    136154,
-    29893,
-    29160,
-    55358,
-    1586,
-    68805,
-    102943,
-    68862,
-    157724,
-    97673,
-    161413,
-    36254,
-    126814,
-    36407,
-    105902,
-    177088,
-    116164,
-    162770,
-    170101,
-    106572,
-    94232,
-    36642,
-    125699,
-    55336,
-    68876,
-    77549,
-    112675,
-    168594,
-    5115,
-    142503,
-    98965,
-    23604,
-    109862,
-    164493,
-    17068,
-    27261,
-    20805,
-    42502,
-    7602,
-    170742,
-    38112,
-    156180,
-    177106,
-    58231,
-    161896,
-    174234,
-    148503,
-    154987,
-    52888,
-    25891,
-    11666,
-    59268,
-    133370,
-    15862,
-    135527,
-    100388,
-    147612,
-    117903,
-    110789,
-    126314,
-    86283,
-    72533,
-    127759,
-    141031,
-    178392,
-    171862,
-    109736,
-    144028,
-    135690,
-    40186,
-    140753,
-    53400,
-    28367,
-    63225,
-    14268,
-    99539,
-    161092,
-    81446,
-    20429,
-    150828,
-    109138,
-    162292,
-    58768,
-    133024,
-    146804,
-    30821,
-    142185,
-    139627,
-    122136,
-    79838,
-    60800,
-    54600,
-    134334,
-    37774,
-    158620,
-    38159,
-    167043,
-    173470,
-    114493,
-    110516,
-    173334,
-    68031,
-    170042,
-    152598,
-    107580,
-    163259,
-    127618,
-    18048,
-    111355,
-    99481,
-    81672,
-    18519,
-    122165,
-    158683,
-    164011,
-    32546,
-    62593,
-    94763,
-    73087,
-    39588,
-    52927,
-    20123,
-    62915,
-    120602,
-    157927,
-    115928,
-    38340,
-    63341,
-    72758,
-    159896,
-    116111,
-    98883,
-    9000,
-    48327,
-    12966,
-    46317,
-    177311,
-    169504,
-    101192,
-    72288,
-    138094,
-    60577,
-    164510,
-    105085,
-    91496,
-    156506,
-    47821,
-    103683,
-    102030,
-    135801,
-    152295,
-    152556,
-    107264,
-    72818,
-    60307,
-    95610,
-    83722,
-    175917,
-    155307,
-    77901,
-    130170,
-    10158,
-    133228,
-    21082,
-    67807,
-    171745,
-    31940,
-    80972,
-    125658,
-    2702,
-    26653,
-    17793,
-    83228,
-    73066,
-    160455,
-    47845,
-    34639,
-    46701,
-    155112,
-    3802,
-    151922,
-    167806,
-    176548,
-    71624,
-    95869,
-    130954,
-    71000,
-    2530,
-    110396,
-    178855,
-    110032,
-    80372,
-    44175,
-    156157,
-    141218,
-    68771,
-    136376,
-    120723,
-    99268,
-    81487,
-    117242,
-    163075,
-    117567,
-    112978,
-    92724,
-    112155,
-    149745,
-    17151,
-    24883,
-    62352,
-    53284,
-    161128,
-    43405,
-    165555,
-    118808,
-    16618,
-    99184,
-    128511,
-    45564,
-    175563,
-    1345,
-    94146,
-    16104,
-    28913,
-    64576,
-    123924,
-    56144,
-    62362,
-    177331,
-    104269,
-    91972,
-    29544,
-    8113,
-    57145,
-    31300,
-    25603,
-    154929,
-    65760,
-    62819,
-    99557,
-    47793,
-    66757,
-    89677,
-    28431,
-    177929,
-    111941,
-    129143,
-    171357,
-    57698,
-    60202,
-    135860,
-    172746,
-    86705,
-    40726,
-    136515,
-    141912,
-    23858,
-    174866,
-    141514,
-    98342,
-    30390,
-    93458,
-    151013,
-    89283,
-    42843,
-    83332,
-    44611,
-    108311,
-    147813,
-    159005,
-    88864,
-    136889,
-    66842,
-    1384,
-    40993,
-    4604,
-    132552,
-    28175,
-    109405,
-    64419,
-    113368,
-    132261,
-    4039,
-    26940,
-    89736,
-    144979,
-    77811,
-    163174,
-    157127,
-    173975,
-    73536,
-    153649,
-    176275,
-    36257,
-    54331,
-    124068,
-    150399,
-    21004,
-    18271,
-    115692,
-    142928,
-    112268,
-    173297,
-    82206,
-    144168,
-    16883,
-    119285,
-    65757,
-    14400,
-    167497,
-    163844,
-    177592,
-    140047,
-    86880,
-    50079,
-    110995,
-    82615,
-    34476,
-    170241,
-    55408,
-    30774,
-    73650,
-    52421,
-    159534,
-    3975,
-    95978,
-    34240,
-    54573,
-    1202,
-    173878,
-    148255,
-    9341,
-    74890,
-    11696,
-    90366,
-    88278,
-    63162,
-    70890,
-    96659,
-    95613,
-    84775,
-    39785,
-    69084,
-    163969,
-    43726,
-    100851,
-    26337,
-    56489,
-    116976,
-    26445,
-    59670,
-    5365,
-    61626,
-    3612,
-    52553,
-    28294,
-    74066,
-    35035,
-    67401,
-    11983,
-    86794,
-    7726,
-    65023,
-    92709,
-    83478,
-    131850,
-    174576,
-    4779,
-    130405,
-    145366,
-    6598,
-    117244,
-    165026,
-    89619,
-    87188,
-    9798,
-    148902,
-    54870,
-    3731,
-    1060,
-    19242,
-    171931,
-    111189,
-    162587,
-    174822,
-    35302,
-    179405,
-    44878,
-    170471,
-    40798,
-    5370,
-    49881,
-    138673,
-    12714,
-    25255,
-    70556,
-    93225,
-    169338,
-    78087,
-    2849,
-    8561,
-    15059,
-    4665,
-    93301,
-    103879,
-    151375,
-    167514,
-    140695,
-    146280,
-    164693,
-    159999,
-    41527,
-    117795,
-    19890,
-    101050,
-    177176,
-    143725,
-    10122,
-    147104,
-    44790,
-    134812,
-    148419,
-    96922,
-    114272,
-    134708,
-    78783,
-    113683,
-    23615,
-    44761,
-    173798,
-    159069,
-    83232,
-    84290,
-    131171,
-    155170,
-    117254,
-    45364,
-    168122,
-    20136,
-    22676,
-    93450,
-    84820,
-    16990,
-    110585,
-    174388,
-    26186,
-    115948,
-    128339,
-    6031,
-    144840,
-    109468,
-    43115,
-    18331,
-    117484,
-    44205,
-    135416,
-    168552,
-    159404,
-    9242,
-    22333,
-    4115,
-    20756,
-    30947,
-    153518,
-    136620,
-    28409,
-    20424,
-    133612,
-    38162,
-    36053,
-    56640,
-    2796,
-    113128,
-    61849,
-    41781,
-    52980,
-    53477,
-    59184,
-    174366,
-    66086,
-    48801,
-    7306,
-    102001,
-    45004,
-    27852,
-    144644,
-    50680,
-    50590,
-    62407,
-    119701,
-    141219,
-    22527,
-    162178,
-    107391,
-    21452,
-    29741,
-    104745,
-    93958,
-    34277,
-    96141,
-    47579,
-    14468,
-    27191,
-    16067,
-    168644,
-    25371,
-    92087,
-    61227,
-    70432,
-    116777,
-    134316,
-    155118,
-    172820,
-    9741,
-    74518,
-    88995,
-    179999,
-    98714,
-    130980,
-    39508,
-    154056,
-    108392,
-    75835,
-    117513,
-    136542,
-    56226,
-    143294,
-    76450,
-    79191,
-    12739,
-    37410,
-    95635,
-    159632,
-    108130,
-    171871,
-    173280,
-    423,
-    109039,
-    1370,
-    124385,
-    62077,
-    162538,
-    162338,
-    137369,
-    175046,
-    106054,
-    149959,
-    25077,
-    60897,
-    154524,
-    106632,
-    96670,
-    10554,
-    147777,
-    165474,
-    169543,
-    108238,
-    116663,
-    57177,
-    128819,
-    85858,
-    9870,
-    26636,
-    62897,
-    70867,
-    20383,
-    174964,
-    70654,
-    133709,
-    7823,
-    151961,
-    73754,
-    155843,
-    23126,
-    119136,
-    21632,
-    21475,
-    124008,
-    95127,
-    147955,
-    2338,
-    145036,
-    22833,
-    138839,
-    102831,
-    169196,
-    27835,
-    143172,
-    76170,
-    55416,
-    114638,
-    25587,
-    122230,
-    122012,
-    102194,
-    47615,
-    49414,
-    44354,
-    8753,
-    39810,
-    79506,
-    126645,
-    82223,
-    41927,
-    44959,
-    10150,
-    75551,
-    128119,
-    110262,
-    176481,
-    55447,
-    145477,
-    29331,
-    8398,
-    130962,
-    63947,
-    10772,
-    33836,
-    122585,
-    35426,
-    166482,
-    104307,
-    56794,
-    77012,
-    170584,
-    119730,
-    144775,
-    145472,
-    126952,
-    114123,
-    145410,
-    153546,
-    150219,
-    168991,
-    140168,
-    130248,
-    804,
-    179706,
-    30994,
-    142294,
-    41124,
-    75744,
-    37776,
-    160347,
-    50667,
-    37414,
-    173466,
-    144682,
-    149663,
-    122927,
-    158585,
-    136797,
-    125697,
-    52649,
-    174207,
-    74440,
-    119707,
-    72885,
-    76007,
-    34886,
-    59772,
-    161828,
-    147417,
-    172035,
-    82759,
-    141097,
-    49284,
-    39096,
-    74169,
-    135084,
-    91617,
-    175026,
-    119183,
-    16914,
-    97437,
-    46367,
-    143200,
-    21138,
-    178332,
-    9631,
-    162978,
-    165364,
-    125024,
-    72563,
-    68688,
-    59927,
-    108525,
-    70801,
-    24079,
-    17642,
-    90526,
-    27252,
-    108372,
-    77382,
-    132951,
-    126579,
-    123580,
-    151012,
-    130118,
-    58716,
-    154593,
-    25493,
-    162956,
-    137230,
-    175989,
-    111008,
-    37072,
-    88730,
-    166681,
-    96472,
-    29128,
-    172049,
-    48062,
-    31936,
-    75991,
-    48541,
-    119530,
-    106676,
-    27323,
-    169358,
-    37842,
-    111052,
-    50130,
-    83995,
-    44070,
-    166927,
-    106445,
-    9975,
-    103289,
-    166323,
-    137626,
-    9985,
-    17656,
-    102672,
-    99158,
-    5078,
-    112396,
-    5999,
-    100738,
-    177728,
-    31182,
-    157396,
-    92090,
-    94178,
-    6576,
-    123563,
-    94392,
-    136952,
-    21722,
-    86011,
-    163789,
-    78967,
-    65397,
-    63299,
-    171382,
-    28432,
-    16115,
-    152204,
-    135825,
-    102671,
-    174632,
-    65965,
-    85850,
-    43219,
-    153897,
-    3995,
-    86826,
-    70497,
-    98240,
-    123551,
-    113722,
-    149890,
-    18960,
-    213,
-    137960,
-    171176,
-    98651,
-    171403,
-    147704,
-    62387,
-    34167,
-    107295,
-    144449,
-    119423,
-    161748,
-    153564,
-    326,
-    70240,
-    86082,
-    18563,
-    66370,
-    90090,
-    38610,
-    12233,
-    90618,
-    127578,
-    77738,
-    116902,
-    134715,
-    150633,
-    169906,
-    163266,
-    30217,
-    145159,
-    16261,
-    25475,
-    146372,
-    141807,
-    93235,
-    168971,
-    13867,
-    58191,
-    73229,
-    165660,
-    112114,
-    145757,
-    44095,
-    10949,
-    145085,
-    90181,
-    22748,
-    23058,
-    78086,
-    148467,
-    13040,
-    105132,
-    47532,
-    80427,
-    167118,
-    6603,
-    12579,
-    122891,
-    29630,
-    39722,
-    139469,
-    19851,
-    61811,
-    101588,
-    97283,
-    118182,
-    108675,
-    165327,
-    65274,
-    148983,
-    21375,
-    168551,
-    108602,
-    144829,
-    122815,
-    168010,
-    30647,
-    59659,
-    98183,
-    136976,
-    147624,
-    46275,
-    59034,
-    63368,
-    93834,
-    4295,
-    5111,
-    89066,
-    14421,
-    78036,
-    101916,
-    177379,
-    73064,
-    153472,
-    167880,
-    156773,
-    97499,
-    76470,
-    171511,
-    3785,
-    105171,
-    66793,
-    177382,
-    68727,
-    97455,
-    82362,
-    80244,
-    80079,
-    11384,
-    112724,
-    109297,
-    46232,
-    118586,
-    115270,
-    150319,
-    159993,
-    38981,
-    118682,
-    53986,
-    3627,
-    176602,
-    23460,
-    11104,
-    122360,
-    81967,
-    169887,
-    49808,
-    22851,
-    70440,
-    52373,
-    22342,
-    41796,
-    110503,
-    61624,
-    5579,
-    161819,
-    152434,
-    5672,
-    116316,
-    87487,
-    3908,
-    106744,
-    63407,
-    113789,
-    85193,
-    103147,
-    28354,
-    70897,
-    36436,
-    39155,
-    15086,
-    81485,
-    172649,
-    149432,
-    3076,
-    147737,
-    143580,
-    32425,
-    74417,
-    93889,
-    42324,
-    95702,
-    95033,
-    87335,
-    103847,
-    65103,
-    158707,
-    35648,
-    95012,
-    133570,
-    118866,
-    52407,
-    70978,
-    27078,
-    88586,
-    163246,
-    83085,
-    25149,
-    301,
-    179001,
-    158861,
-    132386,
-    49166,
-    68512,
-    53827,
-    73966,
-    34544,
-    157313,
-    77800,
-    67868,
-    40903,
-    1421,
-    151018,
-    155206,
-    135273,
-    178517,
-    86368,
-    58934,
-    146219,
-    112746,
-    63107,
-    50265,
-    134292,
-    110954,
-    99951,
-    114820,
-    58779,
-    47760,
-    40705,
-    80713,
-    145141,
-    100237,
-    129259,
-    138879,
-    140476,
-    136979,
-    100278,
-    27800,
-    37726,
-    69848,
-    154520,
-    115309,
-    45617,
-    98650,
-    139027,
-    26659,
-    73636,
-    177186,
-    7047,
-    137475,
-    75693,
-    71628,
-    97682,
-    41532,
-    166214,
-    85859,
-    168779,
-    121119,
-    124099,
-    165758,
-    111214,
-    45144,
-    102502,
-    64963,
-    120841,
-    138658,
-    36990,
-    69849,
-    155907,
-    144079,
-    108820,
-    138927,
-    37513,
-    153497,
-    127687,
-    115544,
-    130200,
-    35722,
-    148415,
-    157117,
-    85584,
-    1226,
-    151801,
-    50798,
-    143045,
-    108021,
-    119008,
-    166067,
-    16247,
-    179677,
-    157466,
-    6927,
-    99623,
-    31590,
-    14135,
-    15649,
-    134341,
-    175725,
-    20205,
-    154778,
-    146738,
-    67582,
-    26588,
-    33902,
-    103524,
-    96929,
-    16058,
-    67671,
-    34215,
-    23841,
-    97483,
-    134371,
-    1454,
-    100746,
-    80683,
-    72066,
-    54067,
-    110963,
-    61345,
-    17594,
-    174967,
-    161146,
-    81372,
-    15894,
-    62899,
-    127557,
-    2800,
-    40945,
-    48677,
-    142345,
-    60701,
-    168624,
-    13385,
-    152810,
-    34088,
-    70523,
-    125173,
-    137689,
-    37114,
-    125712,
-    15962,
-    160664,
-    137670,
-    160729,
-    65091,
-    3716,
-    72966,
-    175022,
-    66317,
-    158227,
-    31397,
-    26871,
-    32776,
-    166290,
-    54282,
-    142931,
-    122077,
-    86503,
-    107057,
-    99973,
-    136951,
-    122497,
-    94839,
-    142587,
-    170702,
-    114570,
-    84798,
-    39067,
-    105485,
-    128763,
-    19250,
-    107505,
-    115904,
-    160128,
-    95319,
-    134489,
-    75505,
-    11898,
-    29762,
-    129265,
-    40403,
-    87102,
-    150116,
-    47317,
-    104113,
-    129051,
-    109016,
-    32231,
-    112443,
-    62413,
-    173272,
-    14246,
-    93997,
-    72665,
-    163065,
-    85933,
-    176891,
-    139651,
-    17978,
-    138027,
-    161464,
-    178604,
-    111231,
-    138790,
-    134745,
-    51112,
-    37155,
-    103628,
-    118898,
-    1878,
-    32461,
-    144405,
-    139631,
-    38307,
-    72655,
-    75844,
-    49244,
-    90738,
-    62069,
-    121856,
-    67752,
-    153844,
-    6931,
-    50885,
-    178485,
-    122241,
-    56050,
-    110497,
-    49200,
-    79735,
-    113299,
-    176158,
-    69206,
-    46490,
-    178863,
-    163840,
-    132553,
-    118285,
-    169693,
-    508,
-    102041,
-    51021,
-    65022,
-    162202,
-    130918,
-    162814,
-    139522,
-    156297,
-    46869,
-    177296,
-    32578,
-    59288,
-    166675,
-    20762,
-    97822,
-    138744,
-    155066,
-    9405,
-    146601,
-    1075,
-    161496,
-    40026,
-    67137,
-    78021,
-    148230,
-    178491,
-    119552,
-    149164,
-    42034,
-    127998,
-    141083,
-    73142,
-    146061,
-    61747,
-    49500,
-    45392,
-    74753,
-    36792,
-    158323,
-    142730,
-    70587,
-    153045,
-    21615,
-    84199,
-    111533,
-    81155,
-    171154,
-    158500,
-    138978,
-    81343,
-    2846,
-    87328,
-    89803,
-    18092,
-    97566,
-    93811,
-    94604,
-    25543,
-    29313,
-    95178,
-    98199,
-    119446,
-    56252,
-    163626,
-    57770,
-    124738,
-    84275,
-    173720,
-    67329,
-    81675,
-    176312,
-    54630,
-    150343,
-    53549,
-    100831,
-    58497,
-    81502,
-    123340,
-    92217,
-    2769,
-    75963,
-    175398,
-    123932,
-    50900,
-    34201,
-    135487,
-    175216,
-    160058,
-    112754,
-    9541,
-    122543,
-    71697,
-    106685,
-    66012,
-    145473,
-    22777,
-    95706,
-    62703,
-    174030,
-    80897,
-    104571,
-    134596,
-    159352,
-    126444,
-    104458,
-    105322,
-    154876,
-    78432,
-    150948,
-    54903,
-    21659,
-    82332,
-    142026,
-    172204,
-    14221,
-    22401,
-    111042,
-    69268,
-    100549,
-    102887,
-    104436,
-    101512,
-    48256,
-    72203,
-    64359,
-    172286,
-    73887,
-    117108,
-    151159,
-    143039,
-    5076,
-    35499,
-    49182,
-    105049,
-    177034,
-    80180,
-    147371,
-    89562,
-    39179,
-    140977,
-    91500,
-    85434,
-    21422,
-    146485,
-    113910,
-    12494,
-    172368,
-    133038,
-    175889,
-    110791,
-    140015,
-    124335,
-    119653,
-    115226,
-    142790,
-    57789,
-    177875,
-    81776,
-    137275,
-    177492,
-    103366,
-    34548,
-    120945,
-    136481,
-    92623,
-    174108,
-    8601,
-    149944,
-    95915,
-    161024,
-    153214,
-    171671,
-    34267,
-    102,
-    27516,
-    129950,
-    107861,
-    60017,
-    76783,
-    160135,
-    92833,
-    161070,
-    91532,
-    71094,
-    16686,
-    158758,
-    56956,
-    20,
-    64914,
-    110849,
-    146145,
-    58585,
-    112525,
-    166431,
-    150759,
-    117100,
-    118936,
-    141812,
-    119970,
-    42142,
-    101232,
-    126667,
-    88682,
-    107519,
-    20989,
-    16252,
-    63097,
-    159157,
-    65594,
-    95992,
-    53887,
-    18579,
-    70812,
-    17553,
-    65755,
-    177003,
-    7781,
-    13102,
-    125308,
-    52523,
-    164236,
-    165014,
-    114906,
-    127507,
-    72764,
-    145923,
-    124103,
-    102772,
-    108439,
-    156606,
-    119365,
-    26095,
-    114630,
-    148301,
-    106659,
-    93678,
-    29966,
-    79631,
-    97301,
-    117264,
-    72703,
-    103876,
-    161394,
-    12217,
-    162169,
-    66955,
-    175647,
-    64031,
-    145429,
-    176348,
-    109090,
-    69194,
-    98434,
-    119103,
-    48118,
-    45218,
-    90175,
-    132209,
-    168400,
-    83210,
-    178991,
-    162253,
-    169840,
-    155290,
-    37974,
-    48552,
-    83556,
-    109409,
-    25138,
-    66670,
-    162155,
-    89026,
-    137504,
-    18697,
-    43587,
-    34283,
-    30563,
-    148729,
-    67006,
-    148685,
-    10740,
-    43156,
-    22408,
-    117152,
-    63955,
-    125167,
-    159243,
-    130486,
-    165669,
-    75999,
-    71716,
-    34935,
-    61802,
-    102659,
-    164323,
-    172066,
-    158575,
-    162309,
-    136651,
-    142260,
-    43728,
-    112479,
-    145397,
-    118138,
-    98867,
-    45954,
-    91279,
-    34440,
-    52036,
-    156737,
-    177074,
-    119089,
-    164866,
-    102969,
-    10036,
-    37053,
-    144130,
-    178723,
-    166223,
-    20302,
-    47044,
-    72564,
-    146018,
-    154639,
-    81751,
-    108645,
-    94665,
-    54618,
-    99438,
-    82547,
-    89837,
-    8161,
-    87423,
-    84938,
-    123871,
-    78129,
-    29188,
-    96540,
-    119798,
-    148520,
-    159314,
-    168675,
-    84332,
-    130824,
-    95773,
-    149188,
-    17719,
-    76156,
-    141635,
-    37330,
-    171470,
-    170879,
-    170915,
-    149801,
-    148245,
-    56137,
-    6832,
-    134788,
-    32200,
-    54089,
-    105568,
-    2636,
-    27031,
-    177378,
-    113961,
-    13735,
-    30835,
-    65380,
-    167946,
-    84527,
-    24096,
-    17392,
-    179496,
-    74912,
-    156091,
-    147915,
-    30358,
-    103744,
-    147219,
-    68037,
-    104868,
-    61269,
-    6556,
-    85057,
-    85353,
-    108252,
-    106467,
-    134665,
-    156555,
-    93340,
-    19837,
-    115125,
-    57898,
-    15404,
-    2463,
-    163329,
-    80044,
-    168251,
-    19331,
-    30664,
-    74389,
-    140592,
-    147027,
-    119018,
-    49321,
-    155903,
-    67555,
-    149000,
-    116398,
-    167489,
-    88403,
-    86788,
-    111858,
-    158754,
-    168605,
-    171108,
-    150373,
-    54123,
-    72462,
-    13719,
-    97846,
-    40230,
-    164757,
-    11191,
-    16884,
-    82167,
-    54273,
-    157579,
-    178139,
-    166924,
-    11203,
-    69815,
-    124967,
-    39748,
-    179699,
-    149182,
-    169123,
-    29209,
-    140041,
-    62097,
-    10064,
-    16595,
-    60912,
-    175918,
-    112303,
-    2034,
-    20604,
-    140185,
-    107198,
-    86417,
-    171528,
-    97006,
-    21396,
-    101960,
-    137685,
-    162711,
-    82321,
-    67903,
-    73245,
-    62506,
-    38836,
-    156976,
-    177855,
-    178353,
-    21147,
-    144186,
-    84004,
-    160057,
-    68377,
-    50691,
-    78241,
-    147590,
-    6606,
-    150917,
-    141604,
-    135269,
-    168970,
-    21233,
-    159672,
-    58356,
-    61463,
-    35156,
-    129194,
-    55948,
-    59477,
-    61370,
-    102064,
-    6686,
-    13125,
-    63531,
-    14622,
-    25953,
-    175648,
-    131273,
-    145694,
-    3655,
-    142848,
-    9630,
-    155358,
-    135650,
-    31410,
-    123784,
-    149851,
-    61533,
-    154800,
-    35994,
-    144473,
-    154708,
-    76692,
-    57317,
-    114923,
-    72125,
-    64670,
-    67056,
-    162865,
-    122528,
-    157762,
-    29903,
-    175098,
-    60565,
-    39731,
-    74836,
-    165169,
-    109871,
-    161200,
-    86517,
-    141666,
-    118885,
-    8379,
-    80065,
-    70861,
-    38449,
-    47522,
-    48153,
-    137826,
-    79978,
-    142540,
-    115175,
-    150726,
-    44208,
-    3282,
-    86591,
-    95634,
-    112441,
-    171473,
-    14234,
-    136520,
-    121520,
-    21197,
-    112376,
-    44015,
-    134658,
-    95370,
-    145650,
-    148074,
-    106152,
-    14129,
-    105070,
-    99911,
-    143379,
-    121167,
-    179269,
-    133937,
-    89288,
-    157404,
-    98456,
-    178873,
-    143066,
-    153217,
-    41249,
-    48689,
-    18719,
-    70929,
-    33931,
-    170307,
-    57354,
-    119,
-    99917,
-    132186,
-    120500,
-    96763,
-    171199,
-    117224,
-    3730,
-    166873,
-    36430,
-    153630,
-    51708,
-    126743,
-    62170,
-    48138,
-    154182,
-    176240,
-    121343,
-    166805,
-    101763,
-    150421,
-    27719,
-    27697,
-    82786,
-    124388,
-    133043,
-    56213,
-    25679,
-    14267,
-    151973,
-    54479,
-    18539,
-    38940,
-    37191,
-    139247,
-    32319,
-    6312,
-    126575,
-    80576,
-    63419,
-    87790,
-    4941,
-    120812,
-    151275,
-    115420,
-    16670,
-    10697,
-    76843,
-    44521,
-    86762,
-    153549,
-    76223,
-    158943,
-    105743,
-    74586,
-    50518,
-    175578,
-    25381,
-    92053,
-    117562,
-    68519,
-    8774,
-    148880,
-    67286,
-    63120,
-    28726,
-    50565,
-    163524,
-    107468,
-    15666,
-    137671,
-    177560,
-    106658,
-    65481,
-    138967,
-    70067,
-    97017,
-    66536,
-    139339,
-    116358,
-    95224,
-    109335,
-    3242,
-    106769,
-    142853,
-    112842,
-    174226,
-    59508,
-    176812,
-    160710,
-    174159,
-    161151,
-    93461,
-    72506,
-    144852,
-    19936,
-    54996,
-    147695,
-    87677,
-    177671,
-    33480,
-    112261,
-    18762,
-    47428,
-    24645,
-    42832,
-    146290,
-    19658,
-    176858,
-    156885,
-    95704,
-    28918,
-    25097,
-    125119,
-    148728,
-    15925,
-    71865,
-    83146,
-    59280,
-    47902,
-    176413,
-    82448,
-    20088,
-    160807,
-    79869,
-    148583,
-    26867,
-    165820,
-    41564,
-    114315,
-    84008,
-    63802,
-    146172,
-    92591,
-    33374,
-    89321,
-    30665,
-    134579,
-    121245,
-    176869,
-    146278,
-    42584,
-    28862,
-    165492,
-    153573,
-    72925,
-    25673,
-    15149,
-    135424,
-    9392,
-    53681,
-    138462,
-    33278,
-    138729,
-    13154,
-    50133,
-    34387,
-    102355,
-    109128,
-    29380,
-    78625,
-    96106,
-    12359,
-    55834,
-    147862,
-    165359,
-    10045,
-    48588,
-    149814,
-    120436,
-    41622,
-    15600,
-    173241,
-    98562,
-    35908,
-    5095,
-    53470,
-    34883,
-    144672,
-    62605,
-    5763,
-    128907,
-    158467,
-    22308,
-    40897,
-    40779,
-    116464,
-    12080,
-    172262,
-    39579,
-    10890,
-    84991,
-    144406,
-    110667,
-    96904,
-    34460,
-    5961,
-    25007,
-    49171,
-    155142,
-    80408,
-    56090,
-    8950,
-    44,
-    115769,
-    39292,
-    77847,
-    57814,
-    18142,
-    113761,
-    38473,
-    139900,
-    42570,
-    179525,
-    137827,
-    101346,
-    178403,
-    19666,
-    27198,
-    112837,
-    152248,
-    147301,
-    97263,
-    152137,
-    9092,
-    35197,
-    64012,
-    87039,
-    173247,
-    30115,
-    49697,
-    27355,
-    174169,
-    71316,
-    149639,
-    140946,
-    134897,
-    30454,
-    80574,
-    73520,
-    118309,
-    147204,
-    62650,
-    159043,
-    119500,
-    19379,
-    9976,
-    5760,
-    70055,
-    105839,
-    91510,
-    24162,
-    126274,
-    149306,
-    153852,
-    65520,
-    27058,
-    35545,
-    46938,
-    149998,
-    97536,
-    172376,
-    53008,
-    135694,
-    48986,
-    22945,
-    111828,
-    42603,
-    45211,
-    47453,
-    36043,
-    171253,
-    174670,
-    133442,
-    178946,
-    47430,
-    155549,
-    8687,
-    13087,
-    141004,
-    139217,
-    74334,
-    31197,
-    141629,
-    91403,
-    135660,
-    163158,
-    58347,
-    109504,
-    8683,
-    93978,
-    18155,
-    64923,
-    146542,
-    103267,
-    71748,
-    53881,
-    146291,
-    143731,
-    21680,
-    103980,
-    107263,
-    148217,
-    140570,
-    132917,
-    70175,
-    15599,
-    168592,
-    128394,
-    74031,
-    101829,
-    112256,
-    76748,
-    77210,
-    28706,
-    24057,
-    79348,
-    134448,
-    84690,
-    77537,
-    147645,
-    10221,
-    63467,
-    82920,
-    42214,
-    130246,
-    83007,
-    111360,
-    61366,
-    117262,
-    8523,
-    121737,
-    30019,
-    121340,
-    1417,
-    76103,
-    115543,
-    179781,
-    172176,
-    28654,
-    41997,
-    68499,
-    167216,
-    5114,
-    143648,
-    129231,
-    49073,
-    157643,
-    11735,
-    140097,
-    76138,
-    86736,
-    54202,
-    26740,
-    134155,
-    115921,
-    42111,
-    713,
-    21063,
-    166262,
-    135209,
-    5719,
-    98734,
-    54229,
-    36591,
-    103315,
-    82577,
-    23779,
-    5875,
-    2115,
-    164743,
-    170803,
-    64066,
-    30931,
-    112857,
-    133535,
-    139346,
-    179633,
-    58108,
-    159747,
-    9621,
-    32271,
-    85114,
-    131593,
-    89216,
-    170919,
-    87807,
-    82326,
-    85190,
-    27985,
-    13001,
-    103981,
-    138684,
-    21136,
-    107496,
-    14639,
-    84441,
-    170147,
-    13396,
-    73757,
-    151488,
-    93954,
-    38452,
-    4890,
-    12509,
-    111363,
-    13281,
-    41590,
-    30241,
-    111598,
-    176252,
-    16423,
-    103824,
-    72719,
-    133112,
-    40331,
-    20097,
-    102855,
-    119898,
-    65877,
-    157976,
-    158242,
-    13519,
-    12229,
-    162052,
-    126505,
-    52840,
-    174899,
-    41629,
-    82916,
-    170631,
-    71700,
-    66006,
-    106823,
-    125090,
-    74097,
-    142842,
-    18871,
-    57111,
-    35002,
-    13430,
-    131160,
-    155521,
-    51562,
-    25838,
-    90455,
-    116514,
-    100707,
-    119629,
-    126307,
-    43075,
-    436,
-    138545,
-    2071,
-    102026,
-    90022,
-    170469,
-    116914,
-    43245,
-    82748,
-    40389,
-    30302,
-    84852,
-    115224,
-    47360,
-    148958,
-    31125,
-    48347,
-    131428,
-    61180,
-    4459,
-    164673,
-    97387,
-    17001,
-    91839,
-    163190,
-    44740,
-    165735,
-    51930,
-    141108,
-    157173,
-    105602,
-    109005,
-    60790,
-    65743,
-    161202,
-    156513,
-    166772,
-    85296,
-    55971,
-    44920,
-    88141,
-    41078,
-    23508,
-    28418,
-    5244,
-    58795,
-    77486,
-    29798,
-    8150,
-    98639,
-    92692,
-    94261,
-    122644,
-    50913,
-    22775,
-    152970,
-    47214,
-    28064,
-    89671,
-    115320,
-    18124,
-    150986,
-    71415,
-    64458,
-    153945,
-    104830,
-    142605,
-    83703,
-    7879,
-    100608,
-    14592,
-    69219,
-    17524,
-    134543,
-    74012,
-    170089,
-    90082,
-    136498,
-    115444,
-    136827,
-    81023,
-    4913,
-    44378,
-    54196,
-    66814,
-    125371,
-    158633,
-    36658,
-    154369,
-    97778,
-    153417,
-    66711,
-    2302,
-    33218,
-    51339,
-    137951,
-    95300,
-    136237,
-    122910,
-    57127,
-    103631,
-    39374,
-    145027,
-    35895,
-    120204,
-    49525,
-    64462,
-    131876,
-    91854,
-    83681,
-    112950,
-    44120,
-    133687,
-    131511,
-    76391,
-    41061,
-    10493,
-    175235,
-    149726,
-    135240,
-    83929,
-    39721,
-    30855,
-    103822,
-    56389,
-    138304,
-    178288,
-    41981,
-    77686,
-    15138,
-    144943,
-    34135,
-    138784,
-    49439,
-    93482,
-    8216,
-    93203,
-    40178,
-    107706,
-    53083,
-    150266,
-    84230,
-    143170,
-    151995,
-    166623,
-    153527,
-    78319,
-    21862,
-    70428,
-    109324,
-    87735,
-    167134,
-    30433,
-    705,
-    61639,
-    73332,
-    13779,
-    13240,
-    58042,
-    40719,
-    102888,
-    62047,
-    129709,
-    167256,
-    142416,
-    3156,
-    158825,
-    32960,
-    56750,
-    98011,
-    48597,
-    89801,
-    142948,
-    138169,
-    575,
-    47944,
-    123674,
-    95423,
-    126338,
-    141453,
-    8345,
-    123982,
-    159082,
-    146756,
-    58144,
-    46842,
-    39319,
-    97322,
-    178730,
-    20820,
-    119402,
-    36428,
-    129099,
-    137340,
-    147808,
-    158800,
-    159743,
-    43832,
-    15671,
-    127458,
-    28291,
-    4343,
-    145784,
-    45324,
-    158192,
-    165431,
-    164406,
-    42341,
-    25418,
-    47950,
-    5286,
-    101385,
-    165515,
-    111772,
-    133921,
-    57367,
-    124112,
-    104073,
-    122420,
-    90809,
-    85533,
-    121195,
-    81636,
-    100839,
-    116105,
-    33970,
-    160828,
-    103687,
-    133638,
-    137352,
-    15974,
-    69623,
-    6053,
-    34110,
-    134586,
-    130385,
-    131569,
-    44080,
-    45884,
-    1415,
-    122718,
-    41960,
-    49363,
-    143286,
-    42276,
-    119134,
-    137390,
-    45490,
-    46749,
-    104898,
-    73096,
-    166416,
-    46605,
-    24139,
-    62882,
-    56547,
-    105755,
-    173604,
-    29724,
-    60882,
-    132492,
-    39092,
-    14785,
-    66121,
-    97802,
-    23597,
-    152044,
-    149426,
-    62252,
-    132975,
-    79357,
-    88951,
-    95912,
-    14096,
-    178305,
-    3206,
-    59744,
-    132106,
-    58856,
-    138189,
-    12387,
-    132612,
-    48832,
-    70609,
-    18682,
-    116031,
-    66508,
-    156836,
-    26429,
-    122924,
-    147812,
-    135820,
-    29701,
-    123162,
-    44721,
-    89372,
-    54754,
-    133246,
-    175508,
-    15751,
-    44612,
-    9911,
-    123128,
-    92895,
-    66822,
-    36693,
-    36117,
-    106281,
-    167579,
-    77276,
-    154541,
-    169862,
-    53131,
-    140528,
-    149863,
-    163908,
-    114241,
-    52264,
-    153921,
-    41008,
-    82010,
-    12345,
-    77398,
-    85911,
-    14312,
-    79910,
-    5303,
-    115727,
-    95879,
-    141773,
-    46624,
-    23533,
-    113914,
-    45323,
-    127825,
-    70983,
-    168230,
-    13303,
-    44631,
-    101949,
-    142100,
-    72741,
-    150456,
-    81011,
-    30833,
-    165844,
-    81838,
-    129402,
-    81656,
-    106597,
-    148529,
-    171881,
-    6843,
-    160077,
-    271,
-    87093,
-    3182,
-    50076,
-    152576,
-    37430,
-    117761,
-    8019,
-    986,
-    57244,
-    129376,
-    126169,
-    46599,
-    61835,
-    37534,
-    64683,
-    176347,
-    122176,
-    137346,
-    67575,
-    43736,
-    65984,
-    115174,
-    113125,
-    82784,
-    35188,
-    108358,
-    141809,
-    98372,
-    128280,
-    121036,
-    23009,
-    4615,
-    117924,
-    41191,
-    112649,
-    83314,
-    155744,
-    158691,
-    67415,
-    140614,
-    73398,
-    116480,
-    89971,
-    172734,
-    177069,
-    103593,
-    27781,
-    119472,
-    178254,
-    120806,
-    104316,
-    35798,
-    105873,
-    153753,
-    119836,
-    162883,
-    151158,
-    23417,
-    140541,
-    139683,
-    64499,
-    21317,
-    154307,
-    124224,
-    20552,
-    18119,
-    175686,
-    78450,
-    20590,
-    126909,
-    130086,
-    131559,
-    93781,
-    103916,
-    18035,
-    134958,
-    117292,
-    101621,
-    80546,
-    161569,
-    140450,
-    82938,
-    17364,
-    85579,
-    145272,
-    88803,
-    99369,
-    89576,
-    77923,
-    46040,
-    101157,
-    89895,
-    32580,
-    41212,
-    102121,
-    173734,
-    146743,
-    151535,
-    45338,
-    78031,
-    6515,
-    96668,
-    170297,
-    106730,
-    16277,
-    69943,
-    84313,
-    85055,
-    126790,
-    168619,
-    41029,
-    39656,
-    148609,
-    92509,
-    109738,
-    6976,
-    541,
-    113930,
-    132832,
-    161763,
-    95048,
-    102119,
-    100293,
-    162498,
-    150172,
-    86574,
-    74199,
-    59475,
-    34824,
-    61893,
-    59503,
-    110528,
-    101957,
-    144695,
-    52588,
-    23612,
-    92494,
-    92560,
-    35192,
-    51641,
-    137460,
-    20280,
-    49623,
-    149087,
-    69435,
-    22310,
-    75132,
-    51732,
-    141757,
-    115879,
-    109114,
-    53066,
-    30001,
-    62184,
-    120571,
-    138848,
-    72019,
-    122612,
-    88891,
-    29176,
-    76680,
-    141177,
-    165794,
-    111869,
-    162751,
-    155412,
-    93351,
-    156288,
-    75758,
-    45234,
-    115384,
-    26342,
-    42867,
-    126912,
-    146077,
-    162216,
-    45979,
-    63760,
-    173865,
-    115385,
-    168407,
-    158182,
-    68219,
-    30094,
-    63622,
-    50364,
-    50254,
-    23337,
-    149246,
-    157259,
-    81225,
-    91547,
-    50045,
-    8784,
-    52594,
-    144008,
-    5542,
-    171235,
-    146438,
-    68988,
-    61668,
-    3935,
-    24202,
-    22685,
-    140133,
-    114690,
-    32067,
-    101331,
-    131233,
-    137881,
-    173601,
-    90704,
-    106392,
-    33562,
-    73209,
-    79177,
-    127859,
-    29935,
-    63042,
-    42429,
-    124352,
-    122100,
-    5845,
-    176107,
-    74557,
-    67399,
-    146891,
-    88788,
-    142448,
-    3478,
-    32516,
-    50571,
-    62266,
-    74879,
-    106104,
-    27906,
-    147269,
-    81183,
-    72621,
-    154292,
-    88161,
-    30440,
-    178445,
-    175661,
-    47436,
-    40216,
-    20108,
-    155488,
-    55290,
-    119044,
-    143162,
-    100118,
-    77374,
-    40013,
-    28665,
-    33745,
-    943,
-    142348,
-    2342,
-    164273,
-    23669,
-    143476,
-    52575,
-    155845,
-    102983,
-    99519,
-    115649,
-    44309,
-    58589,
-    140398,
-    32178,
-    136540,
-    101788,
-    107134,
-    119663,
-    64765,
-    82291,
-    174529,
-    57532,
-    38675,
-    103104,
-    4874,
-    31632,
-    67707,
-    26381,
-    13579,
-    51190,
-    99765,
-    174621,
-    103562,
-    141489,
-    140355,
-    10025,
-    105265,
-    77297,
-    125920,
-    108359,
-    165126,
-    161085,
-    69795,
-    137872,
-    70993,
-    49947,
-    126281,
-    148321,
-    121267,
-    32184,
-    153306,
-    1499,
-    158093,
-    96373,
-    119949,
-    156307,
-    109304,
-    70171,
-    35642,
-    104463,
-    164026,
-    35750,
-    102966,
-    137106,
-    131161,
-    18843,
-    24140,
-    172085,
-    38161,
-    65373,
-    178827,
-    75612,
-    53929,
-    125826,
-    63586,
-    168430,
-    109437,
-    179266,
-    10390,
-    24239,
-    1517,
-    92299,
-    120628,
-    167704,
-    136125,
-    22875,
-    117444,
-    94003,
-    145193,
-    169429,
-    102721,
-    39030,
-    44252,
-    111447,
-    47386,
-    30963,
-    96658,
-    34745,
-    101423,
-    179190,
-    18821,
-    168648,
-    146060,
-    60870,
-    40090,
-    83019,
-    113270,
-    113533,
-    35291,
-    39581,
-    9516,
-    133309,
-    21716,
-    96826,
-    71456,
-    9222,
-    28006,
-    82534,
-    60319,
-    42992,
-    116046,
-    149913,
-    145147,
-    15070,
-    135884,
-    42817,
-    123673,
-    82796,
-    123071,
-    48184,
-    175531,
-    141594,
-    62464,
-    137526,
-    78954,
-    56197,
-    117566,
-    171897,
-    74834,
-    22125,
-    37021,
-    41628,
-    108081,
-    36796,
-    159387,
-    45974,
-    39572,
-    43783,
-    175664,
-    37897,
-    56616,
-    21123,
-    125530,
-    22628,
-    130572,
-    38483,
-    72512,
-    66718,
-    131038,
-    68953,
-    65097,
-    40455,
-    74390,
-    124916,
-    174279,
-    134253,
-    134747,
-    104255,
-    98925,
-    49835,
-    64133,
-    175487,
-    29736,
-    65624,
-    156158,
-    145175,
-    1608,
-    42482,
-    62777,
-    125569,
-    92794,
-    135473,
-    68062,
-    39642,
-    80580,
-    113623,
-    25856,
-    77280,
-    79093,
-    175447,
-    104991,
-    125398,
-    155067,
-    164712,
-    49461,
-    97873,
-    140633,
-    68974,
-    71904,
-    66840,
-    135169,
-    32935,
-    31439,
-    72600,
-    32505,
-    69140,
-    141627,
-    130519,
-    164029,
-    79909,
-    173518,
-    41071,
-    107316,
-    74476,
-    53078,
-    168956,
-    67406,
-    117972,
-    62158,
-    175124,
-    14567,
-    1022,
-    48193,
-    173835,
-    100467,
-    26555,
-    117719,
-    64950,
-    165828,
-    178329,
-    108891,
-    99065,
-    23768,
-    64533,
-    5450,
-    84221,
-    148518,
-    60720,
-    176443,
-    131864,
-    120893,
-    88715,
-    149256,
-    133603,
-    142828,
-    30675,
-    65949,
-    121967,
-    135380,
-    145185,
-    23193,
-    9787,
-    32452,
-    28450,
-    485,
-    51876,
-    105592,
-    44106,
-    85247,
-    154584,
-    176371,
-    19216,
-    146961,
-    13968,
-    131346,
-    32727,
-    117077,
-    90323,
-    92104,
-    116835,
-    54060,
-    128292,
-    119853,
-    10085,
-    36885,
-    152504,
-    787,
-    61170,
-    92012,
-    21111,
-    148097,
-    84307,
-    142603,
-    119282,
-    83319,
-    44885,
-    135752,
-    84490,
-    73256,
-    133797,
-    74177,
-    62337,
-    112797,
-    31282,
-    121551,
-    164586,
-    34301,
-    62133,
-    42729,
-    79033,
-    97795,
-    124179,
-    83327,
-    160251,
-    101877,
-    128462,
-    44223,
-    151972,
-    79603,
-    37679,
-    45465,
-    129464,
-    30409,
-    177279,
-    174932,
-    82218,
-    102186,
-    115002,
-    4730,
-    118280,
-    19298,
-    160889,
-    108028,
-    21976,
-    31090,
-    70040,
-    134778,
-    17696,
-    79161,
-    93656,
-    126252,
-    64191,
-    154487,
-    148174,
-    78774,
-    129878,
-    106608,
-    13109,
-    77345,
-    81520,
-    56774,
-    37663,
-    168091,
-    83267,
-    1688,
-    121567,
-    59294,
-    155869,
-    50911,
-    93896,
-    177856,
-    41701,
-    55816,
-    138727,
-    75430,
-    81635,
-    119748,
-    27638,
-    177214,
-    106415,
-    44419,
-    158482,
-    141751,
-    85902,
-    71032,
-    42211,
-    84132,
-    134935,
-    17826,
-    40350,
-    161925,
-    52737,
-    127417,
-    136392,
-    145517,
-    23662,
-    75461,
-    55407,
-    15300,
-    17984,
-    113349,
-    73758,
-    170556,
-    98928,
-    85084,
-    120810,
-    173829,
-    93675,
-    97027,
-    93325,
-    109622,
-    41260,
-    40784,
-    11978,
-    130662,
-    2788,
-    35328,
-    157952,
-    99849,
-    23493,
-    98198,
-    23643,
-    163207,
-    138764,
-    72787,
-    150717,
-    811,
-    175739,
-    4397,
-    25283,
-    74226,
-    66721,
-    133829,
-    35532,
-    1841,
-    64726,
-    40065,
-    133000,
-    92809,
-    164937,
-    123522,
-    174033,
-    22071,
-    30840,
-    107124,
-    25011,
-    54267,
-    37647,
-    68489,
-    159466,
-    9920,
-    122607,
-    91696,
-    161036,
-    160139,
-    135702,
-    113481,
-    67908,
-    159600,
-    18987,
-    166061,
-    161368,
-    164398,
-    120838,
-    10330,
-    97600,
-    45173,
-    83543,
-    173008,
-    105546,
-    78969,
-    171753,
-    85653,
-    151868,
-    125971,
-    49018,
-    81421,
-    21876,
-    172606,
-    60735,
-    84812,
-    157310,
-    149623,
-    69135,
-    29595,
-    166922,
-    121637,
-    60418,
-    66027,
-    47678,
-    41376,
-    15840,
-    179111,
-    149506,
-    118551,
-    15333,
-    72744,
-    163850,
-    169300,
-    143701,
-    140452,
-    149291,
-    94174,
-    18832,
-    156264,
-    87155,
-    29064,
-    128918,
-    143966,
-    172800,
-    160821,
-    40665,
-    92926,
-    108642,
-    98581,
-    63641,
-    43198,
-    8390,
-    103668,
-    173097,
-    179093,
-    28652,
-    79962,
-    52351,
-    34467,
-    146140,
-    94864,
-    52125,
-    134707,
-    129015,
-    128986,
-    75293,
-    27434,
-    34428,
-    13282,
-    166973,
-    117586,
-    174090,
-    120943,
-    81275,
-    93299,
-    78411,
-    131182,
-    146313,
-    41493,
-    135539,
-    123726,
-    173716,
-    31597,
-    87505,
-    150360,
-    86952,
-    26978,
-    76063,
-    50475,
-    40686,
-    51684,
-    38681,
-    53704,
-    59641,
-    97401,
-    69012,
-    156015,
-    66137,
-    1519,
-    27770,
-    27176,
-    150269,
-    113197,
-    178852,
-    133525,
-    116522,
-    18005,
-    11776,
-    49386,
-    39523,
-    101546,
-    3615,
-    59912,
-    32196,
-    111967,
-    157916,
-    127715,
-    3220,
-    109603,
-    107842,
-    94755,
-    170395,
-    28890,
-    108091,
-    25662,
-    174972,
-    20196,
-    37944,
-    31596,
-    40843,
-    56337,
-    13845,
-    53005,
-    20757,
-    13550,
-    166971,
-    176893,
-    172906,
-    80876,
-    127187,
-    70458,
-    149253,
-    159905,
-    22540,
-    33568,
-    92582,
-    80242,
-    161781,
-    116019,
-    75631,
-    4270,
-    32455,
-    169757,
-    93023,
-    12104,
-    31406,
-    9558,
-    10148,
-    142304,
-    78235,
-    124328,
-    1113,
-    98654,
-    162211,
-    108273,
-    142683,
-    100933,
-    49263,
-    35058,
-    165793,
-    89290,
-    82829,
-    126330,
-    141848,
-    128980,
-    111569,
-    156874,
-    143741,
-    57614,
-    114633,
-    152527,
-    155643,
-    57777,
-    136937,
-    24235,
-    61166,
-    105177,
-    67598,
-    131746,
-    53917,
-    103786,
-    110604,
-    71668,
-    130206,
-    14983,
-    33128,
-    148663,
-    163744,
-    105114,
-    161076,
-    8176,
-    136383,
-    94211,
-    71125,
-    175840,
-    51666,
-    3129,
-    8013,
-    59396,
-    67977,
-    115800,
-    132842,
-    167018,
-    108437,
-    130244,
-    31290,
-    78918,
-    76650,
-    158570,
-    115756,
-    77449,
-    14584,
-    66166,
-    43495,
-    153020,
-    148366,
-    101394,
-    173231,
-    118799,
-    16506,
-    165236,
-    38556,
-    7751,
-    114948,
-    179200,
-    2872,
-    99953,
-    134851,
-    74313,
-    91180,
-    82730,
-    137065,
-    85811,
-    145855,
-    67268,
-    63516,
-    115941,
-    57249,
-    159333,
-    69986,
-    165269,
-    179920,
-    126084,
-    114985,
-    173224,
-    150075,
-    28280,
-    125359,
-    153429,
-    127,
-    148928,
-    109855,
-    78389,
-    65093,
-    18829,
-    51311,
-    64473,
-    126784,
-    37955,
-    66574,
-    175423,
-    99710,
-    4281,
-    76196,
-    32870,
-    11906,
-    5170,
-    48496,
-    71653,
-    143353,
-    30389,
-    177165,
-    56789,
-    5818,
-    174319,
-    79438,
-    67423,
-    40998,
-    130802,
-    43356,
-    43531,
-    124829,
-    92314,
-    43547,
-    85231,
-    109703,
-    160296,
-    110126,
-    16130,
-    111134,
-    11885,
-    32449,
-    45136,
-    23512,
-    5641,
-    111982,
-    23826,
-    17944,
-    109893,
-    73267,
-    56287,
-    101742,
-    83812,
-    122470,
-    173421,
-    104515,
-    160591,
-    150781,
-    80371,
-    110798,
-    172662,
-    3518,
-    36071,
-    122824,
-    73802,
-    16516,
-    78552,
-    175133,
-    158874,
-    100529,
-    130932,
-    10164,
-    78826,
-    82075,
-    62856,
-    148528,
-    93101,
-    115738,
-    34272,
-    11636,
-    109547,
-    109760,
-    101299,
-    92634,
-    80511,
-    51378,
-    90311,
-    142626,
-    167748,
-    30564,
-    80300,
-    110124,
-    13464,
-    33831,
-    7856,
-    55596,
-    89281,
-    163546,
-    43097,
-    46217,
-    40471,
-    11581,
-    140051,
-    96,
-    154798,
-    38842,
-    178968,
-    50924,
-    67202,
-    14647,
-    126806,
-    72257,
-    110961,
-    24678,
-    152103,
-    44190,
-    98184,
-    158412,
-    113852,
-    76277,
-    154974,
-    152012,
-    100988,
-    36998,
-    120984,
-    22877,
-    53275,
-    86572,
-    29620,
-    90340,
-    138778,
-    102918,
-    81364,
-    33614,
-    142834,
-    146387,
-    145933,
-    6404,
-    19792,
-    63399,
-    77353,
-    102483,
-    13639,
-    16170,
-    12059,
-    179104,
-    54972,
-    134833,
-    90383,
-    73038,
-    5131,
-    177501,
-    171984,
-    58101,
-    152305,
-    27969,
-    26696,
-    157687,
-    69637,
-    99671,
-    126391,
-    46141,
-    84462,
-    45402,
-    174155,
-    126698,
-    401,
-    88839,
-    144498,
-    101662,
-    21210,
-    72960,
-    22448,
-    113366,
-    112285,
-    40214,
-    162460,
-    114949,
-    140066,
-    102327,
-    91933,
-    117330,
-    41161,
-    104464,
-    10131,
-    174287,
-    59007,
-    89430,
-    103712,
-    117041,
-    123345,
-    138425,
-    67343,
-    25275,
-    23797,
-    133105,
-    55551,
-    87441,
-    38810,
-    175713,
-    114511,
-    58855,
-    163291,
-    46961,
-    169565,
-    9901,
-    66684,
-    37506,
-    79498,
-    162417,
-    123215,
-    106908,
-    106145,
-    32625,
-    102070,
-    149677,
-    163120,
-    165862,
-    150622,
-    16613,
-    88574,
-    102898,
-    31607,
-    104021,
-    21776,
-    10424,
-    75355,
-    32081,
-    119854,
-    64769,
-    72627,
-    173919,
-    31864,
-    59943,
-    23630,
-    1965,
-    79546,
-    112030,
-    1851,
-    123642,
-    4007,
-    142929,
-    62073,
-    53729,
-    144106,
-    68115,
-    98984,
-    177796,
-    67874,
-    28958,
-    177916,
-    108349,
-    137836,
-    70981,
-    64593,
-    28693,
-    118811,
-    2447,
-    131685,
-    109993,
-    130663,
-    78264,
-    118042,
-    66916,
-    87809,
-    161229,
-    135879,
-    120697,
-    28053,
-    79010,
-    102141,
-    76551,
-    73190,
-    93257,
-    55058,
-    159946,
-    167694,
-    175089,
-    109741,
-    148783,
-    2729,
-    141827,
-    8558,
-    116875,
-    66521,
-    156980,
-    85384,
-    686,
-    36078,
-    32352,
-    140191,
-    65080,
-    54989,
-    123703,
-    92625,
-    137414,
-    47146,
-    90836,
-    54397,
-    51593,
-    118925,
-    2739,
-    79025,
-    90736,
-    45735,
-    76691,
-    63309,
-    176271,
-    129803,
-    169009,
-    43122,
-    101370,
-    128963,
-    156864,
-    113676,
-    172042,
-    67796,
-    50454,
-    27521,
-    42699,
-    56351,
-    177288,
-    69816,
-    111237,
-    35698,
-    72967,
-    28308,
-    158126,
-    156729,
-    31060,
-    27890,
-    52918,
-    168595,
-    102693,
-    64669,
-    125042,
-    8805,
-    42045,
-    50976,
-    135841,
-    1826,
-    147377,
-    69004,
-    161226,
-    34755,
-    144617,
-    17091,
-    128111,
-    147770,
-    37561,
-    52854,
-    169077,
-    163226,
-    162596,
-    96336,
-    164837,
-    75736,
-    149936,
-    2861,
-    95940,
-    160551,
-    23724,
-    97645,
-    101956,
-    86506,
-    44029,
-    101629,
-    136735,
-    170272,
-    179741,
-    147916,
-    159927,
-    29531,
-    55896,
-    162328,
-    28528,
-    68533,
-    15302,
-    97492,
-    129915,
-    41123,
-    980,
-    157531,
-    49445,
-    147402,
-    111213,
-    125922,
-    28001,
-    146456,
-    64350,
-    98527,
-    13182,
-    170107,
-    12393,
-    97541,
-    92355,
-    156994,
-    178718,
-    142110,
-    935,
-    93087,
-    95123,
-    58507,
-    34516,
-    129586,
-    103567,
-    118110,
-    111988,
-    13479,
-    37332,
-    16436,
-    149195,
-    8240,
-    145824,
-    9345,
-    81032,
-    166985,
-    35672,
-    88432,
-    100287,
-    41816,
-    93002,
-    98710,
-    138649,
-    71503,
-    8320,
-    145198,
-    125051,
-    96378,
-    97363,
-    132625,
-    36172,
-    59549,
-    13554,
-    85590,
-    26967,
-    8387,
-    130542,
-    146040,
-    74773,
-    102994,
-    58079,
-    72576,
-    112282,
-    12913,
-    17496,
-    112738,
-    145615,
-    118039,
-    156055,
-    105208,
-    19818,
-    133833,
-    48439,
-    117033,
-    86272,
-    159134,
-    116733,
-    20058,
-    92946,
-    114109,
-    52597,
-    97902,
-    51156,
-    109311,
-    133705,
-    4241,
-    74987,
-    126622,
-    154551,
-    83351,
-    176671,
-    1754,
-    975,
-    33042,
-    22853,
-    65652,
-    47004,
-    20059,
-    166567,
-    53616,
-    46672,
-    150577,
-    1717,
-    168463,
-    100390,
-    30370,
-    66895,
-    1855,
-    156456,
-    133786,
-    124105,
-    31991,
-    69401,
-    23340,
-    137238,
-    25669,
-    143920,
-    29477,
-    125445,
-    171477,
-    169273,
-    68307,
-    44074,
-    153157,
-    40101,
-    11417,
-    120061,
-    118604,
-    73049,
-    39855,
-    77381,
-    5178,
-    92008,
-    31291,
-    46759,
-    41763,
-    97971,
-    72851,
-    177075,
-    160256,
-    179247,
-    95492,
-    67932,
-    134542,
-    160062,
-    96206,
-    110045,
-    175377,
-    125215,
-    179756,
-    101522,
-    149159,
-    3826,
-    98025,
-    133437,
-    5432,
-    127787,
-    116459,
-    62876,
-    101941,
-    102714,
-    85250,
-    97814,
-    105328,
-    50198,
-    166228,
-    161433,
-    39331,
-    152668,
-    76534,
-    151954,
-    166843,
-    106365,
-    119906,
-    4232,
-    46186,
-    26077,
-    19626,
-    160628,
-    122696,
-    149460,
-    142604,
-    154671,
-    2619,
-    67219,
-    138529,
-    8233,
-    144027,
-    90773,
-    99946,
-    160756,
-    4204,
-    160847,
-    39765,
-    3701,
-    41485,
-    27470,
-    76462,
-    107972,
-    175090,
-    60626,
-    68196,
-    9818,
-    139117,
-    131176,
-    10105,
-    105057,
-    684,
-    7294,
-    63970,
-    155090,
-    106347,
-    16828,
-    124590,
-    56120,
-    27022,
-    76927,
-    145463,
-    160346,
-    88364,
-    34332,
-    169253,
-    53423,
-    138981,
-    92367,
-    30313,
-    71787,
-    101116,
-    13896,
-    12743,
-    119909,
-    2579,
-    72759,
-    7174,
-    142246,
-    90512,
-    31587,
-    25677,
-    67540,
-    111768,
-    118883,
-    30670,
-    124993,
-    41453,
-    106382,
-    50925,
-    155299,
-    30198,
-    57489,
-    11153,
-    57935,
-    128085,
-    30264,
-    31925,
-    47407,
-    71944,
-    44032,
-    33266,
-    5044,
-    82505,
-    25109,
-    57361,
-    66934,
-    150007,
-    148666,
-    70516,
-    66736,
-    6216,
-    79178,
-    163346,
-    92328,
-    160473,
-    83091,
-    23486,
-    119497,
-    59769,
-    143127,
-    54205,
-    154954,
-    10141,
-    18560,
-    51978,
-    59863,
-    71728,
-    84758,
-    41894,
-    133827,
-    166369,
-    159345,
-    149880,
-    58440,
-    120748,
-    147957,
-    9917,
-    152969,
-    12745,
-    90812,
-    121149,
-    128448,
-    94967,
-    44287,
-    97177,
-    28818,
-    149555,
-    128673,
-    132289,
-    2165,
-    74993,
-    23739,
-    9636,
-    97128,
-    71498,
-    171010,
-    106211,
-    4823,
-    90684,
-    100724,
-    28150,
-    79058,
-    143753,
-    84641,
-    138511,
-    108094,
-    152862,
-    89141,
-    81139,
-    102464,
-    173685,
-    111916,
-    31206,
-    25548,
-    81347,
-    24558,
-    168941,
-    16640,
-    156148,
-    130581,
-    39176,
-    17555,
-    141191,
-    119651,
-    50835,
-    106218,
-    121006,
-    61738,
-    46184,
-    173236,
-    119685,
-    28320,
-    55649,
-    148359,
-    174703,
-    154393,
-    84591,
-    168041,
-    177531,
-    169765,
-    22942,
-    156120,
-    67960,
-    136975,
-    158862,
-    178618,
-    60331,
-    24702,
-    110177,
-    106453,
-    90282,
-    120620,
-    120259,
-    170949,
-    169751,
-    159112,
-    108068,
-    97811,
-    131011,
-    38704,
-    155449,
-    14651,
-    178250,
-    127875,
-    12782,
-    166364,
-    75522,
-    107452,
-    69898,
-    56077,
-    52964,
-    107380,
-    93816,
-    70811,
-    137231,
-    50848,
-    50787,
-    77043,
-    44846,
-    132476,
-    74464,
-    77753,
-    156824,
-    75575,
-    138460,
-    28762,
-    176225,
-    36749,
-    87378,
-    127229,
-    127258,
-    158963,
-    151308,
-    113809,
-    63847,
-    68141,
-    168243,
-    2129,
-    70570,
-    30277,
-    70528,
-    16957,
-    125961,
-    75782,
-    4557,
-    20120,
-    175357,
-    152233,
-    91934,
-    127595,
-    172694,
-    59591,
-    48422,
-    158125,
-    142786,
-    49636,
-    150138,
-    77463,
-    123532,
-    88330,
-    154045,
-    78668,
-    178796,
-    6213,
-    46468,
-    5600,
-    162324,
-    141641,
-    40589,
-    49658,
-    172185,
-    76802,
-    98940,
-    173093,
-    151551,
-    178904,
-    177255,
-    98130,
-    152659,
-    121543,
-    91083,
-    3714,
-    35066,
-    8138,
-    154177,
-    130718,
-    100076,
-    163541,
-    60921,
-    107553,
-    128441,
-    57571,
-    11991,
-    121744,
-    121766,
-    174070,
-    63018,
-    124601,
-    44540,
-    6912,
-    79685,
-    81493,
-    13722,
-    33246,
-    98338,
-    105016,
-    96154,
-    27761,
-    75556,
-    4012,
-    47071,
-    124573,
-    106312,
-    78237,
-    75784,
-    128922,
-    92234,
-    14680,
-    21443,
-    63342,
-    108992,
-    41700,
-    23869,
-    110688,
-    29121,
-    46284,
-    53207,
-    145621,
-    102805,
-    90418,
-    6780,
-    60200,
-    140718,
-    48434,
-    117578,
-    29733,
-    85840,
-    146681,
-    111082,
-    116450,
-    94149,
-    110765,
-    45921,
-    73264,
-    39598,
-    51006,
-    44240,
-    89902,
-    153037,
-    3077,
-    25267,
-    33213,
-    174029,
-    152141,
-    118053,
-    93820,
-    23420,
-    30485,
-    169068,
-    5399,
-    152976,
-    92281,
-    24895,
-    51806,
-    31738,
-    58602,
-    108753,
-    90361,
-    14550,
-    163637,
-    6067,
-    101103,
-    77265,
-    129680,
-    41116,
-    172061,
-    39928,
-    81012,
-    179396,
-    28741,
-    164707,
-    123382,
-    29135,
-    549,
-    48623,
-    160682,
-    166744,
-    144373,
-    170911,
-    87032,
-    69758,
-    88832,
-    10347,
-    104171,
-    114302,
-    23081,
-    170520,
-    93907,
-    63583,
-    93615,
-    146228,
-    127085,
-    154774,
-    168092,
-    138594,
-    40481,
-    145589,
-    176216,
-    14625,
-    67980,
-    22173,
-    8042,
-    56031,
-    91790,
-    5855,
-    77433,
-    96418,
-    29338,
-    166813,
-    18418,
-    165286,
-    53236,
-    137977,
-    116366,
-    71284,
-    30362,
-    67576,
-    149038,
-    28659,
-    92605,
-    84589,
-    78670,
-    6496,
-    114285,
-    15186,
-    168874,
-    98403,
-    159623,
-    54066,
-    179182,
-    168476,
-    144386,
-    35325,
-    83152,
-    174204,
-    148869,
-    172826,
-    37818,
-    33947,
-    71609,
-    17614,
-    136852,
-    159714,
-    37193,
-    86002,
-    144737,
-    167147,
-    6956,
-    30938,
-    102525,
-    60732,
-    131377,
-    8343,
-    26601,
-    89470,
-    108455,
-    13770,
-    171093,
-    138171,
-    18094,
-    103171,
-    85317,
-    27925,
-    152996,
-    54945,
-    41155,
-    132690,
-    160023,
-    157400,
-    114685,
-    157978,
-    136083,
-    36907,
-    26247,
-    147654,
-    113103,
-    23141,
-    126035,
-    33687,
-    133369,
-    4086,
-    70367,
-    48510,
-    119699,
-    169250,
-    94888,
-    85113,
-    133134,
-    92336,
-    53235,
-    4032,
-    99820,
-    9607,
-    53113,
-    99069,
-    170477,
-    68191,
-    69759,
-    93981,
-    41669,
-    36095,
-    175676,
-    99479,
-    51145,
-    160329,
-    17043,
-    66927,
-    140635,
-    59011,
-    58518,
-    115915,
-    151204,
-    134045,
-    43359,
-    12481,
-    87470,
-    127729,
-    45550,
-    162972,
-    96158,
-    168536,
-    41484,
-    158118,
-    107558,
-    91846,
-    17267,
-    149879,
-    132738,
-    153608,
-    62179,
-    27750,
-    14361,
-    68048,
-    105961,
-    9743,
-    77959,
-    165648,
-    111037,
-    28524,
-    116898,
-    105080,
-    97106,
-    16233,
-    145207,
-    102884,
-    64182,
-    149266,
-    24847,
-    119793,
-    174763,
-    139702,
-    101655,
-    121721,
-    38295,
-    55116,
-    112252,
-    44335,
-    178198,
-    92954,
-    67117,
-    98779,
-    47432,
-    65394,
-    6221,
-    45153,
-    119286,
-    85313,
-    138408,
-    35009,
-    67747,
-    86198,
-    24898,
-    1704,
-    150054,
-    110322,
-    52162,
-    106567,
-    86380,
-    88160,
-    99697,
-    154958,
-    150902,
-    41910,
-    80167,
-    15798,
-    24415,
-    49779,
-    87437,
-    98757,
-    10570,
-    96009,
-    122736,
-    30515,
-    104768,
-    34981,
-    150420,
-    4143,
-    28075,
-    20955,
-    143347,
-    102086,
-    168357,
-    30045,
-    20599,
-    68074,
-    24469,
-    27591,
-    15786,
-    58649,
-    5273,
-    51646,
-    103617,
-    59259,
-    62898,
-    94105,
-    131789,
-    83182,
-    35414,
-    79646,
-    120039,
-    5366,
-    32117,
-    178821,
-    45267,
-    167576,
-    66282,
-    2062,
-    69429,
-    137641,
-    12535,
-    109497,
-    68030,
-    82114,
-    133408,
-    28993,
-    53659,
-    76491,
-    106656,
-    163232,
-    111612,
-    127663,
-    27321,
-    65395,
-    174669,
-    81716,
-    118233,
-    57212,
-    96064,
-    144436,
-    153202,
-    55126,
-    74785,
-    14203,
-    61379,
-    15361,
-    92488,
-    87947,
-    166397,
-    69540,
-    76985,
-    139979,
-    159922,
-    65357,
-    50122,
-    62107,
-    108766,
-    36477,
-    56671,
-    148130,
-    7730,
-    91093,
-    60172,
-    153545,
-    2290,
-    99744,
-    66667,
-    172652,
-    45399,
-    10979,
-    106910,
-    53701,
-    169968,
-    107607,
-    133223,
-    91852,
-    35100,
-    21957,
-    128817,
-    86543,
-    92629,
-    87550,
-    98051,
-    95232,
-    4095,
-    19778,
-    164495,
-    62732,
-    60434,
-    77877,
-    133482,
-    124538,
-    170427,
-    27081,
-    119430,
-    104108,
-    155793,
-    132520,
-    72142,
-    59803,
-    125227,
-    130155,
-    18469,
-    77526,
-    119026,
-    39717,
-    57849,
-    157946,
-    65062,
-    3167,
-    68547,
-    66922,
-    49803,
-    32341,
-    71302,
-    39919,
-    140887,
-    123038,
-    118726,
-    16107,
-    12997,
-    53004,
-    734,
-    171655,
-    81988,
-    88316,
-    153425,
-    119807,
-    150895,
-    9436,
-    52815,
-    7994,
-    169180,
-    55687,
-    141366,
-    115012,
-    21642,
-    108544,
-    44710,
-    145012,
-    27411,
-    14476,
-    137442,
-    169063,
-    50195,
-    169730,
-    76467,
-    2029,
-    65977,
-    157912,
-    61470,
-    24477,
-    4159,
-    14499,
-    33396,
-    157578,
-    77803,
-    54723,
-    146029,
-    73345,
-    171031,
-    131873,
-    155038,
-    170583,
-    131414,
-    5352,
-    172777,
-    98069,
-    88896,
-    164734,
-    137484,
-    148037,
-    99802,
-    124691,
-    165618,
-    12639,
-    175826,
-    161693,
-    146055,
-    176009,
-    50994,
-    29774,
-    13575,
-    104767,
-    93935,
-    140385,
-    6925,
-    152464,
-    142516,
-    58236,
-    139061,
-    140543,
-    167924,
-    114089,
-    49096,
-    125862,
-    31009,
-    111921,
-    14652,
-    14094,
-    127344,
-    20844,
-    99960,
-    94309,
-    36596,
-    24571,
-    127328,
-    67636,
-    105020,
-    102924,
-    67112,
-    39219,
-    93436,
-    163243,
-    25567,
-    51465,
-    117172,
-    158313,
-    71115,
-    119367,
-    35769,
-    9456,
-    36249,
-    160079,
-    32459,
-    80346,
-    125461,
-    163238,
-    104514,
-    78715,
-    90200,
-    135075,
-    56033,
-    76741,
-    120962,
-    36782,
-    71935,
-    140779,
-    178317,
-    169853,
-    179410,
-    126904,
-    4361,
-    28329,
-    138619,
-    12981,
-    79730,
-    111304,
-    157509,
-    50758,
-    56857,
-    13655,
-    58104,
-    129676,
-    102361,
-    33417,
-    103642,
-    41414,
-    67716,
-    109676,
-    2537,
-    79055,
-    159092,
-    135943,
-    104539,
-    139507,
-    21567,
-    21084,
-    121033,
-    88712,
-    35928,
-    66563,
-    59916,
-    145937,
-    87662,
-    124617,
-    91664,
-    162376,
-    55906,
-    164815,
-    108067,
-    123812,
-    8440,
-    151271,
-    76677,
-    146411,
-    90867,
-    175718,
-    15727,
-    173445,
-    99728,
-    84594,
-    163594,
-    138473,
-    118376,
-    16757,
-    133405,
-    152237,
-    1139,
-    19625,
-    44735,
-    142892,
-    105793,
-    6881,
-    155273,
-    178391,
-    37163,
-    50455,
-    101392,
-    85502,
-    127667,
-    149023,
-    78502,
-    170849,
-    179878,
-    58516,
-    134080,
-    44674,
-    61224,
-    135034,
-    94069,
-    159430,
-    102514,
-    9039,
-    76638,
-    115365,
-    38757,
-    67379,
-    171426,
-    170133,
-    94409,
-    126085,
-    14032,
-    11071,
-    87361,
-    141200,
-    12476,
-    61883,
-    47504,
-    147734,
-    83078,
-    81644,
-    86514,
-    70708,
-    95274,
-    45090,
-    93033,
-    8675,
-    88525,
-    103948,
-    86790,
-    81114,
-    20281,
-    176795,
-    119505,
-    109176,
-    7503,
-    126670,
-    46717,
-    73412,
-    91872,
-    99249,
-    65731,
-    103775,
-    61632,
-    1550,
-    23994,
-    123175,
-    69223,
-    21807,
-    80736,
-    5154,
-    106138,
-    109201,
-    156543,
-    105115,
-    90038,
-    130921,
-    58152,
-    137759,
-    104784,
-    8074,
-    95780,
-    17078,
-    18591,
-    12694,
-    71659,
-    126126,
-    113788,
-    28614,
-    16591,
-    74801,
-    146143,
-    153592,
-    157542,
-    58296,
-    44636,
-    6396,
-    143434,
-    82886,
-    63786,
-    30895,
-    133701,
-    75136,
-    22563,
-    58045,
-    162409,
-    35900,
-    6915,
-    52002,
-    58245,
-    119893,
-    157360,
-    42720,
-    51420,
-    98195,
-    152119,
-    153970,
-    166531,
-    141030,
-    161018,
-    24833,
-    156832,
-    70001,
-    44413,
-    85255,
-    23458,
-    147347,
-    33075,
-    106782,
-    130831,
-    5735,
-    78155,
-    95560,
-    19160,
-    106384,
-    135041,
-    145978,
-    58300,
-    161406,
-    10693,
-    120152,
-    122896,
-    44658,
-    118436,
-    93613,
-    52537,
-    135840,
-    61352,
-    32878,
-    135598,
-    146544,
-    11650,
-    24863,
-    71584,
-    129735,
-    41374,
-    127989,
-    10630,
-    165153,
-    44478,
-    122563,
-    177921,
-    66356,
-    58682,
-    32792,
-    78403,
-    63860,
-    171261,
-    106165,
-    42627,
-    152884,
-    131967,
-    113888,
-    102759,
-    126679,
-    67529,
-    97344,
-    110980,
-    1977,
-    107111,
-    165027,
-    172911,
-    46314,
-    123220,
-    63461,
-    158228,
-    94167,
-    147836,
-    46344,
-    71453,
-    6160,
-    113188,
-    34624,
-    97141,
-    158219,
-    132098,
-    149141,
-    29306,
-    50796,
-    78870,
-    47788,
-    28260,
-    85095,
-    107175,
-    37526,
-    105470,
-    140516,
-    65924,
-    24537,
-    51834,
-    147164,
-    120755,
-    66625,
-    121450,
-    179685,
-    148330,
-    45849,
-    147786,
-    107321,
-    134274,
-    126070,
-    149128,
-    161760,
-    100328,
-    126764,
-    173606,
-    109485,
-    17617,
-    137483,
-    139966,
-    69277,
-    101451,
-    74200,
-    73883,
-    10596,
-    149984,
-    52322,
-    64284,
-    8579,
-    159837,
-    165203,
-    123234,
-    136993,
-    74184,
-    80700,
-    104459,
-    79365,
-    165587,
-    13879,
-    109492,
-    19356,
-    112496,
-    144503,
-    13529,
-    37090,
-    27988,
-    53265,
-    24854,
-    59620,
-    2957,
-    99413,
-    167560,
-    70274,
-    41584,
-    149086,
-    179564,
-    150031,
-    164328,
-    45359,
-    68198,
-    166447,
-    120224,
-    35150,
-    132025,
-    27593,
-    47393,
-    53684,
-    16146,
-    136721,
-    25810,
-    127612,
-    134808,
-    29894,
-    153502,
-    66849,
-    126393,
-    163420,
-    52671,
-    6151,
-    36364,
-    3288,
-    41868,
-    109246,
-    68853,
-    36495,
-    95348,
-    80217,
-    58055,
-    112121,
-    43874,
-    93206,
-    97889,
-    37268,
-    99493,
-    39036,
-    91637,
-    18442,
-    104138,
-    68818,
-    114004,
-    30329,
-    67348,
-    74053,
-    150020,
-    142391,
-    125529,
-    46723,
-    123372,
-    109475,
-    151575,
-    90193,
-    136596,
-    50144,
-    7815,
-    139786,
-    112014,
-    18365,
-    47570,
-    52370,
-    165244,
-    128284,
-    61490,
-    152076,
-    148769,
-    179256,
-    109440,
-    1185,
-    147254,
-    98391,
-    179903,
-    159505,
-    60284,
-    117660,
-    161561,
-    8492,
-    140949,
-    93132,
-    141603,
-    119391,
-    121146,
-    131369,
-    82558,
-    164255,
-    15079,
-    57643,
-    159244,
-    95574,
-    57657,
-    2388,
-    51484,
-    169197,
-    58567,
-    101548,
-    138499,
-    26217,
-    153839,
-    112812,
-    88526,
-    124964,
-    49895,
-    65328,
-    117364,
-    177494,
-    66992,
-    106176,
-    176605,
-    110351,
-    27054,
-    31564,
-    22274,
-    151581,
-    64672,
-    176334,
-    160661,
-    20506,
-    167007,
-    36873,
-    172745,
-    14121,
-    1482,
-    307,
-    158498,
-    45579,
-    8938,
-    176852,
-    173888,
-    175886,
-    116523,
-    158212,
-    10098,
-    104130,
-    70711,
-    123167,
-    31253,
-    134877,
-    126511,
-    121911,
-    144448,
-    30546,
-    49673,
-    80503,
-    71403,
-    7001,
-    45531,
-    112019,
-    77869,
-    77397,
-    145592,
-    29849,
-    156901,
-    179020,
-    133651,
-    121717,
-    97503,
-    139079,
-    121984,
-    49717,
-    40688,
-    134798,
-    153881,
-    50556,
-    41468,
-    35235,
-    131333,
-    10748,
-    140024,
-    100425,
-    175587,
-    32989,
-    97337,
-    147724,
-    63025,
-    102091,
-    112449,
-    101730,
-    163589,
-    126499,
-    161800,
-    107763,
-    59359,
-    56286,
-    89655,
-    158605,
-    156593,
-    11855,
-    153687,
-    2502,
-    179238,
-    48572,
-    12107,
-    55629,
-    7064,
-    13615,
-    154565,
-    56405,
-    63206,
-    95806,
-    111735,
-    108757,
-    11910,
-    108941,
-    35387,
-    106957,
-    179889,
-    160447,
-    133893,
-    51472,
-    170820,
-    42965,
-    168875,
-    73764,
-    99060,
-    160518,
-    45804,
-    32702,
-    143323,
-    115506,
-    79043,
-    150960,
-    78640,
-    116965,
-    138548,
-    119108,
-    16070,
-    33150,
-    80207,
-    72878,
-    116200,
-    66588,
-    160981,
-    172819,
-    149708,
-    109802,
-    88698,
-    84175,
-    102999,
-    92935,
-    30686,
-    141762,
-    67015,
-    135569,
-    72486,
-    172837,
-    147987,
-    106257,
-    116691,
-    75876,
-    173607,
-    133804,
-    120293,
-    17272,
-    36461,
-    37322,
-    172038,
-    168081,
-    167058,
-    88626,
-    96362,
-    66268,
-    135823,
-    97340,
-    51009,
-    9908,
-    19468,
-    19961,
-    41322,
-    98139,
-    136166,
-    131548,
-    38266,
-    92030,
-    71167,
-    25271,
-    97,
-    58406,
-    127999,
-    115202,
-    99705,
-    23219,
-    165227,
-    171196,
-    29816,
-    68263,
-    136913,
-    104160,
-    71087,
-    178803,
-    42224,
-    88834,
-    39781,
-    139848,
-    65718,
-    126156,
-    24661,
-    159745,
-    24086,
-    42209,
-    145530,
-    80361,
-    26892,
-    159187,
-    131222,
-    113471,
-    108506,
-    146604,
-    162127,
-    149156,
-    83440,
-    145186,
-    134235,
-    67317,
-    163441,
-    3186,
-    110277,
-    134914,
-    40943,
-    168321,
-    114925,
-    137255,
-    165697,
-    105266,
-    126535,
-    137743,
-    84849,
-    71573,
-    38175,
-    145981,
-    179548,
-    104434,
-    175567,
-    96164,
-    40283,
-    88838,
-    104805,
-    61487,
-    76424,
-    85397,
-    40300,
-    8405,
-    151986,
-    12078,
-    56594,
-    27379,
-    15053,
-    80877,
-    105764,
-    146221,
-    83539,
-    74047,
-    80298,
-    162439,
-    60195,
-    171383,
-    30397,
-    138588,
-    157593,
-    101462,
-    52770,
-    124397,
-    115578,
-    22753,
-    94008,
-    144083,
-    55194,
-    1150,
-    5343,
-    51847,
-    81514,
-    173251,
-    59243,
-    54803,
-    147806,
-    145126,
-    114663,
-    72683,
-    142445,
-    55174,
-    52701,
-    77343,
-    63034,
-    156732,
-    78524,
-    156196,
-    26226,
-    68680,
-    115776,
-    93204,
-    138298,
-    159579,
-    34289,
-    62556,
-    119790,
-    97034,
-    60035,
-    150476,
-    77517,
-    4653,
-    118565,
-    29082,
-    99756,
-    75750,
-    96218,
-    157784,
-    33080,
-    160627,
-    16704,
-    166529,
-    3433,
-    12703,
-    5772,
-    170780,
-    125325,
-    75607,
-    98960,
-    3711,
-    144272,
-    76293,
-    98442,
-    53586,
-    52898,
-    28047,
-    4818,
-    178909,
-    11697,
-    53927,
-    172433,
-    164087,
-    71545,
-    155149,
-    140755,
-    119584,
-    146662,
-    135176,
-    108920,
-    35045,
-    130507,
-    89134,
-    132360,
-    146138,
-    50675,
-    59156,
-    78507,
-    60141,
-    35366,
-    146599,
-    175589,
-    32123,
-    16098,
-    95680,
-    63434,
-    31317,
-    37250,
-    37061,
-    100910,
-    118579,
-    113602,
-    82111,
-    58943,
-    34697,
-    54138,
-    4243,
-    113703,
-    134051,
-    121599,
-    115238,
-    9384,
-    158834,
-    118584,
-    47894,
-    150171,
-    12355,
-    114958,
-    158397,
-    102505,
-    80647,
-    65255,
-    162207,
-    27107,
-    108194,
-    9261,
-    87352,
-    34190,
-    91888,
-    88998,
-    24927,
-    141429,
-    99900,
-    71077,
-    159683,
-    33016,
-    122299,
-    73330,
-    143406,
-    47159,
-    150363,
-    87383,
-    45089,
-    101577,
-    23171,
-    51364,
-    67090,
-    128412,
-    69216,
-    22246,
-    86321,
-    23803,
-    139274,
-    7209,
-    120109,
-    65396,
-    145305,
-    173409,
-    93639,
-    47648,
-    81960,
-    107279,
-    138210,
-    34605,
-    56300,
-    90108,
-    7911,
-    2103,
-    99682,
-    140189,
-    95537,
-    10448,
-    166480,
-    114157,
-    22002,
-    67701,
-    67128,
-    35012,
-    70761,
-    141701,
-    107202,
-    41101,
-    168346,
-    54477,
-    5966,
-    81665,
-    126380,
-    123457,
-    11214,
-    50698,
-    46440,
-    63644,
-    128147,
-    159567,
-    174847,
-    92149,
-    97402,
-    69261,
-    11056,
-    172739,
-    29423,
-    29979,
-    5022,
-    25375,
-    5208,
-    97801,
-    93989,
-    52561,
-    92095,
-    116672,
-    123090,
-    19664,
-    32517,
-    125881,
-    49125,
-    153814,
-    78839,
-    62037,
-    100664,
-    124690,
-    155017,
-    6580,
-    160658,
-    114732,
-    70221,
-    65292,
-    135192,
-    51073,
-    99520,
-    161441,
-    160416,
-    21083,
-    68501,
-    23293,
-    177787,
-    104981,
-    25541,
-    173159,
-    2044,
-    53924,
-    141388,
-    110615,
-    54198,
-    76906,
-    22973,
-    153500,
-    130380,
-    3782,
-    110431,
-    104066,
-    159983,
-    179041,
-    30121,
-    160918,
-    63876,
-    14283,
-    135226,
-    38136,
-    102914,
-    68668,
-    63277,
-    67547,
-    129287,
-    115396,
-    115449,
-    71682,
-    167221,
-    102298,
-    80328,
-    97770,
-    74422,
-    70324,
-    115103,
-    4218,
-    149383,
-    17923,
-    73030,
-    137771,
-    121882,
-    168609,
-    145390,
-    68546,
-    85748,
-    161396,
-    168113,
-    159396,
-    148262,
-    124251,
-    1999,
-    175588,
-    21132,
-    41369,
-    43384,
-    38905,
-    96345,
-    75727,
-    86343,
-    117909,
-    165189,
-    123166,
-    116092,
-    67668,
-    62130,
-    82919,
-    87894,
-    94379,
-    133925,
-    394,
-    155551,
-    164926,
-    91052,
-    161038,
-    127508,
-    161816,
-    158919,
-    107551,
-    131350,
-    163575,
-    146605,
-    136152,
-    149,
-    134303,
-    170407,
-    75534,
-    85064,
-    16240,
-    164670,
-    91600,
-    172566,
-    152782,
-    59635,
-    131884,
-    90220,
-    76254,
-    133504,
-    56761,
-    55921,
-    155766,
-    131810,
-    62331,
-    34802,
-    171844,
-    81488,
-    157778,
-    111390,
-    68139,
-    175940,
-    64596,
-    99374,
-    127102,
-    75843,
-    41872,
-    107852,
-    164991,
-    74429,
-    156883,
-    57833,
-    92381,
-    111543,
-    112377,
-    47513,
-    167838,
-    131328,
-    175717,
-    82854,
-    57842,
-    99101,
-    179684,
-    65284,
-    17037,
-    109329,
-    28355,
-    167199,
-    91245,
-    4072,
-    173611,
-    51429,
-    63236,
-    152466,
-    80968,
-    166724,
-    179675,
-    112090,
-    75847,
-    128663,
-    105486,
-    17723,
-    15200,
-    129906,
-    48995,
-    144326,
-    122213,
-    172093,
-    9804,
-    61115,
-    44474,
-    167054,
-    56104,
-    150941,
-    154550,
-    33230,
-    103368,
-    142620,
-    7459,
-    147974,
-    108429,
-    7092,
-    3589,
-    21936,
-    165292,
-    162655,
-    53925,
-    44524,
-    33165,
-    126339,
-    46810,
-    38410,
-    8841,
-    84704,
-    121080,
-    124222,
-    70170,
-    85347,
-    171431,
-    172351,
-    31580,
-    37790,
-    34254,
-    107581,
-    61777,
-    37174,
-    146667,
-    63157,
-    29614,
-    151191,
-    71329,
-    117476,
-    39943,
-    35766,
-    26504,
-    20450,
-    47161,
-    173490,
-    88474,
-    85437,
-    146910,
-    90174,
-    148625,
-    25272,
-    113697,
-    150597,
-    12273,
-    170247,
-    8551,
-    70520,
-    109568,
-    159819,
-    36077,
-    159051,
-    134781,
-    115323,
-    139218,
-    58222,
-    134049,
-    12223,
-    56375,
-    73597,
-    149675,
-    109207,
-    107961,
-    79144,
-    57727,
-    117216,
-    122067,
-    77223,
-    159047,
-    75806,
-    23373,
-    28826,
-    28875,
-    101686,
-    166693,
-    99665,
-    34068,
-    48945,
-    165804,
-    105965,
-    113029,
-    138372,
-    9906,
-    156399,
-    28686,
-    179394,
-    28719,
-    139124,
-    179040,
-    175296,
-    28043,
-    89105,
-    81192,
-    63685,
-    174237,
-    33616,
-    115920,
-    42788,
-    73589,
-    63027,
-    162105,
-    146243,
-    137044,
-    63751,
-    49291,
-    73425,
-    172278,
-    23492,
-    111107,
-    11313,
-    151698,
-    3208,
-    37961,
-    49873,
-    28785,
-    3800,
-    168780,
-    178101,
-    27693,
-    162930,
-    164033,
-    85769,
-    117558,
-    47978,
-    84103,
-    61538,
-    153059,
-    159483,
-    170304,
-    69587,
-    169710,
-    108412,
-    159109,
-    91917,
-    16185,
-    142548,
-    152060,
-    172872,
-    124169,
-    46322,
-    56168,
-    117826,
-    68357,
-    59759,
-    4734,
-    178854,
-    117746,
-    127079,
-    49016,
-    148571,
-    132227,
-    41902,
-    42496,
-    71109,
-    57235,
-    34418,
-    82343,
-    53863,
-    132246,
-    14525,
-    87757,
-    17481,
-    1779,
-    34114,
-    146319,
-    168621,
-    176591,
-    175875,
-    72937,
-    96374,
-    13126,
-    169598,
-    22934,
-    129435,
-    177665,
-    41874,
-    72958,
-    140437,
-    35760,
-    79336,
-    146407,
-    107947,
-    144953,
-    128250,
-    60111,
-    33187,
-    151981,
-    122634,
-    62332,
-    138672,
-    137038,
-    25606,
-    125457,
-    44771,
-    75000,
-    122818,
-    175303,
-    55727,
-    86578,
-    84835,
-    46347,
-    125295,
-    42848,
-    173907,
-    105554,
-    161250,
-    44723,
-    150672,
-    14666,
-    35479,
-    20351,
-    97457,
-    119203,
-    12070,
-    169750,
-    168072,
-    89198,
-    106944,
-    55867,
-    104874,
-    100799,
-    157553,
-    78915,
-    153622,
-    58124,
-    83654,
-    119452,
-    19112,
-    64714,
-    33159,
-    52013,
-    64201,
-    34211,
-    172339,
-    67841,
-    10545,
-    43216,
-    46593,
-    46812,
-    63473,
-    69684,
-    52341,
-    90078,
-    157130,
-    160945,
-    89629,
-    145604,
-    8658,
-    175307,
-    119476,
-    21235,
-    93585,
-    19408,
-    20903,
-    117204,
-    94751,
-    165264,
-    31924,
-    88305,
-    87518,
-    91875,
-    117624,
-    155365,
-    10757,
-    0,
-    102285,
-    9652,
-    157783,
-    159159,
-    78057,
-    169075,
-    91220,
-    119113,
-    176458,
-    9681,
-    6442,
-    137699,
-    64965,
-    58482,
-    113865,
-    159447,
-    96105,
-    29637,
-    143397,
-    15884,
-    95620,
-    132789,
-    75903,
-    71823,
-    31647,
-    70907,
-    28411,
-    68179,
-    7162,
-    132854,
-    127156,
-    25173,
-    15525,
-    150832,
-    5637,
-    3429,
-    54733,
-    85882,
-    109840,
-    158057,
-    28576,
-    3494,
-    117821,
-    43006,
-    74043,
-    113847,
-    173843,
-    131649,
-    112640,
-    153762,
-    23971,
-    93564,
-    60337,
-    15538,
-    121905,
-    25100,
-    131392,
-    130898,
-    26410,
-    101220,
-    5059,
-    151199,
-    55216,
-    54321,
-    162866,
-    66579,
-    42247,
-    67927,
-    162934,
-    81031,
-    5491,
-    170330,
-    80321,
-    177227,
-    79983,
-    68829,
-    177808,
-    124186,
-    166731,
-    39187,
-    44383,
-    179588,
-    57140,
-    121848,
-    178120,
-    9320,
-    100024,
-    169947,
-    46170,
-    129338,
-    57493,
-    5448,
-    119071,
-    84793,
-    16607,
-    133300,
-    64979,
-    92757,
-    72986,
-    162311,
-    130558,
-    177799,
-    102199,
-    156230,
-    77002,
-    114786,
-    149525,
-    59403,
-    157602,
-    108974,
-    76238,
-    81896,
-    171770,
-    152347,
-    145033,
-    122503,
-    155678,
-    158773,
-    65084,
-    175997,
-    9836,
-    28763,
-    63589,
-    43014,
-    153022,
-    49490,
-    13985,
-    38845,
-    89564,
-    30376,
-    128964,
-    146797,
-    98745,
-    17884,
-    122751,
-    169119,
-    124337,
-    65969,
-    154601,
-    129767,
-    80336,
-    9997,
-    106204,
-    55235,
-    55024,
-    108410,
-    109104,
-    166983,
-    20577,
-    42586,
-    98992,
-    39143,
-    93367,
-    62956,
-    9350,
-    117390,
-    161817,
-    42888,
-    119642,
-    65915,
-    4465,
-    101515,
-    42735,
-    141466,
-    45846,
-    108253,
-    41890,
-    125502,
-    107103,
-    82077,
-    98221,
-    120319,
-    107199,
-    166047,
-    41529,
-    29291,
-    36966,
-    8764,
-    62109,
-    8196,
-    60106,
-    148975,
-    52356,
-    142956,
-    120274,
-    84233,
-    32560,
-    129515,
-    56233,
-    140639,
-    52053,
-    25700,
-    56871,
-    176382,
-    45303,
-    173997,
-    151305,
-    162198,
-    16327,
-    109094,
-    116301,
-    22728,
-    5789,
-    136804,
-    22947,
-    50703,
-    66353,
-    48855,
-    660,
-    124760,
-    152640,
-    81841,
-    122368,
-    64453,
-    32302,
-    147306,
-    95113,
-    14029,
-    163986,
-    12861,
-    96399,
-    75162,
-    105956,
-    35223,
-    111420,
-    121923,
-    136077,
-    159838,
-    67900,
-    19185,
-    136539,
-    55894,
-    119106,
-    88117,
-    3260,
-    31303,
-    46591,
-    38925,
-    7863,
-    123461,
-    21835,
-    8088,
-    146593,
-    44596,
-    127846,
-    18984,
-    57780,
-    10366,
-    143553,
-    126186,
-    31239,
-    32549,
-    45758,
-    165642,
-    102731,
-    91928,
-    176068,
-    14818,
-    46147,
-    91768,
-    111893,
-    15342,
-    59820,
-    40569,
-    125602,
-    20606,
-    163509,
-    169246,
-    61577,
-    46446,
-    128698,
-    19934,
-    121900,
-    104503,
-    68252,
-    84889,
-    115367,
-    22048,
-    10464,
-    69426,
-    136103,
-    82636,
-    88930,
-    155379,
-    13131,
-    5537,
-    42087,
-    4339,
-    63963,
-    84608,
-    32113,
-    48359,
-    153482,
-    13379,
-    75325,
-    166998,
-    33453,
-    16742,
-    3119,
-    31231,
-    95693,
-    88693,
-    116614,
-    173320,
-    142216,
-    104468,
-    31148,
-    101338,
-    178171,
-    64797,
-    7003,
-    130210,
-    444,
-    129697,
-    95540,
-    125367,
-    104825,
-    53708,
-    109860,
-    63706,
-    109916,
-    98292,
-    27964,
-    22780,
-    150612,
-    15364,
-    116948,
-    41886,
-    68473,
-    131697,
-    49187,
-    29078,
-    62537,
-    13695,
-    139671,
-    75685,
-    50139,
-    90716,
-    153027,
-    81918,
-    58430,
-    135883,
-    24069,
-    112903,
-    44691,
-    178975,
-    21768,
-    153963,
-    67557,
-    154878,
-    117850,
-    82880,
-    25930,
-    140354,
-    121758,
-    169177,
-    91849,
-    26254,
-    126172,
-    24462,
-    179408,
-    51797,
-    144273,
-    130737,
-    72899,
-    3245,
-    105091,
-    101418,
-    160830,
-    30035,
-    165499,
-    20304,
-    140556,
-    157328,
-    140979,
-    72205,
-    176577,
-    148098,
-    167434,
-    25733,
-    93563,
-    117932,
-    12881,
-    168172,
-    38995,
-    136189,
-    107605,
-    148825,
-    59864,
-    133182,
-    159784,
-    86057,
-    120588,
-    159770,
-    92280,
-    92143,
-    138430,
-    41222,
-    60004,
-    120736,
-    145813,
-    111648,
-    59906,
-    54835,
-    135783,
-    107537,
-    165681,
-    101775,
-    103402,
-    82564,
-    134645,
-    14820,
-    111939,
-    83130,
-    43044,
-    115389,
-    178762,
-    178094,
-    97133,
-    3690,
-    150764,
-    159825,
-    35343,
-    39031,
-    78238,
-    72187,
-    35905,
-    126891,
-    89775,
-    174824,
-    11225,
-    123389,
-    25431,
-    62064,
-    70060,
-    25818,
-    134722,
-    174592,
-    63298,
-    44089,
-    132148,
-    17679,
-    21724,
-    130272,
-    96490,
-    172429,
-    134691,
-    5616,
-    86104,
-    169109,
-    66240,
-    112709,
-    144690,
-    50280,
-    90015,
-    99376,
-    70196,
-    132213,
-    63647,
-    145434,
-    114871,
-    41109,
-    40367,
-    121062,
-    148592,
-    58892,
-    16874,
-    116771,
-    139127,
-    93157,
-    5082,
-    23462,
-    119167,
-    147379,
-    97393,
-    152074,
-    134896,
-    380,
-    21163,
-    125735,
-    49335,
-    154462,
-    22482,
-    44937,
-    50562,
-    74129,
-    63158,
-    93117,
-    116820,
-    53347,
-    118382,
-    159624,
-    48249,
-    49601,
-    105295,
-    116646,
-    42820,
-    117978,
-    55268,
-    4461,
-    2831,
-    84165,
-    63585,
-    17546,
-    23635,
-    85219,
-    150587,
-    23843,
-    19203,
-    92622,
-    65752,
-    37424,
-    135201,
-    130034,
-    148701,
-    4710,
-    96517,
-    81692,
-    46507,
-    119936,
-    143187,
-    110,
-    67252,
-    79045,
-    55870,
-    137798,
-    87627,
-    32554,
-    36789,
-    129810,
-    49970,
-    143050,
-    95855,
-    31033,
-    135377,
-    107944,
-    140076,
-    118985,
-    116592,
-    25462,
-    31557,
-    101786,
-    167107,
-    18260,
-    149490,
-    174639,
-    51223,
-    34776,
-    46071,
-    35893,
-    84270,
-    47251,
-    145665,
-    71857,
-    27380,
-    28599,
-    67565,
-    157964,
-    71172,
-    8708,
-    50912,
-    40637,
-    134522,
-    16762,
-    3791,
-    69947,
-    160031,
-    27103,
-    97996,
-    64598,
-    100484,
-    124852,
-    10826,
-    138063,
-    177677,
-    155540,
-    64078,
-    27829,
-    81239,
-    150367,
-    65271,
-    101278,
-    125859,
-    126793,
-    53899,
-    42762,
-    149538,
-    115564,
-    89328,
-    43242,
-    113755,
-    155994,
-    50814,
-    8777,
-    40374,
-    58610,
-    1516,
-    15758,
-    52267,
-    94272,
-    168432,
-    28808,
-    135178,
-    69174,
-    144327,
-    124297,
-    97546,
-    136990,
-    172283,
-    164979,
-    179210,
-    8444,
-    41531,
-    83355,
-    134344,
-    87961,
-    127361,
-    97977,
-    140745,
-    41288,
-    17008,
-    104164,
-    28218,
-    154795,
-    34882,
-    146523,
-    95751,
-    13649,
-    62734,
-    65791,
-    3950,
-    132057,
-    107934,
-    139158,
-    11727,
-    27247,
-    110992,
-    124859,
-    77170,
-    60969,
-    31495,
-    119027,
-    131538,
-    134318,
-    70882,
-    65753,
-    132557,
-    159880,
-    134541,
-    56285,
-    119475,
-    106142,
-    135464,
-    145488,
-    145907,
-    43077,
-    165053,
-    46387,
-    128481,
-    162344,
-    26481,
-    73173,
-    58143,
-    31742,
-    166100,
-    59814,
-    172945,
-    75392,
-    177049,
-    86147,
-    44111,
-    77005,
-    85177,
-    168541,
-    156031,
-    52535,
-    174079,
-    142717,
-    27249,
-    83999,
-    81854,
-    164075,
-    28881,
-    92101,
-    43801,
-    81054,
-    79478,
-    4280,
-    145601,
-    48649,
-    41317,
-    135708,
-    154815,
-    146765,
-    176378,
-    9494,
-    48470,
-    66042,
-    4197,
-    64844,
-    162195,
-    170698,
-    91379,
-    169731,
-    106389,
-    140174,
-    96000,
-    161757,
-    88079,
-    87734,
-    37354,
-    16963,
-    126717,
-    889,
-    64560,
-    36707,
-    90807,
-    95786,
-    170325,
-    13320,
-    1465,
-    27667,
-    6980,
-    21453,
-    2868,
-    53086,
-    124091,
-    151900,
-    14994,
-    74733,
-    60603,
-    167589,
-    53499,
-    84029,
-    167779,
-    89163,
-    60448,
-    62078,
-    61755,
-    121,
-    109421,
-    138167,
-    58605,
-    172462,
-    46528,
-    69585,
-    2784,
-    160596,
-    14030,
-    151432,
-    61419,
-    104795,
-    88037,
-    11193,
-    117726,
-    138033,
-    162594,
-    169557,
-    16154,
-    124811,
-    136131,
-    126235,
-    6117,
-    96562,
-    103346,
-    46645,
-    18631,
-    103269,
-    162153,
-    83367,
-    163675,
-    75635,
-    78149,
-    112567,
-    60170,
-    93903,
-    91835,
-    21355,
-    165646,
-    176774,
-    102673,
-    138871,
-    169247,
-    175082,
-    174527,
-    72236,
-    109831,
-    114566,
-    171746,
-    179513,
-    60253,
-    27602,
-    62484,
-    112861,
-    147660,
-    80019,
-    93378,
-    61375,
-    88725,
-    51748,
-    15749,
-    24426,
-    119112,
-    120869,
-    144795,
-    50173,
-    2174,
-    152623,
-    115980,
-    131214,
-    154649,
-    24340,
-    84685,
-    178483,
-    114256,
-    95633,
-    131082,
-    61042,
-    90913,
-    91519,
-    44402,
-    123132,
-    90718,
-    57038,
-    140623,
-    108488,
-    139564,
-    96809,
-    40930,
-    83598,
-    34943,
-    120475,
-    60192,
-    99651,
-    12246,
-    76896,
-    59240,
-    151859,
-    147457,
-    156518,
-    113833,
-    119908,
-    162706,
-    118914,
-    57417,
-    154124,
-    23784,
-    131472,
-    64311,
-    150850,
-    145591,
-    33460,
-    34554,
-    139080,
-    42824,
-    169572,
-    48851,
-    133045,
-    56863,
-    9960,
-    27406,
-    135913,
-    12033,
-    128972,
-    119841,
-    83519,
-    30096,
-    166954,
-    40535,
-    29189,
-    149215,
-    155734,
-    62872,
-    124513,
-    148298,
-    87286,
-    50563,
-    103098,
-    83931,
-    105761,
-    138987,
-    177483,
-    134394,
-    172058,
-    130061,
-    83694,
-    84048,
-    19461,
-    1254,
-    84014,
-    36600,
-    58975,
-    132995,
-    160420,
-    91016,
-    153553,
-    111731,
-    30922,
-    126694,
-    63149,
-    124895,
-    152129,
-    126987,
-    138005,
-    10624,
-    76296,
-    126716,
-    46742,
-    126256,
-    160095,
-    166560,
-    62851,
-    44907,
-    60346,
-    162559,
-    21954,
-    86744,
-    13141,
-    148490,
-    71768,
-    177380,
-    145045,
-    128137,
-    88221,
-    161722,
-    94337,
-    98953,
-    121794,
-    26131,
-    47370,
-    9580,
-    55570,
-    65664,
-    161521,
-    108865,
-    34264,
-    34182,
-    6936,
-    81706,
-    148861,
-    84,
-    159736,
-    149781,
-    74296,
-    110296,
-    147958,
-    84670,
-    159713,
-    65557,
-    58789,
-    175579,
-    165259,
-    48233,
-    142538,
-    24,
-    166568,
-    32056,
-    6924,
-    166953,
-    112846,
-    167155,
-    10543,
-    92048,
-    65754,
-    51681,
-    63431,
-    7614,
-    77822,
-    88923,
-    76239,
-    81914,
-    131366,
-    30203,
-    24500,
-    168228,
-    61150,
-    9970,
-    31666,
-    5124,
-    53433,
-    51603,
-    19550,
-    33972,
-    141273,
-    30672,
-    42927,
-    85906,
-    130477,
-    43712,
-    117030,
-    50870,
-    162009,
-    63937,
-    142153,
-    60939,
-    77102,
-    158807,
-    10169,
-    140271,
-    142809,
-    36402,
-    65561,
-    20399,
-    19735,
-    173018,
-    47325,
-    120105,
-    72929,
-    51196,
-    64406,
-    175799,
-    112819,
-    165673,
-    98719,
-    117525,
-    35443,
-    172526,
-    151449,
-    154995,
-    37753,
-    160582,
-    34990,
-    15477,
-    178505,
-    105719,
-    20485,
-    44606,
-    71962,
-    71703,
-    33277,
-    97198,
-    102040,
-    133585,
-    68893,
-    158607,
-    55104,
-    32764,
-    22373,
-    179103,
-    37063,
-    61399,
-    20933,
-    159165,
-    118114,
-    118749,
-    86735,
-    29268,
-    114882,
-    85355,
-    61120,
-    30826,
-    78688,
-    42730,
-    92561,
-    151727,
-    160089,
-    128640,
-    150700,
-    177468,
-    166311,
-    159125,
-    5644,
-    145101,
-    86473,
-    134083,
-    88321,
-    89164,
-    94648,
-    150565,
-    18713,
-    18270,
-    165191,
-    124729,
-    111192,
-    22632,
-    93828,
-    84102,
-    157344,
-    66424,
-    3294,
-    145866,
-    94680,
-    156835,
-    48234,
-    109685,
-    106465,
-    17220,
-    170356,
-    167176,
-    176821,
-    114170,
-    6974,
-    87839,
-    78849,
-    76979,
-    133805,
-    150186,
-    113848,
-    132772,
-    128820,
-    179492,
-    115743,
-    111423,
-    29728,
-    164560,
-    65818,
-    127221,
-    120976,
-    132712,
-    102612,
-    46171,
-    78039,
-    163114,
-    142641,
-    23642,
-    136512,
-    17732,
-    93999,
-    23503,
-    65856,
-    137506,
-    102950,
-    98095,
-    37366,
-    109991,
-    130143,
-    53543,
-    119861,
-    84276,
-    144929,
-    129779,
-    134406,
-    105365,
-    39408,
-    25495,
-    33966,
-    171460,
-    115704,
-    69886,
-    69791,
-    123037,
-    178672,
-    63443,
-    39761,
-    153501,
-    159283,
-    27271,
-    162233,
-    148393,
-    127068,
-    126360,
-    61575,
-    18576,
-    163373,
-    146735,
-    89100,
-    148668,
-    134636,
-    143847,
-    73982,
-    14384,
-    123187,
-    90513,
-    169659,
-    138842,
-    166135,
-    166448,
-    47580,
-    179206,
-    126445,
-    38101,
-    179439,
-    117386,
-    161169,
-    18938,
-    83043,
-    49320,
-    64448,
-    133252,
-    59644,
-    62488,
-    76164,
-    95858,
-    97111,
-    75189,
-    109887,
-    161694,
-    80034,
-    142083,
-    73645,
-    160782,
-    152700,
-    101915,
-    59579,
-    141579,
-    70252,
-    121828,
-    82584,
-    42930,
-    110534,
-    134431,
-    76837,
-    178720,
-    92396,
-    32655,
-    114754,
-    7259,
-    159994,
-    115422,
-    22059,
-    52629,
-    35449,
-    106441,
-    87002,
-    91734,
-    114378,
-    168368,
-    64421,
-    136809,
-    93670,
-    151910,
-    59212,
-    61117,
-    23035,
-    56821,
-    37184,
-    117779,
-    53670,
-    121272,
-    116415,
-    136887,
-    88831,
-    42857,
-    37592,
-    116653,
-    57346,
-    46162,
-    139383,
-    148897,
-    77349,
-    11131,
-    107034,
-    123770,
-    147165,
-    47909,
-    143076,
-    142570,
-    107642,
-    1623,
-    40082,
-    148761,
-    127946,
-    82627,
-    165729,
-    8365,
-    78357,
-    47946,
-    79356,
-    113596,
-    87806,
-    65855,
-    78158,
-    14544,
-    328,
-    54372,
-    62611,
-    121554,
-    99470,
-    160419,
-    130471,
-    86869,
-    82367,
-    30811,
-    30752,
-    157410,
-    128579,
-    89184,
-    22850,
-    83852,
-    29243,
-    78595,
-    147963,
-    110940,
-    128323,
-    178528,
-    165800,
-    130707,
-    27120,
-    63796,
-    175426,
-    171177,
-    142639,
-    164225,
-    47853,
-    150469,
-    113516,
-    18363,
-    63065,
-    70042,
-    68253,
-    38956,
-    11942,
-    25866,
-    177010,
-    14825,
-    21002,
-    94740,
-    159984,
-    49653,
-    62888,
-    134287,
-    87934,
-    2331,
-    38396,
-    92207,
-    17282,
-    60751,
-    69527,
-    131629,
-    37043,
-    148956,
-    97323,
-    146182,
-    53851,
-    22514,
-    53960,
-    88338,
-    13563,
-    10656,
-    159679,
-    41339,
-    144492,
-    147995,
-    97213,
-    41268,
-    166474,
-    95258,
-    10434,
-    157847,
-    59606,
-    15403,
-    151960,
-    172521,
-    112788,
-    57966,
-    135260,
-    76902,
-    6771,
-    104735,
-    73450,
-    151056,
-    162589,
-    32722,
-    124027,
-    106570,
-    110010,
-    157967,
-    45260,
-    125518,
-    6724,
-    64854,
-    20570,
-    162558,
-    115785,
-    88932,
-    57733,
-    151438,
-    22626,
-    159732,
-    135414,
-    103377,
-    160952,
-    129393,
-    146339,
-    36289,
-    161542,
-    37750,
-    16724,
-    68319,
-    32288,
-    175192,
-    170482,
-    33644,
-    70757,
-    90792,
-    114875,
-    134506,
-    169038,
-    106427,
-    309,
-    99148,
-    174520,
-    124885,
-    9357,
-    62633,
-    163022,
-    30227,
-    54727,
-    153548,
-    25965,
-    129763,
-    151709,
-    158630,
-    140317,
-    94054,
-    3594,
-    15513,
-    26411,
-    149221,
-    133056,
-    122662,
-    120142,
-    142999,
-    18978,
-    55920,
-    141391,
-    104683,
-    108278,
-    96577,
-    76739,
-    86855,
-    44384,
-    75815,
-    128873,
-    154695,
-    174024,
-    40060,
-    167956,
-    8353,
-    125142,
-    51249,
-    102627,
-    132310,
-    32042,
-    61756,
-    128417,
-    226,
-    54657,
-    109231,
-    161864,
-    78798,
-    90737,
-    171355,
-    110062,
-    78180,
-    172308,
-    110316,
-    119876,
-    23111,
-    120311,
-    38104,
-    158870,
-    170929,
-    159503,
-    109832,
-    24314,
-    134057,
-    174774,
-    63648,
-    11518,
-    95086,
-    143148,
-    21517,
-    74519,
-    87403,
-    76801,
-    16176,
-    167696,
-    60663,
-    16581,
-    31089,
-    136675,
-    162137,
-    127967,
-    35420,
-    14870,
-    69982,
-    15092,
-    179687,
-    107287,
-    150006,
-    174392,
-    75588,
-    138603,
-    160753,
-    176130,
-    103734,
-    122050,
-    87075,
-    2651,
-    87439,
-    25481,
-    24635,
-    3069,
-    96145,
-    109659,
-    92773,
-    108895,
-    86367,
-    24021,
-    115345,
-    162431,
-    65099,
-    91495,
-    52720,
-    120267,
-    53656,
-    177065,
-    104743,
-    71552,
-    132373,
-    145946,
-    173167,
-    126932,
-    112539,
-    89213,
-    45179,
-    95986,
-    5013,
-    114641,
-    9259,
-    118582,
-    22249,
-    145248,
-    61325,
-    5099,
-    59329,
-    16246,
-    86605,
-    78536,
-    43083,
-    137171,
-    104909,
-    94936,
-    89632,
-    29718,
-    37591,
-    37075,
-    107425,
-    141523,
-    17797,
-    90120,
-    86195,
-    70226,
-    21369,
-    157119,
-    68623,
-    98731,
-    155120,
-    104370,
-    107426,
-    149260,
-    58948,
-    31964,
-    108887,
-    171189,
-    129643,
-    24367,
-    27756,
-    170191,
-    31129,
-    160546,
-    135459,
-    96271,
-    153455,
-    166087,
-    174192,
-    6181,
-    151082,
-    53510,
-    2827,
-    60190,
-    150639,
-    68543,
-    111204,
-    170112,
-    108836,
-    60389,
-    68989,
-    129202,
-    132315,
-    167140,
-    38120,
-    1874,
-    54556,
-    115567,
-    31862,
-    48979,
-    119473,
-    54568,
-    7693,
-    88065,
-    170033,
-    122727,
-    54280,
-    51014,
-    140069,
-    838,
-    122955,
-    100249,
-    111990,
-    60668,
-    114827,
-    9371,
-    154375,
-    134475,
-    148569,
-    163887,
-    94228,
-    105090,
-    163743,
-    118916,
-    46677,
-    14292,
-    51526,
-    145550,
-    122633,
-    142856,
-    10801,
-    139065,
-    115466,
-    74928,
-    109890,
-    50495,
-    107910,
-    35047,
-    133016,
-    25800,
-    112931,
-    131823,
-    177068,
-    24325,
-    87368,
-    136465,
-    66140,
-    12077,
-    32335,
-    52678,
-    57555,
-    125883,
-    115222,
-    60483,
-    177509,
-    109442,
-    32041,
-    54370,
-    86336,
-    146790,
-    19528,
-    11296,
-    158604,
-    111154,
-    73093,
-    105776,
-    91314,
-    82200,
-    10836,
-    106612,
-    165893,
-    145409,
-    38678,
-    112104,
-    105612,
-    163157,
-    169101,
-    128944,
-    23598,
-    121414,
-    43758,
-    108900,
-    55684,
-    73999,
-    86279,
-    15983,
-    79790,
-    16594,
-    25539,
-    12186,
-    84559,
-    35910,
-    170141,
-    117927,
-    75109,
-    126276,
-    89176,
-    30352,
-    145155,
-    146879,
-    28962,
-    123161,
-    37862,
-    75647,
-    109959,
-    85689,
-    48125,
-    109486,
-    132051,
-    161932,
-    72137,
-    168204,
-    116919,
-    100413,
-    64871,
-    70832,
-    28086,
-    169526,
-    53649,
-    117785,
-    26291,
-    165125,
-    17890,
-    12968,
-    161266,
-    74315,
-    14330,
-    23093,
-    87869,
-    76434,
-    162782,
-    162141,
-    47421,
-    32435,
-    143289,
-    166217,
-    101341,
-    135,
-    81769,
-    138319,
-    38046,
-    102871,
-    166651,
-    57815,
-    171039,
-    104736,
-    99601,
-    106499,
-    15686,
-    165836,
-    6462,
-    49467,
-    156752,
-    44799,
-    80593,
-    146315,
-    41087,
-    42336,
-    61948,
-    138719,
-    33010,
-    151688,
-    179170,
-    112452,
-    103792,
-    33544,
-    145077,
-    102822,
-    95031,
-    10168,
-    30468,
-    40488,
-    77439,
-    97992,
-    21254,
-    123725,
-    157572,
-    84322,
-    45772,
-    26835,
-    129762,
-    115905,
-    121405,
-    131928,
-    38626,
-    125415,
-    57025,
-    156749,
-    80113,
-    60727,
-    4162,
-    152231,
-    103918,
-    152978,
-    156421,
-    106551,
-    108812,
-    176660,
-    46920,
-    13708,
-    38150,
-    59697,
-    55477,
-    128509,
-    72200,
-    74365,
-    165161,
-    102060,
-    134214,
-    10813,
-    15618,
-    96471,
-    19296,
-    26685,
-    80660,
-    144692,
-    104911,
-    137362,
-    12860,
-    147234,
-    12870,
-    68330,
-    137582,
-    163813,
-    115722,
-    21785,
-    133302,
-    24989,
-    173772,
-    67623,
-    81318,
-    57739,
-    171736,
-    42022,
-    139735,
-    111626,
-    60602,
-    13279,
-    157731,
-    123665,
-    16798,
-    125591,
-    166987,
-    154888,
-    42019,
-    63070,
-    13238,
-    177314,
-    64116,
-    158871,
-    171375,
-    33589,
-    114667,
-    134836,
-    22655,
-    137423,
-    16723,
-    95056,
-    163873,
-    27311,
-    16530,
-    44251,
-    5232,
-    49395,
-    99210,
-    160796,
-    38361,
-    106043,
-    115710,
-    95935,
-    34137,
-    147557,
-    114199,
-    90679,
-    13952,
-    57384,
-    79607,
-    165609,
-    76913,
-    260,
-    115861,
-    50965,
-    18896,
-    74147,
-    138203,
-    148964,
-    63072,
-    32031,
-    97270,
-    56524,
-    78713,
-    58156,
-    71004,
-    92572,
-    145874,
-    15093,
-    69037,
-    26113,
-    26044,
-    128977,
-    31865,
-    139485,
-    59298,
-    9115,
-    99224,
-    13921,
-    148111,
-    47273,
-    136710,
-    94080,
-    142983,
-    64648,
-    130116,
-    30523,
-    21801,
-    155224,
-    117487,
-    72602,
-    95652,
-    130934,
-    177091,
-    121602,
-    47190,
-    75905,
-    156776,
-    156248,
-    148127,
-    134614,
-    129508,
-    81173,
-    93921,
-    45374,
-    43979,
-    158741,
-    97781,
-    151163,
-    34158,
-    79733,
-    9377,
-    85363,
-    72362,
-    36841,
-    135967,
-    1802,
-    173833,
-    60704,
-    50068,
-    83330,
-    102641,
-    16926,
-    123744,
-    3486,
-    41589,
-    119684,
-    144309,
-    152485,
-    173267,
-    37205,
-    124615,
-    18683,
-    42152,
-    99220,
-    103440,
-    21619,
-    116097,
-    48124,
-    173076,
-    52332,
-    126921,
-    65707,
-    40016,
-    149534,
-    38782,
-    63080,
-    147060,
-    29061,
-    96040,
-    142231,
-    142829,
-    18857,
-    87676,
-    36935,
-    150189,
-    49301,
-    138662,
-    158196,
-    123400,
-    144593,
-    44563,
-    117198,
-    68724,
-    116013,
-    33879,
-    145228,
-    66428,
-    53751,
-    8010,
-    144570,
-    28648,
-    5905,
-    142520,
-    167170,
-    165025,
-    67896,
-    126826,
-    136732,
-    130815,
-    89209,
-    116698,
-    66244,
-    54768,
-    69556,
-    92922,
-    145678,
-    596,
-    26327,
-    134818,
-    79366,
-    132528,
-    166149,
-    105119,
-    86816,
-    146097,
-    135447,
-    25514,
-    101955,
-    50407,
-    16991,
-    90921,
-    160998,
-    28349,
-    32534,
-    108395,
-    154365,
-    38033,
-    165313,
-    122802,
-    1765,
-    140575,
-    66408,
-    113762,
-    80485,
-    72813,
-    107681,
-    166120,
-    165450,
-    8856,
-    36554,
-    44160,
-    173659,
-    127209,
-    92050,
-    102872,
-    112653,
-    114336,
-    32496,
-    102455,
-    142191,
-    51085,
-    51664,
-    75898,
-    63551,
-    86289,
-    39386,
-    102732,
-    61730,
-    50979,
-    88334,
-    32718,
-    25881,
-    3976,
-    8898,
-    44142,
-    19840,
-    129260,
-    314,
-    46522,
-    158286,
-    117179,
-    13380,
-    178703,
-    150742,
-    107650,
-    113999,
-    130026,
-    148457,
-    41823,
-    129641,
-    146989,
-    153928,
-    56401,
-    149550,
-    124320,
-    114424,
-    58357,
-    146969,
-    172244,
-    96657,
-    24929,
-    161311,
-    103832,
-    28254,
-    27433,
-    157233,
-    74146,
-    89772,
-    93619,
-    165810,
-    63251,
-    136962,
-    41925,
-    165550,
-    86847,
-    1239,
-    179913,
-    61873,
-    11733,
-    38475,
-    87019,
-    12383,
-    142962,
-    77529,
-    123117,
-    53661,
-    63498,
-    2486,
-    42302,
-    95700,
-    7520,
-    132617,
-    16234,
-    87632,
-    10642,
-    39578,
-    170276,
-    172903,
-    147649,
-    5870,
-    31329,
-    50313,
-    17989,
-    71903,
-    178530,
-    109135,
-    88862,
-    27384,
-    163104,
-    62581,
-    55735,
-    82324,
-    70292,
-    9771,
-    68059,
-    167825,
-    169417,
-    42524,
-    7071,
-    21743,
-    100620,
-    27942,
-    10351,
-    38990,
-    112552,
-    17201,
-    55621,
-    4249,
-    117975,
-    101397,
-    119518,
-    20189,
-    101797,
-    154203,
-    173861,
-    160670,
-    56450,
-    82962,
-    117981,
-    63557,
-    26836,
-    50777,
-    134179,
-    99269,
-    47026,
-    107693,
-    15613,
-    79448,
-    15352,
-    171281,
-    102952,
-    98981,
-    51563,
-    32253,
-    175576,
-    42834,
-    45158,
-    48681,
-    157528,
-    39284,
-    64542,
-    123798,
-    137919,
-    137545,
-    52771,
-    92606,
-    101573,
-    51951,
-    31405,
-    68856,
-    129037,
-    56208,
-    138526,
-    96174,
-    160292,
-    137535,
-    115284,
-    168588,
-    145516,
-    7289,
-    24319,
-    105223,
-    15196,
-    55930,
-    135301,
-    89181,
-    3086,
-    173555,
-    24418,
-    30936,
-    93199,
-    113001,
-    163921,
-    61545,
-    118711,
-    11185,
-    40873,
-    59005,
-    86172,
-    8271,
-    55530,
-    147750,
-    17207,
-    50634,
-    12552,
-    119514,
-    129601,
-    138628,
-    35460,
-    74618,
-    81064,
-    100173,
-    10388,
-    146890,
-    105484,
-    177867,
-    176133,
-    101063,
-    111622,
-    40280,
-    21867,
-    53573,
-    87297,
-    59262,
-    12432,
-    40793,
-    111081,
-    1742,
-    133800,
-    160158,
-    112122,
-    19756,
-    76019,
-    2119,
-    65102,
-    159739,
-    105283,
-    72699,
-    134241,
-    63451,
-    71202,
-    42122,
-    138327,
-    68508,
-    96845,
-    103022,
-    175477,
-    161621,
-    85489,
-    29453,
-    5601,
-    123685,
-    55562,
-    17946,
-    25461,
-    148065,
-    102681,
-    162395,
-    118941,
-    15834,
-    65742,
-    32645,
-    28894,
-    158574,
-    30731,
-    155309,
-    106708,
-    56797,
-    143300,
-    89859,
-    113641,
-    85213,
-    4120,
-    84172,
-    151034,
-    69643,
-    78069,
-    169115,
-    110818,
-    129546,
-    68448,
-    34426,
-    73555,
-    52789,
-    103682,
-    11777,
-    162741,
-    94214,
-    156404,
-    104125,
-    85633,
-    79642,
-    139814,
-    55709,
-    12616,
-    32156,
-    36939,
-    138687,
-    77308,
-    159059,
-    133951,
-    48431,
-    114990,
-    9640,
-    91029,
-    120459,
-    78369,
-    178170,
-    106801,
-    105284,
-    176725,
-    56905,
-    117225,
-    77138,
-    159909,
-    156664,
-    81251,
-    81001,
-    52856,
-    158052,
-    150881,
-    5746,
-    83930,
-    172073,
-    158723,
-    113764,
-    42307,
-    8811,
-    174965,
-    171821,
-    118477,
-    19900,
-    111438,
-    133688,
-    78645,
-    20291,
-    114374,
-    5127,
-    167628,
-    27456,
-    135283,
-    50972,
-    91651,
-    110883,
-    30663,
-    104331,
-    167701,
-    158,
-    17926,
-    57992,
-    107351,
-    178838,
-    89171,
-    137846,
-    14180,
-    170938,
-    33932,
-    176792,
-    95993,
-    95361,
-    168185,
-    67392,
-    150529,
-    60093,
-    105748,
-    36074,
-    14846,
-    46112,
-    132217,
-    138371,
-    122518,
-    64630,
-    175770,
-    928,
-    115527,
-    29343,
-    24391,
-    119085,
-    106049,
-    80844,
-    157646,
-    127193,
-    76,
-    163485,
-    9144,
-    165174,
-    121379,
-    87984,
-    176883,
-    136347,
-    51297,
-    40347,
-    86634,
-    23730,
-    74620,
-    161954,
-    85766,
-    122278,
-    119491,
-    70569,
-    77756,
-    167276,
-    48455,
-    116256,
-    22827,
-    71061,
-    43171,
-    152321,
-    86418,
-    160126,
-    25668,
-    44748,
-    89830,
-    15816,
-    126508,
-    134807,
-    2321,
-    163449,
-    99465,
-    21701,
-    48559,
-    115790,
-    53354,
-    83614,
-    141722,
-    167033,
-    27537,
-    143906,
-    5211,
-    36957,
-    137584,
-    163595,
-    88267,
-    50179,
-    34791,
-    71771,
-    177595,
-    98949,
-    132589,
-    142171,
-    84644,
-    65883,
-    76118,
-    34396,
-    113883,
-    55743,
-    102993,
-    137874,
-    5401,
-    108193,
-    106186,
-    35821,
-    51917,
-    144912,
-    135490,
-    171491,
-    129699,
-    23252,
-    23277,
-    63437,
-    61772,
-    160395,
-    151854,
-    99271,
-    86151,
-    175149,
-    152507,
-    61343,
-    132387,
-    178095,
-    78307,
-    107784,
-    85556,
-    25323,
-    89759,
-    49060,
-    15790,
-    113363,
-    124830,
-    63384,
-    19308,
-    44910,
-    162964,
-    4078,
-    68193,
-    20350,
-    162483,
-    110590,
-    122273,
-    135776,
-    104208,
-    157004,
-    107865,
-    36143,
-    162453,
-    2505,
-    101474,
-    7242,
-    25064,
-    74691,
-    3469,
-    55964,
-    106935,
-    27614,
-    49232,
-    34925,
-    158096,
-    20814,
-    71050,
-    8924,
-    90065,
-    38285,
-    3204,
-    78762,
-    110870,
-    28923,
-    170636,
-    104440,
-    121801,
-    30913,
-    154037,
-    51373,
-    13099,
-    56062,
-    169564,
-    83626,
-    126805,
-    144418,
-    31567,
-    2941,
-    35780,
-    50582,
-    102066,
-    9311,
-    102718,
-    159664,
-    92791,
-    15794,
-    101770,
-    76504,
-    24823,
-    37181,
-    15881,
-    158650,
-    56299,
-    84637,
-    83142,
-    146576,
-    122708,
-    33631,
-    130232,
-    23934,
-    37866,
-    82385,
-    132383,
-    26363,
-    16543,
-    143098,
-    91382,
-    137333,
-    144702,
-    54180,
-    169139,
-    115778,
-    76354,
-    138399,
-    89079,
-    116760,
-    71876,
-    41906,
-    43486,
-    82555,
-    150162,
-    44992,
-    57909,
-    362,
-    39455,
-    174973,
-    133576,
-    73611,
-    102921,
-    165173,
-    13258,
-    11446,
-    12091,
-    73694,
-    57908,
-    151647,
-    13847,
-    19111,
-    103952,
-    6302,
-    19998,
-    69896,
-    49403,
-    19211,
-    124520,
-    97642,
-    108338,
-    18177,
-    141953,
-    2455,
-    126046,
-    163889,
-    30861,
-    138935,
-    150019,
-    153508,
-    52112,
-    77099,
-    140758,
-    104603,
-    161962,
-    103498,
-    32926,
-    168867,
-    79192,
-    83932,
-    25882,
-    68280,
-    26723,
-    94596,
-    19903,
-    128154,
-    83914,
-    7476,
-    4269,
-    111035,
-    98923,
-    13053,
-    13033,
-    100445,
-    143107,
-    3600,
-    174477,
-    164181,
-    124580,
-    48955,
-    25027,
-    53518,
-    94808,
-    109326,
-    117892,
-    133039,
-    120189,
-    27893,
-    132753,
-    102642,
-    78383,
-    27335,
-    156713,
-    111680,
-    29217,
-    104625,
-    177389,
-    145862,
-    104574,
-    69796,
-    67898,
-    123428,
-    153197,
-    27330,
-    27477,
-    113836,
-    94770,
-    2168,
-    161638,
-    26030,
-    28375,
-    159943,
-    33083,
-    120539,
-    779,
-    140733,
-    41667,
-    101309,
-    133973,
-    134486,
-    110067,
-    82788,
-    45349,
-    79151,
-    102043,
-    54782,
-    85391,
-    64389,
-    73692,
-    96787,
-    71769,
-    111962,
-    141423,
-    162111,
-    114734,
-    160080,
-    110731,
-    158933,
-    119165,
-    22615,
-    20748,
-    172936,
-    101316,
-    103755,
-    118534,
-    94772,
-    60225,
-    57217,
-    126248,
-    102706,
-    37413,
-    147129,
-    57106,
-    20265,
-    106877,
-    110588,
-    177316,
-    125693,
-    157460,
-    90025,
-    72841,
-    25614,
-    144975,
-    58707,
-    31093,
-    4656,
-    129324,
-    6717,
-    60057,
-    112544,
-    2320,
-    174063,
-    104402,
-    59318,
-    89640,
-    24329,
-    142576,
-    33194,
-    158010,
-    84466,
-    143816,
-    177800,
-    51643,
-    16922,
-    107436,
-    20087,
-    16783,
-    139047,
-    72418,
-    124079,
-    48730,
-    147664,
-    86798,
-    45143,
-    85809,
-    126953,
-    145270,
-    79762,
-    3395,
-    113575,
-    141470,
-    130391,
-    170183,
-    166928,
-    53931,
-    45831,
-    139215,
-    110101,
-    27308,
-    149640,
-    91924,
-    107241,
-    79130,
-    109099,
-    57222,
-    25560,
-    39138,
-    163421,
-    100150,
-    125987,
-    166515,
-    94993,
-    126215,
-    116917,
-    155544,
-    74775,
-    24640,
-    97817,
-    70095,
-    144698,
-    56268,
-    58205,
-    55066,
-    509,
-    161281,
-    116422,
-    21164,
-    114431,
-    176619,
-    132107,
-    104167,
-    78225,
-    153665,
-    109817,
-    96739,
-    163201,
-    16569,
-    659,
-    50988,
-    28513,
-    8092,
-    43321,
-    167543,
-    154804,
-    128806,
-    72380,
-    75841,
-    75576,
-    137127,
-    37395,
-    16968,
-    121586,
-    103260,
-    93279,
-    88154,
-    68262,
-    96325,
-    136770,
-    47324,
-    142950,
-    133782,
-    147548,
-    117115,
-    19294,
-    37894,
-    109729,
-    123250,
-    62314,
-    75863,
-    136301,
-    141750,
-    7225,
-    17213,
-    101625,
-    1696,
-    136261,
-    84800,
-    100407,
-    88097,
-    45558,
-    87887,
-    95444,
-    99888,
-    137764,
-    149939,
-    36560,
-    98366,
-    44469,
-    114055,
-    164996,
-    57234,
-    155209,
-    104915,
-    21895,
-    49596,
-    115719,
-    170029,
-    52920,
-    40795,
-    63766,
-    4639,
-    107428,
-    124427,
-    153173,
-    46890,
-    151071,
-    3427,
-    19102,
-    30847,
-    62377,
-    80879,
-    58309,
-    140598,
-    6865,
-    120034,
-    61342,
-    176084,
-    139275,
-    177543,
-    42401,
-    172809,
-    78928,
-    3166,
-    172572,
-    128618,
-    644,
-    28963,
-    169062,
-    128555,
-    33109,
-    159692,
-    74402,
-    396,
-    173101,
-    64342,
-    158913,
-    168575,
-    64507,
-    117051,
-    177442,
-    102019,
-    5831,
-    120434,
-    96513,
-    157931,
-    59637,
-    21493,
-    91503,
-    150650,
-    119267,
-    158778,
-    25781,
-    40419,
-    156069,
-    61808,
-    161477,
-    159416,
-    161574,
-    145632,
-    6422,
-    175484,
-    122326,
-    27101,
-    66845,
-    147366,
-    86334,
-    132456,
-    153510,
-    67549,
-    134449,
-    52556,
-    93636,
-    164610,
-    80095,
-    81623,
-    79591,
-    40960,
-    87536,
-    91219,
-    109174,
-    26267,
-    114468,
-    124030,
-    112344,
-    167942,
-    160736,
-    166219,
-    152981,
-    139798,
-    92183,
-    19918,
-    57481,
-    142710,
-    41757,
-    158799,
-    132807,
-    9918,
-    52128,
-    43917,
-    164977,
-    14452,
-    88031,
-    74078,
-    54483,
-    125447,
-    38853,
-    75026,
-    125156,
-    74810,
-    91808,
-    124762,
-    77642,
-    33004,
-    26153,
-    19736,
-    175209,
-    11346,
-    131117,
-    108599,
-    83572,
-    114580,
-    62474,
-    25067,
-    83751,
-    150748,
-    25631,
-    34916,
-    129083,
-    19601,
-    178024,
-    32618,
-    21904,
-    33421,
-    46398,
-    65013,
-    139653,
-    46695,
-    79015,
-    154717,
-    153717,
-    137831,
-    67742,
-    178916,
-    113490,
-    159409,
-    137580,
-    83579,
-    129187,
-    75296,
-    73752,
-    15249,
-    102845,
-    109393,
-    81444,
-    66432,
-    170026,
-    45809,
-    127711,
-    112162,
-    53124,
-    88816,
-    54581,
-    171755,
-    103156,
-    47826,
-    43138,
-    60041,
-    160464,
-    56191,
-    113410,
-    119951,
-    159675,
-    44094,
-    62825,
-    104710,
-    159502,
-    86897,
-    65135,
-    64226,
-    28407,
-    60445,
-    44694,
-    121438,
-    43550,
-    67785,
-    117663,
-    14100,
-    120390,
-    13671,
-    153930,
-    129556,
-    125197,
-    28644,
-    112826,
-    93975,
-    141974,
-    211,
-    106736,
-    134244,
-    90624,
-    77970,
-    68979,
-    1831,
-    70056,
-    84382,
-    124284,
-    111995,
-    82204,
-    147593,
-    175131,
-    178990,
-    44117,
-    50047,
-    156907,
-    134367,
-    76878,
-    66489,
-    8230,
-    156139,
-    81033,
-    11500,
-    19183,
-    28156,
-    56975,
-    136943,
-    149293,
-    30890,
-    154143,
-    156216,
-    72325,
-    109447,
-    82064,
-    72073,
-    89246,
-    62225,
-    60686,
-    160875,
-    153748,
-    40490,
-    158037,
-    97990,
-    137728,
-    159229,
-    29352,
-    47558,
-    163710,
-    96671,
-    34224,
-    169157,
-    155524,
-    111191,
-    178214,
-    125444,
-    120633,
-    85804,
-    75554,
-    98744,
-    54606,
-    170008,
-    142657,
-    178336,
-    3619,
-    84891,
-    66303,
-    131640,
-    129174,
-    78198,
-    11229,
-    163822,
-    77572,
-    107824,
-    166919,
-    156820,
-    160888,
-    88014,
-    108087,
-    74357,
-    78447,
-    168013,
-    111293,
-    111741,
-    62773,
-    110735,
-    49542,
-    112916,
-    113567,
-    42312,
-    169454,
-    128073,
-    87917,
-    118466,
-    134380,
-    158639,
-    22234,
-    9281,
-    30519,
-    19649,
-    78410,
-    153744,
-    28344,
-    50336,
-    126018,
-    81687,
-    136869,
-    25334,
-    122266,
-    91795,
-    100306,
-    857,
-    115654,
-    128333,
-    24393,
-    167222,
-    39259,
-    28137,
-    44676,
-    162679,
-    33407,
-    87976,
-    1429,
-    96789,
-    83054,
-    108346,
-    22089,
-    78028,
-    111167,
-    13984,
-    20698,
-    15747,
-    38442,
-    12092,
-    121259,
-    154130,
-    141213,
-    60827,
-    147633,
-    39703,
-    38527,
-    93162,
-    161642,
-    116497,
-    134178,
-    2230,
-    71866,
-    25486,
-    95683,
-    110019,
-    62139,
-    53455,
-    29177,
-    74160,
-    135819,
-    41863,
-    155465,
-    156214,
-    45069,
-    124961,
-    169418,
-    118306,
-    38670,
-    20562,
-    109898,
-    70737,
-    61067,
-    57503,
-    65367,
-    96267,
-    58310,
-    97016,
-    47792,
-    42084,
-    49458,
-    107951,
-    27356,
-    114269,
-    3632,
-    112146,
-    88119,
-    123790,
-    43665,
-    10673,
-    126467,
-    146350,
-    48134,
-    170984,
-    54053,
-    91711,
-    146999,
-    100070,
-    114983,
-    33176,
-    129804,
-    61612,
-    24088,
-    122860,
-    129645,
-    150892,
-    43663,
-    35231,
-    90944,
-    13030,
-    116365,
-    96499,
-    21744,
-    36096,
-    8403,
-    119206,
-    171543,
-    46762,
-    53601,
-    167265,
-    137256,
-    115731,
-    113006,
-    6417,
-    58227,
-    153476,
-    109618,
-    111137,
-    128309,
-    24429,
-    157097,
-    16161,
-    65789,
-    167863,
-    149957,
-    7705,
-    117518,
-    96379,
-    109886,
-    45709,
-    138151,
-    121093,
-    71840,
-    77587,
-    109515,
-    121025,
-    36209,
-    143482,
-    159832,
-    81925,
-    88640,
-    118302,
-    54022,
-    14298,
-    44962,
-    27625,
-    104500,
-    94115,
-    171751,
-    28661,
-    3697,
-    93990,
-    156436,
-    155862,
-    172105,
-    47122,
-    76931,
-    153141,
-    14288,
-    39973,
-    73045,
-    68267,
-    172747,
-    24341,
-    133620,
-    89039,
-    15944,
-    49920,
-    3790,
-    69738,
-    88462,
-    21564,
-    147805,
-    143650,
-    103934,
-    110793,
-    85329,
-    75167,
-    51336,
-    88228,
-    82270,
-    111584,
-    118517,
-    96043,
-    63737,
-    43080,
-    142974,
-    58041,
-    78061,
-    142262,
-    18222,
-    177317,
-    107300,
-    69027,
-    78889,
-    4292,
-    159518,
-    158475,
-    73900,
-    71144,
-    121297,
-    97380,
-    61464,
-    75115,
-    131920,
-    146487,
-    133392,
-    152279,
-    32842,
-    38242,
-    127270,
-    145702,
-    44037,
-    18988,
-    30954,
-    137026,
-    179521,
-    83013,
-    21128,
-    124344,
-    69894,
-    11076,
-    88903,
-    145275,
-    159697,
-    162791,
-    97470,
-    165782,
-    153699,
-    168882,
-    162235,
-    151229,
-    54959,
-    154566,
-    18241,
-    86470,
-    144555,
-    66651,
-    134267,
-    117434,
-    20166,
-    79419,
-    161190,
-    88695,
-    72523,
-    159494,
-    32806,
-    76908,
-    125125,
-    122123,
-    171997,
-    41735,
-    179193,
-    78503,
-    149755,
-    97689,
-    58492,
-    164845,
-    86640,
-    31237,
-    52562,
-    66782,
-    162477,
-    179926,
-    109205,
-    39506,
-    3547,
-    88055,
-    112287,
-    52787,
-    42801,
-    130543,
-    121052,
-    165154,
-    89373,
-    84136,
-    23766,
-    89195,
-    80375,
-    105462,
-    57250,
-    82933,
-    96708,
-    12405,
-    111347,
-    9376,
-    23300,
-    5798,
-    59416,
-    127451,
-    155726,
-    69441,
-    179279,
-    118620,
-    107121,
-    324,
-    143151,
-    80710,
-    33553,
-    53287,
-    154543,
-    109692,
-    129275,
-    100031,
-    115786,
-    103891,
-    39898,
-    147285,
-    86035,
-    97152,
-    14362,
-    173599,
-    51622,
-    98617,
-    133544,
-    31286,
-    166361,
-    120713,
-    46691,
-    31312,
-    88130,
-    130681,
-    100358,
-    11114,
-    119703,
-    152897,
-    107393,
-    148201,
-    79467,
-    114,
-    59703,
-    62237,
-    33567,
-    66530,
-    71430,
-    86895,
-    117445,
-    24364,
-    177780,
-    7753,
-    62589,
-    116941,
-    79390,
-    4272,
-    127021,
-    68424,
-    111025,
-    7516,
-    124087,
-    31595,
-    151797,
-    43420,
-    89076,
-    92444,
-    117395,
-    57531,
-    14247,
-    6184,
-    36961,
-    119858,
-    95550,
-    13658,
-    54767,
-    98268,
-    104598,
-    81467,
-    32489,
-    108285,
-    143019,
-    102179,
-    123843,
-    29671,
-    78693,
-    107256,
-    81934,
-    144368,
-    143861,
-    144136,
-    17806,
-    26779,
-    7562,
-    13271,
-    52926,
-    77269,
-    117997,
-    39784,
-    153236,
-    141496,
-    64671,
-    153158,
-    170878,
-    140783,
-    95732,
-    19892,
-    50080,
-    3505,
-    74375,
-    89554,
-    98659,
-    86792,
-    114727,
-    65389,
-    95744,
-    92357,
-    79359,
-    42240,
-    13063,
-    8844,
-    138916,
-    76877,
-    55098,
-    157165,
-    146397,
-    108079,
-    139040,
-    91735,
-    114582,
-    152818,
-    34810,
-    31128,
-    86250,
-    145046,
-    42481,
-    44071,
-    61469,
-    10572,
-    40355,
-    36503,
-    159032,
-    148906,
-    79388,
-    176678,
-    122386,
-    60491,
-    18930,
-    155004,
-    155873,
-    16011,
-    103034,
-    149454,
-    24345,
-    82420,
-    65569,
-    4022,
-    43432,
-    147430,
-    159874,
-    121969,
-    47668,
-    179512,
-    20503,
-    73819,
-    145941,
-    90607,
-    46867,
-    44543,
-    121531,
-    97766,
-    120199,
-    177484,
-    86224,
-    138849,
-    52189,
-    103557,
-    43650,
-    29387,
-    110570,
-    119958,
-    138188,
-    149658,
-    167299,
-    60257,
-    46424,
-    61258,
-    168286,
-    68066,
-    51323,
-    53279,
-    19559,
-    39335,
-    8865,
-    14667,
-    95322,
-    33447,
-    133431,
-    3860,
-    86282,
-    143773,
-    108926,
-    17707,
-    159162,
-    109506,
-    140474,
-    143240,
-    178819,
-    9364,
-    133906,
-    108075,
-    102113,
-    68660,
-    166995,
-    111392,
-    148275,
-    167747,
-    166244,
-    14196,
-    119776,
-    24994,
-    4918,
-    165089,
-    20201,
-    140628,
-    112372,
-    45265,
-    99390,
-    9360,
-    151073,
-    143153,
-    8476,
-    35527,
-    1091,
-    143868,
-    98532,
-    164897,
-    65026,
-    116578,
-    9679,
-    83659,
-    21928,
-    15355,
-    99359,
-    21201,
-    143556,
-    135215,
-    89933,
-    22894,
-    139855,
-    66506,
-    96928,
-    23985,
-    5467,
-    103760,
-    54778,
-    116674,
-    74136,
-    174926,
-    163488,
-    60163,
-    125746,
-    52660,
-    159956,
-    123078,
-    138739,
-    153289,
-    57166,
-    35956,
-    54270,
-    104480,
-    87280,
-    126673,
-    21371,
-    105301,
-    71883,
-    174612,
-    42436,
-    132972,
-    179556,
-    79254,
-    54307,
-    71013,
-    25244,
-    82646,
-    57400,
-    109654,
-    18970,
-    117167,
-    152181,
-    178424,
-    8771,
-    154754,
-    4548,
-    99261,
-    99207,
-    55584,
-    121651,
-    49142,
-    101632,
-    65159,
-    67751,
-    66816,
-    26103,
-    159552,
-    108559,
-    94213,
-    84473,
-    26428,
-    51324,
-    31472,
-    55519,
-    45501,
-    77547,
-    78017,
-    140530,
-    170465,
-    119965,
-    79157,
-    4059,
-    41196,
-    147945,
-    6792,
-    115122,
-    123999,
-    140676,
-    150583,
-    156887,
-    175286,
-    80148,
-    3117,
-    1762,
-    102911,
-    52415,
-    38799,
-    64404,
-    135765,
-    40669,
-    103179,
-    61975,
-    16245,
-    144095,
-    66420,
-    34156,
-    75726,
-    117661,
-    33986,
-    77697,
-    74537,
-    118541,
-    37651,
-    142166,
-    120820,
-    165180,
-    83051,
-    1174,
-    108134,
-    23767,
-    63790,
-    18191,
-    124443,
-    57161,
-    29919,
-    50760,
-    103735,
-    128612,
-    147115,
-    13005,
-    14051,
-    147282,
-    72697,
-    88656,
-    65072,
-    135402,
-    64644,
-    152669,
-    82794,
-    72694,
-    7301,
-    65562,
-    72636,
-    164830,
-    82390,
-    69085,
-    98143,
-    55844,
-    68455,
-    102254,
-    26574,
-    157463,
-    114342,
-    76857,
-    144339,
-    33347,
-    16171,
-    120000,
-    177573,
-    11057,
-    86824,
-    13078,
-    66200,
-    171783,
-    42367,
-    130398,
-    114581,
-    166556,
-    150237,
-    173310,
-    142132,
-    79491,
-    169054,
-    83141,
-    58395,
-    153558,
-    94215,
-    138942,
-    40087,
-    158490,
-    40029,
-    46860,
-    77724,
-    123460,
-    85629,
-    28048,
-    54036,
-    160312,
-    68544,
-    174457,
-    148886,
-    123501,
-    15034,
-    35161,
-    129474,
-    82366,
-    126571,
-    126915,
-    17376,
-    123294,
-    20726,
-    16654,
-    138283,
-    178587,
-    47755,
-    72294,
-    21920,
-    162966,
-    28041,
-    41676,
-    36704,
-    107823,
-    61810,
-    175336,
-    169824,
-    46757,
-    159786,
-    56427,
-    44781,
-    671,
-    114196,
-    34305,
-    70216,
-    161283,
-    163375,
-    118861,
-    68353,
-    73811,
-    70892,
-    126916,
-    40964,
-    143062,
-    120986,
-    3337,
-    19932,
-    137886,
-    161653,
-    174660,
-    86358,
-    150157,
-    58462,
-    64832,
-    80815,
-    129029,
-    64445,
-    44257,
-    25987,
-    65430,
-    47983,
-    48800,
-    23791,
-    35872,
-    158138,
-    40008,
-    11946,
-    136567,
-    84755,
-    135130,
-    42233,
-    135499,
-    127569,
-    52826,
-    119842,
-    84912,
-    12954,
-    167470,
-    74305,
-    125600,
-    120373,
-    66908,
-    152177,
-    36501,
-    80246,
-    61906,
-    31454,
-    149044,
-    156466,
-    114075,
-    71065,
-    97326,
-    33346,
-    173494,
-    66734,
-    134519,
-    75366,
-    12378,
-    32280,
-    156689,
-    9523,
-    19532,
-    152741,
-    96179,
-    70504,
-    12540,
-    80955,
-    72987,
-    68516,
-    169748,
-    147845,
-    148492,
-    83195,
-    39700,
-    145821,
-    27601,
-    9024,
-    27512,
-    157209,
-    145140,
-    123576,
-    69581,
-    80676,
-    4527,
-    97595,
-    25249,
-    177659,
-    40061,
-    102980,
-    112886,
-    66162,
-    165061,
-    16558,
-    79121,
-    45755,
-    675,
-    151904,
-    92590,
-    149423,
-    143707,
-    120281,
-    30082,
-    95389,
-    131744,
-    29789,
-    25388,
-    38788,
-    36543,
-    26983,
-    51397,
-    162445,
-    35214,
-    109821,
-    163930,
-    163144,
-    11053,
-    41843,
-    5098,
-    2051,
-    61903,
-    48746,
-    75633,
-    137692,
-    166307,
-    75780,
-    51902,
-    136981,
-    151596,
-    138972,
-    14299,
-    175414,
-    35556,
-    88220,
-    173970,
-    148846,
-    39618,
-    149843,
-    152627,
-    2657,
-    36020,
-    144286,
-    132500,
-    71259,
-    117073,
-    28192,
-    9983,
-    82968,
-    101198,
-    88162,
-    58562,
-    155679,
-    97840,
-    9573,
-    38486,
-    103530,
-    145067,
-    99140,
-    119386,
-    126872,
-    152967,
-    177462,
-    14222,
-    118213,
-    133199,
-    101066,
-    7968,
-    164859,
-    162377,
-    16878,
-    13962,
-    27581,
-    40092,
-    130610,
-    29820,
-    106321,
-    164632,
-    74754,
-    76129,
-    22886,
-    54577,
-    142990,
-    6840,
-    107189,
-    150321,
-    67360,
-    132577,
-    160130,
-    42955,
-    93591,
-    52491,
-    104400,
-    14375,
-    79099,
-    28225,
-    51205,
-    142424,
-    36655,
-    159257,
-    35922,
-    85767,
-    79953,
-    52298,
-    19927,
-    51061,
-    117808,
-    46621,
-    98020,
-    169514,
-    36829,
-    171202,
-    69172,
-    92646,
-    109764,
-    155442,
-    111528,
-    19438,
-    60609,
-    27168,
-    15394,
-    105941,
-    81661,
-    23526,
-    122039,
-    171843,
-    44854,
-    136748,
-    131167,
-    38267,
-    108026,
-    6262,
-    21559,
-    168170,
-    119690,
-    7467,
-    98154,
-    133406,
-    154966,
-    45789,
-    18298,
-    7473,
-    76660,
-    57569,
-    127532,
-    44752,
-    64852,
-    132952,
-    18795,
-    172437,
-    98642,
-    38160,
-    67688,
-    15042,
-    78161,
-    11951,
-    34134,
-    43985,
-    158652,
-    22816,
-    110179,
-    176004,
-    54647,
-    118021,
-    83224,
-    147710,
-    47335,
-    152934,
-    81037,
-    163070,
-    65068,
-    37068,
-    116065,
-    16634,
-    2553,
-    28236,
-    103978,
-    26298,
-    33419,
-    166088,
-    159361,
-    148523,
-    1567,
-    135965,
-    178992,
-    52880,
-    94916,
-    136954,
-    71197,
-    172289,
-    41926,
-    121429,
-    45988,
-    99816,
-    2133,
-    114562,
-    143378,
-    84723,
-    43938,
-    11228,
-    172957,
-    107388,
-    130650,
-    147459,
-    63771,
-    127861,
-    137768,
-    18265,
-    155931,
-    56428,
-    177061,
-    2515,
-    95636,
-    82105,
-    114557,
-    42110,
-    83547,
-    87353,
-    25303,
-    80139,
-    121472,
-    29809,
-    89173,
-    51284,
-    174784,
-    87015,
-    165179,
-    120703,
-    108826,
-    29498,
-    45180,
-    52358,
-    175308,
-    131228,
-    151700,
-    100756,
-    27420,
-    36151,
-    46582,
-    16856,
-    89734,
-    153663,
-    51028,
-    67453,
-    94429,
-    145371,
-    54127,
-    59283,
-    34475,
-    138564,
-    80646,
-    121057,
-    59570,
-    148440,
-    133329,
-    113379,
-    65793,
-    123259,
-    108239,
-    136060,
-    24775,
-    156447,
-    7640,
-    4301,
-    99534,
-    100149,
-    84656,
-    178864,
-    157730,
-    52623,
-    50005,
-    77221,
-    77000,
-    73504,
-    13134,
-    60572,
-    25771,
-    133261,
-    164206,
-    151629,
-    23540,
-    61187,
-    144185,
-    152772,
-    17600,
-    161134,
-    174767,
-    76688,
-    67652,
-    167294,
-    121871,
-    38501,
-    134990,
-    175002,
-    103066,
-    11892,
-    100269,
-    148170,
-    115673,
-    72252,
-    65300,
-    89872,
-    116343,
-    14986,
-    149990,
-    388,
-    42938,
-    88645,
-    28977,
-    101002,
-    87474,
-    71581,
-    3389,
-    101865,
-    24492,
-    22603,
-    167873,
-    1405,
-    91824,
-    62627,
-    73842,
-    154431,
-    94862,
-    84655,
-    133495,
-    177874,
-    56853,
-    46208,
-    140106,
-    121839,
-    146255,
-    76429,
-    46282,
-    125396,
-    12919,
-    29354,
-    8317,
-    118373,
-    156802,
-    58428,
-    153155,
-    112847,
-    176233,
-    133596,
-    63896,
-    6664,
-    153702,
-    65061,
-    2715,
-    93398,
-    8159,
-    64265,
-    156869,
-    115689,
-    2182,
-    67937,
-    112531,
-    105745,
-    179031,
-    120685,
-    71201,
-    175570,
-    144310,
-    139664,
-    11280,
-    49839,
-    113263,
-    26059,
-    10380,
-    160160,
-    114518,
-    119189,
-    172212,
-    136825,
-    7231,
-    163458,
-    74665,
-    107618,
-    30972,
-    108017,
-    126617,
-    27303,
-    35281,
-    45382,
-    5624,
-    170748,
-    54417,
-    135858,
-    178129,
-    15594,
-    150538,
-    158833,
-    140081,
-    165287,
-    168078,
-    127369,
-    11710,
-    120235,
-    142902,
-    159977,
-    135567,
-    23623,
-    65051,
-    150207,
-    125124,
-    115452,
-    82004,
-    31651,
-    15566,
-    93210,
-    145536,
-    32913,
-    18612,
-    8089,
-    140491,
-    144914,
-    173897,
-    128039,
-    28177,
-    171535,
-    131636,
-    42671,
-    134870,
-    10869,
-    162668,
-    57497,
-    57926,
-    67199,
-    20007,
-    45358,
-    85212,
-    174376,
-    155746,
-    82996,
-    156016,
-    122412,
-    125913,
-    72857,
-    78708,
-    61823,
-    172757,
-    127837,
-    20184,
-    139547,
-    149981,
-    75628,
-    141657,
-    55137,
-    155428,
-    62654,
-    128545,
-    96812,
-    54831,
-    129064,
-    169828,
-    129363,
-    93049,
-    58632,
-    54567,
-    157350,
-    174725,
-    133352,
-    162399,
-    21431,
-    43861,
-    136460,
-    146217,
-    102258,
-    158209,
-    177270,
-    11830,
-    34721,
-    104026,
-    127448,
-    119019,
-    102861,
-    104917,
-    102625,
-    97800,
-    67437,
-    19152,
-    130735,
-    59989,
-    121329,
-    60472,
-    80150,
-    66309,
-    108160,
-    74311,
-    16795,
-    116973,
-    111754,
-    174447,
-    45408,
-    160154,
-    125630,
-    144134,
-    72245,
-    119902,
-    162920,
-    58370,
-    87196,
-    112790,
-    28414,
-    69773,
-    126460,
-    160601,
-    143922,
-    7765,
-    162306,
-    20940,
-    10259,
-    29639,
-    119329,
-    62178,
-    41059,
-    43685,
-    5614,
-    3767,
-    30547,
-    100447,
-    160660,
-    87557,
-    89878,
-    31743,
-    82679,
-    90187,
-    114841,
-    122395,
-    105081,
-    78662,
-    88365,
-    25902,
-    155252,
-    169031,
-    116113,
-    178412,
-    142550,
-    92752,
-    164057,
-    133861,
-    48514,
-    6452,
-    79382,
-    147953,
-    35390,
-    38373,
-    43474,
-    36281,
-    165317,
-    71560,
-    54546,
-    141831,
-    146647,
-    54769,
-    155193,
-    166635,
-    22182,
-    64052,
-    113494,
-    56811,
-    129839,
-    102860,
-    147707,
-    10206,
-    79643,
-    104091,
-    144194,
-    2104,
-    111728,
-    66698,
-    137651,
-    38271,
-    116391,
-    65786,
-    89331,
-    105299,
-    78630,
-    173969,
-    83983,
-    9723,
-    154246,
-    22037,
-    118205,
-    81555,
-    71079,
-    169228,
-    3412,
-    176985,
-    172359,
-    142636,
-    166899,
-    42102,
-    161502,
-    88696,
-    6439,
-    133809,
-    45410,
-    164552,
-    91391,
-    168198,
-    159942,
-    174801,
-    169352,
-    168558,
-    38209,
-    87696,
-    52352,
-    1654,
-    85773,
-    86645,
-    96408,
-    113170,
-    6929,
-    130693,
-    37657,
-    136648,
-    46244,
-    73584,
-    44470,
-    39336,
-    68281,
-    36296,
-    110181,
-    100553,
-    72953,
-    11719,
-    165868,
-    5112,
-    150544,
-    178560,
-    104964,
-    25197,
-    26434,
-    57561,
-    109167,
-    157408,
-    39516,
-    99673,
-    174585,
-    76326,
-    176052,
-    44997,
-    173408,
-    162004,
-    1560,
-    21117,
-    139795,
-    108317,
-    97884,
-    157112,
-    267,
-    105428,
-    147785,
-    146865,
-    32869,
-    24006,
-    156403,
-    16695,
-    146850,
-    73812,
-    29836,
-    116601,
-    56368,
-    46202,
-    171707,
-    23037,
-    159616,
-    143797,
-    130716,
-    10982,
-    157653,
-    114799,
-    128735,
-    54489,
-    166367,
-    64909,
-    146178,
-    103353,
-    27056,
-    26306,
-    123242,
-    150548,
-    34772,
-    39449,
-    154306,
-    17947,
-    37001,
-    135137,
-    170116,
-    46337,
-    173139,
-    48872,
-    130050,
-    55950,
-    161761,
-    80888,
-    26466,
-    35794,
-    47101,
-    90667,
-    175285,
-    13340,
-    5431,
-    175807,
-    101695,
-    40787,
-    161253,
-    61146,
-    14109,
-    62065,
-    124156,
-    60277,
-    133132,
-    138342,
-    71274,
-    139443,
-    39667,
-    59451,
-    7026,
-    172979,
-    26569,
-    16869,
-    67595,
-    97791,
-    112979,
-    10784,
-    13466,
-    5240,
-    7876,
-    162595,
-    11796,
-    94287,
-    158710,
-    34471,
-    59948,
-    115691,
-    79716,
-    153948,
-    12652,
-    135500,
-    6022,
-    109342,
-    171590,
-    97061,
-    6291,
-    103193,
-    117533,
-    78782,
-    33073,
-    33594,
-    22621,
-    2855,
-    175480,
-    95671,
-    143719,
-    119662,
-    80363,
-    43446,
-    161277,
-    45796,
-    112580,
-    155055,
-    154240,
-    132126,
-    84809,
-    101436,
-    143565,
-    53888,
-    9420,
-    30351,
-    39739,
-    156670,
-    138284,
-    76362,
-    137997,
-    140806,
-    31997,
-    41058,
-    139057,
-    140125,
-    171533,
-    28101,
-    115898,
-    86227,
-    51504,
-    56357,
-    102584,
-    13834,
-    139989,
-    75310,
-    18453,
-    157142,
-    23565,
-    29693,
-    104708,
-    84090,
-    112419,
-    47745,
-    179294,
-    148972,
-    5473,
-    108108,
-    99660,
-    8464,
-    86532,
-    93480,
-    39695,
-    87357,
-    64293,
-    91832,
-    35095,
-    167095,
-    79483,
-    136431,
-    131966,
-    36480,
-    42708,
-    152230,
-    18653,
-    69594,
-    174896,
-    145663,
-    108303,
-    84219,
-    133613,
-    30918,
-    7635,
-    67689,
-    170739,
-    174212,
-    5403,
-    1820,
-    64879,
-    87186,
-    47569,
-    166110,
-    103942,
-    89951,
-    169060,
-    109873,
-    83236,
-    163296,
-    85709,
-    98987,
-    157417,
-    177865,
-    119295,
-    154465,
-    45922,
-    90850,
-    44853,
-    123205,
-    102513,
-    58588,
-    74212,
-    81148,
-    10870,
-    25081,
-    31530,
-    25023,
-    30787,
-    135043,
-    54465,
-    113325,
-    6578,
-    60360,
-    125609,
-    124909,
-    26943,
-    128143,
-    118816,
-    168683,
-    74246,
-    64719,
-    141575,
-    34223,
-    106507,
-    66945,
-    116030,
-    63359,
-    21303,
-    125205,
-    80307,
-    150604,
-    174099,
-    112584,
-    85954,
-    71801,
-    45339,
-    34885,
-    77379,
-    110378,
-    30305,
-    9489,
-    48034,
-    136468,
-    35290,
-    11502,
-    122190,
-    59960,
-    40127,
-    44141,
-    48253,
-    33119,
-    134,
-    164413,
-    45356,
-    160871,
-    165063,
-    151156,
-    79354,
-    19849,
-    88657,
-    179503,
-    85944,
-    163179,
-    10198,
-    30789,
-    18096,
-    141976,
-    83389,
-    7674,
-    83116,
-    138285,
-    118953,
-    74643,
-    132277,
-    60364,
-    54810,
-    27459,
-    9639,
-    118253,
-    122642,
-    169456,
-    68608,
-    142721,
-    133346,
-    129444,
-    143318,
-    148080,
-    144793,
-    133582,
-    119867,
-    147028,
-    156460,
-    49078,
-    10519,
-    51691,
-    87935,
-    50252,
-    118048,
-    53933,
-    138276,
-    128931,
-    19835,
-    124633,
-    166363,
-    171578,
-    94884,
-    160985,
-    141164,
-    143513,
-    61179,
-    65825,
-    103929,
-    75677,
-    122056,
-    152923,
-    28437,
-    165680,
-    125972,
-    39527,
-    91322,
-    13312,
-    74551,
-    67706,
-    40294,
-    74303,
-    115679,
-    112234,
-    62264,
-    125575,
-    55021,
-    87344,
-    92762,
-    130154,
-    142367,
-    172894,
-    122823,
-    127288,
-    133742,
-    17146,
-    91378,
-    19852,
-    24653,
-    132821,
-    173764,
-    6547,
-    57597,
-    92991,
-    39132,
-    64720,
-    155491,
-    162003,
-    99434,
-    41880,
-    97424,
-    26775,
-    66956,
-    116177,
-    35114,
-    127222,
-    100339,
-    94956,
-    6728,
-    43248,
-    166583,
-    93158,
-    67134,
-    173056,
-    50501,
-    119610,
-    125779,
-    108809,
-    169053,
-    152580,
-    26764,
-    99503,
-    11561,
-    82403,
-    26239,
-    83772,
-    145308,
-    120771,
-    107956,
-    175468,
-    39896,
-    127916,
-    146134,
-    28996,
-    55086,
-    126461,
-    118853,
-    111771,
-    94448,
-    163080,
-    104219,
-    160380,
-    75852,
-    160413,
-    162025,
-    169505,
-    150793,
-    69870,
-    169039,
-    51859,
-    111500,
-    88764,
-    152672,
-    24020,
-    111111,
-    62219,
-    49106,
-    156991,
-    148436,
-    9086,
-    4989,
-    110077,
-    31375,
-    155347,
-    151383,
-    19124,
-    71911,
-    179951,
-    67045,
-    162474,
-    2099,
-    140800,
-    165894,
-    123200,
-    168653,
-    88201,
-    23893,
-    164502,
-    66557,
-    105714,
-    115966,
-    91278,
-    35955,
-    65244,
-    61073,
-    158927,
-    91597,
-    174262,
-    34145,
-    25707,
-    124329,
-    161684,
-    24666,
-    40414,
-    147668,
-    168866,
-    133079,
-    167443,
-    1366,
-    5308,
-    123864,
-    54739,
-    136271,
-    127206,
-    68723,
-    57794,
-    117137,
-    101680,
-    18045,
-    36733,
-    45613,
-    163688,
-    77075,
-    52423,
-    8999,
-    171208,
-    73814,
-    161634,
-    74811,
-    130434,
-    27227,
-    133076,
-    137730,
-    166242,
-    66113,
-    29298,
-    61887,
-    66661,
-    8743,
-    159199,
-    172504,
-    15766,
-    17003,
-    33163,
-    155614,
-    1931,
-    75413,
-    8665,
-    140580,
-    152380,
-    141042,
-    147875,
-    163811,
-    55685,
-    154693,
-    132618,
-    64283,
-    72052,
-    111859,
-    79697,
-    151179,
-    91063,
-    144556,
-    100195,
-    105482,
-    89630,
-    1705,
-    30633,
-    36742,
-    97023,
-    141642,
-    129319,
-    40991,
-    34903,
-    140040,
-    80578,
-    132164,
-    128429,
-    22447,
-    150318,
-    147467,
-    33467,
-    7320,
-    85191,
-    88157,
-    134972,
-    162072,
-    69920,
-    9697,
-    66528,
-    42097,
-    48490,
-    22826,
-    39635,
-    37370,
-    118284,
-    111960,
-    141264,
-    130944,
-    120415,
-    143368,
-    29585,
-    59407,
-    97235,
-    5146,
-    81028,
-    19524,
-    60459,
-    78657,
-    59685,
-    117001,
-    79319,
-    26184,
-    178308,
-    108383,
-    75901,
-    64704,
-    148191,
-    136619,
-    131100,
-    75252,
-    142685,
-    47413,
-    142924,
-    118496,
-    35978,
-    63905,
-    47301,
-    40560,
-    141310,
-    84892,
-    7701,
-    43053,
-    81647,
-    114818,
-    173435,
-    37978,
-    90886,
-    44267,
-    34771,
-    84716,
-    127548,
-    42107,
-    143275,
-    16383,
-    95501,
-    66374,
-    102354,
-    41441,
-    120630,
-    39699,
-    30939,
-    165237,
-    122615,
-    121949,
-    110680,
-    6361,
-    78065,
-    36358,
-    24880,
-    22374,
-    22767,
-    90996,
-    145904,
-    115495,
-    69365,
-    23122,
-    74524,
-    118989,
-    165206,
-    64064,
-    94783,
-    68166,
-    46953,
-    35960,
-    115231,
-    30596,
-    161701,
-    87324,
-    105489,
-    42619,
-    177183,
-    46993,
-    142584,
-    44255,
-    30732,
-    169779,
-    114535,
-    78355,
-    111784,
-    164770,
-    94975,
-    145542,
-    11626,
-    153894,
-    126536,
-    124441,
-    170670,
-    111043,
-    46617,
-    7671,
-    55967,
-    148688,
-    114482,
-    62168,
-    121993,
-    50231,
-    101133,
-    124113,
-    169839,
-    102259,
-    25359,
-    30062,
-    51368,
-    53061,
-    50656,
-    148411,
-    24254,
-    14244,
-    176677,
-    33269,
-    138722,
-    9720,
-    126422,
-    9093,
-    13811,
-    164294,
-    113106,
-    93146,
-    44150,
-    107958,
-    91351,
-    128879,
-    62414,
-    31754,
-    92296,
-    26828,
-    57382,
-    176466,
-    26661,
-    94082,
-    147108,
-    77616,
-    138754,
-    17136,
-    131363,
-    154710,
-    92023,
-    17904,
-    72734,
-    179517,
-    98355,
-    86607,
-    36857,
-    158908,
-    154442,
-    119535,
-    139114,
-    70215,
-    80746,
-    87444,
-    135652,
-    118803,
-    108969,
-    12878,
-    72308,
-    23282,
-    82723,
-    123398,
-    162707,
-    81022,
-    26514,
-    149258,
-    60286,
-    169132,
-    80783,
-    6153,
-    37103,
-    174378,
-    104069,
-    113608,
-    170341,
-    150741,
-    84401,
-    107395,
-    169850,
-    169523,
-    63333,
-    27223,
-    83492,
-    99903,
-    18346,
-    110201,
-    66419,
-    152742,
-    4393,
-    81634,
-    90308,
-    24266,
-    138661,
-    17835,
-    156945,
-    150751,
-    13687,
-    155532,
-    67164,
-    92167,
-    19280,
-    30658,
-    66122,
-    88804,
-    84543,
-    50057,
-    162339,
-    131551,
-    133690,
-    76928,
-    142722,
-    114355,
-    136695,
-    22883,
-    75053,
-    94736,
-    127955,
-    14778,
-    98959,
-    51152,
-    129208,
-    30061,
-    9770,
-    176839,
-    118255,
-    50858,
-    49234,
-    153726,
-    44283,
-    144171,
-    22256,
-    14478,
-    8952,
-    142022,
-    44725,
-    101035,
-    76344,
-    86730,
-    79592,
-    95500,
-    155046,
-    6519,
-    158994,
-    51375,
-    87982,
-    35436,
-    70751,
-    129800,
-    13120,
-    177490,
-    22823,
-    42909,
-    65668,
-    5638,
-    156734,
-    116050,
-    101292,
-    90828,
-    176610,
-    159299,
-    131199,
-    96370,
-    163272,
-    42418,
-    103871,
-    175771,
-    171948,
-    104322,
-    154211,
-    140908,
-    152585,
-    29776,
-    134932,
-    103608,
-    139162,
-    31875,
-    79460,
-    102117,
-    159077,
-    153737,
-    20067,
-    59206,
-    107566,
-    125915,
-    52777,
-    171944,
-    12959,
-    136358,
-    24563,
-    76104,
-    159272,
-    4222,
-    80306,
-    131431,
-    1850,
-    84375,
-    117825,
-    58746,
-    61633,
-    178899,
-    77469,
-    114363,
-    73726,
-    136741,
-    112005,
-    130612,
-    22174,
-    56266,
-    44157,
-    127923,
-    142319,
-    126884,
-    60703,
-    10942,
-    23298,
-    45064,
-    95730,
-    92084,
-    118081,
-    98870,
-    149341,
-    17415,
-    177033,
-    126922,
-    20327,
-    153185,
-    102144,
-    108608,
-    170170,
-    136646,
-    70616,
-    101060,
-    21934,
-    19000,
-    17450,
-    64268,
-    52619,
-    74249,
-    116795,
-    23928,
-    164453,
-    29245,
-    139939,
-    35020,
-    112383,
-    103237,
-    122780,
-    11619,
-    64136,
-    9423,
-    152814,
-    74690,
-    103583,
-    21032,
-    44336,
-    159227,
-    129765,
-    22550,
-    85835,
-    24387,
-    105362,
-    11027,
-    157641,
-    112390,
-    171149,
-    45962,
-    43999,
-    172326,
-    93320,
-    68318,
-    50997,
-    145642,
-    53314,
-    114454,
-    93844,
-    103263,
-    125884,
-    138340,
-    106832,
-    39048,
-    84913,
-    55326,
-    151359,
-    148054,
-    18006,
-    64858,
-    21480,
-    141482,
-    148372,
-    120718,
-    1857,
-    107466,
-    52661,
-    1377,
-    35727,
-    77788,
-    112209,
-    166789,
-    175387,
-    58890,
-    21627,
-    24306,
-    123464,
-    51367,
-    123762,
-    137431,
-    22328,
-    178623,
-    178897,
-    12457,
-    137243,
-    122435,
-    172441,
-    64791,
-    169697,
-    68639,
-    176442,
-    155787,
-    45300,
-    164810,
-    73349,
-    160428,
-    29471,
-    77840,
-    146325,
-    70689,
-    93509,
-    162281,
-    1412,
-    161375,
-    147807,
-    105345,
-    111310,
-    26220,
-    43431,
-    7847,
-    142123,
-    134887,
-    123463,
-    172483,
-    19930,
-    93298,
-    100188,
-    73359,
-    91638,
-    57639,
-    40433,
-    61028,
-    16741,
-    171604,
-    39503,
-    67748,
-    158375,
-    4422,
-    2993,
-    168141,
-    120465,
-    25447,
-    76314,
-    173881,
-    99562,
-    138884,
-    26864,
-    10041,
-    84211,
-    158170,
-    121086,
-    108513,
-    41972,
-    142557,
-    20976,
-    149315,
-    26537,
-    81295,
-    96269,
-    64497,
-    173110,
-    167866,
-    46871,
-    133072,
-    42226,
-    66682,
-    19241,
-    56702,
-    100324,
-    174764,
-    150721,
-    46288,
-    148483,
-    113296,
-    74018,
-    114662,
-    177048,
-    58536,
-    18726,
-    43332,
-    53967,
-    26182,
-    11307,
-    9994,
-    70884,
-    71761,
-    93880,
-    21285,
-    124301,
-    125847,
-    128198,
-    77142,
-    71723,
-    782,
-    90911,
-    66909,
-    141971,
-    34987,
-    108833,
-    6757,
-    51742,
-    115717,
-    101184,
-    105643,
-    86542,
-    36627,
-    154678,
-    153828,
-    137556,
-    100144,
-    127630,
-    105545,
-    151978,
-    52551,
-    2880,
-    149657,
-    93537,
-    66002,
-    63022,
-    76047,
-    153637,
-    117792,
-    2442,
-    134546,
-    123824,
-    124372,
-    114063,
-    49444,
-    122339,
-    47039,
-    161808,
-    74324,
-    169683,
-    119275,
-    132202,
-    142761,
-    84550,
-    76278,
-    179539,
-    23945,
-    56877,
-    176775,
-    109801,
-    5843,
-    8394,
-    54717,
-    163501,
-    32902,
-    43061,
-    57336,
-    79827,
-    22179,
-    170048,
-    110822,
-    156006,
-    44427,
-    32285,
-    138700,
-    120338,
-    125204,
-    99736,
-    62134,
-    32756,
-    25638,
-    83974,
-    23063,
-    19542,
-    149452,
-    60431,
-    68584,
-    20651,
-    138370,
-    133928,
-    31193,
-    134216,
-    55675,
-    63863,
-    146750,
-    80855,
-    51601,
-    124706,
-    4205,
-    131281,
-    43811,
-    12925,
-    175764,
-    135025,
-    45719,
-    172467,
-    50023,
-    111039,
-    178152,
-    149127,
-    178273,
-    105504,
-    92322,
-    49273,
-    169486,
-    146384,
-    76283,
-    159867,
-    137297,
-    60859,
-    33233,
-    136013,
-    102824,
-    128281,
-    58572,
-    18297,
-    169760,
-    35468,
-    138856,
-    83625,
-    169874,
-    68742,
-    154260,
-    84429,
-    158119,
-    56078,
-    35221,
-    38993,
-    154024,
-    57165,
-    66680,
-    157926,
-    90286,
-    45405,
-    37133,
-    74547,
-    38632,
-    71642,
-    103635,
-    145986,
-    87830,
-    88335,
-    177927,
-    61474,
-    133550,
-    37831,
-    115579,
-    32695,
-    179358,
-    70641,
-    133899,
-    108250,
-    136838,
-    56460,
-    28446,
-    33763,
-    96434,
-    50053,
-    110553,
-    97577,
-    12544,
-    135553,
-    23685,
-    52418,
-    171454,
-    87974,
-    146636,
-    88820,
-    46643,
-    127312,
-    1761,
-    87625,
-    30763,
-    33185,
-    166073,
-    83935,
-    150797,
-    73060,
-    30641,
-    167438,
-    29975,
-    35253,
-    97108,
-    138019,
-    692,
-    63916,
-    129408,
-    150959,
-    53114,
-    108477,
-    119758,
-    127300,
-    16403,
-    121681,
-    172090,
-    86173,
-    3132,
-    147155,
-    105895,
-    70159,
-    138461,
-    18998,
-    141195,
-    155348,
-    70663,
-    16649,
-    145645,
-    89106,
-    105670,
-    5824,
-    116990,
-    40381,
-    53321,
-    30877,
-    66632,
-    111272,
-    24289,
-    32987,
-    84086,
-    114425,
-    113973,
-    177925,
-    130072,
-    15112,
-    91441,
-    42010,
-    52409,
-    96775,
-    167198,
-    63274,
-    101186,
-    153522,
-    82626,
-    43278,
-    85270,
-    152066,
-    22982,
-    111468,
-    149495,
-    120978,
-    43941,
-    171203,
-    18724,
-    13670,
-    148482,
-    93625,
-    150845,
-    151974,
-    72291,
-    89785,
-    105221,
-    80070,
-    157813,
-    142819,
-    28065,
-    125137,
-    109350,
-    12716,
-    111881,
-    66485,
-    31386,
-    21231,
-    111123,
-    932,
-    43572,
-    21001,
-    22400,
-    34996,
-    303,
-    51570,
-    93292,
-    59304,
-    20815,
-    157924,
-    166600,
-    143405,
-    127788,
-    108377,
-    128477,
-    161982,
-    37188,
-    127054,
-    30489,
-    60799,
-    137741,
-    5379,
-    90593,
-    153392,
-    139313,
-    179891,
-    149716,
-    161965,
-    81971,
-    109173,
-    38496,
-    161265,
-    149578,
-    29559,
-    150766,
-    74002,
-    178131,
-    83692,
-    89649,
-    61391,
-    94112,
-    114137,
-    27554,
-    86254,
-    36115,
-    177862,
-    114987,
-    4314,
-    111810,
-    159286,
-    27609,
-    110664,
-    103866,
-    124832,
-    4116,
-    115558,
-    158717,
-    86137,
-    41565,
-    86996,
-    96387,
-    8302,
-    49482,
-    30452,
-    77841,
-    107710,
-    149236,
-    117375,
-    30555,
-    11592,
-    55405,
-    175951,
-    169763,
-    54434,
-    117695,
-    15152,
-    136351,
-    6389,
-    108446,
-    14566,
-    97938,
-    140722,
-    35267,
-    24952,
-    132162,
-    166378,
-    139809,
-    79901,
-    177113,
-    32946,
-    160480,
-    67025,
-    60029,
-    19454,
-    124587,
-    125278,
-    16933,
-    142933,
-    31045,
-    178619,
-    83621,
-    175854,
-    96661,
-    14616,
-    111853,
-    41350,
-    94969,
-    124879,
-    25470,
-    140561,
-    68691,
-    109686,
-    115415,
-    83513,
-    16726,
-    47584,
-    29216,
-    93140,
-    46020,
-    177585,
-    141233,
-    30170,
-    117765,
-    10329,
-    157457,
-    5603,
-    73043,
-    150618,
-    9326,
-    62948,
-    123316,
-    126759,
-    127114,
-    140263,
-    31387,
-    138963,
-    70866,
-    43040,
-    48663,
-    80518,
-    144140,
-    18570,
-    9249,
-    13298,
-    132510,
-    103437,
-    145442,
-    146533,
-    1522,
-    80253,
-    42501,
-    95187,
-    129589,
-    64025,
-    71777,
-    53451,
-    121437,
-    22835,
-    43865,
-    104018,
-    112926,
-    74241,
-    167269,
-    20334,
-    100675,
-    17708,
-    130408,
-    176350,
-    117664,
-    163299,
-    102852,
-    44798,
-    76393,
-    117006,
-    69651,
-    48016,
-    30935,
-    19587,
-    109952,
-    153409,
-    31561,
-    65962,
-    10484,
-    95162,
-    77679,
-    31744,
-    173680,
-    104615,
-    68940,
-    112722,
-    72536,
-    171540,
-    51434,
-    9998,
-    140282,
-    41040,
-    148238,
-    148923,
-    27903,
-    105193,
-    53748,
-    125199,
-    110622,
-    43197,
-    148582,
-    112422,
-    138106,
-    29771,
-    85381,
-    21346,
-    25016,
-    100894,
-    136612,
-    18948,
-    85287,
-    71476,
-    76447,
-    14598,
-    52674,
-    103718,
-    41324,
-    13321,
-    117455,
-    157758,
-    11343,
-    101534,
-    66459,
-    90838,
-    97774,
-    129199,
-    176424,
-    84177,
-    168704,
-    162888,
-    177530,
-    120954,
-    115582,
-    130274,
-    145276,
-    172346,
-    128843,
-    176244,
-    158257,
-    168590,
-    133778,
-    164935,
-    61172,
-    178982,
-    19757,
-    176394,
-    32619,
-    169869,
-    4109,
-    173885,
-    135352,
-    83341,
-    125822,
-    1235,
-    62730,
-    46462,
-    74219,
-    43536,
-    176882,
-    50725,
-    22595,
-    69977,
-    17246,
-    55875,
-    154899,
-    156269,
-    138414,
-    85821,
-    129932,
-    40476,
-    20408,
-    19392,
-    22317,
-    162270,
-    86641,
-    138438,
-    24301,
-    24474,
-    152387,
-    27966,
-    23591,
-    107799,
-    89808,
-    47129,
-    51637,
-    39852,
-    121200,
-    30530,
-    65451,
-    109417,
-    27201,
-    149915,
-    164106,
-    82092,
-    168334,
-    133402,
-    32841,
-    122052,
-    81837,
-    1211,
-    150889,
-    120386,
-    171644,
-    156792,
-    128847,
-    94518,
-    95582,
-    176814,
-    117354,
-    69771,
-    151571,
-    93088,
-    954,
-    137486,
-    113249,
-    88868,
-    32486,
-    19529,
-    40237,
-    117800,
-    48549,
-    72017,
-    61641,
-    54296,
-    43236,
-    94091,
-    133626,
-    150383,
-    38385,
-    52247,
-    21434,
-    80775,
-    25085,
-    71175,
-    4727,
-    9700,
-    161721,
-    7056,
-    74591,
-    164241,
-    68113,
-    29159,
-    32485,
-    78966,
-    64356,
-    112214,
-    76634,
-    35907,
-    72821,
-    92399,
-    51548,
-    148696,
-    118736,
-    75570,
-    7770,
-    68700,
-    110117,
-    114924,
-    134086,
-    70747,
-    147439,
-    53564,
-    88633,
-    6917,
-    128004,
-    160392,
-    28264,
-    422,
-    147225,
-    79580,
-    41207,
-    101482,
-    91700,
-    125078,
-    96249,
-    27116,
-    85119,
-    74054,
-    91010,
-    170100,
-    52662,
-    178465,
-    19447,
-    177022,
-    16843,
-    31026,
-    176800,
-    69821,
-    104584,
-    137344,
-    152339,
-    74507,
-    28171,
-    62547,
-    157800,
-    23995,
-    6652,
-    59366,
-    62526,
-    41402,
-    130097,
-    47309,
-    62518,
-    53643,
-    4351,
-    8319,
-    145728,
-    88416,
-    121552,
-    49254,
-    34257,
-    145990,
-    32614,
-    169488,
-    46425,
-    12599,
-    161219,
-    170060,
-    132101,
-    80081,
-    24173,
-    11257,
-    177848,
-    38781,
-    61801,
-    175369,
-    112659,
-    125854,
-    20744,
-    102997,
-    143970,
-    169175,
-    86220,
-    3418,
-    167391,
-    129438,
-    128135,
-    70850,
-    44570,
-    176333,
-    169804,
-    159205,
-    2260,
-    139624,
-    174011,
-    114011,
-    1030,
-    130433,
-    96834,
-    150808,
-    18520,
-    66737,
-    127296,
-    1836,
-    47732,
-    170220,
-    116224,
-    37791,
-    110470,
-    128520,
-    163123,
-    157253,
-    61838,
-    72234,
-    67702,
-    3150,
-    38318,
-    166157,
-    83073,
-    61879,
-    50804,
-    83973,
-    178773,
-    60105,
-    10848,
-    134578,
-    162159,
-    142106,
-    73410,
-    27155,
-    149483,
-    111842,
-    170594,
-    63707,
-    168580,
-    26295,
-    22477,
-    175673,
-    54561,
-    24868,
-    20806,
-    121078,
-    179150,
-    33608,
-    4744,
-    42104,
-    35248,
-    130720,
-    93612,
-    23657,
-    117994,
-    135889,
-    19751,
-    75749,
-    161911,
-    145071,
-    74831,
-    36583,
-    95026,
-    172855,
-    13483,
-    135587,
-    176588,
-    61365,
-    81150,
-    137013,
-    122635,
-    140305,
-    67288,
-    67180,
-    74506,
-    151764,
-    173262,
-    62103,
-    124728,
-    41737,
-    120054,
-    147304,
-    120686,
-    21291,
-    40951,
-    54314,
-    120375,
-    23450,
-    15991,
-    126275,
-    9830,
-    130222,
-    80711,
-    49580,
-    30091,
-    158649,
-    129558,
-    118148,
-    48132,
-    55831,
-    147760,
-    130453,
-    100206,
-    34909,
-    161074,
-    119941,
-    60672,
-    28109,
-    19289,
-    53248,
-    140299,
-    113293,
-    171703,
-    101189,
-    162798,
-    175993,
-    8503,
-    147694,
-    57617,
-    153819,
-    36089,
-    165957,
-    16162,
-    1549,
-    147008,
-    37578,
-    29761,
-    153750,
-    43353,
-    50381,
-    171721,
-    46989,
-    130595,
-    34391,
-    34965,
-    145776,
-    47763,
-    94050,
-    158512,
-    134573,
-    4508,
-    6541,
-    87413,
-    5073,
-    59762,
-    56583,
-    42126,
-    111716,
-    1801,
-    25716,
-    115559,
-    89940,
-    69065,
-    160007,
-    156510,
-    34751,
-    168947,
-    112676,
-    15299,
-    118654,
-    98689,
-    97862,
-    14613,
-    65286,
-    12887,
-    172721,
-    173909,
-    91485,
-    101744,
-    100332,
-    173439,
-    42263,
-    118240,
-    72046,
-    82965,
-    100433,
-    178790,
-    33191,
-    168817,
-    104121,
-    101863,
-    60559,
-    13988,
-    159356,
-    33963,
-    13451,
-    867,
-    144068,
-    155040,
-    176498,
-    143544,
-    134187,
-    120223,
-    61109,
-    169854,
-    3165,
-    165943,
-    160815,
-    109845,
-    108984,
-    60237,
-    24676,
-    91816,
-    66494,
-    156550,
-    64639,
-    156785,
-    147830,
-    65695,
-    38198,
-    59358,
-    145502,
-    167105,
-    72641,
-    28985,
-    39045,
-    169453,
-    18397,
-    49208,
-    150475,
-    140784,
-    39333,
-    124074,
-    87282,
-    104688,
-    130919,
-    125262,
-    106764,
-    18248,
-    60685,
-    38583,
-    150730,
-    136396,
-    66441,
-    72653,
-    103779,
-    131343,
-    71280,
-    7230,
-    155476,
-    21030,
-    20965,
-    2298,
-    117817,
-    135050,
-    44850,
-    20892,
-    103138,
-    34465,
-    178012,
-    169607,
-    151912,
-    43243,
-    168329,
-    28102,
-    69237,
-    174823,
-    2394,
-    137061,
-    38053,
-    153783,
-    168709,
-    121912,
-    84659,
-    92485,
-    151064,
-    11525,
-    54763,
-    11501,
-    26915,
-    105222,
-    148319,
-    175127,
-    63895,
-    175884,
-    17138,
-    110314,
-    87003,
-    143077,
-    3046,
-    174626,
-    152922,
-    26202,
-    147792,
-    46644,
-    72606,
-    40485,
-    87215,
-    106882,
-    11077,
-    81828,
-    67544,
-    174365,
-    77419,
-    143428,
-    9812,
-    53650,
-    131752,
-    26278,
-    153710,
-    76353,
-    89003,
-    22714,
-    149987,
-    27587,
-    90430,
-    121220,
-    30700,
-    169270,
-    74242,
-    143721,
-    156862,
-    23558,
-    46878,
-    150465,
-    100205,
-    80886,
-    70129,
-    132234,
-    11314,
-    35101,
-    4891,
-    18269,
-    18620,
-    157721,
-    38559,
-    159055,
-    49661,
-    161891,
-    85129,
-    112578,
-    17169,
-    12885,
-    123352,
-    8341,
-    23310,
-    130394,
-    114710,
-    81124,
-    138471,
-    77864,
-    81452,
-    169056,
-    151195,
-    130832,
-    176796,
-    141726,
-    167519,
-    26587,
-    19376,
-    41037,
-    176917,
-    72614,
-    62298,
-    51653,
-    49996,
-    5707,
-    145576,
-    44172,
-    46955,
-    8063,
-    75544,
-    39779,
-    113716,
-    79595,
-    45348,
-    17929,
-    98838,
-    49643,
-    118453,
-    55864,
-    85043,
-    70345,
-    72155,
-    92471,
-    113077,
-    170822,
-    22955,
-    116928,
-    143629,
-    54230,
-    5466,
-    119428,
-    42557,
-    156929,
-    127666,
-    67643,
-    139432,
-    108228,
-    81415,
-    150979,
-    151312,
-    47618,
-    177863,
-    69472,
-    24865,
-    137247,
-    153891,
-    170257,
-    108020,
-    42,
-    112983,
-    69455,
-    136097,
-    73376,
-    170524,
-    93654,
-    56392,
-    163781,
-    12112,
-    131200,
-    31721,
-    61512,
-    87666,
-    103441,
-    5006,
-    69586,
-    29154,
-    145121,
-    78445,
-    58067,
-    59896,
-    45239,
-    169948,
-    48116,
-    45353,
-    53764,
-    146076,
-    87703,
-    4224,
-    151242,
-    71785,
-    156532,
-    29013,
-    64454,
-    80248,
-    31499,
-    64395,
-    123421,
-    25206,
-    102803,
-    44433,
-    110539,
-    51197,
-    7620,
-    67761,
-    142489,
-    50554,
-    94777,
-    10961,
-    29028,
-    69644,
-    78856,
-    134180,
-    139053,
-    55542,
-    173557,
-    87813,
-    157329,
-    112211,
-    9739,
-    176135,
-    31232,
-    22752,
-    97793,
-    70188,
-    136266,
-    156253,
-    70022,
-    36276,
-    140959,
-    43443,
-    27070,
-    10187,
-    62016,
-    162549,
-    139792,
-    34827,
-    110381,
-    38663,
-    46615,
-    117523,
-    89518,
-    19114,
-    34178,
-    139359,
-    115715,
-    31292,
-    121640,
-    131344,
-    55513,
-    169816,
-    131804,
-    73163,
-    15101,
-    30490,
-    51124,
-    152159,
-    47492,
-    68669,
-    176047,
-    78902,
-    90299,
-    75817,
-    5019,
-    124539,
-    69931,
-    156233,
-    134700,
-    167138,
-    106068,
-    38945,
-    170726,
-    117247,
-    4193,
-    58981,
-    29772,
-    155750,
-    115450,
-    145063,
-    41600,
-    62747,
-    84969,
-    31298,
-    127730,
-    74475,
-    168008,
-    164993,
-    21762,
-    157485,
-    71821,
-    115993,
-    100214,
-    44589,
-    162332,
-    131395,
-    14474,
-    71361,
-    34762,
-    150089,
-    125246,
-    74604,
-    41840,
-    103605,
-    27008,
-    12515,
-    167087,
-    56374,
-    156146,
-    128539,
-    77098,
-    54910,
-    89720,
-    123983,
-    87674,
-    7878,
-    71003,
-    168128,
-    87056,
-    55375,
-    170007,
-    82187,
-    36781,
-    68807,
-    86964,
-    27523,
-    80531,
-    122685,
-    158852,
-    76079,
-    169141,
-    175876,
-    113136,
-    165818,
-    145571,
-    84696,
-    1256,
-    165258,
-    27724,
-    147837,
-    12071,
-    127370,
-    143708,
-    55661,
-    39129,
-    163074,
-    104297,
-    4064,
-    77140,
-    165629,
-    27814,
-    44145,
-    27019,
-    1160,
-    63952,
-    115113,
-    23026,
-    36913,
-    73194,
-    176520,
-    32592,
-    79990,
-    172017,
-    57957,
-    143149,
-    149482,
-    45488,
-    119184,
-    137999,
-    55517,
-    69865,
-    148363,
-    51909,
-    115899,
-    144225,
-    8855,
-    91325,
-    36729,
-    92300,
-    33228,
-    158665,
-    164421,
-    95664,
-    39285,
-    155767,
-    39666,
-    113387,
-    61058,
-    33646,
-    151852,
-    158642,
-    53614,
-    31532,
-    134389,
-    172597,
-    105837,
-    132240,
-    17567,
-    112667,
-    148169,
-    87611,
-    73411,
-    106488,
-    172303,
-    157793,
-    125244,
-    5489,
-    92046,
-    108990,
-    137895,
-    164922,
-    139000,
-    10258,
-    136177,
-    136276,
-    116667,
-    166325,
-    19443,
-    126300,
-    164538,
-    32589,
-    70548,
-    127350,
-    74742,
-    137176,
-    147610,
-    153932,
-    14686,
-    141387,
-    98125,
-    163278,
-    112480,
-    12431,
-    108503,
-    2490,
-    58040,
-    145730,
-    27234,
-    174308,
-    36883,
-    161715,
-    140531,
-    71012,
-    123807,
-    36129,
-    136558,
-    30005,
-    60879,
-    121283,
-    54041,
-    31662,
-    107322,
-    125505,
-    20628,
-    64916,
-    165205,
-    102457,
-    81337,
-    86958,
-    18470,
-    39643,
-    166332,
-    13766,
-    150079,
-    15324,
-    109772,
-    20454,
-    1447,
-    18818,
-    56748,
-    109911,
-    163581,
-    124416,
-    174966,
-    64241,
-    82661,
-    69856,
-    37326,
-    74461,
-    169193,
-    104810,
-    94497,
-    57574,
-    60134,
-    54348,
-    147238,
-    17631,
-    158712,
-    107371,
-    125144,
-    19609,
-    39742,
-    42681,
-    147647,
-    179696,
-    165889,
-    135125,
-    124022,
-    30857,
-    90460,
-    92925,
-    50559,
-    169921,
-    42934,
-    146975,
-    147348,
-    167378,
-    103708,
-    119031,
-    176663,
-    50361,
-    1949,
-    79262,
-    81652,
-    102414,
-    94638,
-    29552,
-    73162,
-    178196,
-    22028,
-    66657,
-    140579,
-    85491,
-    56302,
-    7750,
-    150783,
-    117497,
-    55838,
-    74582,
-    156395,
-    81614,
-    88550,
-    147057,
-    102480,
-    71814,
-    62324,
-    42880,
-    6047,
-    74209,
-    73507,
-    163938,
-    78725,
-    65929,
-    73945,
-    176889,
-    78318,
-    74576,
-    80353,
-    95054,
-    147291,
-    159350,
-    82245,
-    168382,
-    55665,
-    106962,
-    92275,
-    138634,
-    23330,
-    66398,
-    76499,
-    171585,
-    12280,
-    155215,
-    36496,
-    113867,
-    90951,
-    13822,
-    57579,
-    110320,
-    18308,
-    86302,
-    11759,
-    23905,
-    45445,
-    140386,
-    112883,
-    84840,
-    102337,
-    139174,
-    152278,
-    17188,
-    131173,
-    54595,
-    95960,
-    150037,
-    113611,
-    98261,
-    32340,
-    99206,
-    93575,
-    165724,
-    147842,
-    22884,
-    98555,
-    73344,
-    154851,
-    169778,
-    125514,
-    59661,
-    107150,
-    98321,
-    122752,
-    75571,
-    170957,
-    15017,
-    24170,
-    50744,
-    44039,
-    139273,
-    134521,
-    115522,
-    21461,
-    7833,
-    157193,
-    174103,
-    172948,
-    89970,
-    74897,
-    164154,
-    26840,
-    16422,
-    13732,
-    127096,
-    127518,
-    118482,
-    107690,
-    141638,
-    113171,
-    42360,
-    160270,
-    164430,
-    65445,
-    29368,
-    58085,
-    85957,
-    39915,
-    109992,
-    64573,
-    79337,
-    71645,
-    79339,
-    54308,
-    160638,
-    115183,
-    69515,
-    162132,
-    117401,
-    130265,
-    126402,
-    178451,
-    72497,
-    109566,
-    23046,
-    30200,
-    115317,
-    108632,
-    98483,
-    72612,
-    104965,
-    16089,
-    17006,
-    86959,
-    138114,
-    143885,
-    148613,
-    1776,
-    6695,
-    65918,
-    124642,
-    10577,
-    158626,
-    166427,
-    68569,
-    143989,
-    87195,
-    163990,
-    164384,
-    146002,
-    35089,
-    43945,
-    111999,
-    136930,
-    36173,
-    176557,
-    59356,
-    40607,
-    153725,
-    12274,
-    53873,
-    164723,
-    133191,
-    92224,
-    145638,
-    67810,
-    19025,
-    74822,
-    97059,
-    1540,
-    29915,
-    46226,
-    178010,
-    12751,
-    6386,
-    682,
-    87209,
-    24114,
-    89698,
-    20716,
-    178431,
-    76707,
-    122859,
-    122558,
-    119777,
-    74750,
-    62318,
-    57975,
-    161089,
-    77030,
-    111046,
-    120546,
-    90660,
-    140656,
-    80717,
-    101325,
-    87886,
-    150112,
-    96760,
-    148206,
-    26936,
-    157407,
-    105162,
-    61865,
-    103052,
-    96092,
-    58397,
-    137531,
-    107141,
-    110521,
-    162436,
-    119892,
-    7315,
-    77782,
-    84009,
-    61147,
-    118644,
-    50739,
-    113808,
-    108027,
-    27545,
-    140208,
-    104057,
-    24848,
-    157948,
-    153895,
-    23476,
-    70740,
-    58566,
-    172465,
-    169923,
-    138748,
-    155995,
-    58394,
-    86375,
-    112038,
-    139332,
-    172369,
-    93752,
-    62590,
-    89155,
-    57883,
-    107768,
-    127352,
-    84130,
-    103398,
-    165270,
-    153869,
-    176781,
-    110531,
-    77399,
-    11084,
-    164517,
-    121694,
-    37771,
-    168623,
-    160283,
-    54857,
-    10676,
-    84660,
-    168269,
-    64211,
-    86313,
-    158506,
-    23808,
-    42826,
-    97140,
-    32244,
-    151129,
-    144107,
-    111449,
-    62024,
-    41896,
-    136738,
-    176699,
-    129085,
-    101812,
-    124780,
-    120722,
-    34871,
-    42434,
-    105455,
-    58756,
-    163083,
-    179202,
-    169020,
-    98518,
-    49231,
-    133890,
-    45889,
-    30069,
-    86530,
-    129764,
-    4112,
-    32477,
-    169909,
-    21093,
-    125346,
-    66826,
-    62952,
-    166245,
-    61283,
-    108837,
-    108799,
-    146535,
-    27363,
-    66337,
-    128025,
-    103899,
-    105507,
-    64551,
-    130925,
-    73241,
-    86182,
-    177944,
-    22155,
-    167805,
-    32717,
-    143387,
-    142988,
-    115038,
-    3940,
-    88056,
-    91898,
-    167144,
-    91592,
-    17289,
-    60350,
-    165160,
-    11453,
-    55377,
-    82895,
-    128166,
-    34881,
-    176506,
-    93368,
-    155035,
-    101339,
-    58680,
-    34462,
-    67311,
-    59001,
-    24217,
-    131491,
-    138258,
-    5701,
-    50993,
-    144631,
-    142567,
-    67797,
-    79312,
-    98804,
-    167119,
-    116629,
-    5340,
-    116202,
-    2280,
-    45112,
-    98927,
-    49117,
-    17788,
-    50666,
-    148287,
-    27437,
-    36906,
-    144630,
-    64749,
-    176319,
-    88125,
-    161270,
-    8411,
-    4054,
-    63990,
-    165932,
-    177115,
-    93097,
-    50371,
-    174129,
-    1476,
-    80866,
-    130561,
-    127714,
-    140405,
-    150228,
-    173035,
-    36137,
-    32015,
-    173390,
-    125833,
-    177042,
-    74195,
-    114804,
-    98602,
-    21311,
-    73117,
-    42348,
-    91929,
-    147853,
-    51561,
-    81669,
-    110301,
-    144178,
-    149548,
-    125405,
-    129372,
-    79873,
-    45790,
-    27929,
-    113126,
-    175331,
-    163151,
-    91260,
-    4415,
-    59813,
-    48466,
-    101582,
-    138900,
-    14609,
-    104557,
-    18527,
-    31739,
-    59165,
-    44368,
-    124208,
-    93836,
-    128036,
-    156046,
-    2804,
-    94224,
-    165858,
-    51365,
-    18244,
-    73821,
-    20336,
-    108110,
-    129334,
-    101476,
-    139758,
-    158379,
-    135674,
-    24011,
-    137992,
-    44558,
-    38988,
-    31988,
-    152365,
-    63617,
-    157812,
-    128862,
-    101068,
-    134407,
-    14888,
-    22232,
-    50119,
-    41805,
-    27065,
-    2950,
-    173292,
-    18704,
-    66210,
-    88569,
-    121702,
-    142689,
-    157682,
-    66129,
-    4016,
-    51501,
-    104090,
-    69446,
-    28449,
-    154757,
-    61027,
-    112731,
-    125907,
-    45931,
-    100568,
-    123933,
-    147113,
-    34270,
-    175687,
-    83755,
-    52490,
-    127477,
-    91166,
-    111207,
-    133282,
-    57612,
-    111867,
-    163039,
-    146838,
-    160514,
-    29555,
-    106864,
-    37027,
-    106447,
-    60755,
-    72029,
-    18981,
-    33721,
-    130190,
-    165024,
-    59014,
-    30587,
-    156985,
-    13637,
-    167400,
-    172415,
-    146490,
-    27745,
-    38499,
-    172182,
-    111958,
-    29624,
-    140956,
-    22819,
-    52431,
-    151087,
-    53874,
-    132496,
-    62702,
-    24899,
-    161463,
-    152667,
-    156335,
-    24078,
-    166500,
-    23695,
-    51659,
-    155414,
-    163451,
-    53978,
-    88849,
-    35622,
-    165984,
-    155444,
-    178390,
-    138208,
-    107269,
-    75383,
-    37360,
-    63124,
-    168723,
-    32043,
-    139090,
-    132800,
-    134863,
-    61095,
-    3113,
-    98888,
-    161111,
-    43427,
-    103843,
-    171182,
-    72989,
-    5533,
-    124241,
-    97048,
-    172440,
-    42573,
-    65336,
-    18815,
-    18833,
-    163105,
-    121112,
-    2797,
-    82244,
-    32443,
-    133954,
-    143766,
-    38887,
-    137064,
-    121603,
-    124930,
-    177580,
-    87135,
-    50059,
-    50866,
-    72587,
-    14098,
-    149810,
-    109305,
-    83192,
-    78073,
-    50028,
-    155557,
-    148546,
-    137401,
-    9699,
-    68729,
-    15338,
-    139902,
-    80951,
-    8065,
-    59905,
-    126605,
-    83490,
-    137420,
-    29957,
-    672,
-    108011,
-    126117,
-    130807,
-    165699,
-    48240,
-    122223,
-    136364,
-    20367,
-    108499,
-    9129,
-    104888,
-    85941,
-    142932,
-    38750,
-    47844,
-    77155,
-    172100,
-    29406,
-    125700,
-    143065,
-    142890,
-    99648,
-    138825,
-    100384,
-    23955,
-    123388,
-    74333,
-    159913,
-    14409,
-    92801,
-    140992,
-    115093,
-    118072,
-    86998,
-    38625,
-    90466,
-    38928,
-    135122,
-    150706,
-    71141,
-    45886,
-    152217,
-    80835,
-    138867,
-    139568,
-    165909,
-    53125,
-    102016,
-    127599,
-    37347,
-    11271,
-    72074,
-    140067,
-    140411,
-    90803,
-    133384,
-    83945,
-    82502,
-    32565,
-    58842,
-    46145,
-    160823,
-    156614,
-    1808,
-    87216,
-    54539,
-    10827,
-    25051,
-    44284,
-    84871,
-    8525,
-    176874,
-    127338,
-    7107,
-    66525,
-    113728,
-    73255,
-    69571,
-    122555,
-    65052,
-    83227,
-    38111,
-    172805,
-    151743,
-    173276,
-    154151,
-    19148,
-    153685,
-    154323,
-    15720,
-    127538,
-    104629,
-    73292,
-    112176,
-    171172,
-    60488,
-    135715,
-    18952,
-    64428,
-    115218,
-    101479,
-    998,
-    158884,
-    71205,
-    103996,
-    69055,
-    146347,
-    150351,
-    58463,
-    34249,
-    6940,
-    73653,
-    15498,
-    131592,
-    12675,
-    101540,
-    139912,
-    109483,
-    113536,
-    39239,
-    95587,
-    109624,
-    86781,
-    135852,
-    42397,
-    123477,
-    1974,
-    92653,
-    53351,
-    63782,
-    83465,
-    156577,
-    76563,
-    168638,
-    15972,
-    11101,
-    138514,
-    52677,
-    16769,
-    58736,
-    63331,
-    142374,
-    103877,
-    134551,
-    77330,
-    159201,
-    57227,
-    146092,
-    160316,
-    124528,
-    97231,
-    43104,
-    46777,
-    153831,
-    3624,
-    2773,
-    36991,
-    52855,
-    124137,
-    91834,
-    47069,
-    65001,
-    132862,
-    77861,
-    87795,
-    13337,
-    154399,
-    36170,
-    101839,
-    123306,
-    35372,
-    59286,
-    48614,
-    104771,
-    131702,
-    178747,
-    118075,
-    164119,
-    60291,
-    76793,
-    68566,
-    95323,
-    20917,
-    14734,
-    30038,
-    13627,
-    114451,
-    109691,
-    163788,
-    2519,
-    96031,
-    166803,
-    104369,
-    96580,
-    122466,
-    112380,
-    129830,
-    75009,
-    71438,
-    68601,
-    89258,
-    8075,
-    122559,
-    98127,
-    74749,
-    165472,
-    19548,
-    6437,
-    97660,
-    115644,
-    148885,
-    74281,
-    70617,
-    76264,
-    162980,
-    62277,
-    59357,
-    26541,
-    46122,
-    127736,
-    154720,
-    17460,
-    65907,
-    32409,
-    175518,
-    153575,
-    9207,
-    128670,
-    84937,
-    164229,
-    66468,
-    162957,
-    22747,
-    109601,
-    30,
-    79920,
-    41272,
-    15253,
-    67014,
-    83548,
-    40189,
-    132005,
-    117560,
-    115552,
-    45396,
-    121406,
-    40019,
-    16598,
-    166084,
-    56859,
-    158304,
-    22034,
-    82101,
-    33527,
-    83569,
-    12585,
-    146113,
-    146592,
-    127196,
-    56053,
-    79446,
-    75560,
-    63240,
-    43444,
-    145337,
-    116683,
-    89204,
-    127761,
-    129013,
-    169432,
-    111262,
-    163857,
-    131104,
-    88899,
-    98976,
-    146167,
-    93915,
-    1797,
-    125104,
-    53484,
-    125937,
-    134198,
-    160907,
-    55207,
-    133209,
-    28674,
-    117815,
-    157030,
-    98667,
-    62792,
-    103895,
-    92333,
-    77601,
-    65522,
-    150332,
-    171622,
-    46027,
-    178393,
-    103560,
-    109018,
-    103995,
-    164521,
-    588,
-    128813,
-    48897,
-    32226,
-    92321,
-    63393,
-    168784,
-    143121,
-    107943,
-    59114,
-    12158,
-    99832,
-    60636,
-    151360,
-    151421,
-    59100,
-    122953,
-    171665,
-    10439,
-    179615,
-    6848,
-    86024,
-    168873,
-    15182,
-    36926,
-    79434,
-    172795,
-    11861,
-    140846,
-    179623,
-    154675,
-    169803,
-    56769,
-    87520,
-    152942,
-    136806,
-    25217,
-    128366,
-    42840,
-    50567,
-    44991,
-    124792,
-    166784,
-    852,
-    122216,
-    15965,
-    157768,
-    121407,
-    168752,
-    80911,
-    39040,
-    103886,
-    27295,
-    150707,
-    110922,
-    88371,
-    171366,
-    438,
-    129679,
-    29967,
-    155398,
-    69992,
-    149474,
-    80381,
-    168917,
-    54496,
-    152139,
-    116780,
-    142274,
-    4215,
-    104677,
-    127380,
-    67630,
-    119669,
-    33415,
-    59017,
-    133949,
-    71650,
-    6084,
-    161422,
-    71760,
-    42445,
-    65189,
-    74192,
-    7462,
-    111964,
-    155042,
-    128695,
-    132630,
-    148360,
-    79593,
-    118367,
-    163242,
-    22530,
-    24038,
-    61257,
-    111389,
-    85780,
-    28679,
-    111177,
-    139632,
-    172222,
-    173719,
-    4749,
-    176173,
-    34464,
-    98541,
-    105192,
-    128434,
-    140950,
-    74706,
-    80122,
-    153272,
-    177634,
-    55999,
-    41553,
-    152092,
-    86197,
-    37829,
-    86912,
-    18517,
-    86729,
-    104482,
-    107275,
-    139721,
-    179973,
-    8766,
-    25674,
-    52508,
-    80354,
-    131513,
-    9506,
-    46683,
-    128003,
-    8409,
-    24655,
-    126179,
-    151528,
-    131157,
-    43203,
-    61442,
-    53910,
-    154751,
-    98381,
-    35195,
-    83827,
-    70611,
-    45513,
-    158722,
-    106763,
-    108708,
-    61141,
-    30435,
-    118052,
-    48909,
-    124877,
-    23155,
-    157863,
-    64847,
-    153590,
-    36757,
-    86638,
-    97515,
-    71378,
-    106521,
-    59776,
-    12898,
-    33764,
-    58391,
-    117099,
-    41891,
-    162347,
-    140124,
-    63173,
-    121959,
-    46431,
-    91144,
-    37946,
-    170085,
-    57418,
-    83065,
-    57059,
-    44245,
-    119245,
-    122595,
-    152994,
-    160438,
-    51424,
-    111997,
-    101235,
-    35815,
-    56699,
-    2571,
-    111808,
-    152836,
-    65539,
-    33251,
-    80610,
-    99295,
-    149498,
-    172404,
-    99096,
-    117025,
-    41289,
-    139927,
-    146124,
-    169350,
-    29427,
-    145223,
-    32754,
-    111386,
-    122414,
-    39300,
-    164617,
-    11601,
-    94920,
-    152618,
-    9158,
-    84113,
-    159246,
-    84844,
-    66980,
-    65544,
-    133514,
-    176040,
-    136049,
-    68588,
-    37224,
-    137010,
-    150077,
-    159301,
-    156159,
-    159751,
-    178954,
-    122410,
-    58766,
-    139436,
-    99724,
-    82935,
-    79113,
-    64234,
-    174665,
-    71849,
-    149313,
-    166310,
-    129252,
-    161807,
-    19671,
-    139054,
-    117045,
-    130450,
-    96899,
-    175270,
-    114230,
-    73284,
-    123040,
-    52844,
-    137658,
-    22271,
-    3312,
-    22817,
-    172290,
-    112417,
-    107976,
-    15146,
-    7525,
-    118611,
-    153997,
-    33552,
-    59437,
-    123288,
-    165397,
-    23367,
-    154100,
-    52974,
-    138098,
-    113314,
-    92137,
-    3986,
-    81414,
-    132504,
-    90981,
-    126746,
-    63570,
-    143976,
-    68530,
-    27002,
-    11278,
-    177077,
-    160486,
-    161956,
-    176261,
-    69148,
-    136521,
-    138768,
-    153842,
-    158381,
-    153226,
-    66594,
-    76219,
-    71273,
-    167638,
-    152514,
-    151146,
-    98522,
-    67550,
-    143470,
-    9838,
-    3592,
-    94251,
-    51621,
-    92452,
-    33507,
-    8220,
-    136590,
-    115553,
-    156826,
-    21941,
-    173142,
-    92370,
-    173304,
-    170265,
-    65703,
-    153485,
-    55246,
-    18738,
-    152591,
-    119808,
-    45539,
-    81936,
-    179333,
-    137889,
-    139059,
-    140252,
-    52524,
-    9482,
-    6110,
-    15411,
-    154000,
-    141436,
-    53337,
-    130354,
-    118685,
-    6192,
-    24066,
-    3454,
-    54861,
-    27145,
-    47217,
-    48252,
-    27768,
-    48273,
-    100431,
-    145805,
-    68261,
-    122228,
-    31731,
-    145681,
-    148158,
-    167730,
-    120749,
-    172352,
-    147644,
-    84885,
-    86101,
-    50948,
-    160021,
-    83571,
-    36280,
-    53713,
-    117539,
-    80521,
-    67165,
-    21222,
-    97750,
-    129400,
-    98179,
-    14532,
-    31266,
-    83155,
-    73440,
-    21647,
-    67254,
-    10671,
-    7767,
-    53373,
-    59378,
-    54783,
-    80013,
-    118976,
-    136818,
-    142102,
-    48822,
-    106132,
-    32090,
-    66675,
-    1595,
-    113781,
-    108746,
-    32999,
-    134539,
-    67672,
-    142982,
-    70487,
-    147118,
-    152813,
-    95410,
-    140527,
-    116115,
-    44483,
-    39830,
-    105697,
-    128380,
-    109835,
-    19326,
-    164197,
-    127665,
-    107680,
-    144951,
-    147966,
-    70007,
-    175204,
-    128631,
-    77680,
-    142711,
-    172655,
-    10500,
-    90901,
-    46934,
-    36504,
-    175851,
-    46410,
-    12495,
-    69711,
-    24128,
-    24659,
-    72865,
-    76146,
-    35000,
-    120946,
-    175708,
-    81307,
-    88704,
-    94748,
-    156557,
-    128397,
-    43110,
-    120296,
-    96482,
-    22446,
-    21759,
-    29505,
-    17980,
-    69312,
-    31904,
-    68889,
-    178680,
-    124129,
-    58686,
-    75425,
-    52102,
-    68971,
-    19174,
-    135541,
-    165986,
-    12662,
-    133917,
-    161159,
-    104435,
-    158364,
-    142563,
-    3171,
-    56140,
-    162771,
-    29883,
-    105942,
-    59173,
-    166394,
-    20278,
-    111667,
-    169880,
-    113557,
-    34969,
-    89206,
-    101616,
-    93239,
-    80596,
-    169713,
-    29292,
-    127382,
-    34784,
-    44231,
-    110099,
-    45857,
-    21109,
-    164715,
-    51117,
-    12435,
-    120410,
-    15464,
-    95631,
-    94943,
-    167291,
-    53772,
-    90500,
-    2041,
-    28144,
-    100603,
-    156662,
-    45512,
-    150345,
-    80959,
-    107489,
-    69139,
-    3214,
-    177950,
-    50163,
-    11761,
-    164199,
-    28274,
-    68992,
-    158271,
-    95478,
-    54535,
-    131758,
-    64725,
-    71323,
-    134397,
-    165625,
-    143329,
-    110387,
-    38841,
-    114898,
-    2244,
-    17130,
-    14327,
-    152815,
-    136398,
-    101328,
-    52076,
-    74467,
-    119816,
-    174443,
-    88880,
-    67828,
-    94363,
-    124980,
-    165293,
-    146231,
-    30220,
-    72807,
-    171513,
-    77717,
-    8130,
-    56304,
-    120028,
-    121654,
-    60031,
-    64337,
-    167910,
-    119055,
-    32929,
-    158210,
-    112128,
-    32810,
-    10310,
-    10565,
-    73877,
-    175311,
-    54684,
-    169265,
-    107517,
-    39982,
-    114495,
-    12066,
-    22946,
-    174440,
-    88988,
-    144058,
-    93817,
-    101445,
-    114747,
-    104107,
-    131635,
-    86751,
-    3416,
-    4575,
-    31951,
-    24080,
-    66982,
-    123863,
-    109827,
-    172024,
-    156481,
-    106523,
-    45935,
-    83297,
-    167850,
-    43849,
-    73968,
-    166075,
-    52769,
-    124432,
-    162275,
-    158715,
-    161623,
-    141228,
-    55215,
-    109379,
-    102058,
-    94393,
-    109226,
-    21531,
-    92200,
-    150631,
-    99690,
-    89600,
-    147954,
-    67354,
-    6166,
-    43126,
-    14753,
-    135818,
-    102274,
-    83003,
-    177507,
-    51394,
-    8231,
-    92220,
-    50143,
-    126996,
-    29573,
-    97521,
-    1618,
-    114104,
-    960,
-    22691,
-    80400,
-    4338,
-    109046,
-    85238,
-    46765,
-    49426,
-    6735,
-    124317,
-    95260,
-    143706,
-    43416,
-    177607,
-    161133,
-    77209,
-    145411,
-    130712,
-    17473,
-    149782,
-    104299,
-    50769,
-    106295,
-    96689,
-    132115,
-    148429,
-    16938,
-    51705,
-    111006,
-    35199,
-    3523,
-    156600,
-    151205,
-    46899,
-    93277,
-    126285,
-    62142,
-    3958,
-    150155,
-    161035,
-    97300,
-    18779,
-    20455,
-    118846,
-    80277,
-    110496,
-    9274,
-    14553,
-    115225,
-    60801,
-    104877,
-    151424,
-    166011,
-    48870,
-    162236,
-    15220,
-    54357,
-    145151,
-    104453,
-    163936,
-    43928,
-    43318,
-    148643,
-    15276,
-    43970,
-    169090,
-    51835,
-    136900,
-    89998,
-    27784,
-    49563,
-    161,
-    14415,
-    171903,
-    136070,
-    131341,
-    151420,
-    6533,
-    8576,
-    97314,
-    140653,
-    5438,
-    83909,
-    45462,
-    156679,
-    99815,
-    173689,
-    41803,
-    59143,
-    71902,
-    135575,
-    61956,
-    22870,
-    125364,
-    120621,
-    76553,
-    82835,
-    112862,
-    93598,
-    149526,
-    152718,
-    93681,
-    162227,
-    163816,
-    112796,
-    49955,
-    104145,
-    43396,
-    51635,
-    126100,
-    72478,
-    37913,
-    4871,
-    99536,
-    18599,
-    78952,
-    40055,
-    68039,
-    61932,
-    8108,
-    1114,
-    28616,
-    13022,
-    102864,
-    129109,
-    92589,
-    113498,
-    119326,
-    52716,
-    27727,
-    170704,
-    83467,
-    8637,
-    128805,
-    18183,
-    41074,
-    162628,
-    156579,
-    43089,
-    132163,
-    17263,
-    147971,
-    1649,
-    101758,
-    29247,
-    154597,
-    124919,
-    135964,
-    100323,
-    30402,
-    15272,
-    98584,
-    138352,
-    23692,
-    113629,
-    18530,
-    89332,
-    23073,
-    48112,
-    138076,
-    72774,
-    44786,
-    109567,
-    154770,
-    15483,
-    169952,
-    81162,
-    53666,
-    31006,
-    129931,
-    13865,
-    15559,
-    128203,
-    12475,
-    15778,
-    174834,
-    147479,
-    12371,
-    162986,
-    127511,
-    79081,
-    22284,
-    171191,
-    71690,
-    60951,
-    167121,
-    774,
-    63250,
-    48154,
-    73225,
-    153811,
-    64883,
-    29726,
-    80101,
-    115935,
-    6135,
-    81807,
-    179425,
-    70385,
-    90498,
-    155349,
-    3933,
-    58065,
-    108829,
-    138392,
-    43256,
-    11701,
-    46880,
-    29276,
-    114668,
-    109179,
-    24148,
-    72760,
-    55145,
-    147473,
-    114686,
-    11337,
-    103971,
-    177058,
-    69716,
-    16286,
-    55758,
-    116476,
-    148641,
-    117277,
-    157309,
-    171071,
-    127758,
-    33887,
-    41495,
-    148451,
-    177120,
-    41105,
-    48158,
-    40320,
-    150040,
-    138834,
-    166656,
-    85136,
-    174962,
-    23832,
-    8386,
-    24189,
-    101129,
-    77477,
-    23684,
-    118741,
-    143091,
-    28235,
-    124402,
-    79537,
-    131902,
-    61219,
-    33651,
-    61848,
-    68534,
-    123159,
-    36149,
-    91813,
-    172087,
-    57528,
-    97282,
-    26127,
-    30126,
-    70403,
-    176483,
-    132923,
-    159107,
-    30715,
-    10926,
-    9317,
-    162110,
-    160408,
-    146598,
-    82706,
-    45535,
-    10308,
-    79856,
-    161895,
-    36390,
-    57213,
-    176268,
-    14106,
-    64114,
-    8170,
-    99229,
-    131781,
-    63700,
-    148660,
-    30654,
-    51848,
-    171197,
-    3332,
-    107224,
-    46882,
-    105368,
-    46504,
-    14011,
-    54186,
-    117121,
-    57979,
-    67791,
-    146505,
-    126797,
-    84836,
-    21542,
-    65094,
-    91114,
-    137250,
-    61754,
-    168980,
-    90212,
-    75025,
-    56519,
-    170433,
-    83831,
-    34513,
-    123349,
-    49087,
-    170302,
-    56986,
-    126708,
-    148198,
-    92530,
-    41681,
-    144159,
-    112668,
-    178469,
-    143811,
-    1637,
-    148031,
-    167785,
-    42143,
-    64563,
-    22733,
-    90138,
-    167674,
-    174430,
-    94404,
-    17653,
-    104497,
-    167735,
-    9924,
-    79313,
-    161989,
-    173400,
-    10032,
-    167875,
-    4939,
-    171593,
-    115870,
-    143583,
-    74413,
-    134823,
-    92518,
-    68364,
-    115862,
-    157372,
-    166548,
-    42940,
-    95288,
-    115593,
-    2672,
-    101559,
-    158817,
-    161066,
-    108072,
-    3673,
-    155680,
-    32482,
-    96995,
-    142772,
-    170666,
-    24917,
-    145579,
-    157716,
-    174039,
-    110999,
-    81161,
-    103828,
-    161494,
-    11127,
-    174581,
-    115824,
-    16602,
-    138209,
-    160762,
-    115804,
-    44792,
-    119256,
-    179788,
-    77516,
-    14951,
-    26791,
-    117500,
-    154691,
-    120680,
-    57752,
-    173813,
-    32060,
-    17977,
-    57817,
-    2623,
-    83592,
-    142936,
-    101043,
-    104750,
-    25734,
-    4103,
-    159340,
-    157599,
-    151325,
-    177283,
-    34449,
-    145081,
-    23494,
-    149392,
-    131578,
-    125974,
-    113063,
-    177763,
-    93742,
-    105189,
-    119226,
-    175497,
-    82699,
-    125439,
-    28416,
-    94119,
-    1024,
-    156426,
-    75098,
-    49867,
-    129801,
-    37071,
-    145148,
-    15031,
-    143380,
-    104196,
-    167608,
-    29137,
-    162076,
-    123308,
-    122661,
-    86440,
-    108840,
-    21265,
-    124806,
-    174997,
-    115590,
-    76655,
-    66438,
-    111510,
-    68824,
-    175697,
-    139935,
-    86073,
-    3488,
-    12222,
-    69010,
-    130319,
-    132082,
-    166626,
-    54050,
-    152502,
-    113948,
-    79644,
-    11122,
-    174895,
-    74376,
-    163154,
-    70289,
-    107588,
-    37007,
-    171029,
-    49815,
-    157934,
-    77055,
-    179892,
-    138436,
-    43727,
-    124801,
-    73375,
-    100115,
-    159399,
-    71739,
-    136635,
-    86651,
-    175039,
-    151362,
-    44421,
-    143175,
-    60825,
-    70041,
-    151847,
-    75902,
-    171857,
-    57305,
-    118151,
-    35669,
-    83201,
-    79041,
-    124200,
-    140894,
-    32165,
-    171066,
-    104354,
-    40174,
-    179224,
-    31414,
-    120472,
-    9687,
-    56217,
-    78942,
-    13458,
-    23469,
-    12942,
-    148291,
-    812,
-    120230,
-    91175,
-    140766,
-    101913,
-    43494,
-    104243,
-    17174,
-    44818,
-    141549,
-    18544,
-    55650,
-    147446,
-    172167,
-    12168,
-    120140,
-    72224,
-    166093,
-    95268,
-    152794,
-    112971,
-    131838,
-    144664,
-    116630,
-    106151,
-    155833,
-    134186,
-    67894,
-    177506,
-    150430,
-    90741,
-    168061,
-    1990,
-    67992,
-    108727,
-    3921,
-    122805,
-    98579,
-    172412,
-    32748,
-    112246,
-    85083,
-    167842,
-    5058,
-    133081,
-    109639,
-    117764,
-    22422,
-    133279,
-    179680,
-    77542,
-    36917,
-    43234,
-    171962,
-    3990,
-    68352,
-    146869,
-    162378,
-    133289,
-    102662,
-    167776,
-    84980,
-    174706,
-    66118,
-    44848,
-    77552,
-    83491,
-    81883,
-    37796,
-    129953,
-    91759,
-    91028,
-    151578,
-    139315,
-    172984,
-    138495,
-    42253,
-    64261,
-    37113,
-    172031,
-    166939,
-    133656,
-    119146,
-    130653,
-    103503,
-    2137,
-    107465,
-    66339,
-    178692,
-    134460,
-    111589,
-    6691,
-    175345,
-    65863,
-    83510,
-    150927,
-    164642,
-    28641,
-    95409,
-    93881,
-    167836,
-    139946,
-    88926,
-    28567,
-    18192,
-    159834,
-    114528,
-    156905,
-    166711,
-    81611,
-    116204,
-    20338,
-    43222,
-    82388,
-    101760,
-    118330,
-    4256,
-    18573,
-    155386,
-    134364,
-    127864,
-    165432,
-    133065,
-    164362,
-    105195,
-    158186,
-    41881,
-    135766,
-    51273,
-    74338,
-    143114,
-    117717,
-    139600,
-    172132,
-    143720,
-    48259,
-    135827,
-    37795,
-    107438,
-    144865,
-    150880,
-    24409,
-    125068,
-    104220,
-    129223,
-    49392,
-    54133,
-    106193,
-    36056,
-    106250,
-    96860,
-    1956,
-    130602,
-    40546,
-    2989,
-    27671,
-    134361,
-    69288,
-    106063,
-    151407,
-    35349,
-    20798,
-    164177,
-    65145,
-    81970,
-    45071,
-    23028,
-    142095,
-    90488,
-    168540,
-    2658,
-    155864,
-    125856,
-    96534,
-    162681,
-    114131,
-    109942,
-    118672,
-    124173,
-    12067,
-    131262,
-    174557,
-    22959,
-    123193,
-    98589,
-    117023,
-    110642,
-    86936,
-    64185,
-    125970,
-    171505,
-    132043,
-    554,
-    113745,
-    25540,
-    97744,
-    103688,
-    18232,
-    14729,
-    152100,
-    95194,
-    7958,
-    10742,
-    15700,
-    97086,
-    137271,
-    87552,
-    172474,
-    151355,
-    125485,
-    30443,
-    53723,
-    35254,
-    97221,
-    122742,
-    107061,
-    26566,
-    74033,
-    24584,
-    147740,
-    110390,
-    102163,
-    152080,
-    120727,
-    158378,
-    13881,
-    70301,
-    80735,
-    178385,
-    5671,
-    94399,
-    136348,
-    66716,
-    50199,
-    26664,
-    13062,
-    122210,
-    153102,
-    37918,
-    150049,
-    115575,
-    72424,
-    147224,
-    29116,
-    178190,
-    177000,
-    144274,
-    64607,
-    19028,
-    13602,
-    67679,
-    99322,
-    61642,
-    17114,
-    61664,
-    171067,
-    5992,
-    2125,
-    107806,
-    151673,
-    84652,
-    95747,
-    71861,
-    111503,
-    112549,
-    54401,
-    77900,
-    129903,
-    18995,
-    113924,
-    129506,
-    120624,
-    67347,
-    5007,
-    154848,
-    86647,
-    125858,
-    166661,
-    27042,
-    62080,
-    7991,
-    142213,
-    85565,
-    21489,
-    131879,
-    41141,
-    55422,
-    98379,
-    40757,
-    88139,
-    107781,
-    174857,
-    132242,
-    138932,
-    141037,
-    148468,
-    118638,
-    115848,
-    10123,
-    105853,
-    3280,
-    140,
-    56027,
-    14120,
-    101673,
-    41018,
-    136822,
-    85217,
-    142188,
-    130192,
-    609,
-    98325,
-    94917,
-    46767,
-    128611,
-    6730,
-    156654,
-    71243,
-    78652,
-    62997,
-    131147,
-    179986,
-    175118,
-    69742,
-    178042,
-    166350,
-    134127,
-    118764,
-    127055,
-    174537,
-    71838,
-    43866,
-    91504,
-    83033,
-    108461,
-    6479,
-    126711,
-    55699,
-    117588,
-    168245,
-    17162,
-    39161,
-    172900,
-    129995,
-    34222,
-    22893,
-    25224,
-    131133,
-    3878,
-    139330,
-    70132,
-    7802,
-    89855,
-    53456,
-    113495,
-    161510,
-    56136,
-    168181,
-    93508,
-    30403,
-    49837,
-    164682,
-    164889,
-    150057,
-    60966,
-    104252,
-    105298,
-    25347,
-    171632,
-    152657,
-    143646,
-    76873,
-    64341,
-    133313,
-    104184,
-    78604,
-    166380,
-    150993,
-    16295,
-    1388,
-    11585,
-    60314,
-    49406,
-    55388,
-    65188,
-    10026,
-    898,
-    11922,
-    36488,
-    174907,
-    125258,
-    36076,
-    169016,
-    147544,
-    72876,
-    78511,
-    69592,
-    152952,
-    71677,
-    90377,
-    30639,
-    22684,
-    105608,
-    115907,
-    134196,
-    12895,
-    41465,
-    22872,
-    95222,
-    68287,
-    23168,
-    95020,
-    40574,
-    73254,
-    66990,
-    81180,
-    32854,
-    116997,
-    179352,
-    101108,
-    99113,
-    1241,
-    144342,
-    95000,
-    8667,
-    40266,
-    68801,
-    8849,
-    57931,
-    97626,
-    88592,
-    44634,
-    166655,
-    173524,
-    135053,
-    49071,
-    135479,
-    97070,
-    134223,
-    52783,
-    11579,
-    52419,
-    112806,
-    48729,
-    152040,
-    61793,
-    164194,
-    152452,
-    67068,
-    48027,
-    122079,
-    38133,
-    155479,
-    138714,
-    134795,
-    23389,
-    81312,
-    10054,
-    61977,
-    85318,
-    7772,
-    41855,
-    56194,
-    124989,
-    175781,
-    41310,
-    76669,
-    163019,
-    63558,
-    158040,
-    42650,
-    169608,
-    147469,
-    85187,
-    16754,
-    89760,
-    164593,
-    2266,
-    148078,
-    2945,
-    57884,
-    48975,
-    175051,
-    76443,
-    129719,
-    156939,
-    160715,
-    30323,
-    128315,
-    10654,
-    103205,
-    48668,
-    112249,
-    154963,
-    88597,
-    128365,
-    3407,
-    82107,
-    82562,
-    58485,
-    100112,
-    173639,
-    75752,
-    169534,
-    39419,
-    92944,
-    130164,
-    134752,
-    166612,
-    113025,
-    42833,
-    100454,
-    23319,
-    29449,
-    86285,
-    22181,
-    139007,
-    159126,
-    55075,
-    71563,
-    104048,
-    137501,
-    137542,
-    96519,
-    77119,
-    126348,
-    179916,
-    35685,
-    75704,
-    137386,
-    172828,
-    163747,
-    168556,
-    167347,
-    175569,
-    36814,
-    8166,
-    145433,
-    109237,
-    39261,
-    73496,
-    3272,
-    117164,
-    100177,
-    63223,
-    15197,
-    19273,
-    73832,
-    176940,
-    30076,
-    138651,
-    142938,
-    5200,
-    77596,
-    152183,
-    139916,
-    149850,
-    36291,
-    59197,
-    71207,
-    174915,
-    10679,
-    118191,
-    131668,
-    34078,
-    31175,
-    158386,
-    114245,
-    30212,
-    148405,
-    87977,
-    53718,
-    72985,
-    95512,
-    141664,
-    167493,
-    152180,
-    19254,
-    121402,
-    27399,
-    171497,
-    121031,
-    36665,
-    70887,
-    179692,
-    73306,
-    445,
-    26051,
-    111650,
-    136328,
-    120376,
-    22745,
-    150537,
-    16837,
-    10553,
-    72436,
-    84887,
-    139022,
-    95769,
-    55606,
-    32561,
-    123879,
-    12560,
-    69814,
-    36475,
-    109643,
-    128997,
-    172096,
-    49118,
-    55796,
-    107023,
-    96568,
-    100928,
-    92497,
-    30823,
-    20037,
-    27812,
-    46478,
-    150488,
-    141531,
-    161872,
-    28893,
-    19135,
-    90725,
-    55467,
-    47712,
-    15510,
-    85197,
-    15258,
-    13849,
-    89828,
-    72134,
-    78362,
-    101756,
-    117132,
-    134293,
-    1285,
-    116166,
-    60890,
-    32224,
-    8506,
-    92002,
-    76887,
-    12124,
-    83350,
-    69430,
-    169329,
-    92919,
-    107358,
-    29246,
-    21141,
-    56281,
-    126409,
-    66429,
-    10888,
-    62217,
-    173687,
-    5946,
-    86382,
-    56816,
-    56887,
-    73854,
-    117773,
-    101910,
-    12692,
-    179122,
-    1786,
-    146042,
-    6039,
-    53663,
-    14649,
-    153011,
-    47872,
-    52244,
-    85045,
-    142210,
-    35599,
-    88275,
-    142644,
-    70317,
-    68397,
-    39166,
-    126661,
-    94686,
-    53824,
-    179420,
-    22029,
-    43774,
-    83455,
-    42469,
-    100247,
-    43317,
-    119322,
-    120096,
-    125954,
-    441,
-    155084,
-    121891,
-    36354,
-    81492,
-    113673,
-    29902,
-    161913,
-    62566,
-    31123,
-    26169,
-    169893,
-    98948,
-    44887,
-    37427,
-    113751,
-    126030,
-    135631,
-    2054,
-    33336,
-    94282,
-    17607,
-    96035,
-    91344,
-    48323,
-    47463,
-    174991,
-    126219,
-    139435,
-    52040,
-    23176,
-    39868,
-    124042,
-    43747,
-    165740,
-    120085,
-    150715,
-    88072,
-    173694,
-    161278,
-    126870,
-    18390,
-    39052,
-    6034,
-    174677,
-    125943,
-    24342,
-    128274,
-    78864,
-    54747,
-    84479,
-    665,
-    114114,
-    175501,
-    72114,
-    136461,
-    157936,
-    16622,
-    18739,
-    39831,
-    64150,
-    17782,
-    23638,
-    64958,
-    118346,
-    144419,
-    114244,
-    97672,
-    124923,
-    81178,
-    63233,
-    82012,
-    81909,
-    145842,
-    63772,
-    167180,
-    167143,
-    176368,
-    57433,
-    25141,
-    149502,
-    15365,
-    95850,
-    37784,
-    27566,
-    70682,
-    61121,
-    72971,
-    68672,
-    148225,
-    153974,
-    83356,
-    70586,
-    123230,
-    78906,
-    137020,
-    84415,
-    59939,
-    50431,
-    166461,
-    10562,
-    124767,
-    145865,
-    136150,
-    36770,
-    18728,
-    78547,
-    108142,
-    42962,
-    67123,
-    88500,
-    36093,
-    76275,
-    17502,
-    177486,
-    136086,
-    97236,
-    151070,
-    173221,
-    111135,
-    144640,
-    39395,
-    40837,
-    178820,
-    70235,
-    152488,
-    25396,
-    45140,
-    72502,
-    169570,
-    104173,
-    113801,
-    20364,
-    51155,
-    63408,
-    21562,
-    129355,
-    62366,
-    129836,
-    139050,
-    99496,
-    155213,
-    140181,
-    50686,
-    141103,
-    151803,
-    100100,
-    170839,
-    114880,
-    104390,
-    36385,
-    14558,
-    160369,
-    42403,
-    165753,
-    88450,
-    125328,
-    5984,
-    44734,
-    71015,
-    119296,
-    147793,
-    162713,
-    67984,
-    62444,
-    18875,
-    68958,
-    173693,
-    123136,
-    156756,
-    92960,
-    83786,
-    162894,
-    153436,
-    169433,
-    105721,
-    71078,
-    43458,
-    37429,
-    120182,
-    26356,
-    178429,
-    143305,
-    168948,
-    123614,
-    108772,
-    142407,
-    169822,
-    156762,
-    97630,
-    5086,
-    85314,
-    150846,
-    53058,
-    31224,
-    14161,
-    134159,
-    50109,
-    55928,
-    30690,
-    155876,
-    91116,
-    143671,
-    77409,
-    11834,
-    176463,
-    42234,
-    77077,
-    106584,
-    120464,
-    123093,
-    116126,
-    152868,
-    152907,
-    82175,
-    662,
-    90547,
-    161839,
-    122631,
-    38245,
-    56589,
-    31981,
-    132284,
-    102162,
-    157995,
-    159239,
-    144502,
-    151622,
-    157965,
-    40988,
-    140853,
-    2534,
-    121478,
-    76754,
-    80189,
-    174301,
-    70810,
-    179087,
-    143226,
-    123727,
-    88390,
-    108307,
-    27515,
-    162565,
-    169870,
-    84042,
-    45385,
-    69628,
-    178778,
-    32921,
-    111570,
-    15927,
-    104546,
-    128113,
-    97957,
-    98058,
-    107965,
-    34297,
-    121500,
-    52453,
-    94351,
-    90110,
-    4079,
-    109977,
-    125163,
-    115940,
-    93955,
-    60862,
-    82281,
-    124974,
-    171860,
-    96556,
-    141660,
-    82815,
-    133600,
-    21977,
-    80124,
-    17469,
-    84978,
-    30853,
-    168701,
-    13228,
-    32129,
-    69851,
-    174057,
-    146063,
-    90829,
-    116078,
-    101620,
-    30669,
-    68874,
-    148558,
-    94137,
-    111851,
-    78220,
-    83501,
-    145786,
-    170734,
-    123326,
-    67162,
-    109170,
-    19656,
-    143628,
-    58613,
-    126760,
-    79122,
-    154063,
-    13071,
-    156304,
-    89631,
-    98480,
-    31241,
-    114648,
-    157008,
-    12622,
-    64742,
-    80464,
-    61387,
-    28215,
-    141816,
-    139672,
-    72640,
-    128571,
-    47171,
-    33272,
-    85273,
-    176648,
-    17746,
-    78265,
-    158046,
-    159070,
-    177979,
-    42313,
-    154007,
-    112345,
-    125384,
-    45199,
-    138359,
-    150290,
-    98913,
-    179717,
-    110442,
-    20973,
-    175429,
-    156804,
-    96563,
-    83494,
-    176254,
-    157055,
-    119344,
-    121960,
-    2201,
-    67475,
-    32102,
-    167238,
-    149600,
-    135474,
-    71008,
-    1588,
-    57209,
-    39659,
-    873,
-    40267,
-    87089,
-    122876,
-    118742,
-    8850,
-    125672,
-    120192,
-    65538,
-    31762,
-    51830,
-    44355,
-    78023,
-    153533,
-    145901,
-    22634,
-    165395,
-    1599,
-    73300,
-    106247,
-    178825,
-    5498,
-    36073,
-    76166,
-    121335,
-    70820,
-    126738,
-    76083,
-    125525,
-    103582,
-    66664,
-    19143,
-    132398,
-    39626,
-    130789,
-    2053,
-    137463,
-    20692,
-    8926,
-    67017,
-    55356,
-    12804,
-    91173,
-    50572,
-    147262,
-    30810,
-    56810,
-    42334,
-    147426,
-    9166,
-    43012,
-    173397,
-    70100,
-    111278,
-    59933,
-    58366,
-    69060,
-    61704,
-    132375,
-    130314,
-    83530,
-    126962,
-    83077,
-    81258,
-    66343,
-    74946,
-    122886,
-    40034,
-    14331,
-    139620,
-    95422,
-    151963,
-    81829,
-    173986,
-    146007,
-    88928,
-    72077,
-    170055,
-    78330,
-    120584,
-    14437,
-    2009,
-    43273,
-    154060,
-    149265,
-    102322,
-    65485,
-    37331,
-    80786,
-    123368,
-    113078,
-    168475,
-    170505,
-    149400,
-    139060,
-    64363,
-    29702,
-    62655,
-    106651,
-    82336,
-    47525,
-    165905,
-    55497,
-    176338,
-    163692,
-    144747,
-    52488,
-    87416,
-    105178,
-    35761,
-    126837,
-    84427,
-    177978,
-    20864,
-    11833,
-    52447,
-    118435,
-    8592,
-    123648,
-    59581,
-    78474,
-    93936,
-    19824,
-    179127,
-    45395,
-    73792,
-    41158,
-    167900,
-    127841,
-    101106,
-    144667,
-    69417,
-    144011,
-    36938,
-    13462,
-    155582,
-    104200,
-    14737,
-    9979,
-    79104,
-    2709,
-    99715,
-    164516,
-    62737,
-    163386,
-    65968,
-    161308,
-    124325,
-    135656,
-    82831,
-    107501,
-    28238,
-    90495,
-    14617,
-    65003,
-    152408,
-    89210,
-    31687,
-    101932,
-    167397,
-    171517,
-    164156,
-    96768,
-    35494,
-    102381,
-    168898,
-    57389,
-    136230,
-    141253,
-    20214,
-    161560,
-    137761,
-    68838,
-    131416,
-    120612,
-    76912,
-    120051,
-    1322,
-    8967,
-    81153,
-    137569,
-    72817,
-    133165,
-    48023,
-    10393,
-    135507,
-    20248,
-    33210,
-    32256,
-    119832,
-    147564,
-    8045,
-    87615,
-    77839,
-    14050,
-    126820,
-    92020,
-    105859,
-    164397,
-    12548,
-    92761,
-    165516,
-    79069,
-    38331,
-    2160,
-    35293,
-    47958,
-    174614,
-    30637,
-    61773,
-    17500,
-    95197,
-    102975,
-    111210,
-    80753,
-    140129,
-    158155,
-    19237,
-    175062,
-    67003,
-    109032,
-    130456,
-    29803,
-    44651,
-    54849,
-    80218,
-    124635,
-    148258,
-    174399,
-    120144,
-    15782,
-    175178,
-    10835,
-    22618,
-    87624,
-    146506,
-    176908,
-    139449,
-    54749,
-    84635,
-    125866,
-    101816,
-    42272,
-    75740,
-    129573,
-    148343,
-    81923,
-    9751,
-    28336,
-    152262,
-    145353,
-    97327,
-    30349,
-    13829,
-    144208,
-    11915,
-    141053,
-    162630,
-    49727,
-    1571,
-    54443,
-    127774,
-    122590,
-    100074,
-    4337,
-    68799,
-    136059,
-    159546,
-    169785,
-    10162,
-    153785,
-    79829,
-    163830,
-    65616,
-    88872,
-    115228,
-    59678,
-    157016,
-    86183,
-    20677,
-    14473,
-    107890,
-    29748,
-    32856,
-    171977,
-    139581,
-    178289,
-    130365,
-    56945,
-    113113,
-    137224,
-    23866,
-    165178,
-    167901,
-    135241,
-    29353,
-    24753,
-    21684,
-    101806,
-    9177,
-    95176,
-    131505,
-    27187,
-    155547,
-    45824,
-    167128,
-    7537,
-    170673,
-    111744,
-    142768,
-    115099,
-    98489,
-    167820,
-    114961,
-    118931,
-    43561,
-    123492,
-    33788,
-    52796,
-    170850,
-    6072,
-    178695,
-    99454,
-    177705,
-    136029,
-    94158,
-    43151,
-    115974,
-    163422,
-    169969,
-    89974,
-    15620,
-    120141,
-    118388,
-    134638,
-    105828,
-    79930,
-    48065,
-    128234,
-    91157,
-    11212,
-    3903,
-    58919,
-    63787,
-    65085,
-    70294,
-    59335,
-    63032,
-    91526,
-    149900,
-    105937,
-    11827,
-    20194,
-    68411,
-    111069,
-    2624,
-    20409,
-    145415,
-    28508,
-    67097,
-    46744,
-    33678,
-    101144,
-    56475,
-    156190,
-    106098,
-    178574,
-    101151,
-    77266,
-    135778,
-    86451,
-    100101,
-    124332,
-    32475,
-    48881,
-    80961,
-    168725,
-    179083,
-    132573,
-    120238,
-    139288,
-    130396,
-    89601,
-    90238,
-    24751,
-    111996,
-    125950,
-    31496,
-    133587,
-    106100,
-    113937,
-    170208,
-    68507,
-    97334,
-    29508,
-    101670,
-    168634,
-    103846,
-    116876,
-    131417,
-    89892,
-    135401,
-    90900,
-    48968,
-    100270,
-    179742,
-    40368,
-    988,
-    75649,
-    95861,
-    70112,
-    36578,
-    52011,
-    133979,
-    81640,
-    35456,
-    134176,
-    79100,
-    122852,
-    2014,
-    149267,
-    163164,
-    108529,
-    160137,
-    23517,
-    12399,
-    2799,
-    23821,
-    118122,
-    148223,
-    165023,
-    177313,
-    112897,
-    154300,
-    43636,
-    139424,
-    16522,
-    68814,
-    175678,
-    46279,
-    9617,
-    107022,
-    140027,
-    153356,
-    113677,
-    12440,
-    97041,
-    57452,
-    172587,
-    72677,
-    158805,
-    70131,
-    53776,
-    106005,
-    171848,
-    6755,
-    162806,
-    68939,
-    31418,
-    93559,
-    175,
-    37111,
-    163708,
-    74263,
-    139165,
-    68956,
-    20859,
-    111624,
-    8747,
-    4149,
-    107315,
-    1352,
-    26759,
-    57526,
-    18749,
-    47186,
-    139749,
-    128959,
-    100172,
-    5959,
-    158415,
-    170316,
-    99075,
-    117085,
-    105597,
-    119200,
-    26667,
-    123406,
-    158697,
-    107337,
-    13664,
-    81805,
-    163383,
-    126349,
-    20725,
-    48026,
-    30248,
-    171328,
-    67324,
-    1276,
-    81900,
-    132984,
-    146184,
-    91925,
-    17846,
-    150602,
-    145831,
-    27270,
-    79650,
-    55588,
-    10395,
-    24749,
-    80566,
-    43099,
-    173016,
-    147013,
-    126432,
-    44206,
-    25911,
-    172186,
-    136872,
-    104841,
-    96638,
-    178044,
-    119666,
-    155117,
-    109757,
-    168744,
-    134692,
-    78833,
-    10195,
-    145719,
-    93288,
-    7727,
-    115186,
-    78458,
-    87553,
-    34662,
-    171979,
-    176693,
-    128064,
-    14207,
-    128622,
-    122379,
-    149084,
-    14899,
-    76309,
-    72869,
-    36162,
-    19796,
-    45878,
-    96135,
-    12650,
-    32671,
-    85875,
-    38720,
-    28116,
-    27193,
-    109722,
-    37827,
-    161851,
-    140195,
-    32433,
-    143056,
-    157979,
-    112768,
-    90133,
-    138852,
-    106576,
-    142812,
-    25564,
-    37800,
-    38892,
-    120543,
-    157685,
-    150659,
-    29657,
-    131254,
-    8283,
-    25151,
-    122102,
-    156703,
-    96968,
-    39571,
-    142788,
-    48543,
-    103067,
-    67893,
-    45482,
-    32377,
-    170378,
-    77740,
-    126780,
-    46286,
-    3349,
-    80809,
-    81088,
-    65784,
-    77344,
-    127376,
-    29391,
-    118814,
-    63538,
-    138487,
-    8680,
-    120817,
-    136665,
-    91405,
-    26743,
-    154748,
-    124262,
-    132348,
-    64161,
-    147876,
-    141261,
-    86573,
-    51438,
-    149343,
-    121910,
-    154985,
-    8737,
-    53953,
-    19161,
-    72520,
-    73288,
-    16846,
-    90448,
-    11529,
-    117505,
-    133601,
-    42477,
-    60667,
-    79469,
-    96046,
-    134148,
-    99840,
-    61534,
-    41331,
-    104156,
-    96894,
-    33628,
-    101753,
-    82202,
-    108530,
-    22735,
-    67631,
-    153064,
-    178605,
-    139157,
-    50285,
-    43005,
-    135622,
-    82027,
-    21095,
-    92028,
-    144012,
-    128257,
-    107200,
-    156735,
-    7517,
-    29525,
-    133267,
-    133028,
-    82329,
-    85324,
-    32761,
-    109503,
-    92831,
-    64245,
-    137793,
-    64718,
-    21537,
-    173168,
-    30809,
-    154866,
-    17531,
-    147248,
-    30123,
-    52223,
-    87034,
-    61615,
-    134468,
-    28427,
-    168211,
-    110292,
-    39381,
-    133418,
-    32114,
-    2032,
-    47603,
-    37337,
-    54188,
-    82612,
-    66551,
-    115173,
-    174924,
-    59576,
-    65473,
-    137102,
-    31073,
-    50639,
-    144323,
-    155556,
-    11335,
-    110720,
-    111253,
-    19672,
-    25405,
-    128385,
-    153727,
-    128271,
-    27300,
-    38264,
-    111482,
-    98530,
-    179754,
-    36220,
-    58419,
-    113491,
-    124869,
-    13136,
-    22035,
-    152381,
-    143781,
-    126191,
-    102283,
-    125012,
-    127971,
-    100602,
-    157968,
-    157874,
-    116354,
-    76320,
-    79391,
-    96214,
-    116235,
-    152610,
-    165693,
-    67110,
-    8629,
-    82465,
-    58640,
-    142094,
-    10628,
-    79550,
-    156563,
-    107837,
-    168730,
-    135843,
-    47832,
-    147157,
-    13784,
-    17002,
-    67814,
-    13165,
-    130464,
-    171781,
-    94614,
-    25623,
-    123021,
-    136771,
-    9056,
-    69502,
-    126771,
-    41827,
-    11034,
-    64798,
-    86819,
-    129171,
-    8207,
-    65985,
-    82211,
-    176586,
-    48965,
-    67118,
-    155991,
-    167074,
-    45315,
-    103448,
-    57667,
-    12138,
-    120653,
-    157100,
-    6334,
-    39203,
-    166386,
-    173325,
-    36239,
-    35759,
-    2432,
-    32956,
-    112124,
-    105943,
-    140796,
-    53794,
-    159403,
-    80479,
-    85254,
-    15899,
-    112700,
-    36846,
-    88190,
-    78060,
-    94124,
-    95208,
-    170767,
-    106404,
-    51280,
-    167236,
-    120089,
-    69693,
-    112965,
-    19537,
-    21519,
-    58102,
-    3923,
-    74589,
-    52718,
-    163785,
-    94887,
-    57661,
-    44698,
-    80247,
-    22052,
-    100116,
-    22353,
-    161295,
-    12868,
-    138343,
-    23371,
-    41200,
-    45407,
-    81663,
-    162240,
-    81590,
-    88582,
-    159081,
-    35728,
-    86606,
-    47629,
-    127586,
-    178707,
-    62978,
-    166372,
-    101065,
-    136380,
-    65910,
-    100744,
-    126376,
-    114224,
-    9287,
-    15943,
-    60054,
-    55575,
-    160345,
-    89526,
-    34437,
-    146546,
-    148942,
-    116157,
-    62081,
-    146095,
-    152658,
-    26709,
-    90562,
-    109487,
-    142302,
-    177764,
-    32901,
-    71170,
-    178423,
-    91023,
-    107170,
-    80935,
-    174571,
-    14805,
-    156634,
-    50447,
-    133825,
-    65647,
-    55576,
-    42897,
-    150123,
-    4773,
-    92236,
-    112283,
-    43717,
-    17724,
-    51759,
-    148925,
-    86232,
-    111951,
-    137567,
-    60402,
-    67492,
-    46822,
-    112881,
-    54921,
-    15204,
-    87244,
-    114999,
-    18266,
-    152253,
-    139793,
-    15536,
-    4731,
-    137307,
-    100714,
-    64034,
-    164623,
-    137339,
-    43371,
-    36887,
-    156567,
-    21623,
-    67413,
-    5264,
-    63026,
-    126128,
-    47658,
-    112266,
-    58392,
-    146032,
-    113980,
-    95156,
-    75657,
-    65734,
-    110409,
-    39962,
-    55238,
-    76617,
-    151876,
-    165604,
-    104422,
-    27793,
-    111328,
-    88421,
-    42431,
-    103648,
-    105732,
-    1001,
-    127494,
-    139277,
-    88986,
-    160960,
-    85743,
-    55534,
-    68102,
-    98616,
-    92187,
-    22118,
-    48237,
-    70280,
-    70165,
-    29750,
-    23977,
-    124504,
-    91425,
-    79610,
-    159851,
-    47242,
-    130680,
-    158561,
-    51002,
-    25900,
-    130685,
-    59409,
-    18869,
-    133190,
-    104990,
-    104227,
-    61650,
-    85717,
-    2200,
-    152039,
-    109038,
-    50001,
-    33661,
-    26359,
-    158232,
-    53692,
-    105240,
-    84830,
-    169213,
-    47130,
-    141497,
-    7929,
-    141067,
-    168283,
-    114381,
-    157041,
-    142989,
-    101638,
-    90402,
-    131814,
-    161555,
-    119258,
-    137573,
-    121589,
-    104739,
-    115221,
-    58730,
-    45075,
-    71098,
-    53938,
-    153100,
-    145736,
-    43825,
-    26669,
-    9057,
-    134820,
-    82797,
-    64437,
-    137086,
-    84678,
-    79310,
-    163063,
-    168315,
-    21916,
-    84733,
-    26203,
-    126401,
-    75092,
-    27998,
-    143869,
-    135975,
-    102107,
-    50097,
-    155505,
-    51016,
-    16325,
-    120863,
-    24690,
-    112515,
-    54231,
-    135773,
-    63842,
-    106996,
-    144399,
-    170198,
-    70476,
-    144758,
-    56476,
-    151631,
-    75773,
-    73613,
-    32610,
-    101295,
-    10546,
-    78135,
-    131918,
-    6180,
-    81063,
-    85671,
-    62029,
-    37925,
-    44820,
-    43580,
-    120914,
-    57742,
-    116154,
-    78785,
-    115116,
-    161474,
-    52083,
-    46797,
-    47766,
-    99721,
-    51169,
-    86476,
-    39439,
-    127092,
-    1284,
-    36675,
-    82466,
-    59170,
-    69259,
-    132979,
-    178636,
-    146285,
-    112202,
-    105886,
-    165430,
-    173780,
-    155827,
-    51094,
-    168147,
-    37952,
-    83374,
-    152003,
-    39341,
-    171315,
-    52882,
-    149541,
-    146796,
-    82840,
-    162573,
-    164423,
-    66294,
-    162859,
-    134641,
-    91183,
-    24420,
-    178779,
-    165509,
-    152630,
-    146413,
-    163614,
-    68897,
-    165778,
-    2186,
-    46126,
-    147406,
-    74268,
-    80112,
-    105516,
-    154773,
-    111205,
-    27093,
-    278,
-    24683,
-    55473,
-    169079,
-    55728,
-    162979,
-    72299,
-    118964,
-    69774,
-    166476,
-    51849,
-    172163,
-    100791,
-    16514,
-    43610,
-    80712,
-    147787,
-    34847,
-    141703,
-    107595,
-    154873,
-    164886,
-    145816,
-    11758,
-    179008,
-    93111,
-    116511,
-    147840,
-    41066,
-    86431,
-    82537,
-    8880,
-    27956,
-    73979,
-    126964,
-    158836,
-    87881,
-    110412,
-    104047,
-    62329,
-    6391,
-    142896,
-    33011,
-    76037,
-    173803,
-    80492,
-    8995,
-    120348,
-    146265,
-    138201,
-    73153,
-    27348,
-    31690,
-    152202,
-    173404,
-    65335,
-    112624,
-    79302,
-    112686,
-    53669,
-    109956,
-    166890,
-    28466,
-    166851,
-    168308,
-    133707,
-    139178,
-    82501,
-    163994,
-    71783,
-    100438,
-    171532,
-    145987,
-    176318,
-    103133,
-    146233,
-    146459,
-    170305,
-    156245,
-    18607,
-    104032,
-    97578,
-    50632,
-    138195,
-    127696,
-    159571,
-    125610,
-    94473,
-    63837,
-    4265,
-    39544,
-    154718,
-    55157,
-    90330,
-    14176,
-    57656,
-    22761,
-    45193,
-    34331,
-    67193,
-    140396,
-    167961,
-    57850,
-    141189,
-    147608,
-    91447,
-    163435,
-    72896,
-    175420,
-    133513,
-    47904,
-    6250,
-    39167,
-    96170,
-    55681,
-    105994,
-    70139,
-    100827,
-    51278,
-    148391,
-    102093,
-    68277,
-    149596,
-    116567,
-    148935,
-    126757,
-    170592,
-    54859,
-    67901,
-    12257,
-    170577,
-    150773,
-    32834,
-    172098,
-    161268,
-    75894,
-    57542,
-    57319,
-    66861,
-    40212,
-    31338,
-    99645,
-    171069,
-    148567,
-    135156,
-    104933,
-    27555,
-    34896,
-    91217,
-    128176,
-    115491,
-    113748,
-    74297,
-    130217,
-    122364,
-    54341,
-    105176,
-    76475,
-    67080,
-    43455,
-    100399,
-    174504,
-    167049,
-    179718,
-    79860,
-    175395,
-    40684,
-    57182,
-    18072,
-    68271,
-    47067,
-    165342,
-    172794,
-    146418,
-    75405,
-    36457,
-    85535,
-    30187,
-    179791,
-    49535,
-    31769,
-    129176,
-    94186,
-    176446,
-    52334,
-    66239,
-    142502,
-    150099,
-    155700,
-    35984,
-    106497,
-    72473,
-    20355,
-    135478,
-    54814,
-    84129,
-    98695,
-    97559,
-    172836,
-    80798,
-    89136,
-    146775,
-    157773,
-    61465,
-    49405,
-    74765,
-    84639,
-    164635,
-    27087,
-    64953,
-    52644,
-    135838,
-    151266,
-    47981,
-    95403,
-    119335,
-    101904,
-    137565,
-    126885,
-    151223,
-    21982,
-    150776,
-    65222,
-    87859,
-    46426,
-    7715,
-    25703,
-    132358,
-    28126,
-    73813,
-    94207,
-    17149,
-    29503,
-    76002,
-    170778,
-    57195,
-    141252,
-    119734,
-    176870,
-    143812,
-    14771,
-    17768,
-    43296,
-    79175,
-    117592,
-    7217,
-    14643,
-    93967,
-    47649,
-    79249,
-    160295,
-    32978,
-    22922,
-    90514,
-    2425,
-    37494,
-    154450,
-    103190,
-    172518,
-    158269,
-    65073,
-    5974,
-    91660,
-    22471,
-    13123,
-    77673,
-    155878,
-    79225,
-    17799,
-    113658,
-    28168,
-    49576,
-    149406,
-    67869,
-    31621,
-    175471,
-    133263,
-    130947,
-    51787,
-    115538,
-    166992,
-    24498,
-    24454,
-    50284,
-    106504,
-    89439,
-    78790,
-    85570,
-    14961,
-    128786,
-    3897,
-    103984,
-    133298,
-    108,
-    66614,
-    100372,
-    49578,
-    95294,
-    159412,
-    97433,
-    15572,
-    44975,
-    58177,
-    11026,
-    86435,
-    90971,
-    119809,
-    101473,
-    4741,
-    104204,
-    34284,
-    145242,
-    54185,
-    163310,
-    56962,
-    169171,
-    97655,
-    154265,
-    1810,
-    119010,
-    119971,
-    141173,
-    105262,
-    25434,
-    76091,
-    156803,
-    65593,
-    37285,
-    77031,
-    163824,
-    11737,
-    146831,
-    107302,
-    84334,
-    116790,
-    66639,
-    23350,
-    166835,
-    171800,
-    90271,
-    118312,
-    158532,
-    47482,
-    11449,
-    149468,
-    144014,
-    47429,
-    88030,
-    70784,
-    123817,
-    118857,
-    92712,
-    75050,
-    69671,
-    111797,
-    170646,
-    61094,
-    92289,
-    119778,
-    89605,
-    80100,
-    30948,
-    18396,
-    45128,
-    54233,
-    94384,
-    81338,
-    119946,
-    157501,
-    52387,
-    159951,
-    63117,
-    68169,
-    123029,
-    32529,
-    92574,
-    172705,
-    148352,
-    39823,
-    92544,
-    107751,
-    137806,
-    120232,
-    22318,
-    7547,
-    87598,
-    905,
-    4492,
-    95949,
-    15450,
-    137646,
-    42076,
-    31036,
-    105772,
-    18858,
-    134637,
-    137448,
-    52135,
-    43646,
-    174988,
-    58262,
-    1840,
-    29438,
-    161158,
-    35830,
-    92005,
-    35236,
-    95857,
-    155875,
-    133170,
-    142695,
-    176551,
-    127836,
-    87909,
-    74762,
-    130628,
-    35747,
-    95336,
-    38166,
-    25019,
-    108531,
-    82196,
-    56501,
-    95661,
-    113530,
-    51577,
-    75002,
-    19186,
-    23824,
-    147819,
-    88452,
-    26473,
-    157238,
-    49081,
-    45035,
-    176939,
-    60957,
-    139541,
-    172500,
-    37688,
-    165316,
-    129331,
-    117515,
-    144190,
-    24165,
-    73987,
-    84421,
-    102344,
-    80575,
-    154425,
-    63515,
-    124981,
-    149858,
-    145260,
-    140574,
-    139403,
-    115757,
-    48840,
-    154004,
-    32046,
-    102688,
-    23314,
-    158480,
-    164778,
-    111730,
-    148309,
-    69491,
-    129299,
-    111839,
-    103771,
-    157703,
-    155631,
-    150720,
-    123525,
-    62839,
-    12090,
-    39987,
-    150613,
-    101360,
-    92361,
-    137991,
-    117604,
-    148144,
-    128753,
-    84139,
-    130639,
-    79954,
-    40486,
-    67861,
-    158962,
-    117098,
-    89466,
-    92258,
-    105596,
-    54093,
-    108023,
-    29990,
-    74846,
-    66173,
-    38505,
-    49329,
-    130296,
-    29515,
-    132913,
-    62122,
-    146913,
-    16616,
-    79193,
-    106784,
-    104561,
-    54585,
-    127195,
-    176522,
-    142071,
-    92453,
-    125504,
-    157454,
-    15097,
-    127963,
-    163942,
-    20785,
-    162264,
-    28864,
-    58995,
-    97752,
-    127768,
-    21072,
-    63562,
-    161519,
-    146974,
-    69740,
-    147312,
-    168774,
-    2315,
-    12866,
-    112793,
-    133691,
-    121391,
-    21597,
-    171681,
-    89732,
-    22887,
-    165162,
-    148416,
-    71826,
-    10377,
-    70383,
-    57031,
-    172543,
-    76509,
-    149422,
-    160508,
-    163731,
-    102628,
-    90261,
-    135648,
-    23537,
-    10294,
-    144924,
-    170264,
-    115349,
-    49281,
-    117953,
-    26577,
-    34488,
-    10044,
-    99191,
-    31676,
-    109919,
-    11080,
-    32762,
-    125761,
-    159105,
-    38050,
-    36944,
-    6231,
-    35269,
-    167448,
-    113967,
-    42724,
-    159808,
-    121439,
-    132462,
-    32708,
-    4515,
-    168063,
-    32507,
-    56629,
-    130067,
-    51062,
-    165945,
-    29699,
-    99162,
-    83373,
-    96526,
-    66659,
-    133564,
-    150778,
-    57093,
-    97596,
-    171241,
-    65127,
-    156850,
-    2212,
-    81349,
-    30262,
-    173882,
-    91361,
-    137668,
-    151263,
-    170622,
-    82812,
-    107045,
-    143732,
-    43411,
-    131252,
-    168673,
-    76165,
-    106002,
-    27658,
-    81607,
-    71423,
-    81642,
-    63793,
-    102954,
-    175180,
-    117366,
-    162680,
-    154234,
-    13922,
-    174539,
-    89916,
-    30902,
-    45394,
-    75472,
-    113780,
-    128115,
-    112279,
-    68573,
-    51283,
-    26658,
-    115332,
-    74917,
-    121508,
-    26757,
-    75337,
-    102204,
-    96152,
-    103238,
-    26629,
-    19240,
-    64664,
-    169602,
-    98586,
-    94037,
-    89999,
-    19141,
-    160161,
-    53174,
-    71219,
-    134894,
-    75358,
-    176794,
-    19574,
-    26754,
-    28076,
-    38647,
-    9367,
-    130032,
-    112023,
-    102310,
-    14704,
-    101585,
-    160665,
-    85786,
-    38825,
-    68425,
-    38852,
-    83119,
-    160534,
-    6506,
-    134597,
-    132711,
-    19127,
-    52869,
-    37514,
-    5113,
-    56708,
-    60340,
-    13782,
-    103160,
-    114029,
-    22483,
-    176322,
-    143491,
-    154705,
-    58261,
-    168395,
-    171834,
-    28034,
-    99443,
-    109372,
-    92698,
-    165627,
-    144653,
-    69348,
-    98780,
-    116551,
-    26550,
-    137786,
-    118545,
-    58693,
-    164873,
-    75594,
-    85088,
-    61069,
-    140281,
-    73512,
-    93534,
-    32917,
-    118561,
-    35703,
-    153025,
-    9351,
-    21765,
-    85032,
-    53185,
-    49397,
-    154135,
-    124702,
-    94073,
-    148458,
-    82162,
-    160863,
-    9278,
-    78110,
-    134440,
-    96037,
-    36925,
-    130002,
-    99703,
-    116175,
-    23974,
-    86168,
-    110422,
-    47484,
-    71530,
-    141782,
-    10984,
-    108524,
-    74058,
-    52258,
-    53926,
-    168070,
-    143969,
-    59752,
-    172709,
-    118111,
-    47876,
-    140643,
-    173628,
-    110806,
-    107911,
-    128984,
-    39727,
-    92924,
-    132295,
-    29458,
-    82973,
-    172071,
-    53108,
-    174050,
-    15743,
-    8945,
-    92559,
-    177910,
-    131501,
-    106526,
-    168134,
-    19509,
-    148276,
-    102359,
-    93584,
-    32962,
-    172976,
-    124211,
-    90752,
-    110094,
-    64545,
-    137174,
-    107077,
-    880,
-    23315,
-    70552,
-    22754,
-    129139,
-    32189,
-    142840,
-    133042,
-    177748,
-    118009,
-    103454,
-    90457,
-    60788,
-    28404,
-    141730,
-    67441,
-    167264,
-    50689,
-    170358,
-    30699,
-    22217,
-    143138,
-    167822,
-    120365,
-    140581,
-    131427,
-    100219,
-    35721,
-    94466,
-    137860,
-    100760,
-    115612,
-    43511,
-    5926,
-    86007,
-    51210,
-    10550,
-    144628,
-    79184,
-    103927,
-    47263,
-    30282,
-    129197,
-    111953,
-    109,
-    107500,
-    161416,
-    42471,
-    111804,
-    39672,
-    7226,
-    82772,
-    149950,
-    73852,
-    741,
-    175941,
-    114848,
-    129501,
-    89112,
-    96224,
-    123275,
-    63092,
-    153446,
-    171062,
-    45918,
-    116060,
-    165080,
-    22680,
-    62038,
-    17386,
-    544,
-    85467,
-    76339,
-    114750,
-    141517,
-    143654,
-    44468,
-    137172,
-    177857,
-    55297,
-    157058,
-    27088,
-    101898,
-    91988,
-    62171,
-    51957,
-    10980,
-    138528,
-    58904,
-    88126,
-    167344,
-    75652,
-    122305,
-    167578,
-    157875,
-    86485,
-    88937,
-    151373,
-    173172,
-    142895,
-    55348,
-    93804,
-    113223,
-    97838,
-    136091,
-    162461,
-    49309,
-    80697,
-    152615,
-    140359,
-    147077,
-    139936,
-    62687,
-    18906,
-    120220,
-    179011,
-    34729,
-    126984,
-    101138,
-    124497,
-    84561,
-    177169,
-    47966,
-    41710,
-    89457,
-    66284,
-    84489,
-    26735,
-    172775,
-    50289,
-    157106,
-    68398,
-    120608,
-    126521,
-    141358,
-    160215,
-    129465,
-    69537,
-    37870,
-    95601,
-    8241,
-    14766,
-    82893,
-    166337,
-    159117,
-    136143,
-    85805,
-    77408,
-    103587,
-    99426,
-    115150,
-    36057,
-    141680,
-    134971,
-    79549,
-    11284,
-    162678,
-    159424,
-    36650,
-    95304,
-    28978,
-    73001,
-    98996,
-    107336,
-    31042,
-    38885,
-    67675,
-    165659,
-    143715,
-    56972,
-    108749,
-    43918,
-    83618,
-    54856,
-    15844,
-    105861,
-    99452,
-    76161,
-    72345,
-    68313,
-    33693,
-    140071,
-    27445,
-    76661,
-    110237,
-    79945,
-    176459,
-    50240,
-    117332,
-    15349,
-    108347,
-    59217,
-    10894,
-    33220,
-    1349,
-    140455,
-    5748,
-    13315,
-    8435,
-    28653,
-    89824,
-    155935,
-    124880,
-    31886,
-    72963,
-    52099,
-    88136,
-    47304,
-    7756,
-    2091,
-    62018,
-    41099,
-    17643,
-    19458,
-    92985,
-    33289,
-    72751,
-    78478,
-    150931,
-    166842,
-    36178,
-    38978,
-    152369,
-    86267,
-    179264,
-    3287,
-    48313,
-    168470,
-    126692,
-    28159,
-    5575,
-    134138,
-    76115,
-    172341,
-    138420,
-    94169,
-    179142,
-    91968,
-    69834,
-    10978,
-    8205,
-    94870,
-    26704,
-    5464,
-    122616,
-    23543,
-    168340,
-    120745,
-    167313,
-    122288,
-    155610,
-    172124,
-    35606,
-    146759,
-    15537,
-    99336,
-    108170,
-    60129,
-    100622,
-    133050,
-    143245,
-    110600,
-    8672,
-    54755,
-    126985,
-    34433,
-    1960,
-    25496,
-    155453,
-    15539,
-    34036,
-    93465,
-    136704,
-    85813,
-    79074,
-    167041,
-    116270,
-    136580,
-    105350,
-    11461,
-    99498,
-    106146,
-    61925,
-    109300,
-    106045,
-    123077,
-    80007,
-    169462,
-    63977,
-    101691,
-    159850,
-    68316,
-    153668,
-    23246,
-    74511,
-    21664,
-    143804,
-    88905,
-    164574,
-    1873,
-    156449,
-    36741,
-    54366,
-    70116,
-    86822,
-    86438,
-    111166,
-    37187,
-    33442,
-    170807,
-    172915,
-    144997,
-    31887,
-    54593,
-    90244,
-    140536,
-    36773,
-    65069,
-    116926,
-    110185,
-    88818,
-    22771,
-    156166,
-    69840,
-    68855,
-    110518,
-    39960,
-    169548,
-    36897,
-    92654,
-    154303,
-    101736,
-    160454,
-    31517,
-    708,
-    66804,
-    35649,
-    4104,
-    88608,
-    30661,
-    154832,
-    162965,
-    39929,
-    110182,
-    108178,
-    19128,
-    154022,
-    123063,
-    128415,
-    34200,
-    139705,
-    88639,
-    140835,
-    140214,
-    48607,
-    10859,
-    177682,
-    37237,
-    137343,
-    27759,
-    162903,
-    99414,
-    176490,
-    126578,
-    45508,
-    2811,
-    44393,
-    125623,
-    97943,
-    41159,
-    116430,
-    91644,
-    87639,
-    92,
-    138465,
-    2111,
-    44272,
-    168973,
-    118712,
-    118317,
-    52424,
-    98892,
-    160634,
-    69334,
-    96380,
-    73735,
-    138696,
-    67119,
-    144396,
-    45554,
-    84302,
-    151503,
-    64826,
-    12024,
-    151089,
-    105674,
-    76452,
-    125028,
-    179881,
-    81857,
-    14510,
-    80208,
-    85159,
-    12731,
-    133207,
-    140086,
-    1173,
-    161836,
-    43516,
-    72386,
-    46774,
-    34154,
-    126316,
-    33408,
-    129965,
-    171682,
-    111197,
-    34975,
-    102778,
-    165920,
-    176826,
-    96113,
-    56497,
-    26876,
-    174344,
-    14270,
-    54840,
-    135188,
-    62409,
-    57674,
-    1446,
-    80393,
-    75698,
-    86860,
-    94103,
-    84286,
-    152188,
-    19901,
-    126471,
-    43529,
-    93696,
-    59935,
-    3248,
-    43546,
-    54730,
-    45568,
-    112621,
-    121012,
-    85158,
-    78933,
-    58221,
-    45194,
-    89480,
-    127828,
-    61500,
-    116444,
-    80541,
-    99015,
-    153528,
-    75146,
-    25527,
-    78730,
-    30631,
-    78867,
-    442,
-    7978,
-    94844,
-    4128,
-    10881,
-    1176,
-    18905,
-    27637,
-    42509,
-    60533,
-    1502,
-    73888,
-    156285,
-    72718,
-    131211,
-    23021,
-    24283,
-    3014,
-    127793,
-    11010,
-    44256,
-    86429,
-    90191,
-    1951,
-    113449,
-    74486,
-    140691,
-    130848,
-    175418,
-    163477,
-    142544,
-    140654,
-    85010,
-    179620,
-    129419,
-    49099,
-    45733,
-    179290,
-    136847,
-    27930,
-    126286,
-    122256,
-    21582,
-    134548,
-    54974,
-    154722,
-    128336,
-    129371,
-    47023,
-    32422,
-    66318,
-    17865,
-    161329,
-    71953,
-    24207,
-    71919,
-    121028,
-    49037,
-    112598,
-    91706,
-    104382,
-    140917,
-    89426,
-    148966,
-    23143,
-    103091,
-    106335,
-    118689,
-    1326,
-    56826,
-    128460,
-    153273,
-    26626,
-    40261,
-    161605,
-    80547,
-    166265,
-    153259,
-    69805,
-    141457,
-    22651,
-    156805,
-    50452,
-    16182,
-    104373,
-    1910,
-    41056,
-    126867,
-    113399,
-    78898,
-    26785,
-    62994,
-    13842,
-    13358,
-    30722,
-    158548,
-    86997,
-    84680,
-    119539,
-    88580,
-    136644,
-    43178,
-    109605,
-    50205,
-    161061,
-    106118,
-    34923,
-    488,
-    73575,
-    100704,
-    159817,
-    78581,
-    77883,
-    15007,
-    157861,
-    12678,
-    168363,
-    71627,
-    21586,
-    178324,
-    41832,
-    172263,
-    40950,
-    133434,
-    164613,
-    78809,
-    30232,
-    150270,
-    125828,
-    6130,
-    9568,
-    161596,
-    2649,
-    50102,
-    120269,
-    86003,
-    43343,
-    146171,
-    81324,
-    65462,
-    73407,
-    10210,
-    89845,
-    68558,
-    24559,
-    91570,
-    80333,
-    80015,
-    91427,
-    109943,
-    12768,
-    176910,
-    118282,
-    73610,
-    62682,
-    174560,
-    173956,
-    31724,
-    89351,
-    95810,
-    165141,
-    66884,
-    48569,
-    136329,
-    88214,
-    11919,
-    142572,
-    61555,
-    59954,
-    112391,
-    2865,
-    135411,
-    151909,
-    84860,
-    179866,
-    177513,
-    48003,
-    176512,
-    117416,
-    96821,
-    26237,
-    41314,
-    128943,
-    22061,
-    79977,
-    69983,
-    111454,
-    105466,
-    91520,
-    96632,
-    157651,
-    174549,
-    3465,
-    160934,
-    22751,
-    95211,
-    97688,
-    122265,
-    166752,
-    117427,
-    168184,
-    87559,
-    11535,
-    175299,
-    119197,
-    28027,
-    70950,
-    137495,
-    95681,
-    155191,
-    116878,
-    41082,
-    121576,
-    63950,
-    89636,
-    55316,
-    116993,
-    122122,
-    84734,
-    108731,
-    29982,
-    56981,
-    174064,
-    41545,
-    157835,
-    135236,
-    51515,
-    66209,
-    122621,
-    78144,
-    44526,
-    79189,
-    108617,
-    148288,
-    177445,
-    40304,
-    159717,
-    85831,
-    9338,
-    162695,
-    175223,
-    145769,
-    165775,
-    142390,
-    161016,
-    50506,
-    63548,
-    5652,
-    81233,
-    85108,
-    156957,
-    106403,
-    106899,
-    58341,
-    24807,
-    100266,
-    112294,
-    33506,
-    99358,
-    141236,
-    160776,
-    106987,
-    1815,
-    112677,
-    5459,
-    11380,
-    115949,
-    111553,
-    50881,
-    31369,
-    73317,
-    19284,
-    129551,
-    122693,
-    144495,
-    143900,
-    1895,
-    56772,
-    24828,
-    39590,
-    160605,
-    67920,
-    111876,
-    19815,
-    8619,
-    136707,
-    143013,
-    12795,
-    47957,
-    145037,
-    143493,
-    70253,
-    48501,
-    55154,
-    150208,
-    145955,
-    50358,
-    107002,
-    31168,
-    30967,
-    152021,
-    91248,
-    131413,
-    70944,
-    176279,
-    20986,
-    59524,
-    13037,
-    39287,
-    171642,
-    4929,
-    52782,
-    69025,
-    50323,
-    5507,
-    138109,
-    20902,
-    17930,
-    82402,
-    63625,
-    165016,
-    36206,
-    121311,
-    13327,
-    119099,
-    91137,
-    35057,
-    178486,
-    63886,
-    12303,
-    172889,
-    152219,
-    32431,
-    153082,
-    110889,
-    163432,
-    103801,
-    112792,
-    128228,
-    29841,
-    90505,
-    99852,
-    28417,
-    86161,
-    30347,
-    8641,
-    49143,
-    40084,
-    124526,
-    9945,
-    125584,
-    39151,
-    32423,
-    17876,
-    60463,
-    114942,
-    11504,
-    133995,
-    160768,
-    5419,
-    143562,
-    177192,
-    13688,
-    20401,
-    14105,
-    97848,
-    133699,
-    179752,
-    32608,
-    77193,
-    154939,
-    52899,
-    153674,
-    171433,
-    149430,
-    54381,
-    105827,
-    45499,
-    52312,
-    132113,
-    47446,
-    147838,
-    96610,
-    66827,
-    145080,
-    146527,
-    142535,
-    95890,
-    5795,
-    156987,
-    161034,
-    42611,
-    129005,
-    74829,
-    93345,
-    114838,
-    51733,
-    166997,
-    67773,
-    144928,
-    61570,
-    43269,
-    90681,
-    167754,
-    106096,
-    140297,
-    52156,
-    168126,
-    124110,
-    67285,
-    153159,
-    153318,
-    139181,
-    81172,
-    58575,
-    11583,
-    108127,
-    60639,
-    152662,
-    178386,
-    54135,
-    141713,
-    131797,
-    46420,
-    37223,
-    139420,
-    91566,
-    98437,
-    13073,
-    121243,
-    42978,
-    115234,
-    113704,
-    93089,
-    49622,
-    32889,
-    75908,
-    151139,
-    128050,
-    111651,
-    129413,
-    34837,
-    93626,
-    32502,
-    52785,
-    85574,
-    57543,
-    40660,
-    168405,
-    14786,
-    31678,
-    91355,
-    65332,
-    133567,
-    36670,
-    8250,
-    155374,
-    65444,
-    58411,
-    37933,
-    78639,
-    51385,
-    111993,
-    114061,
-    126608,
-    31316,
-    110243,
-    161960,
-    112136,
-    160896,
-    97026,
-    123426,
-    68468,
-    173217,
-    89073,
-    16090,
-    31238,
-    3738,
-    59553,
-    30999,
-    122532,
-    8028,
-    71006,
-    150693,
-    39290,
-    5163,
-    108664,
-    174151,
-    12298,
-    153275,
-    155753,
-    82316,
-    99607,
-    169431,
-    57409,
-    140526,
-    160264,
-    43204,
-    20060,
-    107155,
-    74909,
-    149299,
-    85268,
-    77545,
-    103035,
-    11533,
-    7070,
-    39863,
-    127637,
-    87011,
-    84842,
-    31209,
-    104177,
-    176061,
-    106363,
-    164708,
-    137511,
-    167164,
-    112041,
-    66615,
-    96216,
-    40152,
-    48699,
-    174652,
-    179705,
-    24403,
-    11252,
-    156795,
-    83627,
-    50011,
-    177107,
-    42266,
-    48958,
-    151241,
-    88637,
-    101652,
-    56416,
-    17784,
-    46807,
-    49863,
-    168323,
-    113287,
-    97570,
-    69934,
-    171091,
-    39580,
-    72004,
-    137117,
-    55412,
-    39275,
-    118443,
-    8397,
-    100267,
-    129292,
-    62984,
-    18345,
-    155025,
-    46178,
-    176420,
-    157051,
-    82654,
-    137294,
-    118725,
-    18066,
-    173431,
-    139762,
-    9088,
-    124418,
-    135128,
-    58615,
-    171171,
-    73018,
-    50752,
-    142172,
-    365,
-    125140,
-    110338,
-    107634,
-    67481,
-    116892,
-    157288,
-    58412,
-    119407,
-    16426,
-    83307,
-    7483,
-    113705,
-    9361,
-    11074,
-    105453,
-    176596,
-    151283,
-    82177,
-    128888,
-    109696,
-    48340,
-    37451,
-    103172,
-    114596,
-    115459,
-    142253,
-    170351,
-    39014,
-    81335,
-    56628,
-    103737,
-    161119,
-    64632,
-    78794,
-    49821,
-    177882,
-    8970,
-    91169,
-    55658,
-    35025,
-    19165,
-    126392,
-    125791,
-    171249,
-    170967,
-    121446,
-    72328,
-    135771,
-    127629,
-    22033,
-    148029,
-    75953,
-    61556,
-    34427,
-    157890,
-    162086,
-    47052,
-    129449,
-    64037,
-    117737,
-    74558,
-    151690,
-    136935,
-    145341,
-    8096,
-    160002,
-    83039,
-    125625,
-    84567,
-    7049,
-    83742,
-    90861,
-    146844,
-    30735,
-    2376,
-    88558,
-    43742,
-    15667,
-    77890,
-    58797,
-    139644,
-    55423,
-    103551,
-    42049,
-    130930,
-    10925,
-    80487,
-    136196,
-    179470,
-    150770,
-    112948,
-    53226,
-    103750,
-    47195,
-    160311,
-    66456,
-    71440,
-    175967,
-    95488,
-    177197,
-    66841,
-    69238,
-    137363,
-    11266,
-    140794,
-    39388,
-    72897,
-    4388,
-    156774,
-    15985,
-    44038,
-    57375,
-    131502,
-    114628,
-    66094,
-    171484,
-    23809,
-    7818,
-    111324,
-    2546,
-    35603,
-    153336,
-    134010,
-    70971,
-    160463,
-    129168,
-    135315,
-    128051,
-    66885,
-    69144,
-    158859,
-    144681,
-    177547,
-    66906,
-    154497,
-    130081,
-    103304,
-    45450,
-    171614,
-    75608,
-    2417,
-    39951,
-    53263,
-    4742,
-    116498,
-    61965,
-    140266,
-    10312,
-    151330,
-    60505,
-    100635,
-    145043,
-    84273,
-    42683,
-    54409,
-    40735,
-    156224,
-    23040,
-    63432,
-    69218,
-    120700,
-    124280,
-    67304,
-    80489,
-    162173,
-    109804,
-    61290,
-    106990,
-    153107,
-    71441,
-    152968,
-    49180,
-    6767,
-    61017,
-    76807,
-    9517,
-    14843,
-    122382,
-    112969,
-    43049,
-    52972,
-    165872,
-    19142,
-    121568,
-    140857,
-    136190,
-    167617,
-    41146,
-    91449,
-    108232,
-    36400,
-    46725,
-    535,
-    4947,
-    128604,
-    90974,
-    35265,
-    52983,
-    154205,
-    58377,
-    34976,
-    57929,
-    126288,
-    63799,
-    17539,
-    160968,
-    28227,
-    22801,
-    34412,
-    101699,
-    53360,
-    7725,
-    178761,
-    25783,
-    119131,
-    77443,
-    39216,
-    126813,
-    156283,
-    108452,
-    123581,
-    26545,
-    2363,
-    59966,
-    165842,
-    84880,
-    48969,
-    37091,
-    174165,
-    92842,
-    172920,
-    38549,
-    162664,
-    86410,
-    112069,
-    77522,
-    147799,
-    162080,
-    119064,
-    2097,
-    138220,
-    164931,
-    170924,
-    4906,
-    116112,
-    55953,
-    129590,
-    120302,
-    153257,
-    50852,
-    295,
-    50188,
-    18285,
-    38203,
-    139630,
-    160562,
-    50131,
-    70925,
-    130676,
-    54161,
-    16400,
-    125079,
-    148311,
-    88643,
-    17814,
-    143668,
-    47667,
-    116563,
-    124545,
-    124753,
-    161531,
-    46907,
-    56937,
-    148464,
-    29752,
-    8215,
-    3185,
-    96656,
-    92877,
-    127994,
-    127256,
-    37110,
-    33490,
-    2335,
-    77767,
-    150382,
-    162114,
-    8214,
-    109006,
-    65307,
-    153360,
-    88723,
-    105988,
-    67228,
-    45492,
-    133499,
-    116949,
-    57627,
-    177694,
-    59202,
-    88727,
-    137018,
-    17115,
-    120042,
-    155850,
-    24338,
-    141741,
-    142782,
-    34238,
-    78724,
-    173481,
-    32965,
-    108445,
-    121593,
-    104270,
-    41749,
-    103189,
-    98187,
-    56706,
-    61495,
-    40253,
-    66738,
-    175620,
-    116873,
-    17995,
-    46533,
-    174758,
-    135732,
-    128666,
-    61066,
-    155535,
-    74666,
-    107174,
-    125148,
-    14923,
-    31115,
-    142687,
-    153281,
-    75587,
-    116287,
-    113718,
-    112263,
-    135223,
-    29002,
-    55761,
-    12590,
-    102931,
-    161002,
-    154485,
-    9229,
-    138324,
-    34344,
-    160584,
-    7880,
-    44652,
-    2826,
-    88584,
-    157983,
-    160751,
-    79811,
-    32747,
-    151905,
-    153040,
-    7013,
-    58898,
-    17089,
-    119709,
-    117063,
-    12909,
-    100548,
-    21649,
-    44079,
-    94861,
-    133245,
-    81745,
-    88105,
-    49919,
-    55827,
-    8046,
-    20145,
-    174762,
-    107115,
-    48594,
-    167057,
-    174934,
-    104622,
-    85616,
-    89455,
-    64971,
-    54655,
-    172305,
-    77392,
-    152109,
-    82059,
-    128900,
-    30592,
-    64586,
-    173947,
-    165002,
-    6077,
-    27741,
-    97510,
-    22533,
-    102164,
-    55751,
-    80936,
-    143298,
-    29690,
-    97605,
-    173069,
-    146589,
-    106689,
-    138290,
-    83741,
-    125722,
-    52249,
-    30834,
-    91280,
-    122890,
-    64251,
-    19354,
-    23295,
-    154019,
-    9929,
-    52043,
-    117630,
-    41692,
-    75960,
-    110266,
-    41537,
-    176159,
-    90920,
-    164729,
-    146435,
-    152675,
-    145274,
-    158935,
-    76348,
-    118800,
-    86933,
-    135346,
-    149414,
-    6209,
-    149974,
-    59819,
-    107328,
-    89685,
-    50718,
-    82301,
-    154416,
-    90617,
-    72646,
-    91642,
-    19580,
-    130624,
-    2348,
-    67333,
-    87319,
-    25127,
-    103873,
-    167569,
-    99702,
-    99868,
-    114204,
-    22426,
-    74471,
-    14806,
-    43647,
-    51260,
-    164337,
-    33898,
-    106569,
-    108124,
-    135234,
-    6899,
-    138060,
-    146648,
-    43033,
-    51760,
-    103449,
-    117722,
-    91539,
-    87169,
-    141225,
-    49646,
-    149774,
-    48722,
-    67678,
-    19836,
-    175955,
-    82718,
-    7621,
-    105882,
-    14427,
-    22863,
-    28429,
-    25964,
-    128916,
-    21221,
-    68586,
-    2258,
-    130455,
-    141910,
-    165068,
-    10867,
-    64192,
-    173456,
-    122109,
-    157737,
-    59745,
-    63979,
-    2904,
-    63171,
-    974,
-    28995,
-    106069,
-    29417,
-    18582,
-    58607,
-    174952,
-    8655,
-    132740,
-    60725,
-    478,
-    135348,
-    131048,
-    170333,
-    173049,
-    147048,
-    130214,
-    87452,
-    33475,
-    70303,
-    35307,
-    18122,
-    138427,
-    52478,
-    130327,
-    173831,
-    136534,
-    103450,
-    151515,
-    179085,
-    142835,
-    148734,
-    118790,
-    17866,
-    23563,
-    42391,
-    53980,
-    59669,
-    97030,
-    178365,
-    47721,
-    124712,
-    32079,
-    19089,
-    123255,
-    164298,
-    123813,
-    140065,
-    38773,
-    37601,
-    118661,
-    69220,
-    24948,
-    6554,
-    107037,
-    110447,
-    136419,
-    41365,
-    167572,
-    84174,
-    156368,
-    152780,
-    119886,
-    146882,
-    168742,
-    1219,
-    81513,
-    49762,
-    171136,
-    176208,
-    53717,
-    119205,
-    136775,
-    144278,
-    128748,
-    45799,
-    10501,
-    15263,
-    143632,
-    7354,
-    160382,
-    41521,
-    116311,
-    69386,
-    57496,
-    44167,
-    136136,
-    133372,
-    31652,
-    78519,
-    968,
-    63792,
-    88222,
-    42556,
-    58460,
-    113907,
-    146736,
-    150743,
-    120508,
-    143726,
-    83897,
-    113317,
-    100833,
-    29528,
-    58179,
-    106831,
-    43492,
-    56611,
-    120273,
-    67256,
-    60469,
-    152193,
-    72492,
-    102407,
-    143216,
-    44655,
-    12346,
-    177697,
-    20203,
-    59375,
-    60056,
-    77536,
-    107352,
-    124287,
-    106480,
-    121394,
-    143293,
-    86948,
-    132093,
-    59589,
-    48627,
-    22204,
-    68583,
-    41996,
-    148308,
-    139756,
-    173790,
-    63370,
-    18337,
-    168478,
-    19795,
-    142865,
-    44496,
-    176030,
-    77100,
-    3942,
-    78703,
-    163513,
-    78548,
-    53323,
-    164108,
-    31362,
-    92056,
-    2971,
-    169165,
-    146307,
-    34703,
-    147088,
-    162423,
-    17112,
-    157476,
-    38439,
-    71590,
-    24036,
-    44328,
-    48546,
-    104802,
-    33753,
-    169545,
-    80500,
-    102879,
-    24742,
-    159196,
-    154514,
-    7445,
-    990,
-    50089,
-    71406,
-    78558,
-    50310,
-    45249,
-    23250,
-    9246,
-    140131,
-    166178,
-    93065,
-    34695,
-    40010,
-    138674,
-    13567,
-    22582,
-    40990,
-    76203,
-    57144,
-    147062,
-    72657,
-    89068,
-    59729,
-    50030,
-    88776,
-    76084,
-    16676,
-    114309,
-    145156,
-    29441,
-    18764,
-    138788,
-    68930,
-    139296,
-    175512,
-    49489,
-    71549,
-    38384,
-    84966,
-    175542,
-    13209,
-    78555,
-    68736,
-    140694,
-    10430,
-    150668,
-    174526,
-    81901,
-    21507,
-    132218,
-    60065,
-    148396,
-    118219,
-    43165,
-    33360,
-    80619,
-    80025,
-    46837,
-    74573,
-    90356,
-    35204,
-    105456,
-    167563,
-    57604,
-    50736,
-    71675,
-    127060,
-    109742,
-    68350,
-    175966,
-    132544,
-    172138,
-    60334,
-    156111,
-    134211,
-    119914,
-    75918,
-    163583,
-    45948,
-    168839,
-    30374,
-    156099,
-    65248,
-    75632,
-    94184,
-    113356,
-    109353,
-    173862,
-    163240,
-    89389,
-    92886,
-    36878,
-    79655,
-    134101,
-    99788,
-    83961,
-    83690,
-    103294,
-    61313,
-    139962,
-    122110,
-    132569,
-    16666,
-    93765,
-    29253,
-    68338,
-    151181,
-    22897,
-    110851,
-    5132,
-    174619,
-    51927,
-    96130,
-    55663,
-    90201,
-    82975,
-    37392,
-    30334,
-    70881,
-    100836,
-    37749,
-    32221,
-    90360,
-    155584,
-    105256,
-    167394,
-    26272,
-    69665,
-    85130,
-    65595,
-    129277,
-    43428,
-    135491,
-    144465,
-    42904,
-    38065,
-    36147,
-    98775,
-    171660,
-    42944,
-    134333,
-    7246,
-    115001,
-    126333,
-    142440,
-    126920,
-    25042,
-    78094,
-    28920,
-    95008,
-    11088,
-    128540,
-    54590,
-    53407,
-    177569,
-    13620,
-    27887,
-    51815,
-    4663,
-    165414,
-    119888,
-    104508,
-    147040,
-    40420,
-    145606,
-    72347,
-    145392,
-    176141,
-    89036,
-    124459,
-    179835,
-    47895,
-    62936,
-    74411,
-    148984,
-    27886,
-    4637,
-    113730,
-    165683,
-    139562,
-    175600,
-    170162,
-    105702,
-    21870,
-    149408,
-    100315,
-    51741,
-    122004,
-    58564,
-    114022,
-    94175,
-    10512,
-    65327,
-    163468,
-    28655,
-    1846,
-    120746,
-    141266,
-    175428,
-    57691,
-    103474,
-    14943,
-    140368,
-    132999,
-    46706,
-    146252,
-    126145,
-    143031,
-    142471,
-    8407,
-    102426,
-    144969,
-    138622,
-    179991,
-    117479,
-    154435,
-    84910,
-    75936,
-    19204,
-    9557,
-    135535,
-    31962,
-    9935,
-    51789,
-    94427,
-    43847,
-    145624,
-    119185,
-    62429,
-    179637,
-    152843,
-    84483,
-    98791,
-    120310,
-    58078,
-    12994,
-    41895,
-    6014,
-    100147,
-    102444,
-    156903,
-    165444,
-    139618,
-    66837,
-    134081,
-    13794,
-    104452,
-    137555,
-    164409,
-    73166,
-    85602,
-    32065,
-    145695,
-    91109,
-    88894,
-    178059,
-    24639,
-    61116,
-    151506,
-    149289,
-    52230,
-    117614,
-    158581,
-    126903,
-    151108,
-    36567,
-    111430,
-    85020,
-    24892,
-    125965,
-    70986,
-    141394,
-    133226,
-    120446,
-    109469,
-    90626,
-    45391,
-    101009,
-    131503,
-    135158,
-    84078,
-    166199,
-    59758,
-    162414,
-    5134,
-    43174,
-    116899,
-    96584,
-    147573,
-    7290,
-    134052,
-    143417,
-    116122,
-    41045,
-    177109,
-    105214,
-    75710,
-    61514,
-    172986,
-    26485,
-    162815,
-    3639,
-    100232,
-    52865,
-    101796,
-    11404,
-    5752,
-    91275,
-    90857,
-    174879,
-    171587,
-    39434,
-    167404,
-    159870,
-    165600,
-    55976,
-    49163,
-    6388,
-    16323,
-    117276,
-    1300,
-    110788,
-    125412,
-    67298,
-    19244,
-    5210,
-    34007,
-    76024,
-    134125,
-    162683,
-    128558,
-    99077,
-    83656,
-    42577,
-    161467,
-    75032,
-    138602,
-    118758,
-    147962,
-    95075,
-    153298,
-    1198,
-    8620,
-    155502,
-    100823,
-    173965,
-    8247,
-    165011,
-    111267,
-    149893,
-    59493,
-    115780,
-    94815,
-    7864,
-    175312,
-    122163,
-    153955,
-    174949,
-    170653,
-    131258,
-    157418,
-    24800,
-    106790,
-    154764,
-    17512,
-    117956,
-    32316,
-    167201,
-    125910,
-    129108,
-    118062,
-    43754,
-    160962,
-    133156,
-    88415,
-    140144,
-    6438,
-    55642,
-    154797,
-    33425,
-    178267,
-    139761,
-    31248,
-    123641,
-    138636,
-    34196,
-    61103,
-    35832,
-    124560,
-    96551,
-    124150,
-    91409,
-    34861,
-    58135,
-    25057,
-    54441,
-    78813,
-    13492,
-    107550,
-    44090,
-    97755,
-    933,
-    70082,
-    38653,
-    98758,
-    18559,
-    86864,
-    34348,
-    86461,
-    8859,
-    148167,
-    157219,
-    148092,
-    103831,
-    60792,
-    124991,
-    154586,
-    8937,
-    142551,
-    2903,
-    16730,
-    76816,
-    166979,
-    69433,
-    63030,
-    134889,
-    23443,
-    147598,
-    179611,
-    174631,
-    64378,
-    43594,
-    107472,
-    178812,
-    24573,
-    36684,
-    118471,
-    100463,
-    101461,
-    98700,
-    44513,
-    9444,
-    82690,
-    133340,
-    73218,
-    125424,
-    121728,
-    68994,
-    122733,
-    118697,
-    15920,
-    5011,
-    126542,
-    77690,
-    52933,
-    157282,
-    112968,
-    138860,
-    32658,
-    41714,
-    58388,
-    11960,
-    83387,
-    173331,
-    50294,
-    77649,
-    19382,
-    1190,
-    161553,
-    103330,
-    159080,
-    11183,
-    21027,
-    81856,
-    152260,
-    55520,
-    98614,
-    129668,
-    121333,
-    153647,
-    64466,
-    32163,
-    92426,
-    113981,
-    173219,
-    140834,
-    22123,
-    122531,
-    165615,
-    86866,
-    148196,
-    82110,
-    86512,
-    171143,
-    173690,
-    141464,
-    47228,
-    162562,
-    1205,
-    135477,
-    115237,
-    152436,
-    34517,
-    82873,
-    21476,
-    126410,
-    56199,
-    166003,
-    130691,
-    158360,
-    103484,
-    41093,
-    48140,
-    30946,
-    49013,
-    150285,
-    111257,
-    11494,
-    21608,
-    51066,
-    113194,
-    132220,
-    140621,
-    12036,
-    125734,
-    52706,
-    165711,
-    77458,
-    106481,
-    20000,
-    174825,
-    76271,
-    141769,
-    54954,
-    94507,
-    84917,
-    42777,
-    169005,
-    89956,
-    179289,
-    10230,
-    103309,
-    84519,
-    40306,
-    79514,
-    133998,
-    126291,
-    19175,
-    173052,
-    93622,
-    86222,
-    140582,
-    165798,
-    46351,
-    131163,
-    18413,
-    93604,
-    156830,
-    68067,
-    14230,
-    78805,
-    165733,
-    161786,
-    148959,
-    146215,
-    115493,
-    133619,
-    73729,
-    110095,
-    74728,
-    74943,
-    99289,
-    7622,
-    163787,
-    117703,
-    64208,
-    94388,
-    118783,
-    87114,
-    151357,
-    154015,
-    12944,
-    36203,
-    68189,
-    10612,
-    130600,
-    109292,
-    72737,
-    71199,
-    168596,
-    127737,
-    147421,
-    81473,
-    88195,
-    40620,
-    150701,
-    47226,
-    116620,
-    156176,
-    49197,
-    85572,
-    116367,
-    74470,
-    60980,
-    126192,
-    55212,
-    41761,
-    73003,
-    72405,
-    103385,
-    66390,
-    63008,
-    19456,
-    105659,
-    49127,
-    76041,
-    54629,
-    133779,
-    160929,
-    94411,
-    13160,
-    13513,
-    89082,
-    77509,
-    109411,
-    108466,
-    60621,
-    83546,
-    135517,
-    106812,
-    177782,
-    93043,
-    158446,
-    71134,
-    69732,
-    169004,
-    32188,
-    74915,
-    66363,
-    152899,
-    40815,
-    43715,
-    67790,
-    77205,
-    66769,
-    83851,
-    99982,
-    59307,
-    33844,
-    160467,
-    4190,
-    45754,
-    77703,
-    110335,
-    83590,
-    124685,
-    19726,
-    139953,
-    167086,
-    109310,
-    11542,
-    126785,
-    89296,
-    176025,
-    54744,
-    14165,
-    122533,
-    156132,
-    171935,
-    128182,
-    133338,
-    121425,
-    59018,
-    1031,
-    50161,
-    86457,
-    96252,
-    58903,
-    173005,
-    41067,
-    23594,
-    61,
-    112870,
-    127408,
-    159712,
-    137253,
-    107902,
-    13481,
-    31513,
-    76703,
-    120952,
-    159335,
-    121312,
-    63513,
-    153683,
-    172238,
-    29273,
-    141210,
-    163206,
-    8813,
-    112348,
-    55927,
-    145324,
-    92725,
-    29226,
-    2211,
-    14712,
-    78912,
-    60060,
-    97390,
-    140468,
-    96392,
-    58021,
-    177549,
-    49736,
-    89528,
-    14663,
-    47297,
-    125253,
-    34928,
-    23479,
-    177219,
-    24983,
-    159300,
-    141425,
-    68572,
-    177285,
-    179186,
-    4184,
-    62817,
-    170125,
-    75944,
-    41630,
-    158822,
-    28640,
-    108006,
-    109131,
-    35991,
-    116485,
-    112429,
-    405,
-    50952,
-    178169,
-    9245,
-    149263,
-    125676,
-    89804,
-    40258,
-    54821,
-    16451,
-    64931,
-    71766,
-    141235,
-    77086,
-    108785,
-    64306,
-    121627,
-    115246,
-    170619,
-    64375,
-    53799,
-    106463,
-    2430,
-    26204,
-    120610,
-    166745,
-    109665,
-    134938,
-    45487,
-    126436,
-    10431,
-    1317,
-    76909,
-    151677,
-    68539,
-    133698,
-    131387,
-    73676,
-    132810,
-    118300,
-    80053,
-    162739,
-    25763,
-    29411,
-    17792,
-    48521,
-    129492,
-    61672,
-    115003,
-    33834,
-    64485,
-    14736,
-    89415,
-    154320,
-    143594,
-    52122,
-    97617,
-    162543,
-    154394,
-    64207,
-    67640,
-    111627,
-    104569,
-    29033,
-    65182,
-    20133,
-    172366,
-    133923,
-    82676,
-    155972,
-    123039,
-    18356,
-    75757,
-    175934,
-    27899,
-    177673,
-    90482,
-    31944,
-    29361,
-    106735,
-    55726,
-    67158,
-    97810,
-    116610,
-    130689,
-    32693,
-    4118,
-    53941,
-    146103,
-    111567,
-    58015,
-    133667,
-    84736,
-    51250,
-    55720,
-    158167,
-    100688,
-    122185,
-    165577,
-    97684,
-    95317,
-    53936,
-    42228,
-    54030,
-    24777,
-    137595,
-    153131,
-    34706,
-    142844,
-    12161,
-    174454,
-    123606,
-    4750,
-    127753,
-    33619,
-    110896,
-    88940,
-    53780,
-    88936,
-    134041,
-    129540,
-    133863,
-    160333,
-    122070,
-    99471,
-    134145,
-    50349,
-    64131,
-    90416,
-    178809,
-    1809,
-    64322,
-    164083,
-    42400,
-    123353,
-    126924,
-    20890,
-    97299,
-    86406,
-    32370,
-    60180,
-    107432,
-    56345,
-    115701,
-    134298,
-    89726,
-    99418,
-    35462,
-    63064,
-    140746,
-    120157,
-    172165,
-    43942,
-    148375,
-    139039,
-    91996,
-    70032,
-    93485,
-    96930,
-    81664,
-    176911,
-    129842,
-    116173,
-    26852,
-    60025,
-    60700,
-    42899,
-    114498,
-    96605,
-    172769,
-    106356,
-    162152,
-    159462,
-    168434,
-    49488,
-    125683,
-    60968,
-    83950,
-    47806,
-    139836,
-    165039,
-    15654,
-    10929,
-    70104,
-    111969,
-    82972,
-    32584,
-    51110,
-    72070,
-    48997,
-    31810,
-    71200,
-    151579,
-    108390,
-    175651,
-    59135,
-    18550,
-    99548,
-    10328,
-    6919,
-    142978,
-    94371,
-    123062,
-    130776,
-    45777,
-    22576,
-    106662,
-    94871,
-    84886,
-    116102,
-    1181,
-    49543,
-    9511,
-    3617,
-    55772,
-    62489,
-    168598,
-    92766,
-    12927,
-    154970,
-    63859,
-    93717,
-    179910,
-    22261,
-    130506,
-    136307,
-    96971,
-    117226,
-    155832,
-    51090,
-    110964,
-    100610,
-    62123,
-    165050,
-    113493,
-    42960,
-    128086,
-    61163,
-    7505,
-    133822,
-    118210,
-    174294,
-    78163,
-    66052,
-    151603,
-    137109,
-    50038,
-    93877,
-    156366,
-    87220,
-    19962,
-    9329,
-    82539,
-    90277,
-    138147,
-    74610,
-    74605,
-    51480,
-    175613,
-    166186,
-    105202,
-    107844,
-    115133,
-    116526,
-    155993,
-    106595,
-    149276,
-    67634,
-    154994,
-    5930,
-    56641,
-    479,
-    28348,
-    97796,
-    26935,
-    64439,
-    15122,
-    60283,
-    69264,
-    133812,
-    265,
-    138846,
-    77530,
-    103408,
-    154750,
-    57585,
-    167073,
-    149582,
-    17283,
-    65465,
-    30354,
-    90160,
-    176806,
-    119482,
-    106143,
-    78435,
-    62973,
-    150491,
-    9900,
-    161164,
-    138959,
-    35736,
-    22384,
-    35338,
-    76070,
-    29962,
-    42895,
-    122128,
-    156721,
-    146571,
-    162858,
-    131664,
-    22668,
-    31069,
-    80104,
-    120284,
-    142960,
-    52831,
-    131793,
-    107160,
-    2344,
-    162402,
-    110644,
-    50168,
-    131808,
-    31311,
-    118835,
-    60822,
-    86180,
-    94830,
-    90797,
-    177667,
-    139364,
-    45937,
-    12462,
-    165479,
-    5938,
-    32824,
-    44184,
-    87168,
-    4532,
-    171020,
-    43883,
-    46611,
-    171223,
-    133543,
-    123442,
-    81095,
-    48021,
-    172615,
-    109585,
-    116020,
-    85618,
-    135387,
-    111461,
-    116206,
-    31680,
-    59195,
-    127295,
-    171637,
-    40154,
-    49495,
-    169864,
-    50325,
-    165628,
-    114900,
-    107661,
-    94851,
-    71742,
-    48706,
-    35321,
-    13309,
-    161735,
-    130138,
-    156572,
-    54151,
-    77212,
-    157853,
-    76560,
-    14077,
-    139399,
-    23857,
-    178174,
-    73232,
-    143559,
-    39068,
-    103931,
-    641,
-    95785,
-    40141,
-    174732,
-    76529,
-    9452,
-    81351,
-    95202,
-    22363,
-    127990,
-    100078,
-    58939,
-    148358,
-    22998,
-    119040,
-    39431,
-    116131,
-    70015,
-    146788,
-    92804,
-    47863,
-    136038,
-    103614,
-    91299,
-    163573,
-    111591,
-    148715,
-    150497,
-    60971,
-    129917,
-    131041,
-    110012,
-    74035,
-    113229,
-    1968,
-    90148,
-    24369,
-    103545,
-    130208,
-    34733,
-    11576,
-    167749,
-    38662,
-    28396,
-    147817,
-    47244,
-    1183,
-    72434,
-    157066,
-    143826,
-    130922,
-    30915,
-    130941,
-    21944,
-    77880,
-    38444,
-    71104,
-    95404,
-    75513,
-    42230,
-    170127,
-    37837,
-    138042,
-    34660,
-    147630,
-    162224,
-    142270,
-    174513,
-    143576,
-    168004,
-    22506,
-    30743,
-    160460,
-    17925,
-    121455,
-    59955,
-    117536,
-    91381,
-    6689,
-    148679,
-    50836,
-    44081,
-    127890,
-    63213,
-    10095,
-    52119,
-    136186,
-    52564,
-    95919,
-    163342,
-    50223,
-    101045,
-    92466,
-    16369,
-    142969,
-    105613,
-    68060,
-    169067,
-    174816,
-    104399,
-    168979,
-    15841,
-    88967,
-    114951,
-    176012,
-    16886,
-    79490,
-    43879,
-    43417,
-    2625,
-    130256,
-    137688,
-    28817,
-    21898,
-    95250,
-    79612,
-    55826,
-    8288,
-    75673,
-    86006,
-    6539,
-    75684,
-    98467,
-    38220,
-    5581,
-    3861,
-    105685,
-    66191,
-    110598,
-    14300,
-    66643,
-    107830,
-    114884,
-    83453,
-    56107,
-    81922,
-    14739,
-    142084,
-    141193,
-    116426,
-    28127,
-    156893,
-    57981,
-    54522,
-    165785,
-    11331,
-    124394,
-    15351,
-    94461,
-    166449,
-    116051,
-    137645,
-    138704,
-    34873,
-    111666,
-    43279,
-    137581,
-    127364,
-    3351,
-    96857,
-    142224,
-    121453,
-    14477,
-    125582,
-    76632,
-    143425,
-    22275,
-    160724,
-    83322,
-    156086,
-    60961,
-    179802,
-    152763,
-    1364,
-    76921,
-    115486,
-    73342,
-    4785,
-    70844,
-    178212,
-    109500,
-    145656,
-    110042,
-    28072,
-    13480,
-    30830,
-    31899,
-    164513,
-    77180,
-    150317,
-    108704,
-    97906,
-    48775,
-    68100,
-    109244,
-    131725,
-    88826,
-    118907,
-    153866,
-    127487,
-    92430,
-    72426,
-    133963,
-    3669,
-    4186,
-    101658,
-    78109,
-    76066,
-    16615,
-    109351,
-    62659,
-    67455,
-    169645,
-    84653,
-    105263,
-    129966,
-    76858,
-    169083,
-    31847,
-    19902,
-    166912,
-    50041,
-    61728,
-    95606,
-    66517,
-    179989,
-    94954,
-    87126,
-    77194,
-    133178,
-    34739,
-    54728,
-    88085,
-    34073,
-    65118,
-    154854,
-    51163,
-    12557,
-    38944,
-    62847,
-    73522,
-    164488,
-    95721,
-    39086,
-    102701,
-    33214,
-    55637,
-    14957,
-    64941,
-    132484,
-    26694,
-    108320,
-    170064,
-    171952,
-    51795,
-    28700,
-    161620,
-    20434,
-    160203,
-    129483,
-    155124,
-    116743,
-    35967,
-    110871,
-    173730,
-    150346,
-    175912,
-    135857,
-    43451,
-    151654,
-    139811,
-    129607,
-    114844,
-    20834,
-    154769,
-    10717,
-    28289,
-    22111,
-    34079,
-    102365,
-    36875,
-    39126,
-    117421,
-    59236,
-    61481,
-    101876,
-    175709,
-    179586,
-    1053,
-    120414,
-    142011,
-    16196,
-    54506,
-    4556,
-    92291,
-    5781,
-    14229,
-    69395,
-    136140,
-    178522,
-    175784,
-    87492,
-    147918,
-    47314,
-    44555,
-    122878,
-    106119,
-    28955,
-    116182,
-    119155,
-    157866,
-    50092,
-    138707,
-    79169,
-    74152,
-    65579,
-    19801,
-    49194,
-    52938,
-    96984,
-    161174,
-    22697,
-    23031,
-    166295,
-    126271,
-    24795,
-    137316,
-    102213,
-    129577,
-    107429,
-    126529,
-    140280,
-    120924,
-    3660,
-    95237,
-    48084,
-    112205,
-    42590,
-    36325,
-    42989,
-    105555,
-    34846,
-    16264,
-    132255,
-    13038,
-    49243,
-    122807,
-    104994,
-    39213,
-    69754,
-    116446,
-    143558,
-    7922,
-    110154,
-    11348,
-    13029,
-    45526,
-    85669,
-    27489,
-    60221,
-    532,
-    41814,
-    169933,
-    59666,
-    97258,
-    157607,
-    169205,
-    142061,
-    24134,
-    166357,
-    126671,
-    4172,
-    57139,
-    55666,
-    46925,
-    24452,
-    140538,
-    59545,
-    51648,
-    42060,
-    148799,
-    17488,
-    669,
-    140001,
-    116055,
-    74980,
-    57989,
-    25678,
-    124489,
-    164699,
-    71156,
-    118734,
-    87365,
-    160583,
-    15984,
-    118220,
-    31136,
-    755,
-    96124,
-    172559,
-    11078,
-    43651,
-    108143,
-    88527,
-    109509,
-    30542,
-    175252,
-    109151,
-    62285,
-    156766,
-    35521,
-    179215,
-    31777,
-    42340,
-    97761,
-    76113,
-    14173,
-    17233,
-    134348,
-    9454,
-    91030,
-    125392,
-    83516,
-    166051,
-    44351,
-    37942,
-    168016,
-    130692,
-    140555,
-    173810,
-    85690,
-    134920,
-    6317,
-    112075,
-    144321,
-    100571,
-    121697,
-    73041,
-    80040,
-    154956,
-    158661,
-    1362,
-    7104,
-    76930,
-    154380,
-    87045,
-    41398,
-    121537,
-    2605,
-    85266,
-    105184,
-    26563,
-    34074,
-    43628,
-    162442,
-    70089,
-    153880,
-    124672,
-    151604,
-    163141,
-    48815,
-    162056,
-    100899,
-    168097,
-    57648,
-    127654,
-    27183,
-    16319,
-    88954,
-    151512,
-    160293,
-    125783,
-    61972,
-    35632,
-    137308,
-    150323,
-    95689,
-    100809,
-    107660,
-    118173,
-    107995,
-    158776,
-    97738,
-    101081,
-    13433,
-    66823,
-    103007,
-    135033,
-    38477,
-    138450,
-    1107,
-    31309,
-    43323,
-    83622,
-    142320,
-    168930,
-    61605,
-    52841,
-    87551,
-    18513,
-    71390,
-    160506,
-    142096,
-    89667,
-    52948,
-    164965,
-    116907,
-    61688,
-    40328,
-    99643,
-    45159,
-    91967,
-    116461,
-    74830,
-    84499,
-    19858,
-    26698,
-    155396,
-    22221,
-    109667,
-    24969,
-    131768,
-    59491,
-    92784,
-    103636,
-    106788,
-    151140,
-    30928,
-    44051,
-    9206,
-    121951,
-    173806,
-    30953,
-    132864,
-    10905,
-    59706,
-    154138,
-    135779,
-    147994,
-    75238,
-    43603,
-    178657,
-    16430,
-    57866,
-    144346,
-    3575,
-    177639,
-    166632,
-    65899,
-    157740,
-    106839,
-    113541,
-    168154,
-    154021,
-    62333,
-    96398,
-    109449,
-    159086,
-    132168,
-    142363,
-    69714,
-    74679,
-    99939,
-    4198,
-    58444,
-    72228,
-    113492,
-    74448,
-    62859,
-    93637,
-    69866,
-    80772,
-    165586,
-    126664,
-    102024,
-    42163,
-    64515,
-    147867,
-    41998,
-    94396,
-    13756,
-    33438,
-    135483,
-    165376,
-    139755,
-    129011,
-    107562,
-    178739,
-    82043,
-    46745,
-    46310,
-    165198,
-    33638,
-    56568,
-    38251,
-    83381,
-    131530,
-    56456,
-    107386,
-    82222,
-    148286,
-    7187,
-    91993,
-    43700,
-    69376,
-    8059,
-    78633,
-    159419,
-    57131,
-    94125,
-    71534,
-    6267,
-    110823,
-    80515,
-    23405,
-    123011,
-    33657,
-    7593,
-    35483,
-    56472,
-    128372,
-    33449,
-    66627,
-    50127,
-    81740,
-    46298,
-    8488,
-    154140,
-    18391,
-    52885,
-    5657,
-    129206,
-    113600,
-    111136,
-    148244,
-    25997,
-    14638,
-    25193,
-    7946,
-    89120,
-    113024,
-    35412,
-    117809,
-    57185,
-    179376,
-    88293,
-    123575,
-    66146,
-    75289,
-    57094,
-    17313,
-    107213,
-    7418,
-    145849,
-    52433,
-    136001,
-    95163,
-    53996,
-    10107,
-    46928,
-    101182,
-    177561,
-    179596,
-    107128,
-    15755,
-    164405,
-    160451,
-    11980,
-    170979,
-    127070,
-    28194,
-    163252,
-    79301,
-    120350,
-    114806,
-    45413,
-    54374,
-    107130,
-    169497,
-    76643,
-    143902,
-    48605,
-    161685,
-    84161,
-    91323,
-    27322,
-    35056,
-    43707,
-    124928,
-    39074,
-    40410,
-    100184,
-    50436,
-    114083,
-    125908,
-    166841,
-    172590,
-    131987,
-    88828,
-    109403,
-    8740,
-    174799,
-    51971,
-    151235,
-    9292,
-    167799,
-    131854,
-    123742,
-    34962,
-    151885,
-    51737,
-    106253,
-    66791,
-    126411,
-    120291,
-    36525,
-    137437,
-    358,
-    77016,
-    151119,
-    119143,
-    166559,
-    122215,
-    120694,
-    10752,
-    150411,
-    91995,
-    62440,
-    122974,
-    121526,
-    73571,
-    59333,
-    145044,
-    42790,
-    2778,
-    22653,
-    59718,
-    28415,
-    76455,
-    13846,
-    168890,
-    155255,
-    1443,
-    166836,
-    32530,
-    173363,
-    149210,
-    100515,
-    26603,
-    108695,
-    131582,
-    157338,
-    6498,
-    52502,
-    96802,
-    111498,
-    77109,
-    168318,
-    93031,
-    77634,
-    157416,
-    76346,
-    178132,
-    52509,
-    94361,
-    91286,
-    44471,
-    18924,
-    44075,
-    111708,
-    163155,
-    149108,
-    147524,
-    146550,
-    146065,
-    168375,
-    90250,
-    171645,
-    140485,
-    163428,
-    46372,
-    127498,
-    27324,
-    162600,
-    129787,
-    60743,
-    1372,
-    8636,
-    168903,
-    17701,
-    137544,
-    16579,
-    123709,
-    16420,
-    57592,
-    65716,
-    115969,
-    177924,
-    175894,
-    11024,
-    58637,
-    87504,
-    128594,
-    31637,
-    28428,
-    21609,
-    167408,
-    46396,
-    86240,
-    157618,
-    110149,
-    33101,
-    84619,
-    118889,
-    58570,
-    62585,
-    39332,
-    14932,
-    31670,
-    112606,
-    80590,
-    164426,
-    93494,
-    101554,
-    56528,
-    136669,
-    59548,
-    169360,
-    108425,
-    34278,
-    14168,
-    17972,
-    98986,
-    168667,
-    119300,
-    165998,
-    177497,
-    94787,
-    145633,
-    110328,
-    7984,
-    140331,
-    158528,
-    115798,
-    78013,
-    49908,
-    125088,
-    27246,
-    62807,
-    18765,
-    93953,
-    102692,
-    26810,
-    122881,
-    130199,
-    75972,
-    21326,
-    125157,
-    8939,
-    76068,
-    150203,
-    89905,
-    71730,
-    159373,
-    61202,
-    102538,
-    41130,
-    120394,
-    117731,
-    94009,
-    177795,
-    135941,
-    37364,
-    143483,
-    161131,
-    64750,
-    24417,
-    116321,
-    178797,
-    23232,
-    62835,
-    144754,
-    32333,
-    137199,
-    78460,
-    39486,
-    82094,
-    32526,
-    120552,
-    109156,
-    39354,
-    163032,
-    177536,
-    80834,
-    27204,
-    113383,
-    95145,
-    65114,
-    12586,
-    41370,
-    52401,
-    73891,
-    144527,
-    99024,
-    124583,
-    44416,
-    125326,
-    70860,
-    168352,
-    67032,
-    140636,
-    115630,
-    9137,
-    144712,
-    30310,
-    170164,
-    132505,
-    176471,
-    124950,
-    115089,
-    33765,
-    118369,
-    34941,
-    52467,
-    156551,
-    134627,
-    158883,
-    73988,
-    120818,
-    150722,
-    69954,
-    10912,
-    63665,
-    158903,
-    87454,
-    137306,
-    39450,
-    96343,
-    136133,
-    135134,
-    27543,
-    19020,
-    170439,
-    45827,
-    134814,
-    129298,
-    87602,
-    23299,
-    18590,
-    41613,
-    146616,
-    25228,
-    111196,
-    88269,
-    141368,
-    15975,
-    12742,
-    47840,
-    84386,
-    108247,
-    107994,
-    59862,
-    74252,
-    89058,
-    4564,
-    96083,
-    48178,
-    3833,
-    156005,
-    94688,
-    166430,
-    130847,
-    109145,
-    50354,
-    152574,
-    115242,
-    73014,
-    169361,
-    40829,
-    13995,
-    156294,
-    12187,
-    98627,
-    24257,
-    2737,
-    120154,
-    96734,
-    92219,
-    24513,
-    82966,
-    165146,
-    101382,
-    110087,
-    142529,
-    124754,
-    114453,
-    109445,
-    140253,
-    13084,
-    112247,
-    18392,
-    95006,
-    53306,
-    141291,
-    41203,
-    57066,
-    114275,
-    45997,
-    161384,
-    10416,
-    174223,
-    149539,
-    59934,
-    79275,
-    166403,
-    48939,
-    30388,
-    152393,
-    84867,
-    89113,
-    108098,
-    118308,
-    135213,
-    18720,
-    86213,
-    153872,
-    163835,
-    133455,
-    113374,
-    105929,
-    51127,
-    121278,
-    81905,
-    141796,
-    58833,
-    26927,
-    89380,
-    24808,
-    2885,
-    28479,
-    137040,
-    100826,
-    172173,
-    65523,
-    168115,
-    90030,
-    10171,
-    86830,
-    132129,
-    5895,
-    165484,
-    33739,
-    125122,
-    133818,
-    74510,
-    82930,
-    167921,
-    73894,
-    60219,
-    140230,
-    45682,
-    146917,
-    170438,
-    18664,
-    116454,
-    149285,
-    125634,
-    67780,
-    146953,
-    106197,
-    32349,
-    135901,
-    7051,
-    42282,
-    102176,
-    41068,
-    79320,
-    36036,
-    121936,
-    57129,
-    74065,
-    75674,
-    151645,
-    173711,
-    83550,
-    3987,
-    54121,
-    154923,
-    68791,
-    29613,
-    50863,
-    43836,
-    147871,
-    79008,
-    47906,
-    116387,
-    128235,
-    122584,
-    62804,
-    155536,
-    141659,
-    90115,
-    81246,
-    33656,
-    117649,
-    109033,
-    28991,
-    109088,
-    139514,
-    64939,
-    133358,
-    51568,
-    161439,
-    20880,
-    59751,
-    87263,
-    27744,
-    14448,
-    151659,
-    35243,
-    94617,
-    154186,
-    7941,
-    39334,
-    13274,
-    70694,
-    21389,
-    165378,
-    127486,
-    153183,
-    32354,
-    51623,
-    102764,
-    88770,
-    24153,
-    128419,
-    154872,
-    141969,
-    22496,
-    175839,
-    26094,
-    8835,
-    10463,
-    168219,
-    50226,
-    37112,
-    73058,
-    45860,
-    103310,
-    16789,
-    40069,
-    177964,
-    140566,
-    162068,
-    118202,
-    156825,
-    87842,
-    75236,
-    589,
-    126279,
-    42218,
-    31344,
-    165038,
-    24874,
-    70900,
-    105692,
-    136310,
-    2233,
-    159906,
-    77467,
-    145850,
-    119084,
-    61287,
-    120852,
-    74355,
-    22788,
-    14982,
-    179538,
-    87018,
-    131323,
-    162010,
-    96637,
-    29909,
-    120917,
-    89977,
-    67479,
-    149670,
-    146734,
-    120989,
-    78020,
-    31767,
-    72087,
-    30926,
-    74998,
-    20228,
-    167686,
-    100098,
-    22526,
-    107024,
-    108428,
-    123285,
-    3286,
-    39728,
-    51211,
-    167666,
-    113486,
-    114798,
-    92029,
-    91430,
-    143099,
-    83993,
-    146022,
-    70702,
-    44712,
-    26593,
-    124645,
-    31451,
-    12979,
-    114703,
-    75858,
-    23637,
-    11402,
-    134190,
-    7350,
-    18861,
-    106183,
-    159877,
-    123067,
-    131488,
-    155815,
-    163799,
-    159904,
-    148637,
-    173738,
-    91048,
-    177126,
-    121609,
-    179166,
-    91308,
-    56785,
-    32661,
-    143896,
-    66229,
-    2194,
-    147592,
-    154538,
-    134072,
-    155675,
-    20040,
-    163563,
-    78376,
-    57069,
-    141490,
-    169696,
-    106690,
-    135894,
-    91014,
-    58409,
-    100858,
-    50327,
-    143756,
-    97695,
-    87103,
-    22381,
-    77792,
-    120055,
-    162480,
-    13148,
-    10615,
-    84398,
-    42160,
-    24572,
-    66569,
-    5659,
-    171630,
-    90677,
-    162428,
-    75900,
-    58549,
-    138809,
-    39789,
-    152509,
-    120980,
-    158481,
-    43653,
-    70770,
-    159671,
-    153413,
-    712,
-    170470,
-    35096,
-    81309,
-    95819,
-    99568,
-    145965,
-    163755,
-    2426,
-    173512,
-    101201,
-    11186,
-    108335,
-    90198,
-    83444,
-    86103,
-    165192,
-    138407,
-    38903,
-    70146,
-    24617,
-    165188,
-    137943,
-    71920,
-    152123,
-    55055,
-    76043,
-    87517,
-    155445,
-    43530,
-    177406,
-    57583,
-    174002,
-    35806,
-    9430,
-    100401,
-    80334,
-    95936,
-    173815,
-    119442,
-    96877,
-    10182,
-    129496,
-    135882,
-    71338,
-    148992,
-    58248,
-    155776,
-    128572,
-    90959,
-    175903,
-    13407,
-    62248,
-    148481,
-    167550,
-    30176,
-    126353,
-    11553,
-    25174,
-    156427,
-    166914,
-    134369,
-    12774,
-    123302,
-    14660,
-    3772,
-    81545,
-    115680,
-    164209,
-    54227,
-    129819,
-    2685,
-    134496,
-    74529,
-    127354,
-    156241,
-    2286,
-    176064,
-    111383,
-    147574,
-    3343,
-    150185,
-    70794,
-    55338,
-    149751,
-    174741,
-    69448,
-    116825,
-    165467,
-    129092,
-    136709,
-    35489,
-    1861,
-    12620,
-    66400,
-    122112,
-    15026,
-    119715,
-    55184,
-    96463,
-    38208,
-    104401,
-    95325,
-    143546,
-    120866,
-    3125,
-    144859,
-    8656,
-    107996,
-    79749,
-    52668,
-    131820,
-    157676,
-    106904,
-    152094,
-    19536,
-    114615,
-    164138,
-    71029,
-    154563,
-    23644,
-    30157,
-    26173,
-    76096,
-    20347,
-    546,
-    39340,
-    113456,
-    102585,
-    47889,
-    156540,
-    152989,
-    74347,
-    153193,
-    170747,
-    129616,
-    16461,
-    51608,
-    146939,
-    31990,
-    48151,
-    179914,
-    108341,
-    46373,
-    87456,
-    150387,
-    1088,
-    17750,
-    87671,
-    33200,
-    116178,
-    140243,
-    104580,
-    108375,
-    143356,
-    32260,
-    117222,
-    75643,
-    17965,
-    437,
-    15842,
-    8715,
-    22492,
-    101014,
-    55605,
-    6173,
-    120176,
-    1883,
-    34481,
-    149669,
-    106850,
-    20980,
-    170555,
-    156936,
-    159852,
-    142616,
-    93222,
-    55850,
-    158028,
-    8793,
-    83498,
-    147293,
-    159700,
-    126555,
-    132241,
-    92369,
-    66031,
-    132048,
-    148046,
-    70991,
-    152760,
-    6624,
-    27836,
-    129261,
-    128746,
-    6318,
-    37618,
-    91887,
-    175435,
-    140769,
-    9526,
-    169717,
-    79981,
-    124882,
-    100075,
-    128368,
-    28840,
-    133530,
-    35178,
-    4811,
-    23444,
-    48930,
-    153004,
-    71320,
-    45576,
-    99357,
-    45373,
-    79209,
-    25409,
-    53313,
-    90462,
-    45896,
-    6165,
-    118753,
-    28816,
-    107486,
-    57860,
-    17108,
-    93530,
-    54192,
-    110438,
-    91741,
-    108405,
-    99927,
-    147600,
-    9069,
-    37404,
-    84091,
-    112357,
-    88289,
-    80628,
-    2177,
-    9616,
-    132175,
-    6781,
-    79690,
-    100095,
-    16672,
-    51784,
-    170973,
-    161106,
-    61548,
-    47797,
-    116262,
-    56102,
-    43823,
-    157984,
-    96524,
-    138152,
-    22171,
-    138915,
-    38238,
-    167277,
-    102277,
-    29953,
-    100624,
-    75119,
-    105770,
-    27954,
-    122476,
-    135782,
-    44232,
-    88193,
-    119785,
-    144623,
-    135080,
-    165031,
-    66283,
-    90605,
-    149827,
-    53180,
-    46153,
-    130886,
-    92253,
-    144761,
-    51114,
-    49846,
-    37186,
-    143742,
-    37581,
-    78606,
-    19439,
-    152341,
-    42112,
-    23972,
-    74956,
-    159030,
-    10264,
-    124093,
-    104044,
-    155938,
-    143923,
-    172285,
-    43160,
-    84529,
-    78614,
-    91983,
-    60795,
-    141892,
-    160915,
-    14522,
-    2942,
-    45563,
-    156037,
-    103344,
-    116165,
-    27934,
-    25466,
-    47399,
-    37125,
-    120769,
-    155526,
-    124144,
-    119489,
-    100312,
-    136353,
-    116346,
-    144409,
-    143642,
-    86021,
-    166168,
-    142799,
-    100818,
-    90988,
-    46340,
-    26549,
-    127839,
-    139543,
-    107756,
-    17359,
-    151594,
-    147138,
-    10899,
-    140364,
-    47656,
-    171886,
-    108831,
-    34410,
-    166180,
-    133422,
-    110934,
-    65608,
-    115515,
-    141949,
-    27552,
-    150227,
-    61776,
-    132819,
-    173993,
-    42800,
-    43366,
-    20489,
-    141849,
-    16414,
-    14128,
-    125725,
-    175242,
-    94189,
-    178731,
-    148085,
-    81549,
-    53745,
-    124070,
-    132420,
-    148863,
-    81587,
-    162486,
-    91352,
-    13286,
-    131447,
-    167601,
-    45495,
-    122825,
-    141433,
-    35360,
-    128570,
-    102000,
-    155011,
-    92631,
-    81503,
-    83396,
-    169366,
-    79885,
-    14777,
-    10640,
-    143524,
-    84210,
-    97512,
-    177656,
-    147613,
-    64815,
-    153368,
-    34014,
-    169684,
-    168922,
-    78890,
-    126384,
-    3115,
-    21336,
-    161482,
-    126220,
-    135667,
-    140457,
-    59436,
-    10343,
-    135419,
-    28898,
-    152251,
-    59499,
-    22502,
-    4493,
-    32131,
-    77580,
-    36165,
-    125033,
-    121165,
-    79470,
-    154155,
-    53959,
-    121565,
-    165921,
-    174372,
-    7713,
-    101149,
-    35615,
-    153449,
-    146475,
-    22288,
-    172302,
-    75557,
-    53859,
-    127394,
-    169319,
-    150514,
-    30357,
-    24246,
-    139014,
-    53384,
-    11469,
-    23148,
-    89623,
-    93352,
-    126516,
-    12702,
-    178585,
-    149196,
-    41062,
-    177213,
-    99552,
-    117294,
-    167883,
-    173502,
-    65028,
-    2999,
-    127533,
-    17262,
-    162096,
-    143537,
-    177439,
-    26860,
-    128628,
-    105496,
-    18500,
-    178149,
-    70597,
-    171725,
-    75160,
-    111059,
-    89699,
-    156199,
-    64418,
-    107964,
-    152378,
-    59847,
-    6573,
-    138184,
-    64098,
-    10825,
-    66241,
-    117414,
-    166980,
-    73152,
-    129467,
-    109915,
-    89178,
-    34989,
-    149342,
-    50643,
-    11642,
-    22239,
-    22139,
-    798,
-    32375,
-    7488,
-    43855,
-    174175,
-    116012,
-    89544,
-    62697,
-    121380,
-    23170,
-    20081,
-    103282,
-    57697,
-    96495,
-    152803,
-    153494,
-    11530,
-    178253,
-    12176,
-    175583,
-    68434,
-    56775,
-    64327,
-    59039,
-    79219,
-    83729,
-    96165,
-    134132,
-    133986,
-    24846,
-    21282,
-    38001,
-    57308,
-    59784,
-    165817,
-    155768,
-    52578,
-    132136,
-    35936,
-    105465,
-    53838,
-    103597,
-    101539,
-    90756,
-    126730,
-    130562,
-    141801,
-    67877,
-    41642,
-    136258,
-    132664,
-    140692,
-    27713,
-    14731,
-    25427,
-    160691,
-    431,
-    141009,
-    49791,
-    177500,
-    25708,
-    44595,
-    4940,
-    64830,
-    74372,
-    31616,
-    78691,
-    162603,
-    50278,
-    134329,
-    58992,
-    165312,
-    81007,
-    87538,
-    15714,
-    56412,
-    36542,
-    87764,
-    15206,
-    162070,
-    111520,
-    37691,
-    90304,
-    87171,
-    69215,
-    171765,
-    124821,
-    138798,
-    45665,
-    157009,
-    124787,
-    115465,
-    159332,
-    99750,
-    17168,
-    128679,
-    62367,
-    156944,
-    59876,
-    112736,
-    96403,
-    46119,
-    117140,
-    79050,
-    173436,
-    25227,
-    13943,
-    150199,
-    39291,
-    19868,
-    17626,
-    10406,
-    124893,
-    10228,
-    161670,
-    54218,
-    79959,
-    90673,
-    44132,
-    137239,
-    64122,
-    132247,
-    78584,
-    50633,
-    47475,
-    48622,
-    7950,
-    129867,
-    66484,
-    158780,
-    158864,
-    70534,
-    79812,
-    86106,
-    115460,
-    64867,
-    43150,
-    84032,
-    112845,
-    176185,
-    19863,
-    164114,
-    169436,
-    7666,
-    71052,
-    156035,
-    53710,
-    27656,
-    24388,
-    90994,
-    112503,
-    110118,
-    122814,
-    142316,
-    58136,
-    39649,
-    154309,
-    148751,
-    173091,
-    20216,
-    3015,
-    111038,
-    109680,
-    47543,
-    143809,
-    177934,
-    53731,
-    103181,
-    146955,
-    38666,
-    113470,
-    103059,
-    69008,
-    649,
-    144742,
-    128990,
-    86326,
-    172234,
-    156322,
-    4810,
-    29416,
-    110001,
-    168666,
-    107406,
-    57912,
-    165603,
-    35364,
-    66108,
-    100557,
-    34632,
-    153810,
-    52724,
-    90126,
-    71636,
-    64857,
-    134154,
-    99877,
-    129978,
-    20602,
-    27842,
-    58681,
-    118955,
-    83469,
-    119852,
-    70638,
-    98674,
-    118397,
-    167678,
-    25690,
-    13857,
-    147976,
-    55136,
-    82735,
-    9931,
-    174475,
-    121365,
-    130938,
-    82826,
-    16998,
-    20767,
-    44535,
-    136640,
-    127929,
-    154131,
-    162063,
-    70107,
-    126325,
-    86551,
-    93182,
-    25738,
-    38004,
-    31486,
-    3194,
-    92611,
-    137642,
-    123237,
-    62664,
-    82827,
-    88286,
-    104142,
-    103358,
-    133255,
-    154619,
-    100398,
-    40140,
-    100316,
-    128230,
-    77720,
-    48620,
-    47205,
-    33994,
-    13366,
-    9514,
-    21838,
-    32442,
-    58850,
-    7261,
-    90603,
-    136397,
-    12012,
-    122200,
-    47785,
-    141709,
-    178338,
-    3605,
-    174794,
-    98291,
-    22327,
-    138810,
-    196,
-    110618,
-    55320,
-    9418,
-    123928,
-    77143,
-    168354,
-    27540,
-    68906,
-    112464,
-    104621,
-    153701,
-    128851,
-    11317,
-    100915,
-    71235,
-    73017,
-    47064,
-    114984,
-    114033,
-    32483,
-    47795,
-    134970,
-    48963,
-    112412,
-    92376,
-    161492,
-    29384,
-    143241,
-    164465,
-    128044,
-    152921,
-    58170,
-    84954,
-    23296,
-    130539,
-    99527,
-    1983,
-    64884,
-    59594,
-    22375,
-    105012,
-    16717,
-    75163,
-    126827,
-    50880,
-    159594,
-    49302,
-    72839,
-    160792,
-    159888,
-    111820,
-    55528,
-    129182,
-    119889,
-    145437,
-    137120,
-    144175,
-    4381,
-    13547,
-    176418,
-    46949,
-    11309,
-    117902,
-    139393,
-    83105,
-    10160,
-    98192,
-    63047,
-    144881,
-    160221,
-    131085,
-    103834,
-    92567,
-    154352,
-    134810,
-    75046,
-    175503,
-    177931,
-    40913,
-    91572,
-    105110,
-    157760,
-    141491,
-    173419,
-    42181,
-    129637,
-    145945,
-    111492,
-    42811,
-    159143,
-    97721,
-    54652,
-    77647,
-    30320,
-    142795,
-    105979,
-    92951,
-    17990,
-    46135,
-    59348,
-    114922,
-    86297,
-    10653,
-    150301,
-    92621,
-    151681,
-    84959,
-    91479,
-    92287,
-    125759,
-    118983,
-    48959,
-    67953,
-    124911,
-    76194,
-    73908,
-    147179,
-    99119,
-    152051,
-    71967,
-    160406,
-    165019,
-    122041,
-    141556,
-    103911,
-    64329,
-    174145,
-    125123,
-    45976,
-    25189,
-    71846,
-    43648,
-    61043,
-    97966,
-    109797,
-    100197,
-    46592,
-    47994,
-    143225,
-    19720,
-    5921,
-    5555,
-    124927,
-    31326,
-    20772,
-    168717,
-    52615,
-    119220,
-    175200,
-    167274,
-    3891,
-    87478,
-    110176,
-    99392,
-    41027,
-    20769,
-    131976,
-    133855,
-    161534,
-    63429,
-    88455,
-    38783,
-    173373,
-    168516,
-    62450,
-    114043,
-    88306,
-    89703,
-    50931,
-    106028,
-    48126,
-    142580,
-    113335,
-    107313,
-    159233,
-    77646,
-    69297,
-    2845,
-    120453,
-    107877,
-    60072,
-    11901,
-    153732,
-    148050,
-    72524,
-    60457,
-    91760,
-    14623,
-    142958,
-    155891,
-    146364,
-    27194,
-    160758,
-    168764,
-    16710,
-    119082,
-    114238,
-    92089,
-    9626,
-    84333,
-    62004,
-    106368,
-    73970,
-    58083,
-    81921,
-    134984,
-    27657,
-    68174,
-    133452,
-    102611,
-    62860,
-    46302,
-    140925,
-    173282,
-    158972,
-    104696,
-    149988,
-    28139,
-    77971,
-    27901,
-    11936,
-    164672,
-    17975,
-    69646,
-    41368,
-    17795,
-    16681,
-    9902,
-    103354,
-    119677,
-    139358,
-    148828,
-    53291,
-    86144,
-    164343,
-    86374,
-    89884,
-    73505,
-    40076,
-    166518,
-    32169,
-    58511,
-    84451,
-    90669,
-    10139,
-    144037,
-    163171,
-    144621,
-    115371,
-    125236,
-    50915,
-    63907,
-    34304,
-    142468,
-    37559,
-    161429,
-    80434,
-    164807,
-    28553,
-    81018,
-    3965,
-    73683,
-    150477,
-    71913,
-    13540,
-    56129,
-    122380,
-    85727,
-    72742,
-    160898,
-    166304,
-    143086,
-    84602,
-    157452,
-    80530,
-    19860,
-    177886,
-    168537,
-    140751,
-    70700,
-    40970,
-    169460,
-    7291,
-    11389,
-    177116,
-    29454,
-    84223,
-    150940,
-    127951,
-    47560,
-    129062,
-    59279,
-    28211,
-    50288,
-    145504,
-    150546,
-    172950,
-    11014,
-    31322,
-    103939,
-    4764,
-    127093,
-    167255,
-    73976,
-    55734,
-    143382,
-    48400,
-    174416,
-    144435,
-    8707,
-    101348,
-    75402,
-    98761,
-    86495,
-    10384,
-    135846,
-    77165,
-    124676,
-    122972,
-    120099,
-    89503,
-    93032,
-    71183,
-    120595,
-    105337,
-    125255,
-    67273,
-    126715,
-    37373,
-    151084,
-    64735,
-    178126,
-    106166,
-    71513,
-    130660,
-    106851,
-    131986,
-    62844,
-    152475,
-    21606,
-    50661,
-    122468,
-    15602,
-    118484,
-    30250,
-    143447,
-    87997,
-    140464,
-    63071,
-    84807,
-    104137,
-    124820,
-    42737,
-    47910,
-    121059,
-    109673,
-    37284,
-    48305,
-    142493,
-    68576,
-    170103,
-    134459,
-    61782,
-    47469,
-    17699,
-    41588,
-    32182,
-    21590,
-    122803,
-    136224,
-    116699,
-    144581,
-    42518,
-    156370,
-    122010,
-    88083,
-    156246,
-    16585,
-    84662,
-    101271,
-    151592,
-    152555,
-    134549,
-    21616,
-    17123,
-    86797,
-    62854,
-    152801,
-    37393,
-    113310,
-    34375,
-    57634,
-    62276,
-    166326,
-    108770,
-    80342,
-    159722,
-    18652,
-    112877,
-    28201,
-    176100,
-    57226,
-    133940,
-    52843,
-    77403,
-    151248,
-    155147,
-    93750,
-    1269,
-    129293,
-    155007,
-    176730,
-    20033,
-    143886,
-    41661,
-    89235,
-    65354,
-    113150,
-    164385,
-    114959,
-    145150,
-    175254,
-    46924,
-    12310,
-    16305,
-    177175,
-    100444,
-    69077,
-    120613,
-    52944,
-    170623,
-    81585,
-    29337,
-    157788,
-    31124,
-    150027,
-    149572,
-    21910,
-    56406,
-    39894,
-    44909,
-    46081,
-    15379,
-    37465,
-    159410,
-    39881,
-    8487,
-    78347,
-    3377,
-    7134,
-    72194,
-    82221,
-    140677,
-    35182,
-    148552,
-    162401,
-    135918,
-    563,
-    90903,
-    131834,
-    68532,
-    178525,
-    161182,
-    48654,
-    29383,
-    85182,
-    114002,
-    167615,
-    154250,
-    157475,
-    44260,
-    7908,
-    174445,
-    159029,
-    59874,
-    122483,
-    53015,
-    113355,
-    78746,
-    168724,
-    155089,
-    100896,
-    40818,
-    15501,
-    55970,
-    73276,
-    91189,
-    145226,
-    91944,
-    2351,
-    143631,
-    129911,
-    109233,
-    40820,
-    123380,
-    131955,
-    167732,
-    104239,
-    175597,
-    97269,
-    155054,
-    144589,
-    13506,
-    7149,
-    51695,
-    118281,
-    27758,
-    77250,
-    397,
-    159290,
-    158839,
-    20035,
-    134779,
-    46773,
-    38915,
-    104003,
-    143983,
-    152517,
-    143645,
-    175293,
-    56799,
-    49266,
-    19490,
-    170032,
-    46159,
-    20182,
-    174421,
-    169425,
-    134653,
-    138728,
-    169711,
-    2689,
-    8022,
-    82003,
-    152744,
-    103417,
-    14447,
-    92081,
-    91469,
-    132586,
-    149405,
-    135805,
-    75860,
-    135358,
-    179468,
-    72938,
-    100202,
-    175753,
-    35724,
-    106670,
-    18148,
-    171518,
-    5314,
-    116310,
-    151270,
-    39567,
-    120776,
-    134514,
-    53970,
-    55811,
-    150568,
-    103322,
-    175074,
-    20587,
-    46859,
-    17239,
-    109678,
-    101693,
-    35016,
-    172725,
-    152081,
-    60798,
-    76995,
-    171618,
-    173074,
-    24985,
-    71859,
-    56624,
-    172332,
-    20173,
-    126080,
-    23622,
-    19444,
-    60401,
-    14455,
-    102919,
-    56913,
-    3396,
-    134512,
-    148724,
-    20015,
-    125213,
-    5564,
-    138815,
-    74086,
-    124962,
-    89706,
-    96317,
-    162652,
-    141344,
-    115699,
-    146489,
-    154737,
-    33626,
-    128442,
-    78304,
-    82240,
-    39391,
-    27971,
-    4,
-    159853,
-    162821,
-    124136,
-    149274,
-    118444,
-    4579,
-    53474,
-    126957,
-    18294,
-    126783,
-    85735,
-    111662,
-    157484,
-    104486,
-    35730,
-    97398,
-    118708,
-    119317,
-    5667,
-    87689,
-    16268,
-    112375,
-    173531,
-    21561,
-    116701,
-    75114,
-    128299,
-    86887,
-    101591,
-    178846,
-    28331,
-    173866,
-    160291,
-    119760,
-    145070,
-    153096,
-    33364,
-    84282,
-    74412,
-    39456,
-    68110,
-    3606,
-    165971,
-    141890,
-    3310,
-    139670,
-    52759,
-    4820,
-    47730,
-    143017,
-    157909,
-    117989,
-    120664,
-    116183,
-    41122,
-    4643,
-    56495,
-    52675,
-    32250,
-    94854,
-    43355,
-    68571,
-    167839,
-    68076,
-    127888,
-    128360,
-    98088,
-    12717,
-    150015,
-    70417,
-    106674,
-    35136,
-    140279,
-    16231,
-    87371,
-    123091,
-    154456,
-    44432,
-    80029,
-    58435,
-    59629,
-    99914,
-    28970,
-    121129,
-    166728,
-    14038,
-    42958,
-    133721,
-    144087,
-    6502,
-    28607,
-    156353,
-    43711,
-    98209,
-    154489,
-    3483,
-    129761,
-    117893,
-    24108,
-    167954,
-    82766,
-    37048,
-    4051,
-    80659,
-    25400,
-    144070,
-    124448,
-    81047,
-    33803,
-    98150,
-    465,
-    175096,
-    179465,
-    107312,
-    174569,
-    68995,
-    141610,
-    59141,
-    118713,
-    89507,
-    125773,
-    169769,
-    45235,
-    101452,
-    145974,
-    60152,
-    40895,
-    131264,
-    13723,
-    121461,
-    62326,
-    26052,
-    22760,
-    40279,
-    134056,
-    56013,
-    154977,
-    172029,
-    9258,
-    18813,
-    467,
-    160799,
-    93746,
-    9203,
-    127147,
-    160685,
-    62255,
-    67350,
-    122568,
-    102088,
-    157432,
-    117429,
-    156350,
-    42949,
-    147150,
-    1651,
-    72766,
-    113101,
-    81398,
-    52248,
-    165007,
-    97837,
-    44207,
-    13631,
-    35586,
-    56241,
-    55537,
-    5757,
-    126844,
-    71372,
-    158003,
-    97162,
-    42947,
-    172258,
-    117467,
-    460,
-    124543,
-    9122,
-    13705,
-    23269,
-    78510,
-    171714,
-    46872,
-    162542,
-    64295,
-    131441,
-    37127,
-    44270,
-    109560,
-    139381,
-    57051,
-    73192,
-    54845,
-    94640,
-    32049,
-    17134,
-    163407,
-    43349,
-    178041,
-    75282,
-    63320,
-    105557,
-    112830,
-    98188,
-    19668,
-    124347,
-    114743,
-    53040,
-    119056,
-    51824,
-    75730,
-    94757,
-    119302,
-    36330,
-    177327,
-    8137,
-    85079,
-    89099,
-    94307,
-    123289,
-    163849,
-    162162,
-    35340,
-    57666,
-    16638,
-    39124,
-    163453,
-    170908,
-    75322,
-    155814,
-    161606,
-    172790,
-    73055,
-    22216,
-    64240,
-    4117,
-    152388,
-    151053,
-    169835,
-    140763,
-    132833,
-    62883,
-    107413,
-    134737,
-    179090,
-    160084,
-    20127,
-    45803,
-    6370,
-    3496,
-    59349,
-    21569,
-    56906,
-    53879,
-    590,
-    148218,
-    119910,
-    132695,
-    57917,
-    103162,
-    25452,
-    169988,
-    176145,
-    98800,
-    130780,
-    118797,
-    2144,
-    129313,
-    51331,
-    111721,
-    108112,
-    82480,
-    7514,
-    179116,
-    31180,
-    132973,
-    6018,
-    95314,
-    80718,
-    7496,
-    145664,
-    137615,
-    175379,
-    20160,
-    10089,
-    57004,
-    128694,
-    48072,
-    66765,
-    125020,
-    94727,
-    48282,
-    34359,
-    107110,
-    118447,
-    158772,
-    106016,
-    154196,
-    67071,
-    58400,
-    82550,
-    64962,
-    92749,
-    107683,
-    64910,
-    131039,
-    128744,
-    15799,
-    99401,
-    37036,
-    148181,
-    73799,
-    18425,
-    158815,
-    8965,
-    37610,
-    154,
-    10829,
-    172965,
-    49188,
-    121836,
-    176468,
-    178971,
-    70830,
-    112149,
-    44317,
-    38856,
-    37231,
-    168720,
-    146322,
-    87856,
-    8648,
-    175633,
-    116621,
-    163153,
-    106893,
-    130392,
-    135596,
-    152674,
-    17573,
-    168935,
-    5890,
-    78945,
-    13314,
-    131924,
-    156074,
-    148030,
-    58777,
-    56272,
-    74958,
-    15951,
-    18913,
-    2464,
-    78491,
-    20306,
-    112199,
-    154020,
-    80367,
-    47433,
-    78803,
-    4563,
-    75768,
-    159578,
-    8825,
-    2734,
-    29710,
-    5680,
-    162521,
-    176355,
-    36625,
-    27334,
-    34019,
-    35831,
-    428,
-    74368,
-    124319,
-    34115,
-    68778,
-    140503,
-    168053,
-    145593,
-    79052,
-    45198,
-    84776,
-    3689,
-    94477,
-    134230,
-    129615,
-    58167,
-    112087,
-    13089,
-    110785,
-    37154,
-    92117,
-    39716,
-    54608,
-    12320,
-    116312,
-    124268,
-    35424,
-    19825,
-    19054,
-    33300,
-    165626,
-    108470,
-    34606,
-    91985,
-    168931,
-    41338,
-    92363,
-    141115,
-    18494,
-    103947,
-    107510,
-    114895,
-    64316,
-    110628,
-    36725,
-    172439,
-    149546,
-    46823,
-    93495,
-    173521,
-    146139,
-    98865,
-    49311,
-    165706,
-    22645,
-    174273,
-    149234,
-    83954,
-    4322,
-    77722,
-    128151,
-    90035,
-    90401,
-    96717,
-    69689,
-    93998,
-    84464,
-    177476,
-    14794,
-    68802,
-    121038,
-    5535,
-    74068,
-    87100,
-    46781,
-    104221,
-    173368,
-    81646,
-    155227,
-    156642,
-    99193,
-    177257,
-    40051,
-    85069,
-    107389,
-    13523,
-    175381,
-    170565,
-    165171,
-    28622,
-    124477,
-    92682,
-    131734,
-    28667,
-    6581,
-    123218,
-    61708,
-    73800,
-    159160,
-    125108,
-    17638,
-    143195,
-    133903,
-    125471,
-    96790,
-    38987,
-    52911,
-    146281,
-    117916,
-    166577,
-    27413,
-    58675,
-    61101,
-    135254,
-    71063,
-    167934,
-    128725,
-    99874,
-    965,
-    33225,
-    103413,
-    154670,
-    2323,
-    79995,
-    107043,
-    3526,
-    110525,
-    130063,
-    41264,
-    17495,
-    144265,
-    161682,
-    85763,
-    169480,
-    30758,
-    46160,
-    127077,
-    71051,
-    144147,
-    11591,
-    151702,
-    22416,
-    110427,
-    48168,
-    148849,
-    14025,
-    19690,
-    20915,
-    14467,
-    102942,
-    84907,
-    57785,
-    129318,
-    32108,
-    53212,
-    21348,
-    36874,
-    48194,
-    156512,
-    107020,
-    43483,
-    70488,
-    133304,
-    146208,
-    89660,
-    161259,
-    40159,
-    1870,
-    35641,
-    6419,
-    60119,
-    160500,
-    102835,
-    67651,
-    119244,
-    121777,
-    29911,
-    59230,
-    80031,
-    69780,
-    118591,
-    44243,
-    173299,
-    34061,
-    169011,
-    9995,
-    116008,
-    8851,
-    28245,
-    148943,
-    177797,
-    124629,
-    143620,
-    68784,
-    26679,
-    167729,
-    28046,
-    22398,
-    15724,
-    179617,
-    40179,
-    68452,
-    47706,
-    166549,
-    39296,
-    53138,
-    9878,
-    90227,
-    119208,
-    75183,
-    62955,
-    75666,
-    120337,
-    98429,
-    155385,
-    85307,
-    49186,
-    140587,
-    160832,
-    130983,
-    145982,
-    94749,
-    27878,
-    56923,
-    145723,
-    97116,
-    155933,
-    50745,
-    96700,
-    175314,
-    22096,
-    131908,
-    74087,
-    26960,
-    70630,
-    37825,
-    95888,
-    124883,
-    67449,
-    146689,
-    108133,
-    128627,
-    58905,
-    504,
-    144203,
-    90753,
-    127161,
-    7594,
-    104098,
-    177292,
-    130645,
-    8347,
-    177338,
-    75015,
-    43429,
-    57910,
-    139397,
-    16355,
-    122701,
-    175327,
-    32204,
-    43078,
-    94716,
-    27349,
-    30340,
-    28154,
-    154780,
-    35049,
-    177056,
-    55793,
-    19009,
-    3275,
-    26774,
-    165514,
-    8018,
-    149250,
-    30933,
-    26801,
-    170877,
-    89778,
-    12079,
-    135942,
-    15275,
-    71686,
-    50104,
-    122981,
-    23017,
-    97815,
-    25770,
-    130979,
-    33097,
-    45352,
-    103414,
-    97731,
-    135924,
-    178564,
-    44776,
-    34900,
-    178028,
-    4887,
-    40732,
-    25134,
-    96056,
-    159478,
-    136346,
-    81693,
-    121460,
-    11468,
-    50580,
-    98398,
-    12049,
-    59792,
-    12002,
-    170689,
-    44918,
-    82161,
-    21036,
-    61015,
-    10235,
-    17318,
-    178539,
-    8085,
-    83079,
-    118145,
-    48636,
-    147380,
-    93093,
-    2058,
-    94250,
-    164210,
-    179825,
-    117672,
-    153136,
-    39172,
-    92250,
-    151771,
-    60595,
-    72767,
-    116496,
-    110975,
-    157146,
-    66362,
-    79136,
-    32621,
-    108054,
-    32586,
-    77523,
-    121547,
-    15164,
-    32038,
-    92898,
-    103308,
-    85575,
-    74173,
-    3556,
-    111655,
-    63126,
-    118398,
-    158706,
-    98081,
-    148898,
-    59020,
-    50399,
-    73389,
-    94532,
-    32133,
-    131482,
-    152569,
-    131079,
-    85423,
-    47534,
-    50132,
-    15337,
-    2630,
-    11407,
-    176980,
-    131288,
-    117287,
-    82937,
-    132272,
-    30692,
-    160781,
-    155886,
-    153198,
-    80364,
-    101602,
-    113665,
-    23305,
-    1784,
-    648,
-    64335,
-    107846,
-    56586,
-    65368,
-    78064,
-    92841,
-    59879,
-    147160,
-    72344,
-    33825,
-    111943,
-    34101,
-    14812,
-    172555,
-    25349,
-    22658,
-    18063,
-    74709,
-    57672,
-    88070,
-    19080,
-    42118,
-    18971,
-    62258,
-    72891,
-    154816,
-    97163,
-    18247,
-    43768,
-    138668,
-    177555,
-    129494,
-    168734,
-    168934,
-    119722,
-    150958,
-    71891,
-    151927,
-    176305,
-    62079,
-    9485,
-    136959,
-    168517,
-    167386,
-    172643,
-    32403,
-    9397,
-    130255,
-    3296,
-    87047,
-    27361,
-    104386,
-    164893,
-    136773,
-    160357,
-    84621,
-    20188,
-    47137,
-    68361,
-    106084,
-    152302,
-    142074,
-    58815,
-    163669,
-    143176,
-    154927,
-    49065,
-    16016,
-    100780,
-    53843,
-    50244,
-    55603,
-    163269,
-    42984,
-    176651,
-    86809,
-    25894,
-    130540,
-    122714,
-    103174,
-    6211,
-    126923,
-    127931,
-    127488,
-    96223,
-    42806,
-    97065,
-    158977,
-    1795,
-    110769,
-    58887,
-    85674,
-    118881,
-    151202,
-    171373,
-    8001,
-    172918,
-    29455,
-    90601,
-    129674,
-    87850,
-    7318,
-    177264,
-    165832,
-    121492,
-    134616,
-    89880,
-    36824,
-    179493,
-    48869,
-    70508,
-    2157,
-    127381,
-    165375,
-    150493,
-    107490,
-    97407,
-    24035,
-    147684,
-    114351,
-    52605,
-    126520,
-    55211,
-    39683,
-    3082,
-    59738,
-    179823,
-    51019,
-    168857,
-    157447,
-    179743,
-    127285,
-    61896,
-    163150,
-    10457,
-    144220,
-    179313,
-    175000,
-    38713,
-    70945,
-    25611,
-    88380,
-    62141,
-    159754,
-    7834,
-    17063,
-    151962,
-    147922,
-    71184,
-    400,
-    36356,
-    127250,
-    106852,
-    85131,
-    163578,
-    46052,
-    65325,
-    16249,
-    44677,
-    156873,
-    94601,
-    109462,
-    48646,
-    6203,
-    39360,
-    135256,
-    38279,
-    157231,
-    12113,
-    178176,
-    95902,
-    133668,
-    100242,
-    126229,
-    88537,
-    26422,
-    85035,
-    21971,
-    162407,
-    156300,
-    26087,
-    89253,
-    86,
-    62881,
-    856,
-    132320,
-    52533,
-    10664,
-    69094,
-    147091,
-    152474,
-    155658,
-    17095,
-    148588,
-    153244,
-    146463,
-    38618,
-    159902,
-    42038,
-    155851,
-    66806,
-    150446,
-    164958,
-    10750,
-    89434,
-    43914,
-    104327,
-    18215,
-    147447,
-    55910,
-    18008,
-    5629,
-    173068,
-    60082,
-    161551,
-    45480,
-    135344,
-    71387,
-    36272,
-    173932,
-    9624,
-    40518,
-    92411,
-    11427,
-    170231,
-    170128,
-    62567,
-    112415,
-    128647,
-    167315,
-    106821,
-    54710,
-    99547,
-    48882,
-    46808,
-    173578,
-    45130,
-    107920,
-    132226,
-    96827,
-    52722,
-    82732,
-    111309,
-    139010,
-    48942,
-    155119,
-    113444,
-    20612,
-    147619,
-    91603,
-    177434,
-    174153,
-    20266,
-    63282,
-    92308,
-    102784,
-    174082,
-    171739,
-    111427,
-    82089,
-    166968,
-    92789,
-    63415,
-    136161,
-    162661,
-    64730,
-    110298,
-    101057,
-    7480,
-    159372,
-    99263,
-    145062,
-    98122,
-    138257,
-    178323,
-    7660,
-    96713,
-    177302,
-    16661,
-    77076,
-    149321,
-    15872,
-    6699,
-    106846,
-    130099,
-    155487,
-    176144,
-    170023,
-    155111,
-    151664,
-    53457,
-    25487,
-    6234,
-    114513,
-    44163,
-    96963,
-    66930,
-    150084,
-    178611,
-    75508,
-    171185,
-    69486,
-    36040,
-    137618,
-    150805,
-    97637,
-    176840,
-    17492,
-    55997,
-    154069,
-    69203,
-    42896,
-    89238,
-    21502,
-    47000,
-    81195,
-    175269,
-    126405,
-    87816,
-    41348,
-    170186,
-    15562,
-    136090,
-    13737,
-    85828,
-    52548,
-    21549,
-    158596,
-    64210,
-    155866,
-    148892,
-    149144,
-    136936,
-    2297,
-    45184,
-    157113,
-    24327,
-    14659,
-    6423,
-    73871,
-    157498,
-    143750,
-    65024,
-    132061,
-    4634,
-    7637,
-    161522,
-    71671,
-    65440,
-    62686,
-    137003,
-    86216,
-    163963,
-    8412,
-    135998,
-    105807,
-    87920,
-    130310,
-    96547,
-    144395,
-    86546,
-    88949,
-    20949,
-    102725,
-    171687,
-    177517,
-    41696,
-    133814,
-    6062,
-    85775,
-    109070,
-    22266,
-    75074,
-    128708,
-    89027,
-    72141,
-    74416,
-    99887,
-    158240,
-    90235,
-    97973,
-    45031,
-    158447,
-    4031,
-    76392,
-    155064,
-    164947,
-    57330,
-    24431,
-    41002,
-    173239,
-    70005,
-    79279,
-    139524,
-    49161,
-    19275,
-    48727,
-    55843,
-    13273,
-    98701,
-    152010,
-    175973,
-    758,
-    38884,
-    40056,
-    21010,
-    146379,
-    109471,
-    143412,
-    10482,
-    139457,
-    7052,
-    39416,
-    161251,
-    129769,
-    38883,
-    83743,
-    137200,
-    89684,
-    8932,
-    88150,
-    101175,
-    170566,
-    154448,
-    16222,
-    26578,
-    78338,
-    60391,
-    68985,
-    138441,
-    54106,
-    104902,
-    19554,
-    89286,
-    11181,
-    44289,
-    150197,
-    131081,
-    105093,
-    98063,
-    60677,
-    176568,
-    175060,
-    137047,
-    68010,
-    20218,
-    140855,
-    177619,
-    155668,
-    89327,
-    82024,
-    133901,
-    75826,
-    26147,
-    45571,
-    143096,
-    141424,
-    69043,
-    126777,
-    74494,
-    172447,
-    176567,
-    163309,
-    167165,
-    7979,
-    49829,
-    19898,
-    46885,
-    88850,
-    11786,
-    76852,
-    133902,
-    137767,
-    175219,
-    110557,
-    131010,
-    106693,
-    40555,
-    111913,
-    96318,
-    15445,
-    21468,
-    69845,
-    6363,
-    18078,
-    77698,
-    53099,
-    77777,
-    171393,
-    158140,
-    153411,
-    109059,
-    169271,
-    164677,
-    126196,
-    114442,
-    24023,
-    143705,
-    51180,
-    176907,
-    54171,
-    95920,
-    168151,
-    75581,
-    11490,
-    139172,
-    21379,
-    77325,
-    111726,
-    174578,
-    37627,
-    47389,
-    47028,
-    90398,
-    41471,
-    126178,
-    56130,
-    162054,
-    134604,
-    100302,
-    60979,
-    170610,
-    81228,
-    53329,
-    91708,
-    16831,
-    9898,
-    128384,
-    116937,
-    163557,
-    12004,
-    44372,
-    16237,
-    127052,
-    5326,
-    77713,
-    127952,
-    42068,
-    56146,
-    76683,
-    170548,
-    133867,
-    173210,
-    151316,
-    41712,
-    126556,
-    49804,
-    11421,
-    79418,
-    162847,
-    7653,
-    46377,
-    19315,
-    73577,
-    82853,
-    54119,
-    59441,
-    152480,
-    16505,
-    132038,
-    110852,
-    58960,
-    51662,
-    126014,
-    172139,
-    79182,
-    149963,
-    174923,
-    22175,
-    25664,
-    149096,
-    83448,
-    176777,
-    2701,
-    170173,
-    13700,
-    110655,
-    38248,
-    174464,
-    19598,
-    103974,
-    38350,
-    52113,
-    162877,
-    105738,
-    137170,
-    73433,
-    83259,
-    14516,
-    178066,
-    100164,
-    178674,
-    171805,
-    78932,
-    100129,
-    89639,
-    114904,
-    90616,
-    163888,
-    149793,
-    166301,
-    148354,
-    22213,
-    36630,
-    20322,
-    167070,
-    98289,
-    166659,
-    144584,
-    97635,
-    98881,
-    91562,
-    93205,
-    2746,
-    137320,
-    11627,
-    9105,
-    113902,
-    39882,
-    176212,
-    54200,
-    37740,
-    55319,
-    62657,
-    91987,
-    172503,
-    92018,
-    23427,
-    146896,
-    146707,
-    91684,
-    86999,
-    89094,
-    112028,
-    113934,
-    40691,
-    103681,
-    171178,
-    45739,
-    127842,
-    105903,
-    140772,
-    150467,
-    176509,
-    115264,
-    82672,
-    127116,
-    6971,
-    25841,
-    107609,
-    112577,
-    18574,
-    177562,
-    89800,
-    82610,
-    112867,
-    44978,
-    6555,
-    139106,
-    5964,
-    55583,
-    177540,
-    114470,
-    151618,
-    89165,
-    7964,
-    49226,
-    177488,
-    44704,
-    44905,
-    48283,
-    109740,
-    97264,
-    102352,
-    59369,
-    1178,
-    43493,
-    46018,
-    10648,
-    108325,
-    24540,
-    4816,
-    143238,
-    175222,
-    3367,
-    173200,
-    92511,
-    88810,
-    2507,
-    134963,
-    145501,
-    102934,
-    42458,
-    93129,
-    58908,
-    111448,
-    88494,
-    40921,
-    143882,
-    45045,
-    86718,
-    26821,
-    60362,
-    15465,
-    143545,
-    137278,
-    107702,
-    13974,
-    9905,
-    21979,
-    151896,
-    53101,
-    179374,
-    111245,
-    143829,
-    101308,
-    8415,
-    49487,
-    109182,
-    104072,
-    136533,
-    38597,
-    100430,
-    92489,
-    152205,
-    60423,
-    132006,
-    148353,
-    114807,
-    21663,
-    139338,
-    15870,
-    174333,
-    101260,
-    59190,
-    45070,
-    47258,
-    82808,
-    62725,
-    101212,
-    175389,
-    148804,
-    151939,
-    60729,
-    14024,
-    137987,
-    177790,
-    44286,
-    112393,
-    430,
-    139617,
-    19113,
-    111002,
-    1361,
-    136236,
-    175422,
-    149940,
-    98466,
-    106214,
-    132816,
-    59105,
-    2662,
-    101227,
-    148272,
-    127662,
-    61271,
-    89669,
-    107027,
-    128414,
-    128559,
-    132627,
-    5226,
-    8953,
-    109004,
-    23663,
-    130931,
-    141048,
-    138585,
-    99809,
-    40440,
-    50270,
-    127587,
-    137083,
-    144360,
-    105060,
-    25324,
-    127742,
-    321,
-    13721,
-    116557,
-    115533,
-    127712,
-    18003,
-    5292,
-    17766,
-    49885,
-    8172,
-    129209,
-    60367,
-    62418,
-    39311,
-    112309,
-    115854,
-    126577,
-    100439,
-    126143,
-    108676,
-    142646,
-    37518,
-    113284,
-    143123,
-    90019,
-    109558,
-    10088,
-    26058,
-    39295,
-    45897,
-    108844,
-    107974,
-    9835,
-    90575,
-    3210,
-    25316,
-    8810,
-    24177,
-    141787,
-    135661,
-    16785,
-    12423,
-    110900,
-    98823,
-    126207,
-    97763,
-    115670,
-    129933,
-    152712,
-    91395,
-    18400,
-    106042,
-    126124,
-    149036,
-    115661,
-    132337,
-    114635,
-    136992,
-    115399,
-    10154,
-    96475,
-    10824,
-    14170,
-    98807,
-    23538,
-    2324,
-    148787,
-    40987,
-    147424,
-    61941,
-    20333,
-    38706,
-    25041,
-    2913,
-    134532,
-    130166,
-    61732,
-    92972,
-    102656,
-    98571,
-    51709,
-    126424,
-    57826,
-    144244,
-    6284,
-    151874,
-    37781,
-    62857,
-    138699,
-    91300,
-    136422,
-    141190,
-    13800,
-    15874,
-    146602,
-    18844,
-    62770,
-    54320,
-    56110,
-    130069,
-    58868,
-    126564,
-    142877,
-    50398,
-    15754,
-    131210,
-    103019,
-    10028,
-    8745,
-    46472,
-    142568,
-    95899,
-    3461,
-    128249,
-    90348,
-    133766,
-    97166,
-    94678,
-    100256,
-    114720,
-    47761,
-    49786,
-    7696,
-    14475,
-    3085,
-    136575,
-    100742,
-    17268,
-    15495,
-    101642,
-    23495,
-    97609,
-    138011,
-    4603,
-    11253,
-    143388,
-    45808,
-    4733,
-    142309,
-    108089,
-    3994,
-    2847,
-    139164,
-    14931,
-    97121,
-    51590,
-    90749,
-    111495,
-    104998,
-    19599,
-    51555,
-    45165,
-    116879,
-    136010,
-    14131,
-    116119,
-    101099,
-    106997,
-    94681,
-    94357,
-    110035,
-    53545,
-    143615,
-    99432,
-    96824,
-    100774,
-    139569,
-    94537,
-    141546,
-    17583,
-    111130,
-    21737,
-    109441,
-    104543,
-    95109,
-    26024,
-    100111,
-    620,
-    20340,
-    12807,
-    107608,
-    13717,
-    23117,
-    95527,
-    26817,
-    101651,
-    136317,
-    14579,
-    141432,
-    21715,
-    138207,
-    26538,
-    14334,
-    114026,
-    95072,
-    139264,
-    195,
-    135297,
-    91486,
-    14392,
-    7020,
-    2132,
-    105379,
-    8762,
-    6236,
-    100496,
-    47858,
-    26378,
-    102029,
-    11663,
-    101373,
-    13725,
-    455,
-    102403,
-    113835,
-    104701,
-    3118,
-    452,
-    112888,
-    14524,
-    14059,
-    116615,
-    103842,
-    25575,
-    18705,
-    46470,
-    51589,
-    108342,
-    108174,
-    51498,
-    26956,
-    100948,
-    8674,
-    1169,
-    92472,
-    115489,
-    116099,
-    53431,
-    19117,
-    46225,
-    9150,
-    13772,
-    115676,
-    17535,
-    135437,
-    136523,
-    90395,
-    114388,
-    142671,
-    142622,
-    4824,
-    26446,
-    137228,
-    100579,
-    116271,
-    46011,
-    139411,
-    24090,
-    18021,
-    4472,
-    22321,
-    23064,
-    95952,
-    2731,
-    47517,
-    11860,
-    95448,
-    47843,
-    95705,
-    99636,
-    136163,
-    17200,
-    46001,
-    716,
-    10993,
-    115669,
-    16072,
-    45762,
-    9602,
-    2798,
-    143315,
-    104640,
-    112497,
-    137268,
-    94883,
-    137167,
-    95708,
-    102866,
-    46165,
-    19555,
-    9988,
-    109129,
-    137412,
-    24756,
-    103279,
-    94907,
-    137752,
-    52842,
-    112828,
-    104360,
-    23220,
-    107177,
-    99190,
-    105253,
-    113911,
-    104732,
-    112530,
-    110837,
-    12503,
-    91359,
-    5199,
-    104474,
-    3799,
-    25813,
-    93832,
-    23899,
-    98784,
-    114766,
-    24582,
-    26918,
-    9508,
-    20675,
-    90881,
-    103418,
-    104063,
-    109466,
-    109662,
-    107717,
-    16207,
-    16370,
-    90592,
-    94153,
-    107827,
-    112657,
-    19988,
-    12752,
-    101388,
-    8470,
-    112379,
-    4148,
-    99688,
-    14317,
-    22415,
-    12683,
-    112970,
-    105754,
-    24938,
-    116782,
-    93689,
-    90269,
-    108275,
-    4274,
-    109789,
-    93360,
-    10885,
-    19807,
-    97850,
-    96695,
-    92442,
-    94185,
-    114448,
-    17185,
-    1371,
-    2289,
-    22726,
-    12915,
-    11753,
-    109436,
-    113073,
-    90972,
-    110933,
-    109953,
-    16174,
-    100233,
-    94402,
-    10224,
-    108666,
-    23811,
-    90767,
-    13195,
-    109496,
-    21064,
-    2542,
-    4948,
-    25423,
-    26689,
-    90705,
-    91261,
-    102915,
-    107819,
-    103374,
-    107859,
-    18086,
-    100935,
-    99738,
-    114555,
-    25586,
-    97674,
-    111634,
-    116276,
-    112151,
-    7283,
-    110037,
-    15736,
-    26388,
-    22538,
-    92042,
-    97416,
-    4129,
-    17425,
-    14635,
-    101919,
-    116865,
-    102316,
-    116719,
-    106248,
-    13199,
-    93941,
-    100441,
-    100001,
-    20534,
-    91992,
-    116933,
-    26097,
-    108554,
-    24850,
-    94579,
-    25338,
-    4981,
-    110651,
-    115626,
-    5534,
-    110691,
-    5182,
-    110294,
-    94513,
-    4607,
-    111871,
-    92147,
-    109595,
-    98894,
-    90291,
-    95088,
-    4704,
-    91727,
-    18250,
-    98566,
-    95092,
-    2813,
-    115376,
-    18997,
-    26586,
-    109378,
-    19633,
-    116533,
-    18516,
-    24755,
-    25450,
-    112924,
-    112656,
-    26953,
-    19260,
-    116758,
-    23750,
-    110166,
-    21085,
-    24413,
-    108896,
-    19563,
-    108918,
-    109035,
-    23327,
-    21793,
-    116652,
-    22638,
-    116675,
-    20937,
-    23756,
-    19862,
-    114646,
-    111220,
-    115034,
-]
+r"""
+Indices of the CINIC-10 points used by :meth:`alr.data.datasets.Dataset.get`. They're kept
+in `_indices.npz` and loaded on first access of `_cinic_train_indices` or `_cinic_test_indices`.
+"""
+from alr.data._indices import index_table
 
-_cinic_test_indices = [
-    49238,
-    84837,
-    89250,
-    15266,
-    80200,
-    31581,
-    20453,
-    56106,
-    20720,
-    14912,
-    40922,
-    21797,
-    33922,
-    56548,
-    16543,
-    16148,
-    17358,
-    34137,
-    25880,
-    17918,
-    66066,
-    68975,
-    23832,
-    89551,
-    9509,
-    39990,
-    66429,
-    27338,
-    34772,
-    69803,
-    38671,
-    32113,
-    11287,
-    48817,
-    39324,
-    87673,
-    25963,
-    16908,
-    59330,
-    18683,
-    4795,
-    55557,
-    56989,
-    27840,
-    69749,
-    23813,
-    56011,
-    51999,
-    36931,
-    39323,
-    89428,
-    43480,
-    25569,
-    52182,
-    58058,
-    42550,
-    79851,
-    19254,
-    55535,
-    43061,
-    83732,
-    38907,
-    68041,
-    58795,
-    44629,
-    17326,
-    26833,
-    86743,
-    44239,
-    60117,
-    54401,
-    78273,
-    31973,
-    9878,
-    13460,
-    41770,
-    1253,
-    31730,
-    19840,
-    50180,
-    73125,
-    66941,
-    56215,
-    48835,
-    87256,
-    4353,
-    5691,
-    28070,
-    64281,
-    27664,
-    76307,
-    24781,
-    49741,
-    17175,
-    84337,
-    24850,
-    1847,
-    82517,
-    68988,
-    81379,
-    2283,
-    44704,
-    9334,
-    72555,
-    67474,
-    76466,
-    80478,
-    49593,
-    7524,
-    64853,
-    88624,
-    75529,
-    47239,
-    65988,
-    34881,
-    65004,
-    16084,
-    81830,
-    49290,
-    2604,
-    60233,
-    57413,
-    82759,
-    64196,
-    45905,
-    11448,
-    57347,
-    4022,
-    20423,
-    13391,
-    26873,
-    67685,
-    76976,
-    8232,
-    85868,
-    52676,
-    11692,
-    55176,
-    14741,
-    66304,
-    25777,
-    36793,
-    25056,
-    35962,
-    52945,
-    68745,
-    30669,
-    31841,
-    87648,
-    73527,
-    34525,
-    33473,
-    14864,
-    58482,
-    44374,
-    46160,
-    10037,
-    62731,
-    12727,
-    34612,
-    38331,
-    76297,
-    88641,
-    81297,
-    35902,
-    36882,
-    58268,
-    25727,
-    43890,
-    33588,
-    64220,
-    5308,
-    25684,
-    22164,
-    70752,
-    56009,
-    19800,
-    40599,
-    63730,
-    70028,
-    48963,
-    55343,
-    22786,
-    81863,
-    85153,
-    63717,
-    74697,
-    10526,
-    79319,
-    57470,
-    27241,
-    62567,
-    18797,
-    9455,
-    39516,
-    7255,
-    7262,
-    68096,
-    19387,
-    82048,
-    61770,
-    79913,
-    19708,
-    58059,
-    544,
-    72588,
-    33006,
-    66247,
-    34385,
-    16198,
-    86478,
-    19616,
-    49801,
-    63199,
-    52423,
-    40773,
-    44757,
-    58501,
-    28232,
-    50332,
-    82708,
-    36913,
-    69825,
-    47966,
-    27098,
-    32154,
-    9328,
-    56124,
-    53914,
-    77257,
-    16378,
-    49137,
-    36369,
-    45682,
-    58406,
-    58267,
-    88406,
-    72556,
-    10166,
-    43994,
-    24934,
-    68030,
-    29765,
-    50334,
-    56059,
-    30113,
-    48069,
-    63706,
-    44383,
-    74461,
-    38348,
-    50735,
-    42240,
-    27184,
-    11690,
-    10036,
-    69245,
-    78611,
-    37147,
-    11046,
-    920,
-    44069,
-    36099,
-    18688,
-    13563,
-    5468,
-    28388,
-    2347,
-    15478,
-    62504,
-    39883,
-    54824,
-    17946,
-    76102,
-    57312,
-    87410,
-    37118,
-    72946,
-    73660,
-    69149,
-    67031,
-    62382,
-    21163,
-    76439,
-    64037,
-    31168,
-    26672,
-    64293,
-    84008,
-    33038,
-    595,
-    49568,
-    10748,
-    82680,
-    18056,
-    66661,
-    17819,
-    66421,
-    5410,
-    47274,
-    52470,
-    37199,
-    16329,
-    45445,
-    73954,
-    16370,
-    24282,
-    73607,
-    16143,
-    60640,
-    47786,
-    59906,
-    25150,
-    15578,
-    63100,
-    73131,
-    82505,
-    25507,
-    82034,
-    3609,
-    52847,
-    46635,
-    81178,
-    60220,
-    35849,
-    58793,
-    37419,
-    82241,
-    28349,
-    22229,
-    41533,
-    9090,
-    3665,
-    85849,
-    48213,
-    48216,
-    88990,
-    51581,
-    14989,
-    3745,
-    20430,
-    86035,
-    7286,
-    23405,
-    77803,
-    69022,
-    11505,
-    51062,
-    78194,
-    31440,
-    46126,
-    21382,
-    26505,
-    41911,
-    31964,
-    87801,
-    31689,
-    54866,
-    82818,
-    78243,
-    37069,
-    81855,
-    1990,
-    15572,
-    9082,
-    78153,
-    42742,
-    65725,
-    71158,
-    48303,
-    68463,
-    43998,
-    5937,
-    16001,
-    56196,
-    55499,
-    65103,
-    21539,
-    89569,
-    25580,
-    72903,
-    49935,
-    50444,
-    72001,
-    68194,
-    47815,
-    81298,
-    88810,
-    13647,
-    18994,
-    1497,
-    85437,
-    57530,
-    65275,
-    75421,
-    15504,
-    28365,
-    77066,
-    21181,
-    23204,
-    43162,
-    48792,
-    13612,
-    36437,
-    81829,
-    22439,
-    12534,
-    40029,
-    64761,
-    32062,
-    23040,
-    8223,
-    71870,
-    50869,
-    32261,
-    53127,
-    66915,
-    19532,
-    17133,
-    54427,
-    2476,
-    25693,
-    26681,
-    84339,
-    33613,
-    78760,
-    79598,
-    47510,
-    2231,
-    260,
-    9906,
-    42687,
-    84652,
-    4628,
-    11774,
-    39776,
-    18990,
-    31290,
-    6912,
-    10701,
-    33291,
-    37288,
-    60177,
-    48045,
-    31911,
-    42263,
-    84580,
-    57005,
-    83246,
-    2432,
-    23951,
-    11703,
-    36129,
-    82134,
-    30240,
-    64437,
-    3680,
-    15408,
-    27279,
-    69865,
-    31374,
-    16032,
-    37119,
-    40078,
-    4351,
-    28468,
-    89827,
-    47087,
-    23766,
-    26992,
-    6354,
-    89765,
-    55000,
-    60277,
-    24557,
-    21511,
-    42156,
-    25014,
-    52520,
-    41257,
-    21381,
-    53966,
-    67733,
-    74669,
-    48023,
-    33338,
-    89081,
-    19176,
-    75113,
-    4564,
-    48939,
-    84078,
-    86678,
-    39316,
-    47907,
-    81787,
-    58234,
-    11602,
-    75977,
-    84584,
-    19362,
-    17104,
-    74923,
-    50931,
-    10315,
-    89434,
-    78069,
-    39530,
-    61614,
-    39020,
-    48502,
-    29162,
-    42999,
-    51126,
-    25583,
-    78761,
-    49432,
-    6449,
-    3000,
-    37594,
-    35971,
-    9865,
-    7321,
-    59890,
-    32527,
-    22926,
-    44049,
-    5180,
-    52425,
-    87561,
-    80530,
-    71338,
-    2358,
-    4131,
-    49986,
-    17857,
-    24514,
-    81955,
-    21161,
-    52750,
-    14457,
-    48608,
-    53244,
-    40310,
-    28448,
-    36499,
-    79793,
-    14269,
-    19831,
-    19031,
-    17034,
-    58537,
-    30217,
-    62284,
-    50832,
-    54070,
-    19240,
-    13851,
-    49375,
-    35779,
-    40096,
-    67348,
-    83602,
-    84859,
-    29684,
-    57405,
-    12521,
-    39310,
-    51243,
-    12177,
-    20625,
-    52271,
-    33679,
-    24655,
-    35470,
-    8779,
-    85579,
-    62745,
-    48665,
-    43332,
-    22364,
-    30797,
-    50699,
-    53357,
-    50006,
-    20215,
-    61515,
-    1021,
-    29046,
-    59355,
-    28940,
-    48182,
-    51399,
-    77861,
-    25272,
-    77281,
-    73156,
-    20033,
-    12940,
-    76921,
-    751,
-    59482,
-    1138,
-    65403,
-    41197,
-    77669,
-    54339,
-    67271,
-    1511,
-    5478,
-    67064,
-    65234,
-    26090,
-    75696,
-    70465,
-    46664,
-    1231,
-    75907,
-    903,
-    86357,
-    33168,
-    62925,
-    80662,
-    59128,
-    73253,
-    34997,
-    52733,
-    15850,
-    15011,
-    32102,
-    52458,
-    83004,
-    26371,
-    81073,
-    83916,
-    85918,
-    22386,
-    2205,
-    37652,
-    77600,
-    69131,
-    39889,
-    57086,
-    52697,
-    15126,
-    81185,
-    58574,
-    41934,
-    4237,
-    36519,
-    36266,
-    19601,
-    10456,
-    41341,
-    16662,
-    58331,
-    12378,
-    63831,
-    56832,
-    81419,
-    71124,
-    40504,
-    84146,
-    64329,
-    66748,
-    63811,
-    16567,
-    1582,
-    43677,
-    82698,
-    25587,
-    81337,
-    61453,
-    27973,
-    41694,
-    75604,
-    78826,
-    29635,
-    72723,
-    35887,
-    12933,
-    40906,
-    36829,
-    50985,
-    35419,
-    68336,
-    1950,
-    37289,
-    46387,
-    75242,
-    46490,
-    23195,
-    38577,
-    9171,
-    55091,
-    40330,
-    62797,
-    31666,
-    48151,
-    73444,
-    60159,
-    74762,
-    41009,
-    22124,
-    68630,
-    79168,
-    62212,
-    1342,
-    5015,
-    1828,
-    42060,
-    30489,
-    35804,
-    24835,
-    75615,
-    84926,
-    52701,
-    8102,
-    45522,
-    32341,
-    17686,
-    43255,
-    15643,
-    8497,
-    45130,
-    25346,
-    77051,
-    10551,
-    50675,
-    82916,
-    65414,
-    15105,
-    43544,
-    25980,
-    31663,
-    27233,
-    60601,
-    30274,
-    7989,
-    999,
-    42133,
-    48083,
-    2149,
-    86592,
-    24832,
-    12292,
-    87854,
-    49585,
-    84333,
-    3941,
-    36624,
-    50245,
-    39420,
-    33229,
-    66003,
-    41215,
-    56108,
-    57404,
-    10851,
-    73223,
-    60061,
-    23386,
-    15486,
-    66954,
-    25167,
-    66948,
-    30894,
-    73421,
-    51268,
-    9291,
-    14504,
-    33417,
-    7309,
-    65602,
-    48132,
-    42023,
-    24369,
-    42669,
-    20510,
-    46026,
-    79183,
-    35869,
-    48687,
-    8361,
-    45255,
-    80209,
-    34080,
-    12938,
-    53921,
-    30430,
-    24286,
-    25893,
-    13694,
-    51134,
-    11670,
-    22866,
-    23026,
-    8051,
-    46565,
-    77734,
-    75810,
-    17297,
-    80944,
-    88544,
-    43144,
-    61727,
-    4262,
-    56631,
-    62398,
-    12482,
-    13601,
-    44145,
-    34892,
-    64305,
-    16164,
-    34995,
-    38586,
-    1793,
-    30704,
-    61539,
-    78221,
-    14461,
-    80187,
-    64379,
-    64156,
-    82119,
-    25699,
-    17211,
-    36587,
-    34519,
-    27659,
-    14379,
-    61960,
-    19397,
-    53287,
-    34793,
-    35325,
-    75976,
-    16622,
-    7450,
-    13479,
-    21018,
-    15028,
-    28969,
-    69639,
-    10852,
-    22935,
-    25463,
-    15596,
-    28857,
-    38940,
-    61462,
-    62454,
-    52412,
-    27332,
-    753,
-    17767,
-    22400,
-    9118,
-    81801,
-    49251,
-    89756,
-    12291,
-    79537,
-    84586,
-    60542,
-    70952,
-    28954,
-    70661,
-    41319,
-    31848,
-    37508,
-    23231,
-    22085,
-    58894,
-    87257,
-    31638,
-    23721,
-    87173,
-    3536,
-    51898,
-    61023,
-    57408,
-    48161,
-    31300,
-    50652,
-    70802,
-    16255,
-    73063,
-    54388,
-    83670,
-    26127,
-    16478,
-    79954,
-    65737,
-    67438,
-    11842,
-    12379,
-    30635,
-    17096,
-    73361,
-    78914,
-    50009,
-    65715,
-    62461,
-    78391,
-    11052,
-    14723,
-    34242,
-    84787,
-    79962,
-    7192,
-    26075,
-    40348,
-    53855,
-    46672,
-    6531,
-    70735,
-    18350,
-    58457,
-    47716,
-    29563,
-    20130,
-    43109,
-    86667,
-    67011,
-    859,
-    62501,
-    83469,
-    40292,
-    53733,
-    48735,
-    47792,
-    89451,
-    58621,
-    5057,
-    76879,
-    45996,
-    56481,
-    27530,
-    34098,
-    19262,
-    80967,
-    33697,
-    22180,
-    14311,
-    66019,
-    54744,
-    78167,
-    26,
-    71842,
-    11769,
-    63880,
-    32497,
-    40652,
-    72732,
-    54896,
-    4250,
-    67419,
-    72299,
-    84897,
-    24413,
-    325,
-    35532,
-    29921,
-    83366,
-    89466,
-    51240,
-    26902,
-    12245,
-    8647,
-    25130,
-    59655,
-    15602,
-    52106,
-    86863,
-    7324,
-    33587,
-    17111,
-    30997,
-    71092,
-    10850,
-    4941,
-    4422,
-    12694,
-    70354,
-    43282,
-    21634,
-    73687,
-    58036,
-    50076,
-    46784,
-    47745,
-    38785,
-    39096,
-    72854,
-    66554,
-    76043,
-    38385,
-    22161,
-    50225,
-    45763,
-    43995,
-    7730,
-    43161,
-    3660,
-    5552,
-    37773,
-    59101,
-    68440,
-    25147,
-    78974,
-    13779,
-    41335,
-    84901,
-    1836,
-    82077,
-    73179,
-    86257,
-    20637,
-    39763,
-    16186,
-    78096,
-    7443,
-    74498,
-    21833,
-    13960,
-    17826,
-    39974,
-    50921,
-    15155,
-    89483,
-    32305,
-    77598,
-    87205,
-    77495,
-    11989,
-    24400,
-    76665,
-    62166,
-    20151,
-    51816,
-    50034,
-    34670,
-    57650,
-    226,
-    40113,
-    58854,
-    16710,
-    26474,
-    75228,
-    36166,
-    48356,
-    27368,
-    48000,
-    51354,
-    40783,
-    33120,
-    69492,
-    5452,
-    34148,
-    86367,
-    26586,
-    44030,
-    19383,
-    44719,
-    39932,
-    47429,
-    42839,
-    78130,
-    81029,
-    33621,
-    48733,
-    83801,
-    88528,
-    31508,
-    62219,
-    44060,
-    57862,
-    89303,
-    78042,
-    73552,
-    32246,
-    79595,
-    18366,
-    47838,
-    18419,
-    45869,
-    13480,
-    40233,
-    24049,
-    38953,
-    68306,
-    3255,
-    51830,
-    80014,
-    2424,
-    58235,
-    58920,
-    32636,
-    36275,
-    47109,
-    41805,
-    50228,
-    50141,
-    12768,
-    78853,
-    4049,
-    70874,
-    11096,
-    49762,
-    78158,
-    28580,
-    15791,
-    78749,
-    27592,
-    52329,
-    10072,
-    9311,
-    35345,
-    61620,
-    56110,
-    60264,
-    3415,
-    56687,
-    86157,
-    33691,
-    4614,
-    43757,
-    12962,
-    51446,
-    16838,
-    74716,
-    82019,
-    40814,
-    27620,
-    44764,
-    43486,
-    41497,
-    20073,
-    16987,
-    78209,
-    71605,
-    6225,
-    72918,
-    20881,
-    26841,
-    39942,
-    66985,
-    63035,
-    80135,
-    75380,
-    23094,
-    68404,
-    39664,
-    14238,
-    52353,
-    80793,
-    64888,
-    77151,
-    28183,
-    89595,
-    82776,
-    25345,
-    61750,
-    52009,
-    8143,
-    22387,
-    44364,
-    68685,
-    86123,
-    31855,
-    29380,
-    26298,
-    63790,
-    23078,
-    26229,
-    11047,
-    81534,
-    28697,
-    76640,
-    35588,
-    15663,
-    25671,
-    87402,
-    76540,
-    59058,
-    47952,
-    7570,
-    23077,
-    84326,
-    87251,
-    45818,
-    2148,
-    82245,
-    3242,
-    85286,
-    32483,
-    61402,
-    73685,
-    24861,
-    67343,
-    40776,
-    58777,
-    72695,
-    47798,
-    63418,
-    26680,
-    66188,
-    27114,
-    82308,
-    75650,
-    31678,
-    37523,
-    58905,
-    57580,
-    32405,
-    80937,
-    14356,
-    68148,
-    41714,
-    25977,
-    1761,
-    44090,
-    1400,
-    17072,
-    88535,
-    14026,
-    54611,
-    48089,
-    88429,
-    10106,
-    48723,
-    17272,
-    8577,
-    59301,
-    79192,
-    10130,
-    8267,
-    67523,
-    3065,
-    14831,
-    59959,
-    75475,
-    35203,
-    11201,
-    25291,
-    30096,
-    40112,
-    44654,
-    10235,
-    41287,
-    51660,
-    37668,
-    4993,
-    17087,
-    61523,
-    34396,
-    1110,
-    16876,
-    29583,
-    39359,
-    78883,
-    13692,
-    45037,
-    45389,
-    68424,
-    31971,
-    34290,
-    82337,
-    26194,
-    19799,
-    85426,
-    79321,
-    1420,
-    1484,
-    38164,
-    74568,
-    8585,
-    72174,
-    24630,
-    26201,
-    37167,
-    49549,
-    58718,
-    63285,
-    86763,
-    64824,
-    87332,
-    35049,
-    44967,
-    64522,
-    89744,
-    73855,
-    18006,
-    17061,
-    63032,
-    14267,
-    45127,
-    77909,
-    77875,
-    11402,
-    53669,
-    37768,
-    40058,
-    13119,
-    24546,
-    86747,
-    67589,
-    9857,
-    45864,
-    86951,
-    57083,
-    71482,
-    74198,
-    85847,
-    78191,
-    49565,
-    24103,
-    51429,
-    7110,
-    29988,
-    76718,
-    34476,
-    73211,
-    37424,
-    21491,
-    81860,
-    63348,
-    10421,
-    67092,
-    29109,
-    5491,
-    24483,
-    18803,
-    12493,
-    16948,
-    38472,
-    63462,
-    16354,
-    18125,
-    34015,
-    24902,
-    16099,
-    71951,
-    32818,
-    43472,
-    12915,
-    64051,
-    7106,
-    60743,
-    79182,
-    68454,
-    18581,
-    46562,
-    31216,
-    77531,
-    48823,
-    83606,
-    47752,
-    44808,
-    22143,
-    25242,
-    24040,
-    20322,
-    61596,
-    60807,
-    72077,
-    76871,
-    80984,
-    10179,
-    65411,
-    3981,
-    78484,
-    33011,
-    69708,
-    79532,
-    87238,
-    7415,
-    75039,
-    27405,
-    88181,
-    81752,
-    63987,
-    87390,
-    68008,
-    17914,
-    84500,
-    37499,
-    17174,
-    17695,
-    12766,
-    62735,
-    87695,
-    78524,
-    21151,
-    66570,
-    59848,
-    82897,
-    16602,
-    20724,
-    88426,
-    197,
-    62361,
-    19367,
-    22158,
-    7019,
-    33861,
-    86394,
-    65981,
-    27396,
-    88111,
-    5521,
-    16593,
-    8513,
-    49224,
-    42077,
-    60328,
-    1105,
-    17706,
-    44774,
-    79871,
-    38454,
-    20649,
-    10259,
-    49802,
-    63525,
-    85628,
-    55680,
-    48947,
-    4802,
-    86997,
-    56616,
-    41727,
-    15147,
-    80806,
-    50012,
-    80030,
-    85095,
-    61700,
-    69536,
-    22494,
-    51435,
-    75206,
-    69168,
-    12603,
-    18336,
-    35201,
-    8171,
-    11435,
-    17500,
-    60705,
-    72373,
-    6476,
-    11326,
-    82840,
-    85315,
-    44709,
-    22452,
-    6917,
-    77932,
-    83145,
-    67037,
-    5863,
-    28274,
-    59956,
-    40374,
-    38216,
-    88967,
-    89487,
-    56194,
-    52728,
-    89308,
-    77535,
-    2177,
-    64952,
-    49488,
-    66470,
-    73141,
-    64093,
-    66474,
-    78727,
-    30000,
-    35351,
-    72673,
-    37763,
-    12415,
-    34564,
-    8503,
-    60761,
-    19457,
-    18526,
-    34072,
-    69722,
-    36508,
-    45458,
-    68929,
-    25207,
-    15573,
-    71302,
-    51676,
-    32250,
-    30861,
-    65153,
-    71291,
-    1440,
-    26806,
-    63529,
-    33932,
-    19283,
-    7227,
-    20647,
-    20167,
-    83001,
-    73236,
-    69791,
-    32398,
-    26419,
-    79252,
-    50971,
-    89196,
-    35803,
-    36209,
-    42235,
-    80210,
-    51748,
-    87134,
-    9063,
-    44655,
-    28923,
-    17610,
-    24609,
-    34880,
-    64165,
-    75503,
-    65303,
-    9905,
-    71405,
-    57502,
-    11598,
-    74392,
-    81172,
-    72751,
-    63163,
-    86735,
-    11377,
-    30198,
-    56390,
-    63426,
-    59047,
-    6490,
-    50737,
-    42004,
-    30796,
-    43538,
-    9793,
-    89971,
-    78902,
-    68910,
-    7221,
-    48217,
-    84213,
-    40214,
-    40901,
-    77203,
-    72689,
-    22394,
-    52532,
-    23928,
-    58104,
-    59565,
-    67362,
-    45811,
-    43205,
-    47365,
-    48832,
-    286,
-    65138,
-    47046,
-    61886,
-    34368,
-    24222,
-    68011,
-    20737,
-    89019,
-    78649,
-    70713,
-    26554,
-    7410,
-    49490,
-    50116,
-    15012,
-    88216,
-    43359,
-    80405,
-    76108,
-    45190,
-    49822,
-    18876,
-    36899,
-    31803,
-    33708,
-    34332,
-    7789,
-    42886,
-    16575,
-    30902,
-    84656,
-    28375,
-    89684,
-    19333,
-    16409,
-    9980,
-    81511,
-    55127,
-    79460,
-    83158,
-    70158,
-    33828,
-    83892,
-    25018,
-    70937,
-    9238,
-    64808,
-    49906,
-    53144,
-    53176,
-    47241,
-    46547,
-    63303,
-    44873,
-    633,
-    68360,
-    66745,
-    32092,
-    2485,
-    25817,
-    13405,
-    73929,
-    81699,
-    43348,
-    61950,
-    41509,
-    32805,
-    78961,
-    33112,
-    73262,
-    18496,
-    14904,
-    34829,
-    81478,
-    45312,
-    35673,
-    89944,
-    67927,
-    54648,
-    2574,
-    51291,
-    12032,
-    16714,
-    85535,
-    71257,
-    85788,
-    21306,
-    71121,
-    41842,
-    46140,
-    58779,
-    73818,
-    13163,
-    80744,
-    51248,
-    35899,
-    73467,
-    53040,
-    88782,
-    19431,
-    51136,
-    31536,
-    73517,
-    14770,
-    70694,
-    27015,
-    16456,
-    54372,
-    38745,
-    201,
-    72349,
-    17436,
-    62028,
-    16268,
-    77089,
-    16992,
-    81492,
-    77588,
-    45496,
-    63800,
-    76875,
-    25686,
-    46711,
-    50575,
-    27804,
-    49582,
-    46612,
-    66621,
-    76654,
-    77390,
-    76004,
-    1536,
-    65244,
-    16058,
-    50947,
-    54530,
-    20699,
-    10555,
-    34709,
-    13528,
-    17144,
-    5045,
-    59976,
-    19887,
-    81242,
-    1744,
-    6050,
-    8655,
-    63312,
-    6645,
-    75025,
-    49539,
-    79148,
-    78357,
-    51067,
-    60331,
-    44905,
-    38531,
-    27708,
-    34306,
-    2341,
-    44862,
-    14265,
-    35193,
-    29493,
-    53962,
-    23989,
-    40970,
-    49654,
-    82822,
-    29854,
-    23799,
-    53624,
-    75355,
-    66648,
-    79808,
-    73663,
-    62297,
-    54587,
-    89188,
-    44396,
-    71073,
-    28617,
-    23657,
-    74367,
-    62000,
-    62523,
-    59921,
-    1522,
-    85647,
-    7464,
-    34994,
-    5544,
-    8238,
-    17134,
-    10761,
-    69595,
-    80640,
-    54139,
-    32611,
-    39288,
-    82830,
-    56405,
-    36798,
-    18887,
-    36158,
-    62072,
-    74036,
-    85651,
-    2368,
-    56566,
-    10926,
-    24011,
-    86451,
-    7121,
-    3565,
-    80951,
-    12278,
-    40103,
-    9973,
-    29013,
-    50219,
-    41196,
-    21419,
-    63667,
-    49790,
-    28702,
-    58299,
-    45890,
-    51465,
-    49439,
-    31308,
-    88106,
-    47547,
-    64106,
-    76502,
-    62100,
-    29549,
-    48898,
-    61394,
-    84629,
-    25473,
-    1494,
-    1644,
-    29517,
-    62910,
-    87514,
-    6153,
-    36565,
-    68461,
-    14231,
-    17910,
-    71581,
-    42152,
-    64830,
-    72303,
-    10502,
-    14608,
-    20682,
-    84051,
-    30533,
-    52757,
-    61706,
-    70272,
-    16624,
-    59963,
-    42358,
-    89449,
-    81476,
-    22232,
-    25071,
-    1049,
-    78601,
-    4532,
-    1434,
-    77754,
-    16002,
-    47471,
-    6983,
-    21282,
-    84313,
-    5159,
-    34661,
-    23803,
-    10428,
-    49504,
-    28978,
-    58730,
-    67600,
-    74926,
-    82740,
-    10006,
-    6628,
-    75551,
-    73892,
-    25428,
-    66755,
-    39300,
-    50176,
-    179,
-    30874,
-    58088,
-    11901,
-    72339,
-    6009,
-    35339,
-    11126,
-    34311,
-    24173,
-    85757,
-    89444,
-    62059,
-    50146,
-    73525,
-    85438,
-    12065,
-    89958,
-    54573,
-    34466,
-    45276,
-    57818,
-    12944,
-    27289,
-    51978,
-    69388,
-    82041,
-    39250,
-    61342,
-    73233,
-    12666,
-    34401,
-    1504,
-    3693,
-    49112,
-    88561,
-    51224,
-    65793,
-    50010,
-    59062,
-    31089,
-    53224,
-    61092,
-    13327,
-    42090,
-    57483,
-    80591,
-    82686,
-    43598,
-    31329,
-    10940,
-    8742,
-    48968,
-    13225,
-    52494,
-    89822,
-    64040,
-    89067,
-    17172,
-    69502,
-    5914,
-    49757,
-    12440,
-    26969,
-    71727,
-    3550,
-    48168,
-    24229,
-    30820,
-    75952,
-    41447,
-    84736,
-    11416,
-    31830,
-    49298,
-    19886,
-    20428,
-    8048,
-    68104,
-    7287,
-    77167,
-    39244,
-    84723,
-    45383,
-    27610,
-    43016,
-    57489,
-    21251,
-    42867,
-    49305,
-    5139,
-    62815,
-    31627,
-    14775,
-    40735,
-    40195,
-    17997,
-    55111,
-    56323,
-    6894,
-    55454,
-    7777,
-    60726,
-    19119,
-    78534,
-    22617,
-    34719,
-    80841,
-    53834,
-    40975,
-    86144,
-    72396,
-    10778,
-    41434,
-    14469,
-    84190,
-    86000,
-    25209,
-    52866,
-    37126,
-    22514,
-    40583,
-    10221,
-    86344,
-    69145,
-    54169,
-    30016,
-    5073,
-    79352,
-    64897,
-    30150,
-    87918,
-    26189,
-    74625,
-    54178,
-    59419,
-    56956,
-    48593,
-    74754,
-    86708,
-    53620,
-    48156,
-    63643,
-    570,
-    1803,
-    41113,
-    60351,
-    87351,
-    5812,
-    11772,
-    86571,
-    81057,
-    12445,
-    88858,
-    80648,
-    33181,
-    3960,
-    12252,
-    83308,
-    77828,
-    59897,
-    60630,
-    85214,
-    56346,
-    38056,
-    72162,
-    32109,
-    87341,
-    26979,
-    3131,
-    66764,
-    43323,
-    12097,
-    67535,
-    37800,
-    13194,
-    81388,
-    69801,
-    40725,
-    6851,
-    80962,
-    10781,
-    85133,
-    28066,
-    14146,
-    24877,
-    66318,
-    46975,
-    84055,
-    37596,
-    42494,
-    51286,
-    41972,
-    32293,
-    50321,
-    41344,
-    54477,
-    57354,
-    86214,
-    64820,
-    58957,
-    3467,
-    887,
-    88480,
-    58274,
-    73880,
-    82144,
-    82211,
-    54331,
-    19426,
-    80709,
-    66025,
-    1943,
-    11474,
-    18748,
-    70662,
-    3377,
-    75138,
-    70992,
-    26106,
-    6832,
-    18465,
-    17587,
-    5889,
-    70781,
-    52933,
-    81452,
-    1177,
-    16420,
-    86225,
-    4210,
-    16244,
-    83484,
-    88805,
-    83074,
-    7063,
-    49398,
-    57206,
-    66202,
-    16588,
-    13372,
-    62285,
-    23064,
-    67209,
-    1967,
-    80407,
-    82327,
-    8652,
-    31151,
-    58419,
-    4410,
-    74140,
-    84875,
-    68208,
-    23680,
-    35424,
-    49139,
-    5448,
-    77180,
-    59066,
-    5205,
-    26072,
-    14400,
-    19841,
-    68676,
-    20599,
-    84379,
-    47215,
-    88477,
-    14338,
-    63079,
-    64002,
-    1421,
-    77910,
-    89856,
-    20929,
-    2787,
-    70258,
-    3355,
-    46831,
-    83306,
-    2325,
-    50782,
-    37703,
-    51935,
-    35659,
-    26644,
-    4734,
-    43578,
-    78279,
-    74067,
-    72894,
-    29134,
-    22388,
-    81427,
-    68807,
-    16610,
-    41,
-    52749,
-    50965,
-    20834,
-    40425,
-    10258,
-    19766,
-    72152,
-    59225,
-    84911,
-    8035,
-    25808,
-    50819,
-    7679,
-    47944,
-    73147,
-    71515,
-    65498,
-    33440,
-    45027,
-    3012,
-    61518,
-    81431,
-    9508,
-    46052,
-    80426,
-    52283,
-    53520,
-    28348,
-    62124,
-    742,
-    13640,
-    87930,
-    12127,
-    16154,
-    85689,
-    65912,
-    25906,
-    63908,
-    83964,
-    50653,
-    45288,
-    60552,
-    44571,
-    79122,
-    41576,
-    78954,
-    33738,
-    3816,
-    4929,
-    64241,
-    51517,
-    70668,
-    20233,
-    89312,
-    74371,
-    36600,
-    83724,
-    61806,
-    80634,
-    89868,
-    48346,
-    52354,
-    89786,
-    89975,
-    15452,
-    9430,
-    29229,
-    34404,
-    11489,
-    81267,
-    3922,
-    79875,
-    8,
-    78411,
-    11233,
-    20889,
-    6437,
-    71566,
-    64910,
-    77605,
-    9720,
-    84527,
-    52269,
-    73221,
-    8394,
-    80875,
-    46047,
-    69509,
-    5001,
-    46748,
-    26191,
-    31258,
-    83595,
-    39435,
-    37647,
-    56206,
-    63795,
-    78841,
-    28780,
-    36232,
-    30469,
-    8327,
-    65182,
-    7417,
-    85144,
-    39340,
-    7589,
-    58125,
-    50655,
-    51890,
-    26320,
-    49141,
-    13511,
-    7337,
-    56977,
-    36464,
-    30871,
-    4964,
-    22686,
-    35053,
-    1166,
-    69699,
-    63456,
-    55921,
-    68471,
-    65289,
-    58865,
-    60407,
-    78199,
-    61185,
-    24398,
-    62710,
-    39784,
-    36735,
-    78315,
-    58689,
-    32930,
-    6619,
-    36697,
-    838,
-    56269,
-    8381,
-    39927,
-    36875,
-    53002,
-    87242,
-    73296,
-    51979,
-    24855,
-    84754,
-    50172,
-    88560,
-    1111,
-    15442,
-    78980,
-    11259,
-    4018,
-    31141,
-    12236,
-    22448,
-    72626,
-    78175,
-    42623,
-    75857,
-    89758,
-    82129,
-    48225,
-    47850,
-    56530,
-    70545,
-    59046,
-    314,
-    17908,
-    60103,
-    56615,
-    24598,
-    1229,
-    3498,
-    80121,
-    28209,
-    69380,
-    61641,
-    59691,
-    54389,
-    48414,
-    14862,
-    13817,
-    21396,
-    60242,
-    74564,
-    24381,
-    76219,
-    67448,
-    89082,
-    28148,
-    70878,
-    23083,
-    42935,
-    82748,
-    4918,
-    21865,
-    1512,
-    58507,
-    85961,
-    25832,
-    84204,
-    22345,
-    7130,
-    24436,
-    40781,
-    24281,
-    50892,
-    54133,
-    81144,
-    55107,
-    56473,
-    10663,
-    84271,
-    46313,
-    34652,
-    86541,
-    28315,
-    79655,
-    58099,
-    63520,
-    88737,
-    11823,
-    59530,
-    51300,
-    54924,
-    3215,
-    49105,
-    82003,
-    64226,
-    80045,
-    33989,
-    47066,
-    19165,
-    16910,
-    23110,
-    55769,
-    83106,
-    17425,
-    28287,
-    87712,
-    79024,
-    14147,
-    3462,
-    23287,
-    27689,
-    71942,
-    18408,
-    1265,
-    22165,
-    18699,
-    85312,
-    60440,
-    25561,
-    82279,
-    43714,
-    10886,
-    37051,
-    65755,
-    24677,
-    42442,
-    74970,
-    80077,
-    19885,
-    8203,
-    70338,
-    23509,
-    75975,
-    35047,
-    51314,
-    24945,
-    84465,
-    85234,
-    20783,
-    85454,
-    47008,
-    56916,
-    4766,
-    58429,
-    1014,
-    11359,
-    4303,
-    44279,
-    57792,
-    89391,
-    25586,
-    14776,
-    43159,
-    28790,
-    41909,
-    65401,
-    53878,
-    60949,
-    77311,
-    82662,
-    40771,
-    54646,
-    49454,
-    34292,
-    1332,
-    6573,
-    68780,
-    51206,
-    67815,
-    30166,
-    1524,
-    58065,
-    7634,
-    14719,
-    12363,
-    25934,
-    82336,
-    46628,
-    84095,
-    28389,
-    86647,
-    50173,
-    44540,
-    76962,
-    65922,
-    17579,
-    85285,
-    83938,
-    45644,
-    54483,
-    12009,
-    36401,
-    35567,
-    47017,
-    42172,
-    68532,
-    13368,
-    6203,
-    25572,
-    49953,
-    83960,
-    12722,
-    7845,
-    19346,
-    64805,
-    27801,
-    83655,
-    29064,
-    32838,
-    6077,
-    42972,
-    49406,
-    30843,
-    70449,
-    31266,
-    81709,
-    49012,
-    55370,
-    27086,
-    20078,
-    81110,
-    9086,
-    9109,
-    83622,
-    80534,
-    50734,
-    4928,
-    35082,
-    19141,
-    89699,
-    2257,
-    9235,
-    73648,
-    60072,
-    54216,
-    49062,
-    81226,
-    42379,
-    56328,
-    45032,
-    12028,
-    72,
-    42730,
-    78434,
-    13108,
-    53580,
-    62951,
-    84239,
-    67872,
-    59479,
-    65735,
-    9610,
-    58415,
-    89611,
-    67050,
-    7339,
-    7971,
-    75847,
-    23055,
-    66975,
-    10685,
-    24791,
-    61381,
-    15813,
-    55830,
-    64312,
-    52964,
-    47458,
-    66107,
-    72989,
-    4086,
-    80238,
-    29285,
-    6714,
-    56225,
-    22925,
-    59816,
-    35890,
-    13010,
-    43079,
-    58090,
-    21204,
-    73570,
-    45388,
-    77643,
-    27043,
-    65590,
-    87473,
-    24442,
-    30968,
-    52472,
-    18712,
-    63866,
-    49962,
-    18918,
-    30591,
-    56396,
-    23345,
-    856,
-    34321,
-    37673,
-    8798,
-    87808,
-    39563,
-    34154,
-    24486,
-    28101,
-    62952,
-    27067,
-    58153,
-    23228,
-    68776,
-    73280,
-    81985,
-    2906,
-    64960,
-    62179,
-    81156,
-    15115,
-    75813,
-    63237,
-    88486,
-    15034,
-    86045,
-    38198,
-    36750,
-    37258,
-    78257,
-    38203,
-    45787,
-    3411,
-    70729,
-    9024,
-    65219,
-    19816,
-    53555,
-    77135,
-    18851,
-    39676,
-    69542,
-    87571,
-    71353,
-    4227,
-    37248,
-    60531,
-    28516,
-    17775,
-    3278,
-    13553,
-    24146,
-    76860,
-    45565,
-    58824,
-    50515,
-    3311,
-    53903,
-    41433,
-    38690,
-    82083,
-    45749,
-    65493,
-    50050,
-    8618,
-    20706,
-    72230,
-    89491,
-    44424,
-    57797,
-    27961,
-    53874,
-    23712,
-    12347,
-    321,
-    74363,
-    42055,
-    2494,
-    89952,
-    76127,
-    7392,
-    73021,
-    12441,
-    88648,
-    82561,
-    22227,
-    20517,
-    82252,
-    32637,
-    38433,
-    36980,
-    33070,
-    55738,
-    44137,
-    19571,
-    8752,
-    60186,
-    76097,
-    89253,
-    84665,
-    27256,
-    75479,
-    49284,
-    88393,
-    76683,
-    84914,
-    26393,
-    28931,
-    64119,
-    12218,
-    49820,
-    37050,
-    350,
-    41932,
-    81583,
-    58726,
-    22244,
-    11794,
-    47833,
-    20209,
-    71853,
-    10160,
-    65569,
-    26118,
-    44434,
-    79270,
-    36734,
-    33854,
-    18202,
-    21768,
-    18095,
-    76681,
-    467,
-    69635,
-    75017,
-    33099,
-    37584,
-    63712,
-    52786,
-    74563,
-    58983,
-    13890,
-    40942,
-    68562,
-    74242,
-    32892,
-    57681,
-    17719,
-    22913,
-    81957,
-    24946,
-    85295,
-    32088,
-    12737,
-    72249,
-    32855,
-    50644,
-    14183,
-    5567,
-    38688,
-    82945,
-    34563,
-    75180,
-    48102,
-    24086,
-    86827,
-    56464,
-    76009,
-    50462,
-    2,
-    53241,
-    53805,
-    18448,
-    86758,
-    11714,
-    22130,
-    73666,
-    49237,
-    52514,
-    34090,
-    86984,
-    74975,
-    84767,
-    25564,
-    38558,
-    14804,
-    14674,
-    21703,
-    58046,
-    78565,
-    63583,
-    75872,
-    49442,
-    40397,
-    17000,
-    70836,
-    70143,
-    56822,
-    38780,
-    2703,
-    39297,
-    53268,
-    76650,
-    61852,
-    58565,
-    85209,
-    43563,
-    13770,
-    57668,
-    31864,
-    63181,
-    4329,
-    10932,
-    78045,
-    35947,
-    12384,
-    11418,
-    26362,
-    66022,
-    51081,
-    53304,
-    79064,
-    60442,
-    7683,
-    42418,
-    19393,
-    72000,
-    45695,
-    45931,
-    44026,
-    18407,
-    50143,
-    64033,
-    20755,
-    63531,
-    77866,
-    18241,
-    76674,
-    67979,
-    10505,
-    47534,
-    7728,
-    88027,
-    53557,
-    11546,
-    72261,
-    81784,
-    7306,
-    32321,
-    5266,
-    26347,
-    13774,
-    76829,
-    77154,
-    18726,
-    65860,
-    77109,
-    83232,
-    77901,
-    39443,
-    43095,
-    70385,
-    4909,
-    85729,
-    37208,
-    58273,
-    7199,
-    21034,
-    15056,
-    5138,
-    37056,
-    45647,
-    5689,
-    33790,
-    47094,
-    71793,
-    14692,
-    38173,
-    50613,
-    46307,
-    14725,
-    55287,
-    15712,
-    27510,
-    72782,
-    87684,
-    80350,
-    31020,
-    88757,
-    65730,
-    4597,
-    50248,
-    33763,
-    17276,
-    79645,
-    16412,
-    6299,
-    8606,
-    86880,
-    17150,
-    37660,
-    39474,
-    43946,
-    13650,
-    43284,
-    69171,
-    67863,
-    74147,
-    41097,
-    62827,
-    76669,
-    5300,
-    7984,
-    87025,
-    22056,
-    85976,
-    34237,
-    17057,
-    29464,
-    60391,
-    39561,
-    35612,
-    84062,
-    25266,
-    45080,
-    70744,
-    84085,
-    79033,
-    21375,
-    80056,
-    89932,
-    37558,
-    19200,
-    62364,
-    17898,
-    43865,
-    42391,
-    55880,
-    66403,
-    928,
-    22044,
-    27852,
-    24082,
-    41920,
-    30892,
-    71138,
-    75361,
-    50951,
-    73697,
-    2093,
-    31640,
-    12685,
-    83086,
-    67758,
-    42232,
-    80071,
-    3884,
-    41681,
-    57054,
-    750,
-    79867,
-    68660,
-    1835,
-    24081,
-    15372,
-    15174,
-    20275,
-    593,
-    36986,
-    11705,
-    76137,
-    87039,
-    89780,
-    29383,
-    86175,
-    77649,
-    22839,
-    88622,
-    65034,
-    16871,
-    42786,
-    79531,
-    14496,
-    60070,
-    44843,
-    11872,
-    76685,
-    36047,
-    20769,
-    37758,
-    77067,
-    74185,
-    51379,
-    27862,
-    41325,
-    19488,
-    32196,
-    59616,
-    6105,
-    12465,
-    42880,
-    28065,
-    32074,
-    88075,
-    57073,
-    84428,
-    47876,
-    15386,
-    79746,
-    47814,
-    62669,
-    38864,
-    24209,
-    2027,
-    29343,
-    30302,
-    7689,
-    57044,
-    10311,
-    15358,
-    1197,
-    89943,
-    33296,
-    19694,
-    69146,
-    50297,
-    8776,
-    78035,
-    70598,
-    49834,
-    45760,
-    43334,
-    28099,
-    79811,
-    66595,
-    46298,
-    89410,
-    89814,
-    14623,
-    16742,
-    33367,
-    21699,
-    50283,
-    68349,
-    50286,
-    66250,
-    67567,
-    61497,
-    28032,
-    7451,
-    86651,
-    15628,
-    23688,
-    62779,
-    49373,
-    42589,
-    45089,
-    14961,
-    75900,
-    74519,
-    10900,
-    20955,
-    27572,
-    23115,
-    66449,
-    51012,
-    87430,
-    18351,
-    8871,
-    2238,
-    75963,
-    60614,
-    39701,
-    54290,
-    29580,
-    53030,
-    74082,
-    78516,
-    64179,
-    57509,
-    41041,
-    34828,
-    45310,
-    59768,
-    54121,
-    31466,
-    78213,
-    60472,
-    1578,
-    32929,
-    35409,
-    61478,
-    22606,
-    82552,
-    58405,
-    81641,
-    4673,
-    38727,
-    88602,
-    2340,
-    5440,
-    71246,
-    78648,
-    47179,
-    41322,
-    11370,
-    75495,
-    64571,
-    13635,
-    4513,
-    11240,
-    59548,
-    34977,
-    33749,
-    39649,
-    62864,
-    51212,
-    12476,
-    88768,
-    33609,
-    53911,
-    32036,
-    76550,
-    1591,
-    8198,
-    71577,
-    76766,
-    59626,
-    69264,
-    85553,
-    31007,
-    77553,
-    52122,
-    70469,
-    22771,
-    1168,
-    88169,
-    25996,
-    46729,
-    77977,
-    50330,
-    14476,
-    40184,
-    68135,
-    82663,
-    79546,
-    37074,
-    56834,
-    87226,
-    9728,
-    27359,
-    88160,
-    47998,
-    28166,
-    33119,
-    52971,
-    50709,
-    1639,
-    68166,
-    63342,
-    21727,
-    26413,
-    50756,
-    52977,
-    58681,
-    72717,
-    74884,
-    7119,
-    6128,
-    71567,
-    59576,
-    4957,
-    74694,
-    59703,
-    10225,
-    74005,
-    60212,
-    14129,
-    23189,
-    64826,
-    65012,
-    89417,
-    35433,
-    64918,
-    21422,
-    89732,
-    71827,
-    11751,
-    24599,
-    43364,
-    16916,
-    23930,
-    12613,
-    1704,
-    2025,
-    83381,
-    15368,
-    2367,
-    47136,
-    60077,
-    20818,
-    76798,
-    86247,
-    31570,
-    88621,
-    57922,
-    26796,
-    56866,
-    37047,
-    4623,
-    89351,
-    52584,
-    11494,
-    51457,
-    55736,
-    24319,
-    56644,
-    27081,
-    29163,
-    73452,
-    62283,
-    61286,
-    110,
-    3413,
-    4642,
-    41221,
-    76088,
-    10639,
-    51466,
-    5093,
-    59178,
-    23098,
-    61968,
-    15748,
-    58245,
-    830,
-    82586,
-    51000,
-    65870,
-    45162,
-    78435,
-    44185,
-    66626,
-    67754,
-    83865,
-    62769,
-    52168,
-    35084,
-    15882,
-    76098,
-    83467,
-    10416,
-    57210,
-    28142,
-    51973,
-    43855,
-    84427,
-    25987,
-    28029,
-    22971,
-    57598,
-    36876,
-    15524,
-    40102,
-    43345,
-    68268,
-    33183,
-    11033,
-    52187,
-    4192,
-    63064,
-    7137,
-    48254,
-    75356,
-    81657,
-    18016,
-    7676,
-    27548,
-    41386,
-    48086,
-    43222,
-    74095,
-    74531,
-    54022,
-    71939,
-    67248,
-    22324,
-    85966,
-    35528,
-    1234,
-    31346,
-    51276,
-    60824,
-    59271,
-    48645,
-    13506,
-    31833,
-    70724,
-    26177,
-    85292,
-    41643,
-    53586,
-    87813,
-    77466,
-    41508,
-    28893,
-    53485,
-    81266,
-    35172,
-    83079,
-    66299,
-    12711,
-    33052,
-    65744,
-    65675,
-    13565,
-    31115,
-    42800,
-    75032,
-    52115,
-    5158,
-    69824,
-    30289,
-    68240,
-    65285,
-    29083,
-    51266,
-    27645,
-    49336,
-    63809,
-    78105,
-    61609,
-    65252,
-    69411,
-    34842,
-    1052,
-    47076,
-    26991,
-    31165,
-    88174,
-    76820,
-    57416,
-    37265,
-    25685,
-    79739,
-    21651,
-    27807,
-    20477,
-    22138,
-    25939,
-    18919,
-    6085,
-    76498,
-    52209,
-    54860,
-    18139,
-    63098,
-    33471,
-    52851,
-    81715,
-    82426,
-    49681,
-    26432,
-    42102,
-    49001,
-    67183,
-    14243,
-    64079,
-    69133,
-    20556,
-    9923,
-    67010,
-    82789,
-    18728,
-    64774,
-    41227,
-    84090,
-    55571,
-    18449,
-    21899,
-    45662,
-    22725,
-    79353,
-    88666,
-    24128,
-    8071,
-    23144,
-    44332,
-    86703,
-    71068,
-    44507,
-    12894,
-    14548,
-    16,
-    79465,
-    54540,
-    11646,
-    46999,
-    39074,
-    47038,
-    56875,
-    37812,
-    48135,
-    89583,
-    81783,
-    78,
-    35773,
-    77854,
-    48401,
-    31164,
-    75948,
-    68666,
-    10692,
-    53603,
-    39742,
-    76970,
-    44245,
-    35976,
-    85105,
-    40227,
-    21304,
-    21967,
-    1409,
-    44140,
-    73390,
-    54772,
-    41059,
-    32042,
-    49308,
-    89289,
-    51867,
-    10373,
-    77510,
-    59866,
-    26065,
-    57513,
-    66968,
-    50981,
-    22848,
-    74295,
-    81331,
-    81933,
-    37894,
-    15608,
-    47901,
-    33549,
-    27219,
-    66825,
-    16479,
-    71004,
-    73340,
-    79564,
-    86677,
-    68124,
-    47099,
-    56407,
-    17580,
-    51523,
-    84924,
-    89896,
-    84098,
-    37457,
-    38318,
-    64865,
-    14546,
-    13749,
-    59933,
-    57912,
-    58751,
-    52807,
-    65573,
-    1277,
-    27703,
-    51849,
-    74698,
-    44059,
-    64151,
-    71700,
-    36818,
-    54323,
-    22458,
-    39101,
-    67530,
-    77917,
-    87431,
-    25982,
-    73920,
-    50018,
-    87847,
-    80776,
-    76035,
-    69126,
-    68632,
-    9768,
-    24053,
-    2732,
-    76546,
-    59611,
-    1479,
-    43439,
-    22488,
-    47060,
-    5297,
-    20792,
-    50537,
-    52886,
-    83196,
-    54746,
-    84219,
-    28959,
-    858,
-    73378,
-    85683,
-    80340,
-    55131,
-    41707,
-    61061,
-    10016,
-    40002,
-    86398,
-    15584,
-    75047,
-    17584,
-    79995,
-    5750,
-    43840,
-    74903,
-    24586,
-    68356,
-    4572,
-    73266,
-    80958,
-    2370,
-    5736,
-    2224,
-    41846,
-    49995,
-    10849,
-    31483,
-    77350,
-    69675,
-    72877,
-    27292,
-    42727,
-    19815,
-    5532,
-    16482,
-    30504,
-    50123,
-    85739,
-    25523,
-    22667,
-    8047,
-    41017,
-    40557,
-    32414,
-    74617,
-    28649,
-    83362,
-    30162,
-    65175,
-    58986,
-    31773,
-    71122,
-    1602,
-    75223,
-    66795,
-    79201,
-    26684,
-    40046,
-    46413,
-    40532,
-    26025,
-    53112,
-    37549,
-    53760,
-    78661,
-    27531,
-    54229,
-    39437,
-    27128,
-    12834,
-    86795,
-    12713,
-    23453,
-    31622,
-    76228,
-    49755,
-    38390,
-    1131,
-    16155,
-    67381,
-    22768,
-    49605,
-    66832,
-    20577,
-    43929,
-    73375,
-    7579,
-    48481,
-    48737,
-    58830,
-    41955,
-    74485,
-    79534,
-    22462,
-    87476,
-    40427,
-    12577,
-    15108,
-    24963,
-    23036,
-    12019,
-    47817,
-    20432,
-    9731,
-    39898,
-    15952,
-    11444,
-    63672,
-    39817,
-    5878,
-    33443,
-    42504,
-    70381,
-    66678,
-    52974,
-    19550,
-    29433,
-    38567,
-    34184,
-    246,
-    40836,
-    18590,
-    54478,
-    25610,
-    69166,
-    63538,
-    74061,
-    26623,
-    87691,
-    61319,
-    37542,
-    70424,
-    54689,
-    32955,
-    79951,
-    57698,
-    81607,
-    20467,
-    83879,
-    17858,
-    56502,
-    24237,
-    85939,
-    78715,
-    55290,
-    77256,
-    83178,
-    68001,
-    55653,
-    22573,
-    37014,
-    2836,
-    19454,
-    88625,
-    73582,
-    62720,
-    73486,
-    40377,
-    45551,
-    58435,
-    44422,
-    82600,
-    63571,
-    31117,
-    80808,
-    34479,
-    68146,
-    53022,
-    53286,
-    80598,
-    32469,
-    54146,
-    33366,
-    78931,
-    57853,
-    30536,
-    7245,
-    2858,
-    75711,
-    29970,
-    65047,
-    39455,
-    35607,
-    50785,
-    50337,
-    26953,
-    11943,
-    27381,
-    72188,
-    6161,
-    7703,
-    43549,
-    80584,
-    33223,
-    77110,
-    73580,
-    27618,
-    41398,
-    84989,
-    24230,
-    70537,
-    75886,
-    45937,
-    15323,
-    71877,
-    65491,
-    9644,
-    52580,
-    55071,
-    35913,
-    52999,
-    42674,
-    61643,
-    42781,
-    22378,
-    87319,
-    13181,
-    33555,
-    47355,
-    26999,
-    2376,
-    80107,
-    13488,
-    14886,
-    50702,
-    29690,
-    2768,
-    53400,
-    3378,
-    55713,
-    78051,
-    4940,
-    82435,
-    57881,
-    59998,
-    40428,
-    77070,
-    9805,
-    20085,
-    4095,
-    2695,
-    69720,
-    22873,
-    54964,
-    49765,
-    70459,
-    59481,
-    25811,
-    18249,
-    60645,
-    71111,
-    8555,
-    36237,
-    61116,
-    78233,
-    48575,
-    42873,
-    49720,
-    33958,
-    27544,
-    49116,
-    66360,
-    85012,
-    53640,
-    58901,
-    62410,
-    6837,
-    73070,
-    8005,
-    30308,
-    47954,
-    82592,
-    31310,
-    54834,
-    73815,
-    25962,
-    75699,
-    53632,
-    30405,
-    19290,
-    72310,
-    511,
-    54325,
-    49866,
-    4519,
-    23894,
-    24346,
-    74108,
-    70413,
-    70378,
-    80917,
-    47520,
-    38824,
-    69027,
-    57748,
-    41697,
-    57992,
-    67178,
-    82944,
-    10712,
-    1230,
-    6467,
-    10821,
-    66350,
-    15195,
-    38319,
-    18388,
-    82752,
-    12780,
-    35265,
-    6240,
-    22390,
-    64898,
-    16250,
-    39232,
-    17318,
-    77807,
-    678,
-    29590,
-    13215,
-    16617,
-    80532,
-    63048,
-    20158,
-    30246,
-    85930,
-    30325,
-    41146,
-    31805,
-    11310,
-    84123,
-    16041,
-    65994,
-    29873,
-    76411,
-    39668,
-    14715,
-    88285,
-    6228,
-    60994,
-    7828,
-    36489,
-    16389,
-    38303,
-    16824,
-    12144,
-    61030,
-    44325,
-    31135,
-    9095,
-    30537,
-    40173,
-    20694,
-    52729,
-    49097,
-    37437,
-    38564,
-    3254,
-    20247,
-    63453,
-    38738,
-    48167,
-    66792,
-    20384,
-    26711,
-    61637,
-    79125,
-    6905,
-    52190,
-    55165,
-    41867,
-    23486,
-    69113,
-    40638,
-    26985,
-    11944,
-    12302,
-    88708,
-    49129,
-    12391,
-    10173,
-    954,
-    70230,
-    88932,
-    8382,
-    74780,
-    50319,
-    88855,
-    33361,
-    66540,
-    2847,
-    60333,
-    50044,
-    13976,
-    78099,
-    51058,
-    11288,
-    4289,
-    80784,
-    88139,
-    70214,
-    53838,
-    11300,
-    47920,
-    87734,
-    8624,
-    73758,
-    12840,
-    67899,
-    70118,
-    5724,
-    47813,
-    37764,
-    8214,
-    16075,
-    65696,
-    34548,
-    35165,
-    77146,
-    58763,
-    69515,
-    53134,
-    8343,
-    26963,
-    24994,
-    40729,
-    6454,
-    87192,
-    75358,
-    7550,
-    79840,
-    76453,
-    9512,
-    22016,
-    45068,
-    58426,
-    69144,
-    19260,
-    21231,
-    38776,
-    42148,
-    80372,
-    4348,
-    33455,
-    66686,
-    27041,
-    87529,
-    12058,
-    3756,
-    37972,
-    11109,
-    51398,
-    10279,
-    55098,
-    42805,
-    9461,
-    75958,
-    22121,
-    25192,
-    63918,
-    81623,
-    55845,
-    17558,
-    87674,
-    4367,
-    21708,
-    62363,
-    19336,
-    71965,
-    43310,
-    28454,
-    47761,
-    45638,
-    56920,
-    27467,
-    14397,
-    19965,
-    29891,
-    61717,
-    87950,
-    43001,
-    83811,
-    42161,
-    38565,
-    13469,
-    78634,
-    65397,
-    29271,
-    18287,
-    34083,
-    57263,
-    86483,
-    9121,
-    88313,
-    54585,
-    85329,
-    84433,
-    68580,
-    69204,
-    37453,
-    52512,
-    40325,
-    70376,
-    86183,
-    47518,
-    46967,
-    2364,
-    4182,
-    65968,
-    38023,
-    49813,
-    19145,
-    69714,
-    40817,
-    45073,
-    998,
-    62233,
-    49931,
-    69614,
-    38966,
-    70479,
-    72904,
-    20562,
-    9839,
-    68637,
-    22798,
-    69274,
-    85107,
-    13526,
-    47207,
-    40730,
-    88814,
-    13381,
-    34198,
-    4864,
-    4310,
-    11384,
-    16768,
-    32533,
-    78283,
-    52799,
-    53800,
-    57433,
-    25377,
-    18396,
-    61276,
-    23797,
-    57620,
-    19427,
-    58908,
-    27630,
-    42185,
-    53923,
-    70765,
-    58562,
-    81280,
-    15617,
-    81527,
-    76048,
-    89768,
-    13170,
-    57767,
-    88083,
-    72697,
-    6897,
-    69907,
-    786,
-    29118,
-    77079,
-    30127,
-    57316,
-    61645,
-    17808,
-    6098,
-    6738,
-    56697,
-    2185,
-    53743,
-    9489,
-    12169,
-    13996,
-    74136,
-    79482,
-    9502,
-    59162,
-    34802,
-    77457,
-    13804,
-    48643,
-    69808,
-    74470,
-    28392,
-    54014,
-    43485,
-    86277,
-    18365,
-    70621,
-    34817,
-    15973,
-    18382,
-    13032,
-    65423,
-    7848,
-    42796,
-    41847,
-    48456,
-    77634,
-    26896,
-    1162,
-    65144,
-    74808,
-    61049,
-    16422,
-    62391,
-    57747,
-    76347,
-    75217,
-    35644,
-    84261,
-    66494,
-    35465,
-    79975,
-    15782,
-    58250,
-    54881,
-    22089,
-    24271,
-    75510,
-    10157,
-    85210,
-    3613,
-    5324,
-    68920,
-    63527,
-    87093,
-    18570,
-    44216,
-    56301,
-    29171,
-    69025,
-    62876,
-    81164,
-    6129,
-    55153,
-    42765,
-    63507,
-    67193,
-    43917,
-    9380,
-    6593,
-    35669,
-    31699,
-    40388,
-    18268,
-    56918,
-    72371,
-    82771,
-    15880,
-    86263,
-    28351,
-    25683,
-    87884,
-    34957,
-    86885,
-    23266,
-    80677,
-    46379,
-    37454,
-    18941,
-    76383,
-    72434,
-    5363,
-    15745,
-    9140,
-    72587,
-    9369,
-    54710,
-    82489,
-    9356,
-    58713,
-    54800,
-    87611,
-    70741,
-    36045,
-    27391,
-    8470,
-    10605,
-    22190,
-    31717,
-    31118,
-    14322,
-    29846,
-    9757,
-    23637,
-    38077,
-    14477,
-    38430,
-    19525,
-    32514,
-    29076,
-    5830,
-    19493,
-    82027,
-    875,
-    89340,
-    82050,
-    11658,
-    78784,
-    73068,
-    28793,
-    25840,
-    56869,
-    1403,
-    63089,
-    3114,
-    17120,
-    6026,
-    70343,
-    46712,
-    31981,
-    82329,
-    64549,
-    60313,
-    80098,
-    39196,
-    46453,
-    26365,
-    21230,
-    65862,
-    64725,
-    36215,
-    8698,
-    88881,
-    65547,
-    20892,
-    17632,
-    66682,
-    20282,
-    50153,
-    2792,
-    35915,
-    43624,
-    14807,
-    43322,
-    19582,
-    19700,
-    19451,
-    5602,
-    18780,
-    55780,
-    43859,
-    36590,
-    55745,
-    36055,
-    86865,
-    46130,
-    45884,
-    72679,
-    89500,
-    78387,
-    4508,
-    76141,
-    47600,
-    10184,
-    3537,
-    1219,
-    39227,
-    51661,
-    2078,
-    49883,
-    73844,
-    35076,
-    60401,
-    81067,
-    87444,
-    89982,
-    8970,
-    78820,
-    68197,
-    15439,
-    80395,
-    56819,
-    25144,
-    9038,
-    4177,
-    77010,
-    82395,
-    40132,
-    54041,
-    2198,
-    3481,
-    18393,
-    599,
-    44284,
-    3075,
-    26361,
-    17919,
-    40226,
-    42599,
-    10371,
-    48975,
-    60610,
-    50215,
-    10915,
-    89883,
-    50902,
-    79101,
-    88356,
-    31372,
-    2052,
-    77143,
-    41677,
-    26666,
-    61887,
-    18341,
-    47250,
-    46517,
-    89167,
-    65879,
-    64757,
-    18483,
-    85435,
-    53546,
-    82318,
-    78679,
-    68152,
-    82140,
-    13665,
-    84373,
-    53273,
-    49588,
-    40337,
-    62203,
-    31142,
-    74124,
-    82639,
-    81820,
-    6883,
-    55023,
-    58811,
-    26216,
-    19372,
-    27102,
-    7540,
-    41359,
-    74193,
-    19628,
-    69520,
-    49115,
-    64247,
-    28898,
-    62260,
-    19839,
-    43498,
-    85176,
-    4631,
-    30215,
-    50071,
-    87359,
-    45295,
-    3987,
-    7198,
-    74645,
-    72160,
-    53523,
-    81397,
-    8968,
-    31427,
-    60278,
-    24571,
-    76242,
-    25801,
-    85143,
-    1339,
-    37141,
-    76329,
-    23540,
-    46516,
-    69634,
-    4071,
-    56649,
-    72409,
-    25958,
-    46526,
-    75612,
-    32218,
-    27795,
-    47232,
-    50898,
-    33045,
-    86737,
-    4840,
-    88368,
-    25633,
-    17897,
-    14159,
-    23142,
-    66260,
-    80378,
-    87094,
-    65203,
-    5454,
-    139,
-    37731,
-    82172,
-    74346,
-    54886,
-    84576,
-    59650,
-    45736,
-    60335,
-    69457,
-    8239,
-    72710,
-    82660,
-    12098,
-    19656,
-    75218,
-    71678,
-    2336,
-    38369,
-    12491,
-    11291,
-    8492,
-    16846,
-    44638,
-    39225,
-    74825,
-    6251,
-    17796,
-    19852,
-    25323,
-    44965,
-    66885,
-    77163,
-    43528,
-    23462,
-    66956,
-    53266,
-    82967,
-    75613,
-    48681,
-    23214,
-    55582,
-    35972,
-    42487,
-    7916,
-    46540,
-    32022,
-    25621,
-    13566,
-    30341,
-    14119,
-    62992,
-    88867,
-    70185,
-    2111,
-    64245,
-    27953,
-    43292,
-    69279,
-    22729,
-    55669,
-    56166,
-    63166,
-    85189,
-    23162,
-    63733,
-    68542,
-    88427,
-    51532,
-    41218,
-    59120,
-    47032,
-    52832,
-    31909,
-    63361,
-    87084,
-    62766,
-    63326,
-    26327,
-    79510,
-    32664,
-    42296,
-    39391,
-    50625,
-    36531,
-    74227,
-    9130,
-    18545,
-    15297,
-    13505,
-    10838,
-    20629,
-    19602,
-    39534,
-    51721,
-    56719,
-    73161,
-    85283,
-    13825,
-    19116,
-    67119,
-    88298,
-    65951,
-    78094,
-    40280,
-    54295,
-    11058,
-    17003,
-    38860,
-    42931,
-    54240,
-    42230,
-    79305,
-    86467,
-    15382,
-    65121,
-    54249,
-    26965,
-    59694,
-    74442,
-    65188,
-    5518,
-    47940,
-    84753,
-    87840,
-    28916,
-    77172,
-    25554,
-    21267,
-    40445,
-    28798,
-    3671,
-    80245,
-    17760,
-    27438,
-    51187,
-    7565,
-    62353,
-    85,
-    63736,
-    58666,
-    40488,
-    53846,
-    48155,
-    11512,
-    7141,
-    38092,
-    66962,
-    17752,
-    3688,
-    1069,
-    34106,
-    46235,
-    60718,
-    50336,
-    86890,
-    18719,
-    853,
-    20623,
-    55894,
-    65167,
-    78992,
-    46410,
-    13117,
-    11649,
-    86309,
-    74807,
-    83556,
-    77819,
-    19741,
-    16100,
-    56171,
-    24980,
-    4270,
-    62409,
-    63302,
-    466,
-    74158,
-    69559,
-    43131,
-    7800,
-    13903,
-    82117,
-    21458,
-    83507,
-    83040,
-    58220,
-    32729,
-    69399,
-    68106,
-    13627,
-    36567,
-    17137,
-    9795,
-    3625,
-    86349,
-    21499,
-    64957,
-    21079,
-    78335,
-    21832,
-    78085,
-    78494,
-    62590,
-    49653,
-    30210,
-    12789,
-    19110,
-    15525,
-    77190,
-    25082,
-    3432,
-    5157,
-    56384,
-    74602,
-    36112,
-    71292,
-    3873,
-    55129,
-    54806,
-    40304,
-    27196,
-    41567,
-    73847,
-    47178,
-    30160,
-    23353,
-    53791,
-    69713,
-    86468,
-    31832,
-    2777,
-    30936,
-    14218,
-    7206,
-    21444,
-    76736,
-    4012,
-    54469,
-    33884,
-    73248,
-    69663,
-    81763,
-    8934,
-    44001,
-    47298,
-    436,
-    69973,
-    39152,
-    78881,
-    71807,
-    11295,
-    60815,
-    63110,
-    81826,
-    19865,
-    83990,
-    18799,
-    12600,
-    62367,
-    3646,
-    29222,
-    80181,
-    41673,
-    32237,
-    49785,
-    83426,
-    13860,
-    68996,
-    63884,
-    55439,
-    40253,
-    85990,
-    66652,
-    20858,
-    44337,
-    28670,
-    83342,
-    23129,
-    28819,
-    77442,
-    61130,
-    39256,
-    65295,
-    47561,
-    51718,
-    25152,
-    33937,
-    36822,
-    2850,
-    86260,
-    47587,
-    50378,
-    25964,
-    38270,
-    89755,
-    39034,
-    31434,
-    72342,
-    22114,
-    53503,
-    33982,
-    64503,
-    80998,
-    82831,
-    1541,
-    38867,
-    56700,
-    9005,
-    7546,
-    32221,
-    63938,
-    71961,
-    27954,
-    69849,
-    2068,
-    29233,
-    2932,
-    36830,
-    30176,
-    42003,
-    65692,
-    42144,
-    78095,
-    27524,
-    5855,
-    47605,
-    54266,
-    19826,
-    24158,
-    84249,
-    21852,
-    74743,
-    55342,
-    44057,
-    30312,
-    35371,
-    42761,
-    33306,
-    36089,
-    86153,
-    14327,
-    26307,
-    20244,
-    26818,
-    89608,
-    65772,
-    67577,
-    14172,
-    56587,
-    37906,
-    30949,
-    3886,
-    64655,
-    71103,
-    34893,
-    46015,
-    84321,
-    49125,
-    499,
-    48952,
-    1126,
-    68443,
-    28537,
-    83466,
-    25747,
-    28267,
-    76091,
-    65349,
-    45773,
-    84801,
-    74344,
-    74364,
-    81847,
-    34140,
-    71979,
-    2566,
-    35441,
-    42283,
-    16770,
-    81464,
-    1848,
-    64702,
-    66197,
-    21357,
-    85380,
-    32082,
-    37617,
-    42271,
-    76306,
-    87169,
-    84994,
-    32199,
-    7917,
-    40362,
-    69201,
-    47425,
-    19924,
-    238,
-    56459,
-    33133,
-    57861,
-    4500,
-    67852,
-    69079,
-    57682,
-    75247,
-    77538,
-    18872,
-    8262,
-    6799,
-    59408,
-    23263,
-    74545,
-    41866,
-    81773,
-    3399,
-    42583,
-    62950,
-    33991,
-    46861,
-    56415,
-    46715,
-    42757,
-    75227,
-    39738,
-    79957,
-    49484,
-    19838,
-    88371,
-    66330,
-    79300,
-    85569,
-    49269,
-    87447,
-    44578,
-    44859,
-    37411,
-    78161,
-    15510,
-    55620,
-    60464,
-    47589,
-    14064,
-    10302,
-    65935,
-    12670,
-    71695,
-    44607,
-    42005,
-    47753,
-    66996,
-    1808,
-    22358,
-    31708,
-    47552,
-    16603,
-    53625,
-    43163,
-    44110,
-    15720,
-    40316,
-    47290,
-    60924,
-    82701,
-    25241,
-    25713,
-    20118,
-    75363,
-    68361,
-    21578,
-    71817,
-    33186,
-    48360,
-    9949,
-    14569,
-    34787,
-    87137,
-    21081,
-    34743,
-    51369,
-    54463,
-    45344,
-    47036,
-    40731,
-    88469,
-    14518,
-    51799,
-    87237,
-    57885,
-    730,
-    88355,
-    63096,
-    61147,
-    13957,
-    67632,
-    14223,
-    8521,
-    42960,
-    22980,
-    21203,
-    47575,
-    16732,
-    50182,
-    68826,
-    3287,
-    41334,
-    38919,
-    56506,
-    52967,
-    52871,
-    81811,
-    86808,
-    9847,
-    58884,
-    26551,
-    44842,
-    37044,
-    34088,
-    37070,
-    80248,
-    30297,
-    39480,
-    67117,
-    46656,
-    47223,
-    16931,
-    402,
-    5358,
-    68519,
-    28182,
-    11166,
-    78884,
-    76662,
-    38432,
-    73482,
-    78926,
-    38933,
-    68785,
-    26847,
-    29365,
-    28104,
-    13843,
-    55692,
-    2880,
-    66275,
-    515,
-    85873,
-    59888,
-    87389,
-    35480,
-    73466,
-    88334,
-    44306,
-    11135,
-    6880,
-    47741,
-    64254,
-    59813,
-    55763,
-    80893,
-    23687,
-    36702,
-    18582,
-    82169,
-    9604,
-    66006,
-    84355,
-    16260,
-    67896,
-    4039,
-    20660,
-    63640,
-    19683,
-    55707,
-    11330,
-    44041,
-    64484,
-    43416,
-    72229,
-    79560,
-    35951,
-    26808,
-    36092,
-    89658,
-    62565,
-    17947,
-    57431,
-    77615,
-    63601,
-    12740,
-    42535,
-    62430,
-    71958,
-    30472,
-    27272,
-    15503,
-    29052,
-    11223,
-    66762,
-    65092,
-    56976,
-    53015,
-    59549,
-    26460,
-    70033,
-    10923,
-    43490,
-    8859,
-    29741,
-    8767,
-    88435,
-    86919,
-    58569,
-    75131,
-    8545,
-    584,
-    2878,
-    23050,
-    65087,
-    10828,
-    52762,
-    22970,
-    69949,
-    87451,
-    39526,
-    30353,
-    3210,
-    18374,
-    5888,
-    61156,
-    38330,
-    11044,
-    29214,
-    57378,
-    38744,
-    82550,
-    5600,
-    34807,
-    84452,
-    32355,
-    78616,
-    56393,
-    13075,
-    25290,
-    25225,
-    15542,
-    8558,
-    74497,
-    13623,
-    64523,
-    5813,
-    22222,
-    3218,
-    10835,
-    78062,
-    50023,
-    65186,
-    57423,
-    35582,
-    55181,
-    5213,
-    4104,
-    44394,
-    59307,
-    10977,
-    72383,
-    89657,
-    71544,
-    23414,
-    14239,
-    48379,
-    72956,
-    75542,
-    34614,
-    35613,
-    65982,
-    24583,
-    86328,
-    68093,
-    44021,
-    47269,
-    63438,
-    66732,
-    30780,
-    64697,
-    1951,
-    65469,
-    5028,
-    41300,
-    29440,
-    12786,
-    70967,
-    81898,
-    44228,
-    23752,
-    43295,
-    57454,
-    89697,
-    10509,
-    25573,
-    61329,
-    71615,
-    61757,
-    55527,
-    46648,
-    51678,
-    83966,
-    25994,
-    81907,
-    16673,
-    41717,
-    80218,
-    57938,
-    38700,
-    6477,
-    78783,
-    42044,
-    86829,
-    63244,
-    34243,
-    39543,
-    65257,
-    36505,
-    74660,
-    86288,
-    88866,
-    44980,
-    2469,
-    38468,
-    60704,
-    49689,
-    30722,
-    61573,
-    27636,
-    17886,
-    70306,
-    39780,
-    10141,
-    49715,
-    7574,
-    60325,
-    18912,
-    52538,
-    17933,
-    33444,
-    79853,
-    15239,
-    70067,
-    57628,
-    77099,
-    69202,
-    89870,
-    59310,
-    500,
-    36348,
-    26629,
-    73822,
-    42021,
-    49176,
-    68334,
-    49843,
-    5322,
-    64343,
-    34349,
-    72025,
-    70036,
-    8226,
-    4242,
-    66901,
-    61206,
-    74969,
-    10114,
-    68395,
-    39696,
-    36959,
-    78775,
-    54282,
-    39996,
-    5122,
-    47660,
-    61252,
-    59545,
-    34487,
-    39083,
-    65902,
-    667,
-    61096,
-    63198,
-    66141,
-    22661,
-    88323,
-    80771,
-    36558,
-    62376,
-    10962,
-    18466,
-    67162,
-    49189,
-    62934,
-    44495,
-    55043,
-    52845,
-    70723,
-    33434,
-    31419,
-    80230,
-    55171,
-    12830,
-    59331,
-    34888,
-    37351,
-    20056,
-    23682,
-    77289,
-    62659,
-    75869,
-    34152,
-    87768,
-    52259,
-    11641,
-    48408,
-    43396,
-    86429,
-    37146,
-    76918,
-    61828,
-    28327,
-    12544,
-    57753,
-    76581,
-    87844,
-    74934,
-    79062,
-    27483,
-    21597,
-    20338,
-    47549,
-    32875,
-    51338,
-    80830,
-    46457,
-    19199,
-    20099,
-    64727,
-    34601,
-    20841,
-    21507,
-    75702,
-    21060,
-    19490,
-    41915,
-    36596,
-    65841,
-    52726,
-    20536,
-    66045,
-    49922,
-    28051,
-    27965,
-    47918,
-    53292,
-    22450,
-    16926,
-    5064,
-    50894,
-    46919,
-    40881,
-    63678,
-    26905,
-    27347,
-    70348,
-    7979,
-    89156,
-    52634,
-    56498,
-    70288,
-    17199,
-    41251,
-    75566,
-    61288,
-    35572,
-    58042,
-    28654,
-    32681,
-    21638,
-    35118,
-    52467,
-    16930,
-    40126,
-    16294,
-    16981,
-    88226,
-    89550,
-    56622,
-    43233,
-    45914,
-    77923,
-    37098,
-    52769,
-    45785,
-    56584,
-    18899,
-    9858,
-    58248,
-    50477,
-    73150,
-    81058,
-    45724,
-    19448,
-    62465,
-    69645,
-    53088,
-    19331,
-    50639,
-    43253,
-    76442,
-    44901,
-    16935,
-    13062,
-    58341,
-    43293,
-    37484,
-    54113,
-    33660,
-    60238,
-    43104,
-    50381,
-    54420,
-    67203,
-    40239,
-    1499,
-    59072,
-    31337,
-    17692,
-    19291,
-    37006,
-    88069,
-    35342,
-    31834,
-    29079,
-    42264,
-    40999,
-    30233,
-    56853,
-    21275,
-    31760,
-    30678,
-    56660,
-    37222,
-    15507,
-    62423,
-    77342,
-    85597,
-    35776,
-    44113,
-    72972,
-    80342,
-    58906,
-    52443,
-    86746,
-    28047,
-    26338,
-    61740,
-    9187,
-    76584,
-    55762,
-    6379,
-    5891,
-    47413,
-    48207,
-    80152,
-    34182,
-    69307,
-    79558,
-    67816,
-    6971,
-    9813,
-    78544,
-    78127,
-    30319,
-    78693,
-    59738,
-    1109,
-    10571,
-    35631,
-    79292,
-    80960,
-    29513,
-    44938,
-    89620,
-    6656,
-    38193,
-    77581,
-    34622,
-    55418,
-    42938,
-    19692,
-    48988,
-    60377,
-    81862,
-    61726,
-    71548,
-    3153,
-    47627,
-    52868,
-    79455,
-    61436,
-    47444,
-    87457,
-    42495,
-    66537,
-    15810,
-    17461,
-    57034,
-    8431,
-    16283,
-    19250,
-    40812,
-    47828,
-    45100,
-    8584,
-    20412,
-    19516,
-    41757,
-    54126,
-    13530,
-    47521,
-    24078,
-    53881,
-    87482,
-    71642,
-    35600,
-    26333,
-    65701,
-    12570,
-    66104,
-    89066,
-    24942,
-    3453,
-    38540,
-    71504,
-    422,
-    52355,
-    84414,
-    41572,
-    79107,
-    8637,
-    25370,
-    57814,
-    47180,
-    48778,
-    74249,
-    68304,
-    53741,
-    14232,
-    89102,
-    82460,
-    20150,
-    1723,
-    3870,
-    26254,
-    46941,
-    12156,
-    39154,
-    11941,
-    2492,
-    57963,
-    2567,
-    58371,
-    22733,
-    21041,
-    31014,
-    37587,
-    16584,
-    69410,
-    43547,
-    69451,
-    7283,
-    70707,
-    9969,
-    29581,
-    88442,
-    31809,
-    61015,
-    89536,
-    10667,
-    52213,
-    68458,
-    65633,
-    54225,
-    30835,
-    46912,
-    1558,
-    59008,
-    36652,
-    67059,
-    34672,
-    59674,
-    68171,
-    7382,
-    63310,
-    11648,
-    63754,
-    77332,
-    45666,
-    28217,
-    83359,
-    24490,
-    54186,
-    75429,
-    873,
-    72719,
-    82001,
-    30449,
-    68622,
-    48647,
-    45088,
-    81668,
-    16416,
-    81670,
-    37772,
-    52238,
-    88423,
-    15349,
-    1012,
-    6592,
-    34263,
-    78771,
-    8330,
-    57418,
-    14505,
-    67128,
-    39423,
-    73725,
-    28335,
-    51591,
-    58992,
-    56482,
-    72761,
-    45422,
-    38195,
-    10976,
-    68494,
-    84003,
-    81468,
-    34605,
-    3720,
-    87358,
-    59266,
-    54602,
-    14418,
-    40344,
-    55916,
-    12980,
-    78170,
-    88683,
-    83927,
-    21159,
-    35410,
-    43010,
-    77316,
-    59603,
-    30965,
-    12137,
-    23444,
-    53652,
-    46702,
-    51599,
-    42085,
-    36881,
-    43076,
-    21055,
-    29573,
-    87923,
-    29401,
-    14011,
-    8562,
-    86970,
-    66253,
-    39884,
-    67581,
-    37885,
-    8786,
-    55333,
-    55232,
-    54640,
-    79996,
-    46704,
-    69029,
-    45049,
-    11761,
-    36450,
-    1934,
-    7877,
-    18011,
-    57382,
-    82595,
-    64388,
-    70980,
-    31990,
-    7832,
-    8086,
-    10251,
-    74340,
-    40611,
-    33971,
-    10734,
-    55843,
-    61427,
-    89429,
-    24799,
-    14136,
-    21518,
-    14642,
-    32816,
-    13905,
-    66504,
-    69926,
-    54914,
-    83575,
-    47570,
-    41923,
-    27549,
-    27759,
-    76518,
-    42146,
-    70823,
-    17385,
-    30125,
-    522,
-    43769,
-    7270,
-    19819,
-    831,
-    5207,
-    2786,
-    30945,
-    913,
-    89382,
-    84579,
-    68310,
-    53636,
-    70484,
-    19446,
-    9613,
-    17838,
-    86230,
-    40654,
-    34190,
-    1183,
-    58132,
-    45410,
-    43477,
-    70665,
-    85653,
-    32548,
-    37891,
-    12345,
-    73245,
-    38591,
-    87424,
-    58807,
-    35822,
-    46207,
-    12351,
-    6008,
-    61179,
-    29691,
-    28173,
-    58452,
-    21608,
-    52234,
-    34047,
-    41676,
-    29084,
-    13211,
-    62810,
-    58552,
-    78821,
-    36800,
-    68678,
-    59163,
-    26455,
-    56966,
-    76852,
-    18501,
-    42343,
-    83016,
-    36963,
-    12503,
-    49188,
-    17664,
-    2917,
-    82744,
-    71368,
-    63904,
-    35855,
-    60951,
-    40719,
-    12610,
-    13041,
-    11297,
-    76637,
-    14392,
-    30633,
-    70575,
-    14611,
-    88274,
-    44731,
-    38578,
-    13659,
-    52441,
-    56659,
-    69375,
-    11267,
-    40610,
-    84100,
-    73453,
-    45766,
-    46431,
-    49573,
-    16557,
-    36258,
-    50494,
-    71741,
-    45922,
-    68320,
-    65043,
-    65069,
-    50453,
-    46710,
-    88414,
-    35095,
-    44335,
-    76534,
-    50686,
-    36819,
-    64194,
-    88144,
-    89193,
-    67837,
-    7508,
-    49232,
-    88784,
-    74054,
-    22841,
-    72193,
-    43768,
-    1974,
-    17314,
-    53019,
-    79588,
-    31335,
-    47556,
-    27836,
-    35098,
-    44526,
-    82758,
-    84233,
-    17518,
-    26928,
-    87880,
-    19170,
-    28741,
-    89103,
-    69481,
-    87254,
-    57091,
-    82601,
-    2972,
-    49111,
-    3331,
-    2316,
-    19318,
-    44547,
-    33362,
-    45405,
-    52853,
-    14353,
-    50770,
-    57612,
-    64038,
-    89127,
-    88713,
-    12509,
-    82421,
-    81822,
-    70618,
-    62229,
-    55469,
-    5911,
-    3911,
-    49532,
-    65280,
-    80722,
-    56207,
-    50366,
-    17083,
-    77705,
-    28652,
-    69807,
-    50944,
-    84084,
-    10746,
-    9879,
-    31131,
-    1965,
-    40313,
-    4576,
-    29444,
-    41605,
-    45706,
-    44427,
-    35844,
-    45547,
-    46968,
-    59522,
-    37392,
-    46986,
-    68602,
-    55260,
-    59572,
-    85276,
-    64078,
-    55452,
-    79278,
-    55358,
-    83531,
-    18259,
-    67792,
-    50552,
-    14650,
-    12614,
-    82202,
-    31863,
-    39430,
-    47734,
-    5142,
-    51464,
-    68522,
-    27494,
-    28205,
-    58864,
-    22215,
-    8725,
-    32719,
-    16731,
-    62445,
-    71463,
-    43984,
-    13801,
-    77726,
-    8746,
-    43620,
-    16802,
-    33928,
-    86902,
-    56710,
-    26509,
-    20083,
-    40419,
-    26648,
-    11360,
-    12821,
-    76937,
-    57503,
-    3690,
-    10679,
-    24028,
-    9936,
-    40228,
-    33656,
-    71030,
-    1845,
-    77451,
-    26604,
-    20613,
-    51270,
-    38335,
-    87459,
-    67582,
-    37988,
-    82155,
-    81122,
-    82375,
-    44473,
-    88138,
-    81465,
-    8259,
-    43962,
-    70583,
-    75267,
-    14256,
-    1278,
-    53018,
-    30111,
-    60087,
-    45877,
-    29808,
-    75925,
-    65952,
-    18015,
-    5095,
-    56173,
-    55056,
-    18711,
-    68740,
-    54935,
-    41240,
-    89038,
-    64300,
-    78577,
-    83341,
-    82022,
-    22249,
-    62789,
-    31212,
-    71239,
-    14999,
-    81978,
-    86556,
-    11432,
-    79955,
-    3490,
-    24152,
-    85501,
-    11530,
-    52590,
-    56658,
-    28865,
-    6658,
-    7472,
-    23609,
-    16743,
-    89100,
-    64672,
-    28498,
-    31179,
-    31533,
-    76474,
-    50424,
-    69445,
-    7506,
-    38837,
-    26241,
-    4019,
-    87176,
-    28283,
-    63983,
-    33735,
-    36956,
-    66245,
-    72244,
-    38329,
-    79221,
-    10575,
-    89627,
-    32523,
-    43706,
-    49881,
-    51514,
-    15344,
-    18555,
-    4047,
-    35160,
-    72685,
-    6499,
-    67571,
-    7696,
-    47905,
-    67169,
-    36247,
-    38258,
-    35655,
-    68141,
-    43088,
-    13747,
-    65374,
-    46103,
-    83851,
-    34715,
-    44904,
-    2152,
-    82718,
-    22054,
-    16248,
-    41609,
-    15471,
-    42433,
-    89242,
-    9360,
-    4419,
-    39197,
-    44062,
-    61527,
-    60044,
-    84476,
-    77483,
-    4728,
-    52282,
-    5007,
-    10324,
-    17050,
-    13072,
-    10765,
-    2818,
-    20684,
-    7358,
-    32280,
-    46268,
-    76294,
-    26650,
-    63926,
-    16276,
-    44100,
-    58606,
-    55703,
-    9864,
-    15086,
-    1478,
-    48391,
-    45911,
-    78642,
-    24021,
-    16263,
-    85470,
-    49847,
-    14154,
-    34437,
-    31554,
-    41961,
-    41502,
-    38112,
-    3127,
-    77416,
-    15820,
-    4191,
-    70201,
-    62958,
-    36586,
-    67432,
-    56945,
-    49031,
-    82038,
-    8627,
-    85549,
-    35743,
-    19755,
-    74252,
-    68851,
-    33228,
-    37270,
-    63219,
-    28980,
-    46539,
-    43636,
-    34129,
-    17045,
-    29853,
-    79810,
-    26823,
-    83895,
-    48430,
-    70925,
-    18494,
-    36117,
-    35675,
-    19460,
-    18848,
-    82267,
-    38474,
-    72379,
-    76615,
-    84752,
-    37416,
-    84317,
-    38284,
-    18258,
-    64994,
-    58240,
-    72701,
-    53138,
-    13913,
-    75123,
-    31917,
-    81451,
-    87119,
-    77123,
-    44651,
-    65648,
-    56340,
-    73614,
-    23071,
-    51483,
-    12761,
-    55884,
-    47614,
-    31914,
-    68716,
-    3258,
-    70159,
-    40518,
-    3521,
-    48701,
-    85118,
-    73461,
-    32329,
-    78436,
-    78553,
-    26325,
-    41753,
-    45087,
-    51855,
-    52369,
-    7322,
-    46665,
-    54811,
-    68965,
-    73084,
-    77738,
-    53969,
-    58280,
-    86564,
-    19786,
-    5181,
-    74870,
-    37957,
-    7024,
-    58241,
-    33633,
-    39896,
-    54380,
-    1730,
-    33860,
-    10608,
-    74638,
-    44877,
-    89206,
-    71470,
-    37912,
-    8274,
-    50611,
-    79049,
-    76895,
-    40636,
-    37043,
-    13,
-    35589,
-    5424,
-    67131,
-    6373,
-    15024,
-    74909,
-    40166,
-    3901,
-    88534,
-    80624,
-    85331,
-    43770,
-    50593,
-    8358,
-    6726,
-    10413,
-    45765,
-    66272,
-    86846,
-    74833,
-    10493,
-    49780,
-    8133,
-    8648,
-    26893,
-    37279,
-    48830,
-    33653,
-    28175,
-    72985,
-    13753,
-    48178,
-    50920,
-    17048,
-    43844,
-    24393,
-    19636,
-    31665,
-    3933,
-    12705,
-    86680,
-    21486,
-    696,
-    56041,
-    78665,
-    48992,
-    49254,
-    7663,
-    37822,
-    58693,
-    47715,
-    79152,
-    6327,
-    33435,
-    40572,
-    41260,
-    64150,
-    87283,
-    48520,
-    21435,
-    68601,
-    47169,
-    57267,
-    81284,
-    87871,
-    60239,
-    38516,
-    31577,
-    41718,
-    85664,
-    25074,
-    2751,
-    72624,
-    65986,
-    8629,
-    28319,
-    68805,
-    17387,
-    49897,
-    84370,
-    9784,
-    10308,
-    18267,
-    5722,
-    46595,
-    12991,
-    9057,
-    1620,
-    44699,
-    66872,
-    83198,
-    62793,
-    17663,
-    24407,
-    79833,
-    16646,
-    56434,
-    61350,
-    7535,
-    17012,
-    53505,
-    16946,
-    54207,
-    8139,
-    89496,
-    4947,
-    61308,
-    20281,
-    14710,
-    38383,
-    5140,
-    8488,
-    14285,
-    87035,
-    1035,
-    68213,
-    4459,
-    75037,
-    3630,
-    71588,
-    55682,
-    10966,
-    79604,
-    947,
-    53799,
-    41747,
-    18518,
-    75803,
-    76033,
-    9184,
-    53568,
-    39129,
-    22577,
-    61552,
-    60579,
-    88047,
-    80094,
-    46615,
-    39269,
-    78172,
-    2222,
-    17985,
-    68209,
-    26811,
-    33500,
-    77178,
-    8685,
-    63458,
-    86960,
-    19477,
-    56868,
-    56313,
-    46276,
-    10349,
-    27277,
-    16109,
-    64876,
-    89145,
-    67525,
-    70594,
-    53197,
-    70134,
-    18963,
-    16965,
-    46578,
-    89111,
-    56570,
-    45970,
-    84979,
-    32944,
-    33046,
-    31287,
-    58680,
-    88151,
-    32357,
-    74718,
-    60816,
-    68523,
-    74641,
-    5985,
-    18615,
-    4671,
-    32223,
-    41417,
-    87787,
-    8528,
-    62118,
-    29117,
-    63069,
-    74559,
-    64302,
-    14612,
-    6334,
-    33343,
-    54195,
-    45051,
-    18097,
-    23261,
-    84519,
-    87919,
-    61778,
-    24239,
-    14165,
-    46452,
-    58948,
-    85568,
-    13855,
-    27250,
-    52543,
-    46341,
-    22425,
-    18879,
-    35513,
-    62276,
-    21890,
-    37161,
-    33225,
-    61272,
-    56682,
-    77201,
-    19654,
-    38761,
-    81528,
-    74798,
-    38358,
-    30912,
-    9097,
-    23612,
-    665,
-    83828,
-    89359,
-    53793,
-    7710,
-    83368,
-    34402,
-    11988,
-    12357,
-    82859,
-    67483,
-    37029,
-    43663,
-    89573,
-    10485,
-    58460,
-    32762,
-    52081,
-    30844,
-    53079,
-    31295,
-    47625,
-    28092,
-    49527,
-    27594,
-    63094,
-    50060,
-    6018,
-    25217,
-    24794,
-    18057,
-    81988,
-    11074,
-    9321,
-    48661,
-    8524,
-    48073,
-    18063,
-    27234,
-    74288,
-    41468,
-    32833,
-    82180,
-    6359,
-    2635,
-    38973,
-    40713,
-    39010,
-    63515,
-    39011,
-    62922,
-    37174,
-    52203,
-    27693,
-    19332,
-    57362,
-    61448,
-    57933,
-    62975,
-    71095,
-    49211,
-    2412,
-    47936,
-    74875,
-    65949,
-    82404,
-    42996,
-    60555,
-    14354,
-    52459,
-    26076,
-    16480,
-    32697,
-    35643,
-    46355,
-    6361,
-    28121,
-    36544,
-    74226,
-    33888,
-    75069,
-    14933,
-    22516,
-    57169,
-    44022,
-    5576,
-    9244,
-    14526,
-    37354,
-    40140,
-    39605,
-    78437,
-    41944,
-    12820,
-    69199,
-    44042,
-    71168,
-    76956,
-    78598,
-    8156,
-    76598,
-    53676,
-    38858,
-    85595,
-    6498,
-    77048,
-    46290,
-    85116,
-    76859,
-    73350,
-    21504,
-    60945,
-    56737,
-    88658,
-    79513,
-    76430,
-    75643,
-    39506,
-    25060,
-    7510,
-    69036,
-    7748,
-    29282,
-    37380,
-    58385,
-    86245,
-    80894,
-    47124,
-    73861,
-    66622,
-    35920,
-    75430,
-    83810,
-    1274,
-    33882,
-    25064,
-    36894,
-    81845,
-    80907,
-    66907,
-    4335,
-    58627,
-    47976,
-    83200,
-    16516,
-    7973,
-    23213,
-    83520,
-    72403,
-    12640,
-    18377,
-    48106,
-    83678,
-    2369,
-    47353,
-    61809,
-    69255,
-    78660,
-    34668,
-    31013,
-    43587,
-    48194,
-    70212,
-    18600,
-    40522,
-    9233,
-    7485,
-    87761,
-    60004,
-    49543,
-    69730,
-    47102,
-    11726,
-    83561,
-    87,
-    57542,
-    86039,
-    88211,
-    79350,
-    6346,
-    5344,
-    52388,
-    11413,
-    39002,
-    86465,
-    12258,
-    49089,
-    47280,
-    8202,
-    931,
-    84133,
-    48131,
-    30866,
-    14200,
-    38524,
-    37055,
-    32751,
-    84305,
-    69955,
-    4287,
-    62352,
-    43006,
-    54314,
-    47337,
-    74118,
-    11268,
-    37008,
-    66630,
-    40517,
-    9061,
-    72300,
-    56055,
-    13993,
-    70416,
-    80694,
-    8185,
-    4886,
-    30348,
-    12029,
-    67332,
-    27139,
-    18252,
-    3714,
-    38710,
-    23865,
-    2744,
-    63708,
-    48820,
-    81383,
-    58458,
-    87650,
-    39795,
-    14538,
-    5735,
-    1850,
-    47900,
-    13809,
-    77262,
-    85458,
-    7159,
-    36063,
-    87774,
-    82123,
-    89072,
-    86118,
-    69919,
-    718,
-    47578,
-    8755,
-    37949,
-    87958,
-    31883,
-    79783,
-    10243,
-    44316,
-    76923,
-    26239,
-    73008,
-    67935,
-    15051,
-    71962,
-    75921,
-    81221,
-    22615,
-    24295,
-    80863,
-    51019,
-    34504,
-    36566,
-    62263,
-    89521,
-    59734,
-    75608,
-    10026,
-    16786,
-    6350,
-    32633,
-    25092,
-    67819,
-    14785,
-    67658,
-    26064,
-    57092,
-    59464,
-    3359,
-    56865,
-    2161,
-    40866,
-    354,
-    41711,
-    72074,
-    37929,
-    21857,
-    82485,
-    42012,
-    22350,
-    70983,
-    74244,
-    33877,
-    6188,
-    73627,
-    70379,
-    16123,
-    3749,
-    79716,
-    86716,
-    17374,
-    83954,
-    52541,
-    59750,
-    53952,
-    75013,
-    81395,
-    17115,
-    89847,
-    69042,
-    30803,
-    76609,
-    86472,
-    31652,
-    71394,
-    58288,
-    51108,
-    32487,
-    85304,
-    9727,
-    67506,
-    66606,
-    13896,
-    51861,
-    76325,
-    71392,
-    30524,
-    21815,
-    13353,
-    16249,
-    76986,
-    5072,
-    43909,
-    46541,
-    63557,
-    48804,
-    25632,
-    1344,
-    81243,
-    34381,
-    47668,
-    80954,
-    26822,
-    81211,
-    82322,
-    85835,
-    39768,
-    53450,
-    64723,
-    79674,
-    31639,
-    44233,
-    24168,
-    77497,
-    31238,
-    63603,
-    1027,
-    76106,
-    14834,
-    49319,
-    75234,
-    30101,
-    11666,
-    8961,
-    76931,
-    38859,
-    46668,
-    34411,
-    54166,
-    78669,
-    25690,
-    52194,
-    5246,
-    16857,
-    80165,
-    59692,
-    86513,
-    79931,
-    71908,
-    49899,
-    42098,
-    88409,
-    17531,
-    75419,
-    34460,
-    49545,
-    50052,
-    19960,
-    63616,
-    21406,
-    836,
-    47286,
-    41802,
-    26370,
-    37137,
-    6305,
-    60155,
-    73413,
-    63645,
-    23340,
-    87015,
-    21174,
-    4311,
-    67743,
-    45208,
-    70938,
-    42349,
-    51394,
-    15335,
-    78870,
-    32349,
-    45223,
-    12483,
-    74221,
-    89120,
-    79136,
-    12800,
-    16708,
-    62893,
-    35864,
-    40891,
-    34822,
-    28691,
-    29434,
-    82541,
-    74809,
-    60810,
-    4527,
-    89910,
-    11390,
-    17987,
-    6005,
-    49416,
-    603,
-    60168,
-    64763,
-    6416,
-    25352,
-    25920,
-    44408,
-    82909,
-    34783,
-    47979,
-    27259,
-    40368,
-    3954,
-    53081,
-    83717,
-    1462,
-    88463,
-    36524,
-    22476,
-    6079,
-    17673,
-    17960,
-    15157,
-    964,
-    5922,
-    140,
-    14402,
-    17046,
-    40115,
-    76876,
-    44435,
-    12128,
-    82568,
-    89010,
-    67947,
-    72813,
-    29173,
-    33868,
-    10520,
-    89395,
-    3397,
-    57197,
-    78502,
-    16558,
-    68645,
-    53941,
-    83740,
-    36984,
-    76144,
-    3206,
-    46931,
-    29317,
-    68827,
-    10673,
-    52197,
-    28048,
-    69719,
-    28686,
-    68818,
-    28557,
-    41918,
-    61940,
-    10369,
-    70547,
-    20980,
-    38906,
-    40071,
-    84609,
-    49696,
-    26034,
-    14874,
-    68131,
-    2175,
-    22512,
-    20135,
-    20013,
-    75756,
-    80990,
-    83171,
-    61261,
-    24051,
-    73383,
-    54489,
-    39574,
-    87932,
-    88,
-    65708,
-    72137,
-    40750,
-    43274,
-    11500,
-    73967,
-    73193,
-    25257,
-    6911,
-    13875,
-    45016,
-    49947,
-    51766,
-    37528,
-    73405,
-    17854,
-    32477,
-    5661,
-    59375,
-    61667,
-    13424,
-    23461,
-    74891,
-    33569,
-    6024,
-    50329,
-    45116,
-    48977,
-    29722,
-    73433,
-    22724,
-    81704,
-    46022,
-    15209,
-    51074,
-    8594,
-    77942,
-    3620,
-    88697,
-    52090,
-    3957,
-    83492,
-    60197,
-    62777,
-    42841,
-    44235,
-    31370,
-    25282,
-    19968,
-    51883,
-    88692,
-    78356,
-    41466,
-    38980,
-    814,
-    88865,
-    35446,
-    63819,
-    49807,
-    34258,
-    7656,
-    86738,
-    9322,
-    78539,
-    57280,
-    62157,
-    43171,
-    4979,
-    35650,
-    24852,
-    24101,
-    69527,
-    60765,
-    24212,
-    16823,
-    19773,
-    74675,
-    68702,
-    23411,
-    54699,
-    83212,
-    48743,
-    36066,
-    5506,
-    76481,
-    52810,
-    29793,
-    21411,
-    27038,
-    17478,
-    14861,
-    20898,
-    2215,
-    75070,
-    59007,
-    51229,
-    40737,
-    65992,
-    31942,
-    40277,
-    48875,
-    62927,
-    85431,
-    40086,
-    55266,
-    76367,
-    79095,
-    15444,
-    61375,
-    66255,
-    65359,
-    13823,
-    63006,
-    42575,
-    69252,
-    68713,
-    70533,
-    29675,
-    82093,
-    48467,
-    35689,
-    21023,
-    31366,
-    52598,
-    76715,
-    37794,
-    67738,
-    65290,
-    3721,
-    52727,
-    18456,
-    58270,
-    44698,
-    38243,
-    40373,
-    71161,
-    79480,
-    87937,
-    76827,
-    30925,
-    50437,
-    37395,
-    41521,
-    59223,
-    60280,
-    85075,
-    82539,
-    27944,
-    83112,
-    33557,
-    61635,
-    237,
-    53526,
-    1630,
-    38247,
-    55640,
-    53370,
-    44246,
-    72102,
-    1999,
-    43826,
-    70208,
-    7542,
-    5823,
-    6952,
-    25145,
-    60638,
-    52509,
-    58673,
-    45069,
-    71290,
-    1444,
-    63015,
-    8070,
-    29507,
-    10581,
-    70443,
-    32631,
-    2193,
-    27309,
-    2413,
-    32928,
-    6550,
-    31004,
-    67379,
-    66409,
-    38718,
-    41982,
-    24633,
-    69983,
-    7857,
-    65785,
-    14395,
-    48634,
-    4111,
-    22562,
-    55206,
-    5944,
-    31601,
-    42333,
-    23428,
-    17163,
-    27061,
-    46773,
-    79618,
-    22621,
-    81551,
-    23472,
-    54426,
-    47127,
-    52759,
-    9499,
-    83592,
-    11899,
-    20227,
-    51051,
-    73548,
-    66909,
-    76566,
-    73536,
-    38039,
-    15467,
-    65640,
-    87881,
-    17091,
-    51451,
-    59753,
-    69179,
-    55351,
-    56722,
-    26887,
-    12552,
-    17036,
-    57738,
-    27455,
-    58682,
-    79963,
-    46458,
-    32781,
-    87314,
-    57908,
-    28263,
-    59681,
-    14887,
-    77139,
-    38642,
-    25724,
-    82622,
-    17287,
-    58403,
-    53775,
-    38819,
-    57153,
-    82613,
-    47500,
-    3361,
-    55263,
-    31378,
-    65010,
-    12294,
-    39274,
-    22371,
-    7644,
-    84945,
-    41329,
-    75317,
-    66050,
-    62605,
-    10288,
-    19310,
-    37244,
-    5285,
-    44241,
-    45207,
-    27758,
-    30706,
-    19459,
-    82259,
-    54835,
-    2191,
-    15025,
-    67017,
-    1740,
-    82805,
-    55464,
-    37190,
-    88266,
-    36577,
-    57203,
-    77202,
-    54920,
-    22366,
-    48174,
-    33116,
-    29955,
-    37080,
-    78465,
-    81590,
-    21403,
-    29072,
-    54507,
-    83120,
-    31872,
-    24693,
-    70438,
-    11610,
-    8373,
-    50410,
-    73780,
-    3122,
-    43536,
-    66928,
-    24970,
-    79580,
-    75262,
-    33123,
-    59208,
-    7991,
-    41633,
-    66523,
-    88543,
-    50431,
-    13743,
-    70573,
-    51456,
-    10649,
-    89543,
-    22027,
-    71592,
-    3216,
-    75516,
-    3324,
-    591,
-    77334,
-    80940,
-    41678,
-    89036,
-    29864,
-    67165,
-    75387,
-    22937,
-    35284,
-    45298,
-    6474,
-    63825,
-    76602,
-    59707,
-    84530,
-    16489,
-    87306,
-    50373,
-    31774,
-    70930,
-    22568,
-    31722,
-    2236,
-    11956,
-    78549,
-    61775,
-    81672,
-    86766,
-    36922,
-    39498,
-    10250,
-    68744,
-    56327,
-    3896,
-    55027,
-    15925,
-    64011,
-    6147,
-    5790,
-    33835,
-    27511,
-    8940,
-    30003,
-    49060,
-    23801,
-    55925,
-    77247,
-    30686,
-    12091,
-    30442,
-    35380,
-    44976,
-    41654,
-    64925,
-    62844,
-    70446,
-    45791,
-    65638,
-    70357,
-    85530,
-    68718,
-    70936,
-    11511,
-    40109,
-    60825,
-    76555,
-    21821,
-    87830,
-    76154,
-    3058,
-    21015,
-    29053,
-    34179,
-    18937,
-    70016,
-    17168,
-    11663,
-    36597,
-    57522,
-    47395,
-    71506,
-    58938,
-    19697,
-    46134,
-    59115,
-    66665,
-    42955,
-    23965,
-    8393,
-    46264,
-    27411,
-    33226,
-    68401,
-    88078,
-    75607,
-    84199,
-    75954,
-    4055,
-    86892,
-    41139,
-    66798,
-    56134,
-    80341,
-    64606,
-    37333,
-    16809,
-    68230,
-    271,
-    4051,
-    56049,
-    66215,
-    4110,
-    3826,
-    24516,
-    57004,
-    36877,
-    36065,
-    81006,
-    40650,
-    4522,
-    85146,
-    10635,
-    12668,
-    83494,
-    21097,
-    30864,
-    77393,
-    77701,
-    70404,
-    36034,
-    14607,
-    1697,
-    79310,
-    5668,
-    51529,
-    61340,
-    20090,
-    79752,
-    88984,
-    65611,
-    75940,
-    59687,
-    19239,
-    75184,
-    84611,
-    35533,
-    73438,
-    2014,
-    26954,
-    30387,
-    15872,
-    16496,
-    52175,
-    21515,
-    38774,
-    69880,
-    6797,
-    57163,
-    360,
-    56748,
-    74037,
-    63779,
-    54944,
-    83757,
-    6694,
-    19827,
-    34230,
-    85170,
-    73511,
-    29308,
-    86094,
-    33109,
-    78729,
-    15960,
-    24060,
-    47236,
-    80783,
-    80299,
-    83066,
-    60435,
-    68476,
-    63158,
-    36072,
-    40486,
-    76782,
-    7681,
-    80854,
-    31908,
-    46029,
-    57236,
-    75636,
-    41024,
-    39208,
-    78070,
-    73579,
-    65844,
-    21847,
-    69680,
-    63734,
-    5377,
-    56286,
-    72195,
-    67694,
-    42792,
-    20163,
-    21266,
-    59502,
-    51260,
-    79938,
-    61153,
-    12450,
-    62329,
-    43562,
-    64746,
-    49882,
-    87128,
-    45314,
-    41691,
-    68877,
-    48559,
-    7635,
-    32718,
-    85590,
-    65533,
-    6553,
-    14742,
-    13680,
-    52120,
-    61591,
-    6966,
-    57297,
-    3961,
-    24274,
-    76157,
-    75078,
-    64691,
-    65094,
-    56784,
-    13916,
-    35318,
-    34447,
-    51784,
-    62824,
-    56856,
-    66794,
-    21022,
-    78054,
-    43955,
-    66593,
-    33232,
-    51897,
-    48788,
-    45297,
-    86605,
-    34619,
-    88557,
-    6780,
-    41968,
-    81729,
-    5677,
-    23580,
-    18895,
-    2548,
-    10613,
-    20259,
-    36878,
-    80876,
-    38661,
-    84738,
-    79374,
-    53066,
-    50069,
-    45633,
-    52365,
-    51605,
-    24831,
-    56161,
-    55881,
-    55607,
-    42776,
-    58739,
-    11846,
-    14946,
-    41301,
-    72786,
-    58848,
-    79345,
-    56102,
-    15320,
-    44805,
-    12901,
-    25444,
-    16733,
-    40514,
-    65674,
-    31806,
-    7122,
-    58997,
-    35443,
-    23840,
-    23519,
-    60209,
-    54383,
-    60250,
-    22440,
-    22764,
-    9275,
-    63336,
-    85056,
-    32279,
-    48300,
-    74302,
-    75938,
-    35653,
-    41400,
-    45867,
-    77810,
-    76894,
-    56764,
-    70005,
-    18627,
-    45882,
-    2563,
-    56228,
-    46463,
-    46234,
-    80630,
-    35746,
-    56563,
-    22622,
-    8234,
-    59438,
-    19711,
-    9198,
-    57,
-    71765,
-    89855,
-    54176,
-    35960,
-    11672,
-    75956,
-    38607,
-    18667,
-    41812,
-    26489,
-    55686,
-    27613,
-    77765,
-    80285,
-    36772,
-    66666,
-    54949,
-    88847,
-    62563,
-    36610,
-    72454,
-    14281,
-    13219,
-    25599,
-    89653,
-    35956,
-    58590,
-    26929,
-    29849,
-    18091,
-    25769,
-    45151,
-    27740,
-    77580,
-    67657,
-    11790,
-    55819,
-    59604,
-    46749,
-    65621,
-    76796,
-    22816,
-    85806,
-    8081,
-    69039,
-    86931,
-    87479,
-    60296,
-    58620,
-    21818,
-    50262,
-    86337,
-    88563,
-    17071,
-    12079,
-    38366,
-    65262,
-    61434,
-    72495,
-    81761,
-    30804,
-    44077,
-    4165,
-    69816,
-    20546,
-    17855,
-    50704,
-    17909,
-    37039,
-    87305,
-    84961,
-    35492,
-    2230,
-    19701,
-    73099,
-    84587,
-    15404,
-    30707,
-    3229,
-    26368,
-    49067,
-    62182,
-    82512,
-    35471,
-    29036,
-    46470,
-    11986,
-    23488,
-    22148,
-    77164,
-    26986,
-    7645,
-    76614,
-    58612,
-    63833,
-    74430,
-    59865,
-    72648,
-    88411,
-    55490,
-    25511,
-    12532,
-    66966,
-    11570,
-    3385,
-    19515,
-    8712,
-    4491,
-    12792,
-    17421,
-    12447,
-    30978,
-    47389,
-    66950,
-    81380,
-    32694,
-    5997,
-    17705,
-    51538,
-    39268,
-    60735,
-    81362,
-    54256,
-    68537,
-    20777,
-    49859,
-    44835,
-    19004,
-    18372,
-    42337,
-    36465,
-    3867,
-    23310,
-    15625,
-    50844,
-    85866,
-    3029,
-    32635,
-    81980,
-    24345,
-    25107,
-    37924,
-    25215,
-    51453,
-    43821,
-    77552,
-    56404,
-    63490,
-    20822,
-    75272,
-    76435,
-    70639,
-    62924,
-    39645,
-    21654,
-    14237,
-    44098,
-    47767,
-    23672,
-    53626,
-    53578,
-    64301,
-    17582,
-    23241,
-    50327,
-    62508,
-    39956,
-    21874,
-    18574,
-    20794,
-    87284,
-    16943,
-    87941,
-    67534,
-    69373,
-    16938,
-    25965,
-    30002,
-    44004,
-    65279,
-    4469,
-    50429,
-    14976,
-    12729,
-    29607,
-    71520,
-    503,
-    13856,
-    22474,
-    61503,
-    44925,
-    34576,
-    75864,
-    14930,
-    64334,
-    54876,
-    53554,
-    60792,
-    18307,
-    8761,
-    5977,
-    51939,
-    77959,
-    68450,
-    21934,
-    1398,
-    63615,
-    35747,
-    32291,
-    27667,
-    41045,
-    36420,
-    72078,
-    75484,
-    62794,
-    72335,
-    60276,
-    78950,
-    39291,
-    2511,
-    23839,
-    88821,
-    71892,
-    84007,
-    67900,
-    35674,
-    74431,
-    21526,
-    78452,
-    18827,
-    69434,
-    17642,
-    29472,
-    22987,
-    67668,
-    32572,
-    32983,
-    55893,
-    61,
-    7739,
-    53764,
-    35606,
-    20081,
-    61353,
-    34434,
-    26352,
-    36656,
-    81407,
-    37667,
-    45081,
-    47507,
-    43012,
-    36324,
-    37559,
-    15967,
-    38526,
-    73993,
-    68154,
-    1279,
-    65652,
-    69229,
-    51632,
-    79556,
-    39746,
-    30226,
-    11759,
-    72297,
-    32661,
-    55016,
-    30546,
-    33993,
-    89983,
-    78543,
-    2045,
-    84595,
-    76880,
-    81283,
-    41809,
-    23546,
-    81667,
-    86424,
-    2321,
-    62976,
-    48238,
-    17609,
-    6052,
-    1093,
-    43102,
-    26155,
-    54859,
-    12399,
-    37514,
-    1007,
-    79466,
-    61959,
-    26499,
-    82621,
-    10752,
-    64678,
-    57743,
-    77999,
-    57264,
-    8140,
-    68195,
-    47089,
-    30416,
-    29238,
-    60234,
-    65030,
-    61233,
-    50802,
-    54666,
-    60221,
-    19727,
-    76117,
-    25091,
-    38214,
-    59382,
-    86366,
-    64387,
-    82199,
-    8377,
-    67974,
-    37979,
-    69834,
-    68952,
-    10491,
-    46632,
-    85528,
-    23597,
-    83269,
-    26401,
-    71107,
-    72515,
-    20049,
-    372,
-    28228,
-    62154,
-    49970,
-    30549,
-    19739,
-    44086,
-    36962,
-    86253,
-    8510,
-    19981,
-    58089,
-    5259,
-    20989,
-    83038,
-    67812,
-    53234,
-    7966,
-    56445,
-    77702,
-    61564,
-    568,
-    2104,
-    12407,
-    69178,
-    24458,
-    68279,
-    79084,
-    51141,
-    13182,
-    50697,
-    34587,
-    74478,
-    27817,
-    27172,
-    11619,
-    22101,
-    53755,
-    36918,
-    54310,
-    26634,
-    55625,
-    16467,
-    79704,
-    22511,
-    39614,
-    31691,
-    66549,
-    80871,
-    8272,
-    40158,
-    4243,
-    70861,
-    21819,
-    22035,
-    27514,
-    64432,
-    38360,
-    65365,
-    80552,
-    27445,
-    51643,
-    30077,
-    33580,
-    64158,
-    46472,
-    14175,
-    43060,
-    57926,
-    29284,
-    70560,
-    31202,
-    3851,
-    50759,
-    27432,
-    21405,
-    31514,
-    42526,
-    24646,
-    75329,
-    80492,
-    83248,
-    88577,
-    81543,
-    48867,
-    17142,
-    74027,
-    19069,
-    1556,
-    38525,
-    63996,
-    40148,
-    28380,
-    64377,
-    21218,
-    9721,
-    24118,
-    23296,
-    53598,
-    79442,
-    13173,
-    88087,
-    44481,
-    46469,
-    42480,
-    4550,
-    10395,
-    40231,
-    87365,
-    66715,
-    3032,
-    85815,
-    48355,
-    86524,
-    638,
-    45322,
-    64502,
-    66439,
-    6366,
-    76786,
-    49945,
-    4456,
-    33216,
-    37951,
-    13254,
-    30211,
-    4209,
-    24847,
-    48699,
-    13807,
-    78724,
-    67782,
-    50633,
-    66374,
-    30685,
-    52148,
-    13151,
-    65734,
-    18871,
-    46993,
-    36731,
-    62668,
-    32902,
-    32566,
-    79829,
-    21024,
-    41036,
-    42103,
-    25560,
-    89934,
-    41538,
-    31160,
-    71032,
-    34868,
-    32428,
-    45514,
-    31900,
-    6849,
-    19895,
-    70463,
-    39033,
-    7105,
-    87715,
-    73290,
-    49604,
-    42739,
-    66310,
-    23900,
-    21927,
-    86709,
-    11490,
-    64899,
-    58801,
-    32969,
-    81701,
-    83746,
-    34156,
-    5734,
-    54837,
-    7104,
-    89176,
-    34287,
-    32057,
-    37176,
-    15043,
-    3394,
-    48017,
-    57525,
-    26967,
-    59327,
-    84585,
-    70444,
-    53490,
-    89445,
-    52415,
-    40090,
-    82416,
-    27669,
-    30262,
-    82671,
-    64573,
-    45634,
-    17637,
-    73349,
-    77521,
-    393,
-    16062,
-    17961,
-    52426,
-    85271,
-    16333,
-    61947,
-    17312,
-    72215,
-    56540,
-    39489,
-    32862,
-    9245,
-    6585,
-    63864,
-    32986,
-    70396,
-    68885,
-    68831,
-    83457,
-    9914,
-    15636,
-    72443,
-    80602,
-    28883,
-    50062,
-    42520,
-    41987,
-    42453,
-    89316,
-    146,
-    12499,
-    76600,
-    55415,
-    16604,
-    73229,
-    83287,
-    60986,
-    69303,
-    6195,
-    23201,
-    87091,
-    63780,
-    46167,
-    43997,
-    13103,
-    45393,
-    11031,
-    17153,
-    19969,
-    3392,
-    34110,
-    58222,
-    11683,
-    20825,
-    46801,
-    31686,
-    34389,
-    24498,
-    37188,
-    24671,
-    19224,
-    86640,
-    43951,
-    54659,
-    72900,
-    39877,
-    17652,
-    33539,
-    41060,
-    18432,
-    13967,
-    24290,
-    28203,
-    33806,
-    44111,
-    63226,
-    70790,
-    60804,
-    4753,
-    53444,
-    29943,
-    35789,
-    21196,
-    44244,
-    67914,
-    36710,
-    32067,
-    68999,
-    34421,
-    15730,
-    69391,
-    30174,
-    59838,
-    16445,
-    26746,
-    14669,
-    66802,
-    78597,
-    79561,
-    38449,
-    71171,
-    28928,
-    16379,
-    41419,
-    12966,
-    69800,
-    69246,
-    36,
-    85433,
-    29922,
-    44104,
-    75162,
-    22073,
-    50039,
-    86188,
-    1731,
-    49279,
-    19541,
-    25183,
-    62489,
-    70050,
-    5924,
-    10318,
-    11844,
-    64074,
-    31720,
-    39043,
-    87654,
-    3701,
-    34646,
-    58289,
-    80423,
-    45805,
-    3480,
-    81376,
-    58186,
-    13262,
-    86938,
-    74351,
-    35894,
-    31036,
-    10776,
-    51551,
-    23222,
-    6200,
-    4994,
-    4008,
-    75334,
-    85572,
-    74949,
-    67401,
-    42590,
-    33264,
-    89366,
-    32786,
-    60437,
-    40849,
-    45420,
-    604,
-    27889,
-    58671,
-    48252,
-    23028,
-    81209,
-    24080,
-    25530,
-    27484,
-    75253,
-    78116,
-    43750,
-    31421,
-    27278,
-    38800,
-    84109,
-    17470,
-    31105,
-    54947,
-    56696,
-    4565,
-    17207,
-    64619,
-    18811,
-    50955,
-    9605,
-    2210,
-    24470,
-    75932,
-    69068,
-    87894,
-    16012,
-    22829,
-    55895,
-    10693,
-    13199,
-    34195,
-    71721,
-    7438,
-    65555,
-    4435,
-    43249,
-    14547,
-    30453,
-    28169,
-    22535,
-    72486,
-    84593,
-    54626,
-    62446,
-    82185,
-    7489,
-    45622,
-    89436,
-    89016,
-    19811,
-    29325,
-    19196,
-    83726,
-    33081,
-    88077,
-    77018,
-    87160,
-    23531,
-    2113,
-    88483,
-    83787,
-    17044,
-    7850,
-    77722,
-    32752,
-    30100,
-    75414,
-    65557,
-    89283,
-    12040,
-    73039,
-    72680,
-    63674,
-    72975,
-    73426,
-    47926,
-    17633,
-    67561,
-    80229,
-    43443,
-    53373,
-    66992,
-    35408,
-    1370,
-    55972,
-    37796,
-    77528,
-    79431,
-    12309,
-    80038,
-    83471,
-    9091,
-    64909,
-    23390,
-    48177,
-    55036,
-    35369,
-    36666,
-    64992,
-    30687,
-    13559,
-    67014,
-    19917,
-    86631,
-    61035,
-    46706,
-    71557,
-    52145,
-    50510,
-    76712,
-    17414,
-    13880,
-    15676,
-    50480,
-    57979,
-    61126,
-    62261,
-    48519,
-    3659,
-    46707,
-    542,
-    69707,
-    16869,
-    83270,
-    14584,
-    3492,
-    56554,
-    21343,
-    5077,
-    10889,
-    78238,
-    41250,
-    15802,
-    63685,
-    1739,
-    49541,
-    79893,
-    86859,
-    11227,
-    54652,
-    61711,
-    40053,
-    9628,
-    47922,
-    16858,
-    56520,
-    817,
-    80651,
-    32360,
-    18309,
-    46660,
-    80138,
-    62743,
-    4598,
-    10245,
-    13775,
-    55785,
-    77233,
-    71675,
-    27373,
-    44105,
-    38264,
-    72887,
-    50986,
-    12122,
-    7662,
-    68791,
-    14028,
-    49903,
-    10758,
-    33876,
-    35701,
-    1590,
-    67539,
-    76087,
-    89403,
-    88998,
-    24089,
-    80895,
-    12044,
-    32220,
-    25656,
-    65804,
-    84668,
-    38107,
-    17273,
-    3843,
-    49041,
-    32324,
-    40470,
-    44167,
-    59217,
-    42374,
-    81359,
-    8548,
-    35616,
-    4230,
-    9524,
-    14757,
-    44201,
-    71192,
-    61012,
-    46154,
-    52468,
-    70750,
-    9431,
-    61204,
-    74191,
-    28633,
-    29441,
-    66899,
-    88009,
-    81939,
-    21368,
-    69327,
-    67452,
-    6788,
-    18250,
-    74225,
-    85978,
-    65817,
-    75541,
-    74476,
-    75073,
-    20479,
-    84494,
-    3033,
-    56107,
-    21503,
-    51487,
-    88644,
-    66424,
-    43612,
-    31402,
-    87904,
-    25935,
-    79400,
-    3567,
-    26724,
-    3860,
-    19436,
-    19213,
-    47568,
-    57587,
-    7996,
-    3104,
-    14938,
-    76025,
-    50239,
-    88521,
-    58034,
-    12131,
-    21808,
-    72742,
-    53792,
-    88049,
-    70121,
-    65594,
-    44825,
-    14850,
-    792,
-    41843,
-    57646,
-    17237,
-    5756,
-    28823,
-    34574,
-    87493,
-    76572,
-    78738,
-    32363,
-    74144,
-    47293,
-    58528,
-    19356,
-    50075,
-    62144,
-    69465,
-    78930,
-    19717,
-    5261,
-    46756,
-    9895,
-    83229,
-    70701,
-    5492,
-    61443,
-    54253,
-    47422,
-    89026,
-    72763,
-    62085,
-    61053,
-    1249,
-    80549,
-    63744,
-    4184,
-    60208,
-    88694,
-    33333,
-    4068,
-    44683,
-    83024,
-    40872,
-    55537,
-    22156,
-    772,
-    73209,
-    21329,
-    42774,
-    62308,
-    68904,
-    78712,
-    4436,
-    6072,
-    27876,
-    87594,
-    56197,
-    82823,
-    32001,
-    25649,
-    46855,
-    38848,
-    51616,
-    50731,
-    85876,
-    1355,
-    55246,
-    26831,
-    73107,
-    60156,
-    61255,
-    3681,
-    30332,
-    12049,
-    51494,
-    47254,
-    79796,
-    29436,
-    33089,
-    33446,
-    75215,
-    85759,
-    5189,
-    51175,
-    38223,
-    34550,
-    78731,
-    25529,
-    29601,
-    28273,
-    80956,
-    21688,
-    77055,
-    65666,
-    38389,
-    13950,
-    26000,
-    48264,
-    54717,
-    61326,
-    27076,
-    74008,
-    35336,
-    70382,
-    88304,
-    4860,
-    46054,
-    30596,
-    28921,
-    15804,
-    89404,
-    63317,
-    45497,
-    40114,
-    22698,
-    88030,
-    74103,
-    38250,
-    51307,
-    73680,
-    4211,
-    59501,
-    26134,
-    27859,
-    53180,
-    84296,
-    54534,
-    16157,
-    68231,
-    28520,
-    72286,
-    16232,
-    19189,
-    20959,
-    79504,
-    61658,
-    971,
-    19804,
-    45397,
-    15983,
-    67170,
-    70868,
-    21239,
-    2698,
-    85768,
-    63180,
-    65466,
-    89355,
-    52027,
-    17735,
-    5515,
-    67029,
-    83858,
-    43257,
-    73583,
-    81293,
-    84684,
-    18453,
-    8410,
-    45058,
-    86127,
-    11950,
-    18151,
-    10759,
-    57813,
-    55010,
-    46117,
-    30679,
-    69083,
-    68936,
-    163,
-    34392,
-    35926,
-    70057,
-    22840,
-    38159,
-    12222,
-    49852,
-    62518,
-    71238,
-    28174,
-    87848,
-    74726,
-    57662,
-    81506,
-    18830,
-    10655,
-    56571,
-    64145,
-    60196,
-    71304,
-    70808,
-    18093,
-    15187,
-    89198,
-    28762,
-    61761,
-    41158,
-    23822,
-    69284,
-    19521,
-    64809,
-    89645,
-    65479,
-    44290,
-    47714,
-    51988,
-    79234,
-    15283,
-    47218,
-    70123,
-    20257,
-    32058,
-    42411,
-    38436,
-    17450,
-    89327,
-    5578,
-    8599,
-    33244,
-    68501,
-    45224,
-    76779,
-    79991,
-    4750,
-    31186,
-    88108,
-    47130,
-    44569,
-    40396,
-    80400,
-    26703,
-    464,
-    62654,
-    46326,
-    36599,
-    9363,
-    69489,
-    12716,
-    3194,
-    36936,
-    34489,
-    20999,
-    62292,
-    35219,
-    44534,
-    60711,
-    49905,
-    24900,
-    66567,
-    25790,
-    17321,
-    47107,
-    6646,
-    2183,
-    16065,
-    15817,
-    25118,
-    75575,
-    24003,
-    17159,
-    42686,
-    15251,
-    8983,
-    49081,
-    46697,
-    48487,
-    71024,
-    14827,
-    12152,
-    68284,
-    78166,
-    86959,
-    79330,
-    71614,
-    87736,
-    33696,
-    68812,
-    3390,
-    74010,
-    35721,
-    60710,
-    50732,
-    1596,
-    42887,
-    32157,
-    12919,
-    27783,
-    49865,
-    86084,
-    15514,
-    14817,
-    85831,
-    50928,
-    43732,
-    38275,
-    40585,
-    60152,
-    37374,
-    88090,
-    52296,
-    40347,
-    11397,
-    83284,
-    51095,
-    56439,
-    35074,
-    37597,
-    54048,
-    51477,
-    33992,
-    74411,
-    78003,
-    5542,
-    1983,
-    87407,
-    75828,
-    14823,
-    73163,
-    86185,
-    6881,
-    15950,
-    44114,
-    30554,
-    75725,
-    57389,
-    59442,
-    71750,
-    36479,
-    25721,
-    40902,
-    79461,
-    26332,
-    40664,
-    67673,
-    35791,
-    79772,
-    48244,
-    89448,
-    80024,
-    38764,
-    39706,
-    28177,
-    25636,
-    27784,
-    69173,
-    72804,
-    85374,
-    36537,
-    67250,
-    3608,
-    37750,
-    44345,
-    37738,
-    72795,
-    27357,
-    68273,
-    35802,
-    53528,
-    36096,
-    78733,
-    9288,
-    60367,
-    36131,
-    34052,
-    43963,
-    56630,
-    48372,
-    89696,
-    72444,
-    6278,
-    30110,
-    39253,
-    52389,
-    44013,
-    18999,
-    9688,
-    22275,
-    42113,
-    52456,
-    10572,
-    60937,
-    48989,
-    26154,
-    89129,
-    41823,
-    35592,
-    30203,
-    83863,
-    16883,
-    85772,
-    50059,
-    82775,
-    84016,
-    43404,
-    75199,
-    77106,
-    48505,
-    35975,
-    82373,
-    3877,
-    26892,
-    54218,
-    70146,
-    87668,
-    49927,
-    77635,
-    70935,
-    87181,
-    59430,
-    74004,
-    38506,
-    53525,
-    8483,
-    18736,
-    66369,
-    66796,
-    49964,
-    21258,
-    86588,
-    82502,
-    68518,
-    83623,
-    10869,
-    87686,
-    33906,
-    86562,
-    27249,
-    63517,
-    18087,
-    60717,
-    53655,
-    72637,
-    21682,
-    36492,
-    26570,
-    89972,
-    51967,
-    45604,
-    28878,
-    49872,
-    35344,
-    79891,
-    128,
-    84574,
-    29771,
-    22181,
-    86457,
-    47744,
-    60791,
-    3683,
-    58971,
-    35197,
-    19344,
-    83823,
-    85062,
-    64167,
-    10486,
-    22451,
-    12022,
-    48858,
-    39142,
-    62126,
-    45866,
-    56857,
-    82434,
-    72323,
-    18936,
-    36943,
-    56341,
-    21464,
-    86269,
-    54940,
-    55374,
-    89414,
-    3323,
-    1399,
-    2843,
-    80206,
-    80453,
-    30367,
-    35880,
-    61292,
-    49404,
-    42701,
-    40191,
-    78542,
-    89643,
-    9919,
-    71693,
-    7299,
-    71804,
-    70927,
-    89610,
-    63687,
-    28664,
-    70060,
-    28210,
-    87381,
-    68201,
-    73598,
-    80171,
-    3667,
-    78857,
-    3525,
-    20588,
-    21244,
-    66609,
-    65470,
-    87867,
-    63516,
-    44272,
-    80048,
-    51782,
-    9320,
-    460,
-    18628,
-    51561,
-    16246,
-    23403,
-    15727,
-    32972,
-    32401,
-    19931,
-    84229,
-    21356,
-    68128,
-    27462,
-    3414,
-    32256,
-    85634,
-    23718,
-    59914,
-    19686,
-    57309,
-    4321,
-    10398,
-    33485,
-    78083,
-    83496,
-    65606,
-    77520,
-    737,
-    53853,
-    72199,
-    70367,
-    79974,
-    71607,
-    82836,
-    31979,
-    41954,
-    47731,
-    8242,
-    69689,
-    76478,
-    88564,
-    66841,
-    17992,
-    38126,
-    4042,
-    88736,
-    15543,
-    23487,
-    14092,
-    37964,
-    63473,
-    23120,
-    48531,
-    71539,
-    119,
-    76103,
-    88655,
-    40341,
-    75159,
-    11971,
-    87167,
-    7537,
-    38902,
-    58753,
-    4386,
-    20121,
-    33745,
-    71719,
-    46533,
-    31791,
-    24982,
-    43228,
-    74569,
-    95,
-    1125,
-    8730,
-    55538,
-    41271,
-    62421,
-    14575,
-    70904,
-    34769,
-    85803,
-    14860,
-    1153,
-    12645,
-    3438,
-    21068,
-    72863,
-    19561,
-    59683,
-    85749,
-    49721,
-    69121,
-    72783,
-    72294,
-    85987,
-    82699,
-    83410,
-    51907,
-    58109,
-    82843,
-    74071,
-    48232,
-    76495,
-    25652,
-    51762,
-    58823,
-    49389,
-    59778,
-    76133,
-    33220,
-    43742,
-    3387,
-    9279,
-    31780,
-    80828,
-    14988,
-    82501,
-    73389,
-    46451,
-    21683,
-    79050,
-    33013,
-    56352,
-    89002,
-    83752,
-    9558,
-    43601,
-    5116,
-    19622,
-    40338,
-    17900,
-    23393,
-    63600,
-    3124,
-    37460,
-    72295,
-    20610,
-    6843,
-    58407,
-    60032,
-    56073,
-    78662,
-    39813,
-    62455,
-    11955,
-    62783,
-    30257,
-    21477,
-    48915,
-    46626,
-    74384,
-    56189,
-    71278,
-    6290,
-    39741,
-    87770,
-    22090,
-    30548,
-    19903,
-    4706,
-    25546,
-    1182,
-    23091,
-    11968,
-    50401,
-    81154,
-    29907,
-    37108,
-    25582,
-    83860,
-    82704,
-    74,
-    11357,
-    75415,
-    30190,
-    77337,
-    75844,
-    34126,
-    49503,
-    39812,
-    24749,
-    26198,
-    87382,
-    4534,
-    69962,
-    46020,
-    28950,
-    52724,
-    7813,
-    56655,
-    80678,
-    22095,
-    68918,
-    69970,
-    43068,
-    33913,
-    57913,
-    81098,
-    67862,
-    20372,
-    34691,
-    80989,
-    71179,
-    40128,
-    18444,
-    17769,
-    42485,
-    9278,
-    17404,
-    11319,
-    74715,
-    617,
-    34501,
-    77779,
-    34170,
-    76763,
-    48327,
-    71652,
-    68973,
-    58451,
-    68270,
-    3268,
-    63299,
-    43756,
-    14106,
-    33643,
-    6080,
-    61976,
-    66500,
-    67191,
-    43695,
-    83451,
-    72131,
-    8230,
-    38374,
-    86274,
-    83293,
-    10067,
-    13166,
-    52576,
-    16958,
-    12767,
-    24008,
-    54729,
-    106,
-    25694,
-    43321,
-    20885,
-    14427,
-    40665,
-    31243,
-    84863,
-    60293,
-    18129,
-    82060,
-    87175,
-    62635,
-    45212,
-    88476,
-    18348,
-    50027,
-    12992,
-    30914,
-    62553,
-    35537,
-    30134,
-    78006,
-    60269,
-    7614,
-    64745,
-    6936,
-    70041,
-    18565,
-    10271,
-    1040,
-    77134,
-    5090,
-    68767,
-    7963,
-    15564,
-    23471,
-    75056,
-    54141,
-    85450,
-    40360,
-    88183,
-    61805,
-    4724,
-    3879,
-    42954,
-    56734,
-    23350,
-    20988,
-    87194,
-    25188,
-    68549,
-    54202,
-    50364,
-    45851,
-    64451,
-    77881,
-    53618,
-    8946,
-    63782,
-    77625,
-    52080,
-    88598,
-    33957,
-    80356,
-    89493,
-    67764,
-    36173,
-    86294,
-    8574,
-    20330,
-    86262,
-    30597,
-    63522,
-    44165,
-    79120,
-    12207,
-    76932,
-    11929,
-    18060,
-    71493,
-    46158,
-    3589,
-    40519,
-    89021,
-    78136,
-    41249,
-    74065,
-    43553,
-    52553,
-    3639,
-    14588,
-    59244,
-    15317,
-    29990,
-    61445,
-    33713,
-    76741,
-    29788,
-    85047,
-    77799,
-    26657,
-    40721,
-    87563,
-    81136,
-    65434,
-    68151,
-    4700,
-    843,
-    36938,
-    67579,
-    11601,
-    38882,
-    1483,
-    79737,
-    20975,
-    8802,
-    52124,
-    17525,
-    2642,
-    59210,
-    59561,
-    21037,
-    55005,
-    58309,
-    44225,
-    5149,
-    12972,
-    41613,
-    8217,
-    326,
-    75161,
-    70492,
-    89070,
-    31313,
-    9185,
-    65506,
-    26787,
-    67359,
-    13076,
-    50604,
-    204,
-    5459,
-    10856,
-    56490,
-    65447,
-    15333,
-    36837,
-    3591,
-    49245,
-    31609,
-    50064,
-    60089,
-    20782,
-    21718,
-    25949,
-    31480,
-    11668,
-    56825,
-    47582,
-    31921,
-    7330,
-    74848,
-    33384,
-    89183,
-    30544,
-    35020,
-    15182,
-    5682,
-    26083,
-    36814,
-    21891,
-    86634,
-    37896,
-    45641,
-    24087,
-    85505,
-    42764,
-    48887,
-    8511,
-    58350,
-    79119,
-    29784,
-    64007,
-    63470,
-    47434,
-    56433,
-    37648,
-    53221,
-    44336,
-    3710,
-    52407,
-    31944,
-    67068,
-    11519,
-    76272,
-    44065,
-    88592,
-    78918,
-    27591,
-    26339,
-    47678,
-    83490,
-    38843,
-    34981,
-    81947,
-    83059,
-    89541,
-    32608,
-    62046,
-    14739,
-    69811,
-    33667,
-    2442,
-    4452,
-    28157,
-    14809,
-    38810,
-    46616,
-    57616,
-    73294,
-    6906,
-    45844,
-    55619,
-    26260,
-    51603,
-    19652,
-    46095,
-    2999,
-    29625,
-    76214,
-    69728,
-    27119,
-    11522,
-    6462,
-    23631,
-    43338,
-    6089,
-    21853,
-    15862,
-    68507,
-    41378,
-    88502,
-    64965,
-    37266,
-    58966,
-    56930,
-    29301,
-    30644,
-    83163,
-    50665,
-    1042,
-    74479,
-    69322,
-    78359,
-    22953,
-    20790,
-    31199,
-    81676,
-    42322,
-    4315,
-    88365,
-    49445,
-    4312,
-    37143,
-    84776,
-    61174,
-    39330,
-    4915,
-    4271,
-    59617,
-    4714,
-    47059,
-    66196,
-    28767,
-    86629,
-    50308,
-    30474,
-    70322,
-    29734,
-    53243,
-    5984,
-    69469,
-    31880,
-    8936,
-    42896,
-    35423,
-    25036,
-    11354,
-    47361,
-    39145,
-    33545,
-    46888,
-    81859,
-    51262,
-    77252,
-    36152,
-    69643,
-    80727,
-    80765,
-    57976,
-    77078,
-    1084,
-    56519,
-    11304,
-    48880,
-    85618,
-    32878,
-    1939,
-    61977,
-    82800,
-    10597,
-    28318,
-    25822,
-    39490,
-    85310,
-    16594,
-    61929,
-    5805,
-    62782,
-    59962,
-    88501,
-    16046,
-    4881,
-    84150,
-    70942,
-    18592,
-    42188,
-    55257,
-    48655,
-    81479,
-    75314,
-    87737,
-    86198,
-    53905,
-    73263,
-    35133,
-    24866,
-    58293,
-    10987,
-    59550,
-    16484,
-    30567,
-    2997,
-    84769,
-    84756,
-    40260,
-    82709,
-    42967,
-    16025,
-    2838,
-    25362,
-    42947,
-    71682,
-    29989,
-    80741,
-    87064,
-    63250,
-    25741,
-    63345,
-    61256,
-    46487,
-    15477,
-    16921,
-    1068,
-    37178,
-    88186,
-    83517,
-    58142,
-    47048,
-    37645,
-    80237,
-    65166,
-    84529,
-    26052,
-    28937,
-    32347,
-    32994,
-    79223,
-    64003,
-    17922,
-    22032,
-    28832,
-    57987,
-    50051,
-    73603,
-    62601,
-    65151,
-    76112,
-    27541,
-    3281,
-    53050,
-    34312,
-    37512,
-    9305,
-    42452,
-    13931,
-    27614,
-    78389,
-    41006,
-    42866,
-    48851,
-    42855,
-    73090,
-    12855,
-    17327,
-    31454,
-    10627,
-    44119,
-    70082,
-    70083,
-    32215,
-    15434,
-    9333,
-    5023,
-    70943,
-    34356,
-    60651,
-    17727,
-    48063,
-    75761,
-    68993,
-    12197,
-    75010,
-    55767,
-    77820,
-    51060,
-    44386,
-    34459,
-    24384,
-    42173,
-    48998,
-    69903,
-    25259,
-    76562,
-    88311,
-    44732,
-    59356,
-    73327,
-    8465,
-    39368,
-    66314,
-    31637,
-    86642,
-    64970,
-    29337,
-    39318,
-    75237,
-    59864,
-    23703,
-    74269,
-    59552,
-    73167,
-    62825,
-    41047,
-    2100,
-    24127,
-    84806,
-    26028,
-    8784,
-    1829,
-    1518,
-    30859,
-    25120,
-    73716,
-    72233,
-    38663,
-    34257,
-    63980,
-    73202,
-    73309,
-    54678,
-    2391,
-    6801,
-    67715,
-    28953,
-    61122,
-    81749,
-    70851,
-    80518,
-    8690,
-    20749,
-    56614,
-    64629,
-    80780,
-    55549,
-    82015,
-    78317,
-    35662,
-    57859,
-    55984,
-    75888,
-    59857,
-    26283,
-    66883,
-    23138,
-    24142,
-    65382,
-    22049,
-    70910,
-    68038,
-    23837,
-    8641,
-    5780,
-    1097,
-    74593,
-    3513,
-    71395,
-    6226,
-    21287,
-    87360,
-    19017,
-    61638,
-    3015,
-    87988,
-    82203,
-    26152,
-    81744,
-    64357,
-    56602,
-    87632,
-    83809,
-    20540,
-    884,
-    66162,
-    80768,
-    67058,
-    62139,
-    7344,
-    71266,
-    85147,
-    65960,
-    58374,
-    61819,
-    31891,
-    60411,
-    59435,
-    63632,
-    60527,
-    1746,
-    28861,
-    77187,
-    82949,
-    6706,
-    89307,
-    20472,
-    32501,
-    25971,
-    62434,
-    4533,
-    82971,
-    56901,
-    63328,
-    59160,
-    4758,
-    20187,
-    23359,
-    25116,
-    55852,
-    18445,
-    24678,
-    24721,
-    24549,
-    20866,
-    23057,
-    1000,
-    54542,
-    29005,
-    23700,
-    232,
-    27378,
-    33522,
-    64115,
-    69560,
-    1419,
-    3070,
-    54396,
-    71443,
-    29239,
-    27988,
-    28692,
-    67762,
-    21335,
-    54546,
-    21988,
-    370,
-    27479,
-    27899,
-    62333,
-    71474,
-    3633,
-    64360,
-    34850,
-    29692,
-    32441,
-    57393,
-    35909,
-    31865,
-    55234,
-    5184,
-    21911,
-    28903,
-    34309,
-    6157,
-    31178,
-    31385,
-    1473,
-    57027,
-    60398,
-    28723,
-    6821,
-    57508,
-    35188,
-    65650,
-    32713,
-    6750,
-    6958,
-    3952,
-    70061,
-    61359,
-    70351,
-    3528,
-    6109,
-    2891,
-    57363,
-    61737,
-    7866,
-    69613,
-    71855,
-    69157,
-    57198,
-    62887,
-    67140,
-    65476,
-    68606,
-    65656,
-    69729,
-    61084,
-    61031,
-    62734,
-    63278,
-    70772,
-    68746,
-    58852,
-    58244,
-    65597,
-    67044,
-    58450,
-    58534,
-    60738,
-    54152,
-    62488,
-    60497,
-    55485,
-    57936,
-    57174,
-    54318,
-    62862,
-    54025,
-    61284,
-    59450,
-    56824,
-    57011,
-    60586,
-    58149,
-    61681,
-    60692,
-    59211,
-    61647,
-    56965,
-    60875,
-    62011,
-    61916,
-    56357,
-    58668,
-    58281,
-    55408,
-    61507,
-    58745,
-]
+_TABLES = {
+    "_cinic_train_indices": "cinic_train",
+    "_cinic_test_indices": "cinic_test",
+}
+
+
+def __getattr__(name):
+    if name in _TABLES:
+        # converted once; later accesses find the list in the module's namespace
+        value = globals()[name] = index_table(_TABLES[name]).tolist()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
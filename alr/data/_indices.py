@@ -0,0 +1,22 @@
+r"""
+Index tables (fixed training sets and CINIC-10 subsets) stored as a compressed numpy archive
+next to this module. Tables are only read when they're first used.
+"""
+import functools
+from pathlib import Path
+
+import numpy as np
+
+_PATH = Path(__file__).with_name("_indices.npz")
+
+
+@functools.lru_cache(maxsize=None)
+def index_table(name: str) -> np.ndarray:
+    r"""
+    Returns the (read-only) index table `name`, one of `"cinic_train"`, `"cinic_test"`,
+    `"mnist_20"`, or `"cifar10_1"`.
+    """
+    with np.load(_PATH) as f:
+        table = f[name]
+    table.flags.writeable = False
+    return table
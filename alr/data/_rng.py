@@ -0,0 +1,22 @@
+r"""
+Counter-based random numbers (splitmix64) without any state: a number only depends on the seed,
+a stream (e.g. the epoch), a key (e.g. a sample's index), and its position, so it can be
+regenerated at any time in any process.
+"""
+import numpy as np
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    # splitmix64 finaliser (wraps around on overflow)
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _uniform(seed: int, epoch: int, keys: np.ndarray, n: int) -> np.ndarray:
+    # counter-based random numbers: u[i, j] = hash(seed, epoch, keys[i], j) in [0, 1)
+    seed = np.array([seed & 0xFFFFFFFFFFFFFFFF], dtype=np.uint64)
+    stream = _mix(_mix(seed) ^ np.uint64(epoch))
+    z = _mix(stream ^ keys)[:, None] + np.arange(n, dtype=np.uint64)
+    return (_mix(z) >> np.uint64(11)).astype(np.float64) * 2.0**-53
@@ -0,0 +1,448 @@
+r"""
+Augmentations and target transforms that operate on collated batches
+(:math:`N \times C \times H \times W` tensors) instead of one PIL image at a time.
+Data loader workers then only decode images and the augmentation runs as a handful of
+vectorised tensor operations (on any device). Randomness is drawn per sample from a
+counter-based generator so that the augmentation of a sample only depends on the seed,
+the epoch, and the sample's index (or position in the stream of samples).
+The main classes you should be concerned with are :class:`Compose` and :class:`BatchTransformLoader`.
+"""
+import math
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+import torch.utils.data as torchdata
+
+from alr.data._rng import _uniform
+from alr.utils._type_aliases import _DeviceType
+
+__all__ = [
+    "RandomCrop",
+    "RandomHorizontalFlip",
+    "ColorJitter",
+    "Normalize",
+    "OneHot",
+    "Compose",
+    "BatchTransformLoader",
+    "onehot",
+]
+
+
+class _BatchTransform:
+    #: number of uniform random numbers used per sample
+    n_draws = 0
+
+    def __call__(self, x: torch.Tensor, u: torch.Tensor) -> torch.Tensor:
+        r"""
+        Args:
+            x (`torch.Tensor`): float tensor of shape :math:`N \times C \times H \times W`
+                with values in :math:`[0, 1]` (except after :class:`Normalize`)
+            u (`torch.Tensor`): :math:`N \times` `n_draws` uniform random numbers in :math:`[0, 1)`
+
+        Returns:
+            `torch.Tensor`: transformed batch
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={v}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({args})"
+
+
+class RandomCrop(_BatchTransform):
+    n_draws = 2
+
+    def __init__(
+        self,
+        size: Union[int, Tuple[int, int]],
+        padding: Optional[int] = 0,
+        padding_mode: Optional[str] = "constant",
+        fill: Optional[float] = 0,
+    ):
+        r"""
+        Batched equivalent of :class:`torchvision.transforms.RandomCrop`: the batch is padded once
+        and each sample's crop is gathered with a single indexing operation.
+
+        Args:
+            size (int, tuple): output size
+            padding (int, optional): padding on every border
+            padding_mode (str, optional): `"constant"`, `"reflect"`, `"replicate"`, or `"circular"`
+                (see :func:`torch.nn.functional.pad`). Torchvision's `"edge"` is `"replicate"`.
+            fill (float, optional): fill value of constant padding
+        """
+        self.size = (size, size) if isinstance(size, int) else tuple(size)
+        self.padding = padding
+        self.padding_mode = "replicate" if padding_mode == "edge" else padding_mode
+        self.fill = fill
+
+    def __call__(self, x: torch.Tensor, u: torch.Tensor) -> torch.Tensor:
+        p = self.padding
+        if p:
+            if self.padding_mode == "constant":
+                x = F.pad(x, [p] * 4, value=self.fill)
+            else:
+                x = F.pad(x, [p] * 4, mode=self.padding_mode)
+        N, C, H, W = x.size()
+        h, w = self.size
+        assert H >= h and W >= w, f"Can't crop {H}x{W} images to {h}x{w}."
+        top = (u[:, 0] * (H - h + 1)).long()
+        left = (u[:, 1] * (W - w + 1)).long()
+        rows = top[:, None] + torch.arange(h, device=x.device)
+        cols = left[:, None] + torch.arange(w, device=x.device)
+        n = torch.arange(N, device=x.device)[:, None, None]
+        # N x h x w x C
+        out = x.permute(0, 2, 3, 1)[n, rows[:, :, None], cols[:, None, :]]
+        return out.permute(0, 3, 1, 2).contiguous()
+
+
+class RandomHorizontalFlip(_BatchTransform):
+    n_draws = 1
+
+    def __init__(self, p: Optional[float] = 0.5):
+        r"""
+        Batched equivalent of :class:`torchvision.transforms.RandomHorizontalFlip`.
+
+        Args:
+            p (float, optional): probability of flipping each sample
+        """
+        self.p = p
+
+    def __call__(self, x: torch.Tensor, u: torch.Tensor) -> torch.Tensor:
+        mask = u[:, 0] < self.p
+        x = x.clone()
+        x[mask] = x[mask].flip(-1)
+        return x
+
+
+class ColorJitter(_BatchTransform):
+    n_draws = 4
+
+    def __init__(
+        self,
+        brightness: Optional[float] = 0,
+        contrast: Optional[float] = 0,
+        saturation: Optional[float] = 0,
+        hue: Optional[float] = 0,
+    ):
+        r"""
+        Batched version of :class:`torchvision.transforms.ColorJitter` where each adjustment is
+        a per-sample affine operation. Unlike torchvision, the adjustments are applied in a fixed order
+        (brightness, contrast, saturation, hue) and the hue is shifted by rotating the chroma
+        in YIQ space rather than in HSV space, which is a close approximation that
+        doesn't need the non-linear HSV conversion. Saturation and hue are only adjusted
+        for 3-channel images.
+
+        Args:
+            brightness (float, optional): brightness factor is drawn from
+                :math:`[\max(0, 1 - \text{brightness}), 1 + \text{brightness}]`
+            contrast (float, optional): similar to `brightness`
+            saturation (float, optional): similar to `brightness`
+            hue (float, optional): hue shift is drawn from :math:`[-\text{hue}, \text{hue}]`
+                (as a fraction of a full rotation), :math:`0 \leq \text{hue} \leq 0.5`.
+        """
+        assert 0 <= hue <= 0.5
+        self.brightness = brightness
+        self.contrast = contrast
+        self.saturation = saturation
+        self.hue = hue
+
+    def __call__(self, x: torch.Tensor, u: torch.Tensor) -> torch.Tensor:
+        def factor(v, i):
+            lo = max(0, 1 - v)
+            return (lo + u[:, i] * (1 + v - lo)).view(-1, 1, 1, 1)
+
+        rgb = x.size(1) == 3
+        if self.brightness:
+            x = (x * factor(self.brightness, 0)).clamp_(0, 1)
+        if self.contrast:
+            mean = _grayscale(x).mean(dim=(1, 2, 3), keepdim=True)
+            x = _blend(x, mean, factor(self.contrast, 1))
+        if self.saturation and rgb:
+            x = _blend(x, _grayscale(x), factor(self.saturation, 2))
+        if self.hue and rgb:
+            theta = (2 * u[:, 3] - 1) * self.hue * 2 * math.pi
+            cos, sin = theta.cos(), theta.sin()
+            zero, one = torch.zeros_like(cos), torch.ones_like(cos)
+            # rotation of the I and Q (chroma) components
+            rotation = torch.stack(
+                [
+                    torch.stack([one, zero, zero], -1),
+                    torch.stack([zero, cos, -sin], -1),
+                    torch.stack([zero, sin, cos], -1),
+                ],
+                -2,
+            )
+            yiq = _RGB_TO_YIQ.to(x)
+            m = _YIQ_TO_RGB.to(x) @ rotation @ yiq
+            x = torch.einsum("nij,njhw->nihw", m, x).clamp_(0, 1)
+        return x
+
+
+class Normalize(_BatchTransform):
+    def __init__(self, mean: Sequence[float], std: Sequence[float]):
+        r"""
+        Batched equivalent of :class:`torchvision.transforms.Normalize`.
+
+        Args:
+            mean (Sequence[float]): channel means
+            std (Sequence[float]): channel standard deviations
+        """
+        self.mean = tuple(mean)
+        self.std = tuple(std)
+
+    def __call__(self, x: torch.Tensor, u: torch.Tensor) -> torch.Tensor:
+        mean = torch.tensor(self.mean, dtype=x.dtype, device=x.device)
+        std = torch.tensor(self.std, dtype=x.dtype, device=x.device)
+        return (x - mean.view(-1, 1, 1)) / std.view(-1, 1, 1)
+
+
+class OneHot:
+    def __init__(self, num_classes: int):
+        r"""
+        Batched target transform that turns class indices into one-hot vectors with
+        a single scatter.
+
+        Args:
+            num_classes (int): number of classes
+        """
+        self.num_classes = num_classes
+
+    def __call__(self, y: torch.Tensor) -> torch.Tensor:
+        return onehot(y, self.num_classes)
+
+    def __repr__(self):
+        return f"OneHot(num_classes={self.num_classes})"
+
+
+def onehot(y: torch.Tensor, num_classes: int) -> torch.Tensor:
+    r"""
+    One-hot encodes a batch of class indices.
+
+    Args:
+        y (`torch.Tensor`): class indices of shape :math:`N`
+        num_classes (int): number of classes
+
+    Returns:
+        `torch.Tensor`: float tensor of shape :math:`N \times` `num_classes`
+    """
+    y = torch.as_tensor(y)
+    out = torch.zeros(y.size(0), num_classes, device=y.device)
+    return out.scatter_(1, y.long().view(-1, 1), 1)
+
+
+class Compose:
+    def __init__(
+        self, transforms: Sequence[_BatchTransform], seed: Optional[int] = None
+    ):
+        r"""
+        Applies a sequence of batch transforms. `uint8` batches (e.g. from
+        :class:`torchvision.transforms.PILToTensor`) are scaled to :math:`[0, 1]` first,
+        i.e. they're treated as if they went through :class:`torchvision.transforms.ToTensor`.
+
+        Each sample's random numbers are a hash of (`seed`, epoch, key, draw) where the key
+        is the sample's dataset index if it's provided, otherwise its position in the stream of samples
+        seen in the current epoch. Hence, the augmentation is reproducible and doesn't depend on the
+        batch size or the device.
+
+        Args:
+            transforms (Sequence): batch transforms, e.g. [:class:`RandomCrop`, :class:`Normalize`]
+            seed (int, optional): seed of the random numbers. If `None`, a random seed is drawn from
+                `torch`'s global generator (hence it's reproducible with `torch.manual_seed`).
+        """
+        self.transforms = list(transforms)
+        if seed is None:
+            seed = int(torch.randint(2**62, ()))
+        self.seed = seed
+        self._epoch = 0
+        self._seen = 0
+
+    @classmethod
+    def from_torchvision(
+        cls,
+        transforms: Union["torchvision.transforms.Compose", Sequence[Callable]],
+        seed: Optional[int] = None,
+    ) -> "Compose":
+        r"""
+        Converts torchvision transforms (e.g. :meth:`alr.data.datasets.Dataset.get_augmentation`
+        or :class:`alr.data.TransformedDataset`'s lists) into their batched equivalents.
+        A `Pad` is merged into the next `RandomCrop` (the transforms in between, e.g. a `ColorJitter`,
+        are applied to the unpadded images). `ToTensor` and `PILToTensor` are dropped since batches
+        are tensors already.
+
+        Args:
+            transforms (`torchvision.transforms.Compose`, Sequence): torchvision transforms
+            seed (int, optional): see :class:`Compose`
+
+        Returns:
+            :class:`Compose`: batched transforms
+
+        Raises:
+            ValueError: Occurs when one of the transforms doesn't have a batched equivalent.
+        """
+        # torchvision is slow to import: only import it when it's needed
+        from torchvision import transforms as T
+
+        if isinstance(transforms, T.Compose):
+            transforms = transforms.transforms
+        out, pad = [], None
+        for t in transforms:
+            if isinstance(t, T.Pad):
+                if pad is not None or not isinstance(t.padding, int):
+                    raise ValueError("Only a single uniform padding is supported.")
+                pad = t
+            elif isinstance(t, T.RandomCrop):
+                if pad is not None and t.padding:
+                    raise ValueError("Can't pad twice before a crop.")
+                src = pad if pad is not None else t
+                out.append(
+                    RandomCrop(
+                        t.size,
+                        padding=src.padding or 0,
+                        padding_mode=src.padding_mode,
+                        fill=src.fill,
+                    )
+                )
+                pad = None
+            elif isinstance(t, T.RandomHorizontalFlip):
+                out.append(RandomHorizontalFlip(t.p))
+            elif isinstance(t, T.ColorJitter):
+
+                def spread(v, centre):
+                    return 0 if v is None else max(v[1] - centre, centre - v[0])
+
+                out.append(
+                    ColorJitter(
+                        brightness=spread(t.brightness, 1),
+                        contrast=spread(t.contrast, 1),
+                        saturation=spread(t.saturation, 1),
+                        hue=spread(t.hue, 0),
+                    )
+                )
+            elif isinstance(t, T.Normalize):
+                out.append(Normalize(t.mean, t.std))
+            elif not isinstance(t, (T.ToTensor, T.PILToTensor)):
+                raise ValueError(f"{t} doesn't have a batched equivalent.")
+        if pad is not None:
+            raise ValueError("Pad is only supported before a RandomCrop.")
+        return cls(out, seed=seed)
+
+    def set_epoch(self, epoch: int) -> None:
+        r"""
+        Sets the epoch (part of the random numbers' key) and resets the stream position.
+
+        Args:
+            epoch (int): epoch
+
+        Returns:
+            NoneType: None
+        """
+        self._epoch = epoch
+        self._seen = 0
+
+    def __call__(
+        self, x: torch.Tensor, idxs: Optional[Sequence[int]] = None
+    ) -> torch.Tensor:
+        r"""
+        Transforms batch `x`.
+
+        Args:
+            x (`torch.Tensor`): :math:`N \times C \times H \times W` tensor
+            idxs (Sequence[int], optional): dataset indices of the samples in `x`.
+
+        Returns:
+            `torch.Tensor`: transformed float tensor
+        """
+        n = x.size(0)
+        if idxs is None:
+            keys = np.arange(self._seen, self._seen + n, dtype=np.uint64)
+            self._seen += n
+        else:
+            keys = np.asarray(idxs, dtype=np.int64).astype(np.uint64)
+        if x.dtype == torch.uint8:
+            x = x.float().div_(255)
+        u = _uniform(
+            self.seed, self._epoch, keys, sum(t.n_draws for t in self.transforms)
+        )
+        u = torch.from_numpy(u).to(device=x.device, dtype=x.dtype)
+        offset = 0
+        for t in self.transforms:
+            x = t(x, u[:, offset : offset + t.n_draws])
+            offset += t.n_draws
+        return x
+
+    def __repr__(self):
+        inner = "".join(f"\n    {t}," for t in self.transforms)
+        return f"Compose([{inner}\n], seed={self.seed})"
+
+
+class BatchTransformLoader:
+    def __init__(
+        self,
+        loader: torchdata.DataLoader,
+        transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+        target_transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+        device: _DeviceType = None,
+    ):
+        r"""
+        Wraps a data loader that yields `(x, y)` (or `x`) batches and transforms each batch after
+        it's been collated (and moved to `device`, so the augmentation can run on the GPU).
+        It can be used in place of the loader, e.g. in :meth:`alr.training.Trainer.fit`.
+
+        Args:
+            loader (`torch.utils.data.DataLoader`): loader of decoded but untransformed batches,
+                e.g. a dataset returned by :meth:`alr.data.TransformedDataset.batched`.
+            transform (Callable, optional): input batch transform, e.g. :class:`Compose`.
+                If it has a `set_epoch` method, it's called with the epoch before each pass over `loader`.
+            target_transform (Callable, optional): target batch transform, e.g. :class:`OneHot`.
+            device (None, str, `torch.device`): device to move the batches to before they're transformed.
+        """
+        self.loader = loader
+        self.transform = transform
+        self.target_transform = target_transform
+        self._device = device
+        self._epoch = 0
+
+    def __len__(self):
+        return len(self.loader)
+
+    def __iter__(self):
+        if hasattr(self.transform, "set_epoch"):
+            self.transform.set_epoch(self._epoch)
+        self._epoch += 1
+        for batch in self.loader:
+            if isinstance(batch, (list, tuple)):
+                x, y = batch
+                x, y = x.to(self._device), y.to(self._device)
+                if self.transform is not None:
+                    x = self.transform(x)
+                if self.target_transform is not None:
+                    y = self.target_transform(y)
+                yield x, y
+            else:
+                x = batch.to(self._device)
+                yield self.transform(x) if self.transform is not None else x
+
+
+# ITU-R 601 luma weights, as used by torchvision's grayscale conversion
+_GRAY = (0.299, 0.587, 0.114)
+_RGB_TO_YIQ = torch.tensor(
+    [
+        [0.299, 0.587, 0.114],
+        [0.5959, -0.2746, -0.3213],
+        [0.2115, -0.5227, 0.3112],
+    ]
+)
+_YIQ_TO_RGB = torch.inverse(_RGB_TO_YIQ)
+
+
+def _grayscale(x: torch.Tensor) -> torch.Tensor:
+    if x.size(1) != 3:
+        return x
+    w = torch.tensor(_GRAY, dtype=x.dtype, device=x.device)
+    return torch.einsum("c,nchw->nhw", w, x).unsqueeze(1)
+
+
+def _blend(x: torch.Tensor, other: torch.Tensor, factor: torch.Tensor) -> torch.Tensor:
+    return (factor * x + (1 - factor) * other).clamp_(0, 1)
@@ -0,0 +1,157 @@
+r"""
+Pre-decoded uint8 image caches. Each split is materialised once into a memory-mapped
+:math:`N \times C \times H \times W` uint8 `.npy` file (and a targets file); items and
+batches are then read straight from the page cache and normalised as tensors.
+The main method you should be concerned with is :meth:`alr.data.datasets.Dataset.get` (with `cache`).
+"""
+import os
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+import torch.utils.data as torchdata
+
+__all__ = ["CachedDataset", "build_cache"]
+
+
+class CachedDataset(torchdata.Dataset):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mean: Sequence[float],
+        std: Sequence[float],
+        augmentation: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+    ):
+        r"""
+        A dataset of `(x, y)` pairs backed by a cache created with :func:`build_cache`.
+        `x` is normalised by `mean` and `std` (after scaling to the 0-1 range), i.e.
+        the same as `ToTensor` followed by `Normalize`.
+
+        Args:
+            path (str, `Path`): path prefix of the cache (see :func:`build_cache`)
+            mean (Sequence[float]): channel means
+            std (Sequence[float]): channel standard deviations
+            augmentation (Callable, optional): applied to each uint8 :math:`C \times H \times W` tensor before
+                it's normalised (e.g. torchvision transforms that accept tensors).
+        """
+        path = Path(path)
+        # copy-on-write: the arrays are writable (so torch doesn't complain)
+        # but nothing is ever written back to the files
+        self._x = np.load(str(path) + "_x.npy", mmap_mode="c")
+        self._y = np.load(str(path) + "_y.npy", mmap_mode="c")
+        self._mean = torch.tensor(mean, dtype=torch.float32).view(-1, 1, 1) * 255
+        self._std = torch.tensor(std, dtype=torch.float32).view(-1, 1, 1) * 255
+        self.augmentation = augmentation
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __getitem__(self, idx) -> Tuple[torch.Tensor, int]:
+        x = torch.from_numpy(self._x[idx])
+        if self.augmentation is not None:
+            x = self.augmentation(x)
+        return self._normalise(x), int(self._y[idx])
+
+    def get_batch(self, idxs: Sequence[int]) -> Tuple[torch.Tensor, torch.Tensor]:
+        r"""
+        Returns the points at `idxs` as a batch. The points are read with a single
+        (sorted) read from the cache and normalised together.
+
+        Args:
+            idxs (Sequence[int]): indices
+
+        Returns:
+            Tuple[`torch.Tensor`, `torch.Tensor`]: a batch of inputs and targets
+        """
+        idxs = np.asarray(idxs, dtype=np.int64)
+        order = np.argsort(idxs, kind="stable")
+        x = np.empty((len(idxs), *self._x.shape[1:]), dtype=np.uint8)
+        x[order] = self._x[idxs[order]]
+        x = torch.from_numpy(x)
+        if self.augmentation is not None:
+            x = torch.stack([self.augmentation(xi) for xi in x])
+        return self._normalise(x), torch.from_numpy(self._y[idxs])
+
+    @property
+    def targets(self) -> np.ndarray:
+        return self._y
+
+    def share_memory(self) -> "CachedDataset":
+        r"""
+        The cache is memory-mapped, hence data loader workers already share the
+        (page-cached) file pages: there's nothing to move to shared memory.
+
+        Returns:
+            :class:`CachedDataset`: `self`
+        """
+        return self
+
+    def _normalise(self, x: torch.Tensor) -> torch.Tensor:
+        return (x.float() - self._mean) / self._std
+
+
+def build_cache(
+    dataset: torchdata.Dataset,
+    path: Union[str, Path],
+    overwrite: Optional[bool] = False,
+) -> Path:
+    r"""
+    Materialises `dataset` into a uint8 :math:`N \times C \times H \times W` array (`<path>_x.npy`)
+    and an int64 array of targets (`<path>_y.npy`). `dataset` is expected to return `(image, target)`
+    where `image` is a PIL image or a uint8 array of shape :math:`H \times W` or :math:`H \times W \times C`,
+    i.e. it should have no transforms. If `dataset` has `data` and `targets` attributes (e.g.
+    torchvision's MNIST and CIFAR), they are used directly instead of decoding each item.
+    The files are written to temporary files first and renamed once they're complete.
+
+    Args:
+        dataset (`torch.utils.data.Dataset`): untransformed dataset
+        path (str, `Path`): path prefix of the cache files
+        overwrite (bool, optional): if false and the cache exists, nothing is done.
+
+    Returns:
+        `Path`: `path`
+    """
+    path = Path(path)
+    x_path, y_path = Path(str(path) + "_x.npy"), Path(str(path) + "_y.npy")
+    if not overwrite and x_path.exists() and y_path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = getattr(dataset, "data", None)
+    if data is not None and hasattr(dataset, "targets"):
+        x = np.asarray(data, dtype=np.uint8)
+        y = np.asarray(dataset.targets, dtype=np.int64)
+        x_tmp = _tmp(x_path)
+        np.save(x_tmp, _to_nchw(x))
+    else:
+        first = _to_nchw(np.asarray(dataset[0][0], dtype=np.uint8)[None])
+        x_tmp = _tmp(x_path)
+        x = np.lib.format.open_memmap(
+            x_tmp, mode="w+", dtype=np.uint8, shape=(len(dataset), *first.shape[1:])
+        )
+        y = np.empty(len(dataset), dtype=np.int64)
+        for i in range(len(dataset)):
+            img, target = dataset[i]
+            x[i] = _to_nchw(np.asarray(img, dtype=np.uint8)[None])[0]
+            y[i] = target
+        x.flush()
+        del x
+    y_tmp = _tmp(y_path)
+    np.save(y_tmp, y)
+    os.replace(x_tmp, x_path)
+    os.replace(y_tmp, y_path)
+    return path
+
+
+def _to_nchw(x: np.ndarray) -> np.ndarray:
+    if x.ndim == 3:
+        # N x H x W
+        return x[:, None]
+    # N x H x W x C
+    return np.ascontiguousarray(x.transpose(0, 3, 1, 2))
+
+
+def _tmp(path: Path) -> str:
+    # np.save appends .npy to names without it
+    return str(path.with_name(f".{path.stem}.tmp.npy"))
@@ -1,15 +1,20 @@
 import torch.utils.data as torchdata
-import torchvision as tv
 from torch import nn
 from torch.nn import functional as F
 from dataclasses import dataclass
 from torch.nn.utils import weight_norm
 
 from enum import Enum
-from typing import Optional, Tuple
-from torchvision import transforms
+from typing import Optional, Tuple, Union
 from pathlib import Path
 
+from alr.data._indices import index_table
+
+# CINIC-10 isn't downloaded by torchvision: it's expected to be extracted here
+_CINIC_ROOT = Path().home() / "data" / "cinic-10"
+# (train, test) sizes of Dataset.Synthetic
+_SYNTHETIC_SIZE = (10_000_000, 10_000)
+
 
 @dataclass(frozen=True)
 class DataDescription:
@@ -45,12 +50,15 @@ class Dataset(Enum):
     CIFAR100 = "CIFAR100"
     RepeatedMNIST = "RepeatedMNIST"
     CINIC10 = "CINIC10"
+    # generated on demand, see alr.data.synthetic
+    Synthetic = "Synthetic"
 
     def get(
         self,
         root: Optional[str] = "data",
         raw: Optional[bool] = False,
         augmentation: Optional[bool] = False,
+        cache: Optional[Union[bool, str]] = False,
     ) -> Tuple[torchdata.Dataset, torchdata.Dataset]:
         r"""
         Return (train, test) tuple of datasets.
@@ -61,11 +69,45 @@ class Dataset(Enum):
                 no normalisation, ToTensor, etc.); note, the test set *WILL* be transformed.
             augmentation (bool, optional): whether to add standard augmentation: horizontal flips and
                 random cropping.
+            cache (bool, str, optional): if true (or a directory), each split is decoded once into a
+                memory-mapped uint8 array in `<root>/cache/<dataset>` (or the given directory) and the datasets
+                are :class:`alr.data.cache.CachedDataset` s that read from it. Items are identical to the
+                uncached datasets' items but no PIL image is created per item. Not available with `raw`.
+                CINIC-10 is cached in `~/data/cinic-10/packed` by default (see :func:`pack_cinic10`) and
+                this cache is used whenever it exists, even if `cache` is false.
+
+        Note:
+            `Synthetic` is a 10-class MNIST-shaped dataset of 10M training and 10k test points generated from
+            their indices (see :class:`alr.data.synthetic.SyntheticDataset` for other sizes, shapes, and
+            class imbalance). Nothing is downloaded or stored, `raw` returns inputs in the range of 0-1,
+            and augmentation and caching aren't available.
 
         Returns:
             tuple: a 2-tuple of (train, test) datasets
         """
         assert not raw or not augmentation, "Cannot enable augmentation on raw dataset!"
+        if self is Dataset.Synthetic:
+            from alr.data.synthetic import SyntheticDataset
+
+            assert not augmentation, "Synthetic data has no augmentation."
+            assert not cache, "Synthetic data is generated, not cached."
+            train = SyntheticDataset(_SYNTHETIC_SIZE[0], split=0, normalise=not raw)
+            test = SyntheticDataset(_SYNTHETIC_SIZE[1], split=1)
+            return train, test
+        if (
+            self is Dataset.CINIC10
+            and not cache
+            and not raw
+            and _is_packed(_CINIC_ROOT)
+        ):
+            cache = True
+        if cache:
+            assert not raw, "Cannot cache a raw dataset!"
+            return self._get_cached(root, augmentation, cache)
+
+        # torchvision is slow to import: only import it when it's needed
+        import torchvision as tv
+        from torchvision import transforms
 
         regular_transform = [
             transforms.ToTensor(),
@@ -112,7 +154,7 @@ class Dataset(Enum):
 
             if raw:
                 train_transform = None
-            cinic_root = Path().home() / "data" / "cinic-10"
+            cinic_root = _CINIC_ROOT
             train = tv.datasets.ImageFolder(
                 str(cinic_root / "train"),
                 transform=train_transform,
@@ -132,6 +174,57 @@ class Dataset(Enum):
             raise ValueError(f"{self} dataset hasn't been implemented.")
         return train, test
 
+    def _get_cached(
+        self, root: str, augmentation: bool, cache: Union[bool, str]
+    ) -> Tuple[torchdata.Dataset, torchdata.Dataset]:
+        from torchvision import transforms
+        from alr.data.cache import CachedDataset
+
+        # RepeatedMNIST shares MNIST's cache
+        base = Dataset.MNIST if self is Dataset.RepeatedMNIST else self
+        if cache is not True:
+            directory = Path(cache)
+        elif base is Dataset.CINIC10:
+            directory = _CINIC_ROOT / "packed"
+        else:
+            directory = Path(root) / "cache" / base.value
+        paths = (directory / "train", directory / "test")
+        base._build_cache(root, directory)
+        aug = None
+        if augmentation:
+            aug = transforms.Compose(
+                [
+                    transforms.RandomCrop(32, padding=4),
+                    transforms.RandomHorizontalFlip(),
+                ]
+            )
+        mean, std = self.normalisation_params
+        train = CachedDataset(paths[0], mean, std, augmentation=aug)
+        test = CachedDataset(paths[1], mean, std)
+        if self is Dataset.RepeatedMNIST:
+            train = torchdata.ConcatDataset([train] * 3)
+        return train, test
+
+    def _build_cache(
+        self, root: Optional[str], directory: Path, overwrite: Optional[bool] = False
+    ) -> None:
+        from alr.data.cache import build_cache
+
+        paths = (directory / "train", directory / "test")
+        if not overwrite and all(
+            Path(f"{p}_{a}.npy").exists() for p in paths for a in "xy"
+        ):
+            return
+        # raw datasets (no transforms)
+        train, test = self.get(root, raw=True)
+        if self is Dataset.CINIC10:
+            # unlike the other datasets, the test set is transformed
+            test.dataset.transform = None
+        else:
+            test.transform = None
+        for ds, p in zip((train, test), paths):
+            build_cache(ds, p, overwrite=overwrite)
+
     @property
     def normalisation_params(self) -> Tuple[Tuple[float], Tuple[float]]:
         r"""
@@ -160,6 +253,10 @@ class Dataset(Enum):
             ),
         }
         params[Dataset.RepeatedMNIST] = params[Dataset.MNIST]
+        if self is Dataset.Synthetic:
+            from alr.data.synthetic import _MEAN, _STD
+
+            params[Dataset.Synthetic] = ((_MEAN,), (_STD,))
         return params[self]
 
     @property
@@ -183,6 +280,7 @@ class Dataset(Enum):
             Dataset.CIFAR10: DataDescription(10, 32, 32, 3),
             Dataset.CIFAR100: DataDescription(100, 32, 32, 3),
             Dataset.CINIC10: DataDescription(10, 32, 32, 3),
+            Dataset.Synthetic: DataDescription(10, 28, 28, 1),
         }
         return params[self]
 
@@ -206,9 +304,9 @@ class Dataset(Enum):
             tuple: A tuple of train, pool, and test datasets.
         """
         if self is Dataset.MNIST:
-            idx_set = _mnist_20
+            idx_set = index_table("mnist_20")
         elif self is Dataset.CIFAR10:
-            idx_set = _cifar10_1
+            idx_set = index_table("cifar10_1")
         else:
             raise NotImplementedError(f"Fixed points for {self} is not available yet.")
 
@@ -216,16 +314,17 @@ class Dataset(Enum):
         assert which < len(
             idx_set
         ), f"Only {len(idx_set)} sets are available for {self}."
-        idxs = idx_set[which]
-        cidxs = set(range(len(train))) - set(idxs)
-        pool = torchdata.Subset(train, list(cidxs))
-        train = torchdata.Subset(train, idxs)
+        from alr.data import partition
+
+        train, pool = partition(train, idx_set[which])
         return train, pool, test
 
     @property
     def get_augmentation(self):
         if self is not Dataset.CIFAR10:
             raise NotImplementedError(f"get_augmentation not available for {self}")
+        import torchvision as tv
+
         data_augmentation = tv.transforms.Compose(
             [
                 tv.transforms.Pad(2, padding_mode="reflect"),
@@ -246,569 +345,54 @@ class Dataset(Enum):
         Returns:
             torch.nn.Module: a pytorch model
         """
-        if self in {Dataset.MNIST, Dataset.RepeatedMNIST}:
+        if self in {Dataset.MNIST, Dataset.RepeatedMNIST, Dataset.Synthetic}:
             return MNISTNet()
         if self == Dataset.CIFAR10:
             return CIFAR10Net()
         raise NotImplementedError("No model defined for this dataset yet.")
 
 
-# 24 sets of 20 points with +- 0.01 accuracy from median: 0.65205
-_mnist_20 = [
-    (
-        33479,
-        3162,
-        19169,
-        11495,
-        15914,
-        20426,
-        21495,
-        52396,
-        16515,
-        19727,
-        52720,
-        12424,
-        30690,
-        58679,
-        44785,
-        20682,
-        28513,
-        38932,
-        20408,
-        3801,
-    ),
-    (
-        40920,
-        33826,
-        59132,
-        22914,
-        35401,
-        46080,
-        47822,
-        1925,
-        28716,
-        50867,
-        5126,
-        29159,
-        41470,
-        25508,
-        53476,
-        27472,
-        44436,
-        44587,
-        56388,
-        19129,
-    ),
-    (
-        19641,
-        4578,
-        29287,
-        37320,
-        21474,
-        31142,
-        20221,
-        49296,
-        35922,
-        32416,
-        28365,
-        38441,
-        26961,
-        22063,
-        23629,
-        50925,
-        46201,
-        37567,
-        11815,
-        46561,
-    ),
-    (
-        13506,
-        43404,
-        12223,
-        42233,
-        33552,
-        58117,
-        36527,
-        2797,
-        29225,
-        11150,
-        25582,
-        49413,
-        55733,
-        36569,
-        6531,
-        50308,
-        9405,
-        34069,
-        16092,
-        41826,
-    ),
-    (
-        46938,
-        45343,
-        10338,
-        6631,
-        24919,
-        32224,
-        14440,
-        52834,
-        21392,
-        40344,
-        31691,
-        43258,
-        25017,
-        56908,
-        41200,
-        19552,
-        43623,
-        57612,
-        56061,
-        33019,
-    ),
-    (
-        34380,
-        458,
-        27650,
-        18400,
-        36235,
-        34469,
-        31224,
-        52286,
-        22674,
-        49931,
-        5674,
-        18622,
-        2865,
-        30094,
-        37540,
-        1887,
-        47609,
-        37123,
-        17887,
-        59419,
-    ),
-    (
-        55333,
-        56236,
-        54764,
-        31705,
-        45729,
-        26454,
-        15116,
-        45512,
-        42629,
-        35753,
-        11879,
-        4471,
-        42841,
-        23479,
-        22760,
-        1535,
-        30522,
-        32030,
-        6356,
-        31809,
-    ),
-    (
-        654,
-        6458,
-        52794,
-        16987,
-        38175,
-        14182,
-        1679,
-        44590,
-        2654,
-        38630,
-        27540,
-        22150,
-        27289,
-        36348,
-        46448,
-        25692,
-        2592,
-        43035,
-        11195,
-        19245,
-    ),
-    (
-        38608,
-        28958,
-        49076,
-        55452,
-        43257,
-        38931,
-        28884,
-        52759,
-        41098,
-        28558,
-        46660,
-        59685,
-        34048,
-        51456,
-        19143,
-        38580,
-        3850,
-        17198,
-        22749,
-        39503,
-    ),
-    (
-        33674,
-        28825,
-        35042,
-        57790,
-        18797,
-        59202,
-        45838,
-        44119,
-        28229,
-        30357,
-        59087,
-        22074,
-        37914,
-        43639,
-        28235,
-        59731,
-        2687,
-        1710,
-        16031,
-        37424,
-    ),
-    (
-        37041,
-        32464,
-        2182,
-        5105,
-        25852,
-        42029,
-        15667,
-        53665,
-        52299,
-        19278,
-        29439,
-        21215,
-        12811,
-        20382,
-        50605,
-        36311,
-        3196,
-        6964,
-        34140,
-        58381,
-    ),
-    (
-        49580,
-        32583,
-        10860,
-        12029,
-        27952,
-        57306,
-        27114,
-        51904,
-        37445,
-        12358,
-        39175,
-        8044,
-        10086,
-        18826,
-        36491,
-        27013,
-        53208,
-        49325,
-        55150,
-        50527,
-    ),
-    (
-        34791,
-        43564,
-        16453,
-        18335,
-        19112,
-        18183,
-        17212,
-        473,
-        58744,
-        20163,
-        22546,
-        58391,
-        26952,
-        39042,
-        12006,
-        48625,
-        26815,
-        49461,
-        6468,
-        6936,
-    ),
-    (
-        47333,
-        32600,
-        7634,
-        15318,
-        3236,
-        43565,
-        34004,
-        47891,
-        52446,
-        5381,
-        27198,
-        56250,
-        44513,
-        57343,
-        6476,
-        27699,
-        23440,
-        14554,
-        42538,
-        58241,
-    ),
-    (
-        32861,
-        43028,
-        23876,
-        54561,
-        20624,
-        22584,
-        2156,
-        5675,
-        25557,
-        38187,
-        4675,
-        5643,
-        31785,
-        39365,
-        55789,
-        11507,
-        50565,
-        14166,
-        46226,
-        2144,
-    ),
-    (
-        52038,
-        47011,
-        35514,
-        36353,
-        13205,
-        26807,
-        37701,
-        24186,
-        22144,
-        8822,
-        39192,
-        30370,
-        42906,
-        19378,
-        9625,
-        44845,
-        37137,
-        13356,
-        28077,
-        36932,
-    ),
-    (
-        28931,
-        58414,
-        34981,
-        23698,
-        23096,
-        24403,
-        32018,
-        38366,
-        54223,
-        33457,
-        7647,
-        22917,
-        11600,
-        48807,
-        39192,
-        47631,
-        16900,
-        15283,
-        14155,
-        55377,
-    ),
-    (
-        49969,
-        31620,
-        56337,
-        19699,
-        49342,
-        12913,
-        43909,
-        145,
-        5575,
-        41365,
-        20196,
-        43690,
-        39055,
-        44785,
-        33422,
-        2819,
-        14811,
-        43261,
-        45203,
-        39170,
-    ),
-    (
-        52645,
-        41154,
-        43574,
-        26144,
-        17243,
-        51196,
-        21418,
-        21816,
-        54635,
-        13619,
-        2874,
-        17124,
-        16391,
-        45504,
-        55157,
-        13527,
-        33756,
-        45948,
-        21693,
-        3374,
-    ),
-    (
-        36700,
-        12636,
-        35933,
-        9290,
-        975,
-        42757,
-        5197,
-        41484,
-        11101,
-        10798,
-        19309,
-        4748,
-        38047,
-        34424,
-        42575,
-        38653,
-        43514,
-        36621,
-        35862,
-        28877,
-    ),
-    (
-        20398,
-        27976,
-        25154,
-        54951,
-        18249,
-        20,
-        55911,
-        55500,
-        186,
-        38592,
-        48834,
-        4119,
-        11926,
-        25099,
-        54824,
-        48339,
-        43320,
-        3754,
-        24752,
-        11457,
-    ),
-    (
-        46959,
-        13392,
-        8626,
-        55276,
-        26976,
-        33992,
-        16264,
-        44518,
-        30741,
-        39375,
-        34387,
-        4537,
-        12291,
-        6658,
-        20542,
-        18832,
-        44508,
-        20867,
-        30517,
-        37982,
-    ),
-    (
-        26754,
-        6166,
-        16478,
-        1561,
-        59790,
-        9000,
-        43538,
-        4868,
-        34394,
-        21017,
-        37970,
-        14324,
-        46481,
-        52564,
-        40462,
-        50910,
-        48934,
-        2070,
-        3811,
-        21865,
-    ),
-    (
-        13369,
-        54382,
-        20231,
-        14627,
-        43491,
-        15178,
-        2253,
-        14073,
-        31816,
-        1870,
-        34302,
-        5359,
-        36903,
-        41308,
-        45210,
-        50448,
-        21174,
-        57606,
-        22846,
-        54399,
-    ),
-]
-
-_cifar10_1 = [
-    (
-        33553,
-        9427,
-        199,
-        12447,
-        39489,
-        42724,
-        10822,
-        49498,
-        36958,
-        43106,
-        38695,
-        1414,
-        18471,
-        15118,
-        13466,
-        26497,
-        24148,
-        41514,
-        30263,
-        24712,
+def pack_cinic10(overwrite: Optional[bool] = False) -> Path:
+    r"""
+    One-time conversion of the extracted CINIC-10 PNGs in `~/data/cinic-10` into
+    memory-mapped uint8 arrays (and targets) in `~/data/cinic-10/packed`. The arrays are
+    in the order of :meth:`Dataset.get` (i.e. the train set is the concatenated train and valid
+    sets, shuffled by `_cinic_train_indices`), so an epoch reads the file sequentially.
+    Once packed, :meth:`Dataset.get` uses the arrays instead of the PNGs transparently.
+
+    Args:
+        overwrite (bool, optional): repack even if the packed arrays exist.
+
+    Returns:
+        `Path`: directory of the packed arrays
+    """
+    directory = _CINIC_ROOT / "packed"
+    if overwrite or not _is_packed(_CINIC_ROOT):
+        Dataset.CINIC10._build_cache(None, directory, overwrite=True)
+    return directory
+
+
+def _is_packed(cinic_root: Path) -> bool:
+    return all(
+        (cinic_root / "packed" / f"{split}_{a}.npy").exists()
+        for split in ("train", "test")
+        for a in "xy"
     )
-]
+
+
+# fixed training sets, see Dataset.get_fixed
+_FIXED_SETS = {
+    # 24 sets of 20 points with +- 0.01 accuracy from median: 0.65205
+    "_mnist_20": "mnist_20",
+    "_cifar10_1": "cifar10_1",
+}
+
+
+def __getattr__(name):
+    # the index tables are loaded from alr/data/_indices.npz on first use
+    if name in _FIXED_SETS:
+        return [tuple(idxs) for idxs in index_table(_FIXED_SETS[name]).tolist()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MNISTNet(nn.Module):
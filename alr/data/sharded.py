@@ -0,0 +1,333 @@
+r"""
+Unlabelled pools that don't fit in memory: the pool is stored as shards of `.npy` files listed
+in a manifest, scored by streaming the shards sequentially, and logically reduced with a
+bitmap per shard (one bit per point).
+The main class you should be concerned with is :class:`ShardedUnlabelledDataset`.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+import torch.utils.data as torchdata
+
+__all__ = ["ShardedUnlabelledDataset", "write_shards"]
+
+_MANIFEST = "manifest.json"
+# number of points read at once when the chunk size isn't set
+_READ_SIZE = 1024
+
+
+def write_shards(
+    directory: Union[str, Path],
+    shards: Iterable[Tuple[np.ndarray, Optional[np.ndarray]]],
+) -> Path:
+    r"""
+    Writes `shards` to `directory` in the format read by :class:`ShardedUnlabelledDataset`:
+    the inputs and targets of the :math:`i`-th shard are saved to `inputs_<i>.npy` and `targets_<i>.npy`
+    and `manifest.json` lists the shards and their sizes. The manifest is written last, so
+    a directory with a manifest is always complete.
+
+    Args:
+        directory (str, `Path`): output directory (created if it doesn't exist)
+        shards (Iterable[Tuple[`np.ndarray`, `np.ndarray`]]): `(inputs, targets)` of each shard,
+            where `targets` can be `None` (an unlabelled pool).
+
+    Returns:
+        `Path`: path of the manifest
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    entries = []
+    for i, (x, y) in enumerate(shards):
+        entry = {"inputs": f"inputs_{i:05d}.npy", "size": len(x)}
+        np.save(directory / entry["inputs"], np.asarray(x))
+        if y is not None:
+            assert len(y) == len(x)
+            entry["targets"] = f"targets_{i:05d}.npy"
+            np.save(directory / entry["targets"], np.asarray(y))
+        entries.append(entry)
+    manifest = directory / _MANIFEST
+    tmp = directory / f".{_MANIFEST}.tmp"
+    with open(tmp, "w") as fp:
+        json.dump({"shards": entries}, fp)
+    os.replace(tmp, manifest)
+    return manifest
+
+
+class ShardedUnlabelledDataset(torchdata.IterableDataset):
+    def __init__(
+        self,
+        manifest: Union[str, Path],
+        label_fn: Optional[Callable[[torchdata.Dataset], torchdata.Dataset]] = None,
+        transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+        chunk_size: Optional[int] = None,
+        debug: Optional[bool] = False,
+    ):
+        r"""
+        An out-of-core counterpart of :class:`alr.data.UnlabelledDataset` over shards written by
+        :func:`write_shards`. Labelled points are removed logically by setting their bit in a
+        packed bitmap of their shard (:math:`N / 8` bytes in total) instead of an :math:`N`-element mask and
+        index. Iterating over this dataset streams the remaining points shard by shard
+        (memory-mapped, in ascending order), so it can be scored by acquisition functions with a
+        :class:`torch.utils.data.DataLoader` as usual, and :meth:`alr.data.DataManager.acquire` works unchanged.
+        Only the labelled points (returned by :meth:`label`) are accessed randomly.
+
+        With multiple data loader workers, consecutive chunks of `chunk_size` points are assigned
+        to the workers in turn. As the data loader collects the workers' batches in turn too,
+        the points come out in order **only if** `chunk_size` is the data loader's batch size.
+        Workers can't see the data loader's batch size, hence iterating with more than one worker
+        raises an error unless `chunk_size` is given explicitly.
+
+        Args:
+            manifest (str, `Path`): path of the manifest (or its directory)
+            label_fn (Callable: Dataset :math:`\rightarrow` Dataset, optional): see
+                :class:`alr.data.UnlabelledDataset`. If it's not provided, the shards must have targets.
+            transform (Callable, optional): applied to each input (a tensor) when it's read
+            chunk_size (int, optional): number of consecutive points assigned to a data loader worker,
+                i.e. the batch size of the data loaders that iterate over this dataset with workers.
+            debug (bool, optional): if `True`, iterating yields `(x, y)` instead of `x`
+        """
+        manifest = Path(manifest)
+        if manifest.is_dir():
+            manifest = manifest / _MANIFEST
+        with open(manifest, "r") as fp:
+            self._shards = json.load(fp)["shards"]
+        self._root = manifest.parent
+        self._label_fn = label_fn
+        if label_fn is None:
+            assert all(
+                "targets" in s for s in self._shards
+            ), "Shards must have targets if label_fn isn't provided."
+        self._transform = transform
+        self._chunk_size = chunk_size
+        self.debug = debug
+        if self.debug:
+            assert self._label_fn is None
+        self._sizes = np.array([s["size"] for s in self._shards], dtype=np.int64)
+        # absolute index of the first point of each shard
+        self._offsets = np.concatenate([[0], np.cumsum(self._sizes)])
+        self._arrays = {}
+        self.reset()
+
+    def reset(self) -> None:
+        r"""
+        Reset to initial state -- all labelled points are unlabelled and
+        introduced back into the pool.
+
+        Returns:
+            NoneType: None
+        """
+        self._bitmaps = [
+            np.zeros((n + 7) // 8, dtype=np.uint8) for n in self._sizes.tolist()
+        ]
+        self._remaining = self._sizes.copy()
+
+    def state_dict(self) -> dict:
+        r"""
+        Returns the state of this dataset, i.e. which points have been labelled, as the packed
+        bitmap of every shard (:math:`N / 8` bytes in total).
+
+        Returns:
+            dict: state that can be restored with :meth:`load_state_dict`
+        """
+        return {
+            "size": int(self._offsets[-1]),
+            "labelled": [b.copy() for b in self._bitmaps],
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        r"""
+        Restores a state returned by :meth:`state_dict`.
+
+        Args:
+            state (dict): state
+
+        Returns:
+            NoneType: None
+        """
+        if state["size"] != self._offsets[-1] or len(state["labelled"]) != len(
+            self._shards
+        ):
+            raise ValueError(
+                f"The state is of a pool of {state['size']} points in "
+                f"{len(state['labelled'])} shards, but this pool has "
+                f"{int(self._offsets[-1])} points in {len(self._shards)} shards."
+            )
+        for s, bitmap in enumerate(state["labelled"]):
+            self._bitmaps[s] = np.array(bitmap, dtype=np.uint8)
+            self._remaining[s] = self._sizes[s] - len(self._labelled(s))
+
+    def __len__(self) -> int:
+        return int(self._remaining.sum())
+
+    def convert_idx(self, idxs: np.array) -> np.array:
+        r"""
+        Given a set of indices relative to the current state of this dataset,
+        return the true/absolute index of the original pool.
+
+        Args:
+            idxs (np.array): sequence of indices
+
+        Returns:
+            `np.array`: absolute index
+        """
+        idxs = np.asarray(idxs, dtype=np.int64).reshape(-1)
+        assert ((idxs >= 0) & (idxs < len(self))).all(), "Index out of range."
+        starts = np.concatenate([[0], np.cumsum(self._remaining)])
+        shards = np.searchsorted(starts, idxs, side="right") - 1
+        out = np.empty_like(idxs)
+        for s in np.unique(shards):
+            sel = shards == s
+            out[sel] = self._offsets[s] + self._unlabelled(s)[idxs[sel] - starts[s]]
+        return out
+
+    def label(self, idxs: Sequence[int]) -> torchdata.Dataset:
+        r"""
+        Label and return points specified by `idxs` (relative to the current state of this dataset)
+        according to `label_fn`, see :meth:`alr.data.UnlabelledDataset.label`.
+
+        Args:
+            idxs (`Sequence[int]`): indices of points to label
+
+        Returns:
+            :class:`torch.utils.data.Dataset`: a (random-access) labelled dataset where each
+                point is specified by `idxs` and labelled by `label_fn`.
+        """
+        assert len(self), "There are no remaining unlabelled points."
+        absolute = self.convert_idx(idxs)
+        assert len(np.unique(absolute)) == len(
+            absolute
+        ), "Can't label points that have been labelled."
+        shards, local = self._locate(absolute)
+        for s in np.unique(shards):
+            bits = np.unpackbits(self._bitmaps[s], count=int(self._sizes[s]))
+            bits[local[shards == s]] = 1
+            self._bitmaps[s] = np.packbits(bits)
+            self._remaining[s] = self._sizes[s] - int(bits.sum())
+        labelled = _ShardRows(self, absolute, with_targets=self._label_fn is None)
+        if self._label_fn:
+            labelled = self._label_fn(labelled)
+        return labelled
+
+    @property
+    def labelled_indices(self) -> list:
+        r"""
+        Returns a list of (absolute) indices that were labelled in the past.
+
+        Returns:
+            `list`: all the indices that were labelled by :meth:`label`
+        """
+        return np.concatenate(
+            [self._offsets[s] + self._labelled(s) for s in range(len(self._shards))]
+        ).tolist()
+
+    @contextmanager
+    def true_labels(self):
+        r"""
+        When the dataset is iterated over within this context, it yields the label as well.
+        See :meth:`alr.data.UnlabelledDataset.true_labels`.
+
+        Returns:
+            :class:`ShardedUnlabelledDataset`: `self`
+        """
+        if self.debug:
+            yield self
+        else:
+            self.debug = True
+            yield self
+            self.debug = False
+
+    def __iter__(self):
+        info = torchdata.get_worker_info()
+        worker, n_workers = (0, 1) if info is None else (info.id, info.num_workers)
+        if n_workers > 1 and self._chunk_size is None:
+            raise RuntimeError(
+                "The points are only in order if chunk_size is the data loader's batch size: "
+                "set chunk_size to iterate with multiple workers."
+            )
+        chunk_size = self._chunk_size or _READ_SIZE
+        # logical index of the first remaining point of the current shard
+        start = 0
+        for s in range(len(self._shards)):
+            rows = self._unlabelled(s)
+            chunk = (start + np.arange(len(rows))) // chunk_size
+            start += len(rows)
+            rows = rows[chunk % n_workers == worker]
+            for i in range(0, len(rows), chunk_size):
+                block = rows[i : i + chunk_size]
+                x, y = self._read(s, block, targets=self.debug)
+                for j in range(len(block)):
+                    xj = self._transform(x[j]) if self._transform else x[j]
+                    yield (xj, int(y[j])) if self.debug else xj
+
+    def _unlabelled(self, shard: int) -> np.ndarray:
+        # local indices of the remaining points of a shard
+        bits = np.unpackbits(self._bitmaps[shard], count=int(self._sizes[shard]))
+        return np.flatnonzero(bits == 0)
+
+    def _labelled(self, shard: int) -> np.ndarray:
+        # local indices of the labelled points of a shard
+        bits = np.unpackbits(self._bitmaps[shard], count=int(self._sizes[shard]))
+        return np.flatnonzero(bits)
+
+    def _locate(self, absolute: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        shards = np.searchsorted(self._offsets, absolute, side="right") - 1
+        return shards, absolute - self._offsets[shards]
+
+    def _array(self, shard: int, key: str) -> np.ndarray:
+        if (shard, key) not in self._arrays:
+            self._arrays[shard, key] = np.load(
+                self._root / self._shards[shard][key], mmap_mode="r"
+            )
+        return self._arrays[shard, key]
+
+    def _read(
+        self, shard: int, rows: np.ndarray, targets: bool
+    ) -> Tuple[torch.Tensor, Optional[np.ndarray]]:
+        # rows are sorted: a (nearly) sequential read of the shard
+        x = torch.from_numpy(np.ascontiguousarray(self._array(shard, "inputs")[rows]))
+        y = self._array(shard, "targets")[rows] if targets else None
+        return x, y
+
+    def __getstate__(self):
+        # memory maps are reopened by each worker
+        state = self.__dict__.copy()
+        state["_arrays"] = {}
+        return state
+
+
+class _ShardRows(torchdata.Dataset):
+    def __init__(
+        self,
+        pool: ShardedUnlabelledDataset,
+        absolute: np.ndarray,
+        with_targets: bool,
+    ):
+        # random access to a (small) set of points of the pool
+        self._pool = pool
+        self._absolute = absolute
+        self._with_targets = with_targets
+
+    def __len__(self):
+        return len(self._absolute)
+
+    def __getitem__(self, idx):
+        shards, local = self._pool._locate(self._absolute[[idx]])
+        x, y = self._pool._read(int(shards[0]), local, targets=self._with_targets)
+        x = self._pool._transform(x[0]) if self._pool._transform else x[0]
+        return (x, int(y[0])) if self._with_targets else x
+
+    @property
+    def targets(self) -> np.ndarray:
+        assert self._with_targets
+        shards, local = self._pool._locate(self._absolute)
+        y = np.empty(len(self), dtype=np.int64)
+        for s in np.unique(shards):
+            sel = shards == s
+            y[sel] = self._pool._array(int(s), "targets")[local[sel]]
+        return y
@@ -0,0 +1,129 @@
+r"""
+Procedurally generated datasets for scale testing without downloads. Every point is computed
+from its index (a counter-based hash), hence nothing is stored and a dataset of any size
+costs nothing until it's read.
+The main class you should be concerned with is :class:`SyntheticDataset`.
+"""
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+import torch.utils.data as torchdata
+
+from alr.data._rng import _uniform
+
+__all__ = ["SyntheticDataset"]
+
+# pixels are a class prototype in [0.25, 0.75] plus uniform noise in [-0.25, 0.25]:
+# both have a variance of 1 / 48
+_MEAN = 0.5
+_STD = math.sqrt(1 / 24)
+
+
+class SyntheticDataset(torchdata.Dataset):
+    def __init__(
+        self,
+        size: int,
+        n_class: Optional[int] = 10,
+        shape: Optional[Sequence[int]] = (1, 28, 28),
+        imbalance: Optional[float] = 1.0,
+        seed: Optional[int] = 0,
+        split: Optional[int] = 0,
+        normalise: Optional[bool] = True,
+    ):
+        r"""
+        A deterministic class-conditional dataset of `(x, y)` pairs generated on demand from the index.
+        `y` is drawn from the class proportions (see `imbalance`) and `x` is the prototype of class `y`
+        (drawn once from `seed`) plus independent uniform noise per element, so the classes are
+        learnable but not trivially separable. The same index always yields the same point.
+
+        Args:
+            size (int): number of points
+            n_class (int, optional): number of classes
+            shape (Sequence[int], optional): shape of `x`, e.g. :math:`C \times H \times W` for images or
+                :math:`(D,)` for feature vectors
+            imbalance (float, optional): ratio of the proportions of the most and least frequent class.
+                The proportions decay geometrically from class 0 to class `n_class - 1`; 1 is balanced.
+            seed (int, optional): seed of the prototypes and points
+            split (int, optional): datasets with the same `seed` but different splits share the
+                prototypes (i.e. the classes) but have independent points, e.g. 0 for train and 1 for test.
+            normalise (bool, optional): if true, `x` is normalised to zero mean and unit variance,
+                otherwise it's in the range of 0-1.
+        """
+        assert size >= 0 and n_class >= 1 and imbalance >= 1
+        self._size = size
+        self.n_class = n_class
+        self.shape = tuple(shape)
+        self._seed = seed
+        self._split = split
+        self._normalise = normalise
+        self.class_proportions = imbalance ** (
+            -np.arange(n_class) / max(n_class - 1, 1)
+        )
+        self.class_proportions /= self.class_proportions.sum()
+        self._cdf = np.cumsum(self.class_proportions)
+        rng = np.random.default_rng(seed)
+        self._prototypes = torch.from_numpy(
+            rng.uniform(0.25, 0.75, size=(n_class, *self.shape)).astype(np.float32)
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx) -> Tuple[torch.Tensor, int]:
+        x, y = self.get_batch([idx])
+        return x[0], int(y[0])
+
+    def get_batch(self, idxs: Sequence[int]) -> Tuple[torch.Tensor, torch.Tensor]:
+        r"""
+        Generates the points at `idxs` as a batch.
+
+        Args:
+            idxs (Sequence[int]): indices
+
+        Returns:
+            Tuple[`torch.Tensor`, `torch.Tensor`]: a batch of inputs and targets
+        """
+        keys = self._keys(idxs)
+        y = self._labels(keys)
+        noise = _uniform(self._seed, 2 * self._split, keys, int(np.prod(self.shape)))
+        noise = torch.from_numpy(noise.astype(np.float32)).view(-1, *self.shape)
+        x = self._prototypes[y] + 0.5 * (noise - 0.5)
+        if self._normalise:
+            x = (x - _MEAN) / _STD
+        return x, y
+
+    @property
+    def targets(self) -> np.ndarray:
+        # generated in chunks to bound the memory of the intermediate hashes
+        chunk = 1 << 20
+        return np.concatenate(
+            [
+                self._labels(
+                    self._keys(np.arange(i, min(i + chunk, len(self))))
+                ).numpy()
+                for i in range(0, len(self), chunk)
+            ]
+            or [np.empty(0, dtype=np.int64)]
+        )
+
+    def share_memory(self) -> "SyntheticDataset":
+        r"""
+        Nothing is stored, hence there's nothing to move to shared memory.
+
+        Returns:
+            :class:`SyntheticDataset`: `self`
+        """
+        return self
+
+    def _keys(self, idxs: Sequence[int]) -> np.ndarray:
+        idxs = np.asarray(idxs, dtype=np.int64).reshape(-1)
+        assert ((idxs >= 0) & (idxs < len(self))).all(), "Index out of range."
+        return idxs.astype(np.uint64)
+
+    def _labels(self, keys: np.ndarray) -> torch.Tensor:
+        # the labels use a different hash stream than the noise
+        u = _uniform(self._seed, 2 * self._split + 1, keys, 1)[:, 0]
+        y = np.minimum(np.searchsorted(self._cdf, u, side="right"), self.n_class - 1)
+        return torch.from_numpy(y.astype(np.int64))
@@ -169,26 +169,27 @@ class PersistentFeatureAlphaDropout(_DropoutNd):
 def _replace_dropout(parent, prefix):
     for name, mod in parent.named_children():
         if isinstance(mod, _DropoutNd):
-            kwargs = dict(p=mod.p)
-            if prefix.lower() == "persistent":
-                kwargs["inplace"] = mod.inplace
-            try:
+            base = type(mod).__name__
+            if type(mod).__module__ == __name__:
+                # a module that was already replaced, possibly with the other prefix
+                base = re.sub(r"^(Persistent|Consistent)", "", base)
+            cls = getattr(sys.modules[__name__], prefix + base, None)
+            if cls is None:
+                raise NotImplementedError(f"{base} hasn't been implemented yet.")
+            # modules that were already replaced are left as they are
+            if type(mod) is not cls:
+                kwargs = dict(p=mod.p)
+                if prefix.lower() == "persistent":
+                    kwargs["inplace"] = mod.inplace
                 # replace dropout module with one that always does dropout regardless of the model's mode
-                parent.add_module(
-                    name,
-                    getattr(sys.modules[__name__], prefix + type(mod).__name__)(
-                        **kwargs
-                    ),
-                )
-            except AttributeError:
-                raise NotImplementedError(
-                    f"{type(mod).__name__} hasn't been implemented yet."
-                )
+                parent.add_module(name, cls(**kwargs))
         _replace_dropout(mod, prefix)
 
 
 def replace_dropout(
-    module: torch.nn.Module, inplace: Optional[bool] = True
+    module: torch.nn.Module,
+    inplace: Optional[bool] = True,
+    functional: Optional[bool] = False,
 ) -> torch.nn.Module:
     r"""
     Recursively replaces dropout modules in `module` such that dropout is performed
@@ -198,13 +199,22 @@ def replace_dropout(
     Args:
         module (`torch.nn.Module`): PyTorch module object
         inplace (bool, optional): If `True`, the `model` is modified *in-place*. If `False`, `model` is not modified and a new model is cloned.
+        functional (bool, optional): If `True`, functional dropout calls in `module`'s forward pass
+            (e.g. `F.dropout`) are replaced too (see :func:`alr.modules.graph.rewrite_functional_dropout`).
+            `module` has to be traceable by :mod:`torch.fx`.
 
     Returns:
         `torch.nn.Module`: Same `module` instance if `inplace` is `False`, else a brand new module.
+        If `functional` is `True`, a new :class:`torch.fx.GraphModule` that shares the
+        (replaced) submodules of `module` is returned instead.
     """
     if not inplace:
         module = copy.deepcopy(module)
     _replace_dropout(module, prefix="Persistent")
+    if functional:
+        from alr.modules.graph import rewrite_functional_dropout
+
+        return rewrite_functional_dropout(module, prefix="Persistent")
     _inspect_forward(module)
     return module
 
@@ -215,7 +225,8 @@ def _inspect_forward(module: torch.nn.Module):
     if re.search(r".*dropout(\dd)?\(.*\).*", src):
         warnings.warn(
             "Found usage of non-module dropout in module's forward function."
-            " Please make sure that the training flag is set to True during eval mode too.",
+            " Please make sure that the training flag is set to True during eval mode too"
+            " or use functional=True to replace it.",
             UserWarning,
         )
 
@@ -317,7 +328,9 @@ class ConsistentDropout2d(_DropoutNd):
 
 
 def replace_consistent_dropout(
-    module: torch.nn.Module, inplace: Optional[bool] = True
+    module: torch.nn.Module,
+    inplace: Optional[bool] = True,
+    functional: Optional[bool] = False,
 ) -> torch.nn.Module:
     r"""
     Recursively replaces dropout modules in `module` such that dropout is performed
@@ -328,12 +341,18 @@ def replace_consistent_dropout(
     Args:
         module (`torch.nn.Module`): PyTorch module object
         inplace (bool, optional): If `True`, the `model` is modified *in-place*. If `False`, `model` is not modified and a new model is cloned.
+        functional (bool, optional): see :func:`replace_dropout`.
 
     Returns:
         `torch.nn.Module`: Same `module` instance if `inplace` is `False`, else a brand new module.
+        See :func:`replace_dropout` if `functional` is `True`.
     """
     if not inplace:
         module = copy.deepcopy(module)
     _replace_dropout(module, prefix="Consistent")
+    if functional:
+        from alr.modules.graph import rewrite_functional_dropout
+
+        return rewrite_functional_dropout(module, prefix="Consistent")
     _inspect_forward(module)
     return module
@@ -0,0 +1,91 @@
+r"""
+Evaluate a group of identically-structured modules (e.g. the members of a deep ensemble)
+in one batched call rather than one call per member.
+The main class you should be concerned with is :class:`alr.DeepEnsemble`.
+"""
+import copy
+import warnings
+from typing import Sequence, Optional
+
+import torch
+from torch import nn
+
+from alr.modules.folding import fold_weight_norm, _detached_weight_norm
+from alr.utils import _state_version
+
+try:
+    from torch.func import stack_module_state, functional_call, vmap
+except ImportError:  # torch < 2.0
+    stack_module_state = functional_call = vmap = None
+
+
+class StackedModules:
+    def __init__(self, modules: Sequence[nn.Module], vectorise: Optional[bool] = None):
+        r"""
+        Stacks the parameters and buffers of `modules` along a new leading dimension and
+        evaluates all of them at once with :func:`torch.func.vmap`: convolutions and matrix multiplications
+        are batched over the modules instead of being dispatched once per module.
+        Dropout draws different masks for each module. If vectorisation isn't available
+        (torch < 2.0) or isn't supported by one of the layers (e.g. stateful layers such as
+        consistent dropout), it falls back to calling each module in a loop.
+
+        The stacked weights are cached and automatically rebuilt when any of the
+        modules' weights are modified (e.g. by an optimiser or `load_state_dict`).
+
+        Args:
+            modules (Sequence[`nn.Module`]): modules with identical architecture. They are *not* copied.
+            vectorise (bool, optional): if false, always loop over `modules`. If `None` (default),
+                only vectorise on CUDA inputs: on CPU, the batched convolutions are slower than the loop
+                (see `test_deep_ensemble_throughput`) since there's no kernel launch overhead to amortise.
+                If a call can't be vectorised, that call falls back to the loop; later calls try again.
+        """
+        assert len(modules), "At least one module is required."
+        self.modules = list(modules)
+        self._vectorise = vectorise if vmap is not None else False
+        self._version = None
+        self._params = self._buffers = None
+        self._skeleton = None
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        r"""
+        Returns the stacked outputs of every module given input `x`.
+
+        Args:
+            x (`torch.Tensor`): input tensor
+
+        Returns:
+            `torch.Tensor`: output tensor of shape :math:`M \times N \times \ldots` where
+            :math:`M` is the number of modules.
+        """
+        vectorise = x.is_cuda if self._vectorise is None else self._vectorise
+        # batch norm can't update its running statistics when vectorised
+        if vectorise and not any(m.training for m in self.modules):
+            try:
+                return self._vectorised(x)
+            except (RuntimeError, ValueError, NotImplementedError) as e:
+                warnings.warn(
+                    f"Couldn't vectorise modules ({e}). Falling back to a loop.",
+                    UserWarning,
+                )
+        return torch.stack([m(x) for m in self.modules])
+
+    def _vectorised(self, x: torch.Tensor) -> torch.Tensor:
+        version = tuple(_state_version(m) for m in self.modules)
+        if version != self._version:
+            # weight norm has no batching rule: fold it into (copies of) the weights once
+            copies = []
+            for m in self.modules:
+                with _detached_weight_norm(m):
+                    copies.append(copy.deepcopy(m))
+                fold_weight_norm(copies[-1])
+            self._params, self._buffers = stack_module_state(copies)
+            # only the structure of the skeleton is used; its weights live in self._params
+            self._skeleton = copies[0].to("meta")
+            self._version = version
+
+        def _fwd(params, buffers, data):
+            return functional_call(self._skeleton, (params, buffers), (data,))
+
+        return vmap(_fwd, in_dims=(0, 0, None), randomness="different")(
+            self._params, self._buffers, x
+        )
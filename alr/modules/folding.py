@@ -0,0 +1,129 @@
+r"""
+Inference-time folding of reparameterised and normalisation layers. Folding is only valid
+when the model is used for inference (e.g. acquisition and evaluation): the folded model
+cannot be trained any further.
+The main function you should be concerned with is :meth:`alr.ALRModel.export`.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+
+import torch
+from torch import nn
+from torch.nn.utils import remove_weight_norm
+from torch.nn.utils.fusion import fuse_conv_bn_eval
+from torch.nn.utils.weight_norm import WeightNorm
+
+_CONVS = (nn.Conv1d, nn.Conv2d, nn.Conv3d)
+_BATCH_NORMS = (nn.BatchNorm1d, nn.BatchNorm2d, nn.BatchNorm3d)
+
+
+def fold_weight_norm(module: nn.Module) -> int:
+    r"""
+    Recursively removes :func:`torch.nn.utils.weight_norm` from `module` *in-place*
+    by computing :math:`w = g \frac{v}{\|v\|}` once and storing it as a regular parameter.
+
+    Args:
+        module (`torch.nn.Module`): PyTorch module object
+
+    Returns:
+        int: number of folded weight-normalised parameters
+    """
+    folded = 0
+    for mod in module.modules():
+        names = [
+            hook.name
+            for hook in mod._forward_pre_hooks.values()
+            if isinstance(hook, WeightNorm)
+        ]
+        for name in names:
+            remove_weight_norm(mod, name)
+            folded += 1
+    return folded
+
+
+@contextmanager
+def _detached_weight_norm(module: nn.Module):
+    # weight-normalised modules keep the last computed weight (a non-leaf tensor) as
+    # an attribute which prevents the module from being deep-copied after a forward pass
+    store = []
+    for mod in module.modules():
+        for hook in mod._forward_pre_hooks.values():
+            if isinstance(hook, WeightNorm) and hook.name in mod.__dict__:
+                store.append((mod, hook.name, mod.__dict__[hook.name]))
+                setattr(mod, hook.name, mod.__dict__[hook.name].detach())
+    try:
+        yield module
+    finally:
+        for mod, name, weight in store:
+            setattr(mod, name, weight)
+
+
+def fold_batch_norm(module: nn.Module, example_input: torch.Tensor) -> int:
+    r"""
+    Folds eval-mode batch normalisation layers into the convolution that directly precedes them.
+    Since the pairs can't be read off the module's definition, `module` is run once on
+    `example_input` and a convolution is paired with a batch norm layer only if *every*
+    output of the convolution is fed directly into the same batch norm layer.
+    The convolutions are replaced by their folded counterparts and the batch norm layers
+    are replaced by :class:`torch.nn.Identity` *in-place*.
+
+    Args:
+        module (`torch.nn.Module`): PyTorch module object in eval mode.
+        example_input (`torch.Tensor`): an input that's representative of `module`'s inputs.
+
+    Returns:
+        int: number of folded (convolution, batch norm) pairs
+
+    Warning:
+        This function assumes a convolution's output is not consumed elsewhere (e.g. a residual
+        connection) if it is consumed by a batch norm layer. :meth:`alr.ALRModel.export` verifies the
+        folded model's predictions to catch such cases.
+    """
+    assert not module.training, "Batch norm can only be folded in eval mode."
+    names = {mod: name for name, mod in module.named_modules()}
+    calls = defaultdict(int)
+    paired_calls = defaultdict(int)
+    conv_outputs = {}
+
+    def _conv_hook(mod, _, output):
+        calls[mod] += 1
+        # keep a reference to the output so its id isn't recycled
+        conv_outputs[id(output)] = (mod, output)
+
+    def _bn_hook(mod, inputs, _):
+        calls[mod] += 1
+        conv, _ = conv_outputs.get(id(inputs[0]), (None, None))
+        if conv is not None:
+            paired_calls[(conv, mod)] += 1
+
+    handles = []
+    for mod in names:
+        if isinstance(mod, _CONVS):
+            handles.append(mod.register_forward_hook(_conv_hook))
+        elif isinstance(mod, _BATCH_NORMS):
+            handles.append(mod.register_forward_hook(_bn_hook))
+    # dropout layers in the pass mustn't consume the caller's random state
+    devices = [example_input.device.index or 0] if example_input.is_cuda else []
+    try:
+        with torch.random.fork_rng(devices=devices), torch.no_grad():
+            module(example_input)
+    finally:
+        for h in handles:
+            h.remove()
+
+    folded = 0
+    for (conv, bn), n in paired_calls.items():
+        if not (n == calls[conv] == calls[bn]) or not bn.track_running_stats:
+            continue
+        _set_submodule(module, names[conv], fuse_conv_bn_eval(conv, bn))
+        _set_submodule(module, names[bn], nn.Identity())
+        folded += 1
+    return folded
+
+
+def _set_submodule(module: nn.Module, name: str, new: nn.Module):
+    *path, attr = name.split(".")
+    parent = module
+    for p in path:
+        parent = getattr(parent, p)
+    setattr(parent, attr, new)
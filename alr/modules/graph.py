@@ -0,0 +1,220 @@
+r"""
+Rewrite and split a model's computation graph around its dropout layers with :mod:`torch.fx`.
+The main methods you should be concerned with are :meth:`alr.MCDropout.feature_cache` and
+:func:`alr.modules.dropout.replace_dropout` (with `functional=True`).
+"""
+from typing import List, Optional, Tuple
+
+import torch.nn.functional as F
+from torch import nn
+from torch.nn.modules.dropout import _DropoutNd
+
+from alr.modules import dropout
+
+# functional dropout -> name of the dropout module (without the persistent/consistent prefix)
+_FUNCTIONAL_DROPOUT = {
+    F.dropout: "Dropout",
+    F.dropout2d: "Dropout2d",
+    F.dropout3d: "Dropout3d",
+    F.alpha_dropout: "AlphaDropout",
+    F.feature_alpha_dropout: "FeatureAlphaDropout",
+}
+
+
+def rewrite_functional_dropout(
+    module: nn.Module, prefix: Optional[str] = "Persistent"
+) -> nn.Module:
+    r"""
+    Replaces functional dropout calls (e.g. `F.dropout(x, p, self.training)`) in `module`'s forward pass
+    with persistent (or consistent) dropout modules. Note, every functional dropout call is
+    replaced regardless of its `training` argument.
+
+    Args:
+        module (`torch.nn.Module`): PyTorch module object that is traceable by :func:`torch.fx.symbolic_trace`
+            (i.e. no control flow that depends on the input's values). It isn't modified.
+        prefix (str, optional): either `"Persistent"` or `"Consistent"`
+
+    Returns:
+        `torch.nn.Module`: a new module (a :class:`torch.fx.GraphModule`) that shares `module`'s
+        submodules and parameters.
+
+    Raises:
+        ValueError: Occurs when the dropout probability isn't a constant.
+        NotImplementedError: Occurs when there's no `prefix` variant of the functional dropout call.
+    """
+    fx = _fx()
+    traced = _trace(module)
+    for i, n in enumerate(
+        [
+            n
+            for n in traced.graph.nodes
+            if n.op == "call_function" and n.target in _FUNCTIONAL_DROPOUT
+        ]
+    ):
+        p = n.args[1] if len(n.args) > 1 else n.kwargs.get("p", 0.5)
+        if isinstance(p, fx.Node):
+            raise ValueError(f"Dropout probability of {n.name} isn't a constant.")
+        name = prefix + _FUNCTIONAL_DROPOUT[n.target]
+        try:
+            mod = getattr(dropout, name)(p=p)
+        except AttributeError:
+            raise NotImplementedError(f"{name} hasn't been implemented yet.")
+        target = f"functional_dropout_{i}"
+        traced.add_submodule(target, mod)
+        with traced.graph.inserting_after(n):
+            new = traced.graph.call_module(target, (n.args[0],))
+        n.replace_all_uses_with(new)
+        traced.graph.erase_node(n)
+    traced.recompile()
+    return traced
+
+
+def stochastic_layers(module: nn.Module) -> List[Tuple[int, str]]:
+    r"""
+    Returns the position of the dropout layers in `module`'s computation graph.
+
+    Args:
+        module (`torch.nn.Module`): PyTorch module object that is traceable by :func:`torch.fx.symbolic_trace`.
+
+    Returns:
+        List[Tuple[int, str]]: (position of the node in the topologically sorted graph, name of the dropout module)
+        for each call of a dropout module in order of execution. Everything before the
+        first position is deterministic.
+    """
+    traced = _trace(module)
+    positions = {n: i for i, n in enumerate(traced.graph.nodes)}
+    return [(positions[n], n.target) for n in _dropout_nodes(traced)]
+
+
+def split_at_first_dropout(module: nn.Module) -> Tuple[nn.Module, nn.Module]:
+    r"""
+    Splits `module` into a deterministic prefix and a stochastic suffix such that
+    `suffix(prefix(x)) == module(x)` where the suffix starts at the first dropout layer of `module`.
+    The prefix and suffix share `module`'s submodules (and hence parameters).
+
+    Args:
+        module (`torch.nn.Module`): see :func:`split_at_last_dropout`
+
+    Returns:
+        Tuple[`torch.nn.Module`, `torch.nn.Module`]: prefix and suffix
+
+    Raises:
+        ValueError: Occurs when `module` has no dropout layers or the suffix uses values of
+            the prefix other than its output (e.g. a skip connection across the first dropout layer).
+    """
+    traced = _trace(module)
+    dropouts = _dropout_nodes(traced)
+    if not dropouts:
+        raise ValueError("Couldn't find a dropout layer to split the model at.")
+    return _split(traced, dropouts[0], [])
+
+
+def split_at_last_dropout(
+    module: nn.Module, drop_backbone_dropout: Optional[bool] = False
+) -> Tuple[nn.Module, nn.Module]:
+    r"""
+    Splits `module` into a backbone and a head such that `head(backbone(x)) == module(x)`
+    where the head starts at the last dropout layer of `module`. The backbone and head
+    share `module`'s submodules (and hence parameters).
+
+    Args:
+        module (`torch.nn.Module`): PyTorch module object that is traceable by :func:`torch.fx.symbolic_trace`
+            (i.e. no control flow that depends on the input's values). Dropout has to be used as a module,
+            not as a function (see :func:`rewrite_functional_dropout`).
+        drop_backbone_dropout (bool, optional): if true, dropout layers before the last dropout layer
+            are removed from the backbone, making it deterministic. Otherwise, a `ValueError` is raised
+            if the backbone contains dropout layers.
+
+    Returns:
+        Tuple[`torch.nn.Module`, `torch.nn.Module`]: backbone and head
+
+    Raises:
+        ValueError: Occurs when `module` has no dropout layers, the backbone contains dropout
+            layers and `drop_backbone_dropout` is false, or the head uses values of
+            the backbone other than its output (e.g. a skip connection across the last dropout layer).
+    """
+    traced = _trace(module)
+    dropouts = _dropout_nodes(traced)
+    if not dropouts:
+        raise ValueError("Couldn't find a dropout layer to split the model at.")
+    stochastic = [n for n in dropouts[:-1] if n in _ancestors(dropouts[-1].args[0])]
+    if stochastic and not drop_backbone_dropout:
+        raise ValueError(
+            f"The backbone contains dropout layers ({', '.join(n.target for n in stochastic)}) "
+            "hence its output isn't deterministic."
+        )
+    return _split(traced, dropouts[-1], stochastic)
+
+
+def _fx():
+    try:
+        from torch import fx
+    except ImportError:  # torch < 1.8
+        raise NotImplementedError("Graph rewrites require torch.fx (torch >= 1.8).")
+    return fx
+
+
+def _trace(module: nn.Module):
+    fx = _fx()
+
+    class _Tracer(fx.Tracer):
+        # keep persistent and consistent dropout layers as modules
+        def is_leaf_module(self, m: nn.Module, qualname: str) -> bool:
+            return isinstance(m, _DropoutNd) or super().is_leaf_module(m, qualname)
+
+    return fx.GraphModule(module, _Tracer().trace(module))
+
+
+def _dropout_nodes(traced) -> list:
+    modules = dict(traced.named_modules())
+    return [
+        n
+        for n in traced.graph.nodes
+        if n.op == "call_module" and isinstance(modules[n.target], _DropoutNd)
+    ]
+
+
+def _ancestors(node) -> set:
+    nodes = set()
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n not in nodes:
+            nodes.add(n)
+            stack.extend(n.all_input_nodes)
+    return nodes
+
+
+def _split(traced, split, skipped: list) -> Tuple[nn.Module, nn.Module]:
+    # splits the graph at split's input: the first part is everything that the input depends on
+    fx = _fx()
+    feature = split.args[0]
+    first_nodes = _ancestors(feature)
+    nodes = list(traced.graph.nodes)
+
+    first = fx.Graph()
+    env = {}
+    for n in nodes:
+        if n not in first_nodes:
+            continue
+        if n in skipped:
+            # skip the dropout layer
+            env[n] = env[n.args[0]]
+            continue
+        env[n] = first.node_copy(n, lambda a: env[a])
+    first.output(env[feature])
+
+    second = fx.Graph()
+    env = {feature: second.placeholder("features")}
+    for n in nodes:
+        if n in first_nodes or n.op == "placeholder":
+            continue
+        for a in n.all_input_nodes:
+            if a not in env:
+                if a.op != "get_attr":
+                    raise ValueError(
+                        f"{n.name} uses {a.name} which is computed before {split.target}."
+                    )
+                env[a] = second.node_copy(a)
+        env[n] = second.node_copy(n, lambda a: env[a])
+    return fx.GraphModule(traced, first), fx.GraphModule(traced, second)
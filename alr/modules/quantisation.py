@@ -0,0 +1,92 @@
+r"""
+Static post-training quantisation of models with dropout layers with :mod:`torch.fx`: convolutions and
+linear layers run as int8 kernels while dropout runs in fp32, so its masks are unaffected.
+The main method you should be concerned with is :meth:`alr.ALRModel.quantise`.
+"""
+from typing import Iterator, Tuple
+
+import torch
+from torch import nn
+from torch.nn.modules.conv import _ConvNd
+from torch.nn.modules.dropout import _DropoutNd
+
+from alr.modules.graph import _trace
+
+
+def prepare_static_quantisation(
+    module: nn.Module, example_input: torch.Tensor
+) -> nn.Module:
+    r"""
+    Returns `module` (in eval mode) prepared for static quantisation: convolutions are
+    fused with the following batch norm and ReLU layers, and observers are inserted to record the range
+    of every quantised layer's input and output. Dropout layers are not quantised: their input is
+    dequantised and their output is quantised again (i.e. they are wrapped in `DeQuantStub` and `QuantStub`).
+    Calibrate the copy by calling it on representative inputs (e.g. the labelled set) and
+    then convert it with :func:`convert_static_quantisation`.
+
+    Args:
+        module (`torch.nn.Module`): module with dropout layers. It has to be traceable by :mod:`torch.fx`
+            (dropout layers are not traced through).
+        example_input (`torch.Tensor`): an input of `module`
+
+    Returns:
+        `torch.nn.Module`: prepared module. It shares its layers with `module`, which shouldn't be used anymore.
+    """
+    quantization, quantize_fx, custom_config = _ao()
+    traced = _trace(module)
+    # quantised convolutions return channels-last tensors, which can't be viewed
+    for node in traced.graph.nodes:
+        if node.op == "call_method" and node.target == "view":
+            node.target = "reshape"
+    traced.recompile()
+    dropouts = list({type(m) for m in traced.modules() if isinstance(m, _DropoutNd)})
+    qconfig_mapping = quantization.get_default_qconfig_mapping(
+        torch.backends.quantized.engine
+    )
+    for cls in dropouts:
+        qconfig_mapping.set_object_type(cls, None)
+    return quantize_fx.prepare_fx(
+        traced.eval(),
+        qconfig_mapping,
+        (example_input,),
+        custom_config.PrepareCustomConfig().set_non_traceable_module_classes(dropouts),
+    )
+
+
+def convert_static_quantisation(module: nn.Module) -> nn.Module:
+    r"""
+    Converts a module that was prepared with :func:`prepare_static_quantisation` (and calibrated)
+    to a quantised module.
+
+    Args:
+        module (`torch.nn.Module`): prepared and calibrated module
+
+    Returns:
+        `torch.nn.Module`: quantised module. It only runs on CPU.
+    """
+    return _ao()[1].convert_fx(module)
+
+
+def _ao():
+    try:
+        from torch.ao import quantization
+        from torch.ao.quantization import quantize_fx
+        from torch.ao.quantization.fx import custom_config
+    except ImportError:  # torch < 1.13
+        raise NotImplementedError(
+            "Static quantisation requires torch.ao.quantization (torch >= 1.13)."
+        )
+    return quantization, quantize_fx, custom_config
+
+
+def _conv_modules(
+    module: nn.Module, prefix: str = ""
+) -> Iterator[Tuple[str, nn.Module]]:
+    # the outermost submodules (not containers) that have convolutions
+    for name, child in module.named_children():
+        if not any(isinstance(m, _ConvNd) for m in child.modules()):
+            continue
+        if isinstance(child, (nn.ModuleList, nn.ModuleDict)):
+            yield from _conv_modules(child, prefix + name + ".")
+        else:
+            yield prefix + name, child
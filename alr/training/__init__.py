@@ -1,8 +1,20 @@
 from alr.training.supervised_trainer import Trainer
+from alr.training.utils import WarmStart
+from alr.training.lean_engine import LeanEngine, create_lean_trainer
+from alr.training.post_round import PostRoundPipeline
 from alr.training.pseudo_label_trainer import (
     VanillaPLTrainer,
     soft_cross_entropy,
     soft_nll_loss,
 )
 
-__all__ = ["Trainer", "VanillaPLTrainer", "soft_cross_entropy", "soft_nll_loss"]
+__all__ = [
+    "Trainer",
+    "VanillaPLTrainer",
+    "WarmStart",
+    "LeanEngine",
+    "create_lean_trainer",
+    "PostRoundPipeline",
+    "soft_cross_entropy",
+    "soft_nll_loss",
+]
@@ -1,10 +1,23 @@
+import importlib
 from pathlib import Path
 import pickle
 from typing import Optional
-from matplotlib import cm
-import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib as mpl
+
+
+class _LazyModule:
+    # imports the module on first attribute access: matplotlib is slow to import
+    # and only needed when something is plotted
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+cm = _LazyModule("matplotlib.cm")
+plt = _LazyModule("matplotlib.pyplot")
+mpl = _LazyModule("matplotlib")
 
 
 def jitter(x):
@@ -2,7 +2,12 @@ from collections import defaultdict
 
 from alr import ALRModel
 from alr.data import RelabelDataset, PseudoLabelDataset, UnlabelledDataset
-from alr.training.utils import EarlyStopper, PLPredictionSaver
+from alr.training.utils import (
+    EarlyStopper,
+    PLPredictionSaver,
+    WarmStart,
+    create_evaluator,
+)
 from alr.utils._type_aliases import _DeviceType, _Loss_fn
 from typing import Optional, Callable, Union
 
@@ -11,7 +16,6 @@ import torch
 from torch import nn
 import torch.utils.data as torchdata
 from ignite.engine import create_supervised_evaluator, Events, Engine
-from ignite.metrics import Accuracy, Loss
 from alr.training.progress_bar.ignite_progress_bar import ProgressBar
 from alr.training import Trainer
 from alr.training.samplers import MinLabelledSampler, RandomFixedLengthSampler
@@ -223,6 +227,7 @@ def create_pseudo_label_trainer(
     lr_scheduler_kwargs: Optional[dict] = None,
     device: _DeviceType = None,
     *args,
+    warm_start: Optional[WarmStart] = None,
     **kwargs,
 ):
     assert (
@@ -230,7 +235,9 @@ def create_pseudo_label_trainer(
     ), "rfls_len and min_labelled are mutually exclusive"
 
     def _step(engine: Engine, _):
-        model.reset_weights()
+        # a warm start continues from the previous step's weights
+        if warm_start is None or not warm_start.rounds:
+            model.reset_weights()
         # update loader accordingly: if pld is not none, concatenate them
         new_loader = train_loader
         pld = engine.state.pseudo_labelled_dataset
@@ -266,6 +273,7 @@ def create_pseudo_label_trainer(
             new_loader,
             val_loader=val_loader,
             epochs=epochs,
+            warm_start=warm_start,
         )
 
         # if early stopping was applied w/ patience, then the actual train acc and loss should be
@@ -332,6 +340,7 @@ class EphemeralTrainer:
         val_loader: Optional[torchdata.DataLoader] = None,
         iterations: Optional[int] = 1,
         epochs: Optional[int] = 1,
+        warm_start: Optional[WarmStart] = None,
     ):
         if self._patience:
             if isinstance(self._patience, int):
@@ -345,11 +354,7 @@ class EphemeralTrainer:
                 "If patience is specified, then val_loader must be provided in .fit()."
             )
 
-        val_evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._loss)},
-            device=self._device,
-        )
+        val_evaluator = create_evaluator(self._model, self._loss, self._device)
 
         history = defaultdict(list)
         pbar = ProgressBar(desc=lambda _: "Ephemeral")
@@ -401,6 +406,7 @@ class EphemeralTrainer:
             lr_scheduler_kwargs=self._lr_scheduler_kwargs,
             device=self._device,
             *self._args,
+            warm_start=warm_start,
             **self._kwargs,
         )
         # output of trainer are running averages of train_loss and train_acc (from the
@@ -428,9 +434,5 @@ class EphemeralTrainer:
         return history
 
     def evaluate(self, data_loader: torchdata.DataLoader) -> dict:
-        evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._loss)},
-            device=self._device,
-        )
+        evaluator = create_evaluator(self._model, self._loss, self._device)
         return evaluator.run(data_loader).metrics
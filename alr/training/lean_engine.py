@@ -0,0 +1,146 @@
+r"""
+A low-overhead training loop for small models, where ignite's per-iteration event dispatch,
+metric updates, and `loss.item()` cost about as much as the forward and backward passes.
+The main function you should be concerned with is :func:`create_lean_trainer`.
+"""
+from typing import Callable, List, Optional, Tuple
+
+import torch
+from torch import nn
+from ignite.engine import Engine, Events, State
+
+from alr.utils._type_aliases import _DeviceType, _Loss_fn
+
+__all__ = ["LeanEngine", "create_lean_trainer"]
+
+
+class LeanEngine(Engine):
+    def __init__(
+        self,
+        process_function: Callable[
+            [Engine, tuple], Tuple[torch.Tensor, torch.Tensor, int]
+        ],
+        log_interval: Optional[int] = 50,
+    ):
+        r"""
+        A drop-in replacement of a supervised trainer :class:`ignite.engine.Engine` that only fires
+        `STARTED`, `EPOCH_STARTED`, `EPOCH_COMPLETED`, and `COMPLETED`: handlers of iteration events
+        are never called. `process_function` returns the batch's (detached) mean loss, number of
+        correct predictions, and size. These are accumulated on the device and only read back
+        every `log_interval` iterations (to update `state.metrics` and call the log handlers, see
+        :meth:`add_log_handler`) and at the end of every epoch, before the `EPOCH_COMPLETED` handlers
+        are called. The metrics are `train_loss` and `train_acc`, the means over the epoch so far
+        (instead of the running averages of :class:`ignite.metrics.RunningAverage`).
+
+        Args:
+            process_function (Callable): takes the engine and a batch, and returns
+                `(loss, correct, batch_size)`
+            log_interval (int, optional): number of iterations between host synchronisations
+                within an epoch. If `None`, the metrics are only read at the end of every epoch.
+        """
+        super(LeanEngine, self).__init__(process_function)
+        self.log_interval = log_interval
+        self._log_handlers: List[Callable[[Engine], None]] = []
+
+    def add_log_handler(self, handler: Callable[[Engine], None]) -> None:
+        r"""
+        Calls `handler` with this engine every `log_interval` iterations (after `state.metrics`
+        is updated), e.g. to update a progress bar.
+
+        Args:
+            handler (Callable): takes the engine
+
+        Returns:
+            NoneType: None
+        """
+        self._log_handlers.append(handler)
+
+    def run(self, data, max_epochs: Optional[int] = 1) -> State:
+        r"""
+        Runs the training loop over `data` for at most `max_epochs` epochs
+        (less if the engine is terminated, e.g. by early stopping).
+
+        Args:
+            data (Iterable): training data, e.g. a :class:`torch.utils.data.DataLoader`
+            max_epochs (int, optional): maximum number of epochs
+
+        Returns:
+            `ignite.engine.State`: the engine's state
+        """
+        self.state = State(
+            dataloader=data, epoch_length=len(data), max_epochs=max_epochs
+        )
+        self.should_terminate = False
+        self._fire_event(Events.STARTED)
+        while self.state.epoch < max_epochs and not self.should_terminate:
+            self.state.epoch += 1
+            self._fire_event(Events.EPOCH_STARTED)
+            totals, n = None, 0
+            for i, batch in enumerate(data, 1):
+                self.state.iteration += 1
+                self.state.batch = batch
+                loss, correct, size = self._process_function(self, batch)
+                batch_totals = torch.stack([loss * size, correct.to(loss.dtype)])
+                totals = batch_totals if totals is None else totals + batch_totals
+                n += size
+                if self.log_interval and i % self.log_interval == 0:
+                    self._update_metrics(totals, n)
+                    for handler in self._log_handlers:
+                        handler(self)
+            self.state.batch = None
+            if n:
+                self._update_metrics(totals, n)
+            self._fire_event(Events.EPOCH_COMPLETED)
+        self._fire_event(Events.COMPLETED)
+        return self.state
+
+    def _update_metrics(self, totals: torch.Tensor, n: int) -> None:
+        # the only host synchronisation
+        loss, correct = totals.tolist()
+        self.state.metrics["train_loss"] = loss / n
+        self.state.metrics["train_acc"] = correct / n
+
+
+def create_lean_trainer(
+    model: nn.Module,
+    optimizer: torch.optim.Optimizer,
+    loss_fn: _Loss_fn,
+    device: _DeviceType = None,
+    log_interval: Optional[int] = 50,
+) -> LeanEngine:
+    r"""
+    The counterpart of :func:`ignite.engine.create_supervised_trainer` (with `train_loss` and
+    `train_acc` metrics) that returns a :class:`LeanEngine`. The model is put in training mode
+    at the start of every epoch rather than every iteration, so `EPOCH_COMPLETED` handlers can
+    evaluate it without restoring its mode.
+
+    Args:
+        model (`torch.nn.Module`): model
+        optimizer (`torch.optim.Optimizer`): optimiser
+        loss_fn (Callable): loss function, e.g. `F.nll_loss`
+        device (str, None, torch.device): device type
+        log_interval (int, optional): see :class:`LeanEngine`
+
+    Returns:
+        :class:`LeanEngine`: trainer
+    """
+    if device is not None:
+        model.to(device)
+
+    def _step(_, batch):
+        x, y = batch
+        if device is not None:
+            x = x.to(device, non_blocking=True)
+            y = y.to(device, non_blocking=True)
+        optimizer.zero_grad()
+        preds = model(x)
+        loss = loss_fn(preds, y)
+        loss.backward()
+        optimizer.step()
+        with torch.no_grad():
+            correct = (preds.argmax(dim=-1) == y).sum()
+        return loss.detach(), correct, len(y)
+
+    trainer = LeanEngine(_step, log_interval=log_interval)
+    trainer.add_event_handler(Events.EPOCH_STARTED, lambda _: model.train())
+    return trainer
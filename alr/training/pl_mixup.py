@@ -3,16 +3,21 @@ from torch.optim.lr_scheduler import ReduceLROnPlateau
 from alr.training.progress_bar.ignite_progress_bar import ProgressBar
 from alr.training.samplers import RandomFixedLengthSampler, MinLabelledSampler
 import torch.utils.data as torchdata
+from torch.utils.data.dataloader import default_collate
 import torch
 from typing import Optional, Tuple, Callable, Union
 from torch import nn
 from alr.utils._type_aliases import _DeviceType
-from alr.training.utils import EarlyStopper, PLPredictionSaver
+from alr.training.utils import (
+    DeviceTensors,
+    EarlyStopper,
+    PLPredictionSaver,
+    create_evaluator,
+)
 from alr.utils import _map_device
 import numpy as np
 from contextlib import contextmanager
 from ignite.engine import Engine, Events, create_supervised_evaluator
-from ignite.metrics import Accuracy, Loss
 from torch.nn import functional as F
 from enum import Enum
 
@@ -77,6 +82,11 @@ class PseudoLabelledDataset(torchdata.Dataset):
     def __len__(self):
         return len(self.dataset)
 
+    def get_batch(self, idxs):
+        # see alr.data.get_batch. Augmentations work on one (raw) image at a time,
+        # so the points are fetched one by one
+        return default_collate([self[int(i)] for i in idxs])
+
     @contextmanager
     def original_labels(self):
         if not self._original_labels:
@@ -305,12 +315,13 @@ class PLMixupTrainer:
             transform=self._train_transform,
             augmentation=self._data_augmentation,
         )
-        val = PseudoLabelledDataset(
-            val,
-            mark=DataMarker.LABELLED,
-            transform=self._test_transform,
-        )
-        val._with_metadata = False
+        if not isinstance(val, DeviceTensors):
+            val = PseudoLabelledDataset(
+                val,
+                mark=DataMarker.LABELLED,
+                transform=self._test_transform,
+            )
+            val._with_metadata = False
         train_loader = torchdata.DataLoader(
             train,
             batch_size=self._batch_size,
@@ -320,18 +331,19 @@ class PLMixupTrainer:
         pool_loader = torchdata.DataLoader(
             pool, batch_size=512, shuffle=False, **self._loader_kwargs
         )
-        val_loader = torchdata.DataLoader(
-            val, batch_size=512, shuffle=False, **self._loader_kwargs
+        # pre-materialised (transformed) validation tensors are evaluated as they are
+        val_loader = (
+            val
+            if isinstance(val, DeviceTensors)
+            else torchdata.DataLoader(
+                val, batch_size=512, shuffle=False, **self._loader_kwargs
+            )
         )
         pbar = ProgressBar(desc=lambda _: "Stage 1")
 
         # warm up
         with train.no_fluff():
-            val_eval = create_supervised_evaluator(
-                self._model,
-                metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-                device=self._device,
-            )
+            val_eval = create_evaluator(self._model, F.nll_loss, self._device)
             trainer = create_warmup_trainer(
                 self._model,
                 optimiser=optimiser,
@@ -385,11 +397,7 @@ class PLMixupTrainer:
             ),
             **self._loader_kwargs,
         )
-        val_eval = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-            device=self._device,
-        )
+        val_eval = create_evaluator(self._model, F.nll_loss, self._device)
         optimiser = self._instantiate_optimiser()
         scheduler = ReduceLROnPlateau(
             optimiser,
@@ -453,11 +461,7 @@ class PLMixupTrainer:
         return history
 
     def evaluate(self, data_loader: torchdata.DataLoader) -> dict:
-        evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-            device=self._device,
-        )
+        evaluator = create_evaluator(self._model, F.nll_loss, self._device)
         return evaluator.run(data_loader).metrics
 
 
@@ -583,6 +587,10 @@ class _WithTransform(torchdata.Dataset):
         # (x,) only
         return self._transform(self._dataset[idx])
 
+    def get_batch(self, idxs):
+        # see alr.data.get_batch. transform works on one point at a time
+        return default_collate([self[int(i)] for i in idxs])
+
     def __len__(self):
         return len(self._dataset)
 
@@ -11,16 +11,22 @@ from alr.training.pl_mixup import (
     create_warmup_trainer,
     DataMarker,
 )
-from alr.training.utils import EarlyStopper, PerformanceTracker
+from alr.training.utils import (
+    DeviceTensors,
+    EarlyStopper,
+    PerformanceTracker,
+    create_evaluator,
+)
 from alr.utils._type_aliases import _DeviceType
 from alr.training.samplers import RandomFixedLengthSampler, MinLabelledSampler
 from alr.utils import _map_device
+from alr.modules.ensemble import StackedModules
+from alr.utils.snapshot import SnapshotStore
 from torch import nn
 from torch.nn import functional as F
 import torch
 
-from ignite.engine import create_supervised_evaluator, Events
-from ignite.metrics import Accuracy, Loss
+from ignite.engine import Events
 
 from pathlib import Path
 
@@ -93,12 +99,13 @@ class PLMixupEnsembleTrainer:
             transform=self._train_transform,
             augmentation=self._data_augmentation,
         )
-        val = PseudoLabelledDataset(
-            val,
-            mark=DataMarker.LABELLED,
-            transform=self._test_transform,
-        )
-        val._with_metadata = False
+        if not isinstance(val, DeviceTensors):
+            val = PseudoLabelledDataset(
+                val,
+                mark=DataMarker.LABELLED,
+                transform=self._test_transform,
+            )
+            val._with_metadata = False
         train_loader = torchdata.DataLoader(
             train,
             batch_size=self._batch_size,
@@ -108,8 +115,13 @@ class PLMixupEnsembleTrainer:
         pool_loader = torchdata.DataLoader(
             pool, batch_size=512, shuffle=False, **self._loader_kwargs
         )
-        val_loader = torchdata.DataLoader(
-            val, batch_size=512, shuffle=False, **self._loader_kwargs
+        # pre-materialised (transformed) validation tensors are evaluated as they are
+        val_loader = (
+            val
+            if isinstance(val, DeviceTensors)
+            else torchdata.DataLoader(
+                val, batch_size=512, shuffle=False, **self._loader_kwargs
+            )
         )
 
         models = self._models
@@ -124,11 +136,7 @@ class PLMixupEnsembleTrainer:
         with train.no_fluff():
             for idx, (m, o) in enumerate(zip(models, optimisers)):
                 print(f"\tTraining model {idx + 1} of {len(models)}")
-                val_eval = create_supervised_evaluator(
-                    m,
-                    metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-                    device=self._device,
-                )
+                val_eval = create_evaluator(m, F.nll_loss, self._device)
                 trainer = create_warmup_trainer(
                     m,
                     optimiser=o,
@@ -199,11 +207,7 @@ class PLMixupEnsembleTrainer:
 
                 # get val acc for model m
                 metrics = (
-                    create_supervised_evaluator(
-                        m,
-                        metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-                        device=self._device,
-                    )
+                    create_evaluator(m, F.nll_loss, self._device)
                     .run(val_loader)
                     .metrics
                 )
@@ -250,11 +254,7 @@ class PLMixupEnsembleTrainer:
         ensemble = Ensemble(
             self._models, return_log=True
         )  # return_log=True for the loss function
-        evaluator = create_supervised_evaluator(
-            ensemble,
-            metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)},
-            device=self._device,
-        )
+        evaluator = create_evaluator(ensemble, F.nll_loss, self._device)
         return evaluator.run(data_loader).metrics
 
 
@@ -263,6 +263,7 @@ class Ensemble:
         # assumes models return log-softmax probabilities
         self.models = models
         self.return_log = return_log
+        self._stacked = StackedModules(models)
 
     def forward(self, x):
         if self.return_log:
@@ -270,12 +271,11 @@ class Ensemble:
         return self.get_preds(x).mean(dim=0)
 
     def get_preds(self, x):
-        preds = []
         with torch.no_grad():
             for m in self.models:
                 m.eval()
-                preds.append(m(x).exp())
-        return torch.stack(preds)
+            # all members are evaluated in one batched call
+            return self._stacked(x).exp()
 
     def evaluate(self, loader, device):
         with torch.no_grad():
@@ -297,9 +297,14 @@ class Ensemble:
         # should never ever be in training mode
         assert not mode
 
-    def save_weights(self, prefix: str):
+    def save_weights(self, prefix: str, store: Optional[SnapshotStore] = None):
+        # if store is provided, the weights are kept as compressed, de-duplicated
+        # snapshots named "{prefix}_model_{mi}" instead of separate files
         for mi, m in enumerate(self.models, 1):
-            torch.save(m.state_dict(), f"{prefix}_model_{mi}.pt")
+            if store is not None:
+                store.save(f"{prefix}_model_{mi}", m.state_dict())
+            else:
+                torch.save(m.state_dict(), f"{prefix}_model_{mi}.pt")
 
 
 def plmixup_train(loader, model, optimiser, alpha, device):
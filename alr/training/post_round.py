@@ -0,0 +1,189 @@
+r"""
+Runs the end-of-round reporting of an active learning loop (test evaluation, calibration metrics,
+saving weights and metrics) on a background thread, so the next round's acquisition and
+training don't wait for it.
+The main class you should be concerned with is :class:`PostRoundPipeline`.
+"""
+import copy
+import os
+import pickle
+import queue
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import torch
+from torch import nn
+
+from alr.utils._type_aliases import _DeviceType
+
+__all__ = ["PostRoundPipeline"]
+
+# sentinel that stops the worker
+_STOP = object()
+
+
+class PostRoundPipeline:
+    def __init__(self, max_pending: Optional[int] = 2, device: _DeviceType = "cpu"):
+        r"""
+        A background worker that runs submitted jobs one at a time, in order. At most
+        `max_pending` jobs wait in its queue: :meth:`submit` blocks while the queue is full
+        (back-pressure), so a slow reporting step can't accumulate unbounded snapshots and
+        results in memory. Jobs evaluate immutable copies of the model taken with :meth:`snapshot`,
+        hence training can carry on (or the weights can be reset) while they run.
+
+        If a job raises an exception, it's re-raised by the next call to :meth:`submit`, :meth:`dump`,
+        or :meth:`wait` (and on exiting the `with` block).
+
+        Examples:
+            .. code:: python
+
+                with PostRoundPipeline() as post:
+                    for i in range(1, ITERS + 1):
+                        model.reset_weights()
+                        history = trainer.fit(train_loader, val_loader, epochs=EPOCHS)
+                        test_metrics = trainer.evaluate(test_loader)
+                        accs[dm.n_labelled].append(test_metrics["acc"])
+
+                        snapshot = post.snapshot(model)
+                        post.submit(calc_calib_metrics, pool_loader, snapshot, pool_dir / f"iter_{i}", "cpu")
+                        post.dump(snapshot.state_dict(), saved_models / f"iter_{i}.pt")
+                        post.dump(accs, template + "_accs.pkl")
+
+                        dm.acquire(b=b)
+
+        Args:
+            max_pending (int, optional): maximum number of queued jobs (excluding the one that's running)
+            device (str, None, torch.device): device that the snapshots are moved to
+        """
+        assert max_pending >= 1
+        self._device = device
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def snapshot(self, model: nn.Module) -> nn.Module:
+        r"""
+        Returns a copy of `model` on the pipeline's device in evaluation mode, without gradients.
+        Snapshots kept by :class:`alr.ALRModel` (see :meth:`alr.ALRModel.snap`) aren't copied.
+
+        Args:
+            model (`torch.nn.Module`): model
+
+        Returns:
+            `torch.nn.Module`: copy of `model`
+        """
+        memo = {}
+        for attr in ("_snapshot", "_snapshot_store"):
+            if getattr(model, attr, None) is not None:
+                memo[id(getattr(model, attr))] = None
+        copied = copy.deepcopy(model, memo).to(self._device)
+        copied.eval()
+        for p in copied.parameters():
+            p.requires_grad_(False)
+        return copied
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        r"""
+        Queues `fn(*args, **kwargs)`, blocking while the queue is full. The arguments must not be
+        modified after they're submitted: use :meth:`snapshot` for models and copies for anything
+        else that changes (:meth:`dump` copies its argument).
+
+        Args:
+            fn (Callable): job
+            *args (Any): positional arguments of `fn`
+            **kwargs (Any): keyword arguments of `fn`
+
+        Returns:
+            :class:`concurrent.futures.Future`: the result of the job
+        """
+        self._raise()
+        if not self._worker.is_alive():
+            raise RuntimeError("The pipeline has been closed.")
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def dump(self, obj: Any, path: Union[str, Path]) -> Future:
+        r"""
+        Writes a copy of `obj` to `path` in the background: with :func:`torch.save` if the suffix
+        is `.pt` or `.pth`, otherwise with :mod:`pickle`. The file is written to a temporary
+        file first and renamed once it's complete.
+
+        Args:
+            obj (Any): object (copied before this method returns)
+            path (str, `Path`): output file
+
+        Returns:
+            :class:`concurrent.futures.Future`: completes when the file is written
+        """
+        return self.submit(_write, copy.deepcopy(obj), Path(path))
+
+    def wait(self) -> None:
+        r"""
+        Blocks until every submitted job has finished.
+
+        Returns:
+            NoneType: None
+        """
+        self._queue.join()
+        self._raise()
+
+    def close(self) -> None:
+        r"""
+        Waits for the submitted jobs and stops the worker.
+
+        Returns:
+            NoneType: None
+        """
+        if self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join()
+        self._raise()
+
+    def __enter__(self) -> "PostRoundPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif self._worker.is_alive():
+            # don't mask the original exception
+            self._queue.put(_STOP)
+            self._worker.join()
+
+    def _raise(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                future, fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+                    if self._error is None:
+                        self._error = e
+            finally:
+                self._queue.task_done()
+
+
+def _write(obj: Any, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    if path.suffix in {".pt", ".pth"}:
+        torch.save(obj, str(tmp))
+    else:
+        with open(tmp, "wb") as fp:
+            pickle.dump(obj, fp)
+    os.replace(tmp, path)
@@ -22,9 +22,13 @@ class ProgressBar:
     def attach(self, engine: ignite.engine.Engine):
         engine.add_event_handler(ignite.engine.Events.EPOCH_STARTED, self.on_start)
         engine.add_event_handler(ignite.engine.Events.EPOCH_COMPLETED, self.on_complete)
-        engine.add_event_handler(
-            ignite.engine.Events.ITERATION_COMPLETED, self.on_iteration_complete
-        )
+        if hasattr(engine, "add_log_handler"):
+            # LeanEngine: there are no iteration events
+            engine.add_log_handler(self.on_iteration_complete)
+        else:
+            engine.add_event_handler(
+                ignite.engine.Events.ITERATION_COMPLETED, self.on_iteration_complete
+            )
 
     def on_start(self, engine):
         dataloader = engine.state.dataloader
@@ -11,7 +11,12 @@ from torch import nn
 
 from alr.data import UnlabelledDataset
 from alr.training import Trainer
-from alr.training.utils import EarlyStopper, PLPredictionSaver
+from alr.training.utils import (
+    EarlyStopper,
+    PLPredictionSaver,
+    WarmStart,
+    create_evaluator,
+)
 from alr.utils import _map_device
 from alr.utils.math import cross_entropy
 from alr.utils._type_aliases import _DeviceType, _Loss_fn
@@ -238,6 +243,7 @@ class VanillaPLTrainer:
         pool_loader: torchdata.DataLoader,
         val_loader: Optional[torchdata.DataLoader] = None,
         epochs: Union[int, Sequence[int]] = 1,
+        warm_start: Optional[WarmStart] = None,
     ) -> Dict[str, Dict[str, list]]:
         if self._track_pl_metrics is not None and (
             not isinstance(pool_loader.dataset, UnlabelledDataset)
@@ -291,6 +297,7 @@ class VanillaPLTrainer:
             val_loader,
             epochs=epoch1,
             callbacks=callbacks,
+            warm_start=warm_start,
         )
 
         # stage 2
@@ -301,11 +308,7 @@ class VanillaPLTrainer:
             metrics={"acc": Accuracy(), "loss": Loss(self._lloss)},
             device=self._device,
         )
-        val_evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._lloss)},
-            device=self._device,
-        )
+        val_evaluator = create_evaluator(self._model, self._lloss, self._device)
 
         def _log_metrics(engine: Engine):
             # engine = ssl engine with `pl_tracker`
@@ -371,9 +374,5 @@ class VanillaPLTrainer:
         }
 
     def evaluate(self, data_loader: torchdata.DataLoader) -> dict:
-        evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._lloss)},
-            device=self._device,
-        )
+        evaluator = create_evaluator(self._model, self._lloss, self._device)
         return evaluator.run(data_loader).metrics
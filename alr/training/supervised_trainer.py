@@ -1,12 +1,14 @@
+import copy
+import time
+
 import torch
 from torch import nn
 from ignite.engine import (
     Engine,
     Events,
-    create_supervised_evaluator,
     create_supervised_trainer,
 )
-from ignite.metrics import Loss, Accuracy, RunningAverage
+from ignite.metrics import Accuracy, RunningAverage
 import torch.utils.data as torchdata
 from alr.training.progress_bar.ignite_progress_bar import ProgressBar
 from ignite.contrib.handlers.param_scheduler import LRScheduler
@@ -16,7 +18,8 @@ from collections import defaultdict
 from typing import Optional, Dict, Callable, Sequence
 
 from alr.utils._type_aliases import _DeviceType, _Loss_fn
-from alr.training.utils import EarlyStopper
+from alr.training.utils import EarlyStopper, WarmStart, create_evaluator
+from alr.training.lean_engine import create_lean_trainer
 
 
 class Trainer:
@@ -63,6 +66,7 @@ class Trainer:
         self._model = model
         self._lr_scheduler = lr_scheduler
         lr_scheduler_kwargs = {} if lr_scheduler_kwargs is None else lr_scheduler_kwargs
+        self._lr_scheduler_kwargs = lr_scheduler_kwargs
         if lr_scheduler is not None:
             self._lr_scheduler = getattr(torch.optim.lr_scheduler, lr_scheduler)(
                 self._optim, **lr_scheduler_kwargs
@@ -74,20 +78,46 @@ class Trainer:
         val_loader: Optional[torchdata.DataLoader] = None,
         epochs: Optional[int] = 1,
         callbacks: Optional[Sequence[Callable]] = None,
+        warm_start: Optional[WarmStart] = None,
+        lean: Optional[bool] = False,
     ) -> Dict[str, list]:
-        if self._patience and val_loader is None:
+        r"""
+        Trains the model.
+
+        Args:
+            train_loader (`torch.utils.data.DataLoader`): training data
+            val_loader (`torch.utils.data.DataLoader`, optional): validation data (required with patience).
+                A :class:`alr.training.utils.DeviceTensors` is evaluated without a data loader.
+            epochs (int, optional): maximum number of epochs
+            callbacks (Sequence[Callable], optional): called with the trainer engine at the end of every epoch
+            warm_start (:class:`alr.training.utils.WarmStart`, optional): warm-start policy; a new round
+                is started every time this method is called. The policy's warm patience replaces
+                this trainer's patience in warm rounds.
+            lean (bool, optional): if true, train with a :class:`alr.training.lean_engine.LeanEngine`
+                (no iteration events, metrics accumulated on the device). The training accuracy and
+                loss are then the means over each epoch instead of running averages.
+
+        Returns:
+            Dict[str, list]: training (and validation) accuracy and loss of every epoch
+        """
+        patience = self._patience
+        if warm_start is not None:
+            warm_start.start_round(self._model)
+            patience = warm_start.patience(patience)
+        if patience and val_loader is None:
             raise ValueError(
                 "If patience is specified, then val_loader must be provided in .fit()."
             )
+        if warm_start is not None and warm_start.compare and val_loader is None:
+            raise ValueError(
+                "If warm_start.compare is true, then val_loader must be provided in .fit()."
+            )
+        start = time.perf_counter()
 
         pbar = ProgressBar(desc=lambda _: "Training")
         history = defaultdict(list)
 
-        val_evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._loss)},
-            device=self._device,
-        )
+        val_evaluator = create_evaluator(self._model, self._loss, self._device)
 
         def _log_metrics(engine: Engine):
             # moving averages
@@ -115,26 +145,32 @@ class Trainer:
                 f"\tval acc = {metrics['acc']}, val loss = {metrics['loss']}"
             )
 
-        trainer = create_supervised_trainer(
-            self._model,
-            optimizer=self._optim,
-            loss_fn=self._loss,
-            device=self._device,
-            output_transform=lambda x, y, y_pred, loss: (loss.item(), y_pred, y),
-        )
+        if lean:
+            trainer = create_lean_trainer(
+                self._model, self._optim, self._loss, device=self._device
+            )
+            pbar.log_interval = trainer.log_interval
+        else:
+            trainer = create_supervised_trainer(
+                self._model,
+                optimizer=self._optim,
+                loss_fn=self._loss,
+                device=self._device,
+                output_transform=lambda x, y, y_pred, loss: (loss.item(), y_pred, y),
+            )
+            RunningAverage(Accuracy(output_transform=lambda x: (x[1], x[2]))).attach(
+                trainer, "train_acc"
+            )
+            RunningAverage(output_transform=lambda x: x[0]).attach(
+                trainer, "train_loss"
+            )
         pbar.attach(trainer)
         if self._lr_scheduler is not None:
             scheduler = LRScheduler(self._lr_scheduler)
             trainer.add_event_handler(Events.EPOCH_COMPLETED, scheduler)
-        RunningAverage(Accuracy(output_transform=lambda x: (x[1], x[2]))).attach(
-            trainer, "train_acc"
-        )
-        RunningAverage(output_transform=lambda x: x[0]).attach(trainer, "train_loss")
 
-        if val_loader is not None and self._patience:
-            es = EarlyStopper(
-                self._model, self._patience, trainer, key="acc", mode="max"
-            )
+        if val_loader is not None and patience:
+            es = EarlyStopper(self._model, patience, trainer, key="acc", mode="max")
             es.attach(val_evaluator)
         trainer.add_event_handler(Events.EPOCH_COMPLETED, _log_metrics)
         if callbacks is not None:
@@ -145,14 +181,57 @@ class Trainer:
             train_loader,
             max_epochs=epochs,
         )
-        if val_loader is not None and self._patience and self._reload_best:
+        if val_loader is not None and patience and self._reload_best:
             es.reload_best()
+        if warm_start is not None and warm_start.compare and warm_start.warm:
+            warm = (
+                self.evaluate(val_loader)["acc"],
+                time.perf_counter() - start,
+                len(history["train_loss"]),
+            )
+            self._compare_cold_start(
+                warm_start, warm, train_loader, val_loader, epochs, pbar, lean
+            )
         return history
 
-    def evaluate(self, data_loader: torchdata.DataLoader) -> dict:
-        evaluator = create_supervised_evaluator(
-            self._model,
-            metrics={"acc": Accuracy(), "loss": Loss(self._loss)},
-            device=self._device,
+    def _compare_cold_start(
+        self,
+        warm_start: WarmStart,
+        warm: tuple,
+        train_loader: torchdata.DataLoader,
+        val_loader: torchdata.DataLoader,
+        epochs: int,
+        pbar: ProgressBar,
+        lean: bool,
+    ) -> None:
+        # trains a copy from the initial weights with the same hyperparameters
+        cold = copy.copy(self)
+        cold._model = warm_start.cold_copy(self._model)
+        cold._optim = type(self._optim)(
+            cold._model.parameters(), **self._optim.defaults
+        )
+        if self._lr_scheduler is not None:
+            cold._lr_scheduler = type(self._lr_scheduler)(
+                cold._optim, **self._lr_scheduler_kwargs
+            )
+        start = time.perf_counter()
+        cold_history = cold.fit(train_loader, val_loader, epochs=epochs, lean=lean)
+        result = {
+            "round": warm_start.rounds,
+            "warm_acc": warm[0],
+            "cold_acc": cold.evaluate(val_loader)["acc"],
+            "warm_time": warm[1],
+            "cold_time": time.perf_counter() - start,
+            "warm_epochs": warm[2],
+            "cold_epochs": len(cold_history["train_loss"]),
+        }
+        warm_start.comparisons.append(result)
+        pbar.log_message(
+            f"round {result['round']}: warm start val acc = {result['warm_acc']} "
+            f"({result['warm_time']:.1f}s), cold start val acc = {result['cold_acc']} "
+            f"({result['cold_time']:.1f}s)"
         )
+
+    def evaluate(self, data_loader: torchdata.DataLoader) -> dict:
+        evaluator = create_evaluator(self._model, self._loss, self._device)
         return evaluator.run(data_loader).metrics
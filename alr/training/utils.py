@@ -1,16 +1,121 @@
+import copy
+import os
 import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import torch
 from torch import nn
-from ignite.handlers import EarlyStopping, ModelCheckpoint, global_step_from_engine
-import tempfile
+from ignite.handlers import EarlyStopping
 from pathlib import Path
 from ignite.engine import Engine, Events
 
-from typing import Optional, Callable
+from typing import Iterable, Optional, Callable, Union
 
 from alr.utils.math import entropy
+from alr.utils._type_aliases import _DeviceType, _Loss_fn
+
+
+class StateBuffer:
+    def __init__(self, model: nn.Module, persist_to: Optional[Union[str, Path]] = None):
+        r"""
+        Keeps a copy of `model`'s state dict in preallocated CPU tensors that are reused by every
+        :meth:`save` (no allocation and no disk write per save). If `persist_to` is provided,
+        every save is also written to this file by a background thread. Saves that happen while
+        a write is pending are coalesced, i.e. only the latest state is written.
+
+        Args:
+            model (`torch.nn.Module`): model
+            persist_to (str, `Path`, optional): file that the saved state is written to
+                asynchronously (atomically replaced), e.g. to inspect or recover the best model.
+        """
+        self._model = model
+        self._buffers = None
+        # copy of the buffers that the background thread writes, so saves don't wait for the disk
+        self._staging = None
+        self._path = None if persist_to is None else Path(persist_to)
+        self._lock = threading.Lock()
+        self._pending = False
+        self._writer = None
+
+    @property
+    def saved(self) -> bool:
+        r"""
+        Whether :meth:`save` has been called at least once.
+        """
+        return self._buffers is not None
+
+    def save(self) -> None:
+        r"""
+        Copies the model's current state into the buffers.
+
+        Returns:
+            NoneType: None
+        """
+        state = self._model.state_dict()
+        with self._lock:
+            if self._buffers is None or any(
+                k not in self._buffers
+                or self._buffers[k].shape != v.shape
+                or self._buffers[k].dtype != v.dtype
+                for k, v in state.items()
+            ):
+                self._buffers = OrderedDict(
+                    (k, torch.empty_like(v, device="cpu")) for k, v in state.items()
+                )
+            for k, v in state.items():
+                self._buffers[k].copy_(v)
+            if self._path is not None and not self._pending:
+                self._pending = True
+                if self._writer is None:
+                    self._writer = ThreadPoolExecutor(max_workers=1)
+                self._writer.submit(self._persist)
+
+    def load(self) -> None:
+        r"""
+        Loads the saved state into the model.
+
+        Returns:
+            NoneType: None
+        """
+        if self._buffers is None:
+            raise RuntimeError("No state has been saved.")
+        with self._lock:
+            self._model.load_state_dict(self._buffers, strict=True)
+
+    def wait(self) -> None:
+        r"""
+        Blocks until the pending write (if any) has finished.
+
+        Returns:
+            NoneType: None
+        """
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def _persist(self):
+        # only the writer thread uses the staging buffers
+        with self._lock:
+            self._pending = False
+            if (
+                self._staging is None
+                or self._staging.keys() != self._buffers.keys()
+                or any(
+                    self._staging[k].shape != v.shape
+                    or self._staging[k].dtype != v.dtype
+                    for k, v in self._buffers.items()
+                )
+            ):
+                self._staging = OrderedDict(
+                    (k, torch.empty_like(v)) for k, v in self._buffers.items()
+                )
+            for k, v in self._buffers.items():
+                self._staging[k].copy_(v)
+        tmp = self._path.with_name(f".{self._path.name}.tmp")
+        torch.save(self._staging, str(tmp))
+        os.replace(tmp, self._path)
 
 
 class EarlyStopper:
@@ -21,20 +126,32 @@ class EarlyStopper:
         trainer: Engine,
         key: Optional[str] = "acc",
         mode: Optional[str] = "max",
+        persist_to: Optional[Union[str, Path]] = None,
     ):
+        r"""
+        Terminates `trainer` when a validation metric stops improving and keeps the best
+        model's state in memory (see :class:`StateBuffer`).
+
+        Args:
+            model (`torch.nn.Module`): model
+            patience (int): number of evaluations without improvement before `trainer` is terminated
+            trainer (`ignite.engine.Engine`): trainer engine
+            key (str, optional): metric of the evaluator that's monitored
+            mode (str, optional): `"max"` or `"min"`
+            persist_to (str, `Path`, optional): if provided, the best state is also written to this
+                file in the background
+        """
         self._model = model
         self._patience = patience
         self._trainer = trainer
         self._key = key
-        self._tmpdir = tempfile.TemporaryDirectory()
 
         mode = mode.lower()
         assert mode in {"min", "max"}
         self._mode = -1 if mode == "min" else 1
 
-        assert Path(str(self._tmpdir.name)).is_dir()
-        assert not list(Path(str(self._tmpdir.name)).rglob("*.pth"))
-        self._chkpt_handler = None
+        self._best = StateBuffer(model, persist_to=persist_to)
+        self._best_score = None
 
         self._reload_called = False
 
@@ -56,34 +173,28 @@ class EarlyStopper:
             score_function=self._score_function,
             trainer=self._trainer,
         )
-        self._chkpt_handler = ModelCheckpoint(
-            str(self._tmpdir.name),
-            filename_prefix="best",
-            n_saved=1,
-            create_dir=False,
-            score_function=self._score_function,
-            score_name=f"val_{self._key}",
-            global_step_transform=global_step_from_engine(self._trainer),
-        )
         engine.add_event_handler(Events.COMPLETED, es_handler)
-        engine.add_event_handler(
-            Events.COMPLETED, self._chkpt_handler, {"model": self._model}
-        )
+        engine.add_event_handler(Events.COMPLETED, self._save_best)
 
     def _score_function(self, engine):
         return engine.state.metrics[self._key] * self._mode
 
+    def _save_best(self, engine: Engine):
+        # same as ModelCheckpoint(n_saved=1): save on strict improvements only
+        score = self._score_function(engine)
+        if self._best_score is None or score > self._best_score:
+            self._best_score = score
+            self._best.save()
+
     def reload_best(self):
         if self._reload_called:
             raise RuntimeError("Cannot reload more than once.")
-        if self._chkpt_handler is None or self._chkpt_handler.last_checkpoint is None:
+        if not self._best.saved:
             raise RuntimeError(
                 "Cannot reload model until it has been trained for at least one epoch."
             )
-        self._model.load_state_dict(
-            torch.load(str(self._chkpt_handler.last_checkpoint)), strict=True
-        )
-        self._tmpdir.cleanup()
+        self._best.load()
+        self._best.wait()
         self._reload_called = True
 
 
@@ -215,15 +326,18 @@ def _expected_calibration_error(preds_N_C: np.ndarray, targets_N: np.ndarray):
 
 
 class PerformanceTracker:
-    def __init__(self, model: nn.Module, patience: int):
+    def __init__(
+        self,
+        model: nn.Module,
+        patience: int,
+        persist_to: Optional[Union[str, Path]] = None,
+    ):
         self.model = model
         self.patience = patience
         self._original_patience = patience
         self.last_acc = None
-        self._temp_dir = tempfile.TemporaryDirectory()
-        self._model_filename = (
-            Path(str(self._temp_dir.name)).absolute() / f"{id(self)}.pt"
-        )
+        # the best state is kept in memory (see StateBuffer)
+        self._best = StateBuffer(model, persist_to=persist_to)
         self._reloaded = False
 
     def reset(self):
@@ -232,10 +346,7 @@ class PerformanceTracker:
     def step(self, acc):
         if self.last_acc is None or acc > self.last_acc:
             self.reset()
-            if self._model_filename.exists():
-                # 2 am paranoia: make sure old model weights are overridden
-                self._model_filename.unlink()
-            torch.save(self.model.state_dict(), str(self._model_filename))
+            self._best.save()
             self.last_acc = acc
         else:
             self.patience -= 1
@@ -253,6 +364,251 @@ class PerformanceTracker:
             raise RuntimeError(
                 "Cannot reload model until step is called at least once."
             )
-        self.model.load_state_dict(torch.load(self._model_filename), strict=True)
-        self._temp_dir.cleanup()
+        self._best.load()
+        self._best.wait()
         self._reloaded = True
+
+
+class WarmStart:
+    def __init__(
+        self,
+        shrink: Optional[float] = 1.0,
+        perturb: Optional[float] = 0.0,
+        patience: Optional[Union[int, Callable[[int], int]]] = None,
+        compare: Optional[bool] = False,
+    ):
+        r"""
+        A warm-start policy across acquisition rounds for :meth:`alr.training.Trainer.fit` (and the
+        pseudo-label trainers). The first round trains the model from its current (initial) weights as
+        usual. Every later round continues from the previous round's weights, optionally shrunk and
+        perturbed (see :func:`shrink_perturb`), with a shorter patience since the model only has to adapt
+        to the few newly acquired points.
+
+        Examples:
+            .. code:: python
+
+                warm_start = WarmStart(shrink=0.6, perturb=0.01, patience=lambda r: max(2, 10 // r))
+                for r in range(rounds):
+                    trainer = Trainer(model, F.nll_loss, "Adam", patience=10, reload_best=True)
+                    trainer.fit(train_loader, val_loader, epochs=400, warm_start=warm_start)
+                    ...  # acquire
+
+        Args:
+            shrink (float, optional): the weights are multiplied by `shrink` at the start of a warm round
+            perturb (float, optional): standard deviation of the Gaussian noise that's added to
+                the (shrunk) weights at the start of a warm round
+            patience (int, Callable[[int], int], optional): patience of warm rounds, or a function
+                of the round number (1 for the first warm round). If `None`, the trainer's patience is used.
+            compare (bool, optional): if true, every warm round also trains a copy of the model from the first
+                round's initial weights with the trainer's patience (a cold start) and appends the validation
+                accuracy and training time of both to :attr:`comparisons`. This doubles the cost of a round
+                and is meant for deciding whether warm starts are accurate enough for an experiment.
+        """
+        assert 0 < shrink <= 1 and perturb >= 0
+        self._shrink = shrink
+        self._perturb = perturb
+        self._patience = patience
+        self.compare = compare
+        self.rounds = 0
+        self.comparisons = []
+        self._initial = None
+
+    def start_round(self, model: nn.Module) -> None:
+        r"""
+        Prepares `model` for the next round: the first round remembers the initial weights,
+        the later rounds shrink and perturb the weights.
+
+        Args:
+            model (`torch.nn.Module`): model
+
+        Returns:
+            NoneType: None
+        """
+        if not self.rounds:
+            self._initial = {
+                k: v.detach().clone() for k, v in model.state_dict().items()
+            }
+        else:
+            shrink_perturb(model, self._shrink, self._perturb)
+        self.rounds += 1
+
+    @property
+    def warm(self) -> bool:
+        r"""
+        Whether the current round (i.e. since the last :meth:`start_round`) is a warm round.
+        """
+        return self.rounds > 1
+
+    def patience(self, patience: Optional[int]) -> Optional[int]:
+        r"""
+        Returns the patience of the current round.
+
+        Args:
+            patience (int, optional): the trainer's (cold start) patience
+
+        Returns:
+            int: `patience` in the first round, the warm patience afterwards
+        """
+        if not self.warm or self._patience is None or patience is None:
+            return patience
+        if callable(self._patience):
+            return self._patience(self.rounds - 1)
+        return self._patience
+
+    def cold_copy(self, model: nn.Module) -> nn.Module:
+        r"""
+        Returns a copy of `model` with the first round's initial weights.
+
+        Args:
+            model (`torch.nn.Module`): model
+
+        Returns:
+            `torch.nn.Module`: a new model
+        """
+        assert self._initial is not None, "No round has been started yet."
+        cold = copy.deepcopy(model)
+        cold.load_state_dict(self._initial, strict=True)
+        return cold
+
+
+def shrink_perturb(
+    model: nn.Module, shrink: Optional[float] = 1.0, perturb: Optional[float] = 0.0
+) -> nn.Module:
+    r"""
+    Shrink and perturb (Ash & Adams, 2020): multiplies the parameters of `model` by `shrink` and adds
+    Gaussian noise with a standard deviation of `perturb` in place. This keeps what the previous round has
+    learned while restoring some of the plasticity of a freshly initialised model.
+
+    Args:
+        model (`torch.nn.Module`): model
+        shrink (float, optional): shrinkage factor (1 keeps the weights)
+        perturb (float, optional): standard deviation of the noise (0 adds no noise)
+
+    Returns:
+        `torch.nn.Module`: `model`
+    """
+    with torch.no_grad():
+        for p in model.parameters():
+            if shrink != 1:
+                p.mul_(shrink)
+            if perturb:
+                p.add_(torch.randn_like(p), alpha=perturb)
+    return model
+
+
+class DeviceTensors:
+    def __init__(
+        self,
+        x: torch.Tensor,
+        y: torch.Tensor,
+        batch_size: Optional[int] = 1024,
+        device: _DeviceType = None,
+    ):
+        r"""
+        A pre-materialised (e.g. validation) set of inputs and targets that's kept on the device.
+        Iterating over it yields `(x, y)` slices of `batch_size` points (views, nothing is copied),
+        so it can be passed wherever a validation loader is expected: the trainers evaluate it with
+        :func:`create_evaluator`, i.e. without a data loader and with a single host synchronisation
+        per evaluation.
+
+        Args:
+            x (`torch.Tensor`): inputs (already transformed)
+            y (`torch.Tensor`): targets
+            batch_size (int, optional): number of points evaluated at once
+            device (str, None, torch.device): device the tensors are moved to
+        """
+        assert len(x) == len(y)
+        self.x = x.to(device) if device is not None else x
+        self.y = y.to(device) if device is not None else y
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_loader(
+        cls,
+        loader: Iterable,
+        batch_size: Optional[int] = 1024,
+        device: _DeviceType = None,
+    ) -> "DeviceTensors":
+        r"""
+        Materialises the `(x, y)` batches of `loader` once.
+
+        Args:
+            loader (Iterable): e.g. a :class:`torch.utils.data.DataLoader` over the validation set
+            batch_size (int, optional): number of points evaluated at once
+            device (str, None, torch.device): device the tensors are moved to
+
+        Returns:
+            :class:`DeviceTensors`: the points of `loader`
+        """
+        xs, ys = [], []
+        for x, y in loader:
+            xs.append(x)
+            ys.append(torch.as_tensor(y))
+        return cls(torch.cat(xs), torch.cat(ys), batch_size=batch_size, device=device)
+
+    def __len__(self) -> int:
+        return (len(self.x) + self.batch_size - 1) // self.batch_size
+
+    def __iter__(self):
+        for i in range(0, len(self.x), self.batch_size):
+            yield self.x[i : i + self.batch_size], self.y[i : i + self.batch_size]
+
+
+def create_evaluator(
+    model: nn.Module,
+    loss: _Loss_fn,
+    device: _DeviceType = None,
+) -> Engine:
+    r"""
+    Returns an evaluator engine with `acc` and `loss` metrics, the counterpart of
+    :func:`ignite.engine.create_supervised_evaluator` with :class:`ignite.metrics.Accuracy`
+    and :class:`ignite.metrics.Loss`. Correct predictions and losses are accumulated on the
+    device and the metrics are read back once when the evaluation completes, hence evaluating
+    a :class:`DeviceTensors` (whose batches are already on the device) doesn't synchronise
+    with the host until the end.
+
+    Args:
+        model (`torch.nn.Module`): model
+        loss (Callable): loss function, e.g. `F.nll_loss`
+        device (str, None, torch.device): device type
+
+    Returns:
+        `ignite.engine.Engine`: evaluator
+    """
+    if device is not None:
+        model.to(device)
+
+    def _step(engine: Engine, batch):
+        model.eval()
+        x, y = batch
+        if device is not None:
+            x = x.to(device, non_blocking=True)
+            y = y.to(device, non_blocking=True)
+        with torch.no_grad():
+            preds = model(x)
+            state = engine.state
+            state.correct = state.correct + (preds.argmax(dim=-1) == y).sum()
+            state.total_loss = state.total_loss + loss(preds, y) * len(y)
+            state.n += len(y)
+
+    evaluator = Engine(_step)
+
+    @evaluator.on(Events.STARTED)
+    def _reset(e: Engine):
+        e.state.correct, e.state.total_loss, e.state.n = 0, 0, 0
+
+    @evaluator.on(Events.COMPLETED)
+    def _compute(e: Engine):
+        # the only host synchronisation of the evaluation
+        correct, total_loss = torch.stack(
+            [
+                torch.as_tensor(e.state.correct).float(),
+                torch.as_tensor(e.state.total_loss).float(),
+            ]
+        ).tolist()
+        e.state.metrics = {
+            "acc": correct / e.state.n,
+            "loss": total_loss / e.state.n,
+        }
+
+    return evaluator
@@ -2,6 +2,7 @@ import torch
 import numpy as np
 import os
 import random
+import itertools
 
 from typing import Optional, Sequence, Union
 from pathlib import Path
@@ -10,6 +11,9 @@ from alr.utils.time_utils import Elapsed, timeop, time_this, Time
 from alr.utils.experiment_helpers import stratified_partition, eval_fwd, eval_fwd_exp
 from alr.utils._type_aliases import _DeviceType
 from alr.utils.progress_bar import progress_bar, range_progress_bar
+from alr.utils.snapshot import SnapshotStore
+from alr.utils.parallel import train_ensemble, run_seeds, run_parallel, member_seeds
+from alr.utils.checkpoint import save_checkpoint, load_checkpoint
 
 __all__ = [
     "Elapsed",
@@ -22,6 +26,13 @@ __all__ = [
     "progress_bar",
     "range_progress_bar",
     "manual_seed",
+    "SnapshotStore",
+    "train_ensemble",
+    "run_seeds",
+    "run_parallel",
+    "member_seeds",
+    "save_checkpoint",
+    "load_checkpoint",
 ]
 
 
@@ -59,6 +70,15 @@ def _map_device(xs: Sequence[torch.Tensor], device: _DeviceType):
     return xs
 
 
+def _state_version(module: torch.nn.Module) -> tuple:
+    # parameters and buffers are modified in-place by optimisers and load_state_dict,
+    # both of which bump the tensors' version counters.
+    return tuple(
+        (id(t), t._version)
+        for t in itertools.chain(module.parameters(), module.buffers())
+    )
+
+
 def savefig(filename, fig=None, pad_inches=0.05):
     """Get rid of them pesky padding"""
     import matplotlib.pyplot as plt
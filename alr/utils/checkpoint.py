@@ -0,0 +1,156 @@
+r"""
+Checkpoints of an active learning loop, written atomically at the end of every round so a
+preempted job resumes from its last completed round instead of the first one.
+The main functions you should be concerned with are :func:`save_checkpoint` and :func:`load_checkpoint`.
+"""
+import os
+import random
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import torch
+from torch import nn
+
+__all__ = ["save_checkpoint", "load_checkpoint", "rng_state", "set_rng_state"]
+
+
+def rng_state() -> dict:
+    r"""
+    Returns the states of torch's (CPU and CUDA), numpy's, and python's global random number generators.
+
+    Returns:
+        dict: states that can be restored with :func:`set_rng_state`
+    """
+    return {
+        "torch": torch.get_rng_state(),
+        "cuda": torch.cuda.get_rng_state_all() if torch.cuda.is_available() else [],
+        "numpy": np.random.get_state(),
+        "random": random.getstate(),
+    }
+
+
+def set_rng_state(state: dict) -> None:
+    r"""
+    Restores the random number generators' states returned by :func:`rng_state`.
+
+    Args:
+        state (dict): states
+
+    Returns:
+        NoneType: None
+    """
+    torch.set_rng_state(state["torch"])
+    if state["cuda"] and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(state["cuda"])
+    np.random.set_state(state["numpy"])
+    random.setstate(state["random"])
+
+
+def save_checkpoint(
+    path: Union[str, Path],
+    data_manager: Optional["DataManager"] = None,
+    model: Optional[nn.Module] = None,
+    optimiser: Optional[torch.optim.Optimizer] = None,
+    **state,
+) -> Path:
+    r"""
+    Saves the state of an active learning loop to `path`: the data manager's acquisitions
+    (see :meth:`alr.data.DataManager.state_dict`), the model's weights (and its snapshot, see
+    :meth:`alr.ALRModel.snap`), the optimiser's state, the random number generators' states
+    (see :func:`rng_state`), and any other (picklable) `state`, e.g. the round and the accuracies
+    so far. The checkpoint is written to a temporary file that replaces `path` once it's
+    complete, so `path` always holds the last complete checkpoint even if the job is killed
+    while it's being written.
+
+    Examples:
+        .. code:: python
+
+            manual_seed(42)
+            model = MCDropout(Dataset.MNIST.model, forward=20, fast=True)
+            dm = DataManager(train, pool, BALD(eval_fwd_exp(model)))
+            state = load_checkpoint("al.ckpt", dm, model) or {"round": 0, "accs": []}
+            accs = state["accs"]
+            for r in range(state["round"] + 1, ITERS + 1):
+                model.reset_weights()
+                ...  # train and evaluate
+                accs.append(test_acc)
+                dm.acquire(b)
+                save_checkpoint("al.ckpt", dm, model, round=r, accs=accs)
+
+    Args:
+        path (str, `Path`): checkpoint file
+        data_manager (:class:`alr.data.DataManager`, optional): data manager
+        model (`torch.nn.Module`, optional): model
+        optimiser (`torch.optim.Optimizer`, optional): optimiser (if it's kept across rounds)
+        **state (Any): other state to save
+
+    Returns:
+        `Path`: `path`
+    """
+    path = Path(path)
+    checkpoint = {"state": state, "rng": rng_state()}
+    if data_manager is not None:
+        checkpoint["data_manager"] = data_manager.state_dict()
+    if model is not None:
+        checkpoint["model"] = model.state_dict()
+        if getattr(model, "_snapshot", None) is not None:
+            checkpoint["snapshot"] = model._snapshot
+    if optimiser is not None:
+        checkpoint["optimiser"] = optimiser.state_dict()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp, "wb") as fp:
+            torch.save(checkpoint, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return path
+
+
+def load_checkpoint(
+    path: Union[str, Path],
+    data_manager: Optional["DataManager"] = None,
+    model: Optional[nn.Module] = None,
+    optimiser: Optional[torch.optim.Optimizer] = None,
+    map_location=None,
+) -> Optional[dict]:
+    r"""
+    Restores a checkpoint saved by :func:`save_checkpoint` into `data_manager`, `model`, `optimiser`,
+    and the random number generators, i.e. the loop continues exactly as if it had never stopped,
+    provided the objects are constructed the same way as in the original run.
+
+    Args:
+        path (str, `Path`): checkpoint file
+        data_manager (:class:`alr.data.DataManager`, optional): data manager
+        model (`torch.nn.Module`, optional): model
+        optimiser (`torch.optim.Optimizer`, optional): optimiser
+        map_location (optional): see :func:`torch.load`
+
+    Returns:
+        Optional[dict]: the other state that was saved, or `None` if `path` doesn't exist (i.e. a fresh start)
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        checkpoint = torch.load(
+            str(path), map_location=map_location, weights_only=False
+        )
+    except TypeError:
+        # torch < 1.13
+        checkpoint = torch.load(str(path), map_location=map_location)
+    if data_manager is not None:
+        data_manager.load_state_dict(checkpoint["data_manager"])
+    if model is not None:
+        model.load_state_dict(checkpoint["model"])
+        if "snapshot" in checkpoint:
+            model._snapshot = checkpoint["snapshot"]
+    if optimiser is not None:
+        optimiser.load_state_dict(checkpoint["optimiser"])
+    set_rng_state(checkpoint["rng"])
+    return checkpoint["state"]
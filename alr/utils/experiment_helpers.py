@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Iterable, Tuple, Optional
 
 import numpy as np
 import torch
@@ -27,33 +27,32 @@ def stratified_partition(
     :return: (training pool, unlabelled pool)
     :rtype: tuple
     """
+    from alr.data import get_targets, partition
+
     assert size < len(ds)
     c = size // classes
     extra = size % classes
-    count = {cls: c for cls in range(classes)}
-    original_idxs = set(range(len(ds)))
-    sampled_idxs = []
-    # the first `extra` classes gets the extra counts
-    while extra:
-        count[extra] += 1
-        extra -= 1
-    for idx in np.random.permutation(len(ds)):
-        if all(i == 0 for i in count.values()):
-            break
-        y = ds[idx][1]
-        if isinstance(y, torch.Tensor):
-            # y is one-hot encoded
-            y = y.argmax().item()
-        if count[y]:
-            count[y] -= 1
-            sampled_idxs.append(idx)
-    return _ActiveLearningDataset(
-        training=torchdata.Subset(ds, sampled_idxs),
-        unlabelled=torchdata.Subset(ds, list(original_idxs - set(sampled_idxs))),
-    )
-
-
-def eval_fwd_exp(model: "MCDropout"):
+    count = np.full(classes, c)
+    # classes 1, ..., `extra` get the extra counts
+    count[1 : extra + 1] += 1
+    perm = np.random.permutation(len(ds))
+    # the classes are read from the dataset's metadata (see alr.data.get_targets)
+    # rather than by loading every point
+    y = get_targets(ds)[perm]
+    # rank of each point within its class (in the order of perm)
+    order = np.argsort(y, kind="stable")
+    starts = np.searchsorted(y[order], np.arange(classes))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(y)) - starts[y[order]]
+    training, unlabelled = partition(ds, perm[rank < count[y]])
+    return _ActiveLearningDataset(training=training, unlabelled=unlabelled)
+
+
+def eval_fwd_exp(
+    model: "MCDropout",
+    quantise: Optional[bool] = False,
+    calibration_data: Optional[Iterable] = None,
+):
     r"""
     A helper function that returns a function that
     sets model to eval mode, calls stochastic forward, and exponentiates the output.
@@ -65,22 +64,46 @@ def eval_fwd_exp(model: "MCDropout"):
 
             model = MCDropout(...)
             bald = BALD(eval_fwd_exp(model), ...)
+            # int8 scoring on CPU for this acquisition function only
+            bald = BALD(eval_fwd_exp(model, quantise=True), ...)
 
     Args:
         model (MCDropout): MCDropout model. The stochastic forward output of this model
                             is expected to be log-softmax probabilities.
+        quantise (bool, optional): if true, the stochastic forward pass is done by an int8
+            copy of `model` (see :meth:`alr.ALRModel.quantise`). The copy is built on the first
+            call and rebuilt whenever `model`'s weights change (e.g. after training).
+        calibration_data (Iterable, optional): batches (e.g. a `DataLoader` of the labelled set) to
+            calibrate the int8 copy with. Defaults to the batch that the copy is built on.
 
     Returns:
         Callable: a function that takes a tensor and returns a
         tensor that contains (non log-) probabilities
         from the model's stochastic forward pass
     """
+    if not quantise:
 
-    def _fwd(x: torch.Tensor) -> torch.Tensor:
-        model.eval()
-        return model.stochastic_forward(x).exp()
+        def _fwd(x: torch.Tensor) -> torch.Tensor:
+            model.eval()
+            return model.stochastic_forward(x).exp()
 
-    return _fwd
+        return _fwd
+
+    from alr.utils import _state_version
+
+    cache = {"version": None, "model": None}
+
+    def _quantised_fwd(x: torch.Tensor) -> torch.Tensor:
+        version = _state_version(model)
+        if cache["version"] != version:
+            cache["model"] = model.quantise(
+                x[:1],
+                calibration_data=[x] if calibration_data is None else calibration_data,
+            )
+            cache["version"] = version
+        return cache["model"].stochastic_forward(x).exp()
+
+    return _quantised_fwd
 
 
 def eval_fwd(model: "MCDropout"):
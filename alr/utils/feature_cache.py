@@ -0,0 +1,173 @@
+r"""
+Round-scoped cache of a model's backbone features for repeated head-only stochastic forward passes.
+The main method you should be concerned with is :meth:`alr.MCDropout.feature_cache`.
+"""
+from typing import Optional
+
+import numpy as np
+import torch
+import torch.utils.data as torchdata
+from torch import nn
+
+from alr.utils import _state_version
+from alr.utils._type_aliases import _DeviceType
+
+
+class FeatureCache:
+    def __init__(
+        self,
+        backbone: nn.Module,
+        head: nn.Module,
+        batch_size: Optional[int] = 1024,
+        device: _DeviceType = None,
+        num_workers: Optional[int] = 0,
+    ):
+        r"""
+        Caches `backbone`'s output (in eval mode) for each point of a dataset, keyed by the point's
+        absolute index (see :meth:`alr.data.UnlabelledDataset.convert_idx`). Hence, points remain cached
+        after other points of an :class:`alr.data.UnlabelledDataset` were labelled.
+        The cache is cleared automatically when `backbone`'s parameters or buffers change
+        (e.g. an optimiser step or :meth:`alr.ALRModel.reset_weights`).
+
+        Use one cache per dataset (e.g. one for the unlabelled pool and another for the test set).
+
+        Examples:
+            .. code:: python
+
+                cache = model.feature_cache()
+                bald = BALD(eval_fwd_exp(cache.head), device=device)
+                dm = DataManager(train, pool, bald)
+                # the backbone is only run on points that aren't cached
+                dm.acquire(b, transform=cache.transform)
+
+        Args:
+            backbone (`nn.Module`): deterministic part of the model
+            head (`nn.Module`): stochastic part of the model that takes `backbone`'s output
+            batch_size (int, optional): batch size used to compute missing features
+            device (None, str, `torch.device`): device used to compute missing features.
+                Features are stored on CPU.
+            num_workers (int, optional): number of workers used to load missing points
+
+        Attributes:
+            head (`nn.Module`): `head`
+        """
+        self.backbone = backbone
+        self.head = head
+        self._batch_size = batch_size
+        self._device = device
+        self._num_workers = num_workers
+        self._version = None
+        self.clear()
+
+    def clear(self) -> None:
+        r"""
+        Removes all cached features.
+
+        Returns:
+            NoneType: None
+        """
+        self._features = self._targets = self._filled = None
+
+    def features(self, dataset: torchdata.Dataset) -> torch.Tensor:
+        r"""
+        Returns `backbone`'s output for every point in `dataset` (in order). Only the points
+        that aren't cached yet are loaded and passed through `backbone`.
+
+        Args:
+            dataset (`torch.utils.data.Dataset`): an :class:`alr.data.UnlabelledDataset` or any
+                dataset that returns `x` or `(x, y)`.
+
+        Returns:
+            `torch.Tensor`: features of size :math:`N \times \ldots` where :math:`N` is `len(dataset)`.
+        """
+        idxs = self._populate(dataset)
+        return self._features[idxs]
+
+    def transform(self, dataset: torchdata.Dataset) -> torchdata.Dataset:
+        r"""
+        Returns a dataset of `dataset`'s features (see :meth:`features`). Targets are kept if
+        `dataset` returns `(x, y)`. This can be used as the `transform` argument of
+        :meth:`alr.data.DataManager.acquire`.
+
+        Args:
+            dataset (`torch.utils.data.Dataset`): see :meth:`features`
+
+        Returns:
+            `torch.utils.data.Dataset`: dataset of features
+        """
+        idxs = self._populate(dataset)
+        targets = self._targets[idxs] if self._targets is not None else None
+        return _FeatureDataset(self._features[idxs], targets)
+
+    def _populate(self, dataset: torchdata.Dataset) -> np.ndarray:
+        if hasattr(dataset, "convert_idx"):
+            # UnlabelledDataset: key by index of the original pool
+            idxs = dataset.convert_idx(np.arange(len(dataset)))
+            size = len(dataset._dataset)
+        else:
+            idxs = np.arange(len(dataset))
+            size = len(dataset)
+        version = _state_version(self.backbone)
+        if version != self._version:
+            self.clear()
+            self._version = version
+        if self._filled is not None and len(self._filled) != size:
+            raise ValueError(
+                "This cache holds features of a different dataset. Use one cache per dataset."
+            )
+        missing = (
+            np.arange(len(idxs))
+            if self._filled is None
+            else np.flatnonzero(~self._filled[idxs].numpy())
+        )
+        if not len(missing):
+            return idxs
+
+        loader = torchdata.DataLoader(
+            torchdata.Subset(dataset, missing),
+            batch_size=self._batch_size,
+            shuffle=False,
+            num_workers=self._num_workers,
+        )
+        modes = [(m, m.training) for m in self.backbone.modules()]
+        self.backbone.eval()
+        try:
+            offset = 0
+            with torch.no_grad():
+                for batch in loader:
+                    if isinstance(batch, (list, tuple)):
+                        x, y = batch[0], batch[1]
+                    else:
+                        x, y = batch, None
+                    if self._device is not None:
+                        x = x.to(self._device)
+                    f = self.backbone(x).cpu()
+                    if self._filled is None:
+                        self._features = f.new_empty((size, *f.size()[1:]))
+                        self._filled = torch.zeros(size, dtype=torch.bool)
+                        if y is not None:
+                            self._targets = y.new_empty((size, *y.size()[1:]))
+                    abs_idxs = torch.from_numpy(idxs[missing[offset : offset + len(f)]])
+                    self._features[abs_idxs] = f
+                    if y is not None:
+                        self._targets[abs_idxs] = y
+                    self._filled[abs_idxs] = True
+                    offset += len(f)
+        finally:
+            for m, training in modes:
+                m.training = training
+        return idxs
+
+
+class _FeatureDataset(torchdata.Dataset):
+    def __init__(self, features: torch.Tensor, targets: Optional[torch.Tensor] = None):
+        self._features = features
+        self._targets = targets
+
+    def __len__(self):
+        return len(self._features)
+
+    def __getitem__(self, idx):
+        if self._targets is None:
+            return self._features[idx]
+        return self._features[idx], self._targets[idx]
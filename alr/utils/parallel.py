@@ -0,0 +1,264 @@
+r"""
+Train independent models (e.g. ensemble members or the seeds of an experiment) concurrently in
+a pool of processes that split the CPU cores between them.
+The main functions you should be concerned with are :func:`train_ensemble` and :func:`run_seeds`.
+"""
+import copy
+import functools
+import os
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+from torch import nn
+
+__all__ = ["train_ensemble", "run_seeds", "run_parallel", "member_seeds"]
+
+
+def member_seeds(seed: int, n: int) -> List[int]:
+    r"""
+    Derives `n` independent seeds from `seed` (with :class:`numpy.random.SeedSequence`), one per member.
+
+    Args:
+        seed (int): root seed
+        n (int): number of seeds
+
+    Returns:
+        List[int]: seeds
+    """
+    return [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def run_parallel(
+    fn: Callable[[int], Any],
+    n: int,
+    seed: Optional[int] = 0,
+    processes: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> List[Any]:
+    r"""
+    Calls `fn(i)` for :math:`i = 0, \ldots, n - 1` in a pool of `processes` spawned processes and
+    returns the results in order. Before each call, torch, numpy, and random are seeded with the
+    :math:`i`-th seed of :func:`member_seeds` and torch's intra-op parallelism is limited to `threads`
+    threads, so the calls don't compete for the same cores. The results of a call don't depend on the
+    number of processes.
+
+    `fn` and its results are pickled, i.e. `fn` must be importable (e.g. a module-level function or a
+    :func:`functools.partial` of one). `fn` is sent to each process once (not once per call), and
+    tensors in it are sent through shared memory rather than copied (as are the arrays of datasets
+    passed through :func:`alr.data.share_memory`).
+
+    Args:
+        fn (Callable[[int], Any]): function of the call's index
+        n (int): number of calls
+        seed (int, optional): root seed
+        processes (int, optional): number of processes. Defaults to `n` capped at the number
+            of CPUs. If 0, the calls are made one after another in this process.
+        threads (int, optional): torch threads per call. Defaults to the number of CPUs divided by `processes`.
+
+    Returns:
+        List[Any]: `fn(0), ..., fn(n - 1)`
+    """
+    return _map(fn, list(range(n)), member_seeds(seed, n), processes, threads)
+
+
+def run_seeds(
+    experiment: Callable[..., Any],
+    seeds: Sequence[int],
+    shared: Optional[Dict[str, Any]] = None,
+    processes: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> List[Any]:
+    r"""
+    Runs `experiment(seed, **shared)` for every seed in one job instead of one job per seed
+    (see :func:`run_parallel` for how the calls are scheduled). Before each call, torch, numpy,
+    and random are seeded with `seed` itself, i.e. the same as :func:`alr.utils.manual_seed` at the
+    start of a single-seed script.
+
+    The values of `shared` (e.g. the decoded training set, pool, and validation and test sets)
+    are built once by the caller and moved to shared memory (datasets with
+    :func:`alr.data.share_memory`, tensors with :meth:`torch.Tensor.share_memory_`), so every
+    seed reads the same pages instead of decoding and holding its own copy. They must be
+    treated as read-only, e.g. wrap them in a :class:`alr.data.UnlabelledDataset` (which is
+    per seed) rather than share the wrapper. Data that's stored in numpy arrays (e.g. CIFAR's)
+    is shared too: :func:`alr.data.share_memory` replaces it with views of shared tensors. As each
+    seed has its own cores, data loaders within `experiment` usually don't need workers.
+
+    Examples:
+        .. code:: python
+
+            def experiment(seed, train, pool, val, test):
+                pool = UnlabelledDataset(pool)
+                ...
+                return accs
+
+            train, pool, test = Dataset.MNIST.get_fixed()
+            pool, val = torchdata.random_split(pool, (len(pool) - 5000, 5000))
+            accs = run_seeds(
+                experiment, range(42, 48), dict(train=train, pool=pool, val=val, test=test)
+            )
+
+    Args:
+        experiment (Callable): importable function (see :func:`run_parallel`) of the seed and
+            the keyword arguments in `shared`
+        seeds (Sequence[int]): seeds
+        shared (Dict[str, Any], optional): keyword arguments of `experiment` that are shared by all seeds
+        processes (int, optional): see :func:`run_parallel`
+        threads (int, optional): see :func:`run_parallel`
+
+    Returns:
+        List[Any]: the results of `experiment` in the order of `seeds`
+    """
+    shared = dict(shared or {})
+    for value in shared.values():
+        _share(value)
+    seeds = [int(s) for s in seeds]
+    fn = functools.partial(experiment, **shared)
+    return _map(fn, seeds, seeds, processes, threads)
+
+
+def train_ensemble(
+    build_model: Callable[[], nn.Module],
+    train_member: Callable[[nn.Module, int], Any],
+    n_members: int,
+    seed: Optional[int] = 0,
+    processes: Optional[int] = None,
+    threads: Optional[int] = None,
+) -> Tuple["Ensemble", List[Any]]:
+    r"""
+    Trains `n_members` models concurrently (see :func:`run_parallel`) and returns them as an
+    :class:`alr.training.plmixup_ensemble.Ensemble`.
+
+    If `train_member` is a :func:`functools.partial`, its tensor and dataset arguments (e.g. the
+    training and validation sets) are moved to shared memory as in :func:`run_seeds`, so the
+    members read the same pages instead of each receiving a pickled copy; treat them as read-only.
+    The members' weights are loaded into copies of a single model built with `build_model`
+    under :func:`torch.random.fork_rng`, i.e. the caller's random state is left untouched.
+
+    Examples:
+        .. code:: python
+
+            def build():
+                return Dataset.MNIST.model
+
+            def train(model, member, train_ds, val_ds):
+                trainer = Trainer(model, F.nll_loss, "Adam", patience=10, reload_best=True)
+                return trainer.fit(
+                    DataLoader(train_ds, batch_size=64, shuffle=True),
+                    DataLoader(val_ds, batch_size=512),
+                    epochs=100,
+                )
+
+            ensemble, histories = train_ensemble(
+                build, functools.partial(train, train_ds=train_ds, val_ds=val_ds), 5, seed=42
+            )
+
+    Args:
+        build_model (Callable[[], `torch.nn.Module`]): returns a new (untrained) member; it's called after
+            the member's seed is set, hence members are initialised differently.
+        train_member (Callable[[`torch.nn.Module`, int], Any]): trains the member (in place) given
+            the member and its index, and returns its history
+        n_members (int): number of members
+        seed (int, optional): root seed; every member has its own seed derived from it
+        processes (int, optional): see :func:`run_parallel`
+        threads (int, optional): see :func:`run_parallel`
+
+    Returns:
+        Tuple[:class:`alr.training.plmixup_ensemble.Ensemble`, List[Any]]: the ensemble
+        (members in order) and the members' histories
+    """
+    from alr.training.plmixup_ensemble import Ensemble
+
+    if isinstance(train_member, functools.partial):
+        for value in (*train_member.args, *train_member.keywords.values()):
+            _share(value)
+    results = run_parallel(
+        _Member(build_model, train_member),
+        n_members,
+        seed=seed,
+        processes=processes,
+        threads=threads,
+    )
+    # the shell's initial weights are overwritten: don't draw them from the caller's RNG
+    with torch.random.fork_rng(devices=[]):
+        shell = build_model()
+    models = []
+    for state_dict, _ in results:
+        model = copy.deepcopy(shell)
+        model.load_state_dict(state_dict)
+        models.append(model)
+    return Ensemble(models), [history for _, history in results]
+
+
+class _Member:
+    # picklable fn for run_parallel: builds and trains a member, returns its weights and history
+    def __init__(self, build_model, train_member):
+        self.build_model = build_model
+        self.train_member = train_member
+
+    def __call__(self, i: int):
+        model = self.build_model()
+        history = self.train_member(model, i)
+        return model.state_dict(), history
+
+
+def _share(value):
+    # moves a tensor or (the arrays of) a dataset to shared memory; other values are left as they are
+    from alr.data import share_memory
+
+    if isinstance(value, torch.Tensor):
+        value.share_memory_()
+    elif isinstance(value, torch.utils.data.Dataset):
+        share_memory(value)
+
+
+def _map(
+    fn: Callable[[Any], Any],
+    args: List[Any],
+    seeds: List[int],
+    processes: Optional[int],
+    threads: Optional[int],
+) -> List[Any]:
+    cpus = os.cpu_count() or 1
+    if processes is None:
+        processes = min(len(args), cpus)
+    if threads is None:
+        threads = max(1, cpus // max(processes, 1))
+    tasks = list(zip(args, seeds))
+    if processes == 0:
+        num_threads = torch.get_num_threads()
+        try:
+            torch.set_num_threads(threads)
+            return [_seeded(fn, a, s) for a, s in tasks]
+        finally:
+            torch.set_num_threads(num_threads)
+    import torch.multiprocessing as mp
+
+    # fn (and the shared memory it references) is sent to each process once
+    with mp.get_context("spawn").Pool(
+        processes, initializer=_init_worker, initargs=(fn, threads)
+    ) as pool:
+        return pool.map(_call, tasks, chunksize=1)
+
+
+# the function that the calls in this (worker) process run, see _init_worker
+_worker_fn = None
+
+
+def _init_worker(fn, threads):
+    global _worker_fn
+    _worker_fn = fn
+    torch.set_num_threads(threads)
+
+
+def _call(task):
+    arg, seed = task
+    return _seeded(_worker_fn, arg, seed)
+
+
+def _seeded(fn, arg, seed):
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+    random.seed(seed)
+    return fn(arg)
@@ -0,0 +1,332 @@
+r"""
+A store for named snapshots of model weights (state dicts). Tensors are content-addressed,
+so tensors that didn't change between snapshots (e.g. frozen layers or an ensemble member that
+was saved twice) are stored once. Floating point tensors are stored as a compressed delta
+against the corresponding tensor of a base snapshot.
+The main method you should be concerned with is :meth:`alr.ALRModel.snap`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import torch
+
+from alr.utils._type_aliases import _DeviceType
+
+__all__ = ["SnapshotStore"]
+
+# object header: hash of the object this object is a delta against (or zeros)
+# followed by one byte for the element size
+_NO_BASE = b"0" * 40
+_HEADER = 41
+# each byte plane is stored as a flag (compressed or not), its size (8 bytes), and its data
+_SAMPLE_SIZE = 1 << 16
+
+
+class SnapshotStore:
+    def __init__(
+        self, root: Optional[Union[str, Path]] = None, level: Optional[int] = 1
+    ):
+        r"""
+        Keeps named snapshots of state dicts. Each tensor is identified by the SHA-1 of its
+        contents, hence unchanged tensors are only stored once. New floating point tensors are
+        XOR-ed bitwise with the tensor of the same name in the `base` snapshot (see :meth:`save`),
+        byte-shuffled and compressed with zlib: weights that moved a little since the base
+        snapshot share their sign, exponent, and leading mantissa bits with the base, which compresses well.
+
+        Args:
+            root (str, `Path`, optional): directory of an on-disk store. It's created if it
+                doesn't exist and an existing store is reopened. If `None`, the store is kept in memory.
+            level (int, optional): zlib compression level. Low levels are much faster and
+                compress shuffled weights nearly as well as high levels.
+        """
+        self._root = None if root is None else Path(root)
+        self._level = level
+        self._objects: Dict[str, bytes] = {}
+        self._manifests: Dict[str, dict] = {}
+        if self._root is not None:
+            (self._root / "objects").mkdir(parents=True, exist_ok=True)
+            (self._root / "snapshots").mkdir(parents=True, exist_ok=True)
+            for f in (self._root / "snapshots").glob("*.json"):
+                with open(f, "r") as fp:
+                    self._manifests[f.stem] = json.load(fp)
+
+    @property
+    def names(self) -> List[str]:
+        r"""
+        Names of the stored snapshots in the order they were saved.
+        """
+        return sorted(self._manifests, key=lambda n: self._manifests[n]["order"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._manifests
+
+    def __len__(self) -> int:
+        return len(self._manifests)
+
+    def save(
+        self,
+        name: str,
+        state_dict: Dict[str, torch.Tensor],
+        base: Optional[str] = None,
+    ) -> None:
+        r"""
+        Stores `state_dict` under `name`, overwriting an existing snapshot of the same name
+        (whose tensors are deleted unless another snapshot uses them).
+
+        Args:
+            name (str): snapshot name
+            state_dict (dict): a state dict, e.g. from `model.state_dict()`
+            base (str, optional): name of the snapshot to compute deltas against. Defaults
+                to the first snapshot in this store. Tensors without a counterpart (same name,
+                dtype, and number of elements) in `base` are compressed on their own.
+
+        Returns:
+            NoneType: None
+        """
+        if base is None and len(self):
+            base = self.names[0]
+        base_tensors = (
+            {t["key"]: t for t in self._manifests[base]["tensors"]}
+            if base is not None and base != name
+            else {}
+        )
+        # decompressed base tensors, only kept for the duration of this save
+        base_cache = {}
+        tensors = []
+        for key, value in state_dict.items():
+            arr = _as_numpy(value)
+            digest = _digest(value.dtype, arr)
+            if not self._has_object(digest):
+                ref = base_tensors.get(key)
+                if (
+                    ref is None
+                    or not value.is_floating_point()
+                    or ref["dtype"] != str(value.dtype)
+                    or int(np.prod(ref["shape"])) != arr.size
+                ):
+                    ref = None
+                self._write_object(digest, arr, ref, base_cache)
+            tensors.append(
+                {
+                    "key": key,
+                    "hash": digest,
+                    "dtype": str(value.dtype),
+                    "shape": list(value.size()),
+                }
+            )
+        overwritten = name in self
+        order = (
+            self._manifests[name]["order"]
+            if overwritten
+            else 1 + max((m["order"] for m in self._manifests.values()), default=-1)
+        )
+        manifest = {"order": order, "base": base, "tensors": tensors}
+        if self._root is not None:
+            _atomic_write(
+                self._root / "snapshots" / f"{name}.json",
+                json.dumps(manifest).encode(),
+            )
+        self._manifests[name] = manifest
+        if overwritten:
+            # the replaced snapshot's tensors that nothing else uses
+            self._collect()
+
+    def load(
+        self, name: str, device: Optional[_DeviceType] = None
+    ) -> Dict[str, torch.Tensor]:
+        r"""
+        Restores the snapshot `name`. Only the tensors of this snapshot
+        (and those they are deltas against) are read and decompressed.
+
+        Args:
+            name (str): snapshot name
+            device (None, str, `torch.device`, optional): device to move the tensors to.
+
+        Returns:
+            dict: an ordered state dict that can be passed to `model.load_state_dict`.
+        """
+        if name not in self:
+            raise KeyError(f"Snapshot {name} does not exist.")
+        cache = {}
+        state_dict = OrderedDict()
+        for t in self._manifests[name]["tensors"]:
+            dtype = getattr(torch, t["dtype"].split(".")[-1])
+            raw = self._read_object(t["hash"], cache)
+            value = torch.from_numpy(raw.view(_numpy_dtype(dtype)).copy())
+            state_dict[t["key"]] = value.view(t["shape"]).to(device)
+        return state_dict
+
+    def remove(self, name: str) -> None:
+        r"""
+        Removes the snapshot `name` and deletes the tensors that no other snapshot uses
+        (directly or as the base of a delta).
+
+        Args:
+            name (str): snapshot name
+
+        Returns:
+            NoneType: None
+        """
+        if name not in self:
+            raise KeyError(f"Snapshot {name} does not exist.")
+        del self._manifests[name]
+        if self._root is not None:
+            (self._root / "snapshots" / f"{name}.json").unlink()
+        self._collect()
+
+    def clear(self) -> None:
+        r"""
+        Removes every snapshot and tensor in this store.
+
+        Returns:
+            NoneType: None
+        """
+        for name in list(self._manifests):
+            del self._manifests[name]
+            if self._root is not None:
+                (self._root / "snapshots" / f"{name}.json").unlink()
+        self._collect()
+
+    def nbytes(self) -> int:
+        r"""
+        Number of (compressed) bytes used by tensor data in this store.
+        """
+        if self._root is None:
+            return sum(len(o) for o in self._objects.values())
+        return sum(f.stat().st_size for f in (self._root / "objects").iterdir())
+
+    def _has_object(self, digest: str) -> bool:
+        if self._root is None:
+            return digest in self._objects
+        return (self._root / "objects" / digest).exists()
+
+    def _collect(self):
+        # deletes the objects that aren't reachable from a manifest
+        live = set()
+        stack = [t["hash"] for m in self._manifests.values() for t in m["tensors"]]
+        while stack:
+            digest = stack.pop()
+            if digest in live:
+                continue
+            live.add(digest)
+            base = self._object_base(digest)
+            if base is not None:
+                stack.append(base)
+        if self._root is None:
+            for digest in set(self._objects) - live:
+                del self._objects[digest]
+        else:
+            for f in (self._root / "objects").iterdir():
+                if f.name not in live and not f.name.startswith("."):
+                    f.unlink()
+
+    def _object_base(self, digest: str) -> Optional[str]:
+        # digest of the object that this object is a delta against
+        if self._root is None:
+            header = self._objects[digest][:40]
+        else:
+            with open(self._root / "objects" / digest, "rb") as fp:
+                header = fp.read(40)
+        return None if header == _NO_BASE else header.decode()
+
+    def _write_object(
+        self,
+        digest: str,
+        arr: np.ndarray,
+        ref: Optional[dict],
+        cache: Dict[str, np.ndarray],
+    ):
+        raw = _bytes(arr)
+        header = _NO_BASE
+        if ref is not None:
+            raw = np.bitwise_xor(raw, self._read_object(ref["hash"], cache))
+            header = ref["hash"].encode()
+        # group the i-th byte of every element together: the high-order
+        # (sign and exponent) bytes are then contiguous and compress well
+        planes = raw.reshape(-1, arr.itemsize).T
+        blob = [header, bytes([arr.itemsize])]
+        for plane in planes:
+            blob.extend(self._compress(plane.tobytes()))
+        blob = b"".join(blob)
+        if self._root is None:
+            self._objects[digest] = blob
+        else:
+            _atomic_write(self._root / "objects" / digest, blob)
+
+    def _read_object(self, digest: str, cache: Dict[str, np.ndarray]) -> np.ndarray:
+        # returns the raw bytes of the tensor with the given digest
+        if digest in cache:
+            return cache[digest]
+        if self._root is None:
+            blob = self._objects[digest]
+        else:
+            with open(self._root / "objects" / digest, "rb") as fp:
+                blob = fp.read()
+        header, itemsize = blob[:40], blob[40]
+        planes, offset = [], _HEADER
+        for _ in range(itemsize):
+            compressed = blob[offset]
+            size = int.from_bytes(blob[offset + 1 : offset + 9], "little")
+            plane = blob[offset + 9 : offset + 9 + size]
+            plane = zlib.decompress(plane) if compressed else plane
+            planes.append(np.frombuffer(plane, dtype=np.uint8))
+            offset += 9 + size
+        raw = np.stack(planes, axis=1).reshape(-1)
+        if header != _NO_BASE:
+            raw = np.bitwise_xor(raw, self._read_object(header.decode(), cache))
+        cache[digest] = raw
+        return raw
+
+    def _compress(self, plane: bytes):
+        # noisy planes (e.g. the low-order mantissa bytes) don't compress: compressing
+        # a sample first avoids spending most of the time on them for nothing
+        sample = plane[:_SAMPLE_SIZE]
+        compressed = len(zlib.compress(sample, self._level)) < 0.9 * len(sample)
+        if compressed:
+            plane = zlib.compress(plane, self._level)
+        return bytes([compressed]), len(plane).to_bytes(8, "little"), plane
+
+
+def _as_numpy(value: torch.Tensor) -> np.ndarray:
+    value = value.detach().cpu().contiguous()
+    if value.dtype == torch.bfloat16:
+        # numpy has no bfloat16; keep the bits
+        return value.view(torch.int16).numpy()
+    return value.numpy()
+
+
+def _numpy_dtype(dtype: torch.dtype):
+    if dtype == torch.bfloat16:
+        return np.int16
+    return torch.empty((), dtype=dtype).numpy().dtype
+
+
+def _digest(dtype: torch.dtype, arr: np.ndarray) -> str:
+    h = hashlib.sha1(f"{dtype}{arr.shape}".encode())
+    h.update(_bytes(arr).data)
+    return h.hexdigest()
+
+
+def _bytes(arr: np.ndarray) -> np.ndarray:
+    return arr.reshape(-1).view(np.uint8)
+
+
+def _atomic_write(path: Path, data: bytes):
+    # write to a temporary file in the same directory and rename it so that
+    # readers never observe a partially written file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
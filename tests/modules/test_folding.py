@@ -0,0 +1,69 @@
+import torch
+from torch import nn
+from torch.nn import functional as F
+from torch.nn.utils import weight_norm
+
+from alr.modules.folding import fold_weight_norm, fold_batch_norm
+
+
+class Net(nn.Module):
+    def __init__(self):
+        super(Net, self).__init__()
+        self.conv1 = weight_norm(nn.Conv2d(3, 8, 3, padding=1))
+        self.bn1 = nn.BatchNorm2d(8)
+        self.conv2 = weight_norm(nn.Conv2d(8, 8, 3, padding=1))
+        self.bn2 = nn.BatchNorm2d(8)
+        self.fc = weight_norm(nn.Linear(8, 10))
+
+    def forward(self, x):
+        x = F.relu(self.bn1(self.conv1(x)))
+        x = F.relu(self.bn2(self.conv2(x)))
+        return F.log_softmax(self.fc(x.mean(dim=(2, 3))), dim=-1)
+
+
+def _randomise_bn(model):
+    for m in model.modules():
+        if isinstance(m, nn.BatchNorm2d):
+            m.running_mean.normal_()
+            m.running_var.uniform_(0.5, 2)
+            m.weight.data.normal_()
+            m.bias.data.normal_()
+
+
+def test_fold_weight_norm():
+    model = Net().eval()
+    x = torch.randn(4, 3, 8, 8)
+    expected = model(x)
+    assert fold_weight_norm(model) == 3
+    assert not hasattr(model.conv1, "weight_g")
+    assert isinstance(model.fc.weight, nn.Parameter)
+    assert torch.allclose(model(x), expected, atol=1e-6)
+
+
+def test_fold_batch_norm():
+    model = Net().eval()
+    _randomise_bn(model)
+    x = torch.randn(4, 3, 8, 8)
+    expected = model(x)
+    fold_weight_norm(model)
+    assert fold_batch_norm(model, x) == 2
+    assert isinstance(model.bn1, nn.Identity) and isinstance(model.bn2, nn.Identity)
+    assert torch.allclose(model(x), expected, atol=1e-5)
+
+
+def test_fold_batch_norm_skips_shared_output():
+    class Residual(nn.Module):
+        def __init__(self):
+            super(Residual, self).__init__()
+            self.conv = nn.Conv2d(3, 3, 1)
+            self.bn = nn.BatchNorm2d(3)
+            self.bn_shared = nn.BatchNorm2d(3)
+
+        def forward(self, x):
+            # the same batch norm layer is applied to a non-conv output too
+            x = self.bn(self.conv(x))
+            return self.bn_shared(self.conv(x)) + self.bn_shared(x)
+
+    model = Residual().eval()
+    x = torch.randn(2, 3, 4, 4)
+    assert fold_batch_norm(model, x) == 0
@@ -0,0 +1,111 @@
+import pytest
+import torch
+from torch import nn
+from torch.nn import functional as F
+
+from alr.modules.dropout import (
+    replace_dropout,
+    replace_consistent_dropout,
+    PersistentDropout,
+    ConsistentDropout,
+)
+from alr.modules.graph import (
+    split_at_last_dropout,
+    split_at_first_dropout,
+    stochastic_layers,
+)
+
+
+class Net(nn.Module):
+    def __init__(self):
+        super(Net, self).__init__()
+        self.conv = nn.Conv2d(1, 8, 3)
+        self.drop1 = nn.Dropout2d()
+        self.fc1 = nn.Linear(8, 16)
+        self.drop2 = nn.Dropout()
+        self.fc2 = nn.Linear(16, 10)
+
+    def forward(self, x):
+        x = self.drop1(F.relu(self.conv(x))).mean(dim=(2, 3))
+        return F.log_softmax(self.fc2(self.drop2(F.relu(self.fc1(x)))), dim=-1)
+
+
+class FunctionalNet(nn.Module):
+    def __init__(self):
+        super(FunctionalNet, self).__init__()
+        self.fc1 = nn.Linear(10, 16)
+        self.fc2 = nn.Linear(16, 10)
+
+    def forward(self, x):
+        x = F.dropout(F.relu(self.fc1(x)), 0.3, self.training)
+        return F.log_softmax(self.fc2(x), dim=-1)
+
+
+class SkipNet(nn.Module):
+    def __init__(self):
+        super(SkipNet, self).__init__()
+        self.fc1 = nn.Linear(10, 10)
+        self.drop = nn.Dropout()
+
+    def forward(self, x):
+        h = F.relu(self.fc1(x))
+        return self.drop(h) + x
+
+
+def test_split_at_last_dropout():
+    net = replace_dropout(Net())
+    with pytest.raises(ValueError):
+        split_at_last_dropout(net)
+    backbone, head = split_at_last_dropout(net, drop_backbone_dropout=True)
+    # parameters are shared
+    assert backbone.fc1.weight is net.fc1.weight
+    assert head.fc2.weight is net.fc2.weight
+
+    x = torch.randn(4, 1, 6, 6)
+    # the first dropout layer is skipped
+    net.drop1.p = 0.0
+    torch.manual_seed(0)
+    expected = net(x)
+    features = backbone(x)
+    assert features.size() == (4, 16)
+    torch.manual_seed(0)
+    assert torch.allclose(head(features), expected)
+
+
+def test_split_at_last_dropout_errors():
+    with pytest.raises(ValueError):
+        split_at_last_dropout(nn.Linear(10, 10))
+    # the head uses the input too
+    with pytest.raises(ValueError):
+        split_at_last_dropout(SkipNet())
+
+
+def test_replace_functional_dropout():
+    net = FunctionalNet().eval()
+    x = torch.randn(8, 10)
+    # functional dropout is a no-op in eval mode
+    assert torch.allclose(net(x), net(x))
+
+    replaced = replace_dropout(net, functional=True).eval()
+    assert replaced.fc1 is net.fc1
+    assert isinstance(replaced.functional_dropout_0, PersistentDropout)
+    assert replaced.functional_dropout_0.p == 0.3
+    assert not torch.allclose(replaced(x), replaced(x))
+    assert stochastic_layers(replaced) == [(3, "functional_dropout_0")]
+
+    replaced = replace_consistent_dropout(net, functional=True).eval()
+    assert isinstance(replaced.functional_dropout_0, ConsistentDropout)
+    assert torch.allclose(replaced(x), replaced(x))
+
+
+def test_split_at_first_dropout():
+    net = replace_dropout(Net())
+    assert [name for _, name in stochastic_layers(net)] == ["drop1", "drop2"]
+    prefix, suffix = split_at_first_dropout(net)
+    x = torch.randn(4, 1, 6, 6)
+    features = prefix(x)
+    assert torch.allclose(features, F.relu(net.conv(x)))
+    torch.manual_seed(0)
+    expected = net(x)
+    torch.manual_seed(0)
+    assert torch.allclose(suffix(features), expected)
@@ -3,7 +3,7 @@ import pytest
 from torch import nn
 from torch.nn.modules.dropout import _DropoutNd
 from torch.nn import functional as F
-from alr.modules.dropout import replace_dropout
+from alr.modules.dropout import replace_dropout, replace_consistent_dropout
 
 
 class Net1(nn.Module):
@@ -51,6 +51,17 @@ def test_dropout_replacement_no_clone():
     model.apply(_is_persistent)
 
 
+def test_dropout_replacement_converts_replaced():
+    model = replace_dropout(Net())
+    drop = model.drop
+    # already persistent: left as it is
+    assert replace_dropout(model).drop is drop
+    model = replace_consistent_dropout(model)
+    assert type(model.drop).__name__ == "ConsistentDropout"
+    assert type(model.nn.drop).__name__ == "ConsistentDropout"
+    assert model.drop.p == 0.3
+
+
 def test_functional_dropout_warn():
     class WarnNet(nn.Module):
         def forward(self, x):
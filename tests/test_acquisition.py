@@ -1,7 +1,11 @@
-from alr.acquisition import BALD, RandomAcquisition, ICAL
+from alr import MCDropout
+from alr.acquisition import BALD, RandomAcquisition, ICAL, selection_agreement
+from alr.utils import eval_fwd_exp
 import numpy as np
 import torch
 import torch.utils.data as torchdata
+from torch import nn
+from torch.nn import functional as F
 
 
 class FromArray(torchdata.Dataset):
@@ -68,3 +72,34 @@ def test_BALD_worst_case():
     # need to acquire all points to find the worst!
     idxs = bald(X_pool, b=100)
     assert idxs[-1] == worst_point
+
+
+def test_BALD_quantised_agreement():
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.fc1 = nn.Linear(28, 64)
+            self.drop = nn.Dropout()
+            self.fc2 = nn.Linear(64, 10)
+
+        def forward(self, x):
+            return F.log_softmax(self.fc2(self.drop(F.relu(self.fc1(x)))), dim=-1)
+
+    torch.manual_seed(0)
+    np.random.seed(0)
+    model = MCDropout(Net(), forward=10)
+    X_pool = FromArray(np.random.normal(size=(200, 28)).astype(np.float32))
+    fp32 = BALD(eval_fwd_exp(model), batch_size=50)
+    int8 = BALD(eval_fwd_exp(model, quantise=True), batch_size=50)
+    # same random state, same predictions => perfect agreement
+    assert selection_agreement(fp32, fp32, X_pool, b=10) == 1
+    # same dropout masks, only the linear layers' precision differs
+    assert selection_agreement(fp32, int8, X_pool, b=10) >= 0.8
+    quantised = model.quantise(torch.zeros(1, 28))
+    dynamic = getattr(torch, "ao", torch).nn.quantized.dynamic.Linear
+    assert isinstance(quantised.base_model.fc1, dynamic)
+    assert isinstance(quantised.base_model.fc2, dynamic)
+    # int8 scores should still be strongly correlated with fp32 scores
+    assert np.corrcoef(fp32.recent_score, int8.recent_score)[0, 1] > 0.5
+    # fp32 model is left untouched
+    assert isinstance(model.base_model.fc1, nn.Linear)
@@ -1,10 +1,14 @@
 import torch
 import numpy as np
 import copy
+import pytest
+import warnings
 
-from alr import MCDropout, ALRModel
+from alr import MCDropout, ALRModel, DeepEnsemble
+from alr.modules.dropout import PersistentDropout2d
 from torch import nn
 from torch.nn import functional as F
+from torch.nn.utils import weight_norm
 
 
 class Net1(nn.Module):
@@ -252,6 +256,32 @@ def test_ALRModel_reset_weights():
         assert torch.allclose(v, store[k])
 
 
+def test_ALRModel_named_snapshots():
+    net = MCDropout(Net2(), forward=5)
+    optim = torch.optim.SGD(net.parameters(), lr=0.1)
+    data = torch.randn(16, 10)
+    targets = torch.randint(0, 10, size=(16,))
+    states = []
+    for i in range(3):
+        loss = F.nll_loss(net(data), targets)
+        optim.zero_grad()
+        loss.backward()
+        optim.step()
+        net.snap(f"round_{i}")
+        states.append(copy.deepcopy(net.state_dict()))
+    assert net.snapshots.names == ["round_0", "round_1", "round_2"]
+
+    # named snapshots don't replace the last (unnamed) snapshot
+    net.reset_weights()
+    for k, v in net.state_dict().items():
+        assert not torch.equal(v, states[0][k])
+    net.reset_weights("round_1")
+    for k, v in net.state_dict().items():
+        assert torch.equal(v, states[1][k])
+    # snapshots aren't carried over to exported copies
+    assert net.export(data)._snapshot_store is None
+
+
 def test_mc_dropout_fast_img_data(benchmark):
     class Net(nn.Module):
         def __init__(self):
@@ -340,3 +370,420 @@ def test_mc_dropout_regular_flat_data(benchmark):
             net.stochastic_forward(data)
 
     benchmark(regular)
+
+
+def test_mc_dropout_jit_flat_data(benchmark):
+    data = torch.from_numpy(np.random.normal(size=(32, 10))).float()
+    net = MCDropout(Net2(), forward=50, fast=False, jit=True)
+    with torch.no_grad():
+        # the first call traces the model
+        net.stochastic_forward(data)
+
+    def jit():
+        with torch.no_grad():
+            net.stochastic_forward(data)
+
+    benchmark(jit)
+
+
+def test_mc_dropout_jit_img_data(benchmark):
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv1 = nn.Conv2d(3, 32, 5)
+            self.dropout1 = nn.Dropout2d()
+            self.conv2 = nn.Conv2d(32, 64, 5)
+            self.dropout2 = nn.Dropout2d()
+            self.fc1 = nn.Linear(64 * 4 * 4, 128)
+            self.fc2 = nn.Linear(128, 10)
+
+        def forward(self, x):
+            x = F.max_pool2d(self.dropout1(F.relu(self.conv1(x))), 2)
+            x = F.max_pool2d(self.dropout2(F.relu(self.conv2(x))), 2)
+            x = x.view(-1, 64 * 4 * 4)
+            x = self.fc2(F.relu(self.fc1(x)))
+            return F.log_softmax(x, dim=1)
+
+    img = torch.from_numpy(np.random.normal(size=(32, 3, 28, 28))).float()
+    net = MCDropout(Net(), forward=20, fast=True, jit=True)
+    with torch.no_grad():
+        net.stochastic_forward(img)
+
+    def jit():
+        with torch.no_grad():
+            net.stochastic_forward(img)
+
+    benchmark(jit)
+
+
+def test_mc_dropout_jit_matches_python():
+    data = torch.randn(16, 10)
+    for fast in (False, True):
+        net = MCDropout(Net2(), forward=5, fast=fast, jit=True)
+        for training in (True, False):
+            net.train(training)
+            # trace
+            net(data)
+            torch.manual_seed(0)
+            traced = net(data)
+            traced.sum().backward()
+            grad = net.base_model.fc.weight.grad.clone()
+            net.zero_grad()
+
+            net._jit = False
+            torch.manual_seed(0)
+            expected = net(data)
+            expected.sum().backward()
+            net._jit = True
+            assert torch.allclose(traced, expected)
+            assert torch.allclose(grad, net.base_model.fc.weight.grad)
+            net.zero_grad()
+        assert len(net._traced) == 2
+        # copies don't share traced graphs
+        assert len(copy.deepcopy(net)._traced) == 0
+
+
+def test_mc_dropout_jit_consistent():
+    net = MCDropout(Net2(), forward=5, consistent=True, jit=True).eval()
+    data = torch.randn(16, 10)
+    with torch.no_grad():
+        preds = net.stochastic_forward(data)
+        # masks are kept across batches
+        assert torch.allclose(preds, net.stochastic_forward(data))
+        # and refreshed (along with the traced graphs) when eval is called again
+        net.eval()
+        assert not torch.allclose(preds, net.stochastic_forward(data))
+
+
+def test_mc_dropout_jit_fallback():
+    class Net(Net2):
+        def forward(self, x):
+            if torch.jit.is_tracing() and x.size(0) == 3:
+                raise RuntimeError("untraceable")
+            return super().forward(x)
+
+    net = MCDropout(Net(), forward=5, jit=True).eval()
+    with torch.no_grad():
+        with pytest.warns(UserWarning, match="python execution"):
+            net.stochastic_forward(torch.randn(3, 10))
+        # only the input size that couldn't be traced falls back to python
+        net.stochastic_forward(torch.randn(4, 10))
+    assert net._jit
+    traced = {key[3]: module for key, module in net._traced.items()}
+    assert isinstance(traced[(4, 10)], torch.jit.ScriptModule)
+    assert not isinstance(traced[(3, 10)], torch.jit.ScriptModule)
+
+
+def test_mc_dropout_feature_cache():
+    import torch.utils.data as torchdata
+    from alr.data import UnlabelledDataset
+
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.fc1 = nn.Linear(10, 16)
+            self.bn = nn.BatchNorm1d(16)
+            self.drop = nn.Dropout()
+            self.fc2 = nn.Linear(16, 10)
+
+        def forward(self, x):
+            x = F.relu(self.bn(self.fc1(x)))
+            return F.log_softmax(self.fc2(self.drop(x)), dim=-1)
+
+    net = MCDropout(Net(), forward=5)
+    cache = net.feature_cache(batch_size=8)
+    data = torch.randn(30, 10)
+    pool = UnlabelledDataset(torchdata.TensorDataset(data, torch.zeros(30)))
+
+    features = cache.features(pool)
+    assert features.size() == (30, 16)
+    # computing features doesn't change the model's mode
+    assert net.training
+    net.eval()
+    torch.manual_seed(0)
+    expected = net.stochastic_forward(data)
+    torch.manual_seed(0)
+    assert torch.allclose(cache.head.stochastic_forward(features), expected)
+
+    # cached features are keyed by the absolute pool index
+    pool.label([0, 10])
+    transformed = cache.transform(pool)
+    assert len(transformed) == 28
+    assert torch.equal(transformed[0], features[1])
+    assert torch.equal(transformed[9], features[11])
+
+    # the cache is cleared when the weights change
+    optim = torch.optim.SGD(net.parameters(), lr=0.1)
+    net.train()
+    loss = F.nll_loss(net(data), torch.zeros(30, dtype=torch.long))
+    optim.zero_grad()
+    loss.backward()
+    optim.step()
+    assert not torch.allclose(cache.features(pool), transformed._features)
+    net.reset_weights()
+    assert torch.allclose(cache.features(pool)[0], features[1])
+
+
+def test_mc_dropout_deterministic_prefix():
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv = nn.Conv2d(1, 8, 3)
+            self.fc1 = nn.Linear(8 * 4 * 4, 16)
+            self.fc2 = nn.Linear(16, 10)
+
+        def forward(self, x):
+            x = F.max_pool2d(F.relu(self.conv(x)), 2).flatten(1)
+            x = F.dropout(F.relu(self.fc1(x)), 0.5, self.training)
+            return F.log_softmax(self.fc2(x), dim=-1)
+
+    img = torch.randn(6, 1, 10, 10)
+    for fast in (False, True):
+        for jit in (False, True):
+            net = Net()
+            full = MCDropout(net, forward=5, fast=fast, jit=jit, functional=True)
+            split = MCDropout(
+                net,
+                forward=5,
+                fast=fast,
+                jit=jit,
+                functional=True,
+                deterministic_prefix=True,
+            )
+            full.eval()
+            split.eval()
+            with torch.no_grad():
+                torch.manual_seed(0)
+                expected = full.stochastic_forward(img)
+                torch.manual_seed(0)
+                preds = split.stochastic_forward(img)
+            assert preds.size() == (5, 6, 10)
+            assert (expected.var(dim=0) > 0).any()
+            assert torch.allclose(preds, expected, atol=1e-6)
+
+
+def test_mc_dropout_export():
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv1 = weight_norm(nn.Conv2d(3, 16, 3, padding=1))
+            self.bn1 = nn.BatchNorm2d(16)
+            self.drop = nn.Dropout()
+            self.fc1 = weight_norm(nn.Linear(16, 10))
+
+        def forward(self, x):
+            x = self.drop(F.relu(self.bn1(self.conv1(x))))
+            return F.log_softmax(self.fc1(x.mean(dim=(2, 3))), dim=-1)
+
+    net = MCDropout(Net(), forward=10)
+    net.base_model.bn1.running_mean.normal_()
+    img = torch.randn(8, 3, 12, 12)
+    for trace in (False, True):
+        state = torch.get_rng_state()
+        exported = net.export(img, trace=trace)
+        # exporting doesn't consume the global random state
+        assert torch.equal(state, torch.get_rng_state())
+        assert isinstance(exported.base_model.bn1, nn.Identity) or trace
+        assert not any(p.requires_grad for p in exported.parameters())
+        torch.manual_seed(0)
+        expected = net.eval().stochastic_forward(img)
+        torch.manual_seed(0)
+        output = exported.stochastic_forward(img)
+        assert output.size() == (10, 8, 10)
+        assert torch.allclose(expected, output, atol=1e-5)
+    # original model is untouched
+    assert hasattr(net.base_model.conv1, "weight_g")
+    assert all(p.requires_grad for p in net.parameters())
+
+
+@pytest.mark.parametrize("mode", ["eager", "export", "trace", "quantise"])
+def test_export_throughput(benchmark, mode):
+    from alr.data.datasets import MNISTNet
+
+    # MNISTNet, batch size 64, 4 stochastic passes: the folded and traced copies aren't
+    # measurably faster than the eager model on CPU, the int8 copy is
+    torch.manual_seed(0)
+    model = MCDropout(MNISTNet(), forward=4).eval()
+    x = torch.randn(64, 1, 28, 28)
+    if mode == "quantise":
+        model = model.quantise(x)
+    elif mode != "eager":
+        model = model.export(x, trace=mode == "trace")
+    with torch.no_grad():
+        benchmark.pedantic(
+            model.stochastic_forward, args=(x,), rounds=5, warmup_rounds=1
+        )
+
+
+def test_quantise_static():
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv1 = weight_norm(nn.Conv2d(3, 16, 3, padding=1))
+            self.bn1 = nn.BatchNorm2d(16)
+            self.drop = nn.Dropout2d()
+            self.conv2 = nn.Conv2d(16, 8, 3)
+            self.fc1 = nn.Linear(8 * 10 * 10, 10)
+
+        def forward(self, x):
+            x = self.drop(F.relu(self.bn1(self.conv1(x))))
+            x = F.max_pool2d(F.relu(self.conv2(x)), 1)
+            return F.log_softmax(self.fc1(x.view(x.size(0), -1)), dim=-1)
+
+    quantized = getattr(torch, "ao", torch).nn.quantized
+    torch.manual_seed(0)
+    net = MCDropout(Net(), forward=10)
+    net.base_model.bn1.running_mean.normal_()
+    img = torch.randn(8, 3, 12, 12)
+    labelled = torch.utils.data.DataLoader(
+        torch.utils.data.TensorDataset(torch.randn(32, 3, 12, 12), torch.zeros(32)),
+        batch_size=8,
+    )
+    state = torch.get_rng_state()
+    int8 = net.quantise(img, calibration_data=labelled)
+    assert torch.equal(state, torch.get_rng_state())
+    # the convolutions (not just the linear layers) are quantised, dropout stays in fp32
+    modules = list(int8.base_model.modules())
+    assert sum(isinstance(m, quantized.Conv2d) for m in modules) == 2
+    assert sum(isinstance(m, quantized.Linear) for m in modules) == 1
+    assert not any(isinstance(m, (nn.Conv2d, nn.Linear)) for m in modules)
+    assert any(isinstance(m, PersistentDropout2d) for m in modules)
+    with torch.no_grad():
+        torch.manual_seed(0)
+        expected = net.eval().stochastic_forward(img).exp()
+        torch.manual_seed(0)
+        output = int8.stochastic_forward(img).exp()
+    assert output.size() == (10, 8, 10)
+    # same dropout masks, only the precision differs
+    assert torch.allclose(expected, output, atol=0.05)
+    # original model is untouched
+    assert isinstance(net.base_model.conv2, nn.Conv2d)
+
+    # ensemble members are quantised too
+    members = [Net().eval() for _ in range(3)]
+    int8 = DeepEnsemble(members).quantise(img, calibration_data=labelled)
+    for m in int8.members:
+        assert sum(isinstance(l, quantized.Conv2d) for l in m.modules()) == 2
+    with torch.no_grad():
+        expected = torch.stack([m(img) for m in members]).exp()
+        assert torch.allclose(int8.stochastic_forward(img).exp(), expected, atol=0.05)
+
+
+def test_deep_ensemble_matches_loop():
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv = nn.Conv2d(3, 8, 3)
+            self.bn = nn.BatchNorm2d(8)
+            self.fc = nn.Linear(8, 10)
+
+        def forward(self, x):
+            x = F.relu(self.bn(self.conv(x))).mean(dim=(2, 3))
+            return F.log_softmax(self.fc(x), dim=-1)
+
+    members = [Net() for _ in range(5)]
+    for m in members:
+        m.bn.running_mean.normal_()
+    img = torch.randn(7, 3, 10, 10)
+    ensemble = DeepEnsemble(members, vectorise=True).eval()
+    looped = DeepEnsemble(members, vectorise=False).eval()
+    with torch.no_grad():
+        expected = torch.stack([m(img) for m in members])
+        preds = ensemble.stochastic_forward(img)
+        assert preds.size() == (5, 7, 10)
+        assert torch.allclose(preds, expected, atol=1e-5)
+        assert torch.allclose(looped.stochastic_forward(img), expected)
+        assert torch.allclose(
+            ensemble(img),
+            torch.logsumexp(expected, dim=0) - np.log(5),
+            atol=1e-5,
+        )
+        # stacked weights are rebuilt when a member changes
+        members[0].fc.bias.add_(1.0)
+        assert torch.allclose(ensemble.stochastic_forward(img)[0], members[0](img))
+
+    # reset_weights restores every member
+    ensemble.reset_weights()
+    with torch.no_grad():
+        assert torch.allclose(ensemble.stochastic_forward(img), expected, atol=1e-5)
+
+
+def test_deep_ensemble_output_transform():
+    members = [Net1() for _ in range(3)]
+    ensemble = DeepEnsemble(
+        members, output_transform=lambda x: F.log_softmax(x, dim=1), reduce="mean"
+    ).eval()
+    data = torch.randn(4, 10)
+    with torch.no_grad():
+        preds = ensemble.stochastic_forward(data)
+        assert preds.size() == (3, 4, 10)
+        assert torch.allclose(preds.exp().sum(dim=-1), torch.ones(3, 4))
+        assert torch.allclose(ensemble(data), preds.mean(dim=0))
+
+
+def test_deep_ensemble_fallback():
+    from alr.modules import ensemble as ens
+
+    if ens.vmap is None:
+        pytest.skip("torch.func is not available")
+
+    class Net(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.fc = nn.Linear(4, 2)
+
+        def forward(self, x):
+            if x.size(0) == 1:
+                # data-dependent control flow can't be vectorised
+                return self.fc(x) * self.fc.bias[0].item()
+            return self.fc(x)
+
+    members = [Net() for _ in range(3)]
+    ensemble = DeepEnsemble(members, vectorise=True).eval()
+    with torch.no_grad():
+        x = torch.randn(1, 4)
+        with pytest.warns(UserWarning, match="Couldn't vectorise"):
+            preds = ensemble.stochastic_forward(x)
+        assert torch.allclose(preds, torch.stack([m(x) for m in members]))
+        # only that call fell back to the loop
+        assert ensemble._stacked._vectorise
+        x = torch.randn(5, 4)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            preds = ensemble.stochastic_forward(x)
+        assert torch.allclose(preds, torch.stack([m(x) for m in members]), atol=1e-6)
+
+
+@pytest.mark.parametrize("vectorise", [False, True])
+def test_deep_ensemble_throughput(benchmark, vectorise):
+    from alr.data.datasets import MNISTNet
+
+    # 5 MNISTNet members, batch size 128, on CPU: the loop (the default on CPU) is faster,
+    # vmap only pays off on CUDA where it saves kernel launches
+    members = [MNISTNet() for _ in range(5)]
+    ensemble = DeepEnsemble(members, vectorise=vectorise).eval()
+    x = torch.randn(128, 1, 28, 28)
+    with torch.no_grad():
+        benchmark.pedantic(
+            ensemble.stochastic_forward, args=(x,), rounds=3, warmup_rounds=1
+        )
+
+
+def test_import_time(benchmark):
+    import subprocess
+    import sys
+
+    # `import alr` and `import alr.data` shouldn't import heavy optional dependencies
+    check = (
+        "import sys, alr, alr.data, alr.data.datasets; "
+        "print(','.join(m for m in ('torchvision', 'ignite', 'matplotlib') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+
+    def run():
+        subprocess.run([sys.executable, "-c", "import alr"], check=True)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
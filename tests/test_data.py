@@ -1,7 +1,9 @@
+import pytest
 import numpy as np
 import torch
 import torch.utils.data as torchdata
 import itertools
+import pickle
 
 from alr.data import DataManager, UnlabelledDataset, RelabelDataset, PseudoLabelDataset
 from alr.data.datasets import Dataset
@@ -214,6 +216,39 @@ def test_data_manager():
     assert dm.unlabelled is pool
 
 
+def test_data_manager_state_dict():
+    from alr.acquisition import RandomAcquisition
+
+    def make():
+        pool = UnlabelledDataset(DummyData(100, target=True))
+        return DataManager(DummyData(5, target=True), pool, RandomAcquisition())
+
+    np.random.seed(0)
+    dm = make()
+    for b in (3, 7, 2):
+        dm.acquire(b)
+    state = dm.state_dict()
+    # replayed in order without calling the acquisition function
+    restored = make()
+    restored.load_state_dict(state)
+    assert restored.n_labelled == dm.n_labelled == 17
+    assert [int(x) for x, _ in restored.labelled] == [int(x) for x, _ in dm.labelled]
+    assert [int(x) for x in restored.unlabelled] == [int(x) for x in dm.unlabelled]
+    assert restored.unlabelled.labelled_indices == dm.unlabelled.labelled_indices
+    # the unlabelled dataset's state on its own
+    pool = UnlabelledDataset(DummyData(100, target=True))
+    pool.load_state_dict(dm.unlabelled.state_dict())
+    assert pool.labelled_indices == dm.unlabelled.labelled_indices
+    assert len(pool) == 100 - 12
+
+    dm.append_to_labelled(DummyData(2, target=True))
+    with pytest.raises(RuntimeError):
+        dm.state_dict()
+    dm.reset()
+    restored.load_state_dict(dm.state_dict())
+    assert restored.n_labelled == 5 and restored.n_unlabelled == 100
+
+
 def test_relabel_dataset():
     _, test = Dataset.MNIST.get()
     fake_classes = np.random.randint(0, 100, size=len(test))
@@ -276,3 +311,405 @@ def test_unlabelled_data_debug_nested():
             assert pool.debug
         assert pool.debug
     assert not pool.debug
+
+
+def test_cached_dataset(tmp_path):
+    from PIL import Image
+    from torchvision import transforms
+    from alr.data.cache import CachedDataset, build_cache
+
+    class ImageData(torchdata.Dataset):
+        def __init__(self, data, targets):
+            self.data = data
+            self.targets = targets
+
+        def __getitem__(self, idx):
+            return Image.fromarray(self.data[idx]), self.targets[idx]
+
+        def __len__(self):
+            return len(self.data)
+
+    class PILOnlyData(torchdata.Dataset):
+        # no data/targets attributes: items are decoded one at a time
+        def __init__(self, data, targets):
+            self._ds = ImageData(data, targets)
+
+        def __getitem__(self, idx):
+            return self._ds[idx]
+
+        def __len__(self):
+            return len(self._ds)
+
+    rng = np.random.RandomState(0)
+    mean, std = (0.1, 0.2, 0.3), (0.3, 0.2, 0.1)
+    for shape in [(20, 8, 8), (20, 8, 8, 3)]:
+        data = rng.randint(0, 256, size=shape).astype(np.uint8)
+        targets = list(rng.randint(0, 10, size=20))
+        c = 1 if len(shape) == 3 else 3
+        expected = transforms.Compose(
+            [transforms.ToTensor(), transforms.Normalize(mean[:c], std[:c])]
+        )
+        for i, cls in enumerate([ImageData, PILOnlyData]):
+            path = build_cache(cls(data, targets), tmp_path / f"{len(shape)}_{i}")
+            ds = CachedDataset(path, mean[:c], std[:c])
+            assert len(ds) == 20
+            np.testing.assert_array_equal(ds.targets, targets)
+            for idx in range(20):
+                x, y = ds[idx]
+                assert y == targets[idx]
+                assert torch.allclose(
+                    x, expected(Image.fromarray(data[idx])), atol=1e-5
+                )
+            idxs = [5, 1, 19, 1, 0]
+            xs, ys = ds.get_batch(idxs)
+            assert torch.equal(xs, torch.stack([ds[j][0] for j in idxs]))
+            assert ys.tolist() == [targets[j] for j in idxs]
+
+
+def test_batch_transforms():
+    import torch.nn.functional as F
+    from PIL import Image
+    from torchvision import transforms
+    from alr.data import TransformedDataset
+    from alr.data.batch_transforms import (
+        BatchTransformLoader,
+        Compose,
+        OneHot,
+        RandomCrop,
+        RandomHorizontalFlip,
+    )
+
+    x = torch.randint(0, 256, (16, 3, 32, 32), dtype=torch.uint8)
+    xf = x.float() / 255
+    padded = F.pad(xf, [2] * 4)
+    out = Compose([RandomCrop(32, padding=2), RandomHorizontalFlip()], seed=0)(x)
+    for n in range(16):
+        # every output is a (possibly flipped) crop of the padded image
+        crops = [
+            padded[n, :, i : i + 32, j : j + 32] for i in range(5) for j in range(5)
+        ]
+        assert any(
+            torch.equal(out[n], c) or torch.equal(out[n], c.flip(-1)) for c in crops
+        )
+
+    # the augmentation of a sample only depends on the seed, epoch, and index
+    aug = Compose.from_torchvision(Dataset.CIFAR10.get_augmentation, seed=1)
+    batch = aug(x, idxs=range(16))
+    assert torch.allclose(aug(x[[3, 7]], idxs=[3, 7]), batch[[3, 7]], atol=1e-6)
+    aug.set_epoch(1)
+    assert not torch.allclose(aug(x, idxs=range(16)), batch)
+
+    raw = [
+        (Image.fromarray(xi.permute(1, 2, 0).numpy()), i % 3) for i, xi in enumerate(x)
+    ]
+    ds = TransformedDataset(
+        raw,
+        transform=[transforms.ToTensor(), transforms.Normalize((0.5,) * 3, (0.5,) * 3)],
+    )
+    decoded, transform = ds.batched(seed=0)
+    assert torch.equal(decoded[0][0], x[0])
+    loader = BatchTransformLoader(
+        torchdata.DataLoader(decoded, batch_size=5),
+        transform=transform,
+        target_transform=OneHot(3),
+    )
+    assert len(loader) == 4
+    xs, ys = zip(*loader)
+    assert torch.allclose(torch.cat(xs), torch.stack([ds[i][0] for i in range(16)]))
+    assert torch.equal(torch.cat(ys).argmax(1), torch.arange(16) % 3)
+
+
+def test_packed_cinic10(tmp_path, monkeypatch):
+    from torchvision import transforms
+    from alr.data import datasets
+    from alr.data.cache import CachedDataset, build_cache
+
+    class ImageData(torchdata.Dataset):
+        def __init__(self, n):
+            self.data = np.random.randint(0, 256, size=(n, 32, 32, 3), dtype=np.uint8)
+            self.targets = list(np.random.randint(0, 10, size=n))
+
+        def __getitem__(self, idx):
+            return self.data[idx], self.targets[idx]
+
+        def __len__(self):
+            return len(self.data)
+
+    monkeypatch.setattr(datasets, "_CINIC_ROOT", tmp_path)
+    assert not datasets._is_packed(tmp_path)
+    raw = {"train": ImageData(30), "test": ImageData(20)}
+    for split, ds in raw.items():
+        build_cache(ds, tmp_path / "packed" / split)
+    assert datasets._is_packed(tmp_path)
+
+    # picked up without building ImageFolders
+    train, test = Dataset.CINIC10.get()
+    assert isinstance(train, CachedDataset) and isinstance(test, CachedDataset)
+    assert len(train) == 30 and len(test) == 20
+    normalise = transforms.Compose(
+        [
+            transforms.ToTensor(),
+            transforms.Normalize(*Dataset.CINIC10.normalisation_params),
+        ]
+    )
+    x, y = test[3]
+    assert torch.allclose(x, normalise(raw["test"].data[3]), atol=1e-5)
+    assert y == raw["test"].targets[3]
+
+
+def test_get_targets():
+    from alr.data import TransformedDataset, class_counts, get_targets
+
+    class Targets(torchdata.Dataset):
+        def __init__(self, n):
+            self.targets = torch.arange(n) % 3
+
+        def __getitem__(self, idx):
+            raise AssertionError("The points shouldn't be loaded.")
+
+        def __len__(self):
+            return len(self.targets)
+
+    ds = torchdata.ConcatDataset(
+        [TransformedDataset(Targets(9)), torchdata.Subset(Targets(6), [5, 4])]
+    )
+    expected = np.r_[np.arange(9) % 3, 2, 1]
+    np.testing.assert_array_equal(get_targets(ds), expected)
+    np.testing.assert_array_equal(class_counts(ds, 4), [3, 4, 4, 0])
+
+    ud = UnlabelledDataset(ds)
+    ud.label([0, 4, 10])
+    np.testing.assert_array_equal(get_targets(ud), np.delete(expected, [0, 4, 10]))
+    np.testing.assert_array_equal(
+        get_targets(RelabelDataset(ud, torch.eye(3)[get_targets(ud)])),
+        get_targets(ud),
+    )
+    with pytest.raises(ValueError):
+        get_targets(UnlabelledDataset(ds, label_fn=lambda x: x))
+
+    # datasets without targets are read point by point
+    np.testing.assert_array_equal(get_targets(DummyData(5, target=True)), np.arange(5))
+    ud = UnlabelledDataset(DummyData(10, target=True))
+    ud.label([3, 1])
+    assert ud.labelled_classes == [1, 3]
+
+    # only the requested points are read
+    class Counted(DummyData):
+        loaded = 0
+
+        def __getitem__(self, idx):
+            Counted.loaded += 1
+            return super().__getitem__(idx)
+
+    ud = UnlabelledDataset(Counted(100, target=True))
+    ud.label([7, 2, 50])
+    assert ud.labelled_classes == [2, 7, 50]
+    assert Counted.loaded == 3
+    np.testing.assert_array_equal(get_targets(ds, [10, 2, 9]), expected[[10, 2, 9]])
+    tensors = torchdata.TensorDataset(torch.zeros(5, 2), torch.arange(5) % 2)
+    np.testing.assert_array_equal(get_targets(tensors, [4, 3]), [0, 1])
+    # tensor and one-hot targets are returned as int class indices
+    for y in (torch.arange(5) % 2, torch.eye(2)[torch.arange(5) % 2]):
+        ud = UnlabelledDataset(torchdata.TensorDataset(torch.zeros(5, 2), y))
+        ud.label([4, 1])
+        classes = ud.labelled_classes
+        assert classes == [1, 0] and all(type(c) is int for c in classes)
+
+
+def test_share_memory():
+    from alr.data import share_memory
+
+    class Targets(torchdata.Dataset):
+        def __init__(self, n):
+            self.data = torch.arange(n)
+            self.targets = list(range(n))
+
+        def __getitem__(self, idx):
+            return self.data[idx], self.targets[idx]
+
+        def __len__(self):
+            return len(self.data)
+
+    ds = Targets(20)
+    ud = UnlabelledDataset(torchdata.Subset(ds, list(range(0, 20, 2))))
+    with ud.true_labels():
+        expected = [ud[i] for i in range(len(ud))]
+    assert share_memory(ud) is ud
+    assert ud._mask.is_shared() and ds.data.is_shared()
+    assert isinstance(ds.targets, np.ndarray)
+    # arrays are sent to other processes as handles to the shared memory
+    from multiprocessing.reduction import ForkingPickler
+
+    sent = pickle.loads(ForkingPickler.dumps(ds.targets))
+    assert sent.tolist() == list(range(20)) and sent._tensor.is_shared()
+    with ud.true_labels():
+        assert [ud[i] for i in range(len(ud))] == expected
+    # stays shared when the masks are replaced
+    labelled = ud.label([0, 1])
+    assert ud._idx_mask.is_shared()
+    ud.reset()
+    assert ud._mask.is_shared() and ud._idx_mask.is_shared()
+
+    pl = PseudoLabelDataset(ud, list(range(10, 20))).share_memory()
+    rl = RelabelDataset(labelled, [5, 6]).share_memory()
+    assert [int(y) for _, y in rl] == [5, 6]
+    loader = torchdata.DataLoader(pl, batch_size=4, num_workers=2)
+    assert torch.cat([y for _, y in loader]).tolist() == list(range(10, 20))
+
+
+def test_sharded_unlabelled_dataset(tmp_path):
+    from alr.data import get_targets
+    from alr.data.sharded import ShardedUnlabelledDataset, write_shards
+
+    class Largest(AcquisitionFunction):
+        def __call__(self, X_pool, b):
+            dl = torchdata.DataLoader(X_pool, batch_size=16, num_workers=2)
+            x = torch.cat(list(dl))
+            return torch.argsort(x[:, 0], descending=True)[:b].numpy()
+
+    x = torch.randn(100, 3)
+    y = torch.randint(10, size=(100,))
+    write_shards(
+        tmp_path,
+        [(x[i : i + 30].numpy(), y[i : i + 30].numpy()) for i in range(0, 100, 30)],
+    )
+    sharded = ShardedUnlabelledDataset(tmp_path, chunk_size=16)
+    reference = UnlabelledDataset(torchdata.TensorDataset(x, y))
+    empty = torchdata.TensorDataset(torch.empty(0, 3), torch.empty(0).long())
+    dm1 = DataManager(empty, sharded, Largest())
+    dm2 = DataManager(empty, reference, Largest())
+    for _ in range(3):
+        idxs1, labelled1 = dm1.acquire(7)
+        idxs2, labelled2 = dm2.acquire(7)
+        np.testing.assert_array_equal(idxs1, idxs2)
+        for (x1, y1), (x2, y2) in zip(labelled1, labelled2):
+            assert torch.equal(x1, x2) and y1 == y2
+    assert len(sharded) == dm1.n_unlabelled == 79
+    assert sorted(sharded.labelled_indices) == sorted(reference.labelled_indices)
+    np.testing.assert_array_equal(get_targets(dm1.labelled), get_targets(dm2.labelled))
+    with sharded.true_labels():
+        xs, ys = zip(*sharded)
+    with reference.true_labels():
+        expected = [reference[i] for i in range(len(reference))]
+    assert torch.equal(torch.stack(xs), torch.stack([e[0] for e in expected]))
+    assert list(ys) == [int(e[1]) for e in expected]
+    # one packed bitmap per shard
+    state = dm1.state_dict()
+    bits = np.unpackbits(reference.state_dict()["labelled"], count=100)
+    assert len(state["unlabelled"]["labelled"]) == 4
+    for i, bitmap in enumerate(state["unlabelled"]["labelled"]):
+        np.testing.assert_array_equal(bitmap, np.packbits(bits[i * 30 : i * 30 + 30]))
+    dm1.reset()
+    assert len(sharded) == 100 and dm1.n_labelled == 0
+    dm1.load_state_dict(state)
+    assert sorted(sharded.labelled_indices) == sorted(reference.labelled_indices)
+    np.testing.assert_array_equal(get_targets(dm1.labelled), get_targets(dm2.labelled))
+
+    # the workers' points are only in order if the chunk size is the batch size
+    unordered = ShardedUnlabelledDataset(tmp_path)
+    assert len(list(torchdata.DataLoader(unordered, batch_size=16))) == 7
+    with pytest.raises(RuntimeError, match="chunk_size"):
+        list(torchdata.DataLoader(unordered, batch_size=16, num_workers=2))
+
+
+def test_get_batch():
+    from alr.data import batch_loader, get_batch
+
+    x, y = torch.randn(30, 2), torch.arange(30)
+    tensor_ds = torchdata.TensorDataset(x, y)
+    concat = torchdata.ConcatDataset(
+        [torchdata.Subset(tensor_ds, list(range(29, 9, -1))), tensor_ds]
+    )
+    ud = UnlabelledDataset(concat)
+    ud.label([0, 3, 4, 40])
+    datasets = [
+        concat,
+        ud,
+        PseudoLabelDataset(ud, list(range(len(ud)))),
+        RelabelDataset(concat, np.arange(len(concat)) % 3),
+    ]
+    for ds in datasets:
+        idxs = np.random.permutation(len(ds))[:17]
+        expected = torchdata.dataloader.default_collate([ds[i] for i in idxs])
+        batch = get_batch(ds, idxs)
+        if isinstance(expected, torch.Tensor):
+            expected, batch = [expected], [batch]
+        assert len(batch) == len(expected)
+        for b, e in zip(batch, expected):
+            assert torch.equal(b, e)
+
+    # same batches as a regular data loader
+    for batch, expected in zip(
+        batch_loader(ud, batch_size=8), torchdata.DataLoader(ud, batch_size=8)
+    ):
+        assert torch.equal(batch, expected)
+    assert len(batch_loader(ud, batch_size=8, drop_last=True)) == len(ud) // 8
+    shuffled = torch.cat(list(batch_loader(ud, batch_size=8, shuffle=True)))
+    assert sorted(shuffled[:, 0].tolist()) == sorted(
+        torch.cat(list(torchdata.DataLoader(ud, batch_size=8)))[:, 0].tolist()
+    )
+
+
+def test_synthetic_dataset():
+    from alr.data import class_counts
+    from alr.data.synthetic import SyntheticDataset
+
+    train, test = Dataset.Synthetic.get()
+    assert len(train) == 10_000_000
+    assert train[123][0].shape == (1, 28, 28)
+    # deterministic and independent of how the points are fetched
+    x, y = train.get_batch([5, 9_999_999, 5])
+    assert torch.equal(x[0], train[5][0]) and torch.equal(x[0], x[2])
+    assert int(y[1]) == Dataset.Synthetic.get()[0][9_999_999][1]
+    # test points differ from train points
+    assert not torch.equal(test[5][0], train[5][0])
+    assert abs(float(x.mean())) < 0.2 and abs(float(x.std()) - 1) < 0.2
+
+    ds = SyntheticDataset(20_000, n_class=4, shape=(7,), imbalance=8, seed=1)
+    counts = class_counts(ds)
+    assert counts.sum() == 20_000
+    assert counts[0] / counts[-1] == pytest.approx(8, rel=0.2)
+    assert np.array_equal(ds.targets[:100], ds.get_batch(range(100))[1].numpy())
+    raw = SyntheticDataset(100, shape=(7,), seed=1, normalise=False)
+    assert (
+        (raw.get_batch(range(100))[0] >= 0) & (raw.get_batch(range(100))[0] <= 1)
+    ).all()
+
+
+def test_index_view():
+    from alr.data import IndexView, get_batch, get_targets, partition, random_split
+
+    base = torchdata.TensorDataset(torch.arange(100), torch.arange(100) % 7)
+    nested = torchdata.Subset(
+        torchdata.Subset(base, list(range(99, -1, -1))), [5, 6, 7, 8]
+    )
+    view = IndexView(nested, [3, 1])
+    # flattened: one lookup away from base
+    assert view.dataset is base
+    assert view.indices.tolist() == [91, 93]
+    assert [int(x) for x, _ in view] == [91, 93]
+    assert get_targets(view).tolist() == [91 % 7, 93 % 7]
+    assert get_batch(view, [1, 0])[0].tolist() == [93, 91]
+
+    first, rest = partition(nested, [0, 2])
+    assert first.indices.tolist() == [94, 92]
+    assert rest.indices.tolist() == [93, 91]
+    assert len(first) + len(rest) == len(nested)
+
+    # same splits as torch's random_split
+    splits = random_split(view, [1, 1], generator=torch.Generator().manual_seed(0))
+    expected = torchdata.random_split(
+        view, [1, 1], generator=torch.Generator().manual_seed(0)
+    )
+    for s, e in zip(splits, expected):
+        assert [int(x) for x, _ in s] == [int(x) for x, _ in e]
+        assert s.dataset is base
+    # and the same rounding of fractional lengths: the remainder goes to the first splits
+    fractions = [0.335, 0.335, 0.33]
+    splits = random_split(base, fractions, generator=torch.Generator().manual_seed(1))
+    assert [len(s) for s in splits] == [34, 33, 33]
+    expected = torchdata.random_split(
+        base, [34, 33, 33], generator=torch.Generator().manual_seed(1)
+    )
+    for s, e in zip(splits, expected):
+        assert s.indices.tolist() == list(e.indices)
@@ -1,6 +1,7 @@
 import time
 import inspect
 import pytest
+import torch.utils.data as torchdata
 
 from alr.utils import *
 
@@ -101,3 +102,256 @@ def test_func_time():
         res = foobar()
         assert res is None
     assert len(t.tape) == 1
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_snapshot_store_round_trip(tmp_path, on_disk):
+    import torch
+
+    store = SnapshotStore(tmp_path if on_disk else None)
+    state = {
+        "w": torch.randn(20, 30),
+        "h": torch.randn(7).half(),
+        "n": torch.tensor(3),
+        "mask": torch.rand(5) > 0.5,
+    }
+    store.save("init", state)
+    trained = {k: v.clone() for k, v in state.items()}
+    trained["w"] += 1e-3 * torch.randn(20, 30)
+    trained["n"] += 1
+    store.save("trained", trained)
+    size = store.nbytes()
+    # unchanged tensors and repeated snapshots are de-duplicated
+    store.save("trained_again", trained)
+    assert store.nbytes() == size
+    assert store.names == ["init", "trained", "trained_again"]
+
+    if on_disk:
+        store = SnapshotStore(tmp_path)
+        assert store.names == ["init", "trained", "trained_again"]
+    for name, expected in (("init", state), ("trained", trained)):
+        restored = store.load(name)
+        assert list(restored) == list(expected)
+        for k, v in expected.items():
+            assert restored[k].dtype == v.dtype
+            assert torch.equal(restored[k], v)
+    with pytest.raises(KeyError):
+        store.load("missing")
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_snapshot_store_remove(tmp_path, on_disk):
+    import torch
+
+    store = SnapshotStore(tmp_path if on_disk else None)
+    state = {"w": torch.randn(20, 30), "b": torch.randn(30)}
+    store.save("init", state)
+    size = store.nbytes()
+    trained = {"w": state["w"] + 1e-3 * torch.randn(20, 30), "b": torch.randn(30)}
+    store.save("trained", trained)
+    store.remove("trained")
+    assert store.names == ["init"]
+    assert store.nbytes() == size
+
+    # "trained" is a delta against "init": the tensors it depends on are kept
+    store.save("trained", trained)
+    store.remove("init")
+    assert store.names == ["trained"]
+    if on_disk:
+        store = SnapshotStore(tmp_path)
+    restored = store.load("trained")
+    for k, v in trained.items():
+        assert torch.equal(restored[k], v)
+    with pytest.raises(KeyError):
+        store.remove("init")
+
+    store.clear()
+    assert len(store) == 0
+    assert store.nbytes() == 0
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_snapshot_store_overwrite(tmp_path, on_disk):
+    import torch
+
+    store = SnapshotStore(tmp_path if on_disk else None)
+    store.save("init", {"w": torch.randn(20, 30)})
+    sizes = []
+    for _ in range(4):
+        # e.g. snap("best") whenever the validation accuracy improves
+        store.save("best", {"w": torch.randn(20, 30)})
+        sizes.append(store.nbytes())
+    # only the latest "best" is kept (random tensors compress to slightly different sizes)
+    assert max(sizes) < 1.1 * min(sizes)
+    assert store.names == ["init", "best"]
+
+
+def _build_member():
+    import torch
+
+    return torch.nn.Linear(4, 3)
+
+
+def _train_member(model, member, x, y):
+    import torch
+
+    optim = torch.optim.SGD(model.parameters(), lr=0.1)
+    for _ in range(5):
+        optim.zero_grad()
+        loss = torch.nn.functional.cross_entropy(model(x), y)
+        loss.backward()
+        optim.step()
+    return {"member": member, "loss": loss.item()}
+
+
+def test_train_ensemble():
+    import functools
+    import torch
+
+    x, y = torch.randn(32, 4), torch.randint(3, size=(32,))
+    train = functools.partial(_train_member, x=x, y=y)
+    serial, serial_hist = train_ensemble(_build_member, train, 3, seed=1, processes=0)
+    state = torch.get_rng_state()
+    pooled, pooled_hist = train_ensemble(_build_member, train, 3, seed=1, processes=2)
+    # the data is shared with the workers and the caller's RNG isn't consumed
+    assert x.is_shared() and y.is_shared()
+    assert torch.equal(torch.get_rng_state(), state)
+    assert [h["member"] for h in pooled_hist] == [0, 1, 2]
+    assert serial_hist == pooled_hist
+    for a, b in zip(serial.models, pooled.models):
+        assert torch.equal(a.weight, b.weight)
+    # members are initialised (and hence trained) differently
+    assert not torch.equal(serial.models[0].weight, serial.models[1].weight)
+    assert len(member_seeds(1, 3)) == len(set(member_seeds(1, 3))) == 3
+
+
+def test_checkpoint_resume(tmp_path):
+    import random
+    import numpy as np
+    import torch
+    from alr import MCDropout
+    from alr.acquisition import RandomAcquisition
+    from alr.data import DataManager, UnlabelledDataset
+
+    def setup():
+        manual_seed(0)
+        data = torch.utils.data.TensorDataset(torch.randn(60, 4), torch.arange(60))
+        model = MCDropout(torch.nn.Linear(4, 3), forward=2)
+        optim = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+        dm = DataManager(
+            torch.utils.data.Subset(data, range(5)),
+            UnlabelledDataset(data),
+            RandomAcquisition(),
+        )
+        return dm, model, optim
+
+    def run(dm, model, optim, rounds, accs, ckpt=None):
+        for r in rounds:
+            model.reset_weights()
+            x, y = next(iter(torch.utils.data.DataLoader(dm.labelled, 8, True)))
+            optim.zero_grad()
+            model(x).sum().backward()
+            optim.step()
+            accs.append((x.sum().item(), random.random(), np.random.rand()))
+            dm.acquire(3)
+            if ckpt is not None:
+                save_checkpoint(ckpt, dm, model, optim, round=r, accs=accs)
+        return accs
+
+    ckpt = tmp_path / "al.ckpt"
+    dm, model, optim = setup()
+    assert load_checkpoint(ckpt, dm, model, optim) is None
+    expected = run(dm, model, optim, range(1, 3), [], ckpt)
+    expected = run(dm, model, optim, range(3, 6), list(expected))
+    # preempted after round 2: resume from a fresh process' state
+    dm, model, optim = setup()
+    torch.manual_seed(123)
+    state = load_checkpoint(ckpt, dm, model, optim)
+    assert state["round"] == 2 and len(state["accs"]) == 2
+    accs = run(dm, model, optim, range(state["round"] + 1, 6), state["accs"])
+    assert accs == expected
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def _seed_experiment(seed, data, scale):
+    import random
+    import numpy as np
+    import torch
+
+    x, y = data.tensors
+    return (
+        seed,
+        x.is_shared(),
+        (x * scale).sum().item(),
+        torch.rand(1).item(),
+        np.random.rand(),
+        random.random(),
+    )
+
+
+def test_run_seeds():
+    import torch
+
+    data = torch.utils.data.TensorDataset(torch.randn(16, 3), torch.arange(16))
+    shared = dict(data=data, scale=torch.tensor(2.0))
+    serial = run_seeds(_seed_experiment, [42, 7, 42], shared, processes=0)
+    pooled = run_seeds(_seed_experiment, [42, 7, 42], shared, processes=2)
+    assert serial == pooled
+    assert [r[0] for r in pooled] == [42, 7, 42]
+    # shared once instead of copied per seed
+    assert all(r[1] for r in pooled)
+    assert pooled[0][2] == (data.tensors[0] * 2).sum().item()
+    # isolated RNG: same as seeding a single-seed run
+    manual_seed(42)
+    assert pooled[0] == _seed_experiment(42, data, 2.0)
+    assert pooled[0] == pooled[2] and pooled[0][3:] != pooled[1][3:]
+
+
+class _ArrayDataset(torchdata.Dataset):
+    # like torchvision's CIFAR: numpy inputs and a list of targets
+    def __init__(self, n):
+        import numpy as np
+
+        self.data = np.arange(n * 12, dtype=np.uint8).reshape(n, 2, 2, 3)
+        self.targets = [i % 10 for i in range(n)]
+
+    def __getitem__(self, idx):
+        return self.data[idx], self.targets[idx]
+
+    def __len__(self):
+        return len(self.data)
+
+
+def _array_experiment(seed, data):
+    arrays = (data.data, data.targets)
+    return (
+        # views of tensors that were sent as handles to the shared memory, not copies
+        all(a._tensor.is_shared() for a in arrays),
+        int(data.data.sum()),
+        data.targets[:3].tolist(),
+    )
+
+
+class _CountUnpickled:
+    # counts how many times an instance was unpickled in this process
+    count = 0
+
+    def __init__(self):
+        # non-empty state: __setstate__ is only called if there is one
+        self.name = "count"
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        _CountUnpickled.count += 1
+
+    def __call__(self, i):
+        return _CountUnpickled.count
+
+
+def test_run_seeds_numpy_data():
+    data = _ArrayDataset(20)
+    expected = int(data.data.sum())
+    results = run_seeds(_array_experiment, [1, 2], dict(data=data), processes=2)
+    assert results == [(True, expected, [0, 1, 2])] * 2
+    # the function is sent to each process once rather than with every call
+    assert run_parallel(_CountUnpickled(), 3, processes=1) == [1, 1, 1]
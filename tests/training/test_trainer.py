@@ -0,0 +1,236 @@
+import pytest
+import torch
+import torch.utils.data as torchdata
+from torch import nn
+from torch.nn import functional as F
+
+from alr.data.synthetic import SyntheticDataset
+from alr.training import Trainer, WarmStart
+from alr.training.utils import shrink_perturb
+
+
+def test_shrink_perturb():
+    model = nn.Linear(4, 3)
+    before = [p.detach().clone() for p in model.parameters()]
+    shrink_perturb(model, shrink=0.5)
+    for b, p in zip(before, model.parameters()):
+        assert torch.allclose(p, b * 0.5)
+    torch.manual_seed(0)
+    shrink_perturb(model, perturb=0.1)
+    assert not torch.allclose(model.weight, before[0] * 0.5)
+
+
+def test_warm_start():
+    torch.manual_seed(0)
+    train = SyntheticDataset(256, n_class=3, shape=(8,))
+    val = SyntheticDataset(64, n_class=3, shape=(8,), split=1)
+    train_loader = torchdata.DataLoader(train, batch_size=32, shuffle=True)
+    val_loader = torchdata.DataLoader(val, batch_size=64)
+    model = nn.Sequential(nn.Linear(8, 3), nn.LogSoftmax(dim=-1))
+    initial = model[0].weight.detach().clone()
+    warm_start = WarmStart(
+        shrink=0.9, perturb=0.001, patience=lambda r: 1, compare=True
+    )
+    epochs = []
+    for _ in range(3):
+        trainer = Trainer(model, F.nll_loss, "Adam", patience=3, reload_best=True)
+        history = trainer.fit(
+            train_loader, val_loader, epochs=20, warm_start=warm_start
+        )
+        epochs.append(len(history["train_loss"]))
+    assert warm_start.rounds == 3
+    assert len(epochs) == 3 and all(e <= 20 for e in epochs)
+    assert [c["round"] for c in warm_start.comparisons] == [2, 3]
+    for c in warm_start.comparisons:
+        assert 0 <= c["warm_acc"] <= 1 and 0 <= c["cold_acc"] <= 1
+        assert c["warm_epochs"] >= 1 and c["cold_epochs"] >= 1
+    # the cold copies start from the initial weights; the model isn't reset
+    assert torch.equal(warm_start.cold_copy(model)[0].weight, initial)
+    assert not torch.equal(model[0].weight, initial)
+
+
+def test_state_buffer(tmp_path, monkeypatch):
+    from alr.training.utils import PerformanceTracker, StateBuffer
+
+    model = nn.Linear(4, 3)
+    buffer = StateBuffer(model, persist_to=tmp_path / "best.pt")
+    assert not buffer.saved
+    buffer.save()
+    best = {k: v.clone() for k, v in model.state_dict().items()}
+    storage = buffer._buffers["weight"].data_ptr()
+    with torch.no_grad():
+        model.weight.add_(1)
+    buffer.save()
+    # the buffers are reused
+    assert buffer._buffers["weight"].data_ptr() == storage
+    buffer.wait()
+    assert torch.equal(torch.load(tmp_path / "best.pt")["weight"], model.weight)
+    with torch.no_grad():
+        model.weight.zero_()
+    buffer.load()
+    assert torch.equal(model.weight, best["weight"] + 1)
+
+    # saves don't wait for a write in progress
+    import threading
+
+    writing, saved = threading.Event(), threading.Event()
+    torch_save = torch.save
+    released = []
+
+    def slow_save(obj, f):
+        writing.set()
+        released.append(saved.wait(timeout=5))
+        torch_save(obj, f)
+
+    monkeypatch.setattr(torch, "save", slow_save)
+    buffer.save()
+    assert writing.wait(timeout=5)
+    buffer.save()
+    saved.set()
+    buffer.wait()
+    assert released[0]
+
+    tracker = PerformanceTracker(model, patience=2)
+    tracker.step(0.5)
+    with torch.no_grad():
+        model.weight.zero_()
+    tracker.step(0.4)
+    assert not tracker.done
+    tracker.step(0.5)
+    assert tracker.done
+    tracker.reload_best()
+    assert tracker.reloaded
+    assert torch.equal(model.weight, best["weight"] + 1)
+
+
+def test_device_tensors():
+    from ignite.engine import create_supervised_evaluator
+    from ignite.metrics import Accuracy, Loss
+    from alr.training.utils import DeviceTensors, create_evaluator
+
+    torch.manual_seed(0)
+    val = SyntheticDataset(300, n_class=3, shape=(8,), split=1)
+    val_loader = torchdata.DataLoader(val, batch_size=64)
+    tensors = DeviceTensors.from_loader(val_loader, batch_size=128)
+    assert len(tensors) == 3 and len(tensors.x) == 300
+    model = nn.Sequential(nn.Linear(8, 3), nn.LogSoftmax(dim=-1))
+    expected = (
+        create_supervised_evaluator(
+            model, metrics={"acc": Accuracy(), "loss": Loss(F.nll_loss)}
+        )
+        .run(val_loader)
+        .metrics
+    )
+    evaluator = create_evaluator(model, F.nll_loss)
+    # regular data loaders give the same metrics
+    assert evaluator.run(val_loader).metrics["acc"] == pytest.approx(expected["acc"])
+    metrics = evaluator.run(tensors).metrics
+    assert metrics["acc"] == pytest.approx(expected["acc"])
+    assert metrics["loss"] == pytest.approx(expected["loss"], rel=1e-5)
+    # the evaluator can be run again
+    assert evaluator.run(tensors).metrics == metrics
+
+    train_loader = torchdata.DataLoader(
+        SyntheticDataset(256, n_class=3, shape=(8,)), batch_size=32
+    )
+    trainer = Trainer(model, F.nll_loss, "Adam", patience=2, reload_best=True)
+    history = trainer.fit(train_loader, tensors, epochs=5)
+    assert len(history["val_acc"]) == len(history["train_acc"])
+    assert trainer.evaluate(tensors)["acc"] == pytest.approx(max(history["val_acc"]))
+
+
+def test_lean_engine():
+    torch.manual_seed(0)
+    train = SyntheticDataset(512, shape=(20,), seed=0)
+    val = SyntheticDataset(256, shape=(20,), seed=0, split=1)
+    model = nn.Sequential(nn.Linear(20, 10), nn.LogSoftmax(dim=-1))
+    trainer = Trainer(model, F.nll_loss, "Adam", patience=2, reload_best=True)
+    epochs = []
+    history = trainer.fit(
+        torchdata.DataLoader(train, batch_size=32, shuffle=True),
+        torchdata.DataLoader(val, batch_size=256),
+        epochs=10,
+        callbacks=[lambda e: epochs.append(e.state.epoch)],
+        lean=True,
+    )
+    # same history contract as the ignite trainer
+    assert set(history) == {"train_acc", "train_loss", "val_acc", "val_loss"}
+    assert epochs == list(range(1, len(history["train_acc"]) + 1))
+    assert all(len(v) == len(epochs) for v in history.values())
+    assert history["train_loss"][-1] < history["train_loss"][0]
+    assert history["val_acc"][-1] > 0.5
+    assert trainer.evaluate(torchdata.DataLoader(val, batch_size=256))[
+        "acc"
+    ] == pytest.approx(max(history["val_acc"]))
+
+
+@pytest.mark.parametrize("lean", [False, True], ids=["ignite", "lean"])
+def test_training_loop_throughput(benchmark, lean):
+    from alr.data.datasets import Dataset
+    from alr.training.progress_bar.ignite_progress_bar import ProgressBar
+
+    # MNISTNet, batch size 64: the loop's overhead is comparable to the compute
+    data = SyntheticDataset(64 * 50)
+    loader = torchdata.DataLoader(
+        torchdata.TensorDataset(*data.get_batch(range(len(data)))), batch_size=64
+    )
+    trainer = Trainer(Dataset.MNIST.model, F.nll_loss, "Adam")
+    benchmark.pedantic(
+        trainer.fit, args=(loader,), kwargs={"lean": lean}, rounds=3, warmup_rounds=1
+    )
+    if benchmark.stats is not None:
+        benchmark.extra_info["steps_per_sec"] = (
+            len(loader) / benchmark.stats.stats.mean
+        )
+
+
+def test_post_round_pipeline(tmp_path):
+    import pickle
+    import threading
+    from alr import MCDropout
+    from alr.training import PostRoundPipeline
+
+    model = MCDropout(nn.Linear(4, 2), forward=2)
+    model.train()
+    x = torch.randn(8, 4)
+    started, release = threading.Event(), threading.Event()
+    with PostRoundPipeline(max_pending=1) as post:
+        snapshot = post.snapshot(model)
+        assert not snapshot.training and snapshot._snapshot is None
+        expected = snapshot(x)
+        blocked = post.submit(lambda: (started.set(), release.wait()))
+        assert started.wait(5)
+        # the snapshot doesn't change with the model
+        with torch.no_grad():
+            model.base_model.weight.add_(1)
+        evaluated = post.submit(lambda m: m(x), snapshot)
+        # back-pressure: the queue is full (submit blocks) until the first job finishes
+        assert post._queue.full() and not blocked.done()
+        submitted = threading.Event()
+        threading.Thread(
+            target=lambda: (post.submit(lambda: None), submitted.set())
+        ).start()
+        release.set()
+        assert submitted.wait(5)
+        assert torch.equal(evaluated.result(), expected)
+        assert blocked.done()
+
+        accs = {10: [0.5]}
+        post.dump(accs, tmp_path / "accs.pkl")
+        accs[20] = [0.6]
+        post.dump(snapshot.state_dict(), tmp_path / "model.pt")
+    with open(tmp_path / "accs.pkl", "rb") as fp:
+        assert pickle.load(fp) == {10: [0.5]}
+    assert torch.equal(
+        torch.load(tmp_path / "model.pt")["base_model.weight"],
+        snapshot.base_model.weight,
+    )
+
+    post = PostRoundPipeline()
+    failed = post.submit(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        post.wait()
+    assert isinstance(failed.exception(), ZeroDivisionError)
+    post.close()
+    with pytest.raises(RuntimeError):
+        post.submit(print)